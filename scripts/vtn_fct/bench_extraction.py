@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Benchmark the hot extraction functions over the page-text fixture corpus.
+
+For each function reports pages/s and chars/s (best of `--repeats`), plus
+memory from one extra pass under tracemalloc: peak traced memory (KiB)
+and `live_blocks_after`, the blocks allocated during the pass that are
+still alive after it (a non-zero count means the function retains memory
+across calls). tracemalloc cannot count allocations made, so there is no
+allocation-count column.
+
+Every output is hashed per page, so the same run also acts as a
+regression check:
+- `--save-baseline` records throughput + per-page output digests
+- `--compare` fails (exit 1) when any extracted value differs from the
+  baseline or throughput drops more than `--tolerance` below it
+
+Throughput baselines are machine-specific; record one on the machine you
+compare on. Output digests are portable.
+
+Usage:
+    python3 scripts/vtn_fct/build_page_fixtures.py   # (re)build the corpus
+    python3 scripts/vtn_fct/bench_extraction.py
+    python3 scripts/vtn_fct/bench_extraction.py --save-baseline
+    python3 scripts/vtn_fct/bench_extraction.py --compare --tolerance 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import platform
+import re
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from extract_vtn_fct_2007 import (
+    ALL_NUTRIENTS,
+    deduplicate_text,
+    extract_header,
+    extract_record,
+    extract_value,
+    parse_numeric,
+    parse_ocr_header,
+    tcvn3_to_vietnamese,
+)
+
+VALUE_TOKEN_RE = re.compile(r'(?<=\s)(?:[0-9]+(?:\.[0-9]+)?|--|-)(?=\s|$)')
+
+
+@dataclass
+class BenchResult:
+    function: str
+    pages: int
+    chars: int
+    best_s: float
+    pages_per_s: float
+    chars_per_s: float
+    peak_kib: float
+    live_blocks_after: int
+    output_sha256: str
+
+
+@dataclass
+class Case:
+    """One benchmarked function: per-page payloads and how to run one."""
+    name: str
+    payloads: list[Any]
+    labels: list[str]
+    chars: int
+    run: Callable[[Any], Any]
+
+
+def load_corpus(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def _without_date(record: dict[str, Any] | None) -> dict[str, Any] | None:
+    if record is None:
+        return None
+    return {key: value for key, value in record.items() if key != 'last_verified'}
+
+
+def _all_values(deduped: str) -> list[float | None]:
+    return [extract_value(deduped, label, unit) for label, unit in ALL_NUTRIENTS.values()]
+
+
+def build_cases(corpus: list[dict[str, Any]]) -> list[Case]:
+    labels = [f"page {entry['page']} ({entry['kind']})" for entry in corpus]
+    texts = [entry['text'] for entry in corpus]
+    deduped = [deduplicate_text(text) for text in texts]
+    headers = [extract_header(text) for text in texts]
+    named = [position for position, header in enumerate(headers) if header is not None]
+    vn_names = [headers[position][0] for position in named]
+    with_ocr = [position for position, entry in enumerate(corpus) if entry.get('ocr_header')]
+    ocr_headers = [corpus[position]['ocr_header'] for position in with_ocr]
+    tokens = [VALUE_TOKEN_RE.findall(text) for text in deduped]
+    pages = [(entry['text'], entry['page'] or 0) for entry in corpus]
+
+    return [
+        Case('deduplicate_text', texts, labels, sum(map(len, texts)), deduplicate_text),
+        Case('extract_header', texts, labels, sum(map(len, texts)), extract_header),
+        Case('extract_value', deduped, labels, sum(map(len, deduped)), _all_values),
+        Case(
+            'extract_record',
+            pages,
+            labels,
+            sum(map(len, texts)),
+            lambda page: _without_date(extract_record(*page)),
+        ),
+        Case(
+            'tcvn3_to_vietnamese',
+            vn_names,
+            [labels[position] for position in named],
+            sum(map(len, vn_names)),
+            tcvn3_to_vietnamese,
+        ),
+        Case(
+            'parse_ocr_header',
+            ocr_headers,
+            [labels[position] for position in with_ocr],
+            sum(map(len, ocr_headers)),
+            parse_ocr_header,
+        ),
+        Case(
+            'parse_numeric',
+            tokens,
+            labels,
+            sum(len(token) for page in tokens for token in page),
+            lambda page: [parse_numeric(token) for token in page],
+        ),
+    ]
+
+
+def page_digests(outputs: list[Any]) -> list[str]:
+    return [
+        hashlib.sha256(
+            json.dumps(output, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()[:16]
+        for output in outputs
+    ]
+
+
+def _measure_allocations(case: Case) -> tuple[float, int]:
+    tracemalloc.start()
+    try:
+        for payload in case.payloads:
+            case.run(payload)
+        _, peak = tracemalloc.get_traced_memory()
+        live = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+    return peak / 1024, live
+
+
+def run_case(case: Case, repeats: int) -> tuple[BenchResult, list[str]]:
+    outputs = [case.run(payload) for payload in case.payloads]  # warm-up + digests
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for payload in case.payloads:
+            case.run(payload)
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    peak_kib, live_blocks_after = _measure_allocations(case)
+    digests = page_digests(outputs)
+    result = BenchResult(
+        function=case.name,
+        pages=len(case.payloads),
+        chars=case.chars,
+        best_s=best,
+        pages_per_s=len(case.payloads) / best if best else 0.0,
+        chars_per_s=case.chars / best if best else 0.0,
+        peak_kib=peak_kib,
+        live_blocks_after=live_blocks_after,
+        output_sha256=hashlib.sha256(''.join(digests).encode('ascii')).hexdigest(),
+    )
+    return result, digests
+
+
+def corpus_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def compare_with_baseline(
+    results: list[BenchResult],
+    digests: dict[str, list[str]],
+    labels: dict[str, list[str]],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """Human-readable failures (empty = pass)."""
+    failures: list[str] = []
+    recorded = baseline['functions']
+    for result in results:
+        expected = recorded.get(result.function)
+        if expected is None:
+            failures.append(f'{result.function}: not in baseline')
+            continue
+        if result.output_sha256 != expected['output_sha256']:
+            baseline_pages = expected['page_digests']
+            changed = [
+                position for position, digest in enumerate(digests[result.function])
+                if position >= len(baseline_pages) or digest != baseline_pages[position]
+            ]
+            where = ', '.join(labels[result.function][position] for position in changed[:5])
+            failures.append(f'{result.function}: output changed on {len(changed)} input(s): {where}')
+        floor = expected['pages_per_s'] * (1 - tolerance)
+        if result.pages_per_s < floor:
+            failures.append(
+                f"{result.function}: {result.pages_per_s:,.0f} pages/s < "
+                f"{floor:,.0f} (baseline {expected['pages_per_s']:,.0f}, tolerance {tolerance:.0%})"
+            )
+    return failures
+
+
+def print_results(results: list[BenchResult]) -> None:
+    print(f"  {'function':22s} {'pages/s':>11} {'chars/s':>13} {'peak KiB':>9} {'live after':>10}")
+    for result in results:
+        print(
+            f'  {result.function:22s} {result.pages_per_s:>11,.0f} {result.chars_per_s:>13,.0f} '
+            f'{result.peak_kib:>9.1f} {result.live_blocks_after:>10}'
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Benchmark hot extraction functions on the page-text fixture corpus.',
+    )
+    parser.add_argument(
+        '--corpus',
+        default='data/vtn_fct_2007/fixtures/page_texts.jsonl',
+        help='Page-text fixture corpus (JSONL).',
+    )
+    parser.add_argument(
+        '--baseline',
+        default='data/vtn_fct_2007/fixtures/extraction_bench_baseline.json',
+        help='Baseline JSON for --save-baseline / --compare.',
+    )
+    parser.add_argument('--repeats', type=int, default=5, help='Timed passes per function (best is kept).')
+    parser.add_argument(
+        '--only',
+        action='append',
+        default=[],
+        help='Benchmark only this function (repeatable).',
+    )
+    parser.add_argument('--save-baseline', action='store_true', help='Write results as the new baseline.')
+    parser.add_argument(
+        '--compare',
+        action='store_true',
+        help='Fail on output changes or throughput regressions vs the baseline.',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='Allowed throughput drop for --compare (fraction).',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    corpus_path = Path(args.corpus)
+    corpus = load_corpus(corpus_path)
+
+    cases = build_cases(corpus)
+    if args.only:
+        unknown = set(args.only) - {case.name for case in cases}
+        if unknown:
+            raise SystemExit(f"Unknown function(s): {', '.join(sorted(unknown))}")
+        cases = [case for case in cases if case.name in args.only]
+
+    results: list[BenchResult] = []
+    digests: dict[str, list[str]] = {}
+    for case in cases:
+        result, case_digests = run_case(case, args.repeats)
+        results.append(result)
+        digests[case.name] = case_digests
+
+    print(f'Corpus: {corpus_path} ({len(corpus)} pages)')
+    print_results(results)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline = {
+            'corpus_sha256': corpus_sha256(corpus_path),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'functions': {
+                result.function: {**asdict(result), 'page_digests': digests[result.function]}
+                for result in results
+            },
+        }
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with baseline_path.open('w', encoding='utf-8') as handle:
+            json.dump(baseline, handle, ensure_ascii=False, indent=2)
+            handle.write('\n')
+        print(f'Baseline: {baseline_path}')
+
+    if args.compare:
+        with baseline_path.open('r', encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        if baseline['corpus_sha256'] != corpus_sha256(corpus_path):
+            raise SystemExit('Corpus changed since the baseline was recorded; re-run --save-baseline')
+        labels = {case.name: case.labels for case in cases}
+        failures = compare_with_baseline(results, digests, labels, baseline, args.tolerance)
+        for failure in failures:
+            print(f'FAIL {failure}')
+        if failures:
+            raise SystemExit(1)
+        print('Baseline comparison: OK')
+
+
+if __name__ == '__main__':
+    main()
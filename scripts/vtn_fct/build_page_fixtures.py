@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Build the page-text fixture corpus for extraction benchmarks and tests.
+
+The source PDF is not in the repo, so the corpus combines:
+- `captured`  — the 20 raw page excerpts stored in validation/sample_packet.json
+                (real pdfplumber output, whitespace-collapsed, truncated)
+- `rendered`  — one full page per extracted record, laid out like the book
+                (see page_layout.py), at its page_index.json page number
+- `separator` — chapter separator pages, which the extractor must skip
+
+Each line of the JSONL carries `page`, `kind`, `id` (null for separators),
+`text` and, for record pages, `ocr_header` (what tesseract returns for the
+header crop) so `parse_ocr_header` can be exercised too.
+
+Usage:
+    python3 scripts/vtn_fct/build_page_fixtures.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from enrich_extracted_data import FOOD_GROUPS, get_food_code, get_group_prefix
+from page_layout import render_ocr_header, render_page_text, render_separator_text
+
+
+def load_json(path: Path) -> Any:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def build_corpus(
+    records: list[dict[str, Any]],
+    page_index: dict[str, int],
+    packet: dict[str, Any],
+) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
+
+    for row in packet['rows']:
+        entries.append({
+            'page': row['source_page'],
+            'kind': 'captured',
+            'id': row['id'],
+            'text': row['source_excerpt'],
+        })
+
+    first_page: dict[str, int] = {}
+    for stt, record in enumerate(records, start=1):
+        page = page_index.get(record['id'])
+        prefix = get_group_prefix(get_food_code(record['id']))
+        if page is not None:
+            first_page[prefix] = min(page, first_page.get(prefix, page))
+        entries.append({
+            'page': page,
+            'kind': 'rendered',
+            'id': record['id'],
+            'text': render_page_text(record, stt),
+            'ocr_header': render_ocr_header(record, stt),
+        })
+
+    for prefix, page in first_page.items():
+        type_vn, type_en = FOOD_GROUPS[prefix]
+        entries.append({
+            'page': page - 1,
+            'kind': 'separator',
+            'id': None,
+            'text': render_separator_text(prefix, type_vn, type_en),
+        })
+
+    kind_order = {'separator': 0, 'rendered': 1, 'captured': 2}
+    entries.sort(key=lambda entry: (entry['page'] is None, entry['page'] or 0, kind_order[entry['kind']]))
+    return entries
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Build the page-text fixture corpus (captured + rendered pages).',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--page-index',
+        default='data/vtn_fct_2007/page_index.json',
+        help='id → source page mapping.',
+    )
+    parser.add_argument(
+        '--packet',
+        default='data/vtn_fct_2007/validation/sample_packet.json',
+        help='Validation packet with captured source excerpts.',
+    )
+    parser.add_argument(
+        '--output',
+        default='data/vtn_fct_2007/fixtures/page_texts.jsonl',
+        help='Output JSONL path.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    entries = build_corpus(
+        load_json(Path(args.input)),
+        load_json(Path(args.page_index)),
+        load_json(Path(args.packet)),
+    )
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open('w', encoding='utf-8') as handle:
+        for entry in entries:
+            handle.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    counts: dict[str, int] = {}
+    for entry in entries:
+        counts[entry['kind']] = counts.get(entry['kind'], 0) + 1
+    print(f'Pages: {len(entries)}')
+    for kind, count in sorted(counts.items()):
+        print(f'  {kind}: {count}')
+    print(f'Output: {output_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,8 @@ import re
 from pathlib import Path
 from typing import Any
 
-import pdfplumber
+from page_text_cache import PageTextCache
+from text_backends import BACKENDS, DEFAULT_BACKEND, open_backend
 
 
 def load_records(path: Path) -> list[dict[str, Any]]:
@@ -52,6 +53,8 @@ def make_source_excerpt(text: str) -> str:
 def attach_source_context(
     pdf_path: Path,
     sample: list[dict[str, Any]],
+    backend: str = DEFAULT_BACKEND,
+    page_cache: PageTextCache | None = None,
 ) -> list[dict[str, Any]]:
     pages_needed = {
         record.get('_source_page')
@@ -59,10 +62,30 @@ def attach_source_context(
         if record.get('_source_page')
     }
 
+    # Pages already in the page cache are not fetched again
     page_text: dict[int, str] = {}
-    with pdfplumber.open(pdf_path) as pdf:
+    if page_cache is not None:
         for page_number in pages_needed:
-            page_text[page_number] = pdf.pages[page_number - 1].extract_text() or ''
+            text = page_cache.get(page_number)
+            if text is not None:
+                page_text[page_number] = text
+    pages_to_fetch = sorted(pages_needed - set(page_text))
+
+    if pages_to_fetch:
+        from extraction_daemon import page_texts_via_daemon
+
+        warm = page_texts_via_daemon(pdf_path, pages_to_fetch, backend)
+        fetched: dict[int, str] = {}
+        if warm is not None:
+            fetched = {page_number: text for page_number, (text, _, _) in warm.items()}
+        else:
+            with open_backend(backend, pdf_path) as source:
+                for page_number in pages_to_fetch:
+                    fetched[page_number] = source.page_text(page_number)
+        if page_cache is not None:
+            for page_number, text in fetched.items():
+                page_cache.put(page_number, text)
+        page_text.update(fetched)
 
     packet_rows: list[dict[str, Any]] = []
     for record in sample:
@@ -117,6 +140,18 @@ def build_parser() -> argparse.ArgumentParser:
         default='data/vtn_fct_2007/validation/sample_packet.json',
         help='Output path for validation packet JSON.',
     )
+    parser.add_argument(
+        '--backend',
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help='Page-text extractor for the source excerpts (see text_backends.py).',
+    )
+    parser.add_argument(
+        '--page-cache',
+        default=None,
+        help='Directory for cached page texts (shared with extract_vtn_fct_2007.py --page-cache); '
+             'only pages missing from it are read from the PDF.',
+    )
     parser.add_argument(
         '--sample-size',
         type=int,
@@ -137,7 +172,9 @@ def main() -> None:
 
     records = load_records(Path(args.input))
     sample = sample_records(records, args.sample_size, args.seed)
-    packet_rows = attach_source_context(Path(args.pdf), sample)
+    pdf_path = Path(args.pdf)
+    page_cache = PageTextCache(Path(args.page_cache), pdf_path, args.backend) if args.page_cache else None
+    packet_rows = attach_source_context(pdf_path, sample, args.backend, page_cache)
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
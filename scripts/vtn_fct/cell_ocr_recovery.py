@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""Recover missing nutrient values cell by cell instead of OCRing whole pages.
+
+Many nulls in the quality report are for nutrients the book prints a value
+for: the text layer or the doubled-glyph dedupe broke the page-level
+regex. This pass only touches the missing (record, nutrient) cells:
+
+1. locate   the nutrient's label row on its page from `page.chars` (bold
+            doubled glyphs dropped, grouped into words and rows) and read
+            the row the way the page-level regex reads its line
+2. classify the row's own text:
+            - dash      the row prints "-": the book has no value, nothing to do
+            - row_text  the row text parses on its own (the page-level match
+                        failed elsewhere, e.g. across the other column)
+            - ocr       label found but no readable value → OCR the cell
+            - no_label  the label is not on the page; left alone
+3. OCR      rasterize just that cell — label to the end of its table column
+            (`pdftoppm -x -y -W -H`) — and read it with
+            `tesseract --psm 7` (one text line), `concurrency` cells at a time;
+            a cell whose pdftoppm/tesseract run fails is counted as
+            `ocr_failed` (stderr kept in `ocr_text`) and the pass goes on
+
+Recovered values carry provenance in `record['_cell_recovery'][nutrient]`
+(source, page, bbox in PDF points, the text read), written by the
+extractor to `cell_recovery.json`; extraction_confidence.py scores
+them with the `row_text` / `ocr_cell` signals instead of `label_missing`.
+
+Usage:
+    python3 scripts/vtn_fct/extract_vtn_fct_2007.py --recover-missing-cells [--ocr-concurrency 4]
+    python3 scripts/vtn_fct/cell_ocr_recovery.py --pdf "VTN FCT 2007.pdf" [--nutrient iron_mg]
+    python3 scripts/vtn_fct/cell_ocr_recovery.py --pdf /tmp/synthetic.pdf --check --knockout 200
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import itertools
+import json
+import random
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pdfplumber
+from pdfplumber.utils import extract_words
+
+from extract_vtn_fct_2007 import (
+    ALL_NUTRIENTS,
+    OCR_DPI,
+    OCR_LANG,
+    normalize_spaces,
+    nutrient_regex,
+    parse_numeric,
+)
+
+PDFTOPPM = 'pdftoppm'
+TESSERACT = 'tesseract'
+DEFAULT_CONCURRENCY = 4
+# Words whose tops differ by less than this (points) share a table row
+ROW_TOLERANCE = 3.0
+CELL_PADDING = 2.0
+# Value + source columns, for crops of labels that overflow their column
+VALUE_CELL_WIDTH = 60.0
+COLUMN_HEADER = '(Nutrients)'
+DASHES = frozenset({'-', '--'})
+
+
+@dataclass
+class MissingCell:
+    position: int  # index into the records list
+    record_id: str
+    page: int
+    nutrient: str
+
+
+@dataclass
+class CellLocation:
+    cell: MissingCell
+    status: str  # dash / row_text / ocr / ocr_failed / no_label
+    bbox: tuple[float, float, float, float] | None = None  # x0, top, x1, bottom (points)
+    row_text: str = ''
+    value: float | None = None
+    ocr_text: str = ''
+
+
+def missing_cells(records: list[dict[str, Any]], nutrients: list[str] | None = None) -> list[MissingCell]:
+    wanted = nutrients or list(ALL_NUTRIENTS)
+    return [
+        MissingCell(position, record['id'], record['_source_page'], key)
+        for position, record in enumerate(records)
+        if '_source_page' in record
+        for key in wanted
+        if record['per_100g'].get(key) is None
+    ]
+
+
+# ── Locating label rows ─────────────────────────────────────────────
+
+Word = dict[str, Any]
+BBox = tuple[float, float, float, float]
+
+
+def _single_chars(chars: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop the second glyph of each bold-simulation pair (same char, ≤ 1 pt away).
+
+    The pairs are adjacent in the content stream, so this is `dedupe_chars()`
+    without its all-pairs search (a third of the cost per page)."""
+    kept: list[dict[str, Any]] = []
+    for char in chars:
+        if (
+            kept
+            and char['text'] == kept[-1]['text']
+            and abs(char['x0'] - kept[-1]['x0']) <= 1
+            and abs(char['top'] - kept[-1]['top']) <= 1
+        ):
+            continue
+        kept.append(char)
+    return kept
+
+
+def table_rows(page: Any) -> tuple[list[list[Word]], list[float]]:
+    """Word rows in reading order, and the x where each nutrient column starts."""
+    words = extract_words(_single_chars(page.chars))
+    starts = sorted({w['x0'] for w in words if w['text'] == COLUMN_HEADER}) or [0.0]
+    rows: list[list[Word]] = []
+    for word in sorted(words, key=lambda w: (w['top'], w['x0'])):
+        if rows and abs(word['top'] - rows[-1][0]['top']) <= ROW_TOLERANCE:
+            rows[-1].append(word)
+        else:
+            rows.append([word])
+    for row in rows:
+        row.sort(key=lambda w: w['x0'])
+    return rows, starts
+
+
+def _word_at(offsets: list[int], position: int) -> int:
+    return bisect.bisect_right(offsets, position) - 1
+
+
+def _bbox(words: list[Word], x1: float, page: Any) -> BBox:
+    return (
+        max(words[0]['x0'] - CELL_PADDING, 0.0),
+        max(min(w['top'] for w in words) - CELL_PADDING, 0.0),
+        min(x1 + CELL_PADDING, page.width),
+        min(max(w['bottom'] for w in words) + CELL_PADDING, page.height),
+    )
+
+
+def classify_cell(cell: MissingCell, rows: list[list[Word]], starts: list[float], page: Any) -> CellLocation:
+    """Find the label's row and read it the way the page-level regex would."""
+    label, unit = ALL_NUTRIENTS[cell.nutrient]
+    for row in rows:
+        text = ' '.join(w['text'] for w in row)
+        label_match = re.search(label, text, flags=re.IGNORECASE)
+        if label_match is None:
+            continue
+        offsets = list(itertools.accumulate((len(w['text']) + 1 for w in row[:-1]), initial=0))
+        first = _word_at(offsets, label_match.start())
+        match = nutrient_regex(label, unit).search(text, label_match.start())
+        if match is not None:
+            last = _word_at(offsets, match.start(1))
+            bbox = _bbox(row[first:last + 1], row[last]['x1'], page)
+            status = 'dash' if match.group(1) in DASHES else 'row_text'
+            value = None if status == 'dash' else parse_numeric(match.group(1))
+            return CellLocation(cell, status, bbox, text, value)
+
+        # No readable value: crop to the end of the label's column, or past the
+        # unit by one value + source width when a long label overflows it
+        unit_match = re.search(unit, text[label_match.end():], flags=re.IGNORECASE) if unit else None
+        label_end = label_match.end() + (unit_match.end() if unit_match else 0)
+        last = _word_at(offsets, max(label_end - 1, label_match.start()))
+        column_end = next((x for x in starts if x > row[first]['x0'] + CELL_PADDING), page.width)
+        x1 = max(column_end - CELL_PADDING, row[last]['x1'] + VALUE_CELL_WIDTH)
+        return CellLocation(cell, 'ocr', _bbox(row[first:last + 1], x1, page), text)
+    return CellLocation(cell, 'no_label')
+
+
+def locate_cells(pdf_path: Path, cells: list[MissingCell]) -> list[CellLocation]:
+    """Open only the pages holding missing cells; one row scan per page."""
+    by_page: dict[int, list[MissingCell]] = {}
+    for cell in cells:
+        by_page.setdefault(cell.page, []).append(cell)
+
+    located: list[CellLocation] = []
+    if not by_page:
+        return located
+    with pdfplumber.open(pdf_path, pages=sorted(by_page)) as pdf:
+        for page in pdf.pages:
+            rows, starts = table_rows(page)
+            located.extend(classify_cell(cell, rows, starts, page) for cell in by_page[page.page_number])
+    return located
+
+
+# ── OCR of single cells ─────────────────────────────────────────────
+
+def ocr_unavailable() -> str | None:
+    missing = [tool for tool in (PDFTOPPM, TESSERACT) if shutil.which(tool) is None]
+    return f"{', '.join(missing)} not found on PATH" if missing else None
+
+
+def ocr_cell(pdf_path: Path, location: CellLocation) -> tuple[float | None, str]:
+    """Render only the cell's row at OCR_DPI and read it as one text line."""
+    scale = OCR_DPI / 72
+    x0, top, x1, bottom = location.bbox
+    with tempfile.TemporaryDirectory(prefix='vtn_cell_') as tmp:
+        prefix = Path(tmp) / 'cell'
+        subprocess.run(
+            [
+                PDFTOPPM, '-r', str(OCR_DPI), '-f', str(location.cell.page), '-l', str(location.cell.page),
+                '-x', str(int(x0 * scale)), '-y', str(int(top * scale)),
+                '-W', str(int((x1 - x0) * scale) + 1), '-H', str(int((bottom - top) * scale) + 1),
+                '-png', '-singlefile', str(pdf_path), str(prefix),
+            ],
+            capture_output=True,
+            check=True,
+        )
+        text = subprocess.run(
+            [TESSERACT, str(prefix.with_suffix('.png')), 'stdout', '-l', OCR_LANG, '--psm', '7'],
+            capture_output=True,
+            check=True,
+        ).stdout.decode('utf-8', 'replace')
+    text = normalize_spaces(text)
+    label, unit = ALL_NUTRIENTS[location.cell.nutrient]
+    match = nutrient_regex(label, unit).search(text)
+    if match is None and unit is not None:
+        # OCR often garbles the Vietnamese half of the label; the crop holds one
+        # row of one column, so the number after the unit is the value
+        match = re.search(rf'\b(?:{unit})\s+([0-9]+(?:\.[0-9]+)?|--|-)', text, flags=re.IGNORECASE)
+    if match is None or match.group(1) in DASHES:
+        return None, text
+    return parse_numeric(match.group(1)), text
+
+
+def _ocr_or_failure(pdf_path: Path, location: CellLocation) -> tuple[float | None, str]:
+    """`ocr_cell`, with a failed tool run marking the cell `ocr_failed`."""
+    try:
+        return ocr_cell(pdf_path, location)
+    except subprocess.CalledProcessError as error:
+        location.status = 'ocr_failed'
+        stderr = normalize_spaces((error.stderr or b'').decode('utf-8', 'replace'))
+        return None, f'{Path(error.cmd[0]).name} exited {error.returncode}' + (f': {stderr}' if stderr else '')
+
+
+# ── Recovery pass ───────────────────────────────────────────────────
+
+def recover_missing_cells(
+    records: list[dict[str, Any]],
+    pdf_path: Path,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    nutrients: list[str] | None = None,
+    use_row_text: bool = True,
+    apply: bool = True,
+) -> dict[str, Any]:
+    """Fill missing cells in place (with `_cell_recovery` provenance); returns the summary.
+
+    `use_row_text=False` sends every located, non-dash cell to OCR; `apply=False`
+    only reports what would be recovered (values are still attached as proposals
+    under `_cell_recovery`).
+    """
+    started = time.perf_counter()
+    cells = missing_cells(records, nutrients)
+    located = locate_cells(pdf_path, cells)
+    locate_s = time.perf_counter() - started
+
+    if not use_row_text:
+        for location in located:
+            if location.status == 'row_text':
+                location.status, location.value = 'ocr', None
+
+    to_ocr = [location for location in located if location.status == 'ocr']
+    if to_ocr:
+        reason = ocr_unavailable()
+        if reason is not None:
+            raise FileNotFoundError(f'Cell OCR for {len(to_ocr)} cells: {reason}')
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            for location, (value, text) in zip(to_ocr, pool.map(lambda loc: _ocr_or_failure(pdf_path, loc), to_ocr)):
+                location.value, location.ocr_text = value, text
+
+    recovered: dict[str, int] = {}
+    statuses: dict[str, int] = {}
+    for location in located:
+        statuses[location.status] = statuses.get(location.status, 0) + 1
+        if location.value is None:
+            continue
+        cell = location.cell
+        source = 'ocr_cell' if location.status == 'ocr' else 'row_text'
+        record = records[cell.position]
+        record.setdefault('_cell_recovery', {})[cell.nutrient] = {
+            'value': location.value,
+            'source': source,
+            'page': cell.page,
+            'bbox': [round(v, 1) for v in location.bbox],
+            'text': location.ocr_text or location.row_text,
+        }
+        if apply:
+            apply_recovered_cell(record, cell.nutrient, location.value, source)
+        recovered[cell.nutrient] = recovered.get(cell.nutrient, 0) + 1
+
+    return {
+        'missing_cells': len(cells),
+        'statuses': dict(sorted(statuses.items())),
+        'ocr_cells': len(to_ocr),
+        'recovered': sum(recovered.values()),
+        'recovered_by_nutrient': dict(sorted(recovered.items(), key=lambda item: -item[1])),
+        'locate_s': round(locate_s, 3),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+def apply_recovered_cell(record: dict[str, Any], nutrient: str, value: float, source: str) -> None:
+    """Set the value and swap its `label_missing` signal for `source`."""
+    record['per_100g'][nutrient] = value
+    signals = record.get('_signals')
+    if signals is not None:
+        if nutrient in signals.get('label_missing', []):
+            signals['label_missing'].remove(nutrient)
+        signals.setdefault(source, []).append(nutrient)
+
+
+def carry_recovered_cells(previous: dict[str, Any], candidate: dict[str, Any]) -> None:
+    """Copy `previous`'s recovered cells onto a re-extraction of its page.
+
+    Only cells the candidate still misses; values that were only proposed
+    (`apply=False`) stay proposals."""
+    for nutrient, provenance in previous.get('_cell_recovery', {}).items():
+        if candidate['per_100g'].get(nutrient) is not None:
+            continue
+        candidate.setdefault('_cell_recovery', {})[nutrient] = provenance
+        if previous['per_100g'].get(nutrient) == provenance['value']:
+            apply_recovered_cell(candidate, nutrient, provenance['value'], provenance['source'])
+
+
+def recovery_provenance(records: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """id → nutrient → provenance, for cell_recovery.json."""
+    return {record['id']: record['_cell_recovery'] for record in records if record.get('_cell_recovery')}
+
+
+# ── Standalone runs ─────────────────────────────────────────────────
+
+def load_extracted(data_dir: Path) -> tuple[list[dict[str, Any]], int]:
+    """Extracted records with `_source_page` restored from page_index.json.
+
+    page_index.json keeps one page per id, so records sharing an id get no
+    page (and are not scanned); their count is returned alongside."""
+    with (data_dir / 'extracted_ingredients.json').open('r', encoding='utf-8') as handle:
+        records = json.load(handle)
+    with (data_dir / 'page_index.json').open('r', encoding='utf-8') as handle:
+        page_index = json.load(handle)
+    counts = Counter(record['id'] for record in records)
+    for record in records:
+        if counts[record['id']] == 1 and record['id'] in page_index:
+            record['_source_page'] = page_index[record['id']]
+    return records, sum(count for count in counts.values() if count > 1)
+
+
+def run_check(pdf_path: Path, knockout: int, seed: int, concurrency: int, use_row_text: bool) -> bool:
+    """Blank `knockout` extracted values, recover them, and require the originals back."""
+    from extract_vtn_fct_2007 import run_extraction
+
+    records = run_extraction(pdf_path, ocr_header_fallback=False).records
+    present = [
+        (position, key)
+        for position, record in enumerate(records)
+        for key, value in record['per_100g'].items()
+        if value is not None
+    ]
+    chosen = random.Random(seed).sample(present, min(knockout, len(present)))
+    expected = {}
+    for position, key in chosen:
+        expected[(position, key)] = records[position]['per_100g'][key]
+        records[position]['per_100g'][key] = None
+
+    summary = recover_missing_cells(records, pdf_path, concurrency, use_row_text=use_row_text)
+    exact = sum(1 for (position, key), value in expected.items() if records[position]['per_100g'][key] == value)
+    wrong = [
+        (records[position]['id'], key, value, records[position]['per_100g'][key])
+        for (position, key), value in expected.items()
+        if records[position]['per_100g'][key] not in (None, value)
+    ]
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    print(f'Knocked out: {len(expected)}, recovered exactly: {exact}, wrong: {len(wrong)}')
+    for identifier, key, value, got in wrong[:10]:
+        print(f'  {identifier} {key}: expected {value}, got {got}')
+    # On a PDF that already extracts exactly, every other null is a printed "-"
+    dash_filled = sum(
+        1 for position, record in enumerate(records) for key in record.get('_cell_recovery', {})
+        if (position, key) not in expected
+    )
+    print(f'Originally-null cells filled: {dash_filled}')
+    return exact == len(expected) and not wrong and not dash_filled
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Recover missing nutrient cells from their table row (text, then cell OCR).',
+    )
+    parser.add_argument('--pdf', default='VTN FCT 2007.pdf', help='Path to the source PDF.')
+    parser.add_argument(
+        '--data-dir',
+        default='data/vtn_fct_2007',
+        help='Extraction outputs to scan (extracted_ingredients.json + page_index.json).',
+    )
+    parser.add_argument('--nutrient', action='append', choices=list(ALL_NUTRIENTS), default=None,
+                        help='Only these nutrients (repeatable; default: all).')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Cells OCRed at the same time.')
+    parser.add_argument('--ocr-only', action='store_true',
+                        help='OCR every located cell even when its row text parses.')
+    parser.add_argument('--output', default=None,
+                        help='Write proposed values + provenance here (default: <data-dir>/cell_recovery.json).')
+    parser.add_argument('--check', action='store_true',
+                        help='Extract the PDF, blank --knockout known values and require them recovered.')
+    parser.add_argument('--knockout', type=int, default=200, help='Values blanked by --check.')
+    parser.add_argument('--seed', type=int, default=20260101, help='Random seed for --check.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    pdf_path = Path(args.pdf)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f'PDF not found: {pdf_path}')
+
+    if args.check:
+        if not run_check(pdf_path, args.knockout, args.seed, args.concurrency, not args.ocr_only):
+            raise SystemExit(1)
+        return
+
+    data_dir = Path(args.data_dir)
+    records, ambiguous = load_extracted(data_dir)
+    if ambiguous:
+        print(f'Skipping {ambiguous} records with a duplicate id (no unique source page)')
+    summary = recover_missing_cells(
+        records, pdf_path, args.concurrency, args.nutrient, use_row_text=not args.ocr_only, apply=False,
+    )
+    output_path = Path(args.output) if args.output else data_dir / 'cell_recovery.json'
+    with output_path.open('w', encoding='utf-8') as handle:
+        json.dump(recovery_provenance(records), handle, ensure_ascii=False, indent=2)
+
+    print(f"Missing cells: {summary['missing_cells']} {summary['statuses']}")
+    print(f"Recoverable: {summary['recovered']} ({summary['ocr_cells']} OCRed) in {summary['seconds']:.1f}s")
+    for key, count in summary['recovered_by_nutrient'].items():
+        print(f'  {key:28s} {count}')
+    print(f'Proposals: {output_path} (apply with extract_vtn_fct_2007.py --recover-missing-cells)')
+
+
+if __name__ == '__main__':
+    main()
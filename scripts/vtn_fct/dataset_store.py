@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Append-only version history of extracted_ingredients.json.
+
+The extractor, parser_profile.py --apply, latinize_existing_names.py and
+enrich_extracted_data.py each rewrite the dataset wholesale. Every run is
+recorded here as a new version holding only the records that changed (by
+`id`, see record_keys) against the previous one, so any earlier state can be restored
+without re-extracting:
+
+    <store>/versions.jsonl          one line per version (the commit point)
+    <store>/deltas/v000012.json.gz  upserted records, removed ids, new order
+    <store>/snapshots/v000010.json.gz  full record list
+    <store>/head.json               (id, content hash) of the latest version
+
+Checking out version v reads the newest snapshot at or before v and
+applies the deltas after it, so it costs one snapshot plus at most
+`snapshot_every` small deltas. Snapshots are written every
+`snapshot_every` versions, or when a delta would hold most of the records;
+`--compact` re-plans them (e.g. after changing `--snapshot-every`) and
+deletes the ones no longer needed. Every version keeps its delta, so the
+history itself is never rewritten.
+
+Usage:
+    python3 scripts/vtn_fct/dataset_store.py --log
+    python3 scripts/vtn_fct/dataset_store.py --commit -m "manual fix of 4101_raw"
+    python3 scripts/vtn_fct/dataset_store.py --checkout 12 [--output /tmp/v12.json]
+    python3 scripts/vtn_fct/dataset_store.py --compact [--snapshot-every 10]
+    python3 scripts/vtn_fct/dataset_store.py --check
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / 'data' / 'vtn_fct_2007'
+STORE_DIR_NAME = 'dataset_store'
+DEFAULT_SNAPSHOT_EVERY = 10
+
+
+def record_digest(record: dict[str, Any]) -> str:
+    canonical = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def record_keys(records: list[dict[str, Any]]) -> list[str]:
+    """Record ids, with `#2`, `#3`… on repeats (raw extractions can hold duplicate ids)."""
+    seen: dict[str, int] = {}
+    keys = []
+    for record in records:
+        count = seen[record['id']] = seen.get(record['id'], 0) + 1
+        keys.append(record['id'] if count == 1 else f"{record['id']}#{count}")
+    return keys
+
+
+def dataset_digest(index: list[list[str]]) -> str:
+    """SHA-256 of the ordered (id, record hash) pairs: equal digests = equal datasets."""
+    return hashlib.sha256(json.dumps(index, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def index_records(records: list[dict[str, Any]]) -> list[list[str]]:
+    return [[key, record_digest(record)] for key, record in zip(record_keys(records), records)]
+
+
+def _write_gzip_json(path: Path, payload: Any) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    partial = path.with_suffix('.tmp')
+    # mtime=0 keeps the bytes a function of the content
+    partial.write_bytes(gzip.compress(data, mtime=0))
+    partial.replace(path)
+    return path.stat().st_size
+
+
+def _read_gzip_json(path: Path) -> Any:
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+class DatasetStore:
+    def __init__(self, root: Path, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY) -> None:
+        self.root = root
+        self.snapshot_every = max(snapshot_every, 1)
+        self.log_path = root / 'versions.jsonl'
+        self.head_path = root / 'head.json'
+
+    def delta_path(self, version: int) -> Path:
+        return self.root / 'deltas' / f'v{version:06d}.json.gz'
+
+    def snapshot_path(self, version: int) -> Path:
+        return self.root / 'snapshots' / f'v{version:06d}.json.gz'
+
+    # ── History ──
+
+    def versions(self) -> list[dict[str, Any]]:
+        if not self.log_path.exists():
+            return []
+        with self.log_path.open('r', encoding='utf-8') as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+    def _head_index(self, versions: list[dict[str, Any]]) -> list[list[str]]:
+        """(key, hash) pairs of the latest version, rebuilt if head.json is stale."""
+        if not versions:
+            return []
+        latest = versions[-1]['version']
+        try:
+            with self.head_path.open('r', encoding='utf-8') as handle:
+                head = json.load(handle)
+            if head['version'] == latest:
+                return head['index']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+        return index_records(self.checkout(latest))
+
+    def _write_head(self, version: int, index: list[list[str]]) -> None:
+        partial = self.head_path.with_suffix('.tmp')
+        with partial.open('w', encoding='utf-8') as handle:
+            json.dump({'version': version, 'index': index}, handle, separators=(',', ':'))
+        partial.replace(self.head_path)
+
+    def commit(self, records: list[dict[str, Any]], message: str) -> dict[str, Any] | None:
+        """Record `records` as a new version; None when they equal the latest one."""
+        index = index_records(records)
+        digest = dataset_digest(index)
+
+        versions = self.versions()
+        if versions and versions[-1]['sha256'] == digest:
+            return None
+        previous = dict(map(tuple, self._head_index(versions)))
+        version = versions[-1]['version'] + 1 if versions else 1
+
+        current_keys = {key for key, _ in index}
+        removed = [key for key in previous if key not in current_keys]
+        upserts = [
+            [key, record]
+            for record, (key, record_hash) in zip(records, index)
+            if previous.get(key) != record_hash
+        ]
+        # Applying a delta keeps the previous order and appends new keys;
+        # the full order is stored only when that is not the result.
+        kept = [key for key in previous if key in current_keys]
+        added = [key for key, _ in index if key not in previous]
+        order = [key for key, _ in index]
+        reordered = kept + added != order
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        delta = {'upserts': upserts, 'removed': removed, 'order': order if reordered else None}
+        size = _write_gzip_json(self.delta_path(version), delta) if version > 1 else 0
+        since_snapshot = self._versions_since_snapshot(versions)
+        if version == 1 or since_snapshot + 1 >= self.snapshot_every or len(upserts) * 2 > len(records):
+            size += _write_gzip_json(self.snapshot_path(version), records)
+
+        entry = {
+            'version': version,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'message': message,
+            'records': len(records),
+            'sha256': digest,
+            'upserted': len(upserts),
+            'added': len(added),
+            'removed': len(removed),
+            'reordered': reordered,
+            'bytes': size,
+        }
+        with self.log_path.open('a', encoding='utf-8') as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._write_head(version, index)
+        return entry
+
+    def _versions_since_snapshot(self, versions: list[dict[str, Any]]) -> int:
+        count = 0
+        for entry in reversed(versions):
+            if self.snapshot_path(entry['version']).exists():
+                return count
+            count += 1
+        return count
+
+    # ── Checkout ──
+
+    def checkout(self, version: int) -> list[dict[str, Any]]:
+        versions = {entry['version']: entry for entry in self.versions()}
+        if version not in versions:
+            raise KeyError(f'No version {version} in {self.root}')
+        base = version
+        while not self.snapshot_path(base).exists():
+            base -= 1
+            if base < 1:
+                raise FileNotFoundError(f'No snapshot at or before version {version} in {self.root}')
+
+        snapshot = _read_gzip_json(self.snapshot_path(base))
+        by_key = dict(zip(record_keys(snapshot), snapshot))
+        for step in range(base + 1, version + 1):
+            delta = _read_gzip_json(self.delta_path(step))
+            for key in delta['removed']:
+                del by_key[key]
+            for key, record in delta['upserts']:
+                by_key[key] = record
+            if delta['order'] is not None:
+                by_key = {key: by_key[key] for key in delta['order']}
+        return list(by_key.values())
+
+    # ── Compaction ──
+
+    def compact(self) -> dict[str, int]:
+        """Snapshots at version 1 and every `snapshot_every` versions after; others deleted."""
+        written = deleted = 0
+        wanted = {entry['version'] for entry in self.versions() if (entry['version'] - 1) % self.snapshot_every == 0}
+        for version in sorted(wanted):
+            if not self.snapshot_path(version).exists():
+                _write_gzip_json(self.snapshot_path(version), self.checkout(version))
+                written += 1
+        for path in sorted((self.root / 'snapshots').glob('v*.json.gz')):
+            if int(path.name[1:7]) not in wanted:
+                path.unlink()
+                deleted += 1
+        return {'snapshots_written': written, 'snapshots_deleted': deleted}
+
+    def disk_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.root.rglob('*') if path.is_file())
+
+
+def record_dataset_version(
+    records: list[dict[str, Any]],
+    data_dir: Path,
+    message: str,
+    store: DatasetStore | None = None,
+) -> None:
+    """Pipeline hook: version the dataset just written to `data_dir`."""
+    store = store or DatasetStore(data_dir / STORE_DIR_NAME)
+    entry = store.commit(records, message)
+    if entry is None:
+        print('Dataset unchanged since the last stored version')
+    else:
+        print(
+            f"Dataset version {entry['version']}: {entry['upserted']} records changed "
+            f"({entry['added']} new), {entry['removed']} removed"
+        )
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Version history of the extracted dataset (deltas by record id + snapshots).',
+    )
+    parser.add_argument(
+        '--input',
+        default=str(DATA_DIR / 'extracted_ingredients.json'),
+        help='Dataset JSON (--commit reads it; default --checkout target).',
+    )
+    parser.add_argument(
+        '--store',
+        default=None,
+        help=f'Store directory (default: {STORE_DIR_NAME}/ next to --input).',
+    )
+    parser.add_argument(
+        '--snapshot-every',
+        type=int,
+        default=DEFAULT_SNAPSHOT_EVERY,
+        help='Versions between full snapshots (bounds the deltas applied per checkout).',
+    )
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--log', action='store_true', help='List versions (default action).')
+    action.add_argument('--commit', action='store_true', help='Record --input as a new version.')
+    action.add_argument('--checkout', type=int, default=None, help='Write this version to --output.')
+    action.add_argument('--compact', action='store_true', help='Re-plan snapshots for --snapshot-every.')
+    action.add_argument(
+        '--check',
+        action='store_true',
+        help='Check out every version and fail (exit 1) if one does not match its recorded hash.',
+    )
+    parser.add_argument('-m', '--message', default='manual', help='Message for --commit.')
+    parser.add_argument('--output', default=None, help='Checkout target (default: --input).')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    input_path = Path(args.input)
+    store = DatasetStore(
+        Path(args.store) if args.store else input_path.parent / STORE_DIR_NAME,
+        args.snapshot_every,
+    )
+
+    if args.commit:
+        with input_path.open('r', encoding='utf-8') as handle:
+            records = json.load(handle)
+        record_dataset_version(records, input_path.parent, args.message, store)
+        return
+
+    if args.checkout is not None:
+        started = time.perf_counter()
+        records = store.checkout(args.checkout)
+        output_path = Path(args.output) if args.output else input_path
+        with output_path.open('w', encoding='utf-8') as handle:
+            json.dump(records, handle, ensure_ascii=False, indent=2)
+            handle.write('\n')
+        print(
+            f'Checked out version {args.checkout} ({len(records)} records) to {output_path} '
+            f'in {time.perf_counter() - started:.3f}s'
+        )
+        return
+
+    if args.compact:
+        print(store.compact())
+
+    versions = store.versions()
+    if args.check:
+        failures = 0
+        for entry in versions:
+            if dataset_digest(index_records(store.checkout(entry['version']))) != entry['sha256']:
+                print(f"FAIL version {entry['version']}: content does not match its recorded hash")
+                failures += 1
+        if failures:
+            raise SystemExit(1)
+        print(f'All {len(versions)} versions check out to their recorded content: OK')
+        return
+
+    for entry in versions:
+        snapshot = ' snapshot' if store.snapshot_path(entry['version']).exists() else ''
+        print(
+            f"v{entry['version']:<4} {entry['created']}  {entry['records']:4d} records  "
+            f"+{entry['added']} ~{entry['upserted'] - entry['added']} -{entry['removed']}"
+            f"{' reordered' if entry['reordered'] else ''}{snapshot}  {entry['message']}"
+        )
+    if versions:
+        line = f'{len(versions)} versions, {store.disk_bytes() / 1024:.0f} KB on disk'
+        if input_path.exists() and versions[-1]['records']:
+            # Rough size of the same history kept as full JSON copies
+            per_record = input_path.stat().st_size / versions[-1]['records']
+            copies = sum(entry['records'] for entry in versions) * per_record
+            line += f' (~{copies / 1024:.0f} KB as full copies)'
+        print(line)
+    else:
+        print(f'No versions in {store.root}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Derived nutrient metrics for VTN FCT 2007 records (post-enrichment stage).
+
+Computed once, vectorized, so request-time code only reads them:
+
+- `energy_pct_protein|carbohydrate|fat` — share of `calories_kcal` from
+  each macro (Atwater 4/4/9 kcal/g), in percent
+- `per_100g_purchased.<nutrient>` — value per 100 g as purchased,
+  i.e. `per_100g × (100 − inedible_portion_pct) / 100`
+- `per_100kcal.<nutrient>` — nutrient density per 100 kcal
+- `sodium_potassium_ratio` — sodium_mg / potassium_mg (mass ratio)
+
+Null semantics: a metric is null whenever any input it needs is null, or
+its denominator (`calories_kcal`, `potassium_mg`) is null or 0. Nothing is
+imputed.
+
+Outputs carry `rules_version` plus a SHA-256 of the input records; the
+stage is skipped when both match the existing JSON output (`--force` to
+rebuild). Bump `RULES_VERSION` whenever a formula below changes.
+
+Outputs (in data/vtn_fct_2007/):
+- derived_metrics.json — stamp + one object per record
+- derived_metrics.csv  — flat columns, empty cell = null
+- derived_metrics.npz  — columnar float64 arrays (NaN = null) + `id`
+
+Usage:
+    python3 scripts/vtn_fct/derive_metrics.py
+    python3 scripts/vtn_fct/derive_metrics.py --force
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from enrich_extracted_data import DATA_DIR, NUTRIENT_KEYS
+from nutrient_neighbors import nutrient_matrix
+
+RULES_VERSION = '1'
+
+ATWATER_KCAL_PER_G = {
+    'protein': ('protein_g', 4.0),
+    'carbohydrate': ('carbohydrate_g', 4.0),
+    'fat': ('fat_g', 9.0),
+}
+
+DENSITY_KEYS = [key for key in NUTRIENT_KEYS if key != 'calories_kcal']
+
+
+def input_digest(records: list[dict[str, Any]]) -> str:
+    """SHA-256 over the fields the derivation rules read."""
+    digest = hashlib.sha256()
+    for record in records:
+        payload = [record['id'], record.get('inedible_portion_pct'), record.get('per_100g', {})]
+        digest.update(json.dumps(payload, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """NaN where the denominator is null or zero."""
+    valid = np.isfinite(denominator) & (denominator != 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(valid, numerator / np.where(valid, denominator, 1.0), np.nan)
+
+
+def derive_columns(records: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    """Metric name → float64 column (NaN = null), in record order."""
+    matrix = nutrient_matrix(records)
+    column = {key: matrix[:, position] for position, key in enumerate(NUTRIENT_KEYS)}
+    calories = column['calories_kcal']
+    inedible = np.array([record.get('inedible_portion_pct') for record in records], dtype=float)
+
+    columns: dict[str, np.ndarray] = {}
+    for name, (key, kcal_per_g) in ATWATER_KCAL_PER_G.items():
+        columns[f'energy_pct_{name}'] = _safe_divide(column[key] * kcal_per_g * 100, calories)
+
+    edible_fraction = (100 - inedible) / 100
+    for key in NUTRIENT_KEYS:
+        columns[f'per_100g_purchased.{key}'] = column[key] * edible_fraction
+
+    for key in DENSITY_KEYS:
+        columns[f'per_100kcal.{key}'] = _safe_divide(column[key] * 100, calories)
+
+    columns['sodium_potassium_ratio'] = _safe_divide(column['sodium_mg'], column['potassium_mg'])
+    return columns
+
+
+def _value(value: float) -> float | None:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def to_records(ids: list[str], columns: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+    """Nest dotted column names (`per_100kcal.iron_mg`) into objects."""
+    rows: list[dict[str, Any]] = []
+    for position, record_id in enumerate(ids):
+        row: dict[str, Any] = {'id': record_id}
+        for name, values in columns.items():
+            if '.' in name:
+                group, key = name.split('.', 1)
+                row.setdefault(group, {})[key] = _value(values[position])
+            else:
+                row[name] = _value(values[position])
+        rows.append(row)
+    return rows
+
+
+def read_stamp(json_path: Path) -> tuple[str | None, str | None]:
+    if not json_path.exists():
+        return None, None
+    with json_path.open('r', encoding='utf-8') as handle:
+        existing = json.load(handle)
+    return existing.get('rules_version'), existing.get('input_sha256')
+
+
+def write_outputs(
+    out_dir: Path,
+    ids: list[str],
+    columns: dict[str, np.ndarray],
+    digest: str,
+) -> list[Path]:
+    json_path = out_dir / 'derived_metrics.json'
+    csv_path = out_dir / 'derived_metrics.csv'
+    npz_path = out_dir / 'derived_metrics.npz'
+
+    document = {
+        'rules_version': RULES_VERSION,
+        'input_sha256': digest,
+        'records': to_records(ids, columns),
+    }
+    with json_path.open('w', encoding='utf-8') as handle:
+        json.dump(document, handle, ensure_ascii=False, indent=2)
+        handle.write('\n')
+
+    with csv_path.open('w', encoding='utf-8', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['id', *columns])
+        for position, record_id in enumerate(ids):
+            writer.writerow([
+                record_id,
+                *('' if np.isnan(values[position]) else round(float(values[position]), 4)
+                  for values in columns.values()),
+            ])
+
+    np.savez_compressed(
+        npz_path,
+        id=np.array(ids),
+        rules_version=np.array(RULES_VERSION),
+        input_sha256=np.array(digest),
+        **columns,
+    )
+    return [json_path, csv_path, npz_path]
+
+
+def run_stage(
+    records: list[dict[str, Any]],
+    out_dir: Path = DATA_DIR,
+    force: bool = False,
+) -> list[Path]:
+    """Derive and write metrics unless rules and inputs are unchanged.
+
+    Returns the written paths (empty when the stage was skipped).
+    """
+    digest = input_digest(records)
+    if not force and read_stamp(out_dir / 'derived_metrics.json') == (RULES_VERSION, digest):
+        print(f'Derived metrics up to date (rules v{RULES_VERSION}); skipped')
+        return []
+
+    columns = derive_columns(records)
+    written = write_outputs(out_dir, [record['id'] for record in records], columns, digest)
+    print(f'Derived {len(columns)} metrics for {len(records)} records (rules v{RULES_VERSION})')
+    for path in written:
+        print(f'Wrote {path}')
+    return written
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Derive energy shares, as-purchased values, nutrient density and Na:K ratio.',
+    )
+    parser.add_argument(
+        '--input',
+        default=str(DATA_DIR / 'extracted_ingredients.json'),
+        help='Enriched ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--out-dir',
+        default=str(DATA_DIR),
+        help='Directory for derived_metrics.{json,csv,npz}.',
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild even if rules version and input digest are unchanged.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    with Path(args.input).open('r', encoding='utf-8') as handle:
+        records = json.load(handle)
+    run_stage(records, Path(args.out_dir), force=args.force)
+
+
+if __name__ == '__main__':
+    main()
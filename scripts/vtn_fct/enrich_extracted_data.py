@@ -198,6 +198,10 @@ def main() -> None:
         f.write('\n')
     print(f'Wrote {json_path}')
 
+    # Version history (dataset_store.py)
+    from dataset_store import record_dataset_version
+    record_dataset_version(enriched_records, DATA_DIR, 'enrich_extracted_data.py')
+
     # Write CSV
     csv_columns = [
         'id', 'name_primary', 'name_en', 'type_vn', 'type_en',
@@ -237,6 +241,10 @@ def main() -> None:
             f.write('\n')
         print(f'Updated {report_path} (total_records: {len(enriched_records)})')
 
+    # Derived metrics (skipped when rules + inputs are unchanged)
+    from derive_metrics import run_stage
+    run_stage(enriched_records, DATA_DIR)
+
     # Summary
     from collections import Counter
     group_counts = Counter(
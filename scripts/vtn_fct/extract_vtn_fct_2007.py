@@ -5,15 +5,23 @@ import argparse
 import csv
 import json
 import re
+import sys
+import time
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
-import pdfplumber
-import pytesseract
-from pdf2image import convert_from_path
+from page_text_cache import PageTextCache
+from parser_profile import PARSE_STATE_FILE, ParserProfile, load_profile, records_digest, write_parse_state
+from state_classifier import infer_state
+from text_backends import BACKENDS, DEFAULT_BACKEND, TextBackend, open_backend
+from vn_transcode import tcvn3_to_unicode
+
+if TYPE_CHECKING:
+    from extraction_progress import ExtractionProgress
 
 
 @dataclass
@@ -21,125 +29,24 @@ class ExtractionResult:
     records: list[dict[str, Any]]
     skipped_pages: list[int]
     parse_errors: list[dict[str, Any]]
+    pipeline: dict[str, Any] = field(default_factory=dict)
+    confidence: dict[str, Any] = field(default_factory=dict)
+    cell_recovery: dict[str, Any] = field(default_factory=dict)
+    progress: dict[str, Any] = field(default_factory=dict)
+    # Per-page intermediate state for parser_profile.py (kept with keep_parse_state)
+    parse_state: list[dict[str, Any]] = field(default_factory=list)
+    # Limits and incidents of a page_watchdog.py run
+    watchdog: dict[str, Any] = field(default_factory=dict)
 
 
 # ── Unified nutrient definitions ────────────────────────────────────
-# Each entry: field_name → (label_regex, unit_regex | None)
-# Field names include the measurement unit as a suffix for clarity.
-# The label regex matches the English label in the PDF nutrient table.
-# The unit regex matches the unit column (g, mg, μg, mcg, ug, KCal).
-
-ALL_NUTRIENTS: dict[str, tuple[str, str | None]] = {
-    # ── Macros ────────────────────────────────────────────────
-    'calories_kcal': (r'\(Energy\)\s+KCal', None),
-    'protein_g': (r'\bProtein\b', 'g'),
-    'carbohydrate_g': (r'\(Carbohydrate\)', 'g'),
-    'fat_g': (r'\(Fat\)', 'g'),
-    'fiber_g': (r'\(Fiber\)', 'g'),
-    # ── Minerals ──────────────────────────────────────────────
-    'sodium_mg': (r'\(Sodium\)', 'mg'),
-    'calcium_mg': (r'\(Calcium\)', 'mg'),
-    'iron_mg': (r'\(Iron\)', 'mg'),
-    'magnesium_mg': (r'\(Magnesium\)', 'mg'),
-    'phosphorus_mg': (r'\(Phosphorous\)|\(Phosphorus\)', 'mg'),
-    'potassium_mg': (r'\(Potassium\)', 'mg'),
-    'zinc_mg': (r'\(Zinc\)', 'mg'),
-    'copper_mcg': (r'\(Copper\)', r'μg|ug|mcg'),
-    'manganese_mg': (r'\(Manganese\)', 'mg'),
-    # ── Fat-soluble vitamins & precursors ─────────────────────
-    'beta_carotene_mcg': (r'Beta.caroten\b', r'μg|ug|mcg'),
-    'vitamin_a_mcg': (r'Vitamin\s+A\b', r'μg|ug|mcg'),
-    'vitamin_d_mcg': (r'Vitamin\s+D\b', r'μg|ug|mcg'),
-    'vitamin_e_mg': (r'Vitamin\s+E\b', 'mg'),
-    'vitamin_k_mcg': (r'Vitamin\s+K\b', r'μg|ug|mcg'),
-    # ── Water-soluble vitamins ────────────────────────────────
-    'vitamin_c_mg': (r'Vitamin\s+C\b', 'mg'),
-    'vitamin_b1_mg': (r'Vitamin\s+B1\b', 'mg'),
-    'vitamin_b2_mg': (r'Vitamin\s+B2\b', 'mg'),
-    'vitamin_pp_mg': (r'Vitamin\s+PP\b', 'mg'),
-    'vitamin_b5_mg': (r'Vitamin\s+B5\b', 'mg'),
-    'vitamin_b6_mg': (r'Vitamin\s+B6\b', 'mg'),
-    'vitamin_b9_mcg': (r'Vitamin\s+B9\b', r'μg|ug|mcg'),
-    'vitamin_b12_mcg': (r'Vitamin\s+B12\b', r'μg|ug|mcg'),
-    'vitamin_h_mcg': (r'Vitamin\s+H\b', r'μg|ug|mcg'),
-}
+# field_name → (label_regex, unit_regex | None), from the parser profile
+# (data/vtn_fct_2007/parser_profile.json, see parser_profile.py).
 
-MOJIBAKE_MARKERS = re.compile(r'[ªµ¶·¸¹º»¼½¾¿]|\(cid:')
+PARSER_PROFILE = load_profile()
+ALL_NUTRIENTS: dict[str, tuple[str, str | None]] = PARSER_PROFILE.nutrients
 
-# ── TCVN3 → Vietnamese Unicode mapping ──────────────────────────────
-# Maps TCVN3-encoded characters (as pdfplumber reads them) to proper
-# Vietnamese Unicode with diacritics.
-TCVN3_TO_VIET: dict[str, str] = {
-    '\u00A7': 'Đ',   # §
-    '\u00A8': 'ă',   # ¨
-    '\u00A9': 'â',   # ©
-    '\u00AA': 'ê',   # ª
-    '\u00AB': 'ô',   # «
-    '\u00AC': 'ơ',   # ¬
-    '\u00AE': 'đ',   # ®
-    '\u2212': 'ư',   # − MINUS SIGN
-    '\u03BC': 'à',   # μ Greek mu
-    '\u00B5': 'à',   # µ MICRO SIGN
-    '\u00B6': 'ả',   # ¶
-    '\u00B7': 'ã',   # ·
-    '\u00B8': 'á',   # ¸
-    '\u00B9': 'ạ',   # ¹
-    '\u00BE': 'ắ',   # ¾
-    '\u00BF': 'ằ',   # ¿
-    '\u00C0': 'ẳ',   # À
-    '\u00C1': 'ẵ',   # Á
-    '\u00C6': 'ặ',   # Æ
-    '\u00C7': 'ầ',   # Ç
-    '\u00C8': 'ẩ',   # È
-    '\u00C9': 'ẫ',   # É
-    '\u00CA': 'ấ',   # Ê
-    '\u00CB': 'ậ',   # Ë
-    '\u00CC': 'è',   # Ì
-    '\u00CD': 'ẽ',   # Í
-    '\u00CE': 'ẻ',   # Î
-    '\u00D0': 'é',   # Ð
-    '\u00D1': 'ẹ',   # Ñ
-    '\u00D2': 'ề',   # Ò
-    '\u00D3': 'ể',   # Ó
-    '\u00D4': 'ễ',   # Ô
-    '\u00D5': 'ế',   # Õ
-    '\u00D6': 'ệ',   # Ö
-    '\u00D7': 'ì',   # ×
-    '\u00D8': 'ỉ',   # Ø
-    '\u00DC': 'ĩ',   # Ü
-    '\u00DD': 'í',   # Ý
-    '\u00DE': 'ị',   # Þ
-    '\u00DF': 'ò',   # ß
-    '\u00E0': 'õ',   # à  (o tilde)
-    '\u00E1': 'ỏ',   # á
-    '\u00E3': 'ó',   # ã
-    '\u00E4': 'ọ',   # ä
-    '\u00E5': 'ồ',   # å
-    '\u00E6': 'ổ',   # æ
-    '\u00E7': 'ỗ',   # ç
-    '\u00E8': 'ố',   # è
-    '\u00E9': 'ộ',   # é
-    '\u00EA': 'ờ',   # ê
-    '\u00EB': 'ở',   # ë
-    '\u00EC': 'ỡ',   # ì
-    '\u00ED': 'ớ',   # í
-    '\u00EE': 'ợ',   # î
-    '\u00EF': 'ù',   # ï
-    '\u00F1': 'ủ',   # ñ
-    '\u00F2': 'ũ',   # ò
-    '\u00F3': 'ú',   # ó
-    '\u00F4': 'ụ',   # ô
-    '\u00F5': 'ừ',   # õ
-    '\u00F6': 'ử',   # ö
-    '\u00F7': 'ữ',   # ÷
-    '\u00F8': 'ứ',   # ø
-    '\u00F9': 'ự',   # ù
-    '\u00FA': 'ỳ',   # ú
-    '\u00FB': 'ỷ',   # û
-    '\u00FC': 'ỹ',   # ü
-    '\u00FD': 'ý',   # ý
-    '\u00FE': 'ỵ',   # þ
-}
+MOJIBAKE_MARKERS = re.compile(r'[ªµ¶·¸¹º»¼½¾¿]|\(cid:')
 
 
 # ── Text deduplication ──────────────────────────────────────────────
@@ -187,6 +94,9 @@ def deduplicate_text(text: str) -> str:
     n = len(text)
     min_doubled_pairs = 4  # require 4 consecutive doubled chars to trigger
     in_doubled = False
+    # End of the current run of bridge chars, so a long run is scanned once
+    # rather than once per char (" . . . ." was quadratic; see parser_fuzz.py)
+    bridge_end = -1
 
     while i < n:
         if not in_doubled:
@@ -212,9 +122,13 @@ def deduplicate_text(text: str) -> str:
                 result.append(text[i])
                 i += 1
                 # Peek ahead past any bridge chars
-                j = i
-                while j < n and text[j] in _DEDUP_BRIDGE:
-                    j += 1
+                if i <= bridge_end:
+                    j = bridge_end
+                else:
+                    j = i
+                    while j < n and text[j] in _DEDUP_BRIDGE:
+                        j += 1
+                    bridge_end = j
                 if j + 1 < n and text[j] == text[j + 1]:
                     pass  # doubling resumes — stay in doubled mode
                 else:
@@ -260,50 +174,7 @@ def slugify(value: str) -> str:
 
 def tcvn3_to_vietnamese(value: str) -> str:
     """Convert TCVN3-encoded name to proper Vietnamese Unicode."""
-    converted = ''.join(TCVN3_TO_VIET.get(ch, ch) for ch in value)
-    return normalize_spaces(converted)
-
-
-def infer_state(vn_name: str, en_name: str) -> str:
-    combined = f'{vn_name} {en_name}'.lower()
-
-    cooked_keywords = {
-        'cooked',
-        'boiled',
-        'fried',
-        'steamed',
-        'roasted',
-        'baked',
-        'grilled',
-        'stir-fried',
-        'braised',
-        'soup',
-        'porridge',
-        'chao', 'cháo',
-        'canh',
-        'xao', 'xào',
-        'kho', 'khô',
-        'nuong', 'nướng',
-        'hap', 'hấp',
-        'luộc', 'chiên', 'rán',
-    }
-    raw_keywords = {
-        'raw',
-        'fresh',
-        'dried',
-        'uncooked',
-        'song', 'sống',
-        'tuoi', 'tươi',
-        'kho', 'khô',
-    }
-
-    if any(keyword in combined for keyword in raw_keywords):
-        return 'raw'
-
-    if any(keyword in combined for keyword in cooked_keywords):
-        return 'cooked'
-
-    return 'raw'
+    return normalize_spaces(tcvn3_to_unicode(value))
 
 
 def needs_ocr_header_fix(record: dict[str, Any]) -> bool:
@@ -322,13 +193,14 @@ def needs_ocr_header_fix(record: dict[str, Any]) -> bool:
 def parse_ocr_header(ocr_text: str) -> tuple[str, str, str, int | None, float | None] | None:
     normalized = normalize_spaces(ocr_text)
 
+    # Bounded gaps keep repeated labels linear (OCR header fields are < 80 chars)
     vn_patterns = [
-        r'Vietnamese[^:]*:\s*(.*?)\s+STT\s*[:.]?\s*([0-9]+)',
-        r'Ten\s+thuc\s+pham[^:]*:\s*(.*?)\s+STT\s*[:.]?\s*([0-9]+)',
+        r'Vietnamese[^:]{0,40}:\s*(.{0,200}?)\s+STT\s*[:.]?\s*([0-9]+)',
+        r'Ten\s+thuc\s+pham[^:]{0,40}:\s*(.{0,200}?)\s+STT\s*[:.]?\s*([0-9]+)',
     ]
     en_patterns = [
-        r'English[^:]*:\s*(.*?)\s+Ma\s*s[o0d]\s*[:.]?\s*([0-9\s]{3,8})',
-        r'Ten\s+tieng\s+Anh[^:]*:\s*(.*?)\s+Ma\s*s[o0d]\s*[:.]?\s*([0-9\s]{3,8})',
+        r'English[^:]{0,40}:\s*(.{0,200}?)\s+Ma\s*s[o0d]\s*[:.]?\s*([0-9\s]{3,8})',
+        r'Ten\s+tieng\s+Anh[^:]{0,40}:\s*(.{0,200}?)\s+Ma\s*s[o0d]\s*[:.]?\s*([0-9\s]{3,8})',
     ]
 
     vn_match = None
@@ -363,13 +235,28 @@ def parse_ocr_header(ocr_text: str) -> tuple[str, str, str, int | None, float |
     return vn_name, en_name, food_code, stt, edible_portion
 
 
+OCR_DPI = 250
+OCR_LANG = 'eng'
+HEADER_CROP_FRACTION = 0.2
+
+
+def crop_header(image: Any) -> Any:
+    """Top strip of a rendered page holding the name / code / refuse header."""
+    width, height = image.size
+    return image.crop((0, 0, width, int(height * HEADER_CROP_FRACTION)))
+
+
 def extract_ocr_header(pdf_path: Path, page_number: int) -> tuple[str, str, str, int | None, float | None] | None:
+    # OCR dependencies are only needed with --ocr-header-fallback
+    import pytesseract
+    from pdf2image import convert_from_path
+
     try:
         images = convert_from_path(
             str(pdf_path),
             first_page=page_number,
             last_page=page_number,
-            dpi=250,
+            dpi=OCR_DPI,
         )
     except Exception:  # noqa: BLE001
         return None
@@ -377,44 +264,55 @@ def extract_ocr_header(pdf_path: Path, page_number: int) -> tuple[str, str, str,
     if not images:
         return None
 
-    image = images[0]
-    width, height = image.size
-    header_crop = image.crop((0, 0, width, int(height * 0.2)))
-
-    ocr_text = pytesseract.image_to_string(header_crop, lang='eng')
+    ocr_text = pytesseract.image_to_string(crop_header(images[0]), lang=OCR_LANG)
     return parse_ocr_header(ocr_text)
 
 
-def extract_value(text: str, label_pattern: str, unit_pattern: str | None) -> float | None:
+# Longest label → unit gap searched. Unbounded, a line of repeated labels
+# without units costs O(line²); the widest gap on real pages is ~30 chars.
+NUTRIENT_GAP_CHARS = 160
+
+
+@lru_cache(maxsize=None)
+def nutrient_regex(label_pattern: str, unit_pattern: str | None) -> re.Pattern[str]:
+    """Compiled `label … unit value` pattern; group 1 is the raw value."""
     if unit_pattern is None:
         regex = rf'(?:{label_pattern})\s+([0-9]+(?:\.[0-9]+)?|--|-)'
     else:
-        regex = rf'(?:{label_pattern}).*?(?:{unit_pattern})\s+([0-9]+(?:\.[0-9]+)?|--|-)'
+        regex = (
+            rf'(?:{label_pattern}).{{0,{NUTRIENT_GAP_CHARS}}}?'
+            rf'(?:{unit_pattern})\s+([0-9]+(?:\.[0-9]+)?|--|-)'
+        )
+    return re.compile(regex, flags=re.IGNORECASE)
+
 
-    match = re.search(regex, text, flags=re.IGNORECASE)
+def extract_value(text: str, label_pattern: str, unit_pattern: str | None) -> float | None:
+    match = nutrient_regex(label_pattern, unit_pattern).search(text)
     if not match:
         return None
 
     return parse_numeric(match.group(1))
 
 
-def extract_header(text: str) -> tuple[str, str, str, int | None, float | None] | None:
+HEADER_VN_RE = PARSER_PROFILE.header_regex('vietnamese')
+HEADER_EN_RE = PARSER_PROFILE.header_regex('english')
+HEADER_EDIBLE_RE = PARSER_PROFILE.header_regex('edible')
+
+
+def extract_header(
+    text: str,
+    profile: ParserProfile | None = None,
+) -> tuple[str, str, str, int | None, float | None] | None:
+    """Header groups; `profile` overrides the loaded patterns (parser_profile.py --apply)."""
     normalized_text = re.sub(r'\s+', ' ', text)
+    if profile is None:
+        vn_re, en_re, edible_re = HEADER_VN_RE, HEADER_EN_RE, HEADER_EDIBLE_RE
+    else:
+        vn_re, en_re, edible_re = (profile.header_regex(name) for name in ('vietnamese', 'english', 'edible'))
 
-    vn_match = re.search(
-        r'Vietnamese\):?\s*(.*?)\s+STT:?\s*([0-9]+)',
-        normalized_text,
-        flags=re.IGNORECASE,
-    )
-    en_match = re.search(
-        r'English\):?\s*(.*?)\s+M[^:]{0,14}:?\s*([0-9\s]{3,8})',
-        normalized_text,
-    )
-    edible_match = re.search(
-        r'\(%\):\s*([0-9]+(?:\.[0-9]+)?)',
-        normalized_text,
-        flags=re.IGNORECASE,
-    )
+    vn_match = vn_re.search(normalized_text)
+    en_match = en_re.search(normalized_text)
+    edible_match = edible_re.search(normalized_text)
 
     if not vn_match or not en_match:
         return None
@@ -428,142 +326,271 @@ def extract_header(text: str) -> tuple[str, str, str, int | None, float | None]
     return vn_name, en_name, food_code, stt, edible_portion
 
 
-def extract_record(text: str, page_number: int) -> dict[str, Any] | None:
+def header_record_fields(header: tuple[str, str, str, int | None, float | None]) -> dict[str, Any]:
+    """Record fields that come from the header groups."""
+    vn_name, en_name, food_code, stt, inedible_portion = header
+    vn_name = tcvn3_to_vietnamese(vn_name)
+    state = infer_state(vn_name, en_name)
+    return {
+        'id': f'fao_vn_2007_{food_code}_{state}',
+        'name_primary': vn_name,
+        'name_alt': [],
+        'name_en': en_name,
+        'state': state,
+        'inedible_portion_pct': inedible_portion,
+        '_food_code': food_code,
+        '_stt': stt,
+    }
+
+
+def extract_record(text: str, page_number: int, deduped: str | None = None) -> dict[str, Any] | None:
     # Extract header from original text (header is not doubled)
     header = extract_header(text)
     if header is None:
         return None
-
-    vn_name, en_name, food_code, stt, inedible_portion = header
-    vn_name = tcvn3_to_vietnamese(vn_name)
-    state = infer_state(vn_name, en_name)
+    fields = header_record_fields(header)
 
     # Deduplicate the nutrient table region before extracting values
-    deduped = deduplicate_text(text)
+    if deduped is None:
+        deduped = deduplicate_text(text)
 
     per_100g = {
         key: extract_value(deduped, label, unit)
         for key, (label, unit) in ALL_NUTRIENTS.items()
     }
 
-    identifier = f'fao_vn_2007_{food_code}_{state}'
-
     return {
-        'id': identifier,
-        'name_primary': vn_name,
-        'name_alt': [],
-        'name_en': en_name,
+        'id': fields['id'],
+        'name_primary': fields['name_primary'],
+        'name_alt': fields['name_alt'],
+        'name_en': fields['name_en'],
         'source': 'FAO_VN_2007',
-        'state': state,
-        'inedible_portion_pct': inedible_portion,
+        'state': fields['state'],
+        'inedible_portion_pct': fields['inedible_portion_pct'],
         'per_100g': per_100g,
         'last_verified': date.today().isoformat(),
         # internal fields used during extraction, stripped from final output
-        '_food_code': food_code,
-        '_stt': stt,
+        '_food_code': fields['_food_code'],
+        '_stt': fields['_stt'],
         '_source_page': page_number,
     }
 
 
-def run_extraction(
+def nutrient_signals(text: str, deduped: str) -> dict[str, list[str]]:
+    """Per-nutrient doubt signals for extraction_confidence.py.
+
+    - dedup_row: the matched line was rewritten by deduplicate_text
+    - multiple_matches: the nutrient pattern matches more than once
+    - label_missing: the label/unit pattern is not on the page at all
+    """
+    raw_lines = text.split('\n')
+    deduped_lines = deduped.split('\n')
+    aligned = len(raw_lines) == len(deduped_lines)
+    signals: dict[str, list[str]] = {'dedup_row': [], 'multiple_matches': [], 'label_missing': []}
+
+    for key, (label, unit) in ALL_NUTRIENTS.items():
+        matches = nutrient_regex(label, unit).finditer(deduped)
+        first = next(matches, None)
+        if first is None:
+            signals['label_missing'].append(key)
+            continue
+        if next(matches, None) is not None:
+            signals['multiple_matches'].append(key)
+        if aligned:
+            line = deduped.count('\n', 0, first.start())
+            if raw_lines[line] != deduped_lines[line]:
+                signals['dedup_row'].append(key)
+        elif text != deduped:
+            signals['dedup_row'].append(key)
+    return signals
+
+
+def read_page_text(source: TextBackend, page_index: int, page_cache: PageTextCache | None) -> str:
+    text = page_cache.get(page_index) if page_cache is not None else None
+    if text is None:
+        text = source.page_text(page_index)
+        if page_cache is not None:
+            page_cache.put(page_index, text)
+    return text
+
+
+def dump_page_text(page_index: int, text: str) -> None:
+    """Debug: print full raw + deduplicated text for one page."""
+    print(f'\n{"="*60}')
+    print(f'RAW TEXT — page {page_index}')
+    print(f'{"="*60}')
+    print(text)
+    print(f'\n{"="*60}')
+    print(f'DEDUPLICATED TEXT — page {page_index}')
+    print(f'{"="*60}')
+    print(deduplicate_text(text))
+    print(f'{"="*60}\n')
+
+
+def parse_page(
+    text: str,
+    page_index: int,
+    skipped_pages: list[int],
+    parse_errors: list[dict[str, Any]],
+    parse_state: list[dict[str, Any]] | None = None,
+) -> dict[str, Any] | None:
+    """Record for a food page; skips and errors are appended to the lists.
+
+    With `parse_state`, the page's intermediate state (text, deduplicated text,
+    header groups) is appended for field-level re-evaluation (parser_profile.py)."""
+    if 'Vietnamese)' not in text or 'English)' not in text:
+        skipped_pages.append(page_index)
+        return None
+
+    try:
+        deduped = deduplicate_text(text)
+        record = extract_record(text, page_index, deduped)
+        if record is not None:
+            record['_signals'] = nutrient_signals(text, deduped)
+        if parse_state is not None:
+            parse_state.append(
+                {'page': page_index, 'text': text, 'deduped': deduped, 'header': extract_header(text)}
+            )
+    except Exception as error:  # noqa: BLE001
+        parse_errors.append(
+            {
+                'page': page_index,
+                'error': str(error),
+            }
+        )
+        return None
+
+    if record is None:
+        skipped_pages.append(page_index)
+    return record
+
+
+def apply_ocr_header(
+    record: dict[str, Any],
+    ocr_header: tuple[str, str, str, int | None, float | None],
+) -> None:
+    vn_name, en_name, food_code, stt, inedible_portion = ocr_header
+    record['name_primary'] = vn_name
+    record['name_en'] = en_name
+    record['inedible_portion_pct'] = inedible_portion
+    record['_food_code'] = food_code
+    record['_stt'] = stt
+    record['_header_source'] = 'ocr'
+
+    state = infer_state(vn_name, en_name)
+    record['state'] = state
+    record['id'] = f'fao_vn_2007_{food_code}_{state}'
+
+
+def repair_name_encoding(record: dict[str, Any]) -> None:
+    """Convert a still-mojibake primary name, keeping the original as an alt name."""
+    if not MOJIBAKE_MARKERS.search(record['name_primary']):
+        return
+
+    original_name = record['name_primary']
+    converted_name = tcvn3_to_vietnamese(original_name)
+    if converted_name:
+        if original_name not in record['name_alt']:
+            record['name_alt'].append(original_name)
+        record['name_primary'] = converted_name
+    else:
+        fallback_name = record['name_en'].strip()
+        if fallback_name:
+            if original_name not in record['name_alt']:
+                record['name_alt'].append(original_name)
+            record['name_primary'] = fallback_name
+
+
+def extract_page_texts(
+    page_texts: Iterable[tuple[int, str]],
     pdf_path: Path,
     ocr_header_fallback: bool,
     dump_page: int | None = None,
+    progress: ExtractionProgress | None = None,
+    keep_parse_state: bool = False,
 ) -> ExtractionResult:
+    """Records from (page number, text) pairs, whatever read the text."""
     records: list[dict[str, Any]] = []
     skipped_pages: list[int] = []
     parse_errors: list[dict[str, Any]] = []
+    parse_state: list[dict[str, Any]] | None = [] if keep_parse_state else None
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_index, page in enumerate(pdf.pages, start=1):
-            text = page.extract_text() or ''
-
-            # Debug: dump full raw + deduplicated text for a specific page
-            if dump_page is not None and page_index == dump_page:
-                print(f'\n{"="*60}')
-                print(f'RAW TEXT — page {page_index}')
-                print(f'{"="*60}')
-                print(text)
-                print(f'\n{"="*60}')
-                print(f'DEDUPLICATED TEXT — page {page_index}')
-                print(f'{"="*60}')
-                print(deduplicate_text(text))
-                print(f'{"="*60}\n')
-
-            if 'Vietnamese)' not in text or 'English)' not in text:
-                skipped_pages.append(page_index)
-                continue
-
-            try:
-                record = extract_record(text, page_index)
-            except Exception as error:  # noqa: BLE001
-                parse_errors.append(
-                    {
-                        'page': page_index,
-                        'error': str(error),
-                    }
-                )
-                continue
-
-            if record is None:
-                skipped_pages.append(page_index)
-                continue
+    for page_index, text in page_texts:
+        if dump_page is not None and page_index == dump_page:
+            dump_page_text(page_index, text)
 
+        record = parse_page(text, page_index, skipped_pages, parse_errors, parse_state)
+        if record is not None:
             if ocr_header_fallback and needs_ocr_header_fix(record):
+                if progress is not None:
+                    progress.ocr_queued()
+                    progress.ocr_started(page_index)
+                started = time.perf_counter()
                 ocr_header = extract_ocr_header(pdf_path, page_index)
+                if progress is not None:
+                    progress.ocr_finished(time.perf_counter() - started)
                 if ocr_header is not None:
-                    vn_name, en_name, food_code, stt, inedible_portion = ocr_header
-                    record['name_primary'] = vn_name
-                    record['name_en'] = en_name
-                    record['inedible_portion_pct'] = inedible_portion
-                    record['_food_code'] = food_code
-                    record['_stt'] = stt
-
-                    state = infer_state(vn_name, en_name)
-                    record['state'] = state
-                    record['id'] = f'fao_vn_2007_{food_code}_{state}'
-
-            if MOJIBAKE_MARKERS.search(record['name_primary']):
-                original_name = record['name_primary']
-                converted_name = tcvn3_to_vietnamese(original_name)
-                if converted_name:
-                    if original_name not in record['name_alt']:
-                        record['name_alt'].append(original_name)
-                    record['name_primary'] = converted_name
-                else:
-                    fallback_name = record['name_en'].strip()
-                    if fallback_name:
-                        if original_name not in record['name_alt']:
-                            record['name_alt'].append(original_name)
-                        record['name_primary'] = fallback_name
+                    apply_ocr_header(record, ocr_header)
 
+            repair_name_encoding(record)
             records.append(record)
+        if progress is not None:
+            progress.page_done(len(records), len(skipped_pages), len(parse_errors))
 
     return ExtractionResult(
         records=records,
         skipped_pages=skipped_pages,
         parse_errors=parse_errors,
+        parse_state=parse_state or [],
     )
 
 
+def run_extraction(
+    pdf_path: Path,
+    ocr_header_fallback: bool,
+    dump_page: int | None = None,
+    page_cache: PageTextCache | None = None,
+    backend: str = DEFAULT_BACKEND,
+    progress: ExtractionProgress | None = None,
+    keep_parse_state: bool = False,
+) -> ExtractionResult:
+    with open_backend(backend, pdf_path) as source:
+        if progress is not None:
+            progress.begin(source.page_count, 'serial')
+        return extract_page_texts(
+            (
+                (page_index, read_page_text(source, page_index, page_cache))
+                for page_index in range(1, source.page_count + 1)
+            ),
+            pdf_path,
+            ocr_header_fallback,
+            dump_page,
+            progress,
+            keep_parse_state,
+        )
+
+
 def _clean_record(record: dict[str, Any]) -> dict[str, Any]:
     """Strip internal extraction fields from a record before output."""
     return {k: v for k, v in record.items() if not k.startswith('_')}
 
 
-def write_outputs(result: ExtractionResult, output_dir: Path) -> None:
-    output_dir.mkdir(parents=True, exist_ok=True)
-
+def write_record_files(
+    records: list[dict[str, Any]],
+    output_dir: Path,
+    nutrient_keys: list[str] | None = None,
+) -> tuple[Path, Path]:
+    """extracted_ingredients.json / .csv (also rewritten by parser_profile.py --apply)."""
     json_path = output_dir / 'extracted_ingredients.json'
     csv_path = output_dir / 'extracted_ingredients.csv'
-    report_path = output_dir / 'extraction_report.json'
 
-    cleaned = [_clean_record(r) for r in result.records]
+    cleaned = [_clean_record(r) for r in records]
 
     with json_path.open('w', encoding='utf-8') as handle:
         json.dump(cleaned, handle, ensure_ascii=False, indent=2)
 
-    nutrient_keys = list(ALL_NUTRIENTS.keys())
+    if nutrient_keys is None:
+        nutrient_keys = list(ALL_NUTRIENTS.keys())
     csv_columns = [
         'id',
         'name_primary',
@@ -578,7 +605,7 @@ def write_outputs(result: ExtractionResult, output_dir: Path) -> None:
     with csv_path.open('w', encoding='utf-8', newline='') as handle:
         writer = csv.DictWriter(handle, fieldnames=csv_columns)
         writer.writeheader()
-        for record in result.records:
+        for record in records:
             per_100g = record['per_100g']
             row = {
                 'id': record['id'],
@@ -592,6 +619,14 @@ def write_outputs(result: ExtractionResult, output_dir: Path) -> None:
             for key in nutrient_keys:
                 row[key] = per_100g.get(key)
             writer.writerow(row)
+    return json_path, csv_path
+
+
+def write_outputs(result: ExtractionResult, output_dir: Path) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    report_path = output_dir / 'extraction_report.json'
+    json_path, csv_path = write_record_files(result.records, output_dir)
 
     # Write page index mapping (id → source_page) for validation tooling
     page_index_path = output_dir / 'page_index.json'
@@ -613,6 +648,48 @@ def write_outputs(result: ExtractionResult, output_dir: Path) -> None:
             'page_index': str(page_index_path),
         },
     }
+    report['parser_profile'] = {'version': PARSER_PROFILE.version, 'sha256': PARSER_PROFILE.sha256}
+    if result.pipeline:
+        report['pipeline'] = result.pipeline
+    if result.progress:
+        report['progress'] = result.progress
+    if result.watchdog:
+        report['watchdog'] = result.watchdog
+
+    # Values recovered from their table row / cell OCR (cell_ocr_recovery.py)
+    if result.cell_recovery:
+        recovery_path = output_dir / 'cell_recovery.json'
+        provenance = {r['id']: r['_cell_recovery'] for r in result.records if r.get('_cell_recovery')}
+        with recovery_path.open('w', encoding='utf-8') as handle:
+            json.dump(provenance, handle, ensure_ascii=False, indent=2)
+        report['output_files']['cell_recovery'] = str(recovery_path)
+        report['cell_recovery'] = result.cell_recovery
+
+    # Per-record / per-field confidence (extraction_confidence.py)
+    if any('_confidence' in r for r in result.records):
+        confidence_path = output_dir / 'extraction_confidence.json'
+        confidence = {r['id']: r['_confidence'] for r in result.records if '_confidence' in r}
+        with confidence_path.open('w', encoding='utf-8') as handle:
+            json.dump(confidence, handle, ensure_ascii=False, indent=2)
+        report['output_files']['confidence'] = str(confidence_path)
+        report['confidence'] = result.confidence
+
+    # Per-page parse state so parser_profile.py can re-evaluate only the
+    # fields whose profile entries changed, without re-reading the PDF.
+    if result.parse_state:
+        position_by_page = {
+            r['_source_page']: position
+            for position, r in enumerate(result.records)
+            if '_source_page' in r
+        }
+        for entry in result.parse_state:
+            entry['record'] = position_by_page.get(entry['page'])
+        parse_state_path = output_dir / PARSE_STATE_FILE
+        write_parse_state(parse_state_path, PARSER_PROFILE, result.parse_state, records_digest(json_path))
+        report['output_files']['parse_state'] = str(parse_state_path)
+    else:
+        # State from an earlier run no longer matches these records
+        (output_dir / PARSE_STATE_FILE).unlink(missing_ok=True)
 
     with report_path.open('w', encoding='utf-8') as handle:
         json.dump(report, handle, ensure_ascii=False, indent=2)
@@ -641,7 +718,90 @@ def build_parser() -> argparse.ArgumentParser:
         '--dump-page',
         type=int,
         default=None,
-        help='Print raw + deduplicated text for a specific page (debug).',
+        help='Print raw + deduplicated text for a specific page during a full run '
+             '(for quick debugging use inspect_page.py).',
+    )
+    parser.add_argument(
+        '--page-cache',
+        default=None,
+        help='Directory for cached page texts (reused on later runs and by inspect_page.py).',
+    )
+    parser.add_argument(
+        '--backend',
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help='Page-text extractor (compare them with text_backends.py --bench).',
+    )
+    parser.add_argument(
+        '--pipelined',
+        action='store_true',
+        help='Run OCR repairs as concurrent subprocesses while text extraction continues '
+             '(same output; see pipelined_extraction.py).',
+    )
+    parser.add_argument(
+        '--watchdog',
+        action='store_true',
+        help='Process each page in a supervised worker with a wall-clock timeout and a '
+             'memory cap; pages over a limit are retried once on a cheaper path (see page_watchdog.py).',
+    )
+    parser.add_argument(
+        '--page-timeout',
+        type=float,
+        default=60.0,
+        help='Seconds a page may take with --watchdog.',
+    )
+    parser.add_argument(
+        '--page-memory-mb',
+        type=int,
+        default=2048,
+        help='Address-space cap of each --watchdog worker.',
+    )
+    parser.add_argument(
+        '--page-workers',
+        type=int,
+        default=1,
+        help='Worker processes with --watchdog.',
+    )
+    parser.add_argument(
+        '--ocr-concurrency',
+        type=int,
+        default=2,
+        help='Pages (--pipelined) or cells (--recover-missing-cells) OCRed at the same time.',
+    )
+    parser.add_argument(
+        '--reextract-below',
+        type=float,
+        default=None,
+        help='Re-read pages of records with confidence below this through the slower '
+             'paths (char dedupe, OCR header with --ocr-header-fallback).',
+    )
+    parser.add_argument(
+        '--metrics-file',
+        default=None,
+        help='Rewrite progress metrics here in Prometheus textfile format while running.',
+    )
+    parser.add_argument(
+        '--progress-interval',
+        type=float,
+        default=5.0,
+        help='Seconds between progress lines / metrics file updates.',
+    )
+    parser.add_argument(
+        '--no-progress',
+        action='store_true',
+        help='No progress lines on stderr (the metrics file is still written).',
+    )
+    parser.add_argument(
+        '--recover-missing-cells',
+        action='store_true',
+        help='Re-read each missing nutrient from its table row, OCRing only the cells '
+             'without a readable value (see cell_ocr_recovery.py).',
+    )
+    parser.add_argument(
+        '--no-parse-state',
+        action='store_true',
+        help=f'Do not write {PARSE_STATE_FILE} (used by parser_profile.py to re-evaluate '
+             'profile changes without re-reading the PDF).',
     )
     return parser
 
@@ -654,16 +814,140 @@ def main() -> None:
     if not pdf_path.exists():
         raise FileNotFoundError(f'PDF not found: {pdf_path}')
 
-    result = run_extraction(
-        pdf_path=pdf_path,
-        ocr_header_fallback=args.ocr_header_fallback,
-        dump_page=args.dump_page,
+    page_cache = (
+        PageTextCache(Path(args.page_cache), pdf_path, args.backend) if args.page_cache else None
+    )
+    from extraction_progress import ExtractionProgress
+
+    progress = ExtractionProgress(
+        pdf_path.name,
+        metrics_path=Path(args.metrics_file) if args.metrics_file else None,
+        interval=args.progress_interval,
+        stream=None if args.no_progress else sys.stderr,
     )
+    if args.pipelined and args.watchdog:
+        raise SystemExit('--pipelined and --watchdog are alternative run modes; pick one.')
+    if args.watchdog and args.dump_page is not None:
+        raise SystemExit('--dump-page is not supported with --watchdog (use inspect_page.py).')
+    if args.recover_missing_cells:
+        from cell_ocr_recovery import ocr_unavailable
+
+        # Checked up front: failing after the extraction would lose its results
+        reason = ocr_unavailable()
+        if reason is not None:
+            raise SystemExit(f'--recover-missing-cells needs cell OCR: {reason}')
+    if args.watchdog:
+        from page_watchdog import run_extraction_supervised
+
+        result = run_extraction_supervised(
+            pdf_path=pdf_path,
+            ocr_header_fallback=args.ocr_header_fallback,
+            page_cache_root=args.page_cache,
+            backend=args.backend,
+            progress=progress,
+            keep_parse_state=not args.no_parse_state,
+            timeout=args.page_timeout,
+            memory_mb=args.page_memory_mb,
+            workers=args.page_workers,
+        )
+    elif args.pipelined:
+        from pipelined_extraction import run_extraction_pipelined
+
+        result = run_extraction_pipelined(
+            pdf_path=pdf_path,
+            ocr_header_fallback=args.ocr_header_fallback,
+            dump_page=args.dump_page,
+            page_cache=page_cache,
+            concurrency=args.ocr_concurrency,
+            backend=args.backend,
+            progress=progress,
+            keep_parse_state=not args.no_parse_state,
+        )
+    else:
+        from extraction_daemon import extract_via_daemon
+
+        # A running extraction_daemon.py already has the pages read; --dump-page needs them here
+        result = None if args.dump_page is not None else extract_via_daemon(
+            pdf_path,
+            args.ocr_header_fallback,
+            args.backend,
+            args.page_cache,
+            progress=progress,
+            keep_parse_state=not args.no_parse_state,
+        )
+        if result is None:
+            result = run_extraction(
+                pdf_path=pdf_path,
+                ocr_header_fallback=args.ocr_header_fallback,
+                dump_page=args.dump_page,
+                page_cache=page_cache,
+                backend=args.backend,
+                progress=progress,
+                keep_parse_state=not args.no_parse_state,
+            )
+        else:
+            print('Pages read by the extraction daemon')
+    result.progress = progress.finish()
+
+    if args.recover_missing_cells:
+        from cell_ocr_recovery import recover_missing_cells
+
+        result.cell_recovery = recover_missing_cells(result.records, pdf_path, args.ocr_concurrency)
+
+    from extraction_confidence import confidence_summary, reextract_low_confidence, score_records
+
+    if args.reextract_below is not None:
+        reextraction = reextract_low_confidence(
+            result.records,
+            pdf_path,
+            args.reextract_below,
+            ocr_header_fallback=args.ocr_header_fallback,
+        )
+    else:
+        score_records(result.records)
+        reextraction = None
+    result.confidence = confidence_summary(result.records)
+    if reextraction is not None:
+        result.confidence['reextraction'] = reextraction
     write_outputs(result, output_dir)
 
+    from dataset_store import record_dataset_version
+
+    record_dataset_version(
+        [_clean_record(r) for r in result.records],
+        output_dir,
+        f'extract_vtn_fct_2007.py ({pdf_path.name})',
+    )
+
     print(f'Extracted records: {len(result.records)}')
     print(f'Skipped pages: {len(result.skipped_pages)}')
     print(f'Parse errors: {len(result.parse_errors)}')
+    if result.pipeline:
+        pipeline = result.pipeline
+        print(
+            f"OCR: {pipeline['ocr_pages']} pages, {pipeline['ocr_busy_s']:.1f}s busy, "
+            f"{pipeline['ocr_overlapped_s']:.1f}s overlapped with text extraction, "
+            f"{pipeline['ocr_drain_s']:.1f}s drain"
+        )
+    if result.watchdog:
+        watchdog = result.watchdog
+        print(
+            f"Watchdog: {len(watchdog['incidents'])} pages over a limit, "
+            f"{watchdog['worker_restarts']} worker restarts"
+        )
+    print(f"Mean confidence: {result.confidence['mean']}")
+    if reextraction is not None:
+        print(
+            f"Re-extracted {reextraction['below_threshold']} pages below {reextraction['threshold']} "
+            f"in {reextraction['seconds']:.1f}s: {reextraction['improved']} improved, "
+            f"{reextraction['still_below']} still below"
+        )
+    if result.cell_recovery:
+        recovery = result.cell_recovery
+        print(
+            f"Missing cells: {recovery['missing_cells']} {recovery['statuses']}; "
+            f"recovered {recovery['recovered']} ({recovery['ocr_cells']} OCRed) in {recovery['seconds']:.1f}s"
+        )
 
     # Quick summary of nutrient coverage
     if result.records:
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Per-record and per-field extraction confidence, with selective re-extraction.
+
+Every field starts at 1.0 and is multiplied by a penalty per doubt signal:
+
+Nutrients (collected per page by `nutrient_signals`)
+- dedup_row            value read from a line rewritten by deduplicate_text
+- multiple_matches     the nutrient pattern matches more than once
+- label_missing        label/unit not found on the page (value is null)
+- outside_group_range  value outside its food group's range in this run
+                       (log scale, Q1/Q3 ± 3 IQR, groups with ≥ 8 values)
+- row_text / ocr_cell  value recovered by cell_ocr_recovery.py from the
+                       label's row text / an OCR of the cell
+
+Header
+- name_en_empty / name_en_truncated   empty or trailing-comma English name
+- mojibake_name        Vietnamese name still reads as TCVN3/VNI
+- ocr_header           header fields came from the OCR fallback only
+
+A record's confidence is its weakest field. `reextract_low_confidence`
+re-reads only the pages below a threshold through the slower paths —
+geometric char dedupe (`page.dedupe_chars()`) and, with OCR enabled, the
+OCR header — and keeps the new record when it scores higher, so the cost
+of accuracy scales with the number of doubtful rows.
+
+Usage:
+    python3 scripts/vtn_fct/extract_vtn_fct_2007.py --reextract-below 0.5
+    python3 scripts/vtn_fct/extraction_confidence.py --below 0.7
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pdfplumber
+
+from cell_ocr_recovery import carry_recovered_cells
+from enrich_extracted_data import DATA_DIR, get_group_prefix
+from extract_vtn_fct_2007 import (
+    ALL_NUTRIENTS,
+    apply_ocr_header,
+    deduplicate_text,
+    extract_ocr_header,
+    extract_record,
+    needs_ocr_header_fix,
+    nutrient_signals,
+    repair_name_encoding,
+)
+from vn_transcode import dataset_encoding, is_legacy
+
+NUTRIENT_PENALTIES = {
+    'dedup_row': 0.8,
+    'multiple_matches': 0.7,
+    'label_missing': 0.5,
+    'outside_group_range': 0.6,
+    'row_text': 0.9,
+    'ocr_cell': 0.7,
+}
+HEADER_FIELDS = ['id', 'name_primary', 'name_en', 'state', 'inedible_portion_pct']
+HEADER_PENALTIES = {
+    'name_en_empty': (0.2, ['name_en', 'state']),
+    'name_en_truncated': (0.5, ['name_en']),
+    'mojibake_name': (0.3, ['name_primary']),
+    'ocr_header': (0.8, HEADER_FIELDS),
+}
+RANGE_MIN_VALUES = 8
+RANGE_IQR_FENCE = 3.0
+DEFAULT_THRESHOLD = 0.5
+
+GroupRanges = dict[tuple[str, str], tuple[float, float]]
+
+
+def _group(record: dict[str, Any]) -> str:
+    return get_group_prefix(record['_food_code'])
+
+
+def group_ranges(records: list[dict[str, Any]]) -> GroupRanges:
+    """(group, nutrient) → (low, high) plausible range from this run's values."""
+    by_group: dict[str, list[dict[str, Any]]] = {}
+    for record in records:
+        by_group.setdefault(_group(record), []).append(record)
+
+    ranges: GroupRanges = {}
+    for group, members in by_group.items():
+        for key in ALL_NUTRIENTS:
+            values = np.array(
+                [m['per_100g'][key] for m in members if m['per_100g'].get(key) is not None],
+                dtype=np.float64,
+            )
+            if len(values) < RANGE_MIN_VALUES:
+                continue
+            logged = np.log1p(np.maximum(values, 0))
+            q1, q3 = np.percentile(logged, [25, 75])
+            fence = RANGE_IQR_FENCE * (q3 - q1)
+            ranges[(group, key)] = (float(np.expm1(q1 - fence)), float(np.expm1(q3 + fence)))
+    return ranges
+
+
+def score_record(
+    record: dict[str, Any],
+    ranges: GroupRanges,
+    name_encoding: str | None = None,
+) -> dict[str, Any]:
+    """{'confidence', 'fields' (only those < 1), 'signals'} for one record.
+
+    `name_encoding` is the encoding of all names (vn_transcode.dataset_encoding),
+    so short legacy names that are also valid Unicode still count as mojibake.
+    """
+    fields = {key: 1.0 for key in [*HEADER_FIELDS, *ALL_NUTRIENTS]}
+    signals: list[str] = []
+
+    def penalize(signal: str, penalty: float, keys: list[str]) -> None:
+        signals.append(signal if len(keys) > 3 else f"{signal}:{','.join(keys)}")
+        for key in keys:
+            fields[key] *= penalty
+
+    en_name = record['name_en'].strip()
+    if not en_name:
+        penalize('name_en_empty', *HEADER_PENALTIES['name_en_empty'])
+    elif en_name.endswith(','):
+        penalize('name_en_truncated', *HEADER_PENALTIES['name_en_truncated'])
+    if is_legacy(record['name_primary'], name_encoding):
+        penalize('mojibake_name', *HEADER_PENALTIES['mojibake_name'])
+    if record.get('_header_source') == 'ocr':
+        penalize('ocr_header', *HEADER_PENALTIES['ocr_header'])
+
+    for signal, keys in record.get('_signals', {}).items():
+        if keys:
+            penalize(signal, NUTRIENT_PENALTIES[signal], keys)
+
+    group = _group(record)
+    outside = []
+    for key in ALL_NUTRIENTS:
+        value = record['per_100g'].get(key)
+        bounds = ranges.get((group, key))
+        if value is not None and bounds is not None and not bounds[0] <= value <= bounds[1]:
+            outside.append(key)
+    if outside:
+        penalize('outside_group_range', NUTRIENT_PENALTIES['outside_group_range'], outside)
+
+    return {
+        'confidence': round(min(fields.values()), 4),
+        'fields': {key: round(score, 4) for key, score in fields.items() if score < 1.0},
+        'signals': signals,
+    }
+
+
+def score_records(records: list[dict[str, Any]], ranges: GroupRanges | None = None) -> GroupRanges:
+    """Attach `_confidence` to every record; returns the ranges used."""
+    ranges = group_ranges(records) if ranges is None else ranges
+    name_encoding = dataset_encoding(record['name_primary'] for record in records)
+    for record in records:
+        record['_confidence'] = score_record(record, ranges, name_encoding)
+    return ranges
+
+
+# ── Selective re-extraction ─────────────────────────────────────────
+
+def reextract_page(
+    pdf_page: Any,
+    page_number: int,
+    previous: dict[str, Any],
+    pdf_path: Path,
+    ocr_header_fallback: bool,
+) -> dict[str, Any] | None:
+    """The slow path: geometric dedupe, then OCR for a doubtful header."""
+    text = pdf_page.dedupe_chars().extract_text() or ''
+    deduped = deduplicate_text(text)
+    record = extract_record(text, page_number, deduped)
+    if record is None:
+        return None
+    record['_signals'] = nutrient_signals(text, deduped)
+
+    doubtful_header = needs_ocr_header_fix(record) or needs_ocr_header_fix(previous)
+    if ocr_header_fallback and doubtful_header:
+        ocr_header = extract_ocr_header(pdf_path, page_number)
+        if ocr_header is not None:
+            apply_ocr_header(record, ocr_header)
+    repair_name_encoding(record)
+    return record
+
+
+def _rank(confidence: dict[str, Any]) -> tuple[float, float]:
+    """Weakest field first, then total penalty (fewer doubts win ties)."""
+    return confidence['confidence'], -sum(1 - score for score in confidence['fields'].values())
+
+
+def reextract_low_confidence(
+    records: list[dict[str, Any]],
+    pdf_path: Path,
+    threshold: float,
+    ocr_header_fallback: bool,
+) -> dict[str, Any]:
+    """Re-read pages of records below `threshold`; keep improvements in place.
+
+    A candidate keeps the cells cell_ocr_recovery.py filled in the record it
+    would replace, and its `_watchdog` note, before it is scored."""
+    started = time.perf_counter()
+    ranges = score_records(records)
+    name_encoding = dataset_encoding(record['name_primary'] for record in records)
+    doubtful = {
+        record['_source_page']: position
+        for position, record in enumerate(records)
+        if record['_confidence']['confidence'] < threshold
+    }
+
+    improved = 0
+    if doubtful:
+        with pdfplumber.open(pdf_path, pages=sorted(doubtful)) as pdf:
+            for pdf_page in pdf.pages:
+                position = doubtful[pdf_page.page_number]
+                previous = records[position]
+                candidate = reextract_page(
+                    pdf_page, pdf_page.page_number, previous, pdf_path, ocr_header_fallback,
+                )
+                if candidate is None:
+                    continue
+                carry_recovered_cells(previous, candidate)
+                if '_watchdog' in previous:
+                    candidate['_watchdog'] = previous['_watchdog']
+                candidate['_confidence'] = score_record(candidate, ranges, name_encoding)
+                if _rank(candidate['_confidence']) > _rank(previous['_confidence']):
+                    candidate['_confidence']['reextracted_from'] = previous['_confidence']['confidence']
+                    records[position] = candidate
+                    improved += 1
+
+    return {
+        'threshold': threshold,
+        'below_threshold': len(doubtful),
+        'improved': improved,
+        'still_below': sum(1 for r in records if r['_confidence']['confidence'] < threshold),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+def confidence_summary(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Histogram + signal counts for extraction_report.json."""
+    scores = [record['_confidence']['confidence'] for record in records if '_confidence' in record]
+    bins = [0.0, 0.25, 0.5, 0.75, 0.9, 1.0]
+    histogram = {
+        f'{low:.2f}-{high:.2f}': sum(1 for s in scores if low <= s < high or (high == 1.0 and s == 1.0))
+        for low, high in zip(bins, bins[1:])
+    }
+    signal_counts: dict[str, int] = {}
+    for record in records:
+        for signal in record.get('_confidence', {}).get('signals', []):
+            name = signal.split(':', 1)[0]
+            signal_counts[name] = signal_counts.get(name, 0) + 1
+    return {
+        'records': len(scores),
+        'mean': round(sum(scores) / len(scores), 4) if scores else None,
+        'histogram': histogram,
+        'signals': dict(sorted(signal_counts.items())),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='List extracted records whose confidence is below a threshold.',
+    )
+    parser.add_argument(
+        '--input',
+        default=str(DATA_DIR / 'extraction_confidence.json'),
+        help='Confidence sidecar written by extract_vtn_fct_2007.py.',
+    )
+    parser.add_argument('--below', type=float, default=DEFAULT_THRESHOLD, help='Confidence threshold.')
+    parser.add_argument('--field', default=None, help='Only records where this field is below the threshold.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    with Path(args.input).open('r', encoding='utf-8') as handle:
+        scores: dict[str, dict[str, Any]] = json.load(handle)
+
+    rows = []
+    for identifier, entry in scores.items():
+        score = entry['fields'].get(args.field, 1.0) if args.field else entry['confidence']
+        if score < args.below:
+            rows.append((score, identifier, entry))
+    rows.sort(key=lambda row: (row[0], row[1]))
+
+    print(f'{len(rows)}/{len(scores)} records below {args.below}')
+    for score, identifier, entry in rows:
+        print(f"  {score:.3f}  {identifier:32s} {' '.join(entry['signals'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""Optional resident extraction daemon on a Unix socket.
+
+Every CLI run otherwise pays interpreter start-up, imports, opening the
+PDF and reading page text from scratch, even `build_validation_packet.py`
+for 20 pages. The daemon keeps, across requests:
+
+- open text backends (pdfplumber documents …), reopened when the PDF changes
+- page texts in memory (and the on-disk page cache when a request names one)
+- the parser modules, re-imported whenever their source file changes, so
+  an edited regex is picked up on the next request while the page texts
+  stay warm
+
+Protocol: one JSON request line per connection, answered with NDJSON.
+Requests are served one at a time; the last line is `{"type": "done"}`
+(with a summary) or `{"type": "error"}`.
+
+    {"op": "extract", "pdf": …, "backend": "pdfplumber", "ocr_header_fallback": false, "page_cache": null}
+        → {"type": "record", "record": {…}} per record
+    {"op": "reextract", "pdf": …, "pages": [22, 23]}    same, only those pages
+        → {"type": "progress", …} every progress_interval s with "progress": true
+    {"op": "pages", "pdf": …, "pages": [22, 23]}
+        → {"type": "page", "page": 22, "text": …, "source": "memory", "seconds": …}
+    {"op": "status"} / {"op": "shutdown"}
+
+`extract_vtn_fct_2007.py` (serial mode), `build_validation_packet.py` and
+`inspect_page.py` use the daemon when its socket answers and fall back to
+reading the PDF themselves otherwise (or with VTN_FCT_NO_DAEMON=1).
+
+Usage:
+    python3 scripts/vtn_fct/extraction_daemon.py serve &
+    python3 scripts/vtn_fct/extraction_daemon.py reextract --pdf "VTN FCT 2007.pdf" --pages 22-24
+    python3 scripts/vtn_fct/extraction_daemon.py status
+    python3 scripts/vtn_fct/extraction_daemon.py stop
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    from extraction_progress import ExtractionProgress
+
+# Parser modules re-imported when their source changes (dependencies first);
+# the extraction module is also re-imported when the parser profile changes
+RELOADABLE_MODULES = ('vn_transcode', 'state_classifier', 'parser_profile', 'extract_vtn_fct_2007')
+CONNECT_TIMEOUT_S = 0.2
+# Page texts from pdfplumber can be long; one request line is always small
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def default_socket_path() -> Path:
+    configured = os.environ.get('VTN_FCT_DAEMON_SOCKET')
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / f'vtn_fct_daemon-{os.getuid()}.sock'
+
+
+# ── Warm state ──────────────────────────────────────────────────────
+
+class WarmState:
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.requests = 0
+        # (pdf, backend) → ((mtime_ns, size), TextBackend)
+        self.documents: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+        # (pdf, backend) → {page: text}
+        self.texts: dict[tuple[str, str], dict[int, str]] = {}
+        self.page_caches: dict[tuple[str, str, str], Any] = {}
+        self.module_mtimes: dict[str, int] = {}
+        self.reloads = 0
+
+    def parsers(self) -> ModuleType:
+        """The extraction module, re-imported (with its parser deps) if any source changed."""
+        from parser_profile import profile_path
+
+        profile_mtime = profile_path().stat().st_mtime_ns
+        previous_profile = self.module_mtimes.get('parser_profile.json')
+        changed = False
+        for name in RELOADABLE_MODULES:
+            if name == 'extract_vtn_fct_2007' and previous_profile not in (None, profile_mtime):
+                changed = True
+            module = importlib.import_module(name)
+            mtime = Path(module.__file__).stat().st_mtime_ns
+            previous = self.module_mtimes.get(name)
+            if changed or (previous is not None and previous != mtime):
+                module = importlib.reload(module)
+                changed = True
+                self.reloads += 1
+            self.module_mtimes[name] = mtime
+        self.module_mtimes['parser_profile.json'] = profile_mtime
+        return sys.modules['extract_vtn_fct_2007']
+
+    def source(self, pdf: str, backend: str) -> Any:
+        from text_backends import open_backend
+
+        stat = Path(pdf).stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = (pdf, backend)
+        cached = self.documents.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+            self.texts.pop(key, None)
+            for cache_key in [k for k in self.page_caches if k[:2] == key]:
+                del self.page_caches[cache_key]
+        opened = open_backend(backend, Path(pdf))
+        self.documents[key] = (version, opened)
+        return opened
+
+    def page_cache(self, pdf: str, backend: str, root: str | None) -> Any:
+        if root is None:
+            return None
+        from page_text_cache import PageTextCache
+
+        key = (pdf, backend, root)
+        if key not in self.page_caches:
+            self.page_caches[key] = PageTextCache(Path(root), Path(pdf), backend)
+        return self.page_caches[key]
+
+    def page_text(self, pdf: str, backend: str, page: int, cache_root: str | None) -> tuple[str, str]:
+        """(text, where it came from: memory / cache / backend name)."""
+        source = self.source(pdf, backend)
+        memory = self.texts.setdefault((pdf, backend), {})
+        if page in memory:
+            return memory[page], 'memory'
+        cache = self.page_cache(pdf, backend, cache_root)
+        text = cache.get(page) if cache is not None else None
+        origin = 'cache'
+        if text is None:
+            text = source.page_text(page)
+            origin = backend
+            if cache is not None:
+                cache.put(page, text)
+        memory[page] = text
+        return text, origin
+
+    def close(self) -> None:
+        for _, document in self.documents.values():
+            document.close()
+        self.documents.clear()
+
+
+# ── Request handling ────────────────────────────────────────────────
+
+def _pages(request: dict[str, Any], page_count: int) -> list[int]:
+    pages = request.get('pages')
+    if pages is None:
+        return list(range(1, page_count + 1))
+    return [int(page) for page in pages if 1 <= int(page) <= page_count]
+
+
+def handle_request(
+    state: WarmState,
+    request: dict[str, Any],
+    emit: Callable[[dict[str, Any]], None] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Answer lines for one request; `emit` sends progress lines while a request runs."""
+    op = request.get('op')
+    started = time.perf_counter()
+
+    if op == 'status':
+        yield {
+            'type': 'done',
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - state.started, 1),
+            'requests': state.requests,
+            'documents': [f'{pdf} [{backend}]' for pdf, backend in state.documents],
+            'pages_in_memory': sum(len(texts) for texts in state.texts.values()),
+            'module_reloads': state.reloads,
+        }
+        return
+
+    pdf = str(Path(request['pdf']).resolve())
+    backend = request.get('backend', 'pdfplumber')
+    cache_root = request.get('page_cache')
+    source = state.source(pdf, backend)
+    pages = _pages(request, source.page_count)
+
+    if op == 'pages':
+        origins: dict[str, int] = {}
+        for page in pages:
+            page_started = time.perf_counter()
+            text, origin = state.page_text(pdf, backend, page, cache_root)
+            origins[origin] = origins.get(origin, 0) + 1
+            yield {
+                'type': 'page',
+                'page': page,
+                'text': text,
+                'source': origin,
+                'seconds': round(time.perf_counter() - page_started, 6),
+            }
+        yield {'type': 'done', 'pages': len(pages), 'sources': origins,
+               'seconds': round(time.perf_counter() - started, 3)}
+        return
+
+    if op in ('extract', 'reextract'):
+        parsers = state.parsers()
+        origins = {}
+
+        def texts() -> Iterator[tuple[int, str]]:
+            for page in pages:
+                text, origin = state.page_text(pdf, backend, page, cache_root)
+                origins[origin] = origins.get(origin, 0) + 1
+                yield page, text
+
+        progress = None
+        if emit is not None and request.get('progress'):
+            from extraction_progress import ExtractionProgress
+
+            progress = ExtractionProgress(
+                Path(pdf).name,
+                interval=float(request.get('progress_interval', 1.0)),
+                stream=None,
+                heartbeat=False,
+                on_update=lambda snapshot: emit({'type': 'progress', **snapshot}),
+            )
+            progress.begin(len(pages), 'daemon')
+        result = parsers.extract_page_texts(
+            texts(),
+            Path(pdf),
+            bool(request.get('ocr_header_fallback', False)),
+            progress=progress,
+            keep_parse_state=bool(request.get('keep_parse_state', False)),
+        )
+        if progress is not None:
+            emit({'type': 'progress', **progress.snapshot()})  # final counts, whatever the interval
+        for record in result.records:
+            yield {'type': 'record', 'record': record}
+        for entry in result.parse_state:
+            yield {'type': 'parse_state', 'entry': entry}
+        yield {
+            'type': 'done',
+            'records': len(result.records),
+            'skipped_pages': result.skipped_pages,
+            'parse_errors': result.parse_errors,
+            'sources': origins,
+            'seconds': round(time.perf_counter() - started, 3),
+        }
+        return
+
+    raise ValueError(f'Unknown op {op!r}')
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if request.get('op') == 'shutdown':
+                self.send({'type': 'done', 'stopping': True})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            self.server.state.requests += 1
+            for message in handle_request(self.server.state, request, self.send):
+                self.send(message)
+        except BrokenPipeError:
+            return
+        except Exception as error:  # noqa: BLE001 — reported to the client, daemon keeps running
+            self.send({'type': 'error', 'error': f'{type(error).__name__}: {error}'})
+
+    def send(self, message: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path) -> None:
+        self.state = WarmState()
+        super().__init__(str(socket_path), DaemonHandler)
+
+
+def serve(socket_path: Path) -> None:
+    if daemon_running(socket_path):
+        raise SystemExit(f'A daemon is already listening on {socket_path}')
+    socket_path.unlink(missing_ok=True)  # stale socket from a killed daemon
+    previous_umask = os.umask(0o177)  # socket only for this user
+    try:
+        server = DaemonServer(socket_path)
+    finally:
+        os.umask(previous_umask)
+    print(f'Extraction daemon (pid {os.getpid()}) listening on {socket_path}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.state.close()
+        socket_path.unlink(missing_ok=True)
+
+
+# ── Client ──────────────────────────────────────────────────────────
+
+def daemon_running(socket_path: Path | None = None) -> bool:
+    path = socket_path or default_socket_path()
+    if os.environ.get('VTN_FCT_NO_DAEMON') or not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(CONNECT_TIMEOUT_S)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def request(op: str, socket_path: Path | None = None, **arguments: Any) -> Iterator[dict[str, Any]]:
+    """Send one request and yield the NDJSON answer; raises RuntimeError on an error line."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path or default_socket_path()))
+        connection.sendall(json.dumps({'op': op, **arguments}, ensure_ascii=False).encode('utf-8') + b'\n')
+        with connection.makefile('r', encoding='utf-8') as answer:
+            for line in answer:
+                message = json.loads(line)
+                if message['type'] == 'error':
+                    raise RuntimeError(f"extraction daemon: {message['error']}")
+                yield message
+
+
+def extract_via_daemon(
+    pdf_path: Path,
+    ocr_header_fallback: bool,
+    backend: str,
+    page_cache_root: str | None,
+    pages: list[int] | None = None,
+    progress: ExtractionProgress | None = None,
+    keep_parse_state: bool = False,
+) -> Any:
+    """ExtractionResult from a running daemon, or None when none is running."""
+    if not daemon_running():
+        return None
+    from extract_vtn_fct_2007 import ExtractionResult
+
+    records: list[dict[str, Any]] = []
+    parse_state: list[dict[str, Any]] = []
+    summary: dict[str, Any] = {}
+    arguments: dict[str, Any] = {
+        'pdf': str(pdf_path.resolve()),
+        'backend': backend,
+        'ocr_header_fallback': ocr_header_fallback,
+        'keep_parse_state': keep_parse_state,
+        'page_cache': str(Path(page_cache_root).resolve()) if page_cache_root else None,
+    }
+    if pages is not None:
+        arguments['pages'] = pages
+    if progress is not None:
+        arguments.update(progress=True, progress_interval=min(progress.interval, 1.0))
+    for message in request('reextract' if pages is not None else 'extract', **arguments):
+        if message['type'] == 'record':
+            records.append(message['record'])
+        elif message['type'] == 'parse_state':
+            parse_state.append(message['entry'])
+        elif message['type'] == 'progress':
+            if progress is not None:
+                progress.absorb(message)
+        else:
+            summary = message
+    return ExtractionResult(
+        records=records,
+        skipped_pages=summary.get('skipped_pages', []),
+        parse_errors=summary.get('parse_errors', []),
+        parse_state=parse_state,
+    )
+
+
+def page_texts_via_daemon(
+    pdf_path: Path,
+    pages: list[int],
+    backend: str = 'pdfplumber',
+    page_cache_root: Path | None = None,
+) -> dict[int, tuple[str, str, float]] | None:
+    """page → (text, source, seconds) from a running daemon, or None when none is running."""
+    if not daemon_running():
+        return None
+    texts: dict[int, tuple[str, str, float]] = {}
+    for message in request(
+        'pages',
+        pdf=str(pdf_path.resolve()),
+        pages=pages,
+        backend=backend,
+        page_cache=str(page_cache_root.resolve()) if page_cache_root else None,
+    ):
+        if message['type'] == 'page':
+            texts[message['page']] = (message['text'], f"daemon:{message['source']}", message['seconds'])
+    return texts
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Resident extraction daemon (Unix socket, NDJSON).')
+    parser.add_argument(
+        'command',
+        choices=['serve', 'status', 'stop', 'extract', 'reextract', 'pages'],
+        help='serve: run the daemon; the others are requests to a running daemon.',
+    )
+    parser.add_argument('--socket', default=None, help='Socket path (default: $VTN_FCT_DAEMON_SOCKET or /tmp).')
+    parser.add_argument('--pdf', default='VTN FCT 2007.pdf', help='Path to the source PDF.')
+    parser.add_argument('--pages', default='', help="Page range for reextract / pages, e.g. '22-24'.")
+    parser.add_argument('--backend', default='pdfplumber', help='Text backend (see text_backends.py).')
+    parser.add_argument('--page-cache', default=None, help='Page cache directory for the daemon to use.')
+    parser.add_argument('--ocr-header-fallback', action='store_true', help='OCR suspicious headers.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+
+    if args.command == 'serve':
+        serve(socket_path)
+        return
+
+    if not daemon_running(socket_path):
+        print(f'No extraction daemon on {socket_path}', file=sys.stderr)
+        raise SystemExit(1)
+
+    arguments: dict[str, Any] = {}
+    if args.command in ('extract', 'reextract', 'pages'):
+        from text_backends import parse_page_range
+
+        arguments = {
+            'pdf': str(Path(args.pdf).resolve()),
+            'backend': args.backend,
+            'page_cache': str(Path(args.page_cache).resolve()) if args.page_cache else None,
+            'ocr_header_fallback': args.ocr_header_fallback,
+        }
+        if args.pages:
+            arguments['pages'] = parse_page_range(args.pages, sys.maxsize)
+        elif args.command != 'extract':
+            raise SystemExit(f'{args.command} needs --pages')
+    op = 'shutdown' if args.command == 'stop' else args.command
+    try:
+        for message in request(op, socket_path, **arguments):
+            print(json.dumps(message, ensure_ascii=False))
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Live extraction progress, ETA and a Prometheus textfile export.
+
+`ExtractionProgress` is handed to `run_extraction`, `run_extraction_pipelined`
+or `extract_via_daemon` (the daemon streams its counters back as
+`{"type": "progress"}` lines) and counts:
+
+- pages done / total, records, skipped pages, parse errors
+- OCR repairs queued, running and finished (queue depth = queued − finished)
+- pages/s and records/s since the start, ETA (remaining pages at the current
+  rate, plus the OCR queue at the mean OCR time per worker)
+- what is running right now and for how long ("OCR page 812 for 41s"), so a
+  slow OCR stretch is told apart from a hang
+
+A heartbeat thread prints one status line to stderr and rewrites the
+metrics file every `interval` seconds, also while the main thread is stuck
+in a subprocess: `vtn_fct_extraction_seconds_since_progress` keeps growing
+and `..._last_update_timestamp_seconds` keeps moving, so a scraper can
+alert on a stalled run without mistaking it for a dead one. The file is
+written then renamed, as node_exporter's textfile collector expects.
+
+`finish()` returns the final counters for `extraction_report.json`.
+
+Usage:
+    python3 scripts/vtn_fct/extract_vtn_fct_2007.py --metrics-file /var/lib/node_exporter/textfile/vtn_fct.prom
+    python3 scripts/vtn_fct/extraction_progress.py --metrics-file vtn_fct.prom   # print it
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+DEFAULT_INTERVAL_S = 5.0
+
+# (metric, type, help, snapshot key)
+METRICS = [
+    ('vtn_fct_extraction_pages', 'gauge', 'Pages in the PDF.', 'pages_total'),
+    ('vtn_fct_extraction_pages_done_total', 'counter', 'Pages read and parsed.', 'pages_done'),
+    ('vtn_fct_extraction_records_total', 'counter', 'Records extracted.', 'records'),
+    ('vtn_fct_extraction_skipped_pages_total', 'counter', 'Pages without a food record.', 'skipped_pages'),
+    ('vtn_fct_extraction_parse_errors_total', 'counter', 'Pages that failed to parse.', 'parse_errors'),
+    ('vtn_fct_extraction_ocr_pages_total', 'counter', 'OCR header repairs finished.', 'ocr_done'),
+    ('vtn_fct_extraction_ocr_queue_depth', 'gauge', 'OCR repairs queued or running.', 'ocr_queue_depth'),
+    ('vtn_fct_extraction_pages_per_second', 'gauge', 'Pages per second since the start.', 'pages_per_s'),
+    ('vtn_fct_extraction_records_per_second', 'gauge', 'Records per second since the start.', 'records_per_s'),
+    ('vtn_fct_extraction_eta_seconds', 'gauge', 'Estimated seconds until the run finishes.', 'eta_s'),
+    ('vtn_fct_extraction_elapsed_seconds', 'gauge', 'Seconds since the run started.', 'elapsed_s'),
+    (
+        'vtn_fct_extraction_seconds_since_progress',
+        'gauge',
+        'Seconds since the last page or OCR repair finished.',
+        'since_progress_s',
+    ),
+    ('vtn_fct_extraction_finished', 'gauge', '1 once the run has finished.', 'finished'),
+    (
+        'vtn_fct_extraction_last_update_timestamp_seconds',
+        'gauge',
+        'Unix time this file was written.',
+        'updated_at',
+    ),
+]
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return '?'
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f'{seconds // 3600}h{seconds % 3600 // 60:02d}m'
+    if seconds >= 60:
+        return f'{seconds // 60}m{seconds % 60:02d}s'
+    return f'{seconds}s'
+
+
+def _label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(snapshot: dict[str, Any]) -> str:
+    labels = f'pdf="{_label_value(snapshot["pdf"])}",mode="{_label_value(snapshot["mode"])}"'
+    lines: list[str] = []
+    for name, kind, description, key in METRICS:
+        value = snapshot.get(key)
+        number = 'NaN' if value is None else repr(float(value))
+        lines += [f'# HELP {name} {description}', f'# TYPE {name} {kind}', f'{name}{{{labels}}} {number}']
+    return '\n'.join(lines) + '\n'
+
+
+class ExtractionProgress:
+    def __init__(
+        self,
+        pdf_name: str,
+        metrics_path: Path | None = None,
+        interval: float = DEFAULT_INTERVAL_S,
+        stream: TextIO | None = sys.stderr,
+        heartbeat: bool = True,
+        on_update: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.pdf_name = pdf_name
+        self.metrics_path = metrics_path
+        self.interval = interval
+        self.stream = stream
+        self.heartbeat = heartbeat
+        self.on_update = on_update
+        self.mode = ''
+        self.pages_total = 0
+        self.pages_done = 0
+        self.records = 0
+        self.skipped_pages = 0
+        self.parse_errors = 0
+        self.ocr_submitted = 0
+        self.ocr_done = 0
+        self.ocr_busy_s = 0.0
+        self.ocr_workers = 1
+        self.activity: str | None = None
+        self.activity_since = 0.0
+        self.started: float | None = None
+        self.last_progress = 0.0
+        self.last_emit = 0.0
+        self.finished = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._tty = stream is not None and stream.isatty()
+
+    # ── Events ──────────────────────────────────────────────────────
+
+    def begin(self, pages_total: int, mode: str, ocr_workers: int = 1) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.pages_total, self.mode, self.ocr_workers = pages_total, mode, max(1, ocr_workers)
+            self.started = self.last_progress = now
+        if self.heartbeat and self._thread is None:
+            self._thread = threading.Thread(target=self._beat, name='extraction-progress', daemon=True)
+            self._thread.start()
+        self._emit()
+
+    def page_done(self, records: int, skipped_pages: int, parse_errors: int) -> None:
+        """After each page, with the run's running totals."""
+        with self._lock:
+            self.pages_done += 1
+            self.records, self.skipped_pages, self.parse_errors = records, skipped_pages, parse_errors
+            self.last_progress = time.monotonic()
+        self._maybe_emit()
+
+    def ocr_queued(self) -> None:
+        with self._lock:
+            self.ocr_submitted += 1
+
+    def ocr_started(self, page_number: int) -> None:
+        """Serial mode: the main thread now blocks on this page's OCR."""
+        with self._lock:
+            self.activity, self.activity_since = f'OCR page {page_number}', time.monotonic()
+
+    def ocr_finished(self, seconds: float) -> None:
+        with self._lock:
+            self.ocr_done += 1
+            self.ocr_busy_s += seconds
+            self.activity = None
+            self.last_progress = time.monotonic()
+        self._maybe_emit()
+
+    def absorb(self, snapshot: dict[str, Any]) -> None:
+        """Take over counters streamed from another process (the extraction daemon)."""
+        if self.started is None:
+            self.begin(snapshot['pages_total'], snapshot['mode'])
+        with self._lock:
+            for key in ('pages_done', 'records', 'skipped_pages', 'parse_errors', 'ocr_done'):
+                setattr(self, key, snapshot[key])
+            self.ocr_submitted = snapshot['ocr_done'] + snapshot['ocr_queue_depth']
+            self.last_progress = time.monotonic()
+        self._maybe_emit()
+
+    def finish(self) -> dict[str, Any]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            self.finished = True
+            self.activity = None
+        snapshot = self._emit(final=True)
+        return {
+            key: snapshot[key]
+            for key in (
+                'mode', 'pages_total', 'pages_done', 'records', 'skipped_pages', 'parse_errors',
+                'ocr_done', 'elapsed_s', 'pages_per_s', 'records_per_s',
+            )
+        }
+
+    # ── Reporting ───────────────────────────────────────────────────
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self.started if self.started is not None else 0.0
+            depth = self.ocr_submitted - self.ocr_done
+            pages_per_s = self.pages_done / elapsed if elapsed > 0 else None
+            eta = None
+            if self.finished:
+                eta = 0.0
+            elif pages_per_s:
+                eta = (self.pages_total - self.pages_done) / pages_per_s
+                if depth and self.ocr_done:
+                    eta += depth * (self.ocr_busy_s / self.ocr_done) / self.ocr_workers
+            return {
+                'pdf': self.pdf_name,
+                'mode': self.mode,
+                'pages_total': self.pages_total,
+                'pages_done': self.pages_done,
+                'records': self.records,
+                'skipped_pages': self.skipped_pages,
+                'parse_errors': self.parse_errors,
+                'ocr_done': self.ocr_done,
+                'ocr_queue_depth': depth,
+                'pages_per_s': round(pages_per_s, 3) if pages_per_s is not None else None,
+                'records_per_s': round(self.records / elapsed, 3) if elapsed > 0 else None,
+                'eta_s': round(eta, 1) if eta is not None else None,
+                'elapsed_s': round(elapsed, 3),
+                'since_progress_s': round(now - self.last_progress, 1) if self.started is not None else 0.0,
+                'activity': self.activity,
+                'activity_s': round(now - self.activity_since, 1) if self.activity else None,
+                'finished': int(self.finished),
+                'updated_at': round(time.time(), 3),
+            }
+
+    def status_line(self, snapshot: dict[str, Any]) -> str:
+        total = snapshot['pages_total']
+        share = snapshot['pages_done'] / total if total else 0.0
+        line = (
+            f"[{snapshot['mode']}] {snapshot['pages_done']}/{total} pages ({share:.1%})"
+            f"  {snapshot['pages_per_s'] or 0:.1f} pages/s  {snapshot['records_per_s'] or 0:.1f} records/s"
+            f"  skipped {snapshot['skipped_pages']}  errors {snapshot['parse_errors']}"
+            f"  OCR queue {snapshot['ocr_queue_depth']}"
+        )
+        if snapshot['finished']:
+            return f"{line}  done in {_duration(snapshot['elapsed_s'])}"
+        line += f"  ETA {_duration(snapshot['eta_s'])}"
+        if snapshot['activity']:
+            line += f"  ({snapshot['activity']} for {_duration(snapshot['activity_s'])})"
+        elif snapshot['since_progress_s'] >= self.interval:
+            line += f"  (no progress for {_duration(snapshot['since_progress_s'])})"
+        return line
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._emit()
+
+    def _maybe_emit(self) -> None:
+        # With a heartbeat thread the timer does the emitting
+        if not self.heartbeat and time.monotonic() - self.last_emit >= self.interval:
+            self._emit()
+
+    def _emit(self, final: bool = False) -> dict[str, Any]:
+        snapshot = self.snapshot()
+        self.last_emit = time.monotonic()
+        if self.stream is not None:
+            line = self.status_line(snapshot)
+            if self._tty:
+                self.stream.write(f"\r\033[K{line}{chr(10) if final else ''}")
+            else:
+                self.stream.write(f'{line}\n')
+            self.stream.flush()
+        if self.metrics_path is not None:
+            write_metrics(self.metrics_path, snapshot)
+        if self.on_update is not None:
+            self.on_update(snapshot)
+        return snapshot
+
+
+def write_metrics(path: Path, snapshot: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so the collector never reads a partial file
+    partial = path.with_name(f'.{path.name}.tmp')
+    partial.write_text(prometheus_text(snapshot), encoding='utf-8')
+    partial.replace(path)
+
+
+def read_metrics(path: Path) -> dict[str, float]:
+    """metric name → value from a textfile written by `write_metrics`."""
+    values: dict[str, float] = {}
+    for line in path.read_text(encoding='utf-8').splitlines():
+        if line and not line.startswith('#'):
+            name_labels, _, value = line.rpartition(' ')
+            values[name_labels.split('{', 1)[0]] = float(value)
+    return values
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Show an extraction metrics textfile.')
+    parser.add_argument('--metrics-file', required=True, help='File written with --metrics-file.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    path = Path(args.metrics_file)
+    if not path.exists():
+        raise FileNotFoundError(f'Metrics file not found: {path}')
+    values = read_metrics(path)
+    age = time.time() - values.get('vtn_fct_extraction_last_update_timestamp_seconds', math.nan)
+    for name, value in values.items():
+        print(f'  {name:52s} {value:g}')
+    print(f'Written {age:.0f}s ago')
+
+
+if __name__ == '__main__':
+    main()
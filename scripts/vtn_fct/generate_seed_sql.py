@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Generate the Supabase seed for `vietnamese_food_composition`.
+
+Emits every record of extracted_ingredients.json with `search_text` and
+`search_text_ascii` already computed (see `search_text.py`), and disables
+the `on_food_composition_search_text` trigger for the duration of the
+load, so bulk loads skip the per-row concatenation + unaccent work and the
+full-table backfill UPDATEs are never needed.
+
+Two formats:
+- `sql`  (default) — multi-row INSERT, written to supabase/seed.sql
+- `copy` — psql script using `COPY ... FROM stdin` for large loads
+
+Usage:
+    python3 scripts/vtn_fct/generate_seed_sql.py
+    python3 scripts/vtn_fct/generate_seed_sql.py --format copy --output seed_copy.sql
+    psql "$DATABASE_URL" -f seed_copy.sql
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from search_text import record_search_columns, sql_literal
+
+TABLE = 'vietnamese_food_composition'
+SEARCH_TRIGGER = 'on_food_composition_search_text'
+
+NUTRIENT_KEYS = [
+    'calories_kcal', 'protein_g', 'carbohydrate_g', 'fat_g', 'fiber_g',
+    'sodium_mg', 'calcium_mg', 'iron_mg', 'magnesium_mg', 'phosphorus_mg',
+    'potassium_mg', 'zinc_mg', 'copper_mcg', 'manganese_mg',
+    'beta_carotene_mcg', 'vitamin_a_mcg', 'vitamin_d_mcg', 'vitamin_e_mg',
+    'vitamin_k_mcg', 'vitamin_c_mg', 'vitamin_b1_mg', 'vitamin_b2_mg',
+    'vitamin_pp_mg', 'vitamin_b5_mg', 'vitamin_b6_mg', 'vitamin_b9_mcg',
+    'vitamin_b12_mcg', 'vitamin_h_mcg',
+]
+
+COLUMNS = [
+    'id', 'name_primary', 'name_alt', 'name_en', 'type_vn', 'type_en',
+    'source', 'state', 'inedible_portion_pct',
+    *NUTRIENT_KEYS,
+    'last_verified',
+    'search_text', 'search_text_ascii',
+]
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def array_literal(values: list[str] | None) -> str | None:
+    """Postgres array input syntax for a text[] value."""
+    if values is None:
+        return None
+    elements = ','.join(
+        '"' + item.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for item in values
+    )
+    return '{' + elements + '}'
+
+
+def record_values(record: dict[str, Any]) -> list[Any]:
+    """Column values in `COLUMNS` order (None → NULL)."""
+    search_text, search_text_ascii = record_search_columns(record)
+    per_100g = record.get('per_100g', {})
+    return [
+        record['id'],
+        record['name_primary'],
+        array_literal(record.get('name_alt')),
+        record['name_en'],
+        record['type_vn'],
+        record['type_en'],
+        record['source'],
+        record['state'],
+        record.get('inedible_portion_pct'),
+        *(per_100g.get(key) for key in NUTRIENT_KEYS),
+        record.get('last_verified'),
+        search_text,
+        search_text_ascii,
+    ]
+
+
+def _sql_value(value: Any) -> str:
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return sql_literal(str(value))
+
+
+def _copy_value(value: Any) -> str:
+    """COPY text-format field: \\N for NULL, backslash escapes."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def render_insert(records: list[dict[str, Any]], source: str) -> str:
+    rows = ',\n'.join(
+        '(' + ', '.join(_sql_value(value) for value in record_values(record)) + ')'
+        for record in records
+    )
+    return (
+        f'-- Seed: {TABLE} (VTN FCT 2007)\n'
+        f'-- Source: {source} ({len(records)} records)\n'
+        '-- Generated by: scripts/vtn_fct/generate_seed_sql.py\n'
+        '-- search_text / search_text_ascii are precomputed; the trigger that\n'
+        '-- would rebuild them per row is disabled for the load.\n'
+        '\n'
+        'BEGIN;\n'
+        '\n'
+        f'ALTER TABLE {TABLE} DISABLE TRIGGER {SEARCH_TRIGGER};\n'
+        '\n'
+        f'INSERT INTO {TABLE} (\n'
+        f"  {', '.join(COLUMNS)}\n"
+        ') VALUES\n'
+        f'{rows};\n'
+        '\n'
+        f'ALTER TABLE {TABLE} ENABLE TRIGGER {SEARCH_TRIGGER};\n'
+        '\n'
+        'COMMIT;\n'
+    )
+
+
+def render_copy(records: list[dict[str, Any]], source: str) -> str:
+    rows = ''.join(
+        '\t'.join(_copy_value(value) for value in record_values(record)) + '\n'
+        for record in records
+    )
+    return (
+        f'-- Bulk load: {TABLE} (VTN FCT 2007)\n'
+        f'-- Source: {source} ({len(records)} records)\n'
+        '-- Generated by: scripts/vtn_fct/generate_seed_sql.py --format copy\n'
+        '-- Run with psql; search columns are precomputed.\n'
+        '\n'
+        'BEGIN;\n'
+        f'ALTER TABLE {TABLE} DISABLE TRIGGER {SEARCH_TRIGGER};\n'
+        f"COPY {TABLE} ({', '.join(COLUMNS)}) FROM stdin;\n"
+        f'{rows}'
+        '\\.\n'
+        f'ALTER TABLE {TABLE} ENABLE TRIGGER {SEARCH_TRIGGER};\n'
+        'COMMIT;\n'
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Generate seed SQL (with precomputed search columns) from extracted VTN FCT records.',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--output',
+        default='supabase/seed.sql',
+        help='Output SQL path.',
+    )
+    parser.add_argument(
+        '--format',
+        choices=['sql', 'copy'],
+        default='sql',
+        help='Multi-row INSERT (sql) or psql COPY FROM stdin script (copy).',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    records = load_records(Path(args.input))
+    render = render_copy if args.format == 'copy' else render_insert
+    output = render(records, args.input)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(output, encoding='utf-8')
+
+    print(f'Records: {len(records)}')
+    print(f'Format: {args.format}')
+    print(f'Output: {output_path}')
+
+
+if __name__ == '__main__':
+    main()
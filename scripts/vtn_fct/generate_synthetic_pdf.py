@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Generate synthetic VTN FCT-style PDFs with ground truth.
+
+Each food page is a real extracted record used as a template, with values
+jittered (log-normal, ±~15%) and extra values blanked at `--missing-rate`,
+laid out by page_layout.py:
+
+- TCVN3-encoded Vietnamese header with STT and food code, English name
+- bilingual two-column nutrient table with units
+- bold-simulated rows drawn as overlapping glyph pairs (Magnesium plus
+  `--doubled-rows` random rows per page), which pdfplumber reads doubled
+- chapter separator pages between food groups (skipped by the extractor)
+
+The PDF ships with `<output>.truth.json` listing every food page's
+expected record, so `--evaluate` can measure extraction speed and field
+accuracy together at any page count.
+
+Templates with an empty `name_en` are excluded: the book never has one,
+they come from OCR-damaged rows.
+
+Usage:
+    python3 scripts/vtn_fct/generate_synthetic_pdf.py --pages 2000 --output /tmp/synthetic.pdf
+    python3 scripts/vtn_fct/generate_synthetic_pdf.py --evaluate /tmp/synthetic.pdf
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+from enrich_extracted_data import FOOD_GROUPS, NUTRIENT_KEYS, get_food_code, get_group_prefix
+from page_layout import LEFT_ROWS, page_cells, render_separator_text
+from state_classifier import infer_state
+
+GENERATOR_VERSION = 2
+DEFAULT_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+FONT_NAME = 'FCTSans'
+FONT_SIZE = 7.5
+LEADING = 14.5
+MARGIN_X = 36
+MARGIN_TOP = 40
+RIGHT_COLUMN_X = 300
+BOLD_OFFSET = 0.3
+
+DOUBLEABLE_KEYS = [key for _, _, key in LEFT_ROWS if key is not None]
+
+
+def _jitter(value: float | None, rng: random.Random, missing_rate: float) -> float | None:
+    if value is None or rng.random() < missing_rate:
+        return None
+    scaled = value * rng.lognormvariate(0, 0.15)
+    if scaled >= 100:
+        return float(round(scaled))
+    if scaled >= 10:
+        return round(scaled, 1)
+    return round(scaled, 2)
+
+
+def synthetic_records(
+    templates: list[dict[str, Any]],
+    count: int,
+    rng: random.Random,
+    missing_rate: float,
+) -> list[dict[str, Any]]:
+    """`count` jittered copies of random templates, in food-code order."""
+    chosen = sorted(
+        (rng.choice(templates) for _ in range(count)),
+        key=lambda record: int(get_food_code(record['id'])),
+    )
+    return [
+        {
+            **template,
+            'per_100g': {
+                key: _jitter(template['per_100g'].get(key), rng, missing_rate)
+                for key in NUTRIENT_KEYS
+            },
+        }
+        for template in chosen
+    ]
+
+
+def _draw_cell(pdf: canvas.Canvas, text: str, x: float, y: float, doubled: bool) -> None:
+    if not doubled:
+        pdf.drawString(x, y, text)
+        return
+    # Bold simulation: repeat each glyph (not spaces / '.') slightly offset
+    for ch in text:
+        pdf.drawString(x, y, ch)
+        if ch not in ' .':
+            pdf.drawString(x + BOLD_OFFSET, y, ch)
+        x += pdfmetrics.stringWidth(ch, FONT_NAME, FONT_SIZE)
+
+
+def draw_food_page(pdf: canvas.Canvas, lines: list[list[tuple[str, bool]]]) -> None:
+    _, height = A4
+    pdf.setFont(FONT_NAME, FONT_SIZE)
+    y = height - MARGIN_TOP
+    for cells in lines:
+        for position, (text, doubled) in enumerate(cells):
+            x = MARGIN_X if position == 0 else RIGHT_COLUMN_X
+            _draw_cell(pdf, text, x, y, doubled)
+        y -= LEADING
+    pdf.showPage()
+
+
+def draw_separator_page(pdf: canvas.Canvas, text: str) -> None:
+    _, height = A4
+    pdf.setFont(FONT_NAME, 16)
+    y = height / 2
+    for line in text.split('\n'):
+        pdf.drawString(MARGIN_X * 2, y, line)
+        y -= 24
+    pdf.showPage()
+
+
+def generate(
+    templates: list[dict[str, Any]],
+    output: Path,
+    pages: int,
+    seed: int,
+    missing_rate: float,
+    doubled_rows: int,
+    font_path: Path,
+) -> dict[str, Any]:
+    """Write the PDF and return its ground truth."""
+    rng = random.Random(seed)
+    pdfmetrics.registerFont(TTFont(FONT_NAME, str(font_path)))
+    records = synthetic_records(
+        [template for template in templates if template.get('name_en', '').strip()],
+        pages,
+        rng,
+        missing_rate,
+    )
+
+    pdf = canvas.Canvas(str(output), pagesize=A4, pageCompression=1)
+    truth_records: list[dict[str, Any]] = []
+    separator_pages: list[int] = []
+    page_number = 0
+    current_group = None
+    for stt, record in enumerate(records, start=1):
+        group = get_group_prefix(get_food_code(record['id']))
+        if group != current_group:
+            current_group = group
+            type_vn, type_en = FOOD_GROUPS[group]
+            draw_separator_page(pdf, render_separator_text(group, type_vn, type_en))
+            page_number += 1
+            separator_pages.append(page_number)
+
+        doubled = frozenset({'magnesium_mg', *rng.sample(DOUBLEABLE_KEYS, doubled_rows)})
+        draw_food_page(pdf, page_cells(record, stt, random.Random(rng.random()), doubled))
+        page_number += 1
+        # The extractor derives state (and so the id) from the names; the
+        # template's stored state predates the current classifier.
+        state = infer_state(record['name_primary'], record['name_en'])
+        truth_records.append({
+            'page': page_number,
+            'id': f"fao_vn_2007_{get_food_code(record['id'])}_{state}",
+            'name_primary': record['name_primary'],
+            'name_en': record['name_en'],
+            'state': state,
+            'inedible_portion_pct': record.get('inedible_portion_pct'),
+            'per_100g': record['per_100g'],
+            'doubled_rows': sorted(doubled),
+        })
+    pdf.save()
+
+    return {
+        'generator_version': GENERATOR_VERSION,
+        'seed': seed,
+        'missing_rate': missing_rate,
+        'doubled_rows': doubled_rows,
+        'total_pages': page_number,
+        'separator_pages': separator_pages,
+        'records': truth_records,
+    }
+
+
+def truth_path_for(pdf_path: Path) -> Path:
+    return pdf_path.with_suffix('.truth.json')
+
+
+def evaluate(pdf_path: Path, truth: dict[str, Any]) -> dict[str, Any]:
+    """Run the real extractor on a synthetic PDF and score it against truth."""
+    from extract_vtn_fct_2007 import run_extraction
+
+    started = time.perf_counter()
+    result = run_extraction(pdf_path, ocr_header_fallback=False)
+    elapsed = time.perf_counter() - started
+
+    extracted = {record['_source_page']: record for record in result.records}
+    header_fields = ['id', 'name_primary', 'name_en', 'state', 'inedible_portion_pct']
+    field_errors = {key: 0 for key in [*header_fields, *NUTRIENT_KEYS]}
+    missing_pages: list[int] = []
+    exact_records = 0
+    for expected in truth['records']:
+        actual = extracted.get(expected['page'])
+        if actual is None:
+            missing_pages.append(expected['page'])
+            continue
+        errors = [key for key in header_fields if actual[key] != expected[key]]
+        errors += [
+            key for key in NUTRIENT_KEYS
+            if actual['per_100g'].get(key) != expected['per_100g'].get(key)
+        ]
+        for key in errors:
+            field_errors[key] += 1
+        exact_records += not errors
+
+    total = len(truth['records'])
+    compared = total - len(missing_pages)
+    cells = compared * len(field_errors)
+    return {
+        'pages': truth['total_pages'],
+        'seconds': elapsed,
+        'pages_per_s': truth['total_pages'] / elapsed if elapsed else 0.0,
+        'records_expected': total,
+        'records_extracted': len(result.records),
+        'missing_pages': missing_pages,
+        'exact_records': exact_records,
+        'field_accuracy': 1 - sum(field_errors.values()) / cells if cells else 0.0,
+        'field_errors': {key: count for key, count in field_errors.items() if count},
+        'skipped_pages': len(result.skipped_pages),
+        'parse_errors': len(result.parse_errors),
+    }
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic VTN FCT-style PDFs with ground truth, or evaluate extraction on one.',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients used as page templates.',
+    )
+    parser.add_argument('--output', default='synthetic_vtn_fct.pdf', help='Output PDF path.')
+    parser.add_argument('--pages', type=int, default=500, help='Number of food pages.')
+    parser.add_argument('--seed', type=int, default=2007, help='Random seed.')
+    parser.add_argument(
+        '--missing-rate',
+        type=float,
+        default=0.1,
+        help='Extra fraction of template values printed as "-".',
+    )
+    parser.add_argument(
+        '--doubled-rows',
+        type=int,
+        default=1,
+        help='Random bold-simulated rows per page (besides Magnesium).',
+    )
+    parser.add_argument('--font', default=DEFAULT_FONT, help='TrueType font with Vietnamese + Latin-1 glyphs.')
+    parser.add_argument(
+        '--evaluate',
+        metavar='PDF',
+        default=None,
+        help='Extract an existing synthetic PDF and score it against its .truth.json.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    if args.evaluate:
+        pdf_path = Path(args.evaluate)
+        with truth_path_for(pdf_path).open('r', encoding='utf-8') as handle:
+            truth = json.load(handle)
+        report = evaluate(pdf_path, truth)
+        print(f"Pages: {report['pages']} in {report['seconds']:.1f}s ({report['pages_per_s']:.1f} pages/s)")
+        print(f"Records: {report['records_extracted']}/{report['records_expected']} extracted, "
+              f"{report['exact_records']} exact")
+        print(f"Field accuracy: {report['field_accuracy']:.4%}")
+        for key, count in report['field_errors'].items():
+            print(f'  {key:25s} {count} errors')
+        if report['missing_pages']:
+            print(f"Missing pages: {report['missing_pages'][:20]}")
+        return
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    truth = generate(
+        load_records(Path(args.input)),
+        output,
+        pages=args.pages,
+        seed=args.seed,
+        missing_rate=args.missing_rate,
+        doubled_rows=args.doubled_rows,
+        font_path=Path(args.font),
+    )
+    truth_path = truth_path_for(output)
+    with truth_path.open('w', encoding='utf-8') as handle:
+        json.dump(truth, handle, ensure_ascii=False, indent=2)
+        handle.write('\n')
+
+    print(f"Pages: {truth['total_pages']} ({len(truth['records'])} food, "
+          f"{len(truth['separator_pages'])} separators) in {time.perf_counter() - started:.1f}s")
+    print(f'Output: {output}')
+    print(f'Truth: {truth_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Inspect how individual PDF pages go through the extraction pipeline.
+
+Opens only the requested pages (or reads them from the page-text cache)
+and prints every stage with its timing:
+
+1. raw text (cache hit / pdfplumber)
+2. deduplicated text, with the collapsed regions highlighted
+3. header regex match groups (name, STT, English name, code, refuse %)
+4. each nutrient's match span, matched text and parsed value
+5. TCVN3 → Unicode name conversion
+6. inferred state and the keywords that decided it
+
+Replaces the slow `extract_vtn_fct_2007.py --dump-page` loop, which runs a
+full extraction pass to print one page.
+
+Usage:
+    python3 scripts/vtn_fct/inspect_page.py --pdf "VTN FCT 2007.pdf" --page 22
+    python3 scripts/vtn_fct/inspect_page.py --pdf "VTN FCT 2007.pdf" --page 22-24,484
+    python3 scripts/vtn_fct/inspect_page.py --fixtures data/vtn_fct_2007/fixtures/page_texts.jsonl --page 22
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from extract_vtn_fct_2007 import (
+    ALL_NUTRIENTS,
+    HEADER_EDIBLE_RE,
+    HEADER_EN_RE,
+    HEADER_VN_RE,
+    deduplicate_text,
+    nutrient_regex,
+    parse_numeric,
+    tcvn3_to_vietnamese,
+)
+from page_text_cache import DEFAULT_CACHE_ROOT, PageTextCache
+from state_classifier import classify_state
+
+MERGE_GAP = 3
+
+
+class Style:
+    def __init__(self, color: bool) -> None:
+        self.color = color
+
+    def mark(self, text: str) -> str:
+        return f'\033[7m{text}\033[0m' if self.color else f'⟦{text}⟧'
+
+    def title(self, text: str) -> str:
+        return f'\033[1m{text}\033[0m' if self.color else text
+
+
+def parse_pages(spec: str) -> list[int]:
+    """'22,40-42' → [22, 40, 41, 42]."""
+    pages: list[int] = []
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = part.split('-', 1)
+            pages.extend(range(int(start), int(end) + 1))
+        elif part:
+            pages.append(int(part))
+    return pages
+
+
+def timed(stage: str, timings: dict[str, float], function: Callable[..., Any], *args: Any) -> Any:
+    started = time.perf_counter()
+    result = function(*args)
+    timings[stage] = time.perf_counter() - started
+    return result
+
+
+# ── Page sources ────────────────────────────────────────────────────
+
+def load_pdf_pages(
+    pdf_path: Path,
+    pages: list[int],
+    cache: PageTextCache | None,
+) -> dict[int, tuple[str, str, float]]:
+    """page → (text, source, seconds); only uncached pages are opened."""
+    loaded: dict[int, tuple[str, str, float]] = {}
+    missing: list[int] = []
+    for page in pages:
+        started = time.perf_counter()
+        text = cache.get(page) if cache is not None else None
+        if text is None:
+            missing.append(page)
+        else:
+            loaded[page] = (text, 'cache', time.perf_counter() - started)
+
+    if missing:
+        from extraction_daemon import page_texts_via_daemon
+
+        warm = page_texts_via_daemon(pdf_path, missing)
+        if warm is not None:
+            for page, (text, source, seconds) in warm.items():
+                if cache is not None:
+                    cache.put(page, text)
+                loaded[page] = (text, source, seconds)
+            return loaded
+
+        import pdfplumber
+
+        with pdfplumber.open(pdf_path, pages=missing) as pdf:
+            for page in pdf.pages:
+                started = time.perf_counter()
+                text = page.extract_text() or ''
+                if cache is not None:
+                    cache.put(page.page_number, text)
+                loaded[page.page_number] = (text, 'pdfplumber', time.perf_counter() - started)
+    return loaded
+
+
+def load_fixture_pages(path: Path, pages: list[int]) -> dict[int, tuple[str, str, float]]:
+    """Fixture corpus pages (full `rendered` pages win over `captured` excerpts)."""
+    wanted = set(pages)
+    loaded: dict[int, tuple[str, str, float]] = {}
+    with path.open('r', encoding='utf-8') as handle:
+        for line in handle:
+            entry = json.loads(line)
+            if entry['page'] in wanted and entry['page'] not in loaded:
+                loaded[entry['page']] = (entry['text'], f"fixture:{entry['kind']}", 0.0)
+    return loaded
+
+
+# ── Stages ──────────────────────────────────────────────────────────
+
+def changed_regions(raw: str, deduped: str) -> list[tuple[int, int, int, int]]:
+    """Raw/deduped spans that differ, merged across short equal gaps.
+
+    Deduplication only deletes glyphs, so a greedy left-to-right alignment
+    is exact and linear (difflib is ~20× slower on a full page).
+    """
+    regions: list[list[int]] = []
+    j = 0
+    for i, ch in enumerate(raw):
+        if j < len(deduped) and deduped[j] == ch:
+            j += 1
+            continue
+        if regions and i - regions[-1][1] <= MERGE_GAP:
+            regions[-1][1] = i + 1
+            regions[-1][3] = j
+        else:
+            regions.append([i, i + 1, j, j])
+
+    expanded: list[tuple[int, int, int, int]] = []
+    for i1, i2, j1, j2 in regions:
+        # Include the kept twin of the first and last collapsed pair
+        if i1 > 0 and j1 > 0 and raw[i1 - 1] == raw[i1]:
+            i1, j1 = i1 - 1, j1 - 1
+        if i2 < len(raw) and j2 < len(deduped) and raw[i2] == raw[i2 - 1]:
+            i2, j2 = i2 + 1, j2 + 1
+        expanded.append((i1, i2, j1, j2))
+    return expanded
+
+
+def highlight(text: str, spans: list[tuple[int, int]], style: Style) -> str:
+    parts: list[str] = []
+    cursor = 0
+    for start, end in spans:
+        parts.append(text[cursor:start])
+        parts.append(style.mark(text[start:end]))
+        cursor = end
+    parts.append(text[cursor:])
+    return ''.join(parts)
+
+
+def header_groups(text: str) -> dict[str, Any]:
+    normalized = re.sub(r'\s+', ' ', text)
+    groups: dict[str, Any] = {}
+    for name, pattern in (('vietnamese', HEADER_VN_RE), ('english', HEADER_EN_RE), ('edible', HEADER_EDIBLE_RE)):
+        match = pattern.search(normalized)
+        groups[name] = None if match is None else {
+            'span': match.span(),
+            'groups': match.groups(),
+        }
+    return groups
+
+
+def nutrient_matches(deduped: str) -> list[tuple[str, Any, float | None]]:
+    rows: list[tuple[str, Any, float | None]] = []
+    for key, (label, unit) in ALL_NUTRIENTS.items():
+        match = nutrient_regex(label, unit).search(deduped)
+        rows.append((key, match, parse_numeric(match.group(1)) if match else None))
+    return rows
+
+
+def state_reasons(vn_name: str, en_name: str) -> tuple[str, list[str], list[str]]:
+    result = classify_state(vn_name, en_name)
+    return result.state, list(result.raw_hits), list(result.cooked_hits)
+
+
+def inspect(page: int, text: str, source: str, load_s: float, style: Style, hide_raw: bool) -> None:
+    timings: dict[str, float] = {'load': load_s}
+    print(style.title(f'\n═══ Page {page} ({source}, {len(text)} chars) ═══'))
+
+    if not hide_raw:
+        print(style.title('\n── Raw text ──'))
+        print(text)
+
+    deduped = timed('dedup', timings, deduplicate_text, text)
+    regions = timed('dedup diff', timings, changed_regions, text, deduped)
+    print(style.title(f'\n── Deduplicated ({len(regions)} collapsed region(s)) ──'))
+    print(highlight(deduped, [(j1, j2) for _, _, j1, j2 in regions], style))
+    for i1, i2, j1, j2 in regions:
+        line = text.count('\n', 0, i1) + 1
+        print(f'  L{line}: {text[i1:i2]!r} → {deduped[j1:j2]!r}')
+
+    header = timed('header', timings, header_groups, text)
+    print(style.title('\n── Header ──'))
+    for name, found in header.items():
+        if found is None:
+            print(f'  {name:11s} no match')
+        else:
+            print(f"  {name:11s} span={found['span']} groups={found['groups']}")
+
+    nutrients = timed('nutrients', timings, nutrient_matches, deduped)
+    print(style.title('\n── Nutrients ──'))
+    for key, match, value in nutrients:
+        if match is None:
+            print(f'  {key:18s} no match')
+            continue
+        snippet = match.group(0)
+        if len(snippet) > 60:
+            snippet = snippet[:28] + ' … ' + snippet[-28:]
+        print(f'  {key:18s} {match.start():5d}-{match.end():<5d} {match.group(1):>8s} → {value!s:8s} {snippet!r}')
+
+    if header['vietnamese'] is not None and header['english'] is not None:
+        raw_name = header['vietnamese']['groups'][0].strip()
+        en_name = header['english']['groups'][0].strip()
+        name = timed('tcvn3', timings, tcvn3_to_vietnamese, raw_name)
+        changed = sum(1 for before, after in zip(raw_name, name) if before != after)
+        print(style.title('\n── TCVN3 ──'))
+        print(f'  {raw_name!r} → {name!r} ({changed} glyph(s) mapped)')
+
+        state, raw_hits, cooked_hits = timed('state', timings, state_reasons, name, en_name)
+        print(style.title('\n── State ──'))
+        print(f'  {state}  (raw keywords: {raw_hits or "-"}, cooked keywords: {cooked_hits or "-"})')
+    else:
+        print('\n  Header incomplete: extract_record would skip this page')
+
+    print(style.title('\n── Timings ──'))
+    for stage, seconds in timings.items():
+        print(f'  {stage:11s} {seconds * 1000:8.2f} ms')
+    print(f"  {'total':11s} {sum(timings.values()) * 1000:8.2f} ms")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Show each extraction stage (with timings) for selected pages.',
+    )
+    parser.add_argument('--page', required=True, help='Pages to inspect, e.g. 22 or 22-24,484.')
+    parser.add_argument('--pdf', default='VTN FCT 2007.pdf', help='Path to the source PDF.')
+    parser.add_argument(
+        '--fixtures',
+        default=None,
+        help='Read pages from a page-text fixture corpus (JSONL) instead of a PDF.',
+    )
+    parser.add_argument(
+        '--page-cache',
+        default=str(DEFAULT_CACHE_ROOT),
+        help='Page-text cache directory (shared with extract_vtn_fct_2007.py --page-cache).',
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Always re-read pages from the PDF.')
+    parser.add_argument('--hide-raw', action='store_true', help='Skip printing the raw page text.')
+    parser.add_argument(
+        '--color',
+        choices=['auto', 'always', 'never'],
+        default='auto',
+        help='Highlight with ANSI colors (auto: when stdout is a terminal).',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    pages = parse_pages(args.page)
+    style = Style(args.color == 'always' or (args.color == 'auto' and sys.stdout.isatty()))
+
+    started = time.perf_counter()
+    if args.fixtures:
+        loaded = load_fixture_pages(Path(args.fixtures), pages)
+    else:
+        pdf_path = Path(args.pdf)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f'PDF not found: {pdf_path}')
+        cache = None if args.no_cache else PageTextCache(Path(args.page_cache), pdf_path)
+        loaded = load_pdf_pages(pdf_path, pages, cache)
+
+    for page in pages:
+        if page not in loaded:
+            print(f'\nPage {page}: not found')
+            continue
+        text, source, load_s = loaded[page]
+        inspect(page, text, source, load_s, style, args.hide_raw)
+    print(f'\nWall time: {(time.perf_counter() - started) * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
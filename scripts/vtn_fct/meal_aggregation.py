@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Batch meal nutrient totals over the VTN FCT nutrient matrix.
+
+Each meal line is `(meal_id, ingredient_id, grams, basis)` where `basis`
+is `edible` (default; grams already exclude refuse) or `purchased` (grams
+as bought, so only `100 − inedible_portion_pct` percent is eaten).
+
+All lines are aggregated with one gather-multiply-reduce:
+
+    edible_g = grams × (1 − inedible_pct / 100 if purchased else 1)
+    contrib  = matrix[ingredient_rows] × edible_g / 100
+    totals   = reduce contrib by meal
+
+Null semantics: a null nutrient contributes nothing to the total, and the
+meal is flagged `incomplete` for that nutrient — the total is then a lower
+bound. Unknown ingredient ids make every nutrient incomplete for the meal.
+A null `inedible_portion_pct` on a purchased line is treated as 0% refuse
+and reported in `assumed_edible`.
+
+Input CSV columns: meal_id, ingredient_id, grams[, basis]
+
+Usage:
+    python3 scripts/vtn_fct/meal_aggregation.py --lines meals.csv --output meal_totals.jsonl
+    python3 scripts/vtn_fct/meal_aggregation.py --check
+    python3 scripts/vtn_fct/meal_aggregation.py --bench --bench-lines 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from enrich_extracted_data import NUTRIENT_KEYS
+from nutrient_neighbors import nutrient_matrix
+
+BASES = ('edible', 'purchased')
+
+
+@dataclass
+class MealLines:
+    """Columnar meal lines (one entry per logged ingredient)."""
+    meal_ids: list[str]
+    ingredient_ids: list[str]
+    grams: np.ndarray
+    purchased: np.ndarray
+
+
+@dataclass
+class MealTotals:
+    meal_ids: list[str]
+    totals: np.ndarray          # M × 28, sums of known contributions
+    incomplete: np.ndarray      # M × 28 bool, any contributing value null
+    unknown_lines: np.ndarray   # M, lines whose ingredient id is unknown
+    assumed_edible: np.ndarray  # M, purchased lines with null inedible_portion_pct
+
+    def to_dicts(self) -> Iterable[dict[str, Any]]:
+        for meal, meal_id in enumerate(self.meal_ids):
+            yield {
+                'meal_id': meal_id,
+                'totals': {
+                    key: round(float(self.totals[meal, column]), 4)
+                    for column, key in enumerate(NUTRIENT_KEYS)
+                },
+                'incomplete': [
+                    key for column, key in enumerate(NUTRIENT_KEYS)
+                    if self.incomplete[meal, column]
+                ],
+                'unknown_lines': int(self.unknown_lines[meal]),
+                'assumed_edible': int(self.assumed_edible[meal]),
+            }
+
+
+class MealAggregator:
+    """Nutrient matrix + edible fractions, indexed by ingredient id."""
+
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self.row_by_id = {record['id']: row for row, record in enumerate(records)}
+        matrix = nutrient_matrix(records)
+        # Extra all-NaN row at the end absorbs unknown ingredient ids
+        self.matrix = np.vstack([matrix, np.full((1, matrix.shape[1]), np.nan)])
+        self.known = ~np.isnan(self.matrix)
+        self.filled = np.where(self.known, self.matrix, 0.0)
+        inedible = np.array(
+            [record.get('inedible_portion_pct') for record in records] + [None],
+            dtype=float,
+        )
+        self.inedible_known = ~np.isnan(inedible)
+        self.edible_fraction = 1 - np.where(self.inedible_known, inedible, 0.0) / 100
+        self.unknown_row = len(records)
+
+    def ingredient_rows(self, ingredient_ids: list[str]) -> np.ndarray:
+        get = self.row_by_id.get
+        unknown = self.unknown_row
+        return np.fromiter(
+            (get(identifier, unknown) for identifier in ingredient_ids),
+            dtype=np.int64,
+            count=len(ingredient_ids),
+        )
+
+    def aggregate(self, lines: MealLines) -> MealTotals:
+        if not lines.meal_ids:
+            # reduceat has no runs to reduce over a header-only CSV
+            width = len(NUTRIENT_KEYS)
+            empty = np.zeros(0, dtype=np.int64)
+            return MealTotals([], np.zeros((0, width)), np.zeros((0, width), dtype=bool), empty, empty.copy())
+        meal_ids, meal_index = np.unique(np.asarray(lines.meal_ids), return_inverse=True)
+        rows = self.ingredient_rows(lines.ingredient_ids)
+        meal_count = len(meal_ids)
+
+        # Gather + multiply
+        factor = np.where(lines.purchased, self.edible_fraction[rows], 1.0)
+        scale = lines.grams * factor / 100
+        contributions = self.filled[rows] * scale[:, None]
+        missing = ~self.known[rows]
+
+        # Reduce per meal: sort once, then reduceat over contiguous runs
+        order = np.argsort(meal_index, kind='stable')
+        starts = np.flatnonzero(np.r_[True, np.diff(meal_index[order]) != 0])
+        totals = np.add.reduceat(contributions[order], starts, axis=0)
+        incomplete = np.logical_or.reduceat(missing[order], starts, axis=0)
+
+        unknown_lines = np.bincount(meal_index, weights=rows == self.unknown_row, minlength=meal_count)
+        assumed = lines.purchased & ~self.inedible_known[rows] & (rows != self.unknown_row)
+        assumed_edible = np.bincount(meal_index, weights=assumed, minlength=meal_count)
+
+        return MealTotals(
+            meal_ids=meal_ids.tolist(),
+            totals=totals,
+            incomplete=incomplete,
+            unknown_lines=unknown_lines.astype(np.int64),
+            assumed_edible=assumed_edible.astype(np.int64),
+        )
+
+
+def reference_totals(records: list[dict[str, Any]], lines: MealLines) -> dict[str, dict[str, Any]]:
+    """Per-line dict loop used by --check."""
+    by_id = {record['id']: record for record in records}
+    meals: dict[str, dict[str, Any]] = {}
+    for meal_id, ingredient_id, grams, purchased in zip(
+        lines.meal_ids, lines.ingredient_ids, lines.grams.tolist(), lines.purchased.tolist()
+    ):
+        meal = meals.setdefault(
+            meal_id,
+            {'totals': dict.fromkeys(NUTRIENT_KEYS, 0.0), 'incomplete': set()},
+        )
+        record = by_id.get(ingredient_id)
+        if record is None:
+            meal['incomplete'].update(NUTRIENT_KEYS)
+            continue
+        edible_grams = grams
+        if purchased and record.get('inedible_portion_pct') is not None:
+            edible_grams = grams * (100 - record['inedible_portion_pct']) / 100
+        for key in NUTRIENT_KEYS:
+            value = record['per_100g'].get(key)
+            if value is None:
+                meal['incomplete'].add(key)
+            else:
+                meal['totals'][key] += value * edible_grams / 100
+    return meals
+
+
+def read_lines(path: Path) -> MealLines:
+    meal_ids: list[str] = []
+    ingredient_ids: list[str] = []
+    grams: list[float] = []
+    purchased: list[bool] = []
+    with path.open('r', encoding='utf-8', newline='') as handle:
+        for line_number, row in enumerate(csv.DictReader(handle), start=2):
+            basis = (row.get('basis') or 'edible').strip()
+            if basis not in BASES:
+                raise ValueError(f'{path}:{line_number}: basis must be one of {BASES}, got {basis!r}')
+            meal_ids.append(row['meal_id'])
+            ingredient_ids.append(row['ingredient_id'])
+            grams.append(float(row['grams']))
+            purchased.append(basis == 'purchased')
+    return MealLines(meal_ids, ingredient_ids, np.array(grams), np.array(purchased, dtype=bool))
+
+
+def synthetic_lines(records: list[dict[str, Any]], count: int, seed: int) -> MealLines:
+    """~5 lines per meal, 1% unknown ids, 30% purchased weights."""
+    rng = np.random.default_rng(seed)
+    ids = np.array([record['id'] for record in records] + ['unknown_ingredient'])
+    weights = np.r_[np.full(len(records), 0.99 / len(records)), 0.01]
+    return MealLines(
+        meal_ids=[f'meal_{meal}' for meal in rng.integers(0, max(1, count // 5), size=count)],
+        ingredient_ids=ids[rng.choice(len(ids), size=count, p=weights)].tolist(),
+        grams=np.round(rng.uniform(5, 300, size=count), 1),
+        purchased=rng.random(count) < 0.3,
+    )
+
+
+def run_check(records: list[dict[str, Any]], lines: MealLines) -> int:
+    result = MealAggregator(records).aggregate(lines)
+    expected = reference_totals(records, lines)
+    mismatches = 0
+    for meal in result.to_dicts():
+        reference = expected[meal['meal_id']]
+        totals_match = all(
+            abs(meal['totals'][key] - round(reference['totals'][key], 4)) <= 1e-3
+            for key in NUTRIENT_KEYS
+        )
+        if not totals_match or set(meal['incomplete']) != reference['incomplete']:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"Mismatch: {meal['meal_id']}")
+
+    # A header-only CSV aggregates to no meals
+    no_lines = MealLines([], [], np.zeros(0), np.zeros(0, dtype=bool))
+    if MealAggregator(records).aggregate(no_lines).meal_ids:
+        mismatches += 1
+        print('Mismatch: meals from zero lines')
+    return mismatches
+
+
+def run_benchmark(records: list[dict[str, Any]], count: int, seed: int, repeats: int) -> dict[str, float]:
+    lines = synthetic_lines(records, count, seed)
+    started = time.perf_counter()
+    aggregator = MealAggregator(records)
+    build_s = time.perf_counter() - started
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        aggregator.aggregate(lines)
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {'lines': count, 'build_s': build_s, 'aggregate_s': best, 'lines_per_s': count / best}
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Aggregate nutrient totals for many meal lines in one vectorized pass.',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument('--lines', default=None, help='Meal lines CSV (meal_id, ingredient_id, grams[, basis]).')
+    parser.add_argument(
+        '--output',
+        default='-',
+        help="Per-meal totals as JSON Lines ('-' for stdout).",
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Compare with a per-line dict loop on synthetic (or --lines) input; exit 1 on mismatch.',
+    )
+    parser.add_argument('--bench', action='store_true', help='Report meal lines aggregated per second.')
+    parser.add_argument('--bench-lines', type=int, default=1000000, help='Synthetic lines for --bench.')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed repetitions for --bench (best is reported).')
+    parser.add_argument('--seed', type=int, default=2007, help='Random seed for synthetic lines.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_records(Path(args.input))
+
+    if args.bench:
+        result = run_benchmark(records, args.bench_lines, args.seed, args.repeats)
+        print(f"Lines: {result['lines']:,}")
+        print(f"Matrix build: {result['build_s'] * 1000:.1f}ms")
+        print(f"Aggregate: {result['aggregate_s'] * 1000:.1f}ms ({result['lines_per_s']:,.0f} lines/s)")
+        return
+
+    if args.check:
+        lines = read_lines(Path(args.lines)) if args.lines else synthetic_lines(records, 20000, args.seed)
+        mismatches = run_check(records, lines)
+        print(f'Lines: {len(lines.meal_ids)}')
+        print(f'Mismatches: {mismatches}')
+        if mismatches:
+            raise SystemExit(1)
+        return
+
+    if not args.lines:
+        raise SystemExit('Provide --lines (or use --check / --bench)')
+
+    try:
+        lines = read_lines(Path(args.lines))
+    except ValueError as error:
+        raise SystemExit(str(error)) from error
+
+    result = MealAggregator(records).aggregate(lines)
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for meal in result.to_dicts():
+            output.write(json.dumps(meal, ensure_ascii=False) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    report = sys.stderr if args.output == '-' else sys.stdout
+    print(f'Lines: {len(lines.meal_ids)}', file=report)
+    print(f'Meals: {len(result.meal_ids)}', file=report)
+    print(f'Unknown ingredient lines: {int(result.unknown_lines.sum())}', file=report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""Nutrient-profile nearest neighbours ("foods like this one").
+
+Builds a standardized matrix from the 28 `per_100g` fields and answers
+batched k-NN queries with NumPy. Null nutrients are common (vitamin D is
+printed for under 10% of rows), so every distance is computed over the
+dimensions both rows actually have:
+
+- `euclidean` — standardized Euclidean over shared dims, rescaled by
+  `sqrt(dims / shared)` so rows with fewer shared values are comparable
+- `cosine`    — 1 − cosine similarity of the standardized vectors,
+  restricted to shared dims
+
+Pairs sharing fewer than `--min-shared` nutrients are never returned.
+Candidates can be limited by `state` and food group (`type_en` or the
+group prefix from `enrich_extracted_data.FOOD_GROUPS`).
+
+Usage:
+    python3 scripts/vtn_fct/nutrient_neighbors.py --id fao_vn_2007_1004_raw --k 5
+    python3 scripts/vtn_fct/nutrient_neighbors.py --id fao_vn_2007_7017_raw --state raw --group 7
+    python3 scripts/vtn_fct/nutrient_neighbors.py --bench --bench-sizes 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from enrich_extracted_data import FOOD_GROUPS, NUTRIENT_KEYS, get_food_code, get_group_prefix
+
+METRICS = ('euclidean', 'cosine')
+DEFAULT_MIN_SHARED = 5
+ROW_BLOCK = 65536
+
+
+@dataclass
+class Neighbor:
+    id: str
+    name_primary: str
+    distance: float
+    shared: int
+
+
+def nutrient_matrix(records: list[dict[str, Any]]) -> np.ndarray:
+    """N × 28 float matrix with NaN for null nutrients."""
+    matrix = np.full((len(records), len(NUTRIENT_KEYS)), np.nan)
+    for row, record in enumerate(records):
+        per_100g = record.get('per_100g', {})
+        for column, key in enumerate(NUTRIENT_KEYS):
+            value = per_100g.get(key)
+            if value is not None:
+                matrix[row, column] = value
+    return matrix
+
+
+def record_group(record: dict[str, Any]) -> str:
+    return get_group_prefix(get_food_code(record['id']))
+
+
+class NutrientNeighbors:
+    """Standardized, NaN-masked nutrient matrix with batched k-NN."""
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        states: np.ndarray,
+        groups: np.ndarray,
+        ids: list[str] | None = None,
+        names: list[str] | None = None,
+    ) -> None:
+        self.ids = ids or [str(i) for i in range(matrix.shape[0])]
+        self.names = names or self.ids
+        self.states = states
+        self.groups = groups
+        self.present = ~np.isnan(matrix)
+
+        # Column scale from non-null values only; all-null or constant
+        # columns fall back to mean 0 / std 1
+        counts = self.present.sum(axis=0)
+        filled = np.where(self.present, matrix, 0.0)
+        mean = filled.sum(axis=0) / np.maximum(counts, 1)
+        centered = np.where(self.present, matrix - mean, 0.0)
+        std = np.sqrt((centered * centered).sum(axis=0) / np.maximum(counts, 1))
+        std = np.where(std > 0, std, 1.0)
+
+        standardized = (matrix - mean) / std
+        self.z = np.where(self.present, standardized, 0.0).astype(np.float32)
+        self.z_sq = self.z * self.z
+        self.mask = self.present.astype(np.float32)
+        self.mean = mean
+        self.std = std
+        self.index_by_id = {identifier: row for row, identifier in enumerate(self.ids)}
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> NutrientNeighbors:
+        return cls(
+            nutrient_matrix(records),
+            states=np.array([record.get('state', '') for record in records]),
+            groups=np.array([record_group(record) for record in records]),
+            ids=[record['id'] for record in records],
+            names=[record.get('name_primary', '') for record in records],
+        )
+
+    def candidate_rows(
+        self,
+        state: str | None = None,
+        group: str | None = None,
+    ) -> np.ndarray | None:
+        """Row indices allowed by the filters (None = all rows)."""
+        if state is None and group is None:
+            return None
+        allowed = np.ones(len(self.ids), dtype=bool)
+        if state is not None:
+            allowed &= self.states == state
+        if group is not None:
+            allowed &= self.groups == resolve_group(group)
+        return np.flatnonzero(allowed)
+
+    def query_rows(
+        self,
+        query_rows: np.ndarray,
+        k: int = 10,
+        metric: str = 'euclidean',
+        min_shared: int = DEFAULT_MIN_SHARED,
+        state: str | None = None,
+        group: str | None = None,
+        exclude_self: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """k nearest rows for each query row.
+
+        Returns `(rows, distances, shared)` arrays of shape Q × k; slots
+        without a valid neighbour hold row −1 and distance inf.
+        """
+        if metric not in METRICS:
+            raise ValueError(f'Unknown metric: {metric}')
+
+        zq = self.z[query_rows]
+        zq_sq = self.z_sq[query_rows]
+        mq = self.mask[query_rows]
+        q_count = len(query_rows)
+        dims = self.z.shape[1]
+
+        candidates = self.candidate_rows(state, group)
+        total = len(self.ids) if candidates is None else len(candidates)
+
+        best_rows = np.full((q_count, k), -1, dtype=np.int64)
+        best_dist = np.full((q_count, k), np.inf, dtype=np.float32)
+        best_shared = np.zeros((q_count, k), dtype=np.int32)
+
+        for start in range(0, total, ROW_BLOCK):
+            if candidates is None:
+                rows = np.arange(start, min(start + ROW_BLOCK, total))
+                z = self.z[start:start + ROW_BLOCK]
+                z_sq = self.z_sq[start:start + ROW_BLOCK]
+                mask = self.mask[start:start + ROW_BLOCK]
+            else:
+                rows = candidates[start:start + ROW_BLOCK]
+                z, z_sq, mask = self.z[rows], self.z_sq[rows], self.mask[rows]
+
+            # Sums restricted to dims present in both query and candidate
+            dot = zq @ z.T
+            q_norm = zq_sq @ mask.T
+            c_norm = mq @ z_sq.T
+            shared = mq @ mask.T
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if metric == 'euclidean':
+                    squared = np.maximum(q_norm + c_norm - 2 * dot, 0)
+                    dist = np.sqrt(squared * (dims / shared))
+                else:
+                    dist = 1 - dot / np.sqrt(q_norm * c_norm)
+            dist = np.where((shared >= min_shared) & np.isfinite(dist), dist, np.inf)
+            if exclude_self:
+                dist[rows[None, :] == query_rows[:, None]] = np.inf
+
+            merged_dist = np.concatenate([best_dist, dist.astype(np.float32)], axis=1)
+            merged_rows = np.concatenate(
+                [best_rows, np.broadcast_to(rows, (q_count, len(rows)))],
+                axis=1,
+            )
+            merged_shared = np.concatenate([best_shared, shared.astype(np.int32)], axis=1)
+            if merged_dist.shape[1] > k:
+                keep = np.argpartition(merged_dist, k - 1, axis=1)[:, :k]
+            else:
+                keep = np.broadcast_to(np.arange(merged_dist.shape[1]), merged_dist.shape)
+            best_dist = np.take_along_axis(merged_dist, keep, axis=1)
+            best_rows = np.take_along_axis(merged_rows, keep, axis=1)
+            best_shared = np.take_along_axis(merged_shared, keep, axis=1)
+
+        order = np.argsort(best_dist, axis=1, kind='stable')
+        best_dist = np.take_along_axis(best_dist, order, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+        best_shared = np.take_along_axis(best_shared, order, axis=1)
+        best_rows[~np.isfinite(best_dist)] = -1
+        return best_rows, best_dist, best_shared
+
+    def neighbors(
+        self,
+        identifiers: list[str],
+        k: int = 10,
+        metric: str = 'euclidean',
+        min_shared: int = DEFAULT_MIN_SHARED,
+        state: str | None = None,
+        group: str | None = None,
+    ) -> dict[str, list[Neighbor]]:
+        query_rows = np.array([self.index_by_id[identifier] for identifier in identifiers])
+        rows, distances, shared = self.query_rows(
+            query_rows, k, metric, min_shared, state, group
+        )
+        results: dict[str, list[Neighbor]] = {}
+        for position, identifier in enumerate(identifiers):
+            results[identifier] = [
+                Neighbor(
+                    id=self.ids[row],
+                    name_primary=self.names[row],
+                    distance=float(distance),
+                    shared=int(count),
+                )
+                for row, distance, count in zip(rows[position], distances[position], shared[position])
+                if row >= 0
+            ]
+        return results
+
+
+def resolve_group(group: str) -> str:
+    """Accept a group prefix ('7') or an English/Vietnamese group name."""
+    if group in FOOD_GROUPS:
+        return group
+    lowered = group.strip().lower()
+    for prefix, (type_vn, type_en) in FOOD_GROUPS.items():
+        if lowered in (type_vn.lower(), type_en.lower()):
+            return prefix
+    raise ValueError(f'Unknown food group: {group}')
+
+
+# ── Synthetic scaling benchmark ─────────────────────────────────────
+
+def synthetic_engine(
+    base: NutrientNeighbors,
+    base_matrix: np.ndarray,
+    rows: int,
+    seed: int,
+) -> NutrientNeighbors:
+    """Resample real rows with log-normal noise, keeping each column's null rate."""
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, base_matrix.shape[0], size=rows)
+    matrix = base_matrix[picks] * rng.lognormal(0.0, 0.1, size=(rows, base_matrix.shape[1]))
+    null_rate = np.isnan(base_matrix).mean(axis=0)
+    matrix[rng.random(matrix.shape) < null_rate] = np.nan
+    return NutrientNeighbors(matrix, states=base.states[picks], groups=base.groups[picks])
+
+
+def run_benchmark(
+    records: list[dict[str, Any]],
+    sizes: list[int],
+    queries: int,
+    k: int,
+    seed: int,
+) -> list[dict[str, float]]:
+    base_matrix = nutrient_matrix(records)
+    base = NutrientNeighbors.from_records(records)
+    results: list[dict[str, float]] = []
+    for size in sizes:
+        started = time.perf_counter()
+        engine = synthetic_engine(base, base_matrix, size, seed)
+        build_s = time.perf_counter() - started
+        query_rows = np.random.default_rng(seed + 1).integers(0, size, size=queries)
+
+        row: dict[str, float] = {'rows': size, 'build_s': build_s}
+        for metric in METRICS:
+            started = time.perf_counter()
+            engine.query_rows(query_rows, k=k, metric=metric)
+            row[f'{metric}_s'] = time.perf_counter() - started
+        started = time.perf_counter()
+        engine.query_rows(query_rows, k=k, state='raw', group='4')
+        row['filtered_s'] = time.perf_counter() - started
+        results.append(row)
+    return results
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Find foods with the most similar nutrient profile (NaN-aware k-NN).',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--id',
+        dest='ids',
+        action='append',
+        default=[],
+        help='Record id to find neighbours for (repeatable; batched).',
+    )
+    parser.add_argument('--k', type=int, default=10, help='Neighbours per query.')
+    parser.add_argument(
+        '--metric',
+        choices=METRICS,
+        default='euclidean',
+        help='Distance over shared standardized nutrients.',
+    )
+    parser.add_argument(
+        '--min-shared',
+        type=int,
+        default=DEFAULT_MIN_SHARED,
+        help='Minimum nutrients both rows must have.',
+    )
+    parser.add_argument('--state', choices=['raw', 'cooked'], default=None, help='Only return rows in this state.')
+    parser.add_argument('--group', default=None, help='Only return rows in this food group (prefix or name).')
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Benchmark batched queries over synthetic matrices.',
+    )
+    parser.add_argument(
+        '--bench-sizes',
+        type=int,
+        nargs='+',
+        default=[1000, 10000, 100000, 1000000],
+        help='Synthetic row counts for --bench.',
+    )
+    parser.add_argument('--bench-queries', type=int, default=32, help='Queries per batch for --bench.')
+    parser.add_argument('--seed', type=int, default=2007, help='Random seed for --bench.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_records(Path(args.input))
+
+    if args.bench:
+        print(f'Batch: {args.bench_queries} queries, k={args.k}')
+        print(f"  {'rows':>9}  {'build':>8}  {'euclid':>8}  {'cosine':>8}  {'filtered':>8}")
+        for row in run_benchmark(records, args.bench_sizes, args.bench_queries, args.k, args.seed):
+            print(
+                f"  {row['rows']:>9,}  {row['build_s']:>7.2f}s  {row['euclidean_s']:>7.3f}s  "
+                f"{row['cosine_s']:>7.3f}s  {row['filtered_s']:>7.3f}s"
+            )
+        return
+
+    if not args.ids:
+        raise SystemExit('Provide at least one --id (or use --bench)')
+
+    engine = NutrientNeighbors.from_records(records)
+    unknown = [identifier for identifier in args.ids if identifier not in engine.index_by_id]
+    if unknown:
+        raise SystemExit(f"Unknown id(s): {', '.join(unknown)}")
+
+    results = engine.neighbors(
+        args.ids,
+        k=args.k,
+        metric=args.metric,
+        min_shared=args.min_shared,
+        state=args.state,
+        group=args.group,
+    )
+    for identifier, neighbours in results.items():
+        row = engine.index_by_id[identifier]
+        print(f'\n── {identifier} — {engine.names[row]} ──')
+        for neighbour in neighbours:
+            print(
+                f'  {neighbour.distance:8.4f}  {neighbour.id:28s}  '
+                f'{neighbour.name_primary}  ({neighbour.shared} shared)'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""Range / top-k queries over extracted VTN FCT nutrients.
+
+Precomputes, once per load:
+- a sorted index per nutrient (row order + sorted values, nulls excluded)
+- boolean bitmaps per `state` and per food group
+
+so "protein_g >= 20 and fat_g <= 5" is two `searchsorted` slices AND-ed
+together and "top 20 iron among raw vegetables" walks the iron index from
+the top, keeping rows set in the state/group bitmap. Rows with a null
+value never satisfy a range on that nutrient and never rank.
+
+Usage:
+    python3 scripts/vtn_fct/nutrient_query.py --where "protein_g>=20" --where "fat_g<=5"
+    python3 scripts/vtn_fct/nutrient_query.py --top iron_mg --k 20 --state raw --group 4
+    python3 scripts/vtn_fct/nutrient_query.py --check
+    python3 scripts/vtn_fct/nutrient_query.py --bench --bench-sizes 526 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from enrich_extracted_data import NUTRIENT_KEYS
+from nutrient_neighbors import nutrient_matrix, record_group, resolve_group
+
+# Any float literal (.5, 2., +2, 1e-3); float() does the parsing
+CONDITION_RE = re.compile(
+    r'^\s*([a-z0-9_]+)\s*(>=|<=|>|<|=)\s*([+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)\s*$'
+)
+
+
+@dataclass
+class Range:
+    """Inclusive/exclusive bounds on one nutrient (None = unbounded)."""
+    nutrient: str
+    low: float | None = None
+    high: float | None = None
+    low_inclusive: bool = True
+    high_inclusive: bool = True
+
+    def matches(self, value: float | None) -> bool:
+        if value is None:
+            return False
+        if self.low is not None and (value < self.low or (value == self.low and not self.low_inclusive)):
+            return False
+        if self.high is not None and (value > self.high or (value == self.high and not self.high_inclusive)):
+            return False
+        return True
+
+
+@dataclass
+class Query:
+    ranges: list[Range] = field(default_factory=list)
+    state: str | None = None
+    group: str | None = None
+    order_by: str | None = None
+    k: int | None = None
+    descending: bool = True
+
+
+def parse_condition(text: str) -> Range:
+    """`protein_g>=20` → Range('protein_g', low=20)."""
+    match = CONDITION_RE.match(text)
+    if not match:
+        raise ValueError(f'Cannot parse condition: {text!r} (expected e.g. protein_g>=20)')
+    nutrient, operator, raw = match.groups()
+    if nutrient not in NUTRIENT_KEYS:
+        raise ValueError(f'Unknown nutrient: {nutrient}')
+    value = float(raw)
+    if operator == '>=':
+        return Range(nutrient, low=value)
+    if operator == '>':
+        return Range(nutrient, low=value, low_inclusive=False)
+    if operator == '<=':
+        return Range(nutrient, high=value)
+    if operator == '<':
+        return Range(nutrient, high=value, high_inclusive=False)
+    return Range(nutrient, low=value, high=value)
+
+
+class NutrientIndex:
+    """Sorted per-nutrient indexes plus state/group bitmaps."""
+
+    def __init__(self, matrix: np.ndarray, states: np.ndarray, groups: np.ndarray) -> None:
+        self.matrix = matrix
+        self.size = matrix.shape[0]
+        self.order: dict[str, np.ndarray] = {}
+        self.order_desc: dict[str, np.ndarray] = {}
+        self.sorted_values: dict[str, np.ndarray] = {}
+        for column, key in enumerate(NUTRIENT_KEYS):
+            values = matrix[:, column]
+            rows = np.flatnonzero(~np.isnan(values))
+            # Stable sort keeps ties in row order for deterministic top-k
+            order = rows[np.argsort(values[rows], kind='stable')]
+            self.order[key] = order
+            self.sorted_values[key] = values[order]
+            self.order_desc[key] = _descending(order, values[order])
+        self.state_bitmaps = {state: states == state for state in np.unique(states)}
+        self.group_bitmaps = {group: groups == group for group in np.unique(groups)}
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> NutrientIndex:
+        return cls(
+            nutrient_matrix(records),
+            states=np.array([record.get('state', '') for record in records]),
+            groups=np.array([record_group(record) for record in records]),
+        )
+
+    def range_mask(self, condition: Range) -> np.ndarray:
+        values = self.sorted_values[condition.nutrient]
+        start, stop = 0, len(values)
+        if condition.low is not None:
+            side = 'left' if condition.low_inclusive else 'right'
+            start = int(np.searchsorted(values, condition.low, side=side))
+        if condition.high is not None:
+            side = 'right' if condition.high_inclusive else 'left'
+            stop = int(np.searchsorted(values, condition.high, side=side))
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.order[condition.nutrient][start:max(start, stop)]] = True
+        return mask
+
+    def filter_mask(self, query: Query) -> np.ndarray:
+        mask = np.ones(self.size, dtype=bool)
+        if query.state is not None:
+            mask &= self.state_bitmaps.get(query.state, np.zeros(self.size, dtype=bool))
+        if query.group is not None:
+            mask &= self.group_bitmaps.get(resolve_group(query.group), np.zeros(self.size, dtype=bool))
+        for condition in query.ranges:
+            mask &= self.range_mask(condition)
+        return mask
+
+    def run(self, query: Query) -> list[int]:
+        """Matching row indices: by `order_by` if given, else in row order."""
+        mask = self.filter_mask(query)
+        if query.order_by is None:
+            rows = np.flatnonzero(mask)
+        else:
+            order = (self.order_desc if query.descending else self.order)[query.order_by]
+            rows = order[mask[order]]
+        if query.k is not None:
+            rows = rows[:query.k]
+        return rows.tolist()
+
+
+def _descending(order: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Reverse value order but keep ties in ascending row order."""
+    return order[np.lexsort((order, -values))]
+
+
+def brute_force(records: list[dict[str, Any]], query: Query) -> list[int]:
+    """Reference implementation: loop over dicts."""
+    group = resolve_group(query.group) if query.group is not None else None
+    matches: list[int] = []
+    for row, record in enumerate(records):
+        if query.state is not None and record.get('state') != query.state:
+            continue
+        if group is not None and record_group(record) != group:
+            continue
+        per_100g = record.get('per_100g', {})
+        if not all(condition.matches(per_100g.get(condition.nutrient)) for condition in query.ranges):
+            continue
+        if query.order_by is not None and per_100g.get(query.order_by) is None:
+            continue
+        matches.append(row)
+    if query.order_by is not None:
+        key = query.order_by
+        sign = -1 if query.descending else 1
+        matches.sort(key=lambda row: (sign * records[row]['per_100g'][key], row))
+    if query.k is not None:
+        matches = matches[:query.k]
+    return matches
+
+
+def random_query(rng: random.Random, index: NutrientIndex) -> Query:
+    """Ranges drawn from observed values so queries hit non-trivial sets."""
+    ranges: list[Range] = []
+    for nutrient in rng.sample(NUTRIENT_KEYS, rng.randint(0, 3)):
+        values = index.sorted_values[nutrient]
+        if len(values) == 0:
+            continue
+        bound = float(values[rng.randrange(len(values))])
+        operator = rng.choice(['>=', '>', '<=', '<', '='])
+        ranges.append(parse_condition(f'{nutrient}{operator}{bound}'))
+    return Query(
+        ranges=ranges,
+        state=rng.choice([None, None, 'raw', 'cooked']),
+        group=rng.choice([None, None, *sorted(index.group_bitmaps)]),
+        order_by=rng.choice([None, *NUTRIENT_KEYS]),
+        k=rng.choice([None, 1, 5, 20]),
+        descending=rng.random() < 0.7,
+    )
+
+
+def run_check(records: list[dict[str, Any]], queries: int, seed: int) -> int:
+    index = NutrientIndex.from_records(records)
+    rng = random.Random(seed)
+    mismatches = 0
+    for condition, low in [('vitamin_b12_mcg>.5', 0.5), ('zinc_mg>=1e-3', 0.001), ('fat_g>=+2', 2.0), ('iron_mg>=2.', 2.0)]:
+        if parse_condition(condition).low != low:
+            mismatches += 1
+            print(f'Mismatch: {condition} parsed as {parse_condition(condition)}')
+    for _ in range(queries):
+        query = random_query(rng, index)
+        expected = brute_force(records, query)
+        actual = index.run(query)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f'Mismatch: {query}')
+                print(f'  index: {actual[:10]}')
+                print(f'  scan:  {expected[:10]}')
+    return mismatches
+
+
+def synthetic_records(records: list[dict[str, Any]], rows: int, seed: int) -> list[dict[str, Any]]:
+    """Resample real records with ±10% jitter on every non-null nutrient."""
+    rng = random.Random(seed)
+    synthetic: list[dict[str, Any]] = []
+    for _ in range(rows):
+        source = records[rng.randrange(len(records))]
+        per_100g = {
+            key: None if value is None else round(value * rng.uniform(0.9, 1.1), 3)
+            for key, value in source['per_100g'].items()
+        }
+        synthetic.append({'id': source['id'], 'state': source['state'], 'per_100g': per_100g})
+    return synthetic
+
+
+def run_benchmark(records: list[dict[str, Any]], sizes: list[int], seed: int) -> list[dict[str, float]]:
+    queries = [
+        Query(ranges=[parse_condition('protein_g>=20'), parse_condition('fat_g<=5')]),
+        Query(state='raw', group='4', order_by='iron_mg', k=20),
+        Query(ranges=[parse_condition('calories_kcal<100')], order_by='vitamin_c_mg', k=10),
+    ]
+    results: list[dict[str, float]] = []
+    for size in sizes:
+        corpus = records if size == len(records) else synthetic_records(records, size, seed)
+        started = time.perf_counter()
+        index = NutrientIndex.from_records(corpus)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for query in queries:
+            index.run(query)
+        index_s = (time.perf_counter() - started) / len(queries)
+
+        started = time.perf_counter()
+        for query in queries:
+            brute_force(corpus, query)
+        scan_s = (time.perf_counter() - started) / len(queries)
+        results.append({'rows': size, 'build_s': build_s, 'index_s': index_s, 'scan_s': scan_s})
+    return results
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Range filters and top-k over extracted nutrients using sorted indexes.',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--where',
+        action='append',
+        default=[],
+        help='Condition like protein_g>=20 (repeatable; AND-ed).',
+    )
+    parser.add_argument('--state', choices=['raw', 'cooked'], default=None, help='Filter by state.')
+    parser.add_argument('--group', default=None, help='Filter by food group (prefix or name).')
+    parser.add_argument('--top', choices=NUTRIENT_KEYS, default=None, help='Order by this nutrient.')
+    parser.add_argument('--asc', action='store_true', help='Order ascending (default: highest first).')
+    parser.add_argument('--k', type=int, default=None, help='Limit the number of rows.')
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Compare random queries with a brute-force scan; exit 1 on mismatch.',
+    )
+    parser.add_argument('--check-queries', type=int, default=2000, help='Random queries for --check.')
+    parser.add_argument('--bench', action='store_true', help='Time index vs scan at several sizes.')
+    parser.add_argument(
+        '--bench-sizes',
+        type=int,
+        nargs='+',
+        default=None,
+        help='Row counts for --bench (default: current size, 100k).',
+    )
+    parser.add_argument('--seed', type=int, default=2007, help='Random seed for --check / --bench.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_records(Path(args.input))
+
+    if args.check:
+        mismatches = run_check(records, args.check_queries, args.seed)
+        print(f'Queries: {args.check_queries}')
+        print(f'Mismatches: {mismatches}')
+        if mismatches:
+            raise SystemExit(1)
+        return
+
+    if args.bench:
+        sizes = args.bench_sizes or [len(records), 100000]
+        print(f"  {'rows':>9}  {'build':>8}  {'index/q':>9}  {'scan/q':>9}")
+        for row in run_benchmark(records, sizes, args.seed):
+            print(
+                f"  {row['rows']:>9,}  {row['build_s']:>7.2f}s  "
+                f"{row['index_s'] * 1000:>7.2f}ms  {row['scan_s'] * 1000:>7.2f}ms"
+            )
+        return
+
+    try:
+        query = Query(
+            ranges=[parse_condition(text) for text in args.where],
+            state=args.state,
+            group=args.group,
+            order_by=args.top,
+            k=args.k,
+            descending=not args.asc,
+        )
+        rows = NutrientIndex.from_records(records).run(query)
+    except ValueError as error:
+        raise SystemExit(str(error)) from error
+
+    shown = [args.top] if args.top else []
+    shown += [condition.nutrient for condition in query.ranges if condition.nutrient not in shown]
+    for row in rows:
+        record = records[row]
+        values = '  '.join(f"{key}={record['per_100g'].get(key)}" for key in shown)
+        print(f"  {record['id']:28s}  {record['name_primary']}  {values}")
+    print(f'Matches: {len(rows)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""VTN FCT 2007 page text layout (as pdfplumber reads a food page).
+
+Renders a record back into the text `page.extract_text()` returns for the
+book's food pages, modelled on the captured `source_excerpt`s in
+validation/sample_packet.json:
+
+- TCVN3-encoded header: name, STT, English name, food code, refuse %
+- two-column bilingual nutrient table (label, unit, value, source)
+- bold-simulated rows where every glyph except spaces and '.' is doubled
+  (always the Magnesium row, as in the book)
+- '-' for values the book leaves empty
+
+Used to build the fixture corpus (build_page_fixtures.py) and synthetic
+PDFs without the copyrighted source.
+"""
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from search_text import unaccent
+from vn_transcode import unicode_to_tcvn3
+
+HEADER_VN = 'Tªn thùc phÈm (Vietnamese)'
+HEADER_EN = 'Tªn tiÕng Anh (English)'
+HEADER_CODE = 'M· sè'
+HEADER_PORTION = 'Thμnh phÇn dinh d−ìng trong 100g phÇn ¨n ®−îc (100 grams edible portion) Th¶i bá (%)'
+TABLE_HEADER = [
+    'Thμnh phÇn dinh d−ìng ĐV Hμm lượng TLTK Thμnh phÇn dinh d−ìng ĐV Hμm lượng TLTK',
+    '(Nutrients) (Unit) (Value) (Source) (Nutrients) (Unit) (Value) (Source)',
+]
+
+# Left column: (label, unit, per_100g key | None). Rows without a key are
+# printed with '-' (or derived, for KJ) — the dataset does not track them.
+LEFT_ROWS: list[tuple[str, str, str | None]] = [
+    ('Nước (Water)', 'g', None),
+    ('Năng lượng (Energy)', 'KCal', 'calories_kcal'),
+    ('', 'KJ', None),
+    ('Protein', 'g', 'protein_g'),
+    ('Lipid (Fat)', 'g', 'fat_g'),
+    ('Glucid (Carbohydrate)', 'g', 'carbohydrate_g'),
+    ('Celluloza (Fiber)', 'g', 'fiber_g'),
+    ('Tro (Ash)', 'g', None),
+    ('Đường tổng số (Sugar)', 'g', None),
+    ('Galactoza (Galactose)', 'g', None),
+    ('Maltoza (Maltose)', 'g', None),
+    ('Lactoza (Lactose)', 'g', None),
+    ('Fructoza (Fructose)', 'g', None),
+    ('Glucoza (Glucose)', 'g', None),
+    ('Sacaroza (Sucrose)', 'g', None),
+    ('Calci (Calcium)', 'mg', 'calcium_mg'),
+    ('Sắt (Iron)', 'mg', 'iron_mg'),
+    ('Magiê (Magnesium)', 'mg', 'magnesium_mg'),
+    ('Mangan (Manganese)', 'mg', 'manganese_mg'),
+    ('Phospho (Phosphorous)', 'mg', 'phosphorus_mg'),
+    ('Kali (Potassium)', 'mg', 'potassium_mg'),
+    ('Natri (Sodium)', 'mg', 'sodium_mg'),
+    ('Kẽm (Zinc)', 'mg', 'zinc_mg'),
+    ('Đồng (Copper)', 'μg', 'copper_mcg'),
+    ('Selen (Selenium)', 'μg', None),
+    ('Vitamin C (Ascorbic acid)', 'mg', 'vitamin_c_mg'),
+    ('Vitamin B1 (Thiamine)', 'mg', 'vitamin_b1_mg'),
+    ('Vitamin B2 (Riboflavin)', 'mg', 'vitamin_b2_mg'),
+    ('Vitamin PP (Niacin)', 'mg', 'vitamin_pp_mg'),
+    ('Vitamin B5 (Pantothenic acid)', 'mg', 'vitamin_b5_mg'),
+    ('Vitamin B6 (Pyridoxine)', 'mg', 'vitamin_b6_mg'),
+    ('Folat (Folate)', 'μg', None),
+    ('Vitamin B9 (Folic acid)', 'μg', 'vitamin_b9_mcg'),
+    ('Vitamin H (Biotin)', 'μg', 'vitamin_h_mcg'),
+    ('Vitamin B12 (Cyanocobalamine)', 'μg', 'vitamin_b12_mcg'),
+    ('Vitamin A (Retinol)', 'μg', 'vitamin_a_mcg'),
+    ('Vitamin D (Calciferol)', 'μg', 'vitamin_d_mcg'),
+    ('Vitamin E (Alpha-tocopherol)', 'mg', 'vitamin_e_mg'),
+    ('Vitamin K (Phylloquinone)', 'μg', 'vitamin_k_mcg'),
+    ('Beta-caroten', 'μg', 'beta_carotene_mcg'),
+    ('Alpha-caroten', 'μg', None),
+    ('Beta-cryptoxanthin', 'μg', None),
+    ('Lycopen', 'μg', None),
+    ('Lutein + Zeaxanthin', 'μg', None),
+]
+
+# Right column: (label, unit | None). Never parsed; values are filler.
+RIGHT_ROWS: list[tuple[str, str | None]] = [
+    ('Tổng số isoflavon (Total isoflavone)', 'mg'),
+    ('Daidzein', 'mg'),
+    ('Genistein', 'mg'),
+    ('Glycetin', 'mg'),
+    ('Tổng số acid béo no', 'g'),
+    ('(Total saturated fatty acid)', None),
+    ('Palmitic (C16:0)', 'g'),
+    ('Margaric (C17:0)', 'g'),
+    ('Stearic (C18:0)', 'g'),
+    ('Arachidic (C20:0)', 'g'),
+    ('Behenic (22:0)', 'g'),
+    ('Lignoceric (C24:0)', 'g'),
+    ('TS acid béo không no 1 nối đôi', 'g'),
+    ('(Total monounsaturated fatty acid)', None),
+    ('Myristoleic (C14:1)', 'g'),
+    ('Palmitoleic (C16:1)', 'g'),
+    ('Oleic (C18:1)', 'g'),
+    ('TS acid béo không no nhiều nối đôi', 'g'),
+    ('(Total polyunsaturated fatty acid)', None),
+    ('Linoleic (C18:2 n6)', 'g'),
+    ('Linolenic (C18:3 n3)', 'g'),
+    ('Arachidonic (C20:4)', 'g'),
+    ('EPA (C20:5 n3)', 'g'),
+    ('DHA (C22:6 n3)', 'g'),
+    ('TS acid béo trans', 'g'),
+    ('(Total trans fatty acid)', None),
+    ('Cholesterol', 'mg'),
+    ('Phytosterol', 'mg'),
+    ('Lysin', 'mg'),
+    ('Methionin', 'mg'),
+    ('Tryptophan', 'mg'),
+    ('Phenylalanin', 'mg'),
+    ('Threonin', 'mg'),
+    ('Valin', 'mg'),
+    ('Leucin', 'mg'),
+    ('Isoleucin', 'mg'),
+    ('Arginin', 'mg'),
+    ('Histidin', 'mg'),
+    ('Cystin', 'mg'),
+    ('Tyrosin', 'mg'),
+    ('Alanin', 'mg'),
+    ('Acid aspartic', 'mg'),
+    ('Acid glutamic', 'mg'),
+    ('Glycin', 'mg'),
+]
+
+DOUBLED_KEYS = frozenset({'magnesium_mg'})
+
+
+def format_value(value: float | None) -> str:
+    """Book-style number: '-' for empty, no trailing zeros."""
+    if value is None:
+        return '-'
+    return f'{value:.3f}'.rstrip('0').rstrip('.')
+
+
+def double_glyphs(value: str) -> str:
+    """Bold simulation: every glyph doubled except spaces and '.'."""
+    return ''.join(ch if ch in ' .' else ch * 2 for ch in value)
+
+
+def _cell(label: str, unit: str | None, value: str) -> str:
+    parts = [part for part in (label, unit) if part]
+    parts.append(value)
+    if value != '-':
+        parts.append('1')
+    return ' '.join(parts)
+
+
+def page_cells(
+    record: dict[str, Any],
+    stt: int,
+    rng: random.Random | None = None,
+    doubled_keys: frozenset[str] = DOUBLED_KEYS,
+) -> list[list[tuple[str, bool]]]:
+    """Page lines as `(cell_text, doubled)` cells: 1 cell per header line,
+    up to 2 (left/right column) per table line."""
+    rng = rng or random.Random(record['id'])
+    food_code = record['id'].split('_')[3]
+    per_100g = record.get('per_100g', {})
+    inedible = record.get('inedible_portion_pct')
+    portion = '-' if inedible is None else f'{inedible:.1f}'
+
+    lines: list[list[tuple[str, bool]]] = [
+        [(f"{HEADER_VN}: {unicode_to_tcvn3(record['name_primary'])} STT: {stt}", False)],
+        [(f"{HEADER_EN}: {record['name_en']} {HEADER_CODE}: {food_code}", False)],
+        [(f'{HEADER_PORTION}: {portion}', False)],
+        *([(line, False)] for line in TABLE_HEADER),
+    ]
+
+    calories = per_100g.get('calories_kcal')
+    for position in range(max(len(LEFT_ROWS), len(RIGHT_ROWS))):
+        cells: list[tuple[str, bool]] = []
+        if position < len(LEFT_ROWS):
+            label, unit, key = LEFT_ROWS[position]
+            if key is not None:
+                value = format_value(per_100g.get(key))
+            elif unit == 'KJ':
+                value = format_value(None if calories is None else round(calories * 4.184))
+            else:
+                value = format_value(round(rng.uniform(0.1, 90), 1) if rng.random() < 0.3 else None)
+            cells.append((_cell(label, unit, value), key in doubled_keys))
+        if position < len(RIGHT_ROWS):
+            label, unit = RIGHT_ROWS[position]
+            if unit is None:
+                cells.append((label, False))
+            else:
+                filler = round(rng.uniform(0, 500), 3) if rng.random() < 0.3 else None
+                cells.append((_cell(label, unit, format_value(filler)), False))
+        lines.append(cells)
+    return lines
+
+
+def render_page_text(
+    record: dict[str, Any],
+    stt: int,
+    rng: random.Random | None = None,
+    doubled_keys: frozenset[str] = DOUBLED_KEYS,
+) -> str:
+    """Page text for one record, laid out like pdfplumber's output."""
+    return '\n'.join(
+        ' '.join(double_glyphs(text) if doubled else text for text, doubled in cells)
+        for cells in page_cells(record, stt, rng, doubled_keys)
+    )
+
+
+def render_ocr_header(record: dict[str, Any], stt: int) -> str:
+    """What tesseract (lang='eng') returns for the header crop: no diacritics."""
+    food_code = record['id'].split('_')[3]
+    inedible = record.get('inedible_portion_pct')
+    portion = '' if inedible is None else f'{inedible:.1f}'
+    return (
+        f"Ten thuc pham (Vietnamese): {unaccent(record['name_primary'])} STT: {stt}\n"
+        f"Ten tieng Anh (English): {record['name_en']} Ma so: {food_code}\n"
+        f'Thanh phan dinh duong trong 100g phan an duoc (100 grams edible portion) '
+        f'Thai bo (%): {portion}\n'
+    )
+
+
+def render_separator_text(number: str, type_vn: str, type_en: str) -> str:
+    """Chapter separator page (no food header; the extractor skips it)."""
+    return f'{number}. {type_vn.upper()}\n{type_en.upper()}'
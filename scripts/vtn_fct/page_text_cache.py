@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""On-disk cache of page texts, keyed by PDF content and text backend.
+
+`page.extract_text()` dominates extraction time, and its output only
+depends on the PDF bytes, so texts are stored once per PDF under
+
+    <root>/<sha256 of the PDF, 16 hex>/page_00022.txt
+
+(`<hash>-<backend>/` for the other text backends, see text_backends.py)
+and reused by `extract_vtn_fct_2007.py --page-cache` and inspect_page.py.
+A changed PDF hashes to a new directory, so stale texts are never read.
+"""
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+DEFAULT_CACHE_ROOT = Path('data/vtn_fct_2007/page_cache')
+
+
+def pdf_digest(pdf_path: Path) -> str:
+    with pdf_path.open('rb') as handle:
+        return hashlib.file_digest(handle, 'sha256').hexdigest()
+
+
+class PageTextCache:
+    def __init__(self, root: Path, pdf_path: Path, backend: str = 'pdfplumber') -> None:
+        digest = pdf_digest(pdf_path)[:16]
+        self.directory = root / (digest if backend == 'pdfplumber' else f'{digest}-{backend}')
+
+    def path(self, page_number: int) -> Path:
+        return self.directory / f'page_{page_number:05d}.txt'
+
+    def get(self, page_number: int) -> str | None:
+        try:
+            return self.path(page_number).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def put(self, page_number: int, text: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(page_number)
+        # Write-then-rename so a concurrent reader never sees a partial page;
+        # the daemon, the CLI and inspect_page.py may write the same page at
+        # once, so each writer gets its own temp file.
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=self.directory, prefix=path.stem + '.', suffix='.tmp', delete=False,
+        ) as partial:
+            partial.write(text)
+        Path(partial.name).replace(path)
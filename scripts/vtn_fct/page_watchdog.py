@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""Supervised extraction: each page in a worker process under a watchdog.
+
+`run_extraction` reads, parses and OCRs every page inline, so one page that
+makes pdfplumber's layout analysis explode, a runaway regex or a hung
+tesseract stalls the whole run (`parse_errors` only sees exceptions). Here
+pages go to `workers` long-lived worker processes (spawned, each with the
+PDF open once) and the supervisor enforces per page:
+
+- a wall-clock limit (`timeout`): the worker is killed and replaced, with
+  its process group (each worker has its own), so a hung tesseract or
+  pdftoppm goes too
+- a memory cap (`memory_mb`, RLIMIT_AS in the worker): a MemoryError while
+  reading the page, or the worker dying, counts against the page
+
+A page that hits a limit gets a `parse_errors` entry with the reason and is
+retried once on the cheaper fallback path: the pypdfium2 text backend (no
+layout analysis), no OCR header repair, and the text capped at
+FALLBACK_MAX_CHARS. The retry runs under the same limits, so a run takes
+at most about pages × 2 × timeout / workers, whatever the PDF contains.
+Pages that pass are processed exactly as in the serial run, so without
+incidents the output is identical; records from the fallback path carry
+`_watchdog` (dropped from the written records, listed in the report).
+
+Usage:
+    python3 scripts/vtn_fct/extract_vtn_fct_2007.py --watchdog [--page-timeout 60 --page-memory-mb 2048]
+    python3 scripts/vtn_fct/page_watchdog.py --pdf "VTN FCT 2007.pdf" --check
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import resource
+import signal
+import subprocess
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from extract_vtn_fct_2007 import ExtractionResult, run_extraction
+from text_backends import BACKENDS, DEFAULT_BACKEND, Pypdfium2Backend, open_backend
+
+if TYPE_CHECKING:
+    from extraction_progress import ExtractionProgress
+
+DEFAULT_PAGE_TIMEOUT_S = 60.0
+DEFAULT_PAGE_MEMORY_MB = 2048
+DEFAULT_WORKERS = 1
+FALLBACK_BACKEND = 'pypdfium2'
+# ~8× the longest real page; only the fallback path truncates
+FALLBACK_MAX_CHARS = 20000
+FULL, FALLBACK = 'full', 'fallback'
+# Injected by --check only: page → hang | memory | crash (full path only)
+FAULTS = ('hang', 'memory', 'crash')
+
+
+# ── Worker ──────────────────────────────────────────────────────────
+
+def _limit_memory(memory_mb: int) -> None:
+    limit = memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _inject(fault: str) -> None:
+    if fault == 'hang':
+        # In a child, like a hung tesseract: the kill must reach it too
+        subprocess.run([sys.executable, '-c', 'import time; time.sleep(1e9)'], check=False)
+    elif fault == 'memory':
+        hog = []
+        while True:
+            hog.append(bytearray(64 * 1024 * 1024))
+    elif fault == 'crash':
+        os._exit(70)
+
+
+def fallback_backend(backend: str) -> str:
+    return FALLBACK_BACKEND if Pypdfium2Backend.unavailable() is None else backend
+
+
+def _process_page(
+    page: int,
+    mode: str,
+    sources: dict[str, Any],
+    settings: dict[str, Any],
+) -> dict[str, Any]:
+    """One page as extract_page_texts handles it; the fallback skips OCR."""
+    from extract_vtn_fct_2007 import (
+        apply_ocr_header,
+        extract_ocr_header,
+        needs_ocr_header_fix,
+        parse_page,
+        read_page_text,
+        repair_name_encoding,
+    )
+    from page_text_cache import PageTextCache
+
+    pdf_path = Path(settings['pdf'])
+    backend = settings['backend'] if mode == FULL else fallback_backend(settings['backend'])
+    if backend not in sources:
+        sources[backend] = open_backend(backend, pdf_path)
+    page_cache = None
+    if mode == FULL and settings['page_cache']:
+        page_cache = PageTextCache(Path(settings['page_cache']), pdf_path, backend)
+
+    if mode == FULL and page in settings['faults']:
+        _inject(settings['faults'][page])
+    text = read_page_text(sources[backend], page, page_cache)
+    if mode == FALLBACK:
+        text = text[:FALLBACK_MAX_CHARS]
+
+    skipped: list[int] = []
+    errors: list[dict[str, Any]] = []
+    state: list[dict[str, Any]] | None = [] if settings['keep_parse_state'] else None
+    record = parse_page(text, page, skipped, errors, state)
+    ocr_seconds = None
+    if record is not None:
+        if mode == FULL and settings['ocr_header_fallback'] and needs_ocr_header_fix(record):
+            started = time.perf_counter()
+            ocr_header = extract_ocr_header(pdf_path, page)
+            ocr_seconds = time.perf_counter() - started
+            if ocr_header is not None:
+                apply_ocr_header(record, ocr_header)
+        repair_name_encoding(record)
+    return {
+        'record': record,
+        'skipped': bool(skipped),
+        'errors': errors,
+        'parse_state': state[0] if state else None,
+        'ocr_seconds': ocr_seconds,
+        'backend': backend,
+    }
+
+
+def _worker_main(conn: Connection, settings: dict[str, Any]) -> None:
+    # Own process group, so a kill also reaches the pdftoppm/tesseract it runs
+    os.setsid()
+    _limit_memory(settings['memory_mb'])
+    sources: dict[str, Any] = {}
+    try:
+        while True:
+            job = conn.recv()
+            if job is None:
+                break
+            page, mode = job
+            try:
+                conn.send(('ok', page, _process_page(page, mode, sources, settings)))
+            except MemoryError:
+                # The heap may be unusable now: report (if possible) and exit
+                try:
+                    conn.send(('memory', page, f"memory cap of {settings['memory_mb']} MB reached"))
+                finally:
+                    os._exit(71)
+            except Exception as error:  # noqa: BLE001 — reported per page
+                conn.send(('error', page, f'{type(error).__name__}: {error}'))
+    finally:
+        for source in sources.values():
+            source.close()
+
+
+# ── Supervisor ──────────────────────────────────────────────────────
+
+@dataclass
+class _Worker:
+    process: Any
+    conn: Connection
+    job: tuple[int, str] | None = None
+    started: float = 0.0
+
+
+@dataclass
+class _Incident:
+    page: int
+    reason: str  # timeout | memory | crash | error
+    error: str
+    seconds: float
+
+
+@dataclass
+class WatchdogStats:
+    timeout_s: float
+    memory_mb: int
+    workers: int
+    restarts: int = 0
+    incidents: list[dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'page_timeout_s': self.timeout_s,
+            'page_memory_mb': self.memory_mb,
+            'workers': self.workers,
+            'worker_restarts': self.restarts,
+            'incidents': self.incidents,
+        }
+
+
+class PageSupervisor:
+    """Hands (page, mode) jobs to worker processes and enforces the limits."""
+
+    def __init__(self, settings: dict[str, Any], workers: int, timeout: float) -> None:
+        self.settings = settings
+        self.timeout = timeout
+        self.context = multiprocessing.get_context('spawn')
+        self.workers = [self._spawn() for _ in range(max(workers, 1))]
+        self.restarts = 0
+
+    def _spawn(self) -> _Worker:
+        parent, child = self.context.Pipe()
+        process = self.context.Process(target=_worker_main, args=(child, self.settings), daemon=True)
+        process.start()
+        child.close()
+        return _Worker(process, parent)
+
+    @staticmethod
+    def _kill(worker: _Worker) -> None:
+        """SIGKILL the worker's process group: the worker and any OCR child it left."""
+        try:
+            os.killpg(worker.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        if worker.process.is_alive():  # killed before it reached setsid()
+            worker.process.kill()
+        worker.process.join()
+
+    def _replace(self, worker: _Worker) -> None:
+        # Also after a crash: the worker's children outlive it
+        self._kill(worker)
+        worker.conn.close()
+        position = self.workers.index(worker)
+        self.workers[position] = self._spawn()
+        self.restarts += 1
+
+    def close(self) -> None:
+        for worker in self.workers:
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self.workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                self._kill(worker)
+
+    def run(self, jobs: deque[tuple[int, str]]):
+        """Yield `(page, mode, outcome, payload, seconds)` as jobs finish.
+
+        outcome is 'ok' (payload = page result) or the failure reason
+        (payload = message). The caller may append retries to `jobs`.
+        """
+        while jobs or any(worker.job for worker in self.workers):
+            for worker in self.workers:
+                if worker.job is None and jobs:
+                    worker.job = jobs.popleft()
+                    worker.started = time.monotonic()
+                    worker.conn.send(worker.job)
+
+            busy = [worker for worker in self.workers if worker.job]
+            now = time.monotonic()
+            next_deadline = min(worker.started + self.timeout for worker in busy)
+            ready = wait(
+                [worker.conn for worker in busy] + [worker.process.sentinel for worker in busy],
+                timeout=max(next_deadline - now, 0),
+            )
+            now = time.monotonic()
+            for worker in busy:
+                page, mode = worker.job
+                seconds = now - worker.started
+                if worker.conn in ready:
+                    try:
+                        outcome, _, payload = worker.conn.recv()
+                    except (EOFError, OSError):
+                        outcome, payload = 'crash', self._exit_message(worker)
+                elif worker.process.sentinel in ready:
+                    outcome, payload = 'crash', self._exit_message(worker)
+                elif now >= worker.started + self.timeout:
+                    outcome, payload = 'timeout', f'no result after {self.timeout:g}s'
+                else:
+                    continue
+                worker.job = None
+                if outcome in ('memory', 'crash', 'timeout'):
+                    self._replace(worker)
+                yield page, mode, outcome, payload, seconds
+
+    @staticmethod
+    def _exit_message(worker: _Worker) -> str:
+        worker.process.join(timeout=1)
+        return f'worker exited with code {worker.process.exitcode}'
+
+
+def run_extraction_supervised(
+    pdf_path: Path,
+    ocr_header_fallback: bool,
+    page_cache_root: str | None = None,
+    backend: str = DEFAULT_BACKEND,
+    progress: ExtractionProgress | None = None,
+    keep_parse_state: bool = False,
+    timeout: float = DEFAULT_PAGE_TIMEOUT_S,
+    memory_mb: int = DEFAULT_PAGE_MEMORY_MB,
+    workers: int = DEFAULT_WORKERS,
+    faults: dict[int, str] | None = None,
+) -> ExtractionResult:
+    with open_backend(backend, pdf_path) as source:
+        page_count = source.page_count
+    if progress is not None:
+        progress.begin(page_count, 'watchdog', workers)
+
+    settings = {
+        'pdf': str(pdf_path),
+        'backend': backend,
+        'page_cache': page_cache_root,
+        'ocr_header_fallback': ocr_header_fallback,
+        'keep_parse_state': keep_parse_state,
+        'memory_mb': memory_mb,
+        'faults': faults or {},
+    }
+    stats = WatchdogStats(timeout, memory_mb, workers)
+    results: dict[int, dict[str, Any]] = {}
+    incidents: dict[int, _Incident] = {}
+    failed: dict[int, str] = {}
+    records_so_far = skipped_so_far = errors_so_far = 0
+
+    jobs: deque[tuple[int, str]] = deque((page, FULL) for page in range(1, page_count + 1))
+    supervisor = PageSupervisor(settings, workers, timeout)
+    try:
+        for page, mode, outcome, payload, seconds in supervisor.run(jobs):
+            if outcome == 'ok':
+                results[page] = payload
+            elif mode == FULL:
+                incidents[page] = _Incident(page, outcome, payload, round(seconds, 3))
+                jobs.append((page, FALLBACK))
+                continue
+            else:
+                failed[page] = f'{outcome}: {payload}'
+
+            if progress is not None:
+                result = results.get(page)
+                if result is not None and result['ocr_seconds'] is not None:
+                    progress.ocr_queued()
+                    progress.ocr_started(page)
+                    progress.ocr_finished(result['ocr_seconds'])
+                records_so_far += bool(result and result['record'])
+                skipped_so_far += bool(result and result['skipped'])
+                errors_so_far += len(result['errors']) if result else 1
+                progress.page_done(records_so_far, skipped_so_far, errors_so_far + len(incidents))
+    finally:
+        supervisor.close()
+    stats.restarts = supervisor.restarts
+
+    # Merge in page order, as the serial run would have produced them
+    records: list[dict[str, Any]] = []
+    skipped_pages: list[int] = []
+    parse_errors: list[dict[str, Any]] = []
+    parse_state: list[dict[str, Any]] = []
+    for page in range(1, page_count + 1):
+        result = results.get(page)
+        incident = incidents.get(page)
+        if incident is not None:
+            entry = {
+                'page': page,
+                'error': incident.error,
+                'reason': incident.reason,
+                'fallback': 'failed: ' + failed[page] if page in failed else 'recovered',
+            }
+            parse_errors.append(entry)
+            stats.incidents.append({**entry, 'seconds': incident.seconds})
+        elif page in failed:
+            # Only the fallback path can fail without an incident (the retry itself)
+            parse_errors.append({'page': page, 'error': failed[page]})
+        if result is None:
+            continue
+        parse_errors.extend(result['errors'])
+        if result['skipped']:
+            skipped_pages.append(page)
+        if result['parse_state'] is not None:
+            parse_state.append(result['parse_state'])
+        record = result['record']
+        if record is not None:
+            if incident is not None:
+                record['_watchdog'] = {
+                    'reason': incident.reason,
+                    'fallback_backend': result['backend'],
+                    'ocr': False,
+                }
+            records.append(record)
+
+    return ExtractionResult(
+        records=records,
+        skipped_pages=skipped_pages,
+        parse_errors=parse_errors,
+        parse_state=parse_state,
+        watchdog=stats.summary(),
+    )
+
+
+# ── Check ───────────────────────────────────────────────────────────
+
+def parse_faults(specs: list[str]) -> dict[int, str]:
+    """['hang:5', 'memory:7'] → {5: 'hang', 7: 'memory'}."""
+    faults: dict[int, str] = {}
+    for spec in specs:
+        kind, _, page = spec.partition(':')
+        if kind not in FAULTS or not page.isdigit():
+            raise ValueError(f'Bad fault {spec!r}: expected {"|".join(FAULTS)}:<page>')
+        faults[int(page)] = kind
+    return faults
+
+
+def check_against_serial(
+    serial: ExtractionResult,
+    supervised: ExtractionResult,
+    faults: dict[int, str],
+) -> list[str]:
+    """Differences outside the faulted pages, and faulted pages not handled as expected."""
+    from pipelined_extraction import result_differences
+
+    problems: list[str] = []
+    expected_reason = {'hang': 'timeout', 'memory': 'memory', 'crash': 'crash'}
+    incidents = {entry['page']: entry for entry in supervised.watchdog['incidents']}
+    for page, kind in sorted(faults.items()):
+        incident = incidents.get(page)
+        if incident is None:
+            problems.append(f'page {page} ({kind}): no incident recorded')
+        elif incident['reason'] != expected_reason[kind]:
+            problems.append(f"page {page} ({kind}): recorded as {incident['reason']}")
+        elif incident['fallback'] != 'recovered':
+            problems.append(f"page {page} ({kind}): fallback {incident['fallback']}")
+    unexpected = sorted(set(incidents) - set(faults))
+    if unexpected:
+        problems.append(f'unexpected incidents on pages {unexpected}')
+
+    def without(result: ExtractionResult) -> ExtractionResult:
+        return ExtractionResult(
+            records=[r for r in result.records if r['_source_page'] not in faults],
+            skipped_pages=[p for p in result.skipped_pages if p not in faults],
+            parse_errors=[e for e in result.parse_errors if e['page'] not in faults],
+        )
+
+    problems += result_differences(without(serial), without(supervised))
+    return problems
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Extract with every page in a supervised worker (timeout + memory cap).',
+    )
+    parser.add_argument('--pdf', default='VTN FCT 2007.pdf', help='Path to the source PDF.')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default=DEFAULT_BACKEND, help='Page-text extractor.')
+    parser.add_argument('--no-ocr', action='store_true', help='Text extraction only (no --ocr-header-fallback).')
+    parser.add_argument('--page-timeout', type=float, default=DEFAULT_PAGE_TIMEOUT_S, help='Seconds per page.')
+    parser.add_argument('--page-memory-mb', type=int, default=DEFAULT_PAGE_MEMORY_MB, help='Worker address-space cap.')
+    parser.add_argument('--page-workers', type=int, default=DEFAULT_WORKERS, help='Worker processes.')
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Inject faults (--fault), compare with the serial run and fail (exit 1) on any other difference.',
+    )
+    parser.add_argument(
+        '--fault',
+        action='append',
+        default=None,
+        help='hang|memory|crash:<page> for --check (default: one of each on the first food pages).',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    pdf_path = Path(args.pdf)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f'PDF not found: {pdf_path}')
+    ocr = not args.no_ocr
+
+    faults: dict[int, str] = {}
+    serial = None
+    if args.check:
+        started = time.perf_counter()
+        serial = run_extraction(pdf_path, ocr_header_fallback=ocr, backend=args.backend)
+        print(f'Serial run: {time.perf_counter() - started:.3f}s')
+        if args.fault:
+            faults = parse_faults(args.fault)
+        else:
+            pages = [record['_source_page'] for record in serial.records[:len(FAULTS)]]
+            faults = dict(zip(pages, FAULTS))
+        print('Injected: ' + ', '.join(f'{kind} on page {page}' for page, kind in sorted(faults.items())))
+
+    started = time.perf_counter()
+    result = run_extraction_supervised(
+        pdf_path,
+        ocr_header_fallback=ocr,
+        backend=args.backend,
+        timeout=args.page_timeout,
+        memory_mb=args.page_memory_mb,
+        workers=args.page_workers,
+        faults=faults,
+    )
+    print(f'Supervised run: {time.perf_counter() - started:.3f}s')
+    print(f'Extracted records: {len(result.records)}')
+    print(f"Worker restarts: {result.watchdog['worker_restarts']}")
+    for incident in result.watchdog['incidents']:
+        print(
+            f"  page {incident['page']}: {incident['reason']} ({incident['error']}) "
+            f"after {incident['seconds']:.1f}s → fallback {incident['fallback']}"
+        )
+
+    if serial is not None:
+        problems = check_against_serial(serial, result, faults)
+        for problem in problems[:20]:
+            print(f'FAIL {problem}')
+        if problems:
+            raise SystemExit(1)
+        print('Supervised output identical to serial outside the faulted pages, faults recovered: OK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""Worst-case latency fuzzing for the page parsers.
+
+`bench_extraction.py` measures throughput on real pages; this measures how
+the same parser functions behave on pages built to be hard:
+
+- `doubled_run`     long bold-doubled table rows ("MMaaggiiêê … 3333")
+- `bridge_run`      a doubled run followed by a long stretch of bridge
+                    characters (" . . .") before doubling resumes
+- `missing_units`   nutrient labels repeated on one line, units and values gone
+- `repeated_labels` label + unit repeated on one line, values gone
+- `repeated_headers` header prefixes ("Vietnamese):", "English):") without
+                    the STT / food-code tails
+- `long_line`       a real page with its newlines removed, repeated
+- `mutated_page`    real pages with random doubled spans, deleted units,
+                    duplicated lines and spliced labels (`--samples` per size)
+
+Every function runs on every family at doubling sizes up to `--max-chars`
+(best of `--repeats`; worst of the samples for `mutated_page`). A pair fails
+when one call on an input of at most `--budget-chars` (a few real pages)
+exceeds `--budget-ms`, or when the time grows faster than
+size^`--max-exponent` between the two largest sizes (ignored below
+`--min-ms`, where timer noise dominates). Each input is also checked for
+crashes, a deduplicated text longer than its input, and non-finite values.
+
+Failures can be kept as regression cases (`--record`): the generator spec
+(function, family, size, seed) goes to `fixtures/parser_fuzz_cases.jsonl`
+and is replayed against the budget on every run.
+
+Usage:
+    python3 scripts/vtn_fct/parser_fuzz.py
+    python3 scripts/vtn_fct/parser_fuzz.py --function extract_header --family repeated_headers
+    python3 scripts/vtn_fct/parser_fuzz.py --max-chars 65536 --record
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from extract_vtn_fct_2007 import (
+    ALL_NUTRIENTS,
+    deduplicate_text,
+    extract_header,
+    extract_record,
+    extract_value,
+    nutrient_regex,
+    nutrient_signals,
+    parse_numeric,
+    parse_ocr_header,
+    tcvn3_to_vietnamese,
+)
+
+DEFAULT_CORPUS = Path('data/vtn_fct_2007/fixtures/page_texts.jsonl')
+DEFAULT_CASES = Path('data/vtn_fct_2007/fixtures/parser_fuzz_cases.jsonl')
+DEFAULT_MIN_CHARS = 1024
+DEFAULT_MAX_CHARS = 32768
+DEFAULT_BUDGET_MS = 50.0
+# The longest fixture page is ~2.6k chars
+DEFAULT_BUDGET_CHARS = 8192
+DEFAULT_MAX_EXPONENT = 1.5
+DEFAULT_MIN_MS = 2.0
+# A size this far over budget is not re-run at larger sizes
+ABORT_FACTOR = 20
+
+
+# ── Seeds from the fixture corpus ───────────────────────────────────
+
+@dataclass
+class Seeds:
+    pages: list[str]
+    # (label text, unit text) as printed, one per nutrient found in the corpus
+    labels: list[tuple[str, str]]
+
+
+def load_seeds(corpus_path: Path) -> Seeds:
+    with corpus_path.open('r', encoding='utf-8') as handle:
+        corpus = [json.loads(line) for line in handle if line.strip()]
+    pages = [entry['text'] for entry in corpus if entry['kind'] != 'separator' and entry['text']]
+    labels: dict[str, tuple[str, str]] = {}
+    for text in pages:
+        deduped = deduplicate_text(text)
+        for key, (label, unit) in ALL_NUTRIENTS.items():
+            if key in labels:
+                continue
+            match = nutrient_regex(label, unit).search(deduped)
+            if match is None:
+                continue
+            printed = re.match(rf'(?:{label})', match.group(0), flags=re.IGNORECASE)
+            label_text = printed.group(0) if printed else match.group(0)
+            unit_text = match.group(0)[len(label_text):match.start(1) - match.start()].strip()
+            labels[key] = (label_text, unit_text)
+    return Seeds(pages=pages, labels=list(labels.values()))
+
+
+# ── Adversarial families ────────────────────────────────────────────
+
+def _double(text: str) -> str:
+    """Bold-doubling as pdfplumber renders it: spaces and periods stay single."""
+    return ''.join(ch if ch in ' .' else ch * 2 for ch in text)
+
+
+def _fill(unit: str, size: int) -> str:
+    return (unit * (size // max(len(unit), 1) + 1))[:size]
+
+
+def doubled_run(seeds: Seeds, size: int, rng: random.Random) -> str:
+    rows = [_double(f'{label} {unit} {rng.randint(1, 999)}.{rng.randint(0, 9)}') for label, unit in seeds.labels]
+    return _fill('\n'.join(rows) + '\n', size)
+
+
+def bridge_run(seeds: Seeds, size: int, rng: random.Random) -> str:
+    label, unit = rng.choice(seeds.labels)
+    head = _double(label)
+    tail = _double(f' {unit} 12.5')
+    return head + _fill(' .', max(size - len(head) - len(tail), 0)) + tail
+
+
+def missing_units(seeds: Seeds, size: int, rng: random.Random) -> str:
+    return _fill(' '.join(label for label, _ in seeds.labels) + ' ', size)
+
+
+def repeated_labels(seeds: Seeds, size: int, rng: random.Random) -> str:
+    return _fill(' '.join(f'{label} {unit}' for label, unit in seeds.labels) + ' ', size)
+
+
+def repeated_headers(seeds: Seeds, size: int, rng: random.Random) -> str:
+    return _fill('Tên tiếng Việt (Vietnamese): Gạo tẻ Tên tiếng Anh (English): Rice M ', size)
+
+
+def long_line(seeds: Seeds, size: int, rng: random.Random) -> str:
+    return _fill(rng.choice(seeds.pages).replace('\n', ' ') + ' ', size)
+
+
+def mutated_page(seeds: Seeds, size: int, rng: random.Random) -> str:
+    lines: list[str] = []
+    while sum(len(line) + 1 for line in lines) < size:
+        lines.extend(rng.choice(seeds.pages).split('\n'))
+        for _ in range(max(len(lines) // 8, 1)):
+            position = rng.randrange(len(lines))
+            line = lines[position]
+            mutation = rng.randrange(4)
+            if mutation == 0 and line:
+                start = rng.randrange(len(line))
+                end = min(len(line), start + rng.randint(4, 80))
+                lines[position] = line[:start] + _double(line[start:end]) + line[end:]
+            elif mutation == 1:
+                _, unit = rng.choice(seeds.labels)
+                lines[position] = line.replace(unit, '')
+            elif mutation == 2:
+                lines.insert(position, line)
+            else:
+                label, _ = rng.choice(seeds.labels)
+                lines[position] = f'{line} {label}'
+    return '\n'.join(lines)[:size]
+
+
+FAMILIES: dict[str, Callable[[Seeds, int, random.Random], str]] = {
+    'doubled_run': doubled_run,
+    'bridge_run': bridge_run,
+    'missing_units': missing_units,
+    'repeated_labels': repeated_labels,
+    'repeated_headers': repeated_headers,
+    'long_line': long_line,
+    'mutated_page': mutated_page,
+}
+RANDOM_FAMILIES = frozenset({'mutated_page'})
+
+
+# ── Parser functions under test ─────────────────────────────────────
+
+def _all_values(text: str) -> list[float | None]:
+    return [extract_value(text, label, unit) for label, unit in ALL_NUTRIENTS.values()]
+
+
+def _numeric_tokens(text: str) -> list[float | None]:
+    return [parse_numeric(token) for token in text.split()]
+
+
+FUNCTIONS: dict[str, Callable[[str], Any]] = {
+    'deduplicate_text': deduplicate_text,
+    'extract_header': extract_header,
+    'extract_value': _all_values,
+    'nutrient_signals': lambda text: nutrient_signals(text, text),
+    'extract_record': lambda text: extract_record(text, 1),
+    'tcvn3_to_vietnamese': tcvn3_to_vietnamese,
+    'parse_ocr_header': parse_ocr_header,
+    'parse_numeric': _numeric_tokens,
+}
+
+
+def check_properties(name: str, text: str, output: Any) -> str | None:
+    if name == 'deduplicate_text' and len(output) > len(text):
+        return f'output longer than input ({len(output)} > {len(text)})'
+    if name == 'extract_value':
+        bad = [value for value in output if value is not None and not math.isfinite(value)]
+        if bad:
+            return f'non-finite values {bad[:3]}'
+    return None
+
+
+# ── Measurement ─────────────────────────────────────────────────────
+
+@dataclass
+class Measurement:
+    function: str
+    family: str
+    size: int
+    seed: int
+    ms: float
+
+
+@dataclass
+class Finding:
+    function: str
+    family: str
+    size: int
+    seed: int
+    kind: str  # budget | scaling | crash | property
+    detail: str
+
+
+def time_call(function: Callable[[str], Any], text: str, repeats: int) -> tuple[float, Any]:
+    best = math.inf
+    output = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        output = function(text)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, output
+
+
+def scaling_exponent(small: Measurement, large: Measurement) -> float:
+    if small.ms <= 0 or large.size == small.size:
+        return 0.0
+    return math.log(max(large.ms, 1e-6) / small.ms) / math.log(large.size / small.size)
+
+
+def sizes_between(min_chars: int, max_chars: int) -> list[int]:
+    sizes = [min_chars]
+    while sizes[-1] * 2 <= max_chars:
+        sizes.append(sizes[-1] * 2)
+    return sizes
+
+
+def run_pair(
+    seeds: Seeds,
+    function_name: str,
+    family: str,
+    sizes: list[int],
+    repeats: int,
+    samples: int,
+    budget_ms: float,
+    budget_chars: int,
+    seed: int,
+) -> tuple[list[Measurement], list[Finding]]:
+    """Worst time per size for one function on one family, stopping early when far over budget."""
+    function = FUNCTIONS[function_name]
+    measurements: list[Measurement] = []
+    findings: list[Finding] = []
+    for size in sizes:
+        worst: Measurement | None = None
+        for sample in range(samples if family in RANDOM_FAMILIES else 1):
+            case_seed = seed + sample
+            text = FAMILIES[family](seeds, size, random.Random(case_seed))
+            try:
+                ms, output = time_call(function, text, repeats)
+            except Exception as exc:  # noqa: BLE001 — any crash is a finding
+                findings.append(Finding(function_name, family, size, case_seed, 'crash', repr(exc)))
+                continue
+            problem = check_properties(function_name, text, output)
+            if problem is not None:
+                findings.append(Finding(function_name, family, size, case_seed, 'property', problem))
+            if worst is None or ms > worst.ms:
+                worst = Measurement(function_name, family, size, case_seed, ms)
+        if worst is None:
+            break
+        measurements.append(worst)
+        if size <= budget_chars and worst.ms > budget_ms:
+            findings.append(Finding(
+                function_name, family, size, worst.seed, 'budget',
+                f'{worst.ms:.1f} ms > {budget_ms:.0f} ms budget at {size:,} chars',
+            ))
+        if worst.ms > budget_ms * ABORT_FACTOR:
+            break
+    return measurements, findings
+
+
+def scaling_findings(
+    seeds: Seeds,
+    measurements: list[Measurement],
+    repeats: int,
+    max_exponent: float,
+    min_ms: float,
+) -> list[Finding]:
+    """Growth between the two largest sizes; a steep pair is re-timed before it counts."""
+    if len(measurements) < 2:
+        return []
+    small, large = measurements[-2], measurements[-1]
+    if large.ms < min_ms or scaling_exponent(small, large) <= max_exponent:
+        return []
+    # Single slow runs (GC, scheduler) make a two-point slope noisy
+    function = FUNCTIONS[large.function]
+    retimed = [
+        Measurement(
+            item.function,
+            item.family,
+            item.size,
+            item.seed,
+            time_call(function, FAMILIES[item.family](seeds, item.size, random.Random(item.seed)), repeats * 3)[0],
+        )
+        for item in (small, large)
+    ]
+    small, large = retimed
+    exponent = scaling_exponent(small, large)
+    if large.ms < min_ms or exponent <= max_exponent:
+        return []
+    return [Finding(
+        large.function, large.family, large.size, large.seed, 'scaling',
+        f'time ∝ size^{exponent:.2f} ({small.ms:.1f} ms at {small.size:,} → '
+        f'{large.ms:.1f} ms at {large.size:,} chars)',
+    )]
+
+
+# ── Regression cases ────────────────────────────────────────────────
+
+def load_cases(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with path.open('r', encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def replay_cases(
+    seeds: Seeds,
+    cases: list[dict[str, Any]],
+    repeats: int,
+    budget_ms: float,
+) -> list[Finding]:
+    findings: list[Finding] = []
+    for case in cases:
+        text = FAMILIES[case['family']](seeds, case['size'], random.Random(case['seed']))
+        ms, _ = time_call(FUNCTIONS[case['function']], text, repeats)
+        budget = case.get('budget_ms', budget_ms)
+        if ms > budget:
+            findings.append(Finding(
+                case['function'], case['family'], case['size'], case['seed'], 'budget',
+                f"regression case: {ms:.1f} ms > {budget:.0f} ms ({case.get('note', '')})",
+            ))
+    return findings
+
+
+def record_cases(path: Path, findings: list[Finding], budget_ms: float) -> int:
+    """Append the smallest slow input of each (function, family) not yet recorded."""
+    existing = {(case['function'], case['family']) for case in load_cases(path)}
+    smallest: dict[tuple[str, str], Finding] = {}
+    for finding in findings:
+        key = (finding.function, finding.family)
+        if finding.kind not in ('budget', 'scaling') or key in existing:
+            continue
+        if key not in smallest or finding.size < smallest[key].size:
+            smallest[key] = finding
+    with path.open('a', encoding='utf-8') as handle:
+        for finding in smallest.values():
+            case = {
+                'function': finding.function,
+                'family': finding.family,
+                'size': finding.size,
+                'seed': finding.seed,
+                'budget_ms': budget_ms,
+                'note': finding.detail,
+            }
+            handle.write(json.dumps(case, ensure_ascii=False) + '\n')
+    return len(smallest)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Fuzz the page parsers with adversarial texts; fail on slow or super-linear calls.',
+    )
+    parser.add_argument('--corpus', default=str(DEFAULT_CORPUS), help='Page-text fixture corpus (seed material).')
+    parser.add_argument('--cases', default=str(DEFAULT_CASES), help='Regression cases replayed on every run.')
+    parser.add_argument(
+        '--function',
+        dest='functions',
+        action='append',
+        choices=sorted(FUNCTIONS),
+        help='Only this parser function (repeatable).',
+    )
+    parser.add_argument(
+        '--family',
+        dest='families',
+        action='append',
+        choices=sorted(FAMILIES),
+        help='Only this input family (repeatable).',
+    )
+    parser.add_argument('--min-chars', type=int, default=DEFAULT_MIN_CHARS, help='Smallest input size.')
+    parser.add_argument(
+        '--max-chars',
+        type=int,
+        default=DEFAULT_MAX_CHARS,
+        help='Largest input size (sizes double from --min-chars).',
+    )
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='Per-call time budget.')
+    parser.add_argument(
+        '--budget-chars',
+        type=int,
+        default=DEFAULT_BUDGET_CHARS,
+        help='Largest input held to --budget-ms (larger ones only count for scaling).',
+    )
+    parser.add_argument(
+        '--max-exponent',
+        type=float,
+        default=DEFAULT_MAX_EXPONENT,
+        help='Fail when time grows faster than size^N between the two largest sizes.',
+    )
+    parser.add_argument(
+        '--min-ms',
+        type=float,
+        default=DEFAULT_MIN_MS,
+        help='Ignore scaling below this many ms at the largest size.',
+    )
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per input (best is kept).')
+    parser.add_argument('--samples', type=int, default=8, help='Random inputs per size for mutated_page.')
+    parser.add_argument('--seed', type=int, default=2007, help='Seed for the generators.')
+    parser.add_argument('--record', action='store_true', help='Append budget/scaling failures to --cases.')
+    parser.add_argument('--output', default=None, help='Write measurements and findings as JSON.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    seeds = load_seeds(Path(args.corpus))
+    functions = args.functions or list(FUNCTIONS)
+    families = args.families or list(FAMILIES)
+    sizes = sizes_between(args.min_chars, args.max_chars)
+    print(
+        f'{len(functions)} functions × {len(families)} families, sizes {sizes[0]:,}–{sizes[-1]:,} chars, '
+        f'budget {args.budget_ms:.0f} ms up to {args.budget_chars:,} chars, max exponent {args.max_exponent}'
+    )
+
+    measurements: list[Measurement] = []
+    findings: list[Finding] = []
+    print(f"  {'function':22s} {'family':18s} {'worst ms':>9s} {'at chars':>9s} {'exponent':>8s}")
+    for function_name in functions:
+        for family in families:
+            pair, pair_findings = run_pair(
+                seeds,
+                function_name,
+                family,
+                sizes,
+                args.repeats,
+                args.samples,
+                args.budget_ms,
+                args.budget_chars,
+                args.seed,
+            )
+            pair_findings += scaling_findings(seeds, pair, args.repeats, args.max_exponent, args.min_ms)
+            measurements += pair
+            findings += pair_findings
+            if not pair:
+                continue
+            exponent = scaling_exponent(pair[-2], pair[-1]) if len(pair) > 1 else 0.0
+            flag = '  FAIL' if pair_findings else ''
+            print(
+                f'  {function_name:22s} {family:18s} {pair[-1].ms:9.2f} '
+                f'{pair[-1].size:9,} {exponent:8.2f}{flag}'
+            )
+
+    cases_path = Path(args.cases)
+    cases = load_cases(cases_path)
+    findings += replay_cases(seeds, cases, args.repeats, args.budget_ms)
+    print(f'Regression cases replayed: {len(cases)}')
+
+    if args.output:
+        with Path(args.output).open('w', encoding='utf-8') as handle:
+            json.dump(
+                {
+                    'measurements': [asdict(item) for item in measurements],
+                    'findings': [asdict(item) for item in findings],
+                },
+                handle,
+                ensure_ascii=False,
+                indent=2,
+            )
+    if args.record and findings:
+        print(f'Recorded {record_cases(cases_path, findings, args.budget_ms)} new case(s) → {cases_path}')
+
+    print(f'Findings: {len(findings)}')
+    for finding in findings:
+        print(f'  [{finding.kind}] {finding.function} / {finding.family} (seed {finding.seed}): {finding.detail}')
+    if findings:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
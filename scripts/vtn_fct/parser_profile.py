@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""Versioned parser profile, with field-level re-evaluation over cached pages.
+
+The header and nutrient patterns live in `data/vtn_fct_2007/parser_profile.json`
+(VTN_FCT_PARSER_PROFILE to use another file):
+
+    {"version": 1,
+     "header": {"vietnamese": {"pattern": …, "ignore_case": true}, "english": …, "edible": …},
+     "nutrients": {"iron_mg": {"label": "\\\\(Iron\\\\)", "unit": "mg"}, …}}
+
+Nutrient field names include the measurement unit as a suffix; the label
+regex matches the English label of the PDF nutrient table and the unit
+regex its unit column (null: the value follows the label directly).
+
+Every extraction run also writes `parse_state.jsonl`: one line per food page
+with the raw text, the deduplicated text and the header groups, under a
+header line holding a fingerprint of every field's patterns and the SHA-256
+of the records it produced. `--apply` compares the fingerprints with the
+current profile and re-evaluates only the changed fields:
+
+- nutrient changed / added   value re-read from the cached deduplicated text
+- nutrient removed           dropped from every record
+- header changed             header groups re-read from the cached text; names,
+                             state and id of a record are patched when they
+                             still equal what the old groups produced (OCR
+                             repairs are kept). A page that gains or loses its
+                             record needs a full extraction and is reported.
+
+and patches `extracted_ingredients.{json,csv}` in place, printing the
+coverage delta per changed field. `--watch` does the same on every save.
+
+Usage:
+    python3 scripts/vtn_fct/parser_profile.py                 # show the profile
+    python3 scripts/vtn_fct/parser_profile.py --apply [--dry-run]
+    python3 scripts/vtn_fct/parser_profile.py --watch
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / 'data' / 'vtn_fct_2007'
+DEFAULT_PROFILE_PATH = DATA_DIR / 'parser_profile.json'
+PARSE_STATE_FILE = 'parse_state.jsonl'
+HEADER_FIELDS = ('vietnamese', 'english', 'edible')
+WATCH_POLL_S = 0.5
+
+HeaderGroups = tuple[str, str, str, int | None, float | None]
+
+
+def profile_path() -> Path:
+    configured = os.environ.get('VTN_FCT_PARSER_PROFILE')
+    return Path(configured) if configured else DEFAULT_PROFILE_PATH
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class ParserProfile:
+    version: int
+    header: dict[str, tuple[str, bool]]  # name → (pattern, ignore_case)
+    nutrients: dict[str, tuple[str, str | None]]  # field → (label regex, unit regex)
+    sha256: str
+
+    def header_regex(self, name: str) -> re.Pattern[str]:
+        pattern, ignore_case = self.header[name]
+        return re.compile(pattern, flags=re.IGNORECASE if ignore_case else 0)
+
+    @cached_property
+    def fingerprints(self) -> dict[str, str]:
+        """'header' / 'nutrient:<field>' → fingerprint of the patterns."""
+        fingerprints = {'header': _fingerprint(self.header)}
+        fingerprints.update({f'nutrient:{key}': _fingerprint(value) for key, value in self.nutrients.items()})
+        return fingerprints
+
+
+def load_profile(path: Path | None = None) -> ParserProfile:
+    """Read and validate a profile; ValueError names the broken entry."""
+    path = path or profile_path()
+    raw = path.read_bytes()
+    data = json.loads(raw)
+    missing = [name for name in HEADER_FIELDS if name not in data.get('header', {})]
+    if missing:
+        raise ValueError(f"{path}: header patterns missing: {', '.join(missing)}")
+    header = {
+        name: (entry['pattern'], bool(entry.get('ignore_case', False)))
+        for name, entry in data['header'].items()
+    }
+    nutrients = {key: (entry['label'], entry.get('unit')) for key, entry in data['nutrients'].items()}
+    for name, pattern in [
+        *((f'header.{name}', pattern) for name, (pattern, _) in header.items()),
+        *((f'nutrients.{key}', rf'(?:{label}).*?(?:{unit or ""})') for key, (label, unit) in nutrients.items()),
+    ]:
+        try:
+            re.compile(pattern)
+        except re.error as error:
+            raise ValueError(f'{path}: {name}: {error}') from error
+    return ParserProfile(int(data['version']), header, nutrients, hashlib.sha256(raw).hexdigest())
+
+
+# ── Parse state ─────────────────────────────────────────────────────
+
+def records_digest(json_path: Path) -> str:
+    return hashlib.sha256(json_path.read_bytes()).hexdigest()
+
+
+def write_parse_state(
+    path: Path,
+    profile: ParserProfile,
+    entries: list[dict[str, Any]],
+    records_sha256: str,
+) -> None:
+    """Header line (profile fingerprints + records digest), then one line per page."""
+    partial = path.with_suffix('.tmp')
+    with partial.open('w', encoding='utf-8') as handle:
+        header = {
+            'profile_version': profile.version,
+            'profile_sha256': profile.sha256,
+            'fingerprints': profile.fingerprints,
+            'records_sha256': records_sha256,
+        }
+        handle.write(json.dumps(header, ensure_ascii=False) + '\n')
+        for entry in entries:
+            handle.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    partial.replace(path)
+
+
+def read_parse_state(path: Path) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    with path.open('r', encoding='utf-8') as handle:
+        header = json.loads(next(handle))
+        return header, [json.loads(line) for line in handle]
+
+
+# ── Field-level re-evaluation ───────────────────────────────────────
+
+def changed_fields(old: dict[str, str], new: ParserProfile) -> tuple[list[str], list[str], bool]:
+    """(nutrients changed or added, nutrients removed, header changed)."""
+    changed = [key for key in new.nutrients if old.get(f'nutrient:{key}') != new.fingerprints[f'nutrient:{key}']]
+    removed = [
+        name.split(':', 1)[1]
+        for name in old
+        if name.startswith('nutrient:') and name.split(':', 1)[1] not in new.nutrients
+    ]
+    return changed, removed, old.get('header') != new.fingerprints['header']
+
+
+def coverage(records: list[dict[str, Any]], keys: list[str]) -> dict[str, int]:
+    return {key: sum(1 for record in records if record['per_100g'].get(key) is not None) for key in keys}
+
+
+def _header_fields(groups: HeaderGroups | None) -> dict[str, Any] | None:
+    """The record fields extraction derives from header groups (names, state, id)."""
+    if groups is None:
+        return None
+    from extract_vtn_fct_2007 import header_record_fields, repair_name_encoding
+
+    fields = header_record_fields(tuple(groups))
+    repair_name_encoding(fields)
+    return {key: value for key, value in fields.items() if not key.startswith('_')}
+
+
+def reevaluate(data_dir: Path, profile: ParserProfile, write: bool = True) -> dict[str, Any]:
+    """Patch the stored records for the fields whose patterns changed since extraction."""
+    from extract_vtn_fct_2007 import extract_header, extract_value, write_record_files
+
+    state_path = data_dir / PARSE_STATE_FILE
+    json_path = data_dir / 'extracted_ingredients.json'
+    if not state_path.exists():
+        raise FileNotFoundError(f'{state_path} not found: run extract_vtn_fct_2007.py first')
+    state, entries = read_parse_state(state_path)
+    if records_digest(json_path) != state['records_sha256']:
+        raise ValueError(
+            f'{json_path} changed since {state_path} was written; re-run extract_vtn_fct_2007.py'
+        )
+    with json_path.open('r', encoding='utf-8') as handle:
+        records: list[dict[str, Any]] = json.load(handle)
+
+    started = time.perf_counter()
+    changed, removed, header_changed = changed_fields(state['fingerprints'], profile)
+    before = coverage(records, [*changed, *removed])
+
+    for entry in entries:
+        position = entry['record']
+        if position is None:
+            continue
+        per_100g = records[position]['per_100g']
+        for key in changed:
+            per_100g[key] = extract_value(entry['deduped'], *profile.nutrients[key])
+        for key in removed:
+            per_100g.pop(key, None)
+        if changed or removed:
+            records[position]['per_100g'] = {key: per_100g.get(key) for key in profile.nutrients}
+
+    headers = {'patched': 0, 'kept': 0, 'membership_changes': []}
+    if header_changed:
+        for entry in entries:
+            groups = extract_header(entry['text'], profile)
+            old_groups = tuple(entry['header']) if entry['header'] is not None else None
+            if groups == old_groups:
+                continue
+            entry['header'] = groups
+            position = entry['record']
+            if position is None or groups is None:
+                headers['membership_changes'].append(entry['page'])
+                continue
+            record = records[position]
+            previous = _header_fields(old_groups)
+            if previous is not None and all(record[key] == value for key, value in previous.items()):
+                record.update(_header_fields(groups))
+                headers['patched'] += 1
+            else:
+                headers['kept'] += 1  # header came from the OCR fallback
+
+    after = coverage(records, [*changed, *removed])
+    summary = {
+        'profile_version': profile.version,
+        'from_version': state['profile_version'],
+        'changed': changed,
+        'removed': removed,
+        'header_changed': header_changed,
+        'records': len(records),
+        'pages': len(entries),
+        'coverage': {key: (before[key], after[key]) for key in before},
+        'headers': headers,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    if write and (changed or removed or header_changed):
+        write_record_files(records, data_dir, list(profile.nutrients))
+        if headers['patched']:
+            # Patched names can change record ids
+            page_index = {records[entry['record']]['id']: entry['page'] for entry in entries if entry['record'] is not None}
+            with (data_dir / 'page_index.json').open('w', encoding='utf-8') as handle:
+                json.dump(page_index, handle, ensure_ascii=False, indent=2)
+        write_parse_state(state_path, profile, entries, records_digest(json_path))
+
+        from dataset_store import record_dataset_version
+
+        record_dataset_version(records, data_dir, f'parser_profile.py re-evaluation (profile v{profile.version})')
+    return summary
+
+
+def print_summary(summary: dict[str, Any]) -> None:
+    if not (summary['changed'] or summary['removed'] or summary['header_changed']):
+        print(f"Profile v{summary['profile_version']}: no field changed since extraction")
+        return
+    print(
+        f"Profile v{summary['from_version']} → v{summary['profile_version']}: "
+        f"{len(summary['changed'])} changed, {len(summary['removed'])} removed"
+        f"{', header changed' if summary['header_changed'] else ''} "
+        f"({summary['pages']} cached pages, {summary['seconds']:.3f}s)"
+    )
+    total = summary['records']
+    for key, (before, after) in summary['coverage'].items():
+        note = ' (removed)' if key in summary['removed'] else ''
+        print(f'  {key:24s} {before:5d} → {after:5d}/{total}  ({after - before:+d}){note}')
+    headers = summary['headers']
+    if summary['header_changed']:
+        print(f"  header: {headers['patched']} records patched, {headers['kept']} kept (OCR header)")
+    if headers['membership_changes']:
+        pages = ', '.join(map(str, headers['membership_changes'][:10]))
+        print(f"  {len(headers['membership_changes'])} pages gain/lose a record ({pages} …): "
+              'run extract_vtn_fct_2007.py for those')
+
+
+def watch(data_dir: Path, path: Path, write: bool) -> None:
+    print(f'Watching {path} (Ctrl-C to stop)')
+    seen = None
+    while True:
+        try:
+            stat = path.stat()
+            current = (stat.st_mtime_ns, stat.st_size)
+            if current != seen:
+                seen = current
+                try:
+                    print_summary(reevaluate(data_dir, load_profile(path), write))
+                except (ValueError, KeyError, json.JSONDecodeError) as error:
+                    print(f'Profile not applied: {error}')
+            time.sleep(WATCH_POLL_S)
+        except KeyboardInterrupt:
+            return
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Show the parser profile or re-evaluate the fields it changed.',
+    )
+    parser.add_argument('--profile', default=None, help='Profile file (default: $VTN_FCT_PARSER_PROFILE or data/).')
+    parser.add_argument('--data-dir', default=str(DATA_DIR), help='Extraction outputs with parse_state.jsonl.')
+    parser.add_argument('--apply', action='store_true', help='Re-evaluate changed fields and patch the records.')
+    parser.add_argument('--watch', action='store_true', help='Re-evaluate every time the profile is saved.')
+    parser.add_argument('--dry-run', action='store_true', help='Print coverage deltas without writing.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    path = Path(args.profile) if args.profile else profile_path()
+    data_dir = Path(args.data_dir)
+
+    if args.watch:
+        watch(data_dir, path, not args.dry_run)
+        return
+    if args.apply or args.dry_run:
+        print_summary(reevaluate(data_dir, load_profile(path), not args.dry_run))
+        return
+
+    profile = load_profile(path)
+    print(f'{path}: version {profile.version}, sha256 {profile.sha256[:16]}')
+    print(f"  header: {', '.join(profile.header)}")
+    print(f'  nutrients ({len(profile.nutrients)}): {", ".join(profile.nutrients)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Pipelined extraction: OCR header repairs overlapped with text extraction.
+
+The serial `run_extraction` stops on every suspicious header to render the
+page and OCR it (pdftoppm + tesseract, seconds per page) before reading
+the next page. Here text extraction is the producer: records that need an
+OCR repair are put on an asyncio queue and `concurrency` workers run
+pdftoppm / tesseract as subprocesses while pdfplumber keeps reading pages.
+
+Repairs are merged back by page number once every page is read, and each
+record then goes through the same apply_ocr_header / repair_name_encoding
+steps as the serial run, so the output is identical. The OCR subprocesses
+use the same DPI, crop and language as `extract_ocr_header`.
+
+`ExtractionResult.pipeline` (written to extraction_report.json) reports:
+- text_extraction_s  time until the last page was read
+- ocr_busy_s         summed OCR task time (what the serial run would add)
+- ocr_wall_s         wall time with at least one OCR task running
+- ocr_overlapped_s   part of ocr_wall_s spent while pages were still read
+- ocr_drain_s        wait for the last OCR tasks after the last page
+
+Usage:
+    python3 scripts/vtn_fct/extract_vtn_fct_2007.py --ocr-header-fallback --pipelined
+    python3 scripts/vtn_fct/pipelined_extraction.py --pdf "VTN FCT 2007.pdf" --check
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from extract_vtn_fct_2007 import (
+    OCR_DPI,
+    OCR_LANG,
+    ExtractionResult,
+    apply_ocr_header,
+    crop_header,
+    dump_page_text,
+    needs_ocr_header_fix,
+    parse_ocr_header,
+    parse_page,
+    read_page_text,
+    repair_name_encoding,
+    run_extraction,
+)
+from page_text_cache import PageTextCache
+from text_backends import BACKENDS, DEFAULT_BACKEND, open_backend
+
+if TYPE_CHECKING:
+    from extraction_progress import ExtractionProgress
+
+DEFAULT_CONCURRENCY = 2
+PDFTOPPM = 'pdftoppm'
+TESSERACT = 'tesseract'
+
+OcrHeader = tuple[str, str, str, int | None, float | None]
+
+
+# ── OCR subprocesses ────────────────────────────────────────────────
+
+def _crop_to_png(ppm_path: Path, png_path: Path) -> bool:
+    from PIL import Image
+
+    if not ppm_path.exists():
+        return False
+    with Image.open(ppm_path) as image:
+        crop_header(image).save(png_path)
+    return True
+
+
+async def ocr_header_subprocess(pdf_path: Path, page_number: int) -> OcrHeader | None:
+    """`extract_ocr_header` as awaitable subprocesses (render → crop → tesseract)."""
+    with tempfile.TemporaryDirectory(prefix='vtn_ocr_') as tmp:
+        prefix = Path(tmp) / 'page'
+        render = await asyncio.create_subprocess_exec(
+            PDFTOPPM, '-r', str(OCR_DPI), '-f', str(page_number), '-l', str(page_number),
+            '-singlefile', str(pdf_path), str(prefix),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        if await render.wait() != 0:
+            return None  # as extract_ocr_header: an unrenderable page is not repaired
+
+        png_path = Path(tmp) / 'header.png'
+        if not await asyncio.to_thread(_crop_to_png, prefix.with_suffix('.ppm'), png_path):
+            return None
+
+        ocr = await asyncio.create_subprocess_exec(
+            TESSERACT, str(png_path), 'stdout', '-l', OCR_LANG,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await ocr.communicate()
+        if ocr.returncode != 0:
+            raise RuntimeError(
+                f'tesseract failed on page {page_number}: {stderr.decode("utf-8", "replace").strip()}'
+            )
+        return parse_ocr_header(stdout.decode('utf-8'))
+
+
+async def _ocr_worker(
+    pdf_path: Path,
+    queue: asyncio.Queue[int | None],
+    repairs: dict[int, OcrHeader | None],
+    intervals: list[tuple[float, float]],
+    progress: ExtractionProgress | None,
+) -> None:
+    while True:
+        page_number = await queue.get()
+        if page_number is None:
+            return
+        started = time.perf_counter()
+        try:
+            repairs[page_number] = await ocr_header_subprocess(pdf_path, page_number)
+        finally:
+            finished = time.perf_counter()
+            intervals.append((started, finished))
+            if progress is not None:
+                progress.ocr_finished(finished - started)
+
+
+# ── Timing report ───────────────────────────────────────────────────
+
+def _union(intervals: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    merged: list[list[float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def overlap_report(
+    started: float,
+    text_done: float,
+    finished: float,
+    intervals: list[tuple[float, float]],
+    concurrency: int,
+    repaired: int,
+) -> dict[str, Any]:
+    union = _union(intervals)
+    overlapped = sum(max(0.0, min(end, text_done) - start) for start, end in union)
+    ocr_wall = sum(end - start for start, end in union)
+    return {
+        'mode': 'pipelined',
+        'ocr_concurrency': concurrency,
+        'ocr_pages': len(intervals),
+        'ocr_repaired': repaired,
+        'wall_s': round(finished - started, 3),
+        'text_extraction_s': round(text_done - started, 3),
+        'ocr_busy_s': round(sum(end - start for start, end in intervals), 3),
+        'ocr_wall_s': round(ocr_wall, 3),
+        'ocr_overlapped_s': round(overlapped, 3),
+        'ocr_drain_s': round(finished - text_done, 3),
+    }
+
+
+# ── Pipeline ────────────────────────────────────────────────────────
+
+async def _run_pipelined(
+    pdf_path: Path,
+    ocr_header_fallback: bool,
+    dump_page: int | None,
+    page_cache: PageTextCache | None,
+    concurrency: int,
+    backend: str,
+    progress: ExtractionProgress | None,
+    keep_parse_state: bool,
+) -> ExtractionResult:
+    started = time.perf_counter()
+    records: list[dict[str, Any]] = []
+    skipped_pages: list[int] = []
+    parse_errors: list[dict[str, Any]] = []
+    repairs: dict[int, OcrHeader | None] = {}
+    intervals: list[tuple[float, float]] = []
+    parse_state: list[dict[str, Any]] | None = [] if keep_parse_state else None
+
+    queue: asyncio.Queue[int | None] = asyncio.Queue()
+    workers = [
+        asyncio.create_task(_ocr_worker(pdf_path, queue, repairs, intervals, progress))
+        for _ in range(concurrency if ocr_header_fallback else 0)
+    ]
+
+    try:
+        with open_backend(backend, pdf_path) as source:
+            if progress is not None:
+                progress.begin(source.page_count, 'pipelined', len(workers))
+            for page_index in range(1, source.page_count + 1):
+                # Read in a thread so workers can start the next subprocess meanwhile
+                text = await asyncio.to_thread(read_page_text, source, page_index, page_cache)
+                if dump_page is not None and page_index == dump_page:
+                    dump_page_text(page_index, text)
+
+                record = parse_page(text, page_index, skipped_pages, parse_errors, parse_state)
+                if record is not None:
+                    if ocr_header_fallback and needs_ocr_header_fix(record):
+                        queue.put_nowait(page_index)
+                        if progress is not None:
+                            progress.ocr_queued()
+                    records.append(record)
+                if progress is not None:
+                    progress.page_done(len(records), len(skipped_pages), len(parse_errors))
+        text_done = time.perf_counter()
+
+        for _ in workers:
+            queue.put_nowait(None)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+    finished = time.perf_counter()
+
+    # Merge back by page, then finish every record exactly as run_extraction does
+    for record in records:
+        ocr_header = repairs.get(record['_source_page'])
+        if ocr_header is not None:
+            apply_ocr_header(record, ocr_header)
+        repair_name_encoding(record)
+
+    return ExtractionResult(
+        records=records,
+        skipped_pages=skipped_pages,
+        parse_errors=parse_errors,
+        pipeline=overlap_report(
+            started,
+            text_done,
+            finished,
+            intervals,
+            concurrency,
+            sum(1 for header in repairs.values() if header is not None),
+        ),
+        parse_state=parse_state or [],
+    )
+
+
+def run_extraction_pipelined(
+    pdf_path: Path,
+    ocr_header_fallback: bool,
+    dump_page: int | None = None,
+    page_cache: PageTextCache | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    backend: str = DEFAULT_BACKEND,
+    progress: ExtractionProgress | None = None,
+    keep_parse_state: bool = False,
+) -> ExtractionResult:
+    if concurrency < 1:
+        raise ValueError('OCR concurrency must be at least 1')
+    if ocr_header_fallback:
+        for tool in (PDFTOPPM, TESSERACT):
+            if shutil.which(tool) is None:
+                raise FileNotFoundError(f'{tool} not found on PATH (needed for --ocr-header-fallback)')
+    return asyncio.run(
+        _run_pipelined(
+            pdf_path,
+            ocr_header_fallback,
+            dump_page,
+            page_cache,
+            concurrency,
+            backend,
+            progress,
+            keep_parse_state,
+        )
+    )
+
+
+# ── Serial comparison ───────────────────────────────────────────────
+
+def result_differences(serial: ExtractionResult, pipelined: ExtractionResult) -> list[str]:
+    """Human-readable differences (empty = identical output)."""
+    differences: list[str] = []
+    if serial.skipped_pages != pipelined.skipped_pages:
+        differences.append('skipped pages differ')
+    if serial.parse_errors != pipelined.parse_errors:
+        differences.append('parse errors differ')
+    if len(serial.records) != len(pipelined.records):
+        differences.append(f'{len(serial.records)} serial vs {len(pipelined.records)} pipelined records')
+    for expected, actual in zip(serial.records, pipelined.records):
+        if expected != actual:
+            differences.append(f"page {expected['_source_page']}: record differs ({expected['id']})")
+    return differences
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Run extraction with OCR repairs overlapped with text extraction.',
+    )
+    parser.add_argument('--pdf', default='VTN FCT 2007.pdf', help='Path to the source PDF.')
+    parser.add_argument(
+        '--ocr-concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help='Pages OCRed at the same time.',
+    )
+    parser.add_argument(
+        '--backend',
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help='Page-text extractor (see text_backends.py).',
+    )
+    parser.add_argument(
+        '--no-ocr',
+        action='store_true',
+        help='Text extraction only (no --ocr-header-fallback).',
+    )
+    parser.add_argument(
+        '--page-cache',
+        default=None,
+        help='Directory for cached page texts (shared with extract_vtn_fct_2007.py).',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Also run the serial extraction and fail (exit 1) unless outputs are identical.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    pdf_path = Path(args.pdf)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f'PDF not found: {pdf_path}')
+    page_cache = (
+        PageTextCache(Path(args.page_cache), pdf_path, args.backend) if args.page_cache else None
+    )
+    ocr = not args.no_ocr
+
+    result = run_extraction_pipelined(
+        pdf_path,
+        ocr_header_fallback=ocr,
+        page_cache=page_cache,
+        concurrency=args.ocr_concurrency,
+        backend=args.backend,
+    )
+    print(f'Extracted records: {len(result.records)}')
+    print(json.dumps(result.pipeline, indent=2))
+
+    if args.check:
+        started = time.perf_counter()
+        serial = run_extraction(
+            pdf_path, ocr_header_fallback=ocr, page_cache=page_cache, backend=args.backend,
+        )
+        print(f'Serial run: {time.perf_counter() - started:.3f}s')
+        differences = result_differences(serial, result)
+        for difference in differences[:20]:
+            print(f'FAIL {difference}')
+        if differences:
+            raise SystemExit(1)
+        print('Pipelined output identical to serial: OK')
+
+
+if __name__ == '__main__':
+    main()
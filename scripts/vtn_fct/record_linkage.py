@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""Blocked record linkage for merging food composition sources.
+
+Links records of several tables (later VTN FCT editions, other regional
+tables) that describe the same food, without comparing every pair.
+
+Blocking — a pair is only compared when it shares a block key:
+- ('code', food_code)       same food code (FAO ids, or a `food_code` field)
+- ('name', group, token)    same food group and folded-name token: adjacent
+                            syllable pairs of the Vietnamese name / alt names
+                            and English words (≥ 3 letters, no stop words)
+Blocks with more than `--max-block` records are dropped as uninformative
+(e.g. every raw fish sharing 'fish'); records left without any block are
+reported as uncovered.
+
+Scoring — pairs in the same state (and from different sources when more
+than one is given):
+- name       best pg_trgm similarity of the folded Vietnamese names and of
+             the English names (trigram_search.trigrams)
+- nutrient   exp(−RMS log-ratio over shared nutrients / 0.25), i.e. about
+             0.37 when values differ by ~25% on average; ignored below
+             `--min-shared` shared nutrients
+- score      0.6 · name + 0.4 · nutrient (name alone without nutrients),
+             + 0.1 when both carry the same food code
+Nutrient similarity is computed with NumPy over all candidate pairs first;
+name similarity only for pairs that can still reach `--threshold`.
+
+Clusters are grown greedily from the best links down and never hold two
+records of the same source. The canonical id is the member from the
+earliest `--source` (then the lowest id); members and accepted links are
+kept as provenance.
+
+Usage:
+    python3 scripts/vtn_fct/record_linkage.py --source data/vtn_fct_2007/extracted_ingredients.json \\
+        --source other_table.json --output clusters.json
+    python3 scripts/vtn_fct/record_linkage.py --bench --bench-size 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from enrich_extracted_data import FOOD_GROUPS, NUTRIENT_KEYS, get_food_code, get_group_prefix
+from nutrient_neighbors import DEFAULT_MIN_SHARED, nutrient_matrix, resolve_group
+from search_text import fold_ascii, unaccent
+from trigram_search import trigrams
+
+NAME_WEIGHT = 0.6
+NUTRIENT_WEIGHT = 0.4
+CODE_BONUS = 0.1
+NUTRIENT_TOLERANCE = 0.25
+DEFAULT_THRESHOLD = 0.75
+DEFAULT_MAX_BLOCK = 200
+PAIR_CHUNK = 1 << 20
+STOP_WORDS = frozenset({'and', 'the', 'with', 'raw', 'cooked', 'fresh', 'dried', 'boiled'})
+UNKNOWN_GROUP = '?'
+
+
+# ── Block keys ──────────────────────────────────────────────────────
+
+def food_code(record: dict[str, Any]) -> str | None:
+    if record.get('food_code'):
+        return str(record['food_code'])
+    if record['id'].startswith('fao_vn_'):
+        return get_food_code(record['id'])
+    return None
+
+
+def block_group(record: dict[str, Any]) -> str:
+    """Food group prefix from `type_en` / `food_group`, else the FAO food code."""
+    for key in ('food_group', 'type_en'):
+        if record.get(key):
+            try:
+                return resolve_group(str(record[key]))
+            except ValueError:
+                pass
+    code = food_code(record)
+    return get_group_prefix(code) if code and code.isdigit() else UNKNOWN_GROUP
+
+
+def _syllables(name: str) -> list[str]:
+    return ''.join(ch if ch.isalnum() else ' ' for ch in fold_ascii(name)).split()
+
+
+def name_tokens(record: dict[str, Any]) -> set[str]:
+    tokens: set[str] = set()
+    for name in [record.get('name_primary', ''), *record.get('name_alt', [])]:
+        words = _syllables(name)
+        tokens.update(f'{a} {b}' for a, b in zip(words, words[1:]))
+        if len(words) == 1:
+            tokens.add(words[0])
+    tokens.update(
+        word for word in _syllables(record.get('name_en', ''))
+        if len(word) >= 3 and word not in STOP_WORDS
+    )
+    return tokens
+
+
+def build_blocks(records: list[dict[str, Any]]) -> dict[tuple[str, ...], list[int]]:
+    blocks: dict[tuple[str, ...], list[int]] = {}
+    for row, record in enumerate(records):
+        code = food_code(record)
+        if code:
+            blocks.setdefault(('code', code), []).append(row)
+        group = block_group(record)
+        for token in name_tokens(record):
+            blocks.setdefault(('name', group, token), []).append(row)
+    return blocks
+
+
+def _size_stats(sizes: list[int]) -> dict[str, float]:
+    if not sizes:
+        return {'blocks': 0}
+    values = np.array(sizes)
+    return {
+        'blocks': len(sizes),
+        'records': int(values.sum()),
+        'mean': round(float(values.mean()), 2),
+        'p50': int(np.percentile(values, 50)),
+        'p99': int(np.percentile(values, 99)),
+        'max': int(values.max()),
+    }
+
+
+def candidate_pairs(
+    blocks: dict[tuple[str, ...], list[int]],
+    sources: np.ndarray,
+    max_block: int,
+    cross_source: bool,
+) -> tuple[np.ndarray, np.ndarray, dict[str, Any]]:
+    """Unique (left < right) row pairs sharing a usable block, plus block stats."""
+    rows = len(sources)
+    triangles: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    keys: list[np.ndarray] = []
+    covered = np.zeros(rows, dtype=bool)
+    sizes: dict[str, list[int]] = {'code': [], 'name': []}
+    dropped: dict[str, int] = {'code': 0, 'name': 0}
+    emitted = 0
+
+    for key, members in blocks.items():
+        size = len(members)
+        if size > max_block:
+            dropped[key[0]] += 1
+            continue
+        sizes[key[0]].append(size)
+        if size < 2:
+            continue
+        if size not in triangles:
+            triangles[size] = np.triu_indices(size, 1)
+        upper, lower = triangles[size]
+        members_array = np.array(members, dtype=np.int64)
+        left = members_array[upper]
+        right = members_array[lower]
+        if cross_source:
+            differ = sources[left] != sources[right]
+            left, right = left[differ], right[differ]
+        if len(left):
+            emitted += len(left)
+            covered[members_array] = True
+            keys.append(np.minimum(left, right) * rows + np.maximum(left, right))
+
+    unique = np.unique(np.concatenate(keys)) if keys else np.empty(0, dtype=np.int64)
+    stats = {
+        'code_blocks': _size_stats(sizes['code']),
+        'name_blocks': _size_stats(sizes['name']),
+        'dropped_blocks': dropped,
+        'uncovered_records': int(rows - covered.sum()),
+        'pair_emissions': emitted,
+        'candidate_pairs': int(len(unique)),
+    }
+    return unique // rows, unique % rows, stats
+
+
+# ── Pair scoring ────────────────────────────────────────────────────
+
+def _name_sets(record: dict[str, Any]) -> tuple[list[frozenset[str]], frozenset[str]]:
+    vietnamese = [
+        trigrams(fold_ascii(name))
+        for name in [record.get('name_primary', ''), *record.get('name_alt', [])]
+        if name
+    ]
+    return vietnamese, trigrams(fold_ascii(record.get('name_en', '')))
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def name_similarity(
+    left: tuple[list[frozenset[str]], frozenset[str]],
+    right: tuple[list[frozenset[str]], frozenset[str]],
+) -> float:
+    best = _jaccard(left[1], right[1])
+    for a in left[0]:
+        for b in right[0]:
+            best = max(best, _jaccard(a, b))
+    return best
+
+
+def nutrient_similarity(
+    matrix: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(similarity, shared nutrient count) per pair, in chunks of PAIR_CHUNK.
+
+    Differences are taken on log1p values, so they are relative: the same
+    food measured twice differs by a few percent whatever its magnitude.
+    """
+    present = ~np.isnan(matrix)
+    logged = np.where(present, np.log1p(np.maximum(np.nan_to_num(matrix), 0)), 0).astype(np.float32)
+    mask = present.astype(np.float32)
+
+    similarity = np.empty(len(left), dtype=np.float32)
+    shared = np.empty(len(left), dtype=np.int32)
+    for start in range(0, len(left), PAIR_CHUNK):
+        a = left[start:start + PAIR_CHUNK]
+        b = right[start:start + PAIR_CHUNK]
+        both = mask[a] * mask[b]
+        count = both.sum(axis=1)
+        diff = logged[a] - logged[b]
+        rms = np.sqrt((diff * diff * both).sum(axis=1) / np.maximum(count, 1))
+        similarity[start:start + len(a)] = np.exp(-rms / NUTRIENT_TOLERANCE)
+        shared[start:start + len(a)] = count
+    return similarity, shared
+
+
+def score_pairs(
+    records: list[dict[str, Any]],
+    left: np.ndarray,
+    right: np.ndarray,
+    threshold: float,
+    min_shared: int,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Links (score ≥ threshold) among candidate pairs, plus counts per stage."""
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    states = np.array([record.get('state', '') for record in records])
+    same_state = states[left] == states[right]
+    left, right = left[same_state], right[same_state]
+
+    codes = [food_code(record) for record in records]
+    code_ids = {code: position for position, code in enumerate(sorted({c for c in codes if c}))}
+    code_array = np.array([code_ids.get(code, -1) for code in codes])
+    code_match = (code_array[left] == code_array[right]) & (code_array[left] >= 0)
+
+    nutrient, shared = nutrient_similarity(nutrient_matrix(records), left, right)
+    has_nutrients = shared >= min_shared
+    bonus = np.where(code_match, CODE_BONUS, 0.0)
+    # Best possible score if the names matched perfectly
+    ceiling = np.where(has_nutrients, NAME_WEIGHT + NUTRIENT_WEIGHT * nutrient, 1.0) + bonus
+    reachable = np.flatnonzero(ceiling >= threshold)
+    timings['nutrient_s'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    name_cache: dict[int, tuple[list[frozenset[str]], frozenset[str]]] = {}
+    links: list[dict[str, Any]] = []
+    for position in reachable.tolist():
+        a, b = int(left[position]), int(right[position])
+        if a not in name_cache:
+            name_cache[a] = _name_sets(records[a])
+        if b not in name_cache:
+            name_cache[b] = _name_sets(records[b])
+        name = name_similarity(name_cache[a], name_cache[b])
+        if has_nutrients[position]:
+            score = NAME_WEIGHT * name + NUTRIENT_WEIGHT * float(nutrient[position])
+        else:
+            score = name
+        score += float(bonus[position])
+        if score >= threshold:
+            links.append({
+                'left': a,
+                'right': b,
+                'score': round(min(score, 1.0), 4),
+                'name': round(name, 4),
+                'nutrient': round(float(nutrient[position]), 4) if has_nutrients[position] else None,
+                'shared': int(shared[position]),
+                'code_match': bool(code_match[position]),
+            })
+    timings['name_s'] = time.perf_counter() - started
+
+    return links, {
+        'state_compatible_pairs': int(len(left)),
+        'name_comparisons': int(len(reachable)),
+        'nutrient_pruned_pairs': int(len(left) - len(reachable)),
+        'links': len(links),
+        **{key: round(value, 3) for key, value in timings.items()},
+    }
+
+
+# ── Clusters ────────────────────────────────────────────────────────
+
+def build_clusters(
+    records: list[dict[str, Any]],
+    sources: np.ndarray,
+    source_names: list[str],
+    links: list[dict[str, Any]],
+    cross_source: bool,
+) -> list[dict[str, Any]]:
+    """Greedy best-first union; one record per source per cluster."""
+    parent = list(range(len(records)))
+    members_sources: dict[int, set[int]] = {}
+
+    def find(row: int) -> int:
+        while parent[row] != row:
+            parent[row] = parent[parent[row]]
+            row = parent[row]
+        return row
+
+    accepted: dict[int, list[dict[str, Any]]] = {}
+    for link in sorted(links, key=lambda item: (-item['score'], item['left'], item['right'])):
+        a, b = find(link['left']), find(link['right'])
+        if a == b:
+            continue
+        sources_a = members_sources.get(a, {int(sources[a])})
+        sources_b = members_sources.get(b, {int(sources[b])})
+        if cross_source and sources_a & sources_b:
+            continue
+        parent[b] = a
+        members_sources[a] = sources_a | sources_b
+        accepted.setdefault(a, []).extend(accepted.pop(b, []))
+        accepted[a].append(link)
+
+    groups: dict[int, list[int]] = {}
+    for row in range(len(records)):
+        groups.setdefault(find(row), []).append(row)
+
+    clusters: list[dict[str, Any]] = []
+    for root, rows in groups.items():
+        if len(rows) < 2:
+            continue
+        rows.sort(key=lambda row: (int(sources[row]), records[row]['id']))
+        clusters.append({
+            'canonical_id': records[rows[0]]['id'],
+            'size': len(rows),
+            'members': [
+                {
+                    'id': records[row]['id'],
+                    'source': source_names[int(sources[row])],
+                    'name_primary': records[row].get('name_primary', ''),
+                    'state': records[row].get('state', ''),
+                }
+                for row in rows
+            ],
+            'links': [
+                {
+                    **link,
+                    'left': records[link['left']]['id'],
+                    'right': records[link['right']]['id'],
+                }
+                for link in accepted.get(root, [])
+            ],
+        })
+    clusters.sort(key=lambda cluster: cluster['canonical_id'])
+    return clusters
+
+
+def link_sources(
+    tables: list[tuple[str, list[dict[str, Any]]]],
+    threshold: float = DEFAULT_THRESHOLD,
+    max_block: int = DEFAULT_MAX_BLOCK,
+    min_shared: int = DEFAULT_MIN_SHARED,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Clusters + report for `[(source_name, records), ...]` in priority order."""
+    records = [record for _, table in tables for record in table]
+    sources = np.concatenate([np.full(len(table), position) for position, (_, table) in enumerate(tables)])
+    source_names = [name for name, _ in tables]
+    cross_source = len(tables) > 1
+
+    started = time.perf_counter()
+    blocks = build_blocks(records)
+    blocking_s = time.perf_counter() - started
+    started = time.perf_counter()
+    left, right, block_stats = candidate_pairs(blocks, sources, max_block, cross_source)
+    pairs_s = time.perf_counter() - started
+
+    links, score_stats = score_pairs(records, left, right, threshold, min_shared)
+    started = time.perf_counter()
+    clusters = build_clusters(records, sources, source_names, links, cross_source)
+    cluster_s = time.perf_counter() - started
+
+    sizes = [len(table) for _, table in tables]
+    full_pairs = sum(a * b for i, a in enumerate(sizes) for b in sizes[i + 1:]) if cross_source \
+        else sizes[0] * (sizes[0] - 1) // 2
+    report = {
+        'sources': dict(zip(source_names, sizes)),
+        'threshold': threshold,
+        'max_block': max_block,
+        **block_stats,
+        'full_pairs': full_pairs,
+        'reduction_ratio': round(1 - block_stats['candidate_pairs'] / full_pairs, 6) if full_pairs else None,
+        **score_stats,
+        'clusters': len(clusters),
+        'clustered_records': sum(cluster['size'] for cluster in clusters),
+        'blocking_s': round(blocking_s, 3),
+        'pairs_s': round(pairs_s, 3),
+        'cluster_s': round(cluster_s, 3),
+    }
+    return clusters, report
+
+
+# ── Synthetic benchmark ─────────────────────────────────────────────
+
+SYLLABLES = (
+    'an binh cao dai dong gia hai hoa hung khanh lam long minh nam ngoc phu quang son tan thanh '
+    'thuan tien trung tuan van vinh xuan yen bac dinh giang ha kim lac my ninh phong'
+).split()
+
+
+def _variety(rng: random.Random) -> str:
+    return ' '.join(rng.choice(SYLLABLES) for _ in range(3))
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    if len(name) < 4:
+        return name
+    position = rng.randrange(1, len(name) - 1)
+    return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+
+
+def _synthetic_record(
+    template: dict[str, Any],
+    identifier: str,
+    variety: str,
+    rng: random.Random,
+    noise: float,
+) -> dict[str, Any]:
+    return {
+        'id': identifier,
+        'name_primary': f"{template['name_primary']} {variety}",
+        'name_alt': [],
+        'name_en': f"{template['name_en']}, {variety}",
+        'state': template['state'],
+        'type_en': template.get('type_en') or FOOD_GROUPS[get_group_prefix(get_food_code(template['id']))][1],
+        'per_100g': {
+            key: None if value is None else round(value * rng.lognormvariate(0, noise), 3)
+            for key, value in ((key, template['per_100g'].get(key)) for key in NUTRIENT_KEYS)
+        },
+    }
+
+
+def synthetic_sources(
+    templates: list[dict[str, Any]],
+    size: int,
+    match_rate: float,
+    seed: int,
+) -> tuple[list[tuple[str, list[dict[str, Any]]]], set[tuple[str, str]]]:
+    """Two `size`-record tables; `match_rate` of B re-describes an A record
+    (diacritics dropped or a typo, nutrients ±5%, some nulls, code kept 30%)."""
+    rng = random.Random(seed)
+    table_a: list[dict[str, Any]] = []
+    for row in range(size):
+        template = rng.choice(templates)
+        record = _synthetic_record(template, f'syn_a_{row}', _variety(rng), rng, 0.15)
+        record['food_code'] = f'{get_food_code(template["id"])}.{row}'
+        table_a.append(record)
+
+    table_b: list[dict[str, Any]] = []
+    truth: set[tuple[str, str]] = set()
+    matched = iter(rng.sample(range(size), size))
+    for row in range(size):
+        if rng.random() < match_rate:
+            original = table_a[next(matched)]
+            record = {
+                **original,
+                'id': f'syn_b_{row}',
+                'name_primary': unaccent(original['name_primary']) if rng.random() < 0.5
+                else _typo(original['name_primary'], rng),
+                'name_en': _typo(original['name_en'], rng) if rng.random() < 0.3 else original['name_en'],
+                'per_100g': {
+                    key: None if value is None or rng.random() < 0.1
+                    else round(value * rng.lognormvariate(0, 0.05), 3)
+                    for key, value in original['per_100g'].items()
+                },
+            }
+            if rng.random() >= 0.3:
+                record.pop('food_code')
+            truth.add((original['id'], record['id']))
+        else:
+            template = rng.choice(templates)
+            record = _synthetic_record(template, f'syn_b_{row}', _variety(rng), rng, 0.15)
+        table_b.append(record)
+    return [('SYN_A', table_a), ('SYN_B', table_b)], truth
+
+
+def linkage_quality(clusters: list[dict[str, Any]], truth: set[tuple[str, str]]) -> dict[str, float]:
+    found = {
+        (cluster['members'][0]['id'], member['id'])
+        for cluster in clusters
+        for member in cluster['members'][1:]
+    }
+    true_positive = len(found & truth)
+    return {
+        'precision': true_positive / len(found) if found else 0.0,
+        'recall': true_positive / len(truth) if truth else 0.0,
+    }
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(f"Sources: {', '.join(f'{name} ({count:,})' for name, count in report['sources'].items())}")
+    for kind in ('code_blocks', 'name_blocks'):
+        stats = report[kind]
+        if stats['blocks']:
+            print(
+                f"  {kind:12s} {stats['blocks']:>9,} blocks  mean {stats['mean']:>6}  "
+                f"p50 {stats['p50']:>4}  p99 {stats['p99']:>5}  max {stats['max']:>5}"
+            )
+    dropped = report['dropped_blocks']
+    print(f"  dropped (> {report['max_block']} records): {dropped['code']} code, {dropped['name']} name; "
+          f"uncovered records: {report['uncovered_records']:,}")
+    print(f"Pairs: {report['full_pairs']:,} possible → {report['pair_emissions']:,} emitted → "
+          f"{report['candidate_pairs']:,} candidates ({report['reduction_ratio']:.6%} pruned)")
+    print(f"  same state {report['state_compatible_pairs']:,} → name comparisons "
+          f"{report['name_comparisons']:,} → links {report['links']:,}")
+    print(f"Clusters: {report['clusters']:,} ({report['clustered_records']:,} records)")
+    print(f"Time: blocking {report['blocking_s']}s, pairs {report['pairs_s']}s, "
+          f"nutrient {report['nutrient_s']}s, names {report['name_s']}s, clusters {report['cluster_s']}s")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Link records across food composition sources into merge clusters.',
+    )
+    parser.add_argument(
+        '--source',
+        action='append',
+        default=[],
+        help='Records JSON (repeatable, most authoritative first). '
+             'Prefix with NAME= to override the source name.',
+    )
+    parser.add_argument('--output', default=None, help='Write clusters + report JSON here.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Minimum link score.')
+    parser.add_argument(
+        '--max-block',
+        type=int,
+        default=DEFAULT_MAX_BLOCK,
+        help='Drop blocks with more records than this.',
+    )
+    parser.add_argument(
+        '--min-shared',
+        type=int,
+        default=DEFAULT_MIN_SHARED,
+        help='Minimum shared nutrients for the nutrient term.',
+    )
+    parser.add_argument('--bench', action='store_true', help='Link two synthetic tables and score against truth.')
+    parser.add_argument('--bench-size', type=int, default=100000, help='Records per synthetic table.')
+    parser.add_argument('--match-rate', type=float, default=0.5, help='Share of synthetic B records matching A.')
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Templates for --bench.',
+    )
+    parser.add_argument('--seed', type=int, default=2007, help='Random seed for --bench.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    truth: set[tuple[str, str]] | None = None
+    if args.bench:
+        started = time.perf_counter()
+        tables, truth = synthetic_sources(
+            load_records(Path(args.input)), args.bench_size, args.match_rate, args.seed,
+        )
+        print(f'Generated 2 × {args.bench_size:,} records in {time.perf_counter() - started:.1f}s')
+    else:
+        if not args.source:
+            raise SystemExit('Provide at least one --source (or use --bench)')
+        tables = []
+        for spec in args.source:
+            name, _, path = spec.rpartition('=')
+            records = load_records(Path(path))
+            tables.append((name or (records[0].get('source') if records else None) or Path(path).stem, records))
+
+    started = time.perf_counter()
+    clusters, report = link_sources(tables, args.threshold, args.max_block, args.min_shared)
+    report['total_s'] = round(time.perf_counter() - started, 3)
+    print_report(report)
+    print(f"Total: {report['total_s']}s")
+
+    if truth is not None:
+        quality = linkage_quality(clusters, truth)
+        report.update(quality)
+        print(f"Precision {quality['precision']:.4f}, recall {quality['recall']:.4f} ({len(truth):,} true links)")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open('w', encoding='utf-8') as handle:
+            json.dump({'report': report, 'clusters': clusters}, handle, ensure_ascii=False, indent=2)
+            handle.write('\n')
+        print(f'Output: {output}')
+
+
+if __name__ == '__main__':
+    main()
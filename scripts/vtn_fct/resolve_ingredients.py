@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""Batch-resolve free-text ingredient mentions against VTN FCT names.
+
+Replays a query log (one mention per line, or JSONL with a `query` field)
+through the offline `fuzzy_match_ingredients` equivalent from
+`trigram_search.py` and streams one JSON line per mention.
+
+- The trigram index is built once and published into
+  `multiprocessing.shared_memory` as flat int32 arrays; worker processes
+  attach to it instead of rebuilding or unpickling the index.
+- Mentions are normalized (NFC, lower-case, collapsed whitespace) and a
+  bounded LRU memo in the parent answers repeats without dispatching them.
+- Throughput (queries/s) and memo hit rate are reported at the end.
+
+Without `--queries`, a synthetic replay log is drawn from the corpus names
+with a skewed (Zipf-like) repetition pattern.
+
+Usage:
+    python3 scripts/vtn_fct/resolve_ingredients.py --queries meal_mentions.txt --output resolved.jsonl
+    python3 scripts/vtn_fct/resolve_ingredients.py --synthetic 100000 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from multiprocessing import Pool, shared_memory, util
+from pathlib import Path
+from typing import Any, TextIO
+
+from search_text import fold_ascii
+from trigram_search import (
+    DEFAULT_MATCH_COUNT,
+    DEFAULT_MATCH_THRESHOLD,
+    ColumnIndex,
+    TrigramIndex,
+    load_records,
+    rank_columns,
+)
+
+COLUMNS = ('search_text', 'search_text_ascii')
+
+
+@dataclass
+class ResolverStats:
+    queries: int = 0
+    unique_queries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Repeats within one chunk, resolved once without an LRU lookup
+    chunk_duplicates: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """LRU hits over LRU lookups (chunk duplicates excluded)."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    @property
+    def queries_per_second(self) -> float:
+        return self.queries / self.elapsed_s if self.elapsed_s else 0.0
+
+
+class LRUCache:
+    """Bounded normalized-query → ranking memo."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, list[tuple[float, int]]] = OrderedDict()
+
+    def get(self, key: str) -> list[tuple[float, int]] | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: list[tuple[float, int]]) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def normalize_query(value: str) -> str:
+    """Memo key: NFC, lower-cased, whitespace collapsed.
+
+    pg_trgm lower-cases and splits on non-alphanumerics, so case and
+    spacing never change a ranking; NFC folds decomposed input onto the
+    precomposed spelling the corpus uses.
+    """
+    normalized = unicodedata.normalize('NFC', value)
+    return re.sub(r'\s+', ' ', normalized).strip().lower()
+
+
+# ── Shared-memory index ─────────────────────────────────────────────
+# Per column: sizes[N] int32, offsets[V+1] int32, postings[P] int32, and
+# a NUL-joined UTF-8 trigram vocabulary. The layout (byte offsets) is
+# small and passed to workers directly.
+
+class _PostingLists:
+    def __init__(
+        self,
+        vocab: dict[str, int],
+        offsets: memoryview,
+        postings: memoryview,
+    ) -> None:
+        self._vocab = vocab
+        self._offsets = offsets
+        self._postings = postings
+
+    def get(self, gram: str) -> memoryview | None:
+        slot = self._vocab.get(gram)
+        if slot is None:
+            return None
+        return self._postings[self._offsets[slot]:self._offsets[slot + 1]]
+
+
+class SharedColumn(ColumnIndex):
+    """ColumnIndex view over arrays living in a shared memory block."""
+
+    def __init__(self, buffer: memoryview, layout: dict[str, tuple[int, int]]) -> None:
+        def section(name: str) -> memoryview:
+            start, end = layout[name]
+            return buffer[start:end]
+
+        vocab_bytes = bytes(section('vocab'))
+        grams = vocab_bytes.decode('utf-8').split('\0') if vocab_bytes else []
+        self.sizes = section('sizes').cast('i')
+        self.postings = _PostingLists(
+            {gram: slot for slot, gram in enumerate(grams)},
+            section('offsets').cast('i'),
+            section('postings').cast('i'),
+        )
+
+
+def _column_sections(column: ColumnIndex) -> dict[str, bytes]:
+    grams = sorted(column.postings)
+    offsets = array('i', [0])
+    postings = array('i')
+    for gram in grams:
+        postings.extend(column.postings[gram])
+        offsets.append(len(postings))
+    return {
+        'sizes': array('i', column.sizes).tobytes(),
+        'offsets': offsets.tobytes(),
+        'postings': postings.tobytes(),
+        'vocab': '\0'.join(grams).encode('utf-8'),
+    }
+
+
+def publish_index(
+    index: TrigramIndex,
+) -> tuple[shared_memory.SharedMemory, dict[str, dict[str, tuple[int, int]]]]:
+    """Copy both column indexes into one shared memory block."""
+    sections: list[tuple[str, str, bytes]] = []
+    for column_name in COLUMNS:
+        column = getattr(index, column_name)
+        for section_name, payload in _column_sections(column).items():
+            sections.append((column_name, section_name, payload))
+
+    total = sum(len(payload) + 3 for _, _, payload in sections)
+    block = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    layout: dict[str, dict[str, tuple[int, int]]] = {name: {} for name in COLUMNS}
+    cursor = 0
+    for column_name, section_name, payload in sections:
+        cursor = (cursor + 3) & ~3  # keep int32 sections aligned
+        block.buf[cursor:cursor + len(payload)] = payload
+        layout[column_name][section_name] = (cursor, cursor + len(payload))
+        cursor += len(payload)
+    return block, layout
+
+
+# ── Worker side ─────────────────────────────────────────────────────
+
+_worker_block: shared_memory.SharedMemory | None = None
+_worker_columns: tuple[ColumnIndex, ColumnIndex] | None = None
+
+
+def _attach_worker(name: str, layout: dict[str, dict[str, tuple[int, int]]]) -> None:
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not transfer ownership; the parent unlinks the block.
+    global _worker_block, _worker_columns
+    _worker_block = shared_memory.SharedMemory(name=name)
+    util.Finalize(None, _detach_worker, exitpriority=10)
+    _worker_columns = (
+        SharedColumn(_worker_block.buf, layout['search_text']),
+        SharedColumn(_worker_block.buf, layout['search_text_ascii']),
+    )
+
+
+def _detach_worker() -> None:
+    # Views into the block must be released before it can be closed
+    global _worker_block, _worker_columns
+    _worker_columns = None
+    if _worker_block is not None:
+        _worker_block.close()
+        _worker_block = None
+
+
+def _rank_batch(
+    batch: tuple[list[str], int, float],
+) -> list[list[tuple[float, int]]]:
+    queries, match_count, match_threshold = batch
+    assert _worker_columns is not None
+    search_text, search_text_ascii = _worker_columns
+    return [
+        rank_columns(search_text, search_text_ascii, query, match_count, match_threshold)
+        for query in queries
+    ]
+
+
+# ── Driver ──────────────────────────────────────────────────────────
+
+def read_query_log(path: Path) -> Iterator[str]:
+    with path.open('r', encoding='utf-8') as handle:
+        for line in handle:
+            line = line.rstrip('\n')
+            if not line.strip():
+                continue
+            if line.lstrip().startswith('{'):
+                yield json.loads(line)['query']
+            else:
+                yield line
+
+
+def synthetic_query_log(
+    records: list[dict[str, Any]],
+    count: int,
+    seed: int,
+) -> list[str]:
+    """Mentions drawn from corpus names with Zipf-like repetition.
+
+    Variants mimic what meal logs contain: lower-cased names, names typed
+    without diacritics, the first two words only, and a gram prefix.
+    """
+    rng = random.Random(seed)
+    names = [record['name_primary'] for record in records]
+    rng.shuffle(names)
+    weights = [1 / (rank + 1) for rank in range(len(names))]
+    variants = [
+        lambda name: name,
+        lambda name: name.lower(),
+        lambda name: fold_ascii(name),
+        lambda name: ' '.join(name.split()[:2]),
+        lambda name: f'100g {name.lower()}',
+    ]
+    picks = rng.choices(names, weights=weights, k=count)
+    return [rng.choice(variants)(name) for name in picks]
+
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def resolve_stream(
+    queries: Iterable[str],
+    index: TrigramIndex,
+    output: TextIO,
+    workers: int,
+    cache_size: int,
+    chunk_size: int,
+    match_count: int,
+    match_threshold: float,
+) -> ResolverStats:
+    stats = ResolverStats()
+    cache = LRUCache(cache_size)
+    seen: set[str] = set()
+    records = index.records
+
+    block: shared_memory.SharedMemory | None = None
+    pool = None
+    if workers > 0:
+        block, layout = publish_index(index)
+        pool = Pool(
+            workers,
+            initializer=_attach_worker,
+            initargs=(block.name, layout),
+        )
+
+    started = time.perf_counter()
+    try:
+        for chunk in _chunks(queries, chunk_size):
+            normalized = [normalize_query(query) for query in chunk]
+            resolved: dict[str, list[tuple[float, int]]] = {}
+            misses: list[str] = []
+            for key in normalized:
+                if key in resolved:
+                    stats.chunk_duplicates += 1
+                    continue
+                cached = cache.get(key)
+                if cached is not None:
+                    stats.cache_hits += 1
+                    resolved[key] = cached
+                    continue
+                stats.cache_misses += 1
+                resolved[key] = []
+                misses.append(key)
+
+            if misses:
+                if pool is None:
+                    rankings = [index.rank(key, match_count, match_threshold) for key in misses]
+                else:
+                    step = max(1, -(-len(misses) // (workers * 4)))
+                    batches = [
+                        (misses[i:i + step], match_count, match_threshold)
+                        for i in range(0, len(misses), step)
+                    ]
+                    rankings = [
+                        ranking
+                        for batch_result in pool.map(_rank_batch, batches)
+                        for ranking in batch_result
+                    ]
+                for key, ranking in zip(misses, rankings):
+                    resolved[key] = ranking
+                    cache.put(key, ranking)
+
+            for query, key in zip(chunk, normalized):
+                seen.add(key)
+                matches = [
+                    {
+                        'id': records[position]['id'],
+                        'name_primary': records[position]['name_primary'],
+                        'similarity': round(sim, 6),
+                    }
+                    for sim, position in resolved[key]
+                ]
+                output.write(
+                    json.dumps(
+                        {'query': query, 'normalized': key, 'matches': matches},
+                        ensure_ascii=False,
+                    )
+                    + '\n'
+                )
+            stats.queries += len(chunk)
+    finally:
+        stats.elapsed_s = time.perf_counter() - started
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    stats.unique_queries = len(seen)
+    return stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Resolve a log of ingredient mentions against VTN FCT names (JSONL out).',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--queries',
+        default=None,
+        help='Query log: one mention per line, or JSONL with a "query" field.',
+    )
+    parser.add_argument(
+        '--synthetic',
+        type=int,
+        default=20000,
+        help='Size of the synthetic replay log used when --queries is omitted.',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=2007,
+        help='Random seed for the synthetic replay log.',
+    )
+    parser.add_argument(
+        '--output',
+        default='resolved_ingredients.jsonl',
+        help='JSONL output path ("-" for stdout).',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Worker processes (0 = resolve in-process).',
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=10000,
+        help='Maximum normalized queries kept in the LRU memo.',
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=4096,
+        help='Mentions read, dispatched and written per round.',
+    )
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=DEFAULT_MATCH_COUNT,
+        help='match_count per mention.',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_MATCH_THRESHOLD,
+        help='match_threshold per mention.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    records = load_records(Path(args.input))
+    index = TrigramIndex(records)
+
+    if args.queries:
+        queries: Iterable[str] = read_query_log(Path(args.queries))
+        source = args.queries
+    else:
+        queries = synthetic_query_log(records, args.synthetic, args.seed)
+        source = f'synthetic ({args.synthetic} mentions, seed {args.seed})'
+
+    to_stdout = args.output == '-'
+    output = sys.stdout if to_stdout else open(args.output, 'w', encoding='utf-8')
+    try:
+        stats = resolve_stream(
+            queries,
+            index,
+            output,
+            workers=args.workers,
+            cache_size=args.cache_size,
+            chunk_size=args.chunk_size,
+            match_count=args.count,
+            match_threshold=args.threshold,
+        )
+    finally:
+        if not to_stdout:
+            output.close()
+
+    report = sys.stderr if to_stdout else sys.stdout
+    print(f'Query log: {source}', file=report)
+    print(f'Mentions resolved: {stats.queries}', file=report)
+    print(f'Unique normalized: {stats.unique_queries}', file=report)
+    print(f'Workers: {args.workers}', file=report)
+    print(f'Memo hits: {stats.cache_hits} ({stats.hit_rate * 100:.1f}% of LRU lookups)', file=report)
+    print(f'Repeats within a chunk: {stats.chunk_duplicates}', file=report)
+    print(f'Elapsed: {stats.elapsed_s:.2f} s', file=report)
+    print(f'Throughput: {stats.queries_per_second:,.0f} queries/s', file=report)
+    if not to_stdout:
+        print(f'Output: {args.output}', file=report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""Offline equivalents of the database search-text columns.
+
+Mirrors `public.build_food_search_text()` from
+`supabase/migrations/20260301022622_pg_trgm_ingredient_search.sql`:
+
+    search_text       = name_primary || COALESCE(' ' || array_to_string(name_alt, ' '), '') || ' ' || name_en
+    search_text_ascii = lower(unaccent(search_text))
+
+and the diacritic routing used by `fuzzy_match_ingredients`, so exporters
+can ship both columns precomputed instead of leaving them to the trigger.
+
+Run with `--check` to prove the offline folding matches
+`lower(unaccent(...))` on a live database over the whole corpus:
+    python3 scripts/vtn_fct/search_text.py --check --database-url "$DATABASE_URL"
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import subprocess
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Any
+
+# ── unaccent folding ────────────────────────────────────────────────
+# Blocks whose letters unaccent.rules strips to their NFD base letter.
+# Latin Extended Additional holds every precomposed Vietnamese vowel
+# (ạ ả ấ ầ ẩ ẫ ậ ắ … ự ỳ ỵ ỷ ỹ).
+_UNACCENT_BLOCKS = (
+    range(0x00C0, 0x0180),  # Latin-1 Supplement letters, Latin Extended-A
+    range(0x0180, 0x0250),  # Latin Extended-B (ơ ư Ơ Ư)
+    range(0x1E00, 0x1F00),  # Latin Extended Additional
+)
+
+# unaccent.rules entries NFD cannot derive: letters without a canonical
+# decomposition (đ/Đ above all) and the Latin-1 symbols / punctuation it
+# transliterates. Several of these are TCVN3 mojibake bytes (© « ® ¼ ½ ¾
+# ¿ × ÷ µ −) that survive in `name_alt`, so they matter for parity.
+_UNACCENT_SPECIAL: dict[str, str] = {
+    '¡': '!',
+    '©': '(C)',
+    'ª': 'a',
+    '«': '<<',
+    '\u00AD': '-',     # soft hyphen
+    '®': '(R)',
+    '±': '+/-',
+    '\u00B5': '\u03BC',  # µ MICRO SIGN → μ Greek mu
+    'º': 'o',
+    '»': '>>',
+    '¼': ' 1/4',
+    '½': ' 1/2',
+    '¾': ' 3/4',
+    '¿': '?',
+    'Æ': 'AE',
+    'Ð': 'D',
+    '×': '*',
+    'Ø': 'O',
+    'Þ': 'TH',
+    'ß': 'ss',
+    'æ': 'ae',
+    'ð': 'd',
+    '÷': '/',
+    'ø': 'o',
+    'þ': 'th',
+    'Đ': 'D',
+    'đ': 'd',
+    'Ħ': 'H',
+    'ħ': 'h',
+    'ı': 'i',
+    'Ĳ': 'IJ',
+    'ĳ': 'ij',
+    'ĸ': 'q',
+    'Ŀ': 'L',
+    'ŀ': 'l',
+    'Ł': 'L',
+    'ł': 'l',
+    'ŉ': "'n",
+    'Ŋ': 'N',
+    'ŋ': 'n',
+    'Œ': 'OE',
+    'œ': 'oe',
+    'Ŧ': 'T',
+    'ŧ': 't',
+    'ſ': 's',
+    # Latin Extended-B letters without a decomposition
+    'ƀ': 'b', 'Ɓ': 'B', 'Ƃ': 'B', 'ƃ': 'b', 'Ƈ': 'C', 'ƈ': 'c',
+    'Ɖ': 'D', 'Ɗ': 'D', 'Ƌ': 'D', 'ƌ': 'd', 'Ɛ': 'E', 'Ƒ': 'F',
+    'ƒ': 'f', 'Ɠ': 'G', 'ƕ': 'hv', 'Ɩ': 'I', 'Ɨ': 'I', 'Ƙ': 'K',
+    'ƙ': 'k', 'ƚ': 'l', 'Ɲ': 'N', 'ƞ': 'n', 'Ƣ': 'OI', 'ƣ': 'oi',
+    'Ƥ': 'P', 'ƥ': 'p', 'ƫ': 't', 'Ƭ': 'T', 'ƭ': 't', 'Ʈ': 'T',
+    'Ʋ': 'V', 'Ƴ': 'Y', 'ƴ': 'y', 'Ƶ': 'Z', 'ƶ': 'z', 'Ǆ': 'DZ',
+    'ǅ': 'Dz', 'ǆ': 'dz', 'Ǉ': 'LJ', 'ǈ': 'Lj', 'ǉ': 'lj', 'Ǌ': 'NJ',
+    'ǋ': 'Nj', 'ǌ': 'nj', 'Ǥ': 'G', 'ǥ': 'g', 'Ǳ': 'DZ', 'ǲ': 'Dz',
+    'ǳ': 'dz', 'ȡ': 'd', 'Ȥ': 'Z', 'ȥ': 'z', 'ȴ': 'l', 'ȵ': 'n',
+    'ȶ': 't', 'ȷ': 'j', 'ȸ': 'db', 'ȹ': 'qp', 'Ⱥ': 'A', 'Ȼ': 'C',
+    'ȼ': 'c', 'Ƚ': 'L', 'Ⱦ': 'T', 'ȿ': 's', 'ɀ': 'z', 'Ƀ': 'B',
+    'Ʉ': 'U', 'Ɇ': 'E', 'ɇ': 'e', 'Ɉ': 'J', 'ɉ': 'j', 'Ɍ': 'R',
+    'ɍ': 'r', 'Ɏ': 'Y', 'ɏ': 'y',
+    'ẚ': 'a',
+    'ẜ': 's',
+    'ẝ': 's',
+    'ẞ': 'SS',
+    'Ỻ': 'LL',
+    'ỻ': 'll',
+    'Ỽ': 'V',
+    'ỽ': 'v',
+    'Ỿ': 'Y',
+    'ỿ': 'y',
+    '‐': '-',
+    '‑': '-',
+    '‒': '-',
+    '–': '-',
+    '—': '-',
+    '―': '-',
+    '‖': '||',
+    '‘': "'",
+    '’': "'",
+    '‚': ',',
+    '‛': "'",
+    '“': '"',
+    '”': '"',
+    '„': ',,',
+    '‟': '"',
+    '․': '.',
+    '‥': '..',
+    '…': '...',
+    '′': "'",
+    '″': '"',
+    '‹': '<',
+    '›': '>',
+    '‼': '!!',
+    '⁄': '/',
+    '⁅': '[',
+    '⁆': ']',
+    '⁇': '??',
+    '⁈': '?!',
+    '⁉': '!?',
+    '⁎': '*',
+    '\u2212': '-',     # − MINUS SIGN (TCVN3 ư)
+}
+
+# Combining marks U+0300–U+0362 are deleted, so NFD input folds too.
+_COMBINING_REMOVED = range(0x0300, 0x0363)
+
+
+def _build_unaccent_table() -> dict[int, str]:
+    table: dict[int, str] = {}
+    for block in _UNACCENT_BLOCKS:
+        for codepoint in block:
+            ch = chr(codepoint)
+            base = ''.join(
+                part
+                for part in unicodedata.normalize('NFD', ch)
+                if not unicodedata.combining(part)
+            )
+            if base != ch and base.isascii():
+                table[codepoint] = base
+    for codepoint in _COMBINING_REMOVED:
+        table[codepoint] = ''
+    table.update({ord(ch): value for ch, value in _UNACCENT_SPECIAL.items()})
+    return table
+
+
+UNACCENT_TABLE = _build_unaccent_table()
+
+
+def unaccent(value: str) -> str:
+    """Equivalent of the `unaccent` extension for Latin / Vietnamese text."""
+    return value.translate(UNACCENT_TABLE)
+
+
+def fold_ascii(value: str) -> str:
+    """Equivalent of SQL `lower(unaccent(value))`."""
+    return value.translate(UNACCENT_TABLE).lower()
+
+
+# ── Search columns ──────────────────────────────────────────────────
+
+def build_search_text(
+    name_primary: str,
+    name_alt: list[str] | None,
+    name_en: str,
+) -> str:
+    """Build `search_text` exactly as the insert/update trigger does.
+
+    `array_to_string('{}', ' ')` is '' (not NULL), so an empty `name_alt`
+    still contributes the separator and yields a double space.
+    """
+    alt = '' if name_alt is None else ' ' + ' '.join(
+        item for item in name_alt if item is not None
+    )
+    return f'{name_primary}{alt} {name_en}'
+
+
+def record_search_columns(record: dict[str, Any]) -> tuple[str, str]:
+    """Return `(search_text, search_text_ascii)` for an extracted record."""
+    search_text = build_search_text(
+        record['name_primary'],
+        record.get('name_alt'),
+        record['name_en'],
+    )
+    return search_text, fold_ascii(search_text)
+
+
+def has_diacritics(query: str) -> bool:
+    """Routing rule of `fuzzy_match_ingredients`.
+
+    A query "has diacritics" when `lower(unaccent(q))` differs from
+    `lower(q)`; such queries search `search_text`, all others search
+    `search_text_ascii` with the folded query.
+    """
+    return fold_ascii(query) != query.lower()
+
+
+# ── Parity check against a live database ────────────────────────────
+
+def sql_literal(value: str | None) -> str:
+    if value is None:
+        return 'NULL'
+    return "'" + value.replace("'", "''") + "'"
+
+
+def sql_text_array(values: list[str] | None) -> str:
+    """Render a Python list as a `text[]` literal expression."""
+    if values is None:
+        return 'NULL::text[]'
+    elements = ','.join(
+        '"' + item.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for item in values
+    )
+    return sql_literal('{' + elements + '}') + '::text[]'
+
+
+def _psql_rows(database_url: str, sql: str) -> list[list[str]]:
+    completed = subprocess.run(
+        ['psql', database_url, '-X', '--csv', '--tuples-only', '-v', 'ON_ERROR_STOP=1'],
+        input=sql,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [row for row in csv.reader(io.StringIO(completed.stdout)) if row]
+
+
+def check_parity(
+    records: list[dict[str, Any]],
+    database_url: str,
+    unaccent_function: str,
+) -> list[str]:
+    """Compare offline columns with the trigger expressions evaluated in SQL.
+
+    Every record's `search_text`/`search_text_ascii` is recomputed by the
+    database from its names, and every character of the supported blocks
+    is folded individually so gaps in the table show up even when the
+    corpus does not use them yet.
+    """
+    record_rows = ',\n'.join(
+        f"({position}, {sql_literal(record['name_primary'])}, "
+        f"{sql_text_array(record.get('name_alt'))}, {sql_literal(record['name_en'])})"
+        for position, record in enumerate(records)
+    )
+    record_sql = (
+        'SELECT position, search_text, '
+        f'lower({unaccent_function}(search_text))\n'
+        'FROM (\n'
+        "  SELECT position, name_primary || COALESCE(' ' || array_to_string(name_alt, ' '), '')"
+        " || ' ' || name_en AS search_text\n"
+        f'  FROM (VALUES\n{record_rows}\n  ) AS r(position, name_primary, name_alt, name_en)\n'
+        ') AS s ORDER BY position;\n'
+    )
+
+    probes = sorted(
+        {chr(cp) for block in _UNACCENT_BLOCKS for cp in block}
+        | {chr(cp) for cp in range(0x00A0, 0x00C0)}
+        | {chr(cp) for cp in _COMBINING_REMOVED}
+        | set(_UNACCENT_SPECIAL)
+        | {ch for record in records for ch in record_search_columns(record)[0] if not ch.isascii()}
+    )
+    probe_rows = ',\n'.join(
+        f'({position}, {sql_literal(ch)})' for position, ch in enumerate(probes)
+    )
+    probe_sql = (
+        f'SELECT position, lower({unaccent_function}(ch))\n'
+        f'FROM (VALUES\n{probe_rows}\n) AS p(position, ch) ORDER BY position;\n'
+    )
+
+    problems: list[str] = []
+    for position, sql_text, sql_ascii in _psql_rows(database_url, record_sql):
+        record = records[int(position)]
+        text, text_ascii = record_search_columns(record)
+        if text != sql_text:
+            problems.append(f"{record['id']}: search_text {text!r} != SQL {sql_text!r}")
+        if text_ascii != sql_ascii:
+            problems.append(
+                f"{record['id']}: search_text_ascii {text_ascii!r} != SQL {sql_ascii!r}"
+            )
+
+    for position, sql_folded in _psql_rows(database_url, probe_sql):
+        ch = probes[int(position)]
+        if fold_ascii(ch) != sql_folded:
+            problems.append(
+                f'U+{ord(ch):04X} {ch!r}: folds to {fold_ascii(ch)!r}, SQL {sql_folded!r}'
+            )
+
+    return problems
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Check offline search_text / search_text_ascii against lower(unaccent(...)).',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Run the parity check against --database-url; exit 1 on mismatch.',
+    )
+    parser.add_argument(
+        '--database-url',
+        default=None,
+        help='Postgres URL with the unaccent extension installed.',
+    )
+    parser.add_argument(
+        '--unaccent-function',
+        default='extensions.unaccent',
+        help='Schema-qualified unaccent function to compare against.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    with Path(args.input).open('r', encoding='utf-8') as handle:
+        records: list[dict[str, Any]] = json.load(handle)
+
+    if not args.check:
+        for record in records[:10]:
+            print(' | '.join(record_search_columns(record)))
+        return
+
+    if not args.database_url:
+        raise SystemExit('--check requires --database-url')
+
+    problems = check_parity(records, args.database_url, args.unaccent_function)
+    print(f'Records checked: {len(records)}')
+    print(f'Mismatches: {len(problems)}')
+    for problem in problems[:50]:
+        print(f'  {problem}')
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
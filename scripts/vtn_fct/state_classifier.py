@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Raw/cooked state and cooking method from a food's Vietnamese + English names.
+
+One alternation regex over every keyword (factored into a prefix trie),
+compiled at import, with word boundaries: "kho" no longer fires inside
+"khoai", "canh" inside longer words, or "raw" inside "strawberry".
+
+Matching is over the lower-cased NFC text, not the diacritic-folded text:
+"khô" (dried) vs "kho" (braised) and "sống" (raw) vs "song" differ only by
+their diacritics. When the Vietnamese name has no diacritics at all, the
+unaccented spellings (kho, song, chao …) are read as the accented words,
+as the previous classifier did; in an accented name "kho" means braised.
+
+The rules are otherwise those of the previous substring `infer_state`:
+- any raw keyword → raw (dried products count as raw)
+- else any cooking keyword → cooked, with the most specific method
+- else raw
+
+`classify_states` folds a whole batch of records in one pass.
+
+Usage:
+    python3 scripts/vtn_fct/state_classifier.py "Khoai tây lát chiên" "Potato crisp, fried"
+    python3 scripts/vtn_fct/state_classifier.py --check
+    python3 scripts/vtn_fct/state_classifier.py --bench
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+RAW_KEYWORDS = frozenset({
+    'raw',
+    'fresh',
+    'dried',
+    'uncooked',
+    'sống',
+    'tươi',
+    'khô',
+})
+
+# Most specific first: a name with several methods reports the earliest here
+COOKING_METHODS: dict[str, frozenset[str]] = {
+    'stir_fried': frozenset({'stir-fried', 'xào'}),
+    'fried': frozenset({'fried', 'chiên', 'rán', 'chao'}),  # chao dầu: deep-fried
+    'grilled': frozenset({'grilled', 'nướng'}),
+    'roasted': frozenset({'roasted'}),
+    'baked': frozenset({'baked'}),
+    'steamed': frozenset({'steamed', 'hấp'}),
+    'boiled': frozenset({'boiled', 'luộc'}),
+    'braised': frozenset({'braised', 'kho'}),
+    'soup': frozenset({'soup', 'canh'}),
+    'porridge': frozenset({'porridge', 'cháo'}),
+    'cooked': frozenset({'cooked'}),
+}
+
+# Names typed without diacritics: each spelling stands for the accented word
+UNACCENTED_SPELLINGS = {
+    'song': 'sống',
+    'tuoi': 'tươi',
+    'kho': 'khô',
+    'chao': 'cháo',
+    'xao': 'xào',
+    'nuong': 'nướng',
+    'hap': 'hấp',
+}
+COOKED_KEYWORDS = frozenset().union(*COOKING_METHODS.values())
+
+_METHOD_RANK = {method: rank for rank, method in enumerate(COOKING_METHODS)}
+_KEYWORD_METHOD = {
+    keyword: method for method, keywords in COOKING_METHODS.items() for keyword in keywords
+}
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Alternation factored by common prefix ("kh(?:o|ô)"): the regex engine
+    tries one branch per character instead of every keyword in turn."""
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
+
+
+# Every keyword starts and ends with a word character, so \b is a word boundary
+_KEYWORD_RE = re.compile(
+    rf'\b({_trie_pattern(RAW_KEYWORDS | COOKED_KEYWORDS | UNACCENTED_SPELLINGS.keys())})\b'
+)
+
+
+@dataclass(frozen=True)
+class StateResult:
+    state: str
+    method: str | None
+    raw_hits: tuple[str, ...] = ()
+    cooked_hits: tuple[str, ...] = ()
+
+
+_NO_KEYWORDS = StateResult('raw', None)
+
+
+def fold(value: str) -> str:
+    return unicodedata.normalize('NFC', value).lower()
+
+
+def _decide(hits: list[str], unaccented: bool) -> StateResult:
+    if not hits:
+        return _NO_KEYWORDS
+    if unaccented:
+        hits = [UNACCENTED_SPELLINGS.get(hit, hit) for hit in hits]
+    raw_hits = tuple(sorted({hit for hit in hits if hit in RAW_KEYWORDS}))
+    cooked_hits = tuple(sorted({hit for hit in hits if hit in COOKED_KEYWORDS}))
+    if raw_hits:
+        return StateResult('raw', None, raw_hits, cooked_hits)
+    method = min((_KEYWORD_METHOD[hit] for hit in cooked_hits), key=_METHOD_RANK.__getitem__)
+    return StateResult('cooked', method, raw_hits, cooked_hits)
+
+
+def classify_state(vn_name: str, en_name: str) -> StateResult:
+    return _decide(_KEYWORD_RE.findall(fold(f'{vn_name} {en_name}')), vn_name.isascii())
+
+
+def classify_states(names: Iterable[tuple[str, str]]) -> list[StateResult]:
+    """classify_state for many (vn_name, en_name) pairs, folding the batch in one pass."""
+    names = list(names)
+    # A newline inside a name would start a new record; the classifier reads it as a space
+    combined = [f'{vn_name} {en_name}'.replace('\n', ' ') for vn_name, en_name in names]
+    if not combined:
+        return []
+    findall = _KEYWORD_RE.findall
+    return [
+        _decide(findall(line), vn_name.isascii())
+        for line, (vn_name, _) in zip(fold('\n'.join(combined)).split('\n'), names)
+    ]
+
+
+def infer_state(vn_name: str, en_name: str) -> str:
+    return classify_state(vn_name, en_name).state
+
+
+# ── Agreement check and benchmark ───────────────────────────────────
+
+LEGACY_RAW_KEYWORDS = RAW_KEYWORDS | {'song', 'tuoi', 'kho'}
+LEGACY_COOKED_KEYWORDS = (COOKED_KEYWORDS - {'kho'}) | {'chao', 'xao', 'nuong', 'hap', 'khô', 'kho'}
+
+
+def legacy_infer_state(vn_name: str, en_name: str) -> str:
+    """The previous substring classifier, kept for --check / --bench."""
+    combined = f'{vn_name} {en_name}'.lower()
+    if any(keyword in combined for keyword in LEGACY_RAW_KEYWORDS):
+        return 'raw'
+    if any(keyword in combined for keyword in LEGACY_COOKED_KEYWORDS):
+        return 'cooked'
+    return 'raw'
+
+
+def load_names(path: Path) -> list[tuple[str, str]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return [(record['name_primary'], record['name_en']) for record in json.load(handle)]
+
+
+def agreement(names: list[tuple[str, str]]) -> tuple[list[tuple[str, str, str, StateResult]], bool]:
+    """(names where the state changed vs legacy, batch == single for every name)."""
+    batch = classify_states(names)
+    consistent = all(result == classify_state(*pair) for pair, result in zip(names, batch))
+    changed = [
+        (vn_name, en_name, legacy, result)
+        for (vn_name, en_name), result in zip(names, batch)
+        if (legacy := legacy_infer_state(vn_name, en_name)) != result.state
+    ]
+    return changed, consistent
+
+
+def run_benchmark(names: list[tuple[str, str]], repeats: int) -> list[tuple[str, float]]:
+    """(classifier, records/s), best of `repeats`."""
+    cases = [
+        ('legacy substring scan', lambda: [legacy_infer_state(*pair) for pair in names]),
+        ('classify_state (per record)', lambda: [classify_state(*pair) for pair in names]),
+        ('classify_states (batch)', lambda: classify_states(names)),
+    ]
+    results: list[tuple[str, float]] = []
+    for label, run in cases:
+        best = float('inf')
+        for _ in range(repeats):
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        results.append((label, len(names) / best if best else 0.0))
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Classify raw/cooked state and cooking method from food names.',
+    )
+    parser.add_argument('vn_name', nargs='?', default=None, help='Vietnamese name.')
+    parser.add_argument('en_name', nargs='?', default='', help='English name.')
+    parser.add_argument(
+        '--records',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Records for --check / --bench.',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Compare with the previous substring classifier; fail on unexpected changes.',
+    )
+    parser.add_argument('--bench', action='store_true', help='Records/s vs the previous classifier.')
+    parser.add_argument('--scale', type=int, default=200, help='Corpus copies for --bench.')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed passes for --bench.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    if args.check:
+        names = load_names(Path(args.records))
+        changed, consistent = agreement(names)
+        print(f'Records: {len(names)}, agreement with substring classifier: '
+              f'{1 - len(changed) / len(names):.2%}')
+        # Every change must come from a keyword the old scan found inside a longer
+        # word, or from "kho" read as braised in an accented name
+        unexpected = 0
+        for vn_name, en_name, legacy, result in changed:
+            hits = set(result.raw_hits) | set(result.cooked_hits)
+            reasons = [
+                f'inside a word: {keyword}'
+                for keyword in sorted(LEGACY_RAW_KEYWORDS | LEGACY_COOKED_KEYWORDS)
+                if keyword in f'{vn_name} {en_name}'.lower() and keyword not in hits
+            ]
+            if not vn_name.isascii():
+                reasons += [f'accented name: {hit}' for hit in sorted(hits) if hit in UNACCENTED_SPELLINGS]
+            unexpected += not reasons
+            print(f'  {legacy} → {result.state} ({result.method}): {vn_name} | {en_name}'
+                  f"  [{'; '.join(reasons) or 'unexplained'}]")
+        print(f"Batch API matches per-record API: {'OK' if consistent else 'FAIL'}")
+        if unexpected or not consistent:
+            raise SystemExit(1)
+        return
+
+    if args.bench:
+        names = load_names(Path(args.records)) * args.scale
+        results = run_benchmark(names, args.repeats)
+        baseline = results[0][1]
+        print(f'Records: {len(names):,}')
+        for label, rate in results:
+            print(f'  {label:30s} {rate:12,.0f} records/s  ({rate / baseline:4.1f}×)')
+        return
+
+    if args.vn_name is None:
+        raise SystemExit('Give a Vietnamese name (and optionally an English name), --check or --bench')
+    result = classify_state(args.vn_name, args.en_name)
+    print(f'{result.state} (method: {result.method}) raw={list(result.raw_hits)} cooked={list(result.cooked_hits)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""Pluggable page-text backends, with a head-to-head benchmark.
+
+Every backend returns the text of a page (1-based) as one string:
+
+- pdfplumber  `page.extract_text()` — the reference the parsers were written against
+- pdftotext   poppler `pdftotext -layout` subprocesses, CHUNK_PAGES pages per call
+              (pages split on form feeds)
+- pypdfium2   PDFium text pages (`pip install pypdfium2`)
+
+The faster backends lay the page out differently (column gaps, blank
+lines, glyph mapping of the TCVN3 fonts). Runs of spaces and blank lines
+are collapsed so the text has pdfplumber's shape, but whether a backend
+reproduces the records is measured, not assumed: `--bench` runs every
+available backend over the same pages and reports pages/s plus the
+field-level agreement of the parsed records with pdfplumber's.
+
+Usage:
+    python3 scripts/vtn_fct/extract_vtn_fct_2007.py --backend pdftotext
+    python3 scripts/vtn_fct/text_backends.py --pdf "VTN FCT 2007.pdf" --bench --pages 1-120
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import re
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import pdfplumber
+
+DEFAULT_BACKEND = 'pdfplumber'
+CHUNK_PAGES = 32
+PDFTOTEXT = 'pdftotext'
+PDFINFO = 'pdfinfo'
+
+_SPACES_RE = re.compile('[ \t\u00a0]+')
+
+
+def normalize_layout(text: str) -> str:
+    """Single spaces, no trailing whitespace, no blank lines (pdfplumber's shape)."""
+    lines = (_SPACES_RE.sub(' ', line).strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+# ── Backends ────────────────────────────────────────────────────────
+
+class TextBackend:
+    """Open once per PDF; `page_text(n)` for any page in any order."""
+
+    name = ''
+
+    def __init__(self, pdf_path: Path) -> None:
+        self.pdf_path = pdf_path
+
+    def __enter__(self) -> TextBackend:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def unavailable() -> str | None:
+        """Why this backend cannot run here (None when it can)."""
+        return None
+
+    @property
+    def page_count(self) -> int:
+        raise NotImplementedError
+
+    def page_text(self, page_number: int) -> str:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class PdfplumberBackend(TextBackend):
+    name = 'pdfplumber'
+
+    def __init__(self, pdf_path: Path) -> None:
+        super().__init__(pdf_path)
+        self.pdf = pdfplumber.open(pdf_path)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pdf.pages)
+
+    def page_text(self, page_number: int) -> str:
+        return self.pdf.pages[page_number - 1].extract_text() or ''
+
+    def close(self) -> None:
+        self.pdf.close()
+
+
+class PdftotextBackend(TextBackend):
+    name = 'pdftotext'
+
+    def __init__(self, pdf_path: Path) -> None:
+        super().__init__(pdf_path)
+        self._page_count: int | None = None
+        self._chunk: dict[int, str] = {}
+
+    @staticmethod
+    def unavailable() -> str | None:
+        missing = [tool for tool in (PDFTOTEXT, PDFINFO) if shutil.which(tool) is None]
+        return f"{', '.join(missing)} not found on PATH (poppler-utils)" if missing else None
+
+    @property
+    def page_count(self) -> int:
+        if self._page_count is None:
+            info = subprocess.run(
+                [PDFINFO, str(self.pdf_path)], capture_output=True, text=True, check=True,
+            ).stdout
+            match = re.search(r'^Pages:\s+(\d+)', info, re.MULTILINE)
+            if match is None:
+                raise RuntimeError(f'pdfinfo reported no page count for {self.pdf_path}')
+            self._page_count = int(match.group(1))
+        return self._page_count
+
+    def page_text(self, page_number: int) -> str:
+        # One subprocess per chunk: process start-up would dominate per page
+        if page_number not in self._chunk:
+            last = min(page_number + CHUNK_PAGES - 1, self.page_count)
+            output = subprocess.run(
+                [
+                    PDFTOTEXT, '-layout', '-enc', 'UTF-8',
+                    '-f', str(page_number), '-l', str(last), str(self.pdf_path), '-',
+                ],
+                capture_output=True,
+                check=True,
+            ).stdout.decode('utf-8', 'replace')
+            pages = output.split('\f')
+            self._chunk = {
+                page_number + offset: normalize_layout(pages[offset]) if offset < len(pages) else ''
+                for offset in range(last - page_number + 1)
+            }
+        return self._chunk[page_number]
+
+
+class Pypdfium2Backend(TextBackend):
+    name = 'pypdfium2'
+
+    def __init__(self, pdf_path: Path) -> None:
+        super().__init__(pdf_path)
+        import pypdfium2
+
+        self.pdf = pypdfium2.PdfDocument(str(pdf_path))
+
+    @staticmethod
+    def unavailable() -> str | None:
+        if importlib.util.find_spec('pypdfium2') is None:
+            return 'pypdfium2 not installed (pip install pypdfium2)'
+        return None
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pdf)
+
+    def page_text(self, page_number: int) -> str:
+        page = self.pdf[page_number - 1]
+        try:
+            text_page = page.get_textpage()
+            try:
+                text = text_page.get_text_range()
+            finally:
+                text_page.close()
+        finally:
+            page.close()
+        return normalize_layout(text)
+
+    def close(self) -> None:
+        self.pdf.close()
+
+
+BACKENDS: dict[str, type[TextBackend]] = {
+    backend.name: backend for backend in (PdfplumberBackend, PdftotextBackend, Pypdfium2Backend)
+}
+
+
+def open_backend(name: str, pdf_path: Path) -> TextBackend:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown text backend {name!r} (choose from {', '.join(BACKENDS)})")
+    backend = BACKENDS[name]
+    reason = backend.unavailable()
+    if reason is not None:
+        raise FileNotFoundError(f'Text backend {name}: {reason}')
+    return backend(pdf_path)
+
+
+# ── Head-to-head benchmark ──────────────────────────────────────────
+
+def parse_page_range(value: str, page_count: int) -> list[int]:
+    """'1-120' / '22,24' / '' (all) → sorted page numbers within the PDF."""
+    if not value:
+        return list(range(1, page_count + 1))
+    pages: set[int] = set()
+    for part in value.split(','):
+        start, _, end = part.partition('-')
+        pages.update(range(int(start), int(end or start) + 1))
+    return sorted(page for page in pages if 1 <= page <= page_count)
+
+
+def extract_records(backend: TextBackend, pages: list[int]) -> tuple[dict[int, dict[str, Any]], float]:
+    """page → record as run_extraction builds it (no OCR), and the seconds spent reading text."""
+    from extract_vtn_fct_2007 import parse_page, repair_name_encoding
+
+    records: dict[int, dict[str, Any]] = {}
+    reading = 0.0
+    for page_number in pages:
+        started = time.perf_counter()
+        text = backend.page_text(page_number)
+        reading += time.perf_counter() - started
+        record = parse_page(text, page_number, [], [])
+        if record is not None:
+            repair_name_encoding(record)
+            records[page_number] = record
+    return records, reading
+
+
+def _fields(record: dict[str, Any]) -> dict[str, Any]:
+    fields = {
+        key: record[key]
+        for key in ('id', 'name_primary', 'name_en', 'state', 'inedible_portion_pct')
+    }
+    fields.update(record['per_100g'])
+    return fields
+
+
+def field_agreement(
+    reference: dict[int, dict[str, Any]],
+    candidate: dict[int, dict[str, Any]],
+) -> dict[str, Any]:
+    """Share of reference fields the candidate reproduces exactly, plus the worst fields."""
+    total = matched = identical_records = 0
+    per_field: dict[str, list[int]] = {}
+    for page_number, expected in reference.items():
+        actual = candidate.get(page_number)
+        expected_fields = _fields(expected)
+        actual_fields = _fields(actual) if actual is not None else {}
+        same_record = True
+        for key, value in expected_fields.items():
+            hit = key in actual_fields and actual_fields[key] == value
+            counts = per_field.setdefault(key, [0, 0])
+            counts[0] += hit
+            counts[1] += 1
+            matched += hit
+            total += 1
+            same_record &= hit
+        identical_records += same_record
+    worst = sorted(
+        ((key, hits / count) for key, (hits, count) in per_field.items() if hits < count),
+        key=lambda item: item[1],
+    )
+    return {
+        'records': len(reference),
+        'found': sum(1 for page_number in reference if page_number in candidate),
+        'extra': sum(1 for page_number in candidate if page_number not in reference),
+        'identical_records': identical_records,
+        'field_agreement': matched / total if total else 1.0,
+        'worst_fields': [(key, round(rate, 4)) for key, rate in worst[:5]],
+    }
+
+
+def run_benchmark(pdf_path: Path, page_spec: str, names: list[str]) -> list[dict[str, Any]]:
+    """Every available backend over the same pages; agreement is against pdfplumber."""
+    with PdfplumberBackend(pdf_path) as reference_backend:
+        pages = parse_page_range(page_spec, reference_backend.page_count)
+
+    results: list[dict[str, Any]] = []
+    reference: dict[int, dict[str, Any]] | None = None
+    for name in [DEFAULT_BACKEND, *[name for name in names if name != DEFAULT_BACKEND]]:
+        reason = BACKENDS[name].unavailable()
+        if reason is not None:
+            results.append({'backend': name, 'unavailable': reason})
+            continue
+        started = time.perf_counter()
+        with open_backend(name, pdf_path) as backend:
+            records, reading = extract_records(backend, pages)
+        elapsed = time.perf_counter() - started
+        if reference is None:
+            reference = records
+        results.append({
+            'backend': name,
+            'pages': len(pages),
+            'seconds': round(elapsed, 3),
+            'pages_per_s': round(len(pages) / elapsed, 2) if elapsed else None,
+            'text_pages_per_s': round(len(pages) / reading, 2) if reading else None,
+            **field_agreement(reference, records),
+        })
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Compare text-extraction backends on speed and record agreement.',
+    )
+    parser.add_argument('--pdf', default='VTN FCT 2007.pdf', help='Path to the source PDF.')
+    parser.add_argument('--bench', action='store_true', help='Run the head-to-head benchmark.')
+    parser.add_argument('--pages', default='', help="Page range, e.g. '1-120' or '22,24' (default: all).")
+    parser.add_argument(
+        '--backend',
+        action='append',
+        choices=sorted(BACKENDS),
+        default=[],
+        help='Backends to compare (repeatable; default: all). pdfplumber always runs as the reference.',
+    )
+    parser.add_argument(
+        '--min-agreement',
+        type=float,
+        default=None,
+        help='With --bench, fail (exit 1) if an available backend agrees on fewer fields than this.',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    pdf_path = Path(args.pdf)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f'PDF not found: {pdf_path}')
+
+    if not args.bench:
+        for name, backend in BACKENDS.items():
+            print(f"  {name:12s} {backend.unavailable() or 'available'}")
+        return
+
+    results = run_benchmark(pdf_path, args.pages, args.backend or list(BACKENDS))
+    failed = False
+    print(f'{"backend":12s} {"pages/s":>9s} {"text p/s":>9s} {"records":>9s} {"identical":>10s} {"fields":>8s}')
+    for result in results:
+        if 'unavailable' in result:
+            print(f"{result['backend']:12s} unavailable: {result['unavailable']}")
+            continue
+        print(
+            f"{result['backend']:12s} {result['pages_per_s']:9.2f} {result['text_pages_per_s']:9.2f} "
+            f"{result['found']:>4d}/{result['records']:<4d} {result['identical_records']:>10d} "
+            f"{result['field_agreement']:8.2%}"
+        )
+        for key, rate in result['worst_fields']:
+            print(f'    {key:28s} {rate:.2%}')
+        if args.min_agreement is not None and result['field_agreement'] < args.min_agreement:
+            failed = True
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
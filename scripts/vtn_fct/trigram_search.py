@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""In-process trigram search over the VTN FCT ingredient corpus.
+
+Reproduces `public.fuzzy_match_ingredients()` (pg_trgm + unaccent routing)
+without a database, so search-quality experiments can run offline:
+
+- `search_text` / `search_text_ascii` are built like the
+  `build_food_search_text` trigger (see `search_text.py`).
+- Trigrams follow pg_trgm's `show_trgm`: lower-cased, split on
+  non-alphanumerics, each word padded with two leading and one trailing
+  space.
+- `similarity` is `shared / (|a| + |b| - shared)` rounded to float4,
+  like pg_trgm.
+- Queries with diacritics search `search_text` verbatim; all others
+  search `search_text_ascii` with the folded query.
+
+Usage:
+    python3 scripts/vtn_fct/trigram_search.py "thit lon" --count 5
+    python3 scripts/vtn_fct/trigram_search.py --bench
+    python3 scripts/vtn_fct/trigram_search.py --check
+    python3 scripts/vtn_fct/trigram_search.py --record --database-url "$DATABASE_URL"
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import heapq
+import io
+import json
+import statistics
+import struct
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from search_text import fold_ascii, has_diacritics, record_search_columns
+
+DEFAULT_MATCH_COUNT = 5
+DEFAULT_MATCH_THRESHOLD = 0.15
+SIMILARITY_TOLERANCE = 1e-6
+
+
+@dataclass
+class SearchHit:
+    id: str
+    name_primary: str
+    name_alt: list[str]
+    name_en: str
+    state: str
+    similarity: float
+
+
+# ── pg_trgm semantics ───────────────────────────────────────────────
+
+def _float4(value: float) -> float:
+    """Round to single precision, as pg_trgm's float4 similarity does."""
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def _words(text: str) -> list[str]:
+    words: list[str] = []
+    current: list[str] = []
+    for ch in text:
+        if ch.isalnum():
+            current.append(ch)
+        elif current:
+            words.append(''.join(current))
+            current = []
+    if current:
+        words.append(''.join(current))
+    return words
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Unique trigrams of `text`, equivalent to pg_trgm `show_trgm()`."""
+    result: set[str] = set()
+    for word in _words(text.lower()):
+        padded = f'  {word} '
+        for i in range(len(padded) - 2):
+            result.add(padded[i:i + 3])
+    return frozenset(result)
+
+
+def similarity(left: str, right: str) -> float:
+    """pg_trgm `similarity(left, right)`."""
+    a = trigrams(left)
+    b = trigrams(right)
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return _float4(shared / (len(a) + len(b) - shared))
+
+
+# ── Inverted index ──────────────────────────────────────────────────
+
+class ColumnIndex:
+    """Trigram → posting list of row positions for one text column."""
+
+    def __init__(self, texts: list[str]) -> None:
+        self.sizes: list[int] = []
+        postings: dict[str, list[int]] = {}
+        for position, text in enumerate(texts):
+            grams = trigrams(text)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+        self.postings = postings
+
+    def score(self, query: str, threshold: float) -> list[tuple[float, int]]:
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting:
+                shared.update(posting)
+
+        if threshold <= 0:
+            # similarity 0 still satisfies `>= threshold`
+            candidates = {
+                position: shared.get(position, 0)
+                for position in range(len(self.sizes))
+            }
+        else:
+            candidates = shared
+
+        query_size = len(grams)
+        sizes = self.sizes
+        scored: list[tuple[float, int]] = []
+        for position, count in candidates.items():
+            if sizes[position] == 0:
+                sim = 0.0
+            else:
+                sim = _float4(count / (query_size + sizes[position] - count))
+            if sim >= threshold:
+                scored.append((sim, position))
+        return scored
+
+
+def rank_columns(
+    search_text: ColumnIndex,
+    search_text_ascii: ColumnIndex,
+    query: str,
+    match_count: int | None,
+    match_threshold: float,
+) -> list[tuple[float, int]]:
+    """Route by diacritics, score, and keep the top `match_count` rows."""
+    if has_diacritics(query):
+        scored = search_text.score(query, match_threshold)
+    else:
+        scored = search_text_ascii.score(fold_ascii(query), match_threshold)
+
+    # Ties are broken by corpus order; SQL leaves them unspecified
+    if match_count is None:
+        return sorted(scored, key=lambda item: (-item[0], item[1]))
+    return heapq.nsmallest(
+        max(match_count, 0),
+        scored,
+        key=lambda item: (-item[0], item[1]),
+    )
+
+
+class TrigramIndex:
+    """Offline stand-in for `fuzzy_match_ingredients`."""
+
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self.records = records
+        search_text: list[str] = []
+        search_text_ascii: list[str] = []
+        for record in records:
+            text, text_ascii = record_search_columns(record)
+            search_text.append(text)
+            search_text_ascii.append(text_ascii)
+        self.search_text = ColumnIndex(search_text)
+        self.search_text_ascii = ColumnIndex(search_text_ascii)
+
+    def rank(
+        self,
+        query: str,
+        match_count: int | None = DEFAULT_MATCH_COUNT,
+        match_threshold: float = DEFAULT_MATCH_THRESHOLD,
+    ) -> list[tuple[float, int]]:
+        """`(similarity, row position)` pairs, best first."""
+        return rank_columns(
+            self.search_text,
+            self.search_text_ascii,
+            query,
+            match_count,
+            match_threshold,
+        )
+
+    def search(
+        self,
+        query: str,
+        match_count: int | None = DEFAULT_MATCH_COUNT,
+        match_threshold: float = DEFAULT_MATCH_THRESHOLD,
+    ) -> list[SearchHit]:
+        """Top `match_count` rows by similarity (all rows when None)."""
+        ranked = self.rank(query, match_count, match_threshold)
+
+        hits: list[SearchHit] = []
+        for sim, position in ranked:
+            record = self.records[position]
+            hits.append(
+                SearchHit(
+                    id=record['id'],
+                    name_primary=record['name_primary'],
+                    name_alt=record.get('name_alt') or [],
+                    name_en=record['name_en'],
+                    state=record['state'],
+                    similarity=sim,
+                )
+            )
+        return hits
+
+
+# ── Recorded query set (SQL parity) ─────────────────────────────────
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def load_query_set(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)['queries']
+
+
+def record_sql_results(
+    queries: list[dict[str, Any]],
+    database_url: str,
+) -> list[dict[str, Any]]:
+    """Run every query through the live `fuzzy_match_ingredients` via psql."""
+    sql = (
+        'SELECT id, similarity FROM fuzzy_match_ingredients('
+        ":'q', :count, :threshold);\n"
+    )
+    recorded: list[dict[str, Any]] = []
+    for entry in queries:
+        completed = subprocess.run(
+            [
+                'psql', database_url,
+                '-X', '--csv', '--tuples-only',
+                '-v', 'ON_ERROR_STOP=1',
+                '-v', f"q={entry['query']}",
+                '-v', f"count={entry['match_count']}",
+                '-v', f"threshold={entry['match_threshold']}",
+            ],
+            input=sql,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        rows = [
+            {'id': row[0], 'similarity': float(row[1])}
+            for row in csv.reader(io.StringIO(completed.stdout))
+            if row
+        ]
+        recorded.append({**entry, 'results': rows})
+    return recorded
+
+
+def compare_with_recorded(
+    index: TrigramIndex,
+    entry: dict[str, Any],
+) -> list[str]:
+    """Return mismatch descriptions for one recorded query (empty = parity).
+
+    SQL does not order rows with equal similarity, so a recorded row only
+    has to appear in the offline result with the same similarity, and the
+    similarity sequence and row count must agree.
+    """
+    query = entry['query']
+    expected = entry['results']
+    hits = index.search(query, entry['match_count'], entry['match_threshold'])
+    full = {
+        hit.id: hit.similarity
+        for hit in index.search(query, None, entry['match_threshold'])
+    }
+
+    problems: list[str] = []
+    if len(hits) != len(expected):
+        problems.append(f'{query!r}: {len(hits)} rows, SQL returned {len(expected)}')
+
+    for position, (hit, row) in enumerate(zip(hits, expected)):
+        if abs(hit.similarity - row['similarity']) > SIMILARITY_TOLERANCE:
+            problems.append(
+                f'{query!r} #{position + 1}: similarity {hit.similarity:.6f} '
+                f"!= SQL {row['similarity']:.6f}"
+            )
+    for row in expected:
+        offline = full.get(row['id'])
+        if offline is None or abs(offline - row['similarity']) > SIMILARITY_TOLERANCE:
+            problems.append(
+                f"{query!r}: SQL row {row['id']} ({row['similarity']:.6f}) "
+                f'scored {offline} offline'
+            )
+    return problems
+
+
+# ── Benchmark ───────────────────────────────────────────────────────
+
+def run_benchmark(
+    index: TrigramIndex,
+    queries: list[dict[str, Any]],
+    repeats: int,
+) -> dict[str, float]:
+    timings_us: list[float] = []
+    for _ in range(repeats):
+        for entry in queries:
+            started = time.perf_counter()
+            index.search(entry['query'], entry['match_count'], entry['match_threshold'])
+            timings_us.append((time.perf_counter() - started) * 1e6)
+
+    timings_us.sort()
+    total_s = sum(timings_us) / 1e6
+    return {
+        'queries': len(timings_us),
+        'mean_us': statistics.fmean(timings_us),
+        'p50_us': timings_us[len(timings_us) // 2],
+        'p99_us': timings_us[min(len(timings_us) - 1, int(len(timings_us) * 0.99))],
+        'max_us': timings_us[-1],
+        'qps': len(timings_us) / total_s if total_s else 0.0,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Offline pg_trgm-equivalent ingredient search over extracted VTN FCT records.',
+    )
+    parser.add_argument(
+        'query',
+        nargs='?',
+        help='Query text to search for.',
+    )
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--queries',
+        default='data/vtn_fct_2007/fixtures/search_queries.json',
+        help='Recorded query set used by --check, --bench and --record.',
+    )
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=DEFAULT_MATCH_COUNT,
+        help='match_count for a single query.',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_MATCH_THRESHOLD,
+        help='match_threshold for a single query.',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Compare offline rankings with the recorded SQL results; exit 1 on mismatch.',
+    )
+    parser.add_argument(
+        '--bench',
+        action='store_true',
+        help='Time index build and every query in the recorded set.',
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=200,
+        help='Passes over the query set for --bench.',
+    )
+    parser.add_argument(
+        '--record',
+        action='store_true',
+        help='Re-record SQL results for the query set via psql (needs --database-url).',
+    )
+    parser.add_argument(
+        '--database-url',
+        default=None,
+        help='Postgres URL with fuzzy_match_ingredients installed (for --record).',
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    queries_path = Path(args.queries)
+
+    if args.record:
+        if not args.database_url:
+            raise SystemExit('--record requires --database-url')
+        with queries_path.open('r', encoding='utf-8') as handle:
+            payload = json.load(handle)
+        payload['queries'] = record_sql_results(payload['queries'], args.database_url)
+        with queries_path.open('w', encoding='utf-8') as handle:
+            json.dump(payload, handle, ensure_ascii=False, indent=2)
+            handle.write('\n')
+        print(f"Recorded {len(payload['queries'])} queries → {queries_path}")
+        return
+
+    started = time.perf_counter()
+    index = TrigramIndex(load_records(Path(args.input)))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    if args.check:
+        queries = load_query_set(queries_path)
+        problems: list[str] = []
+        for entry in queries:
+            problems.extend(compare_with_recorded(index, entry))
+        print(f'Parity queries: {len(queries)}')
+        print(f'Mismatches: {len(problems)}')
+        for problem in problems:
+            print(f'  {problem}')
+        if problems:
+            sys.exit(1)
+        return
+
+    if args.bench:
+        queries = load_query_set(queries_path)
+        stats = run_benchmark(index, queries, args.repeats)
+        print(f'Rows indexed: {len(index.records)}')
+        print(f'Index build: {build_ms:.1f} ms')
+        print(f"Queries timed: {stats['queries']:.0f}")
+        print(f"  mean  {stats['mean_us']:8.1f} µs")
+        print(f"  p50   {stats['p50_us']:8.1f} µs")
+        print(f"  p99   {stats['p99_us']:8.1f} µs")
+        print(f"  max   {stats['max_us']:8.1f} µs")
+        print(f"  throughput {stats['qps']:,.0f} queries/s")
+        return
+
+    if args.query is None:
+        raise SystemExit('Provide a query, or use --check / --bench / --record')
+
+    for hit in index.search(args.query, args.count, args.threshold):
+        print(f'  {hit.similarity:.4f}  {hit.id:28s}  {hit.name_primary} — {hit.name_en}')
+
+
+if __name__ == '__main__':
+    main()
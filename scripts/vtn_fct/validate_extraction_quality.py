@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import re
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from vn_transcode import dataset_encoding, is_legacy
 
-MOJIBAKE_MARKERS = re.compile(r'[ªµ¶·¸¹º»¼½¾¿]|\(cid:')
+CACHE_FORMAT = 1
 
 
 def load_records(path: Path) -> list[dict[str, Any]]:
@@ -27,58 +29,94 @@ def is_suspicious_english_name(name: str) -> bool:
     return False
 
 
-def run_quality_checks(records: list[dict[str, Any]]) -> dict[str, Any]:
+CORE_NUTRIENT_KEYS = [
+    'calories_kcal',
+    'protein_g',
+    'carbohydrate_g',
+    'fat_g',
+    'fiber_g',
+    'sodium_mg',
+    'calcium_mg',
+    'iron_mg',
+]
+
+# Full nutrient coverage
+ALL_NUTRIENT_KEYS = [
+    'calories_kcal', 'protein_g', 'carbohydrate_g', 'fat_g',
+    'fiber_g', 'sodium_mg', 'calcium_mg', 'iron_mg',
+    'magnesium_mg', 'phosphorus_mg', 'potassium_mg', 'zinc_mg',
+    'copper_mcg', 'manganese_mg', 'beta_carotene_mcg',
+    'vitamin_a_mcg', 'vitamin_d_mcg', 'vitamin_e_mg',
+    'vitamin_k_mcg', 'vitamin_c_mg', 'vitamin_b1_mg',
+    'vitamin_b2_mg', 'vitamin_pp_mg', 'vitamin_b5_mg',
+    'vitamin_b6_mg', 'vitamin_b9_mcg', 'vitamin_b12_mcg',
+    'vitamin_h_mcg',
+]
+
+
+# ── Per-record checks ───────────────────────────────────────────────
+# Each check only looks at one record, so its result can be cached under
+# the record's content hash (--incremental). Bump a check's version when
+# its logic changes: cached results of older versions are re-evaluated.
+
+def check_mojibake_name(record: dict[str, Any]) -> list[str]:
+    """Dataset encodings under which the name is still legacy.
+
+    Short TCVN3 names can be valid Unicode too ("Bét"), so whether they
+    count depends on the encoding of all names; that is decided when the
+    report is aggregated, keeping this result cacheable per record.
+    """
+    name = record.get('name_primary', '')
+    return [prior for prior in ('unicode', 'tcvn3', 'vni') if is_legacy(name, prior)]
+
+
+def check_suspicious_english_name(record: dict[str, Any]) -> bool:
+    return is_suspicious_english_name(record.get('name_en', ''))
+
+
+def check_nutrients_present(record: dict[str, Any]) -> list[str]:
+    per_100g = record.get('per_100g', {})
+    return [key for key in ALL_NUTRIENT_KEYS if per_100g.get(key) is not None]
+
+
+RECORD_CHECKS: dict[str, tuple[int, Callable[[dict[str, Any]], Any]]] = {
+    'mojibake_name': (2, check_mojibake_name),
+    'suspicious_english_name': (1, check_suspicious_english_name),
+    'nutrients_present': (1, check_nutrients_present),
+}
+
+
+def record_results(record: dict[str, Any]) -> dict[str, Any]:
+    return {name: check(record) for name, (_, check) in RECORD_CHECKS.items()}
+
+
+def aggregate_report(records: list[dict[str, Any]], results: list[dict[str, Any]]) -> dict[str, Any]:
+    """The quality report from per-record check results (in record order)."""
     duplicate_ids = len(records) - len({record['id'] for record in records})
 
+    name_encoding = dataset_encoding(record.get('name_primary', '') for record in records)
     mojibake_rows = [
         record
-        for record in records
-        if MOJIBAKE_MARKERS.search(record.get('name_primary', ''))
+        for record, result in zip(records, results)
+        if name_encoding in result['mojibake_name']
     ]
     suspicious_en_rows = [
         record
-        for record in records
-        if is_suspicious_english_name(record.get('name_en', ''))
+        for record, result in zip(records, results)
+        if result['suspicious_english_name']
     ]
 
-    missing_core = {}
-    for nutrient in [
-        'calories_kcal',
-        'protein_g',
-        'carbohydrate_g',
-        'fat_g',
-        'fiber_g',
-        'sodium_mg',
-        'calcium_mg',
-        'iron_mg',
-    ]:
-        missing_core[nutrient] = sum(
-            1
-            for record in records
-            if record.get('per_100g', {}).get(nutrient) is None
-        )
+    present_counts = dict.fromkeys(ALL_NUTRIENT_KEYS, 0)
+    for result in results:
+        for key in result['nutrients_present']:
+            present_counts[key] += 1
 
-    # Full nutrient coverage
-    all_nutrient_keys = [
-        'calories_kcal', 'protein_g', 'carbohydrate_g', 'fat_g',
-        'fiber_g', 'sodium_mg', 'calcium_mg', 'iron_mg',
-        'magnesium_mg', 'phosphorus_mg', 'potassium_mg', 'zinc_mg',
-        'copper_mcg', 'manganese_mg', 'beta_carotene_mcg',
-        'vitamin_a_mcg', 'vitamin_d_mcg', 'vitamin_e_mg',
-        'vitamin_k_mcg', 'vitamin_c_mg', 'vitamin_b1_mg',
-        'vitamin_b2_mg', 'vitamin_pp_mg', 'vitamin_b5_mg',
-        'vitamin_b6_mg', 'vitamin_b9_mcg', 'vitamin_b12_mcg',
-        'vitamin_h_mcg',
-    ]
+    total = len(records)
+    missing_core = {nutrient: total - present_counts[nutrient] for nutrient in CORE_NUTRIENT_KEYS}
 
     nutrient_coverage = {}
-    total = len(records)
-    for key in all_nutrient_keys:
-        non_null = sum(
-            1
-            for r in records
-            if r.get('per_100g', {}).get(key) is not None
-        )
+    for key in ALL_NUTRIENT_KEYS:
+        non_null = present_counts[key]
         nutrient_coverage[key] = {
             'non_null': non_null,
             'null': total - non_null,
@@ -111,6 +149,68 @@ def run_quality_checks(records: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
+def run_quality_checks(records: list[dict[str, Any]]) -> dict[str, Any]:
+    return aggregate_report(records, [record_results(record) for record in records])
+
+
+# ── Incremental mode ────────────────────────────────────────────────
+
+def record_digest(record: dict[str, Any]) -> str:
+    canonical = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def load_check_cache(path: Path) -> dict[str, dict[str, list[Any]]]:
+    """content hash → check name → [check version, result]; empty if missing or another format."""
+    try:
+        with path.open('r', encoding='utf-8') as handle:
+            payload = json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if payload.get('format') != CACHE_FORMAT:
+        return {}
+    return payload['records']
+
+
+def write_check_cache(path: Path, entries: dict[str, dict[str, list[Any]]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix('.tmp')
+    with partial.open('w', encoding='utf-8') as handle:
+        json.dump({'format': CACHE_FORMAT, 'records': entries}, handle, ensure_ascii=False)
+    partial.replace(path)
+
+
+def run_quality_checks_incremental(
+    records: list[dict[str, Any]],
+    cache_path: Path,
+) -> tuple[dict[str, Any], dict[str, int]]:
+    """Same report as run_quality_checks, re-running only checks whose record
+    content or check version changed since the cached run."""
+    cached = load_check_cache(cache_path)
+    entries: dict[str, dict[str, list[Any]]] = {}
+    results: list[dict[str, Any]] = []
+    stats = {'records': len(records), 'records_rechecked': 0, 'checks_evaluated': 0}
+
+    for record in records:
+        digest = record_digest(record)
+        entry = entries.get(digest) or cached.get(digest, {})
+        rechecked = False
+        for name, (version, check) in RECORD_CHECKS.items():
+            previous = entry.get(name)
+            if previous is None or previous[0] != version:
+                entry[name] = [version, check(record)]
+                stats['checks_evaluated'] += 1
+                rechecked = True
+        stats['records_rechecked'] += rechecked
+        # Only hashes still present are kept, so the cache tracks the current records
+        entries[digest] = {name: entry[name] for name in RECORD_CHECKS}
+        results.append({name: entry[name][1] for name in RECORD_CHECKS})
+
+    if stats['checks_evaluated'] or set(entries) != set(cached):
+        write_check_cache(cache_path, entries)
+    return aggregate_report(records, results), stats
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description='Run extraction quality checks for VTN FCT artifacts.',
@@ -125,6 +225,22 @@ def build_parser() -> argparse.ArgumentParser:
         default='data/vtn_fct_2007/validation/quality_report.json',
         help='Path to write quality report JSON.',
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Re-run checks only for records whose content (or check version) changed, '
+             'reusing per-record results cached in --cache.',
+    )
+    parser.add_argument(
+        '--cache',
+        default='data/vtn_fct_2007/validation/quality_check_cache.json',
+        help='Per-record check results for --incremental, keyed by record content hash.',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Build the report incrementally and from scratch and fail (exit 1) if they differ.',
+    )
     return parser
 
 
@@ -132,7 +248,20 @@ def main() -> None:
     args = build_parser().parse_args()
 
     records = load_records(Path(args.input))
-    report = run_quality_checks(records)
+    started = time.perf_counter()
+    if args.incremental or args.check:
+        report, stats = run_quality_checks_incremental(records, Path(args.cache))
+        print(
+            f"Re-checked {stats['records_rechecked']}/{stats['records']} records "
+            f"({stats['checks_evaluated']} check evaluations) in {time.perf_counter() - started:.3f}s"
+        )
+    else:
+        report = run_quality_checks(records)
+    if args.check:
+        if report != run_quality_checks(records):
+            print('FAIL incremental report differs from the full run')
+            raise SystemExit(1)
+        print('Incremental report identical to the full run: OK')
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
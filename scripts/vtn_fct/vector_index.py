@@ -0,0 +1,656 @@
+#!/usr/bin/env python3
+"""Offline vector index standing in for the pgvector semantic fallback.
+
+`public.match_ingredients()` ranks rows by cosine similarity of Gemini
+embeddings of `build_food_embedding_text` (`buildEmbeddingText` in
+`scripts/backfill_embeddings.ts`). This module reproduces the search side
+without network access or a database, so fallback ranking and latency can
+be measured locally:
+
+- Embeddings are deterministic hashed character n-grams (3- and 4-grams of
+  pg_trgm-style padded words, over the text and its unaccented form, so
+  "thit lon" reaches "Thịt lợn") in 768 signed buckets, L2-normalized.
+  They are lexical, not semantic: rankings resemble the Gemini ones only
+  where names share spelling.
+- Exact search is a blocked matrix product with a running top-k.
+- Approximate search is IVF: spherical k-means centroids, vectors stored
+  grouped by list, and each query scans only its `nprobe` closest lists.
+- Queries are batched (Q × 768 at a time) and the index is saved as `.npy`
+  files that are memory-mapped on load.
+
+At the corpus's 526 rows an exact scan is faster than IVF and loses
+nothing, so queries are exact unless `--nprobe` is given; `--bench` shows
+where IVF starts to pay off (synthetic corpora of mixed real vectors).
+
+Usage:
+    python3 scripts/vtn_fct/vector_index.py --build [--nlist 23]
+    python3 scripts/vtn_fct/vector_index.py "thit lon nac" [--nprobe 4]
+    python3 scripts/vtn_fct/vector_index.py --id fao_vn_2007_1004_raw --count 5
+    python3 scripts/vtn_fct/vector_index.py --check
+    python3 scripts/vtn_fct/vector_index.py --bench --bench-sizes 526 20000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from search_text import fold_ascii
+
+# Bump when the embedding function changes (stale indexes are rebuilt)
+EMBEDDING_VERSION = '1'
+DIMENSIONS = 768  # vector(768), as for gemini-embedding-001
+NGRAM_SIZES = (3, 4)
+DEFAULT_INDEX_DIR = Path('data/vtn_fct_2007/vector_index')
+# match_ingredients() defaults
+DEFAULT_MATCH_COUNT = 3
+DEFAULT_MATCH_THRESHOLD = 0.5
+DEFAULT_NPROBE = 4
+KMEANS_ITERATIONS = 20
+KMEANS_SAMPLE_PER_LIST = 64
+ROW_BLOCK = 65536
+
+
+@dataclass
+class VectorHit:
+    id: str
+    name_primary: str
+    name_en: str
+    state: str
+    similarity: float
+
+
+# ── Embeddings ──────────────────────────────────────────────────────
+
+def embedding_text(record: dict[str, Any]) -> str:
+    """`buildEmbeddingText`: names, English name and both food group names."""
+    name_alt = record.get('name_alt')
+    alt = ' ' + ' '.join(name_alt) if name_alt else ''
+    return (
+        f"{record['name_primary']}{alt} {record['name_en']} "
+        f"{record.get('type_vn', '')} {record.get('type_en', '')}"
+    )
+
+
+def _words(text: str) -> list[str]:
+    words: list[str] = []
+    current: list[str] = []
+    for ch in text:
+        if ch.isalnum():
+            current.append(ch)
+        elif current:
+            words.append(''.join(current))
+            current = []
+    if current:
+        words.append(''.join(current))
+    return words
+
+
+@lru_cache(maxsize=1 << 18)
+def _bucket(gram: str) -> tuple[int, float]:
+    """Stable (bucket, sign) for a feature; Python's hash() is salted per process."""
+    value = int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'little')
+    return value % DIMENSIONS, -1.0 if value >> 63 else 1.0
+
+
+def ngram_counts(text: str) -> dict[str, int]:
+    """Character n-grams of the padded words of `text` and of its unaccented form."""
+    counts: dict[str, int] = {}
+    lowered = unicodedata.normalize('NFC', text).lower()
+    folded = fold_ascii(lowered)
+    for variant in (lowered, folded) if folded != lowered else (lowered,):
+        for word in _words(variant):
+            padded = f'  {word} '
+            for size in NGRAM_SIZES:
+                for start in range(len(padded) - size + 1):
+                    gram = padded[start:start + size]
+                    counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    """len(texts) × 768 float32 unit vectors (zero rows for texts without words)."""
+    vectors = np.zeros((len(texts), DIMENSIONS), dtype=np.float32)
+    for row, text in enumerate(texts):
+        vector = vectors[row]
+        for gram, count in ngram_counts(text).items():
+            bucket, sign = _bucket(gram)
+            vector[bucket] += sign * (1.0 + math.log(count))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def corpus_digest(texts: list[str]) -> str:
+    digest = hashlib.sha256(f'{EMBEDDING_VERSION}:{DIMENSIONS}:{NGRAM_SIZES}'.encode('utf-8'))
+    for text in texts:
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+# ── Top-k ───────────────────────────────────────────────────────────
+
+def _empty_top_k(queries: int, k: int) -> tuple[np.ndarray, np.ndarray]:
+    return np.full((queries, k), -1, dtype=np.int64), np.full((queries, k), -np.inf, dtype=np.float32)
+
+
+def _merge_top_k(
+    best_rows: np.ndarray,
+    best_sims: np.ndarray,
+    rows: np.ndarray,
+    sims: np.ndarray,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    merged_sims = np.concatenate([best_sims, sims], axis=1)
+    merged_rows = np.concatenate([best_rows, np.broadcast_to(rows, sims.shape)], axis=1)
+    keep = np.argpartition(-merged_sims, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(merged_rows, keep, axis=1), np.take_along_axis(merged_sims, keep, axis=1)
+
+
+def _sorted_top_k(rows: np.ndarray, sims: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Best first; equal similarities by row so exact and IVF results compare."""
+    order = np.lexsort((rows, -sims), axis=-1)
+    return np.take_along_axis(rows, order, axis=1), np.take_along_axis(sims, order, axis=1)
+
+
+# ── Index ───────────────────────────────────────────────────────────
+
+def spherical_kmeans(
+    vectors: np.ndarray,
+    nlist: int,
+    seed: int,
+    iterations: int = KMEANS_ITERATIONS,
+) -> np.ndarray:
+    """nlist unit centroids trained on a sample of (unit) `vectors`."""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * KMEANS_SAMPLE_PER_LIST)
+    sample = np.asarray(vectors[rng.choice(len(vectors), size=sample_size, replace=False)])
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+    for _ in range(iterations):
+        scores = sample @ centroids.T
+        assignment = scores.argmax(axis=1)
+        order = np.argsort(assignment, kind='stable')
+        lists, starts = np.unique(assignment[order], return_index=True)
+        sums = np.add.reduceat(sample[order], starts, axis=0)
+        updated = centroids.copy()
+        updated[lists] = sums
+        # Empty lists restart at the samples their centroid fits worst
+        empty = np.setdiff1d(np.arange(nlist), lists)
+        if len(empty):
+            worst = np.argsort(scores[np.arange(sample_size), assignment])[:len(empty)]
+            updated[empty] = sample[worst]
+        norms = np.linalg.norm(updated, axis=1, keepdims=True)
+        updated /= np.where(norms > 0, norms, 1.0)
+        if np.allclose(updated, centroids):
+            break
+        centroids = updated
+    return centroids.astype(np.float32)
+
+
+def default_nlist(rows: int) -> int:
+    return max(1, min(rows, round(math.sqrt(rows))))
+
+
+class VectorIndex:
+    """Unit vectors grouped by IVF list, with exact and IVF top-k search.
+
+    Row positions are positions in list order; `ids[row]` maps them back.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        meta: dict[str, Any],
+    ) -> None:
+        self.vectors = vectors
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.meta = meta
+        self.ids: list[str] = meta['ids']
+        self.index_by_id = {identifier: row for row, identifier in enumerate(self.ids)}
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        meta: dict[str, Any],
+        nlist: int | None = None,
+        seed: int = 2007,
+    ) -> VectorIndex:
+        """Cluster `vectors`; `meta['ids']` and other per-row lists are reordered to match."""
+        nlist = default_nlist(len(vectors)) if nlist is None else max(1, min(nlist, len(vectors)))
+        centroids = spherical_kmeans(vectors, nlist, seed)
+        assignment = np.concatenate([
+            (vectors[start:start + ROW_BLOCK] @ centroids.T).argmax(axis=1)
+            for start in range(0, len(vectors), ROW_BLOCK)
+        ])
+        order = np.argsort(assignment, kind='stable')
+        list_offsets = np.searchsorted(assignment[order], np.arange(nlist + 1)).astype(np.int64)
+        meta = dict(meta)
+        for key in ('ids', 'names', 'names_en', 'states'):
+            if key in meta:
+                meta[key] = [meta[key][position] for position in order]
+        meta['nlist'] = nlist
+        return cls(np.ascontiguousarray(vectors[order]), centroids, list_offsets, meta)
+
+    # ── Persistence ──
+
+    def save(self, directory: Path) -> None:
+        """One .npy per array (memory-mappable), meta.json written last."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, array in (
+            ('vectors', self.vectors),
+            ('centroids', self.centroids),
+            ('list_offsets', self.list_offsets),
+        ):
+            tmp_path = directory / f'{name}.tmp.npy'
+            np.save(tmp_path, array)
+            os.replace(tmp_path, directory / f'{name}.npy')
+        tmp_path = directory / 'meta.json.tmp'
+        with tmp_path.open('w', encoding='utf-8') as handle:
+            json.dump(self.meta, handle, ensure_ascii=False)
+        os.replace(tmp_path, directory / 'meta.json')
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> VectorIndex:
+        mode = 'r' if mmap else None
+        with (directory / 'meta.json').open('r', encoding='utf-8') as handle:
+            meta = json.load(handle)
+        return cls(
+            np.load(directory / 'vectors.npy', mmap_mode=mode),
+            np.load(directory / 'centroids.npy'),
+            np.load(directory / 'list_offsets.npy'),
+            meta,
+        )
+
+    # ── Search ──
+
+    def search_exact(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Q × k `(rows, similarities)` over every row; empty slots hold −1 / −inf."""
+        k = min(k, len(self.ids))
+        best_rows, best_sims = _empty_top_k(len(queries), k)
+        for start in range(0, len(self.ids), ROW_BLOCK):
+            block = self.vectors[start:start + ROW_BLOCK]
+            rows = np.arange(start, start + len(block))
+            best_rows, best_sims = _merge_top_k(best_rows, best_sims, rows, queries @ block.T, k)
+        return _sorted_top_k(best_rows, best_sims)
+
+    def search_ivf(self, queries: np.ndarray, k: int, nprobe: int) -> tuple[np.ndarray, np.ndarray]:
+        """Like `search_exact`, scanning only each query's `nprobe` closest lists."""
+        k = min(k, len(self.ids))
+        nprobe = max(1, min(nprobe, self.nlist))
+        centroid_sims = queries @ self.centroids.T
+        probes = np.argpartition(-centroid_sims, nprobe - 1, axis=1)[:, :nprobe]
+
+        # Visit each list once, with the batch of queries probing it
+        probe_lists = probes.ravel()
+        probe_queries = np.repeat(np.arange(len(queries)), nprobe)
+        order = np.argsort(probe_lists, kind='stable')
+        probe_lists, probe_queries = probe_lists[order], probe_queries[order]
+        lists, starts = np.unique(probe_lists, return_index=True)
+        ends = np.append(starts[1:], len(probe_lists))
+
+        best_rows, best_sims = _empty_top_k(len(queries), k)
+        for list_id, begin, end in zip(lists, starts, ends):
+            first, last = self.list_offsets[list_id], self.list_offsets[list_id + 1]
+            if first == last:
+                continue
+            members = probe_queries[begin:end]
+            sims = queries[members] @ self.vectors[first:last].T
+            best_rows[members], best_sims[members] = _merge_top_k(
+                best_rows[members], best_sims[members], np.arange(first, last), sims, k
+            )
+        return _sorted_top_k(best_rows, best_sims)
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        nprobe: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """IVF search, or exact when `nprobe` is None."""
+        if nprobe is None:
+            return self.search_exact(queries, k)
+        return self.search_ivf(queries, k, nprobe)
+
+    def match(
+        self,
+        queries: np.ndarray,
+        match_count: int = DEFAULT_MATCH_COUNT,
+        match_threshold: float = DEFAULT_MATCH_THRESHOLD,
+        nprobe: int | None = None,
+    ) -> list[list[VectorHit]]:
+        """`match_ingredients()` per query row: top `match_count` at or above the threshold."""
+        rows, sims = self.search(queries, match_count, nprobe)
+        names = self.meta.get('names', self.ids)
+        names_en = self.meta.get('names_en', [''] * len(self.ids))
+        states = self.meta.get('states', [''] * len(self.ids))
+        results: list[list[VectorHit]] = []
+        for query_rows, query_sims in zip(rows, sims):
+            results.append([
+                VectorHit(
+                    id=self.ids[row],
+                    name_primary=names[row],
+                    name_en=names_en[row],
+                    state=states[row],
+                    similarity=float(sim),
+                )
+                for row, sim in zip(query_rows, query_sims)
+                if row >= 0 and sim >= match_threshold
+            ])
+        return results
+
+
+def index_from_records(
+    records: list[dict[str, Any]],
+    nlist: int | None = None,
+    seed: int = 2007,
+) -> VectorIndex:
+    texts = [embedding_text(record) for record in records]
+    meta = {
+        'embedding_version': EMBEDDING_VERSION,
+        'dimensions': DIMENSIONS,
+        'corpus_sha256': corpus_digest(texts),
+        'ids': [record['id'] for record in records],
+        'names': [record['name_primary'] for record in records],
+        'names_en': [record['name_en'] for record in records],
+        'states': [record.get('state', '') for record in records],
+    }
+    return VectorIndex.build(embed(texts), meta, nlist, seed)
+
+
+def open_index(records: list[dict[str, Any]], directory: Path, nlist: int | None = None) -> VectorIndex:
+    """The saved index (memory-mapped), rebuilt first when missing or stale."""
+    digest = corpus_digest([embedding_text(record) for record in records])
+    if (directory / 'meta.json').exists():
+        index = VectorIndex.load(directory)
+        if index.meta.get('corpus_sha256') == digest and (nlist is None or nlist == index.nlist):
+            return index
+    index = index_from_records(records, nlist)
+    index.save(directory)
+    print(f'Built vector index: {len(index.ids)} rows, {index.nlist} lists → {directory}', file=sys.stderr)
+    return VectorIndex.load(directory)
+
+
+# ── Check ───────────────────────────────────────────────────────────
+
+def run_check(records: list[dict[str, Any]], directory: Path, k: int) -> list[str]:
+    """Search mechanics from lib/db/__tests__/search-pipeline.test.ts, plus IVF/mmap parity."""
+    problems: list[str] = []
+    index = open_index(records, directory)
+    in_memory = VectorIndex.load(directory, mmap=False)
+    queries = np.asarray(index.vectors)
+
+    # A row used as the query matches itself first with similarity ≈ 1
+    rows, sims = index.search_exact(queries, 1)
+    for row in np.flatnonzero((rows[:, 0] != np.arange(len(queries))) & (sims[:, 0] < 0.99)):
+        problems.append(f'{index.ids[row]}: self-match missing (best {index.ids[rows[row, 0]]})')
+
+    rows, sims = index.search_exact(queries, k)
+    if np.any(np.diff(sims, axis=1) > 0):
+        problems.append('exact results not sorted by similarity')
+    loose = index.match(queries[:50], 20, 0.3, nprobe=None)
+    strict = index.match(queries[:50], 20, 0.8, nprobe=None)
+    for loose_hits, strict_hits in zip(loose, strict):
+        if len(strict_hits) > len(loose_hits) or any(hit.similarity < 0.8 for hit in strict_hits):
+            problems.append('threshold does not filter weak matches')
+            break
+    if any(len(hits) > 3 for hits in index.match(queries, 3, 0.0, nprobe=None)):
+        problems.append('match_count does not limit results')
+
+    # Probing every list is exact search; mmap and in-memory loads agree
+    full_rows, full_sims = index.search_ivf(queries, k, index.nlist)
+    if not (np.array_equal(full_rows, rows) and np.allclose(full_sims, sims)):
+        problems.append(f'IVF with nprobe={index.nlist} differs from exact search')
+    memory_rows, _ = in_memory.search_ivf(queries, k, DEFAULT_NPROBE)
+    mapped_rows, _ = index.search_ivf(queries, k, DEFAULT_NPROBE)
+    if not np.array_equal(memory_rows, mapped_rows):
+        problems.append('memory-mapped index answers differently from the in-memory one')
+
+    # Unaccented queries land on the accented rows
+    by_id = {record['id']: record for record in records}
+    for identifier in index.ids[:50]:
+        text = fold_ascii(by_id[identifier]['name_primary'])
+        hits = index.match(embed([text]), 5, 0.0, nprobe=None)[0]
+        names = {hit.name_primary for hit in hits}
+        if by_id[identifier]['name_primary'] not in names:
+            problems.append(f'{text!r}: {identifier} not in the top 5')
+    return problems
+
+
+# ── Benchmark ───────────────────────────────────────────────────────
+
+def synthetic_vectors(base: np.ndarray, rows: int, seed: int) -> np.ndarray:
+    """Real vectors mixed with a second row and noise, renormalized."""
+    rng = np.random.default_rng(seed)
+    vectors = base[rng.integers(0, len(base), size=rows)].copy()
+    vectors += 0.4 * base[rng.integers(0, len(base), size=rows)]
+    vectors += rng.normal(0.0, 0.02, size=vectors.shape).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def recall(expected: np.ndarray, actual: np.ndarray) -> float:
+    found = sum(len(np.intersect1d(want, got)) for want, got in zip(expected, actual))
+    return found / expected.size
+
+
+def run_benchmark(
+    records: list[dict[str, Any]],
+    sizes: list[int],
+    queries: int,
+    k: int,
+    nprobes: list[int],
+    seed: int,
+    workdir: Path,
+    query_texts: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Exact vs IVF per size; the real corpus is queried with `query_texts` when given."""
+    base = embed([embedding_text(record) for record in records])
+    results: list[dict[str, Any]] = []
+    for size in sizes:
+        vectors = base if size == len(base) else synthetic_vectors(base, size, seed)
+        meta = {'ids': [str(row) for row in range(size)]}
+
+        started = time.perf_counter()
+        built = VectorIndex.build(vectors, meta, seed=seed)
+        build_s = time.perf_counter() - started
+        directory = workdir / f'bench_{size}'
+        built.save(directory)
+        started = time.perf_counter()
+        index = VectorIndex.load(directory)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        if size == len(base) and query_texts:
+            batch = embed(query_texts)
+        else:
+            # Fresh mixtures, not copies of indexed rows
+            batch = synthetic_vectors(base, queries, seed + 1 + size)
+
+        # Rows are in list order in both indexes, so results compare by id
+        started = time.perf_counter()
+        exact_rows, _ = index.search_exact(batch, k)
+        exact_s = time.perf_counter() - started
+        row: dict[str, Any] = {
+            'rows': size,
+            'queries': len(batch),
+            'nlist': index.nlist,
+            'build_s': build_s,
+            'load_ms': load_ms,
+            'exact_s': exact_s,
+            'ivf': [],
+        }
+        for nprobe in nprobes:
+            if nprobe > index.nlist:
+                continue
+            started = time.perf_counter()
+            ivf_rows, _ = index.search_ivf(batch, k, nprobe)
+            ivf_s = time.perf_counter() - started
+            row['ivf'].append({'nprobe': nprobe, 'seconds': ivf_s, 'recall': recall(exact_rows, ivf_rows)})
+        results.append(row)
+    return results
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    with path.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Offline stand-in for match_ingredients(): hashed n-gram vectors, exact and IVF top-k.',
+    )
+    parser.add_argument('query', nargs='*', help='Query texts (batched).')
+    parser.add_argument(
+        '--input',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Extracted ingredients JSON path.',
+    )
+    parser.add_argument(
+        '--index-dir',
+        default=str(DEFAULT_INDEX_DIR),
+        help='Directory of the saved index (built on first use, rebuilt when stale).',
+    )
+    parser.add_argument(
+        '--id',
+        dest='ids',
+        action='append',
+        default=[],
+        help="Use a row's own vector as the query, as the search-pipeline tests do (repeatable).",
+    )
+    parser.add_argument('--count', type=int, default=DEFAULT_MATCH_COUNT, help='match_count.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_MATCH_THRESHOLD,
+        help='match_threshold (minimum cosine similarity).',
+    )
+    parser.add_argument(
+        '--nprobe',
+        type=int,
+        default=None,
+        help='Scan only this many IVF lists per query (default: exact search over every row).',
+    )
+    parser.add_argument('--nlist', type=int, default=None, help='IVF lists when building (default √rows).')
+    parser.add_argument('--build', action='store_true', help='(Re)build and save the index, then exit.')
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Check search mechanics and IVF/mmap parity against exact search; exit 1 on failure.',
+    )
+    parser.add_argument('--bench', action='store_true', help='Recall and latency of IVF vs exact search.')
+    parser.add_argument(
+        '--bench-sizes',
+        type=int,
+        nargs='+',
+        default=None,
+        help='Row counts for --bench (default: the corpus, 20000, 100000).',
+    )
+    parser.add_argument('--bench-queries', type=int, default=256, help='Queries per batch for --bench.')
+    parser.add_argument(
+        '--queries',
+        default='data/vtn_fct_2007/fixtures/search_queries.json',
+        help='Recorded query set; its strings query the real corpus in --bench.',
+    )
+    parser.add_argument(
+        '--bench-nprobe',
+        type=int,
+        nargs='+',
+        default=[1, 2, 4, 8, 16, 32],
+        help='nprobe values compared in --bench.',
+    )
+    parser.add_argument('--k', type=int, default=10, help='Top-k for --check / --bench.')
+    parser.add_argument('--seed', type=int, default=2007, help='Random seed for --bench.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_records(Path(args.input))
+    directory = Path(args.index_dir)
+
+    if args.build:
+        started = time.perf_counter()
+        index = index_from_records(records, args.nlist)
+        index.save(directory)
+        print(
+            f'Indexed {len(index.ids)} rows into {index.nlist} lists '
+            f'in {time.perf_counter() - started:.2f}s → {directory}'
+        )
+        return
+
+    if args.check:
+        problems = run_check(records, directory, args.k)
+        print(f'Rows checked: {len(records)}')
+        print(f'Problems: {len(problems)}')
+        for problem in problems:
+            print(f'  {problem}')
+        if problems:
+            sys.exit(1)
+        return
+
+    if args.bench:
+        sizes = args.bench_sizes or [len(records), 20000, 100000]
+        print(f'k={args.k}, {DIMENSIONS} dims; synthetic sizes use batches of {args.bench_queries} mixed vectors')
+        workdir = directory.parent / f'{directory.name}_bench'
+        # The corpus itself is queried with the recorded search strings and unaccented names
+        with Path(args.queries).open('r', encoding='utf-8') as handle:
+            query_texts = [entry['query'] for entry in json.load(handle)['queries']]
+        query_texts += [fold_ascii(record['name_primary']) for record in records]
+        query_texts = query_texts[:args.bench_queries]
+        for row in run_benchmark(
+            records, sizes, args.bench_queries, args.k, args.bench_nprobe, args.seed, workdir, query_texts
+        ):
+            exact_qps = row['queries'] / row['exact_s']
+            print(
+                f"  {row['rows']:>9,} rows, {row['nlist']} lists, {row['queries']} queries: "
+                f"build {row['build_s']:.2f}s, mmap load {row['load_ms']:.1f} ms"
+            )
+            print(f"    exact        {row['exact_s'] * 1000:8.1f} ms  {exact_qps:>9,.0f} q/s  recall 1.000")
+            for ivf in row['ivf']:
+                print(
+                    f"    nprobe {ivf['nprobe']:>3}   {ivf['seconds'] * 1000:8.1f} ms  "
+                    f"{row['queries'] / ivf['seconds']:>9,.0f} q/s  recall {ivf['recall']:.3f}  "
+                    f"({row['exact_s'] / ivf['seconds']:.1f}× exact)"
+                )
+        return
+
+    if not args.query and not args.ids:
+        raise SystemExit('Provide query text or --id (or use --build / --check / --bench)')
+
+    index = open_index(records, directory, args.nlist)
+    unknown = [identifier for identifier in args.ids if identifier not in index.index_by_id]
+    if unknown:
+        raise SystemExit(f"Unknown id(s): {', '.join(unknown)}")
+
+    labels = [*args.query, *args.ids]
+    queries = np.concatenate([
+        embed(args.query),
+        np.asarray(index.vectors[[index.index_by_id[identifier] for identifier in args.ids]]),
+    ]).astype(np.float32)
+    for label, hits in zip(labels, index.match(queries, args.count, args.threshold, args.nprobe)):
+        print(label)
+        for hit in hits:
+            print(f'  {hit.similarity:.4f}  {hit.id:28s}  {hit.name_primary} — {hit.name_en}')
+
+
+if __name__ == '__main__':
+    main()
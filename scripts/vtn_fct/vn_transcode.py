@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+"""Legacy Vietnamese encodings (TCVN3, VNI) → Unicode, with detection.
+
+The VTN FCT PDF fonts are TCVN3 (ABC): one Latin-1 glyph per Vietnamese
+letter, e.g. "Thùc phÈm" = "Thực phẩm". Other tables still circulate in
+VNI-Windows, where a base letter is followed by a mark glyph, e.g.
+"Thöïc phaåm". Both decoders are precompiled `str.translate` tables:
+
+- TCVN3: one char → one char
+- VNI: each mark glyph → Unicode combining marks, then NFC composes
+  "a" + U+0302 + U+0323 into "ậ"; the few VNI letters (ô = ơ, ö = ư,
+  ñ = đ, æ/ó/ò = ỉ/ĩ/ị, î = ỵ) map to base + combining mark as well
+
+`detect_encoding` picks the encoding of a string or page from character
+histograms of each reading: the one that leaves the fewest characters that
+are not Vietnamese letters (and syllables with two tone marks) wins, and a
+legacy reading beats a valid Unicode one only with positive evidence
+(TCVN3 "phÈm" casing, VNI mark glyphs after a vowel), so correct Unicode
+is never "repaired". Whole pages are unambiguous; short names like "Bét"
+can be either and stay Unicode.
+
+Usage:
+    python3 scripts/vtn_fct/vn_transcode.py "Thùc phÈm"
+    python3 scripts/vtn_fct/vn_transcode.py --input table.csv --output table.utf8.csv --field name
+    python3 scripts/vtn_fct/vn_transcode.py --check
+    python3 scripts/vtn_fct/vn_transcode.py --bench
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+# ── TCVN3 → Vietnamese Unicode mapping ──────────────────────────────
+# Empirically derived from every non-ASCII character in the extracted
+# food-name corpus, cross-checked against known Vietnamese food names
+# (đậu/bean, bột/flour, thịt/meat, sữa/milk, nước/water …).
+#
+# Keys = characters as they appear in the JSON (PDF extractor read
+#         TCVN3 font bytes as Latin-1 / CP-1252).
+# Values = correct Vietnamese Unicode characters with diacritics.
+
+TCVN3_TO_VIET: dict[str, str] = {
+    # ── Uppercase ──────────────────────────────────────────────
+    '\u00A7': 'Đ',   # § → Đ  (§Ëu = Đậu)
+
+    # ── Base vowels with structural marks (no tone) ───────────
+    '\u00A8': 'ă',   # ¨       (M¨ng = Măng)
+    '\u00A9': 'â',   # ©       (t©y = tây)
+    '\u00AA': 'ê',   # ª       (chiªn = chiên)
+    '\u00AB': 'ô',   # «       (Ng« = Ngô)
+    '\u00AC': 'ơ',   # ¬       (t−¬i = tươi)
+    '\u00AE': 'đ',   # ®       (®Ëu = đậu)
+    '\u2212': 'ư',   # − MINUS SIGN   (n−íc = nước)
+    '\u03BC': 'à',   # μ Greek mu     (vμng = vàng)
+    '\u00B5': 'à',   # µ MICRO SIGN   (alternate of 0xB5)
+
+    # ── a: à ả ã á ạ ──────────────────────────────────────────
+    '\u00B6': 'ả',   # ¶       (Qu¶ = Quả)
+    '\u00B7': 'ã',   # ·       (Nh·n = Nhãn)
+    '\u00B8': 'á',   # ¸       (Gi¸ = Giá)
+    '\u00B9': 'ạ',   # ¹       (H¹t = Hạt)
+
+    # ── ă: ắ ằ ẳ ẵ ặ ────────────────────────────────────────
+    '\u00BE': 'ắ',   # ¾       (b¾p = bắp)
+    '\u00BF': 'ằ',   # ¿
+    '\u00C0': 'ẳ',   # À
+    '\u00C1': 'ẵ',   # Á
+    '\u00C6': 'ặ',   # Æ       (®Æc = đặc)
+
+    # ── â: ầ ẩ ẫ ấ ậ ─────────────────────────────────────────
+    '\u00C7': 'ầ',   # Ç       (dÇu = dầu)
+    '\u00C8': 'ẩ',   # È       (quÈy = quẩy)
+    '\u00C9': 'ẫ',   # É
+    '\u00CA': 'ấ',   # Ê       (GÊc = Gấc)
+    '\u00CB': 'ậ',   # Ë       (®Ëu = đậu)
+
+    # ── e: è ẽ ẻ é ẹ ─────────────────────────────────────────
+    '\u00CC': 'è',   # Ì       (DÇu mÌ = Dầu mè)
+    '\u00CD': 'ẽ',   # Í
+    '\u00CE': 'ẻ',   # Î       (tÎ = tẻ, dÎ = dẻ)
+    '\u00D0': 'é',   # Ð       (bÐo = béo)
+    '\u00D1': 'ẹ',   # Ñ       (HÑ = Hẹ, ghÑ = ghẹ)
+
+    # ── ê: ề ể ễ ế ệ ─────────────────────────────────────────
+    '\u00D2': 'ề',   # Ò       (riÒng = riềng)
+    '\u00D3': 'ể',   # Ó       (bÓ = bể)
+    '\u00D4': 'ễ',   # Ô       (niÔng = niễng)
+    '\u00D5': 'ế',   # Õ       (KhÕ = Khế)
+    '\u00D6': 'ệ',   # Ö       (ViÖt = Việt)
+
+    # ── i: ì ỉ ĩ í ị ──────────────────────────────────────────
+    '\u00D7': 'ì',   # ×       (m× = mì)
+    '\u00D8': 'ỉ',   # Ø
+    '\u00DC': 'ĩ',   # Ü       (nhÜ = nhĩ)
+    '\u00DD': 'í',   # Ý       (bÝ = bí)
+    '\u00DE': 'ị',   # Þ       (ThÞt = Thịt)
+
+    # ── o: ò õ ỏ ó ọ ──────────────────────────────────────────
+    '\u00DF': 'ò',   # ß       (bß = bò)
+    '\u00E0': 'õ',   # à       (o tilde)
+    '\u00E1': 'ỏ',   # á       (®á = đỏ)
+    '\u00E3': 'ó',   # ã       (ngãt = ngót)
+    '\u00E4': 'ọ',   # ä       (sä = sọ)
+
+    # ── ô: ồ ổ ỗ ố ộ ─────────────────────────────────────────
+    '\u00E5': 'ồ',   # å       (rång = rồng)
+    '\u00E6': 'ổ',   # æ       (æi = ổi)
+    '\u00E7': 'ỗ',   # ç       (ngçng = ngỗng)
+    '\u00E8': 'ố',   # è       (Cèm = Cốm)
+    '\u00E9': 'ộ',   # é       (Bét = Bột)
+
+    # ── ơ: ờ ở ỡ ớ ợ ─────────────────────────────────────────
+    '\u00EA': 'ờ',   # ê       (th−êng = thường)
+    '\u00EB': 'ở',   # ë       (B−ëi = Bưởi)
+    '\u00EC': 'ỡ',   # ì       (NÊm mì = Nấm mỡ)
+    '\u00ED': 'ớ',   # í       (n−íc = nước)
+    '\u00EE': 'ợ',   # î       (lîn = lợn)
+
+    # ── u: ù ủ ũ ú ụ ─────────────────────────────────────────
+    '\u00EF': 'ù',   # ï       (Cïi = Cùi)
+    '\u00F1': 'ủ',   # ñ       (Cñ = Củ)
+    '\u00F2': 'ũ',   # ò       (®òa = đũa)
+    '\u00F3': 'ú',   # ó       (Bón = Bún)
+    '\u00F4': 'ụ',   # ô       (phô = phụ)
+
+    # ── ư: ừ ử ữ ứ ự ─────────────────────────────────────────
+    '\u00F5': 'ừ',   # õ       (dõa = dừa)
+    '\u00F6': 'ử',   # ö       (nöa = nửa)
+    '\u00F7': 'ữ',   # ÷       (S÷a = Sữa)
+    '\u00F8': 'ứ',   # ø       (trøng = trứng)
+    '\u00F9': 'ự',   # ù       (thùc = thực)
+
+    # ── y: ỳ ỷ ỹ ý ỵ ──────────────────────────────────────────
+    '\u00FA': 'ỳ',   # ú       (Mú sîi = Mỳ sợi)
+    '\u00FB': 'ỷ',   # û
+    '\u00FC': 'ỹ',   # ü
+    '\u00FD': 'ý',   # ý → ý  (maps to itself)
+    '\u00FE': 'ỵ',   # þ
+}
+
+
+
+def translation_table(mapping: dict[str, str]) -> list[str]:
+    """`str.translate` table as a list indexed by code point.
+
+    A list lookup is several times faster than the dict from
+    `str.maketrans`; code points past its end raise IndexError, which
+    translate treats as "leave unchanged".
+    """
+    table = [chr(code) for code in range(max(map(ord, mapping)) + 1)]
+    for source, target in mapping.items():
+        table[ord(source)] = target
+    return table
+
+
+TCVN3_TABLE = translation_table(TCVN3_TO_VIET)
+
+# Vietnamese → TCVN3 (µ and μ both decode to 'à'; the book uses μ)
+VIET_TO_TCVN3: dict[str, str] = {viet: tcvn3 for tcvn3, viet in TCVN3_TO_VIET.items() if tcvn3 != 'µ'}
+VIET_TO_TCVN3_TABLE = translation_table(VIET_TO_TCVN3)
+
+# ── VNI-Windows → combining marks ───────────────────────────────────
+# VNI writes "ậ" as "a" + "ä"; mapping "ä" to U+0302 U+0323 and letting
+# NFC compose keeps decoding a single C-level translate + normalize.
+
+_GRAVE, _ACUTE, _HOOK, _TILDE, _DOT = '̀', '́', '̉', '̃', '̣'
+_CIRCUMFLEX, _BREVE, _HORN = '̂', '̆', '̛'
+
+VNI_MARKS: dict[str, str] = {
+    'ø': _GRAVE, 'ù': _ACUTE, 'û': _HOOK, 'õ': _TILDE, 'ï': _DOT,
+    'â': _CIRCUMFLEX,
+    'à': _CIRCUMFLEX + _GRAVE, 'á': _CIRCUMFLEX + _ACUTE, 'å': _CIRCUMFLEX + _HOOK,
+    'ã': _CIRCUMFLEX + _TILDE, 'ä': _CIRCUMFLEX + _DOT,
+    'ê': _BREVE,
+    'è': _BREVE + _GRAVE, 'é': _BREVE + _ACUTE, 'ú': _BREVE + _HOOK,
+    'ü': _BREVE + _TILDE, 'ë': _BREVE + _DOT,
+}
+# Glyphs that are whole letters in VNI (ơ ư đ ỉ ĩ ị ỵ)
+VNI_LETTERS: dict[str, str] = {
+    'ô': 'o' + _HORN, 'ö': 'u' + _HORN, 'ñ': 'đ',
+    'æ': 'i' + _HOOK, 'ó': 'i' + _TILDE, 'ò': 'i' + _DOT, 'î': 'y' + _DOT,
+}
+VNI_TO_COMBINING: dict[str, str] = {
+    **VNI_MARKS,
+    **{glyph.upper(): marks for glyph, marks in VNI_MARKS.items()},
+    **VNI_LETTERS,
+    **{glyph.upper(): letter.upper() for glyph, letter in VNI_LETTERS.items()},
+}
+VNI_TABLE = translation_table(VNI_TO_COMBINING)
+
+
+def tcvn3_to_unicode(text: str) -> str:
+    return text.translate(TCVN3_TABLE)
+
+
+def unicode_to_tcvn3(text: str) -> str:
+    """Unicode → TCVN3 glyphs (characters with no TCVN3 form pass through)."""
+    return text.translate(VIET_TO_TCVN3_TABLE)
+
+
+def vni_to_unicode(text: str) -> str:
+    return unicodedata.normalize('NFC', text.translate(VNI_TABLE))
+
+
+def _build_vni_encoder() -> dict[str, str]:
+    """Unicode letter → shortest VNI spelling, derived from the decoder."""
+    encoder: dict[str, str] = {}
+    for glyph in VNI_TO_COMBINING:
+        if glyph in VNI_LETTERS or glyph.lower() in VNI_LETTERS:
+            encoder.setdefault(vni_to_unicode(glyph), glyph)
+    for lower in (True, False):
+        bases = 'aeiouyôö' if lower else 'AEIOUYÔÖ'
+        for base in bases:
+            for mark in VNI_MARKS:
+                spelled = base + (mark if lower else mark.upper())
+                decoded = vni_to_unicode(spelled)
+                if len(decoded) == 1:
+                    encoder.setdefault(decoded, spelled)
+    return encoder
+
+
+UNICODE_TO_VNI = _build_vni_encoder()
+UNICODE_TO_VNI_TABLE = translation_table(UNICODE_TO_VNI)
+
+
+def unicode_to_vni(text: str) -> str:
+    return unicodedata.normalize('NFC', text).translate(UNICODE_TO_VNI_TABLE)
+
+
+# ── Detection ───────────────────────────────────────────────────────
+
+VIET_LETTERS = frozenset(
+    'àáảãạăằắẳẵặâầấẩẫậđèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵ'
+)
+VIET_LETTERS |= frozenset(letter.upper() for letter in VIET_LETTERS)
+# Any non-ASCII character that is not a (precomposed) Vietnamese letter
+_NOT_VIET_RE = re.compile('[^\\x00-\\x7f' + ''.join(sorted(VIET_LETTERS)) + ']')
+# TCVN3 has no capitals of its own: "phÈm" (phẩm) puts an upper-case
+# Latin-1 glyph right after a lower-case letter
+_TCVN3_CASE_RE = re.compile('[a-z][ÀÁÂÃÈÉÊÌÍÒÓÔÕÙÚÝ]')
+# Vowel + VNI mark glyph, minus the vowel pairs Unicode spells that way
+# (hoà, khoé, quân, quý, giá, yên, muôn …)
+_VNI_MARK_RE = re.compile(
+    '[aeiouyôö][' + ''.join(VNI_MARKS) + ']', re.IGNORECASE,
+)
+_UNICODE_PAIR_RE = re.compile('o[àáãèé]|u[âêýàáãôõ]|i[àáãèéêòóõùú]|yê', re.IGNORECASE)
+# VNI ñ = đ starts a syllable; TCVN3 reads it as ủ, which rarely does
+_VNI_D_RE = re.compile(r'\b[ñÑ][aeiouyAEIOUY]')
+# A syllable carries one tone mark; two means the wrong table
+_TONED = ''.join(sorted(
+    letter for letter in VIET_LETTERS
+    if set(unicodedata.normalize('NFD', letter)) & set('\u0300\u0301\u0303\u0309\u0323')
+))
+_MULTI_TONE_RE = re.compile(f'[{_TONED}][^\\W\\d_]*?[{_TONED}]')
+
+LEGACY_DECODERS = (('tcvn3', tcvn3_to_unicode), ('vni', vni_to_unicode))
+DECODERS = dict(LEGACY_DECODERS)
+
+
+def encoding_scores(text: str) -> dict[str, dict[str, int]]:
+    """Per reading: characters left that are not Vietnamese letters, plus evidence.
+
+    The histogram is taken over the text as decoded by each reading, so
+    whichever reading leaves the fewest stray glyphs (µ ¸ × in TCVN3,
+    uncomposed marks in VNI, ï å ä in Unicode) or syllables with two tone
+    marks ("tửụi" is VNI "töôi" read as TCVN3) wins.
+    """
+    scores = {'unicode': {'stray': len(_NOT_VIET_RE.findall(text)), 'evidence': 0}}
+    for encoding, decode in LEGACY_DECODERS:
+        decoded = decode(text)
+        scores[encoding] = {
+            'stray': len(_NOT_VIET_RE.findall(decoded)) + len(_MULTI_TONE_RE.findall(decoded)),
+            'evidence': 0,
+        }
+    scores['tcvn3']['evidence'] = len(_TCVN3_CASE_RE.findall(text))
+    scores['vni']['evidence'] = len(_VNI_D_RE.findall(text)) + sum(
+        1 for pair in _VNI_MARK_RE.findall(text) if not _UNICODE_PAIR_RE.fullmatch(pair)
+    )
+    return scores
+
+
+def detect_encoding(text: str, prior: str | None = None) -> str:
+    """'unicode', 'tcvn3', 'vni' or 'ascii' for a string or a whole page.
+
+    Among the readings with the fewest stray glyphs, a legacy encoding only
+    beats Unicode with positive evidence, so text that is valid Unicode is
+    never "repaired". Short strings are often valid both ways ("Bét" is
+    TCVN3 for "Bột" and also a Unicode word): without evidence they follow
+    `prior`, the encoding of the text around them (see dataset_encoding),
+    and stay Unicode when there is none.
+    """
+    if text.isascii():
+        return 'ascii'
+    scores = encoding_scores(text)
+    fewest = min(score['stray'] for score in scores.values())
+    candidates = [encoding for encoding, score in scores.items() if score['stray'] == fewest]
+    legacy = [encoding for encoding in candidates if encoding != 'unicode']
+    best = max(legacy, key=lambda encoding: scores[encoding]['evidence'], default='unicode')
+    if 'unicode' in candidates and (best == 'unicode' or scores[best]['evidence'] == 0):
+        if prior in legacy and DECODERS[prior](text) != text:
+            return prior
+        return 'unicode'
+    return best
+
+
+def dataset_encoding(texts: Iterable[str]) -> str:
+    """The encoding of a set of strings read together (e.g. every name of a dataset).
+
+    Detection over the joined text has the evidence single names lack;
+    pass the result as `prior` when detecting the names one by one.
+    """
+    encoding = detect_encoding('\n'.join(texts))
+    return 'unicode' if encoding == 'ascii' else encoding
+
+
+def is_legacy(text: str, prior: str | None = None) -> bool:
+    """Still TCVN3/VNI (or pdfplumber's `(cid:N)` for unmapped glyphs)."""
+    return '(cid:' in text or detect_encoding(text, prior) in ('tcvn3', 'vni')
+
+
+def transcode(text: str, encoding: str = 'auto', prior: str | None = None) -> tuple[str, str]:
+    """(Unicode text, encoding it was read as)."""
+    if encoding == 'auto':
+        encoding = detect_encoding(text, prior)
+    decoder = DECODERS.get(encoding)
+    return (decoder(text) if decoder else text), encoding
+
+
+# ── Bulk mode ───────────────────────────────────────────────────────
+
+def transcode_rows(
+    rows: Iterator[dict[str, Any]],
+    fields: list[str],
+    encoding: str,
+    keep_original: str | None,
+    counts: dict[str, int],
+) -> Iterator[dict[str, Any]]:
+    """Lazily transcode `fields` of each row; `counts` tallies encodings seen."""
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if not isinstance(value, str) or not value:
+                continue
+            converted, used = transcode(value, encoding)
+            counts[used] = counts.get(used, 0) + 1
+            if converted != value:
+                row[field] = converted
+                if keep_original:
+                    kept = row.get(keep_original)
+                    if isinstance(kept, list) and value not in kept:
+                        kept.append(value)
+                    elif not kept:
+                        row[keep_original] = [value] if isinstance(kept, list) or kept is None else value
+        yield row
+
+
+def transcode_file(
+    input_path: Path,
+    output_path: Path,
+    fields: list[str],
+    encoding: str = 'auto',
+    keep_original: str | None = None,
+) -> dict[str, int]:
+    """Stream a CSV or JSONL file row by row (a JSON array is loaded whole)."""
+    counts: dict[str, int] = {}
+    suffix = input_path.suffix.lower()
+    with input_path.open('r', encoding='utf-8', newline='') as source, \
+            output_path.open('w', encoding='utf-8', newline='') as target:
+        if suffix == '.csv':
+            reader = csv.DictReader(source)
+            writer = csv.DictWriter(target, fieldnames=reader.fieldnames or [])
+            writer.writeheader()
+            for row in transcode_rows(reader, fields, encoding, keep_original, counts):
+                writer.writerow(row)
+        elif suffix == '.jsonl':
+            lines = (json.loads(line) for line in source if line.strip())
+            for row in transcode_rows(lines, fields, encoding, keep_original, counts):
+                target.write(json.dumps(row, ensure_ascii=False) + '\n')
+        else:
+            rows = list(transcode_rows(iter(json.load(source)), fields, encoding, keep_original, counts))
+            json.dump(rows, target, ensure_ascii=False, indent=2)
+            target.write('\n')
+    return counts
+
+
+# ── Round-trip check and benchmark ──────────────────────────────────
+
+# Corpus names whose TCVN3 form is also valid Unicode on its own; they must
+# still convert once the dataset they sit in is known to be TCVN3.
+AMBIGUOUS_TCVN3 = (
+    ('Bón', 'Bún'), ('Cèm', 'Cốm'), ('Bét khoai lang', 'Bột khoai lang'),
+    ('Chuèi xanh', 'Chuối xanh'), ('GÊc', 'Gấc'), ('Hoa chuèi', 'Hoa chuối'),
+    ('Ngã sen', 'Ngó sen'), ('ít xanh to', 'ớt xanh to'), ('Rau hóng', 'Rau húng'),
+    ('Rau kinh giíi', 'Rau kinh giới'), ('Rau muèng', 'Rau muống'), ('Rau ngãt', 'Rau ngót'),
+    ('Rau rót', 'Rau rút'), ('SÊu xanh', 'Sấu xanh'), ('Tái ta', 'Tỏi ta'), ('Lùu', 'Lựu'),
+    ('MÝt dai', 'Mít dai'), ('Nhãt', 'Nhót'), ('Bét cãc', 'Bột cóc'), ('Nhéng', 'Nhộng'),
+    ('HÕn', 'Hến'), ('Bét ca cao', 'Bột ca cao'), ('Cary bét', 'Cary bột'), ('Muèi', 'Muối'),
+    ('Sèt mayonnaise', 'Sốt mayonnaise'),
+)
+
+def run_check(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Round-trip every corpus name through TCVN3 and VNI, and detect each form."""
+    failures: list[str] = []
+    detected = {'unicode': 0, 'tcvn3': 0, 'vni': 0}
+    checked = {'unicode': 0, 'tcvn3': 0, 'vni': 0}
+    tcvn3_unrepresentable = 0
+    legacy_in_corpus: list[str] = []
+
+    def expect(form: str, text: str) -> None:
+        checked[form] += 1
+        got = detect_encoding(text)
+        if got == form or (form == 'unicode' and got == 'ascii'):
+            detected[form] += 1
+        elif form == 'unicode':
+            legacy_in_corpus.append(text)
+
+    names = [r.get(key, '') for r in records for key in ('name_primary', 'name_en') if r.get(key)]
+    for name in names:
+        expect('unicode', name)
+        if name.isascii():
+            continue
+
+        vni = unicode_to_vni(name)
+        if vni_to_unicode(vni) != name:
+            failures.append(f'VNI round trip: {name!r} → {vni!r} → {vni_to_unicode(vni)!r}')
+        expect('vni', vni)
+
+        tcvn3 = unicode_to_tcvn3(name)
+        if tcvn3_to_unicode(tcvn3) != name:
+            # TCVN3 capitals live in a separate font; not representable here
+            tcvn3_unrepresentable += 1
+        elif tcvn3 != name:
+            expect('tcvn3', tcvn3)
+
+    # The same names as one TCVN3 dataset: detected together, then one by one
+    tcvn3_names = [unicode_to_tcvn3(name) for name in names if not name.isascii()]
+    prior = dataset_encoding(tcvn3_names)
+    if prior != 'tcvn3':
+        failures.append(f'TCVN3 dataset detected as {prior}')
+    with_prior = sum(
+        1 for tcvn3, name in zip(tcvn3_names, (n for n in names if not n.isascii()))
+        if tcvn3 == name or transcode(tcvn3, prior=prior)[0] == name
+    )
+    for tcvn3, expected in AMBIGUOUS_TCVN3:
+        converted = transcode(tcvn3, prior=prior)[0]
+        if converted != expected:
+            failures.append(f'TCVN3 in a TCVN3 dataset: {tcvn3!r} → {converted!r}, expected {expected!r}')
+
+    # The book's own glyphs, kept in name_alt by extraction
+    originals = 0
+    for record in records:
+        for alt in record.get('name_alt', []):
+            originals += 1
+            expect('tcvn3', alt)
+            if ' '.join(tcvn3_to_unicode(alt).split()) != record['name_primary']:
+                failures.append(f"TCVN3 original: {alt!r} ≠ {record['name_primary']!r}")
+
+    return {
+        'names': len(names),
+        'book_originals': originals,
+        'tcvn3_unrepresentable': tcvn3_unrepresentable,
+        'detection': {
+            form: round(detected[form] / checked[form], 4) if checked[form] else None
+            for form in checked
+        },
+        'checked': checked,
+        # TCVN3 names converted correctly given the dataset's encoding
+        'tcvn3_with_prior': round(with_prior / len(tcvn3_names), 4) if tcvn3_names else None,
+        # Names the detector reads as TCVN3/VNI although the corpus stores them as Unicode
+        'legacy_in_corpus': legacy_in_corpus,
+        'failures': failures,
+    }
+
+
+def _join_map(text: str) -> str:
+    """Previous per-character decoder (generator + dict.get), for comparison."""
+    return ''.join(TCVN3_TO_VIET.get(ch, ch) for ch in text)
+
+
+def run_benchmark(texts: list[str], repeats: int) -> list[tuple[str, float]]:
+    """(function, MB/s) over `texts`, best of `repeats`."""
+    size_mb = sum(len(text.encode('utf-8')) for text in texts) / 1e6
+    vni_texts = [unicode_to_vni(tcvn3_to_unicode(text)) for text in texts]
+    dict_table = str.maketrans(TCVN3_TO_VIET)
+    cases = [
+        ('tcvn3 join+dict.get (old)', _join_map, texts),
+        ('tcvn3 translate (dict)', lambda text: text.translate(dict_table), texts),
+        ('tcvn3 translate (list)', tcvn3_to_unicode, texts),
+        ('vni translate+NFC', vni_to_unicode, vni_texts),
+        ('detect_encoding', detect_encoding, texts),
+    ]
+    results: list[tuple[str, float]] = []
+    for name, function, inputs in cases:
+        best = float('inf')
+        for _ in range(repeats):
+            started = time.perf_counter()
+            for text in inputs:
+                function(text)
+            best = min(best, time.perf_counter() - started)
+        results.append((name, size_mb / best if best else 0.0))
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Convert TCVN3 / VNI Vietnamese text to Unicode (auto-detected per string).',
+    )
+    parser.add_argument('text', nargs='?', default=None, help='A string to detect and convert.')
+    parser.add_argument('--input', default=None, help='CSV, JSONL or JSON file to convert.')
+    parser.add_argument('--output', default=None, help='Output path for --input.')
+    parser.add_argument(
+        '--field',
+        action='append',
+        default=[],
+        help='Field to convert (repeatable; default name_primary).',
+    )
+    parser.add_argument(
+        '--from',
+        dest='encoding',
+        choices=['auto', 'tcvn3', 'vni'],
+        default='auto',
+        help='Source encoding (auto: detect per value).',
+    )
+    parser.add_argument(
+        '--keep-original',
+        default=None,
+        help='Append the original value to this field (e.g. name_alt) when it changes.',
+    )
+    parser.add_argument('--check', action='store_true', help='Round-trip + detection check over the corpus.')
+    parser.add_argument('--bench', action='store_true', help='Throughput vs the old per-character decoder.')
+    parser.add_argument(
+        '--records',
+        default='data/vtn_fct_2007/extracted_ingredients.json',
+        help='Records for --check.',
+    )
+    parser.add_argument(
+        '--corpus',
+        default='data/vtn_fct_2007/fixtures/page_texts.jsonl',
+        help='Page texts for --bench.',
+    )
+    parser.add_argument('--repeats', type=int, default=5, help='Timed passes for --bench.')
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    if args.check:
+        with Path(args.records).open('r', encoding='utf-8') as handle:
+            report = run_check(json.load(handle))
+        print(f"Names: {report['names']}, book originals: {report['book_originals']}, "
+              f"TCVN3-unrepresentable: {report['tcvn3_unrepresentable']}")
+        for form, rate in report['detection'].items():
+            print(f"  detect {form:8s} {rate:.2%} of {report['checked'][form]}")
+        if report['tcvn3_with_prior'] is not None:
+            print(f"  convert tcvn3 with the dataset's encoding: {report['tcvn3_with_prior']:.2%}")
+        for name in report['legacy_in_corpus']:
+            print(f'  still legacy in corpus: {name!r} → {transcode(name)[0]!r}')
+        for failure in report['failures'][:20]:
+            print(f'FAIL {failure}')
+        if report['failures']:
+            raise SystemExit(1)
+        print('Round trips: OK')
+        return
+
+    if args.bench:
+        with Path(args.corpus).open('r', encoding='utf-8') as handle:
+            texts = [json.loads(line)['text'] for line in handle if line.strip()]
+        results = run_benchmark(texts, args.repeats)
+        baseline = results[0][1]
+        print(f'Corpus: {args.corpus} ({len(texts)} pages)')
+        for name, rate in results:
+            print(f'  {name:28s} {rate:8.1f} MB/s  ({rate / baseline:5.1f}×)')
+        return
+
+    if args.input:
+        if not args.output:
+            raise SystemExit('--input needs --output')
+        started = time.perf_counter()
+        counts = transcode_file(
+            Path(args.input),
+            Path(args.output),
+            args.field or ['name_primary'],
+            args.encoding,
+            args.keep_original,
+        )
+        print(f'Converted {args.input} → {args.output} in {time.perf_counter() - started:.2f}s')
+        for encoding, count in sorted(counts.items()):
+            print(f'  {encoding:8s} {count}')
+        return
+
+    text = args.text if args.text is not None else sys.stdin.read()
+    converted, encoding = transcode(text, args.encoding)
+    print(f'{encoding}: {converted}')
+
+
+if __name__ == '__main__':
+    main()
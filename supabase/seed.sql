@@ -1,533 +1,543 @@
 -- Seed: vietnamese_food_composition (VTN FCT 2007)
 -- Source: data/vtn_fct_2007/extracted_ingredients.json (526 records)
 -- Generated by: scripts/vtn_fct/generate_seed_sql.py
+-- search_text / search_text_ascii are precomputed; the trigger that
+-- would rebuild them per row is disabled for the load.
+
+BEGIN;
+
+ALTER TABLE vietnamese_food_composition DISABLE TRIGGER on_food_composition_search_text;
 
 INSERT INTO vietnamese_food_composition (
-  id, name_primary, name_alt, name_en, type_vn, type_en, source, state, inedible_portion_pct, calories_kcal, protein_g, carbohydrate_g, fat_g, fiber_g, sodium_mg, calcium_mg, iron_mg, magnesium_mg, phosphorus_mg, potassium_mg, zinc_mg, copper_mcg, manganese_mg, beta_carotene_mcg, vitamin_a_mcg, vitamin_d_mcg, vitamin_e_mg, vitamin_k_mcg, vitamin_c_mg, vitamin_b1_mg, vitamin_b2_mg, vitamin_pp_mg, vitamin_b5_mg, vitamin_b6_mg, vitamin_b9_mcg, vitamin_b12_mcg, vitamin_h_mcg, last_verified
+  id, name_primary, name_alt, name_en, type_vn, type_en, source, state, inedible_portion_pct, calories_kcal, protein_g, carbohydrate_g, fat_g, fiber_g, sodium_mg, calcium_mg, iron_mg, magnesium_mg, phosphorus_mg, potassium_mg, zinc_mg, copper_mcg, manganese_mg, beta_carotene_mcg, vitamin_a_mcg, vitamin_d_mcg, vitamin_e_mg, vitamin_k_mcg, vitamin_c_mg, vitamin_b1_mg, vitamin_b2_mg, vitamin_pp_mg, vitamin_b5_mg, vitamin_b6_mg, vitamin_b9_mcg, vitamin_b12_mcg, vitamin_h_mcg, last_verified, search_text, search_text_ascii
 ) VALUES
-('fao_vn_2007_1001_raw', 'Gạo nếp cái', '{}', 'Glutinous rice, milled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 344.0, 8.6, 74.5, 1.5, 0.6, 3.0, 32.0, 1.2, 17.0, 98.0, 282.0, 2.2, 280.0, 1.1, 0.0, 0.0, 0.0, NULL, NULL, 0.0, 0.14, 0.06, 2.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1002_raw', 'Gạo nếp máy (Loại thường)', '{}', 'Glutinous rice, milled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 346.0, 8.4, 74.9, 1.6, 0.5, 3.0, 16.0, 1.2, 17.0, 130.0, 282.0, 2.2, 280.0, 1.1, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.16, 0.06, 2.4, 0.284, 0.107, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_1003_raw', 'Gạo tẻ giã', '{}', 'Under milled, home-pounded rice', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 344.0, 8.1, 75.0, 1.3, 0.7, 5.0, 36.0, 0.2, 52.0, 108.0, 202.0, 1.9, 360.0, 1.5, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.12, 0.04, 1.9, NULL, NULL, NULL, NULL, 3.0, '2026-02-26'),
-('fao_vn_2007_1004_raw', 'Gạo tẻ máy', '{}', 'Ordinary polished rice', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 344.0, 7.9, 75.9, 1.0, 0.4, 5.0, 30.0, 1.3, 14.0, 104.0, 241.0, 1.5, 230.0, 0.9, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.03, 1.6, 1.342, 0.145, 0.0, 0.0, 3.0, '2026-02-26'),
-('fao_vn_2007_1005_raw', 'Gạo lứt', '{}', 'Rice, brown or hulled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 345.0, 7.5, 72.8, 2.7, 3.4, 5.0, 16.0, 2.8, 52.0, 246.0, 202.0, 1.9, 360.0, 1.5, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.34, 0.07, 5.0, 1.5, 0.62, 0.0, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1006_raw', 'Kê', '{}', 'Foxtail millet', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 2.0, 331.0, 7.0, 69.0, 3.0, 3.4, 7.0, 22.0, 2.7, 430.0, 290.0, 249.0, 1.5, 440.0, 1.7, 60.0, 0.0, NULL, 0.05, 0.9, 0.0, 0.4, 0.09, 1.6, 0.848, 0.384, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_1007_raw', 'Ngô bắp tươi', '{}', 'Fresh maize seeds, raw', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 45.0, 196.0, 4.1, 39.6, 2.3, 1.2, 3.0, 4.0, 0.6, 39.0, 170.0, 306.0, 1.4, 240.0, 0.35, NULL, 0.0, NULL, 0.8, 0.0, 12.0, 0.15, 0.08, 1.8, 0.54, 0.16, 0.0, 0.0, 0.5, '2026-02-26'),
-('fao_vn_2007_1008_raw', 'Ngô vàng hạt khô', '{}', 'Yellow maize, dried seeds', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 2.0, 354.0, 8.6, 69.4, 4.7, 2.0, 35.0, 30.0, 2.3, 127.0, 190.0, 287.0, 2.21, 314.0, 0.49, 97.0, 0.0, NULL, 0.49, 0.3, 0.0, 0.28, 0.11, 2.0, 0.424, 0.622, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_1009_cooked', 'Bánh bao nhân thịt', '{}', 'Ball shaped dumpling, Vietnamese steamed buns', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'cooked', 0.0, 219.0, 6.1, 47.5, 0.5, 0.5, NULL, 19.0, 1.5, NULL, 88.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.1, 0.04, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1010_raw', 'Bánh đa nem', '{}', 'Rice paper for rollers', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 333.0, 4.0, 78.9, 0.2, 0.5, NULL, 20.0, 0.3, NULL, 65.0, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1011_raw', 'Bánh đúc', '{}', 'Rice pudding', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 52.0, 0.9, 11.3, 0.3, 0.1, NULL, 50.0, 0.4, NULL, 19.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1012_raw', 'Bánh mỳ', '{}', 'French bread', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 249.0, 7.9, 52.6, 0.8, 0.2, NULL, 28.0, 2.0, NULL, 164.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.07, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1013_raw', 'Bánh phở', '{}', 'Rice noodles', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 143.0, 3.2, 31.7, 0.4, 0.0, 3.0, 16.0, 0.3, NULL, 64.0, 15.0, NULL, NULL, NULL, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.01, 0.01, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1014_cooked', 'Bánh quẩy', '{}', 'Wheat fritters twisted fried', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'cooked', 0.0, 292.0, 8.0, 40.7, 10.8, 0.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.0, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1015_raw', 'Bỏng ngô', '{}', 'Corn flakes', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 372.0, 8.6, 80.8, 1.6, 3.4, NULL, 3.0, 0.6, NULL, 47.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.02, 0.03, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1016_raw', 'Bột gạo nếp', '{}', 'Glutinous rice flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 362.0, 8.2, 78.8, 1.6, 0.6, 3.0, 12.0, 0.8, 18.0, 148.0, 293.0, 2.29, 291.0, 1.14, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.02, 1.7, 0.295, 0.111, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_1017_raw', 'Bột gạo tẻ', '{}', 'Rice ordinary flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 359.0, 6.6, 82.2, 0.4, 0.4, 0.0, 24.0, 1.9, 35.0, 135.0, 76.0, 0.8, 130.0, 1.2, 0.0, 0.0, NULL, 0.11, 0.0, 0.0, 0.08, 0.05, 2.1, 0.819, 0.436, 0.0, 0.0, 1.0, '2026-02-26'),
-('fao_vn_2007_1018_raw', 'Bột mì', '{}', 'Wheat flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 346.0, 10.3, 73.6, 1.1, 0.3, 4.0, 29.0, 2.0, 173.0, 132.0, 186.0, 2.5, 21.0, 2.0, 0.0, 0.0, NULL, 0.82, 1.9, 0.0, 0.18, 0.13, 1.0, 1.008, 0.341, 0.0, 0.0, 1.9, '2026-02-26'),
-('fao_vn_2007_1019_raw', 'Bột ngô vàng', '{}', 'Yellow maize flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 361.0, 8.3, 73.0, 4.0, 1.5, 5.0, 15.0, 2.1, 93.0, 170.0, 315.0, 1.73, 230.0, 0.46, 97.0, 0.0, NULL, 0.42, 0.3, 0.0, 0.17, 0.08, 1.9, 0.658, 0.37, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_1020_raw', 'Bún', '{}', 'Rice vermicelli', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 110.0, 1.7, 25.7, NULL, 0.5, NULL, 12.0, 0.2, NULL, 32.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.04, 0.01, 1.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1021_raw', 'Cốm', '{}', 'Rice, unriped. Raw', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 297.0, 6.1, 66.3, 0.8, 0.6, NULL, 24.0, 1.0, NULL, 143.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1022_raw', 'Mỳ sợi', '{}', 'Wheat noodles', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 349.0, 11.0, 74.2, 0.9, 0.3, NULL, 34.0, 1.5, NULL, 97.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.04, 1.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_1023_cooked', 'Ngô nếp luộc', '{}', 'Glutinous maize, boiled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'cooked', 50.0, 167.0, 3.9, 32.9, 2.2, 1.2, NULL, 18.0, 0.8, NULL, 146.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2001_raw', 'Củ ấu', '{}', 'Water-caltrops', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 50.0, 115.0, 3.6, 24.0, 0.5, 1.0, NULL, 9.0, 0.7, NULL, 49.0, NULL, NULL, NULL, NULL, 5.0, 0.0, NULL, NULL, NULL, 5.0, 0.23, 0.05, 1.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2002_raw', 'Củ cái', '{}', 'Yam winged', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 15.0, 127.0, 3.1, 28.3, 0.2, 1.8, 12.0, 20.0, 2.9, 20.0, 32.0, 397.0, 11.0, NULL, NULL, 83.0, 0.0, NULL, 0.39, 2.6, 1.0, NULL, NULL, NULL, 0.314, 0.293, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2003_raw', 'Củ dong', '{}', 'Bermuda tuber', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 4.0, 119.0, 1.4, 28.4, NULL, 2.4, NULL, 42.0, NULL, NULL, 21.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2004_raw', 'Củ sắn', '{}', 'Bitter cassava', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 25.0, 152.0, 1.1, 36.4, 0.2, 1.5, 2.0, 25.0, 1.2, 4.0, 30.0, 394.0, NULL, NULL, NULL, 8.0, 0.0, NULL, 0.19, 1.9, 34.0, 0.03, 0.03, 0.6, 0.107, 0.088, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2005_raw', 'Củ sắn dây', '{}', 'Radix puerariae', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 10.0, 119.0, 1.6, 28.0, 0.1, 9.2, NULL, 28.0, 0.2, NULL, 45.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2006_raw', 'Củ súng khô (đã bỏ vỏ)', '{}', 'Nymphaea stellata wild, dried, unshelled', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 350.0, 16.1, 70.3, 0.5, 2.3, NULL, 100.0, 0.2, NULL, 720.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2007_raw', 'Củ từ', '{}', 'Igname Yam, Chinese', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 6.0, 92.0, 1.5, 21.5, NULL, 1.2, NULL, 28.0, 0.2, NULL, 30.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2008_raw', 'Khoai lang', '{}', 'Sweet potato, white', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 17.0, 119.0, 0.8, 28.5, 0.2, 1.3, 31.0, 34.0, 1.0, 201.0, 49.0, 210.0, 0.2, 260.0, 0.39, 150.0, 0.0, NULL, 0.26, 1.8, 23.0, 0.05, 0.05, 0.6, 0.8, 0.209, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2009_raw', 'Khoai lang nghệ', '{}', 'Sweet potato, yellow', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 13.0, 116.0, 1.2, 27.1, 0.3, 0.8, NULL, 36.0, 0.9, NULL, 56.0, NULL, NULL, NULL, NULL, 1470.0, 0.0, NULL, NULL, NULL, 30.0, 0.12, 0.05, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2010_raw', 'Khoai môn', '{}', 'Chinese Yam, spiny yam', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 14.0, 109.0, 1.5, 25.2, 0.2, 1.2, NULL, 44.0, 0.8, NULL, 44.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 4.0, 0.09, 0.03, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2011_raw', 'Khoai nước', '{}', 'Water-taro', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 14.0, 98.0, 1.0, 23.3, 0.1, 2.0, NULL, 52.0, 0.2, NULL, 35.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2012_raw', 'Khoai riềng', '{}', 'Edible canna', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 19.0, 104.0, 0.8, 25.1, NULL, 2.5, NULL, 64.0, 1.7, NULL, 107.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2013_raw', 'Khoai sọ', '{}', 'Taro tuber', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 18.0, 114.0, 1.8, 26.5, 0.1, 1.2, 10.0, 64.0, 1.5, 33.0, 75.0, 448.0, NULL, NULL, 0.38, 35.0, 0.0, NULL, 2.38, 1.0, 4.0, 0.06, 0.03, 0.1, 0.303, 0.283, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2014_raw', 'Khoai tây', '{}', 'Potato, white', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 13.0, 93.0, 2.0, 20.9, 0.1, 1.0, 7.0, 10.0, 1.2, 32.0, 50.0, 396.0, 0.3, 230.0, 0.2, 5.0, 0.0, NULL, 0.01, 1.6, 10.0, 0.1, 0.05, 0.9, 0.281, 0.203, 0.0, 0.0, 0.47, '2026-02-26'),
-('fao_vn_2007_2015_raw', 'Miến dong', '{}', 'Vermicelli from Bermuda tuber', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 332.0, 0.6, 82.2, 0.1, 1.5, NULL, 40.0, 1.0, NULL, 120.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2016_raw', 'Bột dong lọc', '{}', 'Bermuda flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 341.0, 0.6, 84.7, NULL, 0.5, NULL, 37.0, 1.7, NULL, 18.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2017_raw', 'Bột khoai lang', '{}', 'Sweet potato flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 334.0, 2.2, 80.2, 0.5, 1.6, NULL, 50.0, 2.0, NULL, 95.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.24, 0.09, 1.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2018_raw', 'Bột khoai riềng (bột đao)', '{}', 'Canna edulis Ker, flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 337.0, 0.2, 84.1, NULL, 1.5, NULL, 16.0, NULL, NULL, 17.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2019_raw', 'Bột khoai tây (lọc)', '{}', 'Potato flour, white', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 345.0, 1.0, 84.4, 0.3, 0.4, NULL, 30.0, 3.0, NULL, 125.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, 0.25, 0.0, NULL, 0.01, NULL, 0.4, 0.474, 0.769, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2020_raw', 'Bột sắn', '{}', 'Cassava flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 333.0, 2.4, 79.6, 0.5, 2.2, NULL, 84.0, NULL, NULL, 37.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.02, 0.03, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2021_raw', 'Bột sắn dây', '{}', 'Radix puerariae flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 340.0, 0.7, 84.3, NULL, 0.8, NULL, 18.0, 1.5, NULL, 20.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2022_raw', 'Khoai lang khô', '{}', 'Sweet potato, dried', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 5.0, 333.0, 2.2, 80.0, 0.5, 3.6, 86.0, 95.0, 2.78, 559.0, 137.0, 584.0, 0.56, 723.0, 1.08, 417.0, 0.0, NULL, 0.72, 5.0, NULL, 0.09, 0.07, 1.7, 2.225, 0.581, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2023_raw', 'Khoai tây khô', '{}', 'Potato, white, dried', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 330.0, 6.6, 75.1, 0.3, 3.4, 25.0, 37.0, 4.3, 114.0, 180.0, 1410.0, 1.07, 819.0, 0.71, 18.0, 0.0, NULL, 0.04, 5.7, NULL, 0.36, 0.18, 3.2, 1.0, 0.723, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_2024_raw', 'Khoai tây lát chiên', '{}', 'Potato crisp, fried', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 525.0, 2.2, 49.3, 35.4, 6.3, NULL, 37.0, 2.1, NULL, 130.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 1.0, 0.15, 0.02, 4.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2025_raw', 'Sắn khô', '{}', 'Dried bitter cassava', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 5.0, 340.0, 3.0, 80.3, 0.7, 3.0, NULL, 96.0, 7.9, NULL, 81.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.06, 0.05, 0.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_2026_raw', 'Trân châu sắn', '{}', 'Tapioca, pearls E.P', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 341.0, 1.0, 84.3, NULL, 0.6, NULL, 30.0, 2.0, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.04, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3001_raw', 'Cùi dừa già', '{}', 'Coconut meat, mature, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 20.0, 368.0, 4.8, 6.2, 36.0, 4.2, 7.0, 30.0, 30.0, 160.0, 154.0, 555.0, 5.0, 50.0, 1.3, 0.0, 0.0, NULL, 0.24, 0.2, 2.0, 0.1, 0.01, 0.2, 0.3, 0.054, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3002_raw', 'Cùi dừa non', '{}', 'Coconut meat, immature, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 40.0, 3.5, 2.6, 1.7, 3.5, NULL, 4.0, 1.0, NULL, 53.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 6.0, 0.04, 0.03, 0.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3003_raw', 'Đậu cô ve (hạt)', '{}', 'French bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 10.0, 321.0, 21.8, 54.9, 1.6, 3.5, NULL, 96.0, NULL, NULL, 360.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3004_raw', 'Đậu đen (hạt)', '{}', 'Black bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 325.0, 24.2, 53.3, 1.7, 4.0, NULL, 56.0, 6.1, NULL, 354.0, NULL, NULL, NULL, NULL, 30.0, 0.0, NULL, 0.22, 6.0, 3.0, 0.5, 0.21, 1.8, 0.899, 0.286, 0.0, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3005_raw', 'Đậu đũa (hạt)', '{}', 'Cow pea whole seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 10.0, 320.0, 23.7, 51.9, 2.0, 4.3, NULL, 110.0, 6.5, NULL, 382.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, 0.39, 5.0, 1.0, 0.59, 0.22, 2.3, 1.496, 0.357, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3006_raw', 'Đậu Hà lan (hạt)', '{}', 'Peas garden and field, seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 318.0, 22.2, 54.1, 1.4, 6.0, 9.0, 57.0, 4.4, 145.0, 303.0, 135.0, 4.0, 930.0, NULL, 70.0, 0.0, NULL, 0.09, 14.5, 0.0, 0.77, 0.18, 3.1, 1.758, 0.174, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3007_raw', 'Đậu tương (đậu nành)', '{}', 'Yellow dried soybean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 400.0, 34.0, 24.6, 18.4, 4.5, 2.0, 165.0, 11.0, 236.0, 690.0, 1504.0, 3.8, 300.0, 1.2, 30.0, 0.0, NULL, 0.85, 47.0, 4.0, 0.54, 0.29, 2.3, 0.793, 0.377, 0.0, 0.0, 60.0, '2026-02-26'),
-('fao_vn_2007_3008_raw', 'Đậu trắng hạt (Đậu Tây)', '{}', 'Kidney bean whole seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 327.0, 23.2, 53.8, 2.1, 3.6, NULL, 160.0, 6.8, NULL, 514.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, 0.22, 19.0, 3.0, 0.54, 0.18, 2.1, 0.78, 0.397, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3009_raw', 'Đậu trứng cuốc', '{}', 'Egg bird bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 321.0, 25.8, 50.0, 2.0, 4.8, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3010_raw', 'Đậu xanh (đậu tắt)', '{}', 'Mungo bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 328.0, 23.4, 53.1, 2.4, 4.7, 6.0, 64.0, 4.8, 270.0, 377.0, 1132.0, 1.1, 880.0, NULL, 30.0, 0.0, NULL, 0.51, 9.0, 4.0, 0.72, 0.15, 2.4, 1.91, 0.382, 0.0, 0.0, 0.7, '2026-02-26'),
-('fao_vn_2007_3011_raw', 'Hạt dẻ to', '{}', 'Chestnut, Chinese whole, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 30.0, 638.0, 18.0, 8.7, 59.0, 3.5, NULL, 61.0, 2.3, NULL, 510.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 3.0, 0.48, 0.13, 1.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3012_raw', 'Hạt dẻ tươi', '{}', 'Chestnut, Chinese whole, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 18.0, 223.0, 4.2, 49.1, 1.1, NULL, 3.0, 18.0, 1.41, 84.0, 96.0, 447.0, 0.87, 363.0, 1.6, NULL, 0.0, NULL, NULL, NULL, 36.0, 0.16, 0.18, 0.8, 0.555, 0.41, 0.0, 0.0, 1.3, '2026-02-26'),
-('fao_vn_2007_3013_raw', 'Hạt dẻ khô', '{}', 'Chestnut, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 20.0, 363.0, 6.8, 79.8, 1.8, NULL, 5.0, 29.0, 2.29, 137.0, 155.0, 726.0, 1.41, 590.0, 2.6, NULL, 0.0, NULL, NULL, NULL, 59.0, 0.26, 0.29, 1.3, 0.902, 0.666, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3014_raw', 'Hạt đen', '{}', 'Black seed', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 50.0, 472.0, 17.3, 35.5, 29.0, 3.5, NULL, 84.0, NULL, NULL, 255.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3015_raw', 'Hạt điều', '{}', 'Cashew nut, common', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 605.0, 18.4, 28.7, 46.3, 0.6, 12.0, 28.0, 3.6, 292.0, 462.0, 660.0, 5.78, 2195.0, 1.66, 5.0, 0.0, NULL, 0.9, 34.1, 1.0, 0.25, 0.34, 2.4, 0.864, 0.417, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3016_raw', 'Hạt mít', '{}', 'Jack fruit, seed, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 15.0, 166.0, 0.7, 38.3, 1.1, NULL, NULL, 46.0, 3.4, NULL, 34.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3017_raw', 'Lạc hạt', '{}', 'Dried peanut seed', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 573.0, 27.5, 15.5, 44.5, 2.5, 4.0, 68.0, 2.2, 185.0, 420.0, 421.0, 1.9, 420.0, 1.6, 10.0, 0.0, NULL, 8.33, 0.0, NULL, 0.44, 0.12, 16.0, 1.767, 0.348, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3018_raw', 'Quả cọ tươi', '{}', 'Palm fruit fresh', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 40.0, 178.0, 2.3, 12.1, 13.4, 3.5, NULL, 38.0, 0.2, NULL, 34.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3019_raw', 'Quả đại hái tươi', '{}', 'Hodgsonia fruit', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 90.0, 427.0, 20.0, 1.2, 38.0, 3.4, NULL, 66.0, 3.1, NULL, 440.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3020_raw', 'Vừng (đen, trắng)', '{}', 'Sesame oriental seeds, whole, dried black or white', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 5.0, 568.0, 20.1, 17.6, 46.4, 3.5, 11.0, 975.0, 14.55, 351.0, 629.0, 468.0, 7.75, 4082.0, 2.46, 15.0, 0.0, NULL, 0.25, 0.0, 0.0, 0.79, 0.25, 4.5, 0.05, 0.79, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3021_raw', 'Bột đậu tương đã loại béo (đậu nành)', '{}', 'Soybeans flour, defatted', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 321.0, 49.0, 29.0, 1.0, 2.5, 20.0, 247.0, 7.6, 290.0, 602.0, 2384.0, 2.46, 4067.0, 3.02, 35.0, 0.0, NULL, 0.2, 4.1, 0.0, 0.7, 0.3, 2.0, 1.995, 0.574, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3022_cooked', 'Bột đậu tương rang chín', '{}', 'Roasted soybeans flour', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 0.0, 418.0, 41.0, 22.9, 18.0, 2.5, NULL, 189.0, 7.5, NULL, 540.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.4, 0.16, 2.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3023_raw', 'Bột đậu xanh', '{}', 'Mungo bean flour', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 347.0, 24.6, 56.5, 2.5, 3.9, 6.0, 50.0, 1.0, 283.0, 100.0, 1185.0, 1.15, 921.0, NULL, NULL, 0.0, NULL, 0.53, 9.4, 4.0, 0.75, 0.16, 2.5, 1.999, 0.4, 0.0, 0.0, 0.73, '2026-02-26'),
-('fao_vn_2007_3024_raw', 'Bột lạc', '{}', 'Peanut flour', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 575.0, 27.5, 15.0, 45.0, 2.1, 4.0, 80.0, 3.0, 182.0, 380.0, 414.0, 1.87, 413.0, 1.57, 10.0, 0.0, NULL, 8.2, 0.0, NULL, 0.4, 0.11, 15.3, 1.739, 0.342, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3025_raw', 'Đậu phụ', '{}', 'Soybean curt cake pressed, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 95.0, 10.9, 0.7, 5.4, 0.4, 7.0, 24.0, 2.2, 30.0, 85.0, 121.0, 0.8, 193.0, 0.61, NULL, 0.0, NULL, NULL, NULL, 0.0, 0.03, 0.02, 0.4, 0.068, 0.047, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3026_raw', 'Đậu phụ chúc', '{}', 'Curd tofu concentrated', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 414.0, 50.2, 6.5, 20.8, 0.3, NULL, 325.0, 10.8, NULL, 225.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3027_cooked', 'Đậu phụ nướng', '{}', 'Curd tofu, fried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 0.0, 114.0, 13.4, 0.8, 6.4, 0.5, NULL, 370.0, 4.7, NULL, 167.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.04, 0.05, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3028_cooked', 'Hạt bí đỏ rang', '{}', 'Pumpkin seeds, fried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 19.0, 519.0, 35.1, 23.0, 31.8, 2.3, NULL, 235.0, 2.2, NULL, 900.0, NULL, NULL, NULL, NULL, 235.0, 0.0, NULL, NULL, NULL, NULL, 0.15, 0.15, 3.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3029_cooked', 'Hạt dưa đỏ rang (dưa hấu)', '{}', 'Water melon seeds whole, fried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 22.0, 551.0, 31.8, 18.0, 39.1, 1.8, NULL, 237.0, 3.0, NULL, 751.0, NULL, NULL, NULL, NULL, 90.0, 0.0, NULL, NULL, NULL, NULL, 0.03, 0.14, 2.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3030_raw', 'Hạt điều khô, chiên dầu', '{}', 'Cashew, common, roasted with oil', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 583.0, 18.3, 16.4, 49.3, 0.7, NULL, 32.0, 3.9, NULL, 411.0, NULL, NULL, NULL, NULL, 5.0, 0.0, NULL, NULL, NULL, NULL, 0.36, 0.34, 1.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3031_cooked', 'Sữa bột đậu nành', '{}', 'Milk flour, made from roasted soybeans', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 0.0, 405.0, 31.1, 48.2, 9.7, 2.2, NULL, 224.0, 7.5, NULL, 320.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.4, 0.16, 2.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_3032_raw', 'Sữa đậu nành (100g đậu/lít)', '{}', 'Soybean milk (100 g soybean/l)', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 28.0, 3.1, 0.4, 1.6, 0.1, 55.0, 18.0, 1.2, 25.0, 36.0, 124.0, 0.44, 141.0, 0.22, NULL, 0.0, 0.4, 1.35, 3.0, 0.0, 0.05, 0.02, 0.3, 0.518, 0.096, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_3033_raw', 'Tào phớ', '{}', 'Tofu in light syrup (Tofu 160g, sirup 65ml)', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 37.0, 2.3, 6.4, 0.2, 0.2, NULL, 92.0, 0.3, NULL, 150.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4001_raw', 'Bầu', '{}', 'Calabash, Bottle gourd', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 35.3, 14.0, 0.6, 2.9, 0.02, 1.0, 2.0, 21.0, 0.2, 11.0, 25.0, 150.0, 0.7, 26.0, 0.07, 10.0, 0.0, NULL, NULL, NULL, 12.0, 0.02, 0.03, 0.4, 0.152, 0.04, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4002_raw', 'Bí đao (bí xanh)', '{}', 'Asgourd Waxgoured, Winter melon', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 12.0, 0.6, 2.4, NULL, 1.0, 13.0, 26.0, 0.3, 8.0, 23.0, 150.0, NULL, NULL, NULL, 5.0, 0.0, NULL, NULL, NULL, 16.0, 0.01, 0.02, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4003_raw', 'Bí ngô', '{}', 'Pumpkin squash', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.3, 27.0, 0.3, 6.1, 0.1, 0.7, 8.0, 24.0, 0.5, 10.0, 16.0, 349.0, 0.1, 210.0, 16.0, 3100.0, 0.0, 0.0, 1.06, 1.1, 8.0, 0.06, 0.03, 0.4, 0.298, 0.061, 0.0, 0.0, 0.4, '2026-02-26'),
-('fao_vn_2007_4004_raw', 'Cà bát', '{}', 'Egg plant big, Brinja aubergine', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 23.0, 1.2, 4.0, 0.2, 1.5, 2.0, 12.0, 0.7, 14.0, 16.0, 230.0, 0.16, 82.0, 0.25, 40.0, 0.0, NULL, 0.3, 3.5, 3.0, 0.03, 0.04, 0.5, 0.281, 0.084, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4005_raw', 'Cà chua', '{}', 'Tomato', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 20.0, 0.6, 4.0, 0.2, 0.8, 12.0, 12.0, 1.4, 15.0, 26.0, 275.0, 0.74, 90.0, 0.21, 393.0, 0.0, 0.0, 0.54, 7.9, 40.0, 0.06, 0.04, 0.5, 0.089, 0.08, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4006_raw', 'Cà pháo', '{}', 'Egg plant - small', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 20.0, 1.5, 3.6, NULL, 1.6, 7.0, 12.0, 0.7, 18.0, 16.0, 221.0, 0.3, 90.0, 0.2, 20.0, 0.0, NULL, NULL, NULL, 3.0, 0.03, 0.04, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4007_raw', 'Cà rốt (củ đỏ, vàng)', '{}', 'Carrots', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.5, 39.0, 1.5, 7.8, 0.2, 1.2, 52.0, 43.0, 0.8, 12.0, 39.0, 266.0, 1.11, 150.0, 0.23, 8285.0, 0.0, NULL, NULL, NULL, 8.0, 0.06, 0.06, 0.4, 0.273, 0.138, 0.0, 0.0, 3.4, '2026-02-26'),
-('fao_vn_2007_4008_raw', 'Cà rốt khô', '{}', 'Dried carrot', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 292.0, 9.2, 60.4, 1.5, 9.6, NULL, 323.0, 5.9, NULL, 292.0, NULL, NULL, NULL, NULL, 810.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4009_raw', 'Cà tím', '{}', 'Aubergine', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 22.0, 1.0, 4.5, NULL, 1.5, NULL, 15.0, 0.4, NULL, 34.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 15.0, 0.04, 0.05, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4010_raw', 'Cải bắp', '{}', 'Cabbage, common', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 29.0, 1.8, 5.3, 0.1, 1.6, 28.0, 48.0, 1.1, 13.0, 31.0, 190.0, 0.81, 180.0, 0.45, 65.0, 0.0, NULL, 0.15, 60.0, 30.0, 0.06, 0.05, 0.4, 0.14, 0.096, 0.0, 0.0, 1.2, '2026-02-26'),
-('fao_vn_2007_4011_raw', 'Cải bắp đỏ', '{}', 'Cabbage, red', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 22.0, 45.0, 1.9, 9.0, 0.2, 4.0, 27.0, 83.0, 0.5, 16.0, 42.0, 243.0, 0.22, 17.0, 0.24, 670.0, 0.0, 0.0, 0.11, 38.2, 60.0, 0.07, 0.05, 0.8, 0.147, 0.209, 0.0, 0.0, 0.1, '2026-02-26'),
-('fao_vn_2007_4012_raw', 'Cải bắp khô', '{}', 'Dried cabbage, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 245.0, 18.0, 39.7, 1.6, 14.0, NULL, 300.0, 7.5, NULL, 106.0, NULL, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, 2.0, 0.15, 0.52, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4013_raw', 'Cải cúc', '{}', 'Chrysanthemum. crown-daisy', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 14.0, 1.6, 1.9, NULL, 2.0, 33.0, 63.0, 0.8, 32.0, 38.0, 219.0, 0.67, 180.0, 0.7, 1115.0, 0.0, NULL, NULL, NULL, 27.0, 0.01, 0.03, 0.2, 0.221, 0.176, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4014_raw', 'Cải soong', '{}', 'Watercress', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 30.0, 15.0, 2.1, 1.3, 0.1, 2.0, 85.0, 69.0, 1.6, 21.0, 28.0, 211.0, 0.8, 200.0, 0.38, 2820.0, 0.0, 0.0, 1.0, 250.0, 25.0, 0.08, 0.26, 1.0, 0.31, 0.129, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4015_raw', 'Cải thìa (cải trắng)', '{}', 'Chinese cabbage, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 17.0, 1.4, 2.4, 0.2, 1.8, 25.0, 50.0, 0.7, 25.0, 30.0, 200.0, 0.75, 90.0, 0.5, 2681.0, 0.0, NULL, 0.09, 35.8, 26.0, 0.09, 0.07, 0.4, 0.088, 0.194, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4016_raw', 'Cải xanh', '{}', 'Mustard greens, India, leaves and stems', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 24.0, 16.0, 1.7, 1.9, 0.2, 1.8, 29.0, 89.0, 1.9, 23.0, 14.0, 221.0, 0.9, 120.0, 0.32, 6300.0, 0.0, NULL, 2.01, 497.3, 51.0, 0.07, 0.1, 0.8, 0.21, 0.18, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4017_raw', 'Cần ta', '{}', 'Water drop-wort; Celery water', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 10.0, 1.0, 1.5, NULL, 1.5, NULL, 310.0, 3.0, NULL, 64.0, NULL, NULL, NULL, NULL, 2045.0, 0.0, NULL, NULL, NULL, 6.0, 0.04, 0.03, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4018_raw', 'Cần tây', '{}', 'Celery, Chinese', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 16.0, 48.0, 3.7, 7.9, 0.2, 1.5, 96.0, 325.0, 8.0, 18.0, 128.0, 326.0, 0.3, 90.0, 0.2, 150.0, 0.0, NULL, 0.27, 29.3, 150.0, 0.06, 0.07, 0.4, 0.246, 0.074, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4019_raw', 'Chuối xanh', '{}', 'Banana common varieties, unripe', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 32.0, 74.0, 1.2, 16.4, 0.5, 1.0, 13.0, 26.0, 0.4, 17.0, 27.0, 256.0, 0.25, 94.0, 0.1, 184.0, 0.0, NULL, 0.69, 9.5, 31.0, 0.05, 0.02, 0.6, 0.265, 0.357, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4020_raw', 'Củ cải đỏ', '{}', 'Red radish oriental, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 48.0, 1.3, 10.8, NULL, 0.9, NULL, 28.0, 1.4, NULL, 43.0, NULL, NULL, NULL, NULL, 16.0, 0.0, NULL, NULL, NULL, 20.0, 0.02, 0.05, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4021_raw', 'Củ cải trắng', '{}', 'Radish garden while, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.2, 21.0, 1.5, 3.6, 0.1, 1.5, 10.0, 40.0, 1.1, 15.0, 41.0, 242.0, 0.2, 150.0, 0.05, 0.0, 0.0, NULL, 0.0, 0.3, 30.0, 0.06, 0.06, 0.5, 0.138, 0.046, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4022_raw', 'Củ cải trắng khô', '{}', 'Dried radish, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 220.0, 17.6, 33.9, 1.5, 17.7, 278.0, 629.0, 6.73, 170.0, 204.0, 3494.0, 2.13, 1631.0, 0.54, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.27, 0.68, 3.4, 1.854, 0.618, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4023_raw', 'Củ đậu', '{}', 'Pachyrrhizus', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 15.0, 28.0, 1.0, 6.0, NULL, 0.7, NULL, 8.0, NULL, NULL, 16.0, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.0, NULL, NULL, 6.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4024_raw', 'Củ niễng', '{}', 'Manchurian water-rice, Manchurian Wild rice', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.0, 30.0, 2.0, 5.4, NULL, 1.8, NULL, 24.0, 1.4, NULL, 92.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4025_raw', 'Dọc củ cải (non)', '{}', 'Horse radish; dish - tree, drumstick leave', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 4.0, 14.0, 1.9, 1.6, NULL, 1.8, NULL, 220.0, 0.4, NULL, 57.0, NULL, NULL, NULL, NULL, 1090.0, 0.0, NULL, NULL, NULL, 72.0, 0.06, 0.11, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4026_raw', 'Dọc mùng', '{}', 'Colocasia indica', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 5.0, 0.4, 0.8, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4027_raw', 'Dưa chuột', '{}', 'Cucumber', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 16.0, 0.8, 2.9, 0.1, 0.7, 13.0, 23.0, 1.0, 15.0, 27.0, 169.0, 0.18, 90.0, 0.25, 138.0, 0.0, 0.0, 0.03, 16.4, 5.0, 0.03, 0.04, 0.1, 0.259, 0.04, 0.0, 0.0, 0.4, '2026-02-26'),
-('fao_vn_2007_4028_raw', 'Dưa gang', '{}', 'Large cucumber', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 11.0, 0.8, 2.0, NULL, 0.7, NULL, 25.0, 0.4, NULL, 37.0, NULL, NULL, NULL, NULL, 130.0, 0.0, NULL, NULL, NULL, 4.0, 0.04, 0.04, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4029_raw', 'Đậu cô ve', '{}', 'Beans, kidney, in pod, French bean; Navy been', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 73.0, 5.0, 13.3, NULL, 1.0, 96.0, 26.0, 0.7, 26.0, 122.0, 254.0, 0.01, 90.0, 0.5, 180.0, 0.0, NULL, NULL, NULL, 25.0, 0.34, 0.19, 2.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4030_raw', 'Đậu đũa', '{}', 'Cow-peas, yard long, Chinese long bean', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 59.0, 6.0, 7.9, 0.4, 2.0, 5.0, 47.0, 1.6, 36.0, 16.0, 194.0, 0.37, 48.0, 0.21, 250.0, 0.0, NULL, NULL, NULL, 22.0, 0.29, 0.18, 1.8, 0.055, 0.024, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4031_raw', 'Đậu Hà Lan', '{}', 'Green peas; field pea; Peas garden', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 72.0, 6.5, 10.6, 0.4, 1.0, 5.0, 57.0, 0.8, 33.0, 43.0, 244.0, 1.24, 176.0, 0.41, 485.0, 0.0, NULL, 0.13, 24.8, 27.0, 0.4, 0.15, 2.2, 0.104, 0.169, 0.0, 0.0, 3.0, '2026-02-26'),
-('fao_vn_2007_4032_raw', 'Đậu rồng (quả non)', '{}', 'Winged bean goabean, Indies, asparagus pea', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 34.0, 1.9, 6.3, 0.1, 1.6, NULL, 63.0, 1.3, NULL, 60.0, NULL, NULL, NULL, NULL, 270.0, 0.0, NULL, NULL, NULL, 22.0, 0.06, 0.12, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4033_raw', 'Đu đủ xanh', '{}', 'Papaya, unripe, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 22.0, 0.8, 4.6, NULL, 2.0, 7.0, 63.0, 0.9, 56.0, 50.0, 215.0, NULL, 101.0, NULL, 15.0, 0.0, NULL, NULL, NULL, 40.0, 0.02, 0.03, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4034_raw', 'Gấc', '{}', 'Gac fruit, whole', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 80.0, 122.0, 2.1, 10.5, 7.9, 1.8, NULL, 56.0, 1.2, NULL, 6.0, NULL, NULL, NULL, NULL, 21756.0, 0.0, NULL, NULL, NULL, 11.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4035_raw', 'Giá đậu tương', '{}', 'Sprout of soybeans', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 79.0, 7.7, 8.0, 1.8, 0.7, 14.0, 52.0, 1.1, 72.0, 58.0, 484.0, 1.17, 427.0, 0.7, 25.0, 0.0, NULL, NULL, NULL, 10.0, 0.19, 0.15, 0.8, 0.929, 0.176, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4036_raw', 'Giá đậu xanh', '{}', 'Mungobean sprouts, Green gram, Tiensin green bean', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 44.0, 5.5, 5.1, 0.2, 2.0, 23.0, 38.0, 1.4, 17.0, 91.0, 164.0, 0.41, 164.0, 0.19, 6.0, 0.0, NULL, 0.1, 33.0, 10.0, 0.2, 0.13, 0.8, 0.38, 0.088, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4037_raw', 'Hành củ tươi', '{}', 'Onion, Welsh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 24.0, 26.0, 1.3, 4.4, 0.4, 0.7, 17.0, 32.0, 1.1, 23.0, 49.0, 212.0, 0.52, 70.0, 0.14, 15.0, 0.0, NULL, NULL, NULL, 10.0, 0.03, 0.04, 0.2, 0.169, 0.072, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4038_raw', 'Hành lá (hành hoa)', '{}', 'Onion, Welsh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 22.0, 1.3, 4.3, NULL, 0.9, 16.0, 80.0, 1.0, 23.0, 41.0, 123.0, 0.44, 180.0, 0.26, 1370.0, 0.0, 0.0, NULL, NULL, 60.0, 0.03, 0.1, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4039_raw', 'Hành tây', '{}', 'Onion, common, garden', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 17.0, 41.0, 1.8, 8.2, 0.1, 1.1, 8.0, 38.0, 0.8, 23.0, 58.0, 221.0, 1.43, 70.0, 0.2, 1.0, 0.0, 0.0, 0.02, 0.4, 10.0, 0.03, 0.04, 0.2, 0.122, 0.147, 0.0, 0.0, 0.9, '2026-02-26'),
-('fao_vn_2007_4040_raw', 'Hạt sen tươi', '{}', 'Lotus seed, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 39.0, 161.0, 9.5, 29.5, 0.5, 0.8, 1.0, 76.0, 1.4, 56.0, 164.0, 367.0, 0.28, 94.0, 0.62, 10.0, 0.0, NULL, NULL, NULL, 17.0, 0.17, 0.09, 1.7, 0.228, 0.168, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4041_raw', 'Hạt sen khô', '{}', 'Dried lotus seed', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 334.0, 20.0, 58.0, 2.4, 2.2, 5.0, 89.0, 6.4, 210.0, 285.0, 1368.0, 1.05, 350.0, 2.32, 30.0, 0.0, NULL, NULL, NULL, 0.0, 0.64, 0.15, 1.6, 0.851, 0.629, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4042_raw', 'Hẹ lá', '{}', 'Onion, fragrant, Chinese leek', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.0, 18.0, 2.2, 1.5, 0.3, 0.9, 6.0, 56.0, 1.3, 18.0, 45.0, 234.0, 0.2, 100.0, 0.3, 1000.0, 0.0, 0.0, 0.92, 47.0, 19.0, 0.03, 0.09, 0.9, 0.14, 0.233, 0.0, 0.0, 1.4, '2026-02-26'),
-('fao_vn_2007_4043_raw', 'Hoa chuối', '{}', 'Banana, buds and flowers', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 29.0, 20.0, 1.5, 3.5, NULL, 2.0, NULL, 44.0, 0.9, NULL, 32.0, NULL, NULL, NULL, NULL, 170.0, 0.0, NULL, NULL, NULL, 5.0, 1.04, 0.03, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4044_raw', 'Hoa lý', '{}', 'Daylily, lemon flowers, Pergularia, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 3.0, 23.0, 2.9, 2.8, NULL, 3.0, NULL, 52.0, 1.2, NULL, 53.0, NULL, NULL, NULL, NULL, 585.0, 0.0, NULL, NULL, NULL, 48.0, 0.19, 0.13, 1.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4045_raw', 'Khế', '{}', 'Carambola; Star fruit', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.0, 16.0, 0.6, 2.8, 0.3, 2.6, 2.0, 10.0, 0.9, 10.0, 8.0, 133.0, 0.12, 137.0, 0.04, 25.0, 0.0, 0.0, 0.15, 0.0, 30.0, 0.05, 0.04, 0.4, 0.391, 0.017, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4046_raw', 'Lá lốt', '{}', 'Lolot', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 39.0, 4.3, 5.4, NULL, 2.5, 15.0, 260.0, 4.1, 98.0, 980.0, 598.0, NULL, NULL, NULL, 4050.0, 0.0, NULL, NULL, NULL, 34.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4047_raw', 'Lá me', '{}', 'Tamarind, leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 46.0, 7.5, 4.0, NULL, NULL, NULL, 319.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4048_raw', 'Lá mơ lông', '{}', 'Wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 27.0, 3.9, 2.9, NULL, 5.1, NULL, 211.0, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, 330.0, 0.0, NULL, NULL, NULL, 75.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4049_raw', 'Lá sắn tươi', '{}', 'Cassava leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 78.0, 7.0, 12.6, NULL, 4.3, NULL, 200.0, 1.9, NULL, 27.0, NULL, NULL, NULL, NULL, 8280.0, 0.0, NULL, NULL, NULL, 295.0, 0.25, 0.66, 2.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4050_raw', 'Măng chua', '{}', 'Bamboo shoot, unspecified', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 24.0, 11.0, 1.4, 1.4, NULL, 4.1, 9.0, 18.0, 0.9, 88.0, 29.0, 486.0, 1.1, 190.0, NULL, 15.0, 0.0, NULL, NULL, NULL, 9.0, 0.11, 0.09, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4051_raw', 'Măng khô', '{}', 'Dried bamboo shoots', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 157.0, 13.0, 21.5, 2.1, 36.0, NULL, 100.0, 5.0, NULL, 200.0, NULL, NULL, NULL, NULL, 20.0, 0.0, NULL, NULL, NULL, 1.0, 0.11, 0.14, 1.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4052_raw', 'Măng tây', '{}', 'Asparagus, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 50.0, 14.0, 2.2, 1.1, 0.1, 2.3, 2.0, 21.0, 0.9, 14.0, 6.0, 202.0, 0.54, 189.0, 0.16, 449.0, 0.0, NULL, 1.13, 41.6, 10.0, 0.16, 0.03, 3.0, 0.274, 0.091, 0.0, 0.0, 0.2, '2026-02-26'),
-('fao_vn_2007_4053_raw', 'Măng tre', '{}', 'Bamboo shoots, spring variety', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 50.0, 15.0, 1.7, 1.4, 0.3, 4.1, 4.0, 22.0, 1.0, 3.0, 58.0, 533.0, 1.1, 190.0, 0.26, 12.0, 0.0, NULL, 1.0, 0.0, 1.0, 0.08, 0.08, 0.6, 0.161, 0.24, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4054_raw', 'Mướp', '{}', 'Gourd, sponge gourd', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.8, 17.0, 0.9, 2.8, 0.2, 0.5, 3.0, 28.0, 0.8, 14.0, 45.0, 139.0, 0.07, 35.0, 0.09, 160.0, 0.0, NULL, NULL, NULL, 8.0, 0.04, 0.06, 0.5, 0.218, 0.043, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4055_raw', 'Mướp đắng', '{}', 'Balsam-pear, balsam-apple, bitter melon, bitter gourd', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 16.0, 0.9, 2.8, 0.2, 1.1, 5.0, 18.0, 0.6, 17.0, 29.0, 296.0, 0.8, 34.0, 0.09, 190.0, 0.0, NULL, NULL, NULL, 22.0, 0.07, 0.04, 0.3, 0.212, 0.043, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4056_raw', 'Mướp Nhật bản', '{}', 'Gourd, sponge gourd, Japanese', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 10.0, 0.8, 1.8, 0.0, 1.4, NULL, 30.0, 0.3, NULL, 22.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4057_raw', 'Ngải cứu', '{}', 'Mugwort, common sagebrush', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 31.0, 25.0, 3.8, 2.4, 0.0, 2.0, NULL, 136.0, 3.1, NULL, 45.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4058_raw', 'Ngô bao tử', '{}', 'Corn, small variety immature, baby corn', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 40.0, 2.2, 7.4, 0.2, 0.4, NULL, 5.0, 0.9, NULL, 52.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 34.0, 0.09, 0.2, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4059_raw', 'Ngó sen', '{}', 'Lotus, stem underground', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 11.0, 61.0, 1.0, 13.9, 0.1, 1.2, 40.0, 19.0, 0.5, 23.0, 51.0, 556.0, 0.39, 257.0, 0.26, 10.0, 0.0, NULL, NULL, NULL, 25.0, 0.11, 0.04, 0.4, 0.377, 0.258, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4060_raw', 'Nụ mướp', '{}', 'Sponge gourd, rag, young flower', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.0, 30.0, 4.9, 2.5, NULL, 1.5, NULL, 140.0, 1.2, NULL, 80.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4061_raw', 'ớt đỏ to', '{}', 'Chili pepper, peppers red', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.0, 23.0, 1.0, 4.0, 0.3, 2.0, 2.0, 7.0, 0.43, 12.0, 26.0, 211.0, 0.25, 17.0, 0.11, 1624.0, 0.0, 0.0, 1.58, 4.9, 190.0, 0.05, 0.09, 1.0, 0.317, 0.291, 0.0, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4062_raw', 'ớt vàng to', '{}', 'Peppers, yellow', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 29.0, 1.3, 5.5, 0.2, 1.4, 15.0, 86.0, 3.6, 12.0, 120.0, 275.0, 0.32, 140.0, 1.1, 120.0, 0.0, NULL, NULL, NULL, 250.0, 0.37, 0.51, 2.5, 0.168, 0.168, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4063_raw', 'ớt xanh to', '{}', 'Peppers, green', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 25.0, 1.3, 4.5, 0.2, 1.5, 3.0, 6.0, 0.8, 10.0, 25.0, 175.0, 0.13, 66.0, 0.12, 198.0, 0.0, NULL, NULL, NULL, 103.0, 0.04, 0.05, 0.9, 0.099, 0.224, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4064_raw', 'Quả dọc', '{}', '', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 36.0, 19.0, 0.8, 3.9, 0.0, NULL, NULL, 21.0, NULL, NULL, 5.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4065_raw', 'Quả me chua', '{}', 'Tamarind fruit, pulp raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 15.0, 27.0, 1.9, 4.8, NULL, 2.0, NULL, 130.0, 0.4, NULL, 46.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 12.0, 0.15, 0.05, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4066_raw', 'Rau bí', '{}', 'Pumpkin leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 23.4, 18.0, 2.7, 1.7, NULL, 1.7, 17.0, 100.0, 2.1, 18.0, 26.0, 390.0, 0.45, 90.0, 0.29, 1940.0, 0.0, NULL, NULL, NULL, 11.0, 0.09, 0.13, 0.9, 0.042, 0.207, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4067_raw', 'Rau câu khô', '{}', 'Dried seaweed', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 198.0, 11.2, 35.8, 1.1, 20.8, 102.0, 378.0, 8.8, 770.0, 124.0, 1125.0, 5.8, 610.0, 4.3, NULL, 0.0, NULL, 5.0, 24.4, 0.0, 0.01, 0.22, 0.2, 3.018, 0.303, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4068_raw', 'Rau câu tươi', '{}', 'Seaweed fresh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 4.0, 25.0, 1.9, 4.1, 0.1, 5.0, 9.0, 85.0, 0.9, 67.0, 34.0, 226.0, 0.58, 61.0, 0.37, NULL, 0.0, NULL, 0.87, 2.3, 0.0, 0.01, 0.03, 0.5, 0.302, 0.032, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4069_raw', 'Rau diếp', '{}', 'Lettuce garden', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 14.0, 1.2, 1.8, 0.2, 0.5, 14.0, 38.0, 1.1, 18.0, 37.0, 254.0, 0.4, 180.0, 0.8, 4443.0, 0.0, NULL, 0.29, 173.6, 30.0, 0.3, 0.09, 0.2, 0.134, 0.09, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4070_raw', 'Rau đay', '{}', 'Jute potherb', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 25.0, 2.8, 3.0, 0.3, 1.5, 16.0, 182.0, 7.7, 79.0, 57.0, 417.0, 0.79, 255.0, 0.12, 4560.0, 0.0, NULL, NULL, NULL, 77.0, 0.13, 0.26, 1.1, 0.072, 0.6, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4071_raw', 'Rau giấp cá, diếp cá', '{}', 'Wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 22.0, 2.9, 2.7, NULL, 1.8, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 620.0, 0.0, NULL, NULL, NULL, 68.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4072_raw', 'Rau giền cơm', '{}', 'Amaranth, spineless', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 21.0, 3.4, 1.1, 0.3, 1.6, 20.0, 341.0, 4.1, 55.0, 76.0, 611.0, 0.9, 162.0, 0.89, 5300.0, 0.0, NULL, NULL, 1140.0, 63.0, 0.36, 1.3, 1.3, 0.064, 0.192, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4073_raw', 'Rau giền đỏ', '{}', 'Amaranth, sp. Red', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 38.0, 41.0, 3.3, 6.2, 0.3, 1.6, 56.0, 288.0, 5.4, 164.0, 123.0, 476.0, 0.5, 200.0, 1.85, 4080.0, 0.0, NULL, NULL, NULL, 89.0, 0.08, 1.16, 1.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4074_raw', 'Rau giền trắng', '{}', 'Amaranth, sp White', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 14.0, 42.0, 3.2, 6.3, 0.4, 1.5, NULL, 288.0, 6.1, NULL, 80.0, NULL, NULL, NULL, NULL, 2855.0, 0.0, NULL, NULL, NULL, 27.0, 0.08, 0.28, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4075_raw', 'Rau húng', '{}', 'Basil sweet leaves, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 20.0, 2.2, 1.5, 0.6, 3.5, 91.0, 202.0, 4.8, 73.0, 83.0, 148.0, 0.91, 220.0, 1.86, 3142.0, 0.0, NULL, NULL, 414.8, 27.0, 0.08, 0.35, 0.8, 0.238, 0.129, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4076_raw', 'Rau khoai lang', '{}', 'Sweet potato, leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 23.0, 2.6, 2.5, 0.3, 1.4, 19.0, 48.0, 2.7, 60.0, 54.0, 498.0, 0.29, 37.0, 0.26, 1830.0, 0.0, NULL, NULL, NULL, 11.0, 0.13, 0.26, 0.9, 0.225, 0.19, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4077_raw', 'Rau kinh giới', '{}', 'Sweet marjoram', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 16.0, 22.0, 2.7, 2.8, NULL, 3.6, 2.0, 246.0, 1.0, 89.0, 15.0, 211.0, 0.52, 250.0, NULL, 4360.0, 0.0, NULL, NULL, NULL, 110.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4078_raw', 'Rau má rừng', '{}', 'Wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 25.0, 3.1, 3.1, NULL, 1.5, NULL, 172.0, 0.2, NULL, 24.0, NULL, NULL, NULL, NULL, 260.0, 0.0, NULL, NULL, NULL, 20.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4079_raw', 'Rau má, má mơ', '{}', 'Wort, India penny', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 20.0, 3.2, 1.8, NULL, 4.5, NULL, 229.0, 3.1, NULL, 2.0, NULL, NULL, NULL, NULL, 1300.0, 0.0, NULL, NULL, NULL, 37.0, 0.15, 0.14, 1.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4080_raw', 'Rau mồng tơi', '{}', 'Malabar night shade, Vinespinach, Ceylon spinach', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 17.0, 14.0, 2.0, 1.4, NULL, 2.5, 38.0, 176.0, 1.6, 94.0, 34.0, 391.0, 0.54, 20.0, 0.45, 1920.0, 0.0, NULL, NULL, NULL, 72.0, 0.06, 0.17, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4081_raw', 'Rau mùi', '{}', 'Coriander', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 15.0, 16.0, 2.6, 0.2, 0.5, 1.8, 46.0, 133.0, 4.5, 26.0, 80.0, 521.0, 0.5, 225.0, 0.43, 3930.0, 0.0, NULL, 2.5, 310.0, 140.0, 0.11, 0.15, 1.3, 0.57, 0.149, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4082_raw', 'Rau mùi tàu', '{}', 'Parsley, curley', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 25.0, 2.1, 2.4, 0.8, 1.6, 39.0, 20.0, 2.9, 35.0, 30.0, 237.0, 0.41, 210.0, 0.36, 5040.0, 0.0, NULL, 0.75, 1640.0, 177.0, 0.11, 0.28, 1.4, 0.4, 0.09, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4083_raw', 'Rau muống', '{}', 'Swamp cabbage, water spinach, water convol', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 37.5, 25.0, 3.2, 2.1, 0.4, 1.0, 37.0, 100.0, 1.4, 15.0, 37.0, 331.0, 0.35, 100.0, 0.6, 5597.0, 0.0, NULL, 2.03, 482.9, 23.0, 0.1, 0.09, 0.7, 0.065, 0.195, 0.0, 0.0, 1.6, '2026-02-26'),
-('fao_vn_2007_4084_raw', 'Rau muống khô', '{}', 'Water spinach, dried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 245.0, 34.2, 23.0, 1.8, 12.0, NULL, 880.0, 15.2, NULL, 300.0, NULL, NULL, NULL, NULL, 12996.0, 0.0, NULL, NULL, NULL, 10.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4085_raw', 'Rau ngổ', '{}', 'Limnophila aromatic', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 29.0, 15.0, 1.5, 2.3, NULL, 2.1, 5.0, 84.0, 2.2, NULL, 18.0, 222.0, 1.48, 480.0, 1.49, 2325.0, 0.0, NULL, NULL, NULL, 78.0, 0.11, 0.15, 1.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4086_raw', 'Rau ngót', '{}', 'Sauropus, sp. leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 23.0, 35.0, 5.3, 3.4, NULL, 2.5, 25.0, 169.0, 2.7, 123.0, 65.0, 457.0, 0.94, 190.0, 2.4, 6650.0, 0.0, NULL, NULL, NULL, 185.0, 0.07, 0.39, 2.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4087_raw', 'Rau ngót khô', '{}', 'Sauropus, dried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 239.0, 32.2, 21.8, 2.6, 15.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 1560.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4088_raw', 'Rau răm', '{}', 'Polygonum odoratum', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 30.0, 4.7, 2.8, NULL, 3.8, 5.0, 316.0, 2.2, 28.0, 55.0, 216.0, 1.05, 390.0, 3.63, NULL, 0.0, NULL, NULL, NULL, 57.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4089_raw', 'Rau rút', '{}', 'Neptunia, dismanthus', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 55.0, 28.0, 5.1, 1.8, NULL, 1.9, NULL, 180.0, NULL, NULL, 59.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4090_raw', 'Rau sà lách', '{}', 'Lettuce, garden asparagus', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 17.0, 1.5, 1.8, 0.4, 0.5, 59.0, 77.0, 0.9, 18.0, 34.0, 333.0, 0.4, 220.0, 0.75, 1050.0, 0.0, NULL, NULL, NULL, 15.0, 0.14, 0.12, 0.7, NULL, NULL, NULL, NULL, 0.7, '2026-02-26'),
-('fao_vn_2007_4091_raw', 'Rau sam', '{}', 'Purslane, common', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 18.0, 1.4, 3.0, NULL, 0.7, NULL, 85.0, 1.5, NULL, 56.0, NULL, NULL, NULL, NULL, 160.0, 0.0, NULL, NULL, NULL, 26.0, 0.03, 0.11, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4092_raw', 'Rau sắng (chùa Hương)', '{}', 'Perfume pagoda wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 40.0, 48.0, 6.5, 5.5, NULL, 3.4, NULL, 110.0, NULL, NULL, 80.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 114.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4093_raw', 'Rau tàu bay', '{}', 'Gynura crepidioides', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 18.0, 2.5, 1.9, NULL, 1.6, NULL, 81.0, NULL, NULL, 25.0, NULL, NULL, NULL, NULL, 1700.0, 0.0, NULL, NULL, NULL, 10.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4094_raw', 'Rau thơm', '{}', 'Mint leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 18.0, 2.0, 2.4, NULL, 3.0, 6.0, 170.0, 3.8, NULL, 49.0, 217.0, 0.56, 740.0, 0.88, 3560.0, 0.0, NULL, NULL, NULL, 41.0, 0.14, 0.15, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4095_raw', 'Sấu xanh', '{}', 'Dracontomelum fruit, unripe, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 35.0, 19.0, 1.8, 3.0, NULL, NULL, NULL, 135.0, NULL, NULL, 6.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4096_raw', 'Su hào', '{}', 'Kohlrabi', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 22.4, 37.0, 2.8, 6.2, 0.1, 1.7, 53.0, 46.0, 0.6, 19.0, 50.0, 321.0, 0.45, 310.0, 0.62, 22.0, 0.0, NULL, 0.48, 0.1, 40.0, 0.06, 0.05, 0.2, 0.165, 0.15, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4097_raw', 'Su hào khô', '{}', 'Dried kohlrabi', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 261.0, 20.0, 42.1, 1.4, 12.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4098_raw', 'Su su, quả', '{}', 'Chayote, fruit raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 19.0, 0.8, 3.6, 0.1, 1.0, 2.0, 17.0, 0.4, 12.0, 14.0, 125.0, 0.74, 123.0, 0.19, 0.0, 0.0, NULL, 0.12, 4.6, 4.0, 0.01, 0.02, 0.4, 0.249, 0.076, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4099_raw', 'Súp lơ trắng', '{}', 'Cauliflower, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 40.0, 30.0, 2.5, 4.8, 0.1, 0.9, 20.0, 26.0, 1.4, 22.0, 51.0, 349.0, 0.2, 140.0, 0.2, 8.0, 0.0, NULL, 0.08, 16.0, 70.0, 0.11, 0.1, 0.6, 0.652, 0.222, 0.0, 0.0, 1.5, '2026-02-26'),
-('fao_vn_2007_4100_raw', 'Súp lơ xanh', '{}', 'Cauliflower, green', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 39.0, 26.0, 3.0, 2.9, 0.3, 3.2, 23.0, 33.0, 0.73, 20.0, 62.0, 300.0, 0.64, 41.0, 0.25, 93.0, 0.0, NULL, 0.04, 20.2, 88.0, 0.08, 0.1, 0.7, 0.696, 0.222, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4101_raw', 'Thìa là', '{}', 'Dill', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 28.0, 2.6, 1.8, 1.1, 5.0, 48.0, 200.0, 1.2, 55.0, 12.0, 361.0, 0.5, 220.0, 0.55, 2850.0, 0.0, NULL, NULL, NULL, 63.0, 0.05, 0.12, 0.7, 0.397, 0.185, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4102_raw', 'Tía tô', '{}', 'Balm-mint, garden- balm', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 25.0, 2.9, 3.4, NULL, 3.6, 3.0, 190.0, 3.2, 112.0, 18.0, 284.0, 0.86, 460.0, 0.73, 5520.0, 0.0, NULL, NULL, NULL, 13.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4103_raw', 'Tỏi ta', '{}', 'Garlic bulbs', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 121.0, 6.0, 23.0, 0.5, 1.5, 18.0, 24.0, 1.5, 8.0, 181.0, 373.0, 0.9, 299.0, 1.3, 0.0, 0.0, NULL, 0.01, 1.4, 10.0, 0.24, 0.03, 0.9, 0.596, 1.235, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4104_raw', 'Tỏi tây (cả lá)', '{}', 'Chinese Leek, Onion fragrant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 29.0, 1.4, 5.9, NULL, 1.5, NULL, 80.0, 2.0, NULL, 58.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 20.0, 0.06, 0.04, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4105_raw', 'Trám đen chín', '{}', 'Variety of canarium', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 50.0, 114.0, 2.5, 3.6, 10.0, 4.9, NULL, 140.0, NULL, NULL, 30.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 14.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4106_raw', 'Trám xanh sống, trám trắng', '{}', 'Chinese olive', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 34.0, 37.0, 1.2, 4.4, 1.6, 4.9, NULL, 136.0, NULL, NULL, 9.0, NULL, NULL, NULL, NULL, 330.0, 0.0, NULL, NULL, NULL, 20.0, 0.02, 0.11, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4107_raw', 'Xương sông', '{}', 'Edible herbaceous plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 15.0, 2.2, 1.5, NULL, 3.2, 12.0, 112.0, 4.0, 50.0, 17.0, 424.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 4.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4108_raw', 'Cà chua muối', '{}', 'Tomato, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 6.0, 0.6, 1.0, NULL, 0.8, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4109_raw', 'Cà muối nén', '{}', 'Eggplant, garden, brinjan; aubergine, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 13.0, 1.3, 2.0, NULL, 1.7, NULL, 15.0, 0.8, NULL, 18.0, NULL, NULL, NULL, NULL, 40.0, 0.0, NULL, NULL, NULL, NULL, 0.05, 0.06, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4110_raw', 'Cà muối sổi', '{}', 'Eggplant, garden, brinjan; aubergine, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 16.0, 1.5, 2.5, NULL, 1.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4111_raw', 'Dưa cải bắp', '{}', 'Cabbage Chinese, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 18.0, 1.2, 3.3, NULL, 1.6, NULL, 51.0, 0.3, NULL, 34.0, NULL, NULL, NULL, NULL, 20.0, 0.0, NULL, NULL, NULL, 20.0, 0.01, 0.06, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4112_raw', 'Dưa cải bẹ', '{}', 'Mustard green, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 17.0, 1.8, 2.4, NULL, 2.1, NULL, 100.0, 3.0, NULL, 21.0, NULL, NULL, NULL, NULL, 745.0, 0.0, NULL, NULL, NULL, 3.0, 0.03, 0.12, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4113_raw', 'Dưa cải sen', '{}', 'Rape bird, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 10.0, 1.1, 1.3, NULL, 1.8, NULL, 63.0, NULL, NULL, 41.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4114_raw', 'Dưa chuột muối', '{}', 'Cucumber, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 13.0, 0.8, 2.5, NULL, 0.7, 1208.0, 25.0, 1.2, 4.0, 20.0, 23.0, 0.02, 85.0, 0.01, 100.0, 0.0, NULL, 0.06, 13.0, 4.0, 0.01, 0.02, 0.2, 0.038, 0.009, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4115_raw', 'Dưa giá (đậu xanh)', '{}', 'Mung bean sprouts, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 39.0, 5.0, 4.8, NULL, 2.0, NULL, 22.0, 1.1, NULL, 33.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4116_raw', 'Hành củ muối', '{}', 'Onion, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 30.0, 22.0, 1.4, 4.0, NULL, 0.7, NULL, 12.0, 1.3, NULL, 5.0, NULL, NULL, NULL, NULL, 18.0, 0.0, NULL, NULL, NULL, NULL, 0.02, 0.03, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4117_raw', 'Kiệu muối', '{}', 'Onion shallot, scallion, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 30.0, 24.0, 1.3, 4.7, NULL, 1.2, NULL, 50.0, 1.2, NULL, 35.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 12.0, 0.05, 0.1, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4118_raw', 'Nhút (muối từ mít non, ngọn đậu xanh non...)', '{}', 'Mix pickled from young jack fruit', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 16.0, 2.5, 1.5, NULL, 2.3, NULL, 204.0, 9.0, NULL, 33.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4119_raw', 'Men bia khô', '{}', 'Brewer''s yeast, fried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 340.0, 52.5, 25.4, 3.2, 6.6, NULL, 44.0, 16.1, NULL, 1291.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 2.33, 5.44, 36.7, NULL, NULL, NULL, NULL, 200.0, '2026-02-26'),
-('fao_vn_2007_4120_raw', 'Men bia tươi', '{}', 'Baker''s yeast, fresh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 95.0, 16.2, 4.5, 1.3, 2.0, NULL, 30.0, 5.0, NULL, 272.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.77, 1.06, 8.3, NULL, NULL, NULL, NULL, 60.0, '2026-02-26'),
-('fao_vn_2007_4121_raw', 'Mộc nhĩ', '{}', 'Jew''s ear, Juda''s ear, dried, Wood-ear, Tender variety', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 304.0, 10.6, 65.0, 0.2, 7.0, 70.0, 357.0, 56.1, 146.0, 201.0, 708.0, 7.52, 5070.0, 1.15, 20.0, 0.0, NULL, NULL, NULL, 1.0, 0.15, 0.55, 2.7, 21.477, 0.95, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_4122_raw', 'Nấm hương khô', '{}', 'Mushroom Chinese, dried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 274.0, 36.0, 23.5, 4.0, 17.0, NULL, 184.0, 35.0, NULL, 606.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.16, 1.59, 23.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4123_raw', 'Nấm hương tươi', '{}', 'Mushroom, Chinese, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 39.0, 5.5, 3.1, 0.5, 3.0, NULL, 27.0, 5.2, NULL, 89.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4124_raw', 'Nấm mỡ (Nấm tây)', '{}', 'Mushroom', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 32.0, 4.0, 3.4, 0.3, 1.1, 12.0, 28.0, 1.3, 14.0, 80.0, 322.0, 0.3, 1790.0, 0.1, 10.0, 0.0, NULL, NULL, NULL, 4.0, 0.11, 0.16, 3.3, NULL, NULL, NULL, NULL, 16.0, '2026-02-26'),
-('fao_vn_2007_4125_raw', 'Nấm rơm', '{}', 'Mushroom, straw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 57.0, 3.6, 3.4, 3.2, 1.1, NULL, 28.0, 1.2, NULL, 80.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 2.0, 0.12, 0.33, 9.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_4126_raw', 'Nấm thường tươi', '{}', 'Mushroom, common', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 34.0, 4.6, 2.2, 0.8, 3.5, 5.0, 2.0, 0.7, 9.0, 59.0, 318.0, 0.52, 318.0, 0.05, 10.0, 0.0, 1.9, 0.01, 0.0, 6.0, 0.25, 0.3, 5.2, 1.497, 0.104, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5001_raw', 'Bưởi', '{}', 'Pomelo, Pummelo; Shaddock', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 35.0, 30.0, 0.2, 7.3, 0.0, 0.7, 3.0, 23.0, 0.5, 6.0, 18.0, 159.0, 0.16, 120.0, 0.02, 0.0, 0.0, NULL, NULL, NULL, 95.0, 0.04, 0.02, 0.3, NULL, 0.036, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5002_raw', 'Cam', '{}', 'Orange', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 31.1, 38.0, 0.9, 8.3, 0.1, 1.4, 4.0, 34.0, 0.4, 10.0, 23.0, 108.0, 0.22, 140.0, 0.52, 71.0, 0.0, NULL, 0.18, 0.0, 40.0, 0.08, 0.03, 0.2, 0.25, 0.06, 0.0, 0.0, 0.89, '2026-02-26'),
-('fao_vn_2007_5003_raw', 'Chanh', '{}', 'Lemon', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 25.0, 24.0, 0.9, 4.5, 0.3, 1.3, 3.0, 40.0, 0.6, 12.0, 22.0, 145.0, 0.1, 260.0, NULL, NULL, 0.0, NULL, NULL, NULL, 77.0, 0.04, 0.01, 0.1, 0.232, 0.109, NULL, NULL, 0.5, '2026-02-26'),
-('fao_vn_2007_5004_raw', 'Chôm chôm', '{}', 'Rambutan', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 50.0, 72.0, 1.5, 16.4, 0.0, 1.3, NULL, 28.0, 0.5, NULL, 15.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5005_raw', 'Chuối khô', '{}', 'Banana, dried', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 292.0, 5.0, 68.0, 0.0, 2.3, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5006_raw', 'Chuối tây', '{}', 'Banana', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 26.5, 56.0, 0.9, 12.4, 0.3, 2.6, 17.0, 12.0, 0.5, 27.0, 25.0, 286.0, 0.32, 150.0, 0.31, 26.0, 0.0, NULL, 0.1, 0.5, 6.0, 0.04, 0.07, 0.6, 0.334, 0.367, 0.0, 0.0, 5.5, '2026-02-26'),
-('fao_vn_2007_5007_raw', 'Chuối tiêu', '{}', 'Banana, dwarf', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 35.0, 97.0, 1.5, 22.2, 0.2, 0.8, 19.0, 8.0, 0.6, 41.0, 28.0, 329.0, 0.37, 140.0, 0.12, 45.0, 0.0, NULL, NULL, NULL, 6.0, 0.04, 0.05, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5008_raw', 'Dâu gia', '{}', 'Blackberry', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 56.0, 27.0, 0.6, 6.2, NULL, NULL, NULL, 20.0, 0.5, NULL, 12.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5009_raw', 'Dâu tây', '{}', 'Strawberry', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 15.0, 43.0, 1.8, 8.1, 0.4, 4.0, 37.0, 22.0, 0.7, 17.0, 23.0, 292.0, NULL, NULL, NULL, 30.0, 0.0, NULL, NULL, NULL, 60.0, 0.03, 0.06, 0.3, NULL, NULL, NULL, NULL, 1.1, '2026-02-26'),
-('fao_vn_2007_5010_raw', 'Dưa bở', '{}', 'Musk melon, Spanish melon, Cantaloupe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 10.0, 18.0, 0.5, 3.6, 0.2, 0.7, 0.0, 36.0, 0.3, 9.0, 36.0, 201.0, 0.17, 86.0, 0.05, 150.0, 0.0, NULL, 0.77, 2.2, 9.0, 0.04, 0.02, 0.4, 0.185, 0.025, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5011_raw', 'Dưa hấu', '{}', 'Watermelon', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 48.0, 16.0, 1.2, 2.3, 0.2, 0.5, 5.0, 8.0, 1.0, 15.0, 13.0, 187.0, 0.11, 80.0, 0.03, 303.0, 0.0, NULL, 0.05, 0.1, 7.0, 0.04, 0.04, 0.2, 0.221, 0.045, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5012_raw', 'Dưa hồng', '{}', 'Honey dew melon', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 16.0, 17.0, 0.3, 3.7, 0.1, 0.4, 18.0, 27.0, 0.4, 10.0, 12.0, 228.0, 0.09, 24.0, 0.03, 30.0, 0.0, NULL, 0.02, 2.9, 7.0, 0.02, 0.02, 0.5, 0.155, 0.088, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5013_raw', 'Dưa lê', '{}', '', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 18.0, 18.0, 0.4, 4.2, 0.0, 0.5, NULL, 11.0, 0.6, NULL, 21.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5014_raw', 'Dứa ta', '{}', 'Pineapple, wild', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 40.0, 29.0, 0.8, 6.5, NULL, 0.8, 24.0, 15.0, 0.5, 22.0, 17.0, 157.0, 0.25, 320.0, 0.12, 40.0, 0.0, NULL, NULL, NULL, 24.0, 0.08, 0.02, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5015_raw', 'Dứa tây', '{}', 'Pineapple', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 40.0, 38.0, 0.5, 8.8, 0.1, 0.4, 1.0, 32.0, 0.3, 12.0, 11.0, 115.0, 0.1, 99.0, 1.18, 34.0, 0.0, NULL, 0.02, 0.7, 26.0, 0.08, 0.03, 0.2, 0.205, 0.11, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5016_raw', 'Đào', '{}', 'Peach', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.0, 31.0, 0.9, 6.3, 0.2, 1.5, 0.0, 20.0, 0.45, 9.0, 34.0, 190.0, 0.17, 68.0, 0.06, 162.0, 0.0, NULL, 0.73, 2.6, 10.0, 0.02, 0.05, 0.9, 0.153, 0.025, 0.0, 0.0, 0.2, '2026-02-26'),
-('fao_vn_2007_5017_raw', 'Đu đủ chín', '{}', 'Papaya, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.4, 36.0, 1.0, 7.6, 0.1, 0.6, 4.0, 40.0, 2.6, 8.0, 32.0, 221.0, 0.1, 40.0, 0.84, 276.0, 0.0, NULL, 0.73, 2.6, 54.0, 0.02, 0.02, 0.4, 0.218, 0.019, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5018_raw', 'Gioi', '{}', 'Ohia; Malaya roseapple', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 19.0, 16.0, 0.4, 3.2, 0.3, 2.9, 0.0, 12.0, 0.5, 5.0, 6.0, 123.0, 0.06, 16.0, 0.03, NULL, 0.0, NULL, NULL, NULL, 30.0, 0.03, 0.02, 0.2, NULL, NULL, NULL, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5019_raw', 'Hồng bì', '{}', 'Wampee, Chinese; Wampi', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 46.0, 34.0, 1.4, 7.2, NULL, 2.4, NULL, 48.0, 0.4, NULL, 9.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 24.0, 0.02, 0.11, 3.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5020_raw', 'Hồng đỏ', '{}', 'Persimmon kaki, soft type, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 8.8, 29.0, 0.7, 6.0, 0.2, 2.5, 4.0, 10.0, 0.2, 9.0, 19.0, 214.0, 0.19, 100.0, 1.12, 253.0, 0.0, NULL, 0.73, 2.6, 16.0, 0.01, 0.02, 0.2, NULL, 0.1, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5021_raw', 'Hồng ngâm', '{}', 'Persimmon kaki, Hard-type, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 17.7, 38.0, 0.9, 8.6, NULL, 2.5, 3.0, 10.0, 0.2, NULL, 19.0, 217.0, 0.22, 100.0, 1.22, 1615.0, 0.0, NULL, NULL, NULL, 16.0, 0.01, 0.02, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5022_raw', 'Hồng xiêm', '{}', 'Sapodilla, sapota ponderosa', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 10.0, 48.0, 0.5, 10.0, 0.7, 2.5, 12.0, 52.0, 2.3, 12.0, 24.0, 193.0, 0.1, 86.0, NULL, NULL, 0.0, NULL, NULL, NULL, 8.0, 0.0, 0.02, 0.2, 0.252, 0.037, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5023_raw', 'Lê', '{}', 'Pear', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.0, 45.0, 0.7, 10.2, 0.2, 0.6, 5.0, 19.0, 2.3, 7.0, 16.0, 88.0, 0.13, 140.0, 0.05, 27.0, 0.0, NULL, 0.12, 4.5, 4.0, 0.02, 0.04, 0.1, 0.048, 0.028, 0.0, 0.0, 0.1, '2026-02-26'),
-('fao_vn_2007_5024_raw', 'Lựu', '{}', 'Pome granate', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 85.0, 70.0, 0.6, 16.2, 0.3, 2.5, 3.0, 13.0, 0.7, 3.0, 23.0, 259.0, 0.12, 70.0, NULL, 40.0, 0.0, NULL, 0.6, 4.6, 6.0, 0.07, 0.01, 0.3, 0.596, 0.105, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5025_raw', 'Mãng cầu xiêm', '{}', 'Siamese custard apple, soursop', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 21.0, 53.0, 1.8, 10.1, 0.6, 1.9, 4.0, 38.0, 0.7, 18.0, 14.0, 382.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 19.0, 0.08, 0.1, 0.5, 0.135, 0.221, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5026_raw', 'Mắc coọc', '{}', 'Pyrus pashia Ham', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 24.0, 0.2, 5.7, NULL, NULL, NULL, 32.0, 0.6, NULL, 7.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5027_raw', 'Mận', '{}', 'Japanese, plum', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 15.0, 20.0, 0.6, 3.9, 0.2, 0.7, 0.0, 28.0, 0.4, 7.0, 20.0, 157.0, 0.1, 57.0, 0.05, 98.0, 0.0, NULL, 0.26, 6.4, 3.0, 0.06, 0.04, 0.5, 0.135, 0.029, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5028_raw', 'Mít dai', '{}', 'Jackfruit, jackfruit mature', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 55.0, 50.0, 0.6, 11.1, 0.3, 1.2, 3.0, 21.0, 0.4, 37.0, 28.0, 368.0, 0.67, 120.0, 0.15, 180.0, 0.0, NULL, NULL, NULL, 5.0, 0.09, 0.04, 0.7, NULL, 0.108, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5029_raw', 'Mít khô', '{}', 'Dried jackfruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 280.0, 2.9, 67.0, NULL, 1.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5030_raw', 'Mít mật', '{}', 'Jack fruit, honey', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 55.0, 62.0, 1.5, 14.0, NULL, 1.2, NULL, 21.0, 0.4, NULL, 28.0, NULL, NULL, NULL, NULL, 80.0, 0.0, NULL, NULL, NULL, 5.0, 0.09, 0.04, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5031_raw', 'Mơ', '{}', 'Apricot, Apricot nectar', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 48.0, 0.9, 10.1, 0.4, 0.8, 1.0, 28.0, 2.1, 10.0, 26.0, 259.0, 0.2, 78.0, 0.08, 2554.0, 0.0, NULL, 0.89, 3.3, 7.0, 0.04, 0.06, 0.7, 0.24, 0.054, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5032_raw', 'Mơ khô', '{}', 'Apricot dried, unsulfured', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 273.0, 3.0, 62.8, 1.1, 4.1, 10.0, 62.0, 4.5, 32.0, 106.0, 1162.0, 0.39, 343.0, 0.24, 2163.0, 0.0, NULL, 4.33, 3.1, 5.0, 0.08, 0.09, 1.6, 0.516, 0.143, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5033_raw', 'Muỗm, quéo', '{}', 'Mango, common; Indian mango, unripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 20.0, 67.0, 0.6, 15.3, 0.4, 0.4, NULL, 4.0, 0.2, NULL, 4.0, NULL, NULL, NULL, NULL, 1905.0, 0.0, NULL, NULL, NULL, 60.0, 0.06, 0.06, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5034_raw', 'Na', '{}', 'Sugarapple, sweetsop', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 44.4, 66.0, 1.6, 14.2, 0.3, 0.8, 22.0, 35.0, 0.6, 21.0, 45.0, 260.0, 0.21, 200.0, 0.17, 0.0, 0.0, NULL, NULL, NULL, 36.0, 0.11, 0.1, 0.8, 0.226, 0.2, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5035_raw', 'Nhãn', '{}', 'Longan', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 45.0, 48.0, 0.9, 10.9, 0.1, 1.0, 26.0, 21.0, 0.4, 10.0, 12.0, 257.0, 0.29, 150.0, 0.1, 0.0, 0.0, NULL, NULL, NULL, 58.0, 0.03, 0.14, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5036_raw', 'Nhãn khô', '{}', 'Longan, dried', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 285.0, 4.3, 65.9, 0.5, 1.7, 48.0, 32.0, 4.4, 46.0, 117.0, 658.0, 0.22, 807.0, 0.25, 0.0, 0.0, NULL, NULL, NULL, 34.0, 0.02, 0.5, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5037_raw', 'Nho ngọt', '{}', 'Grape, European, sweet', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 1.9, 68.0, 0.4, 16.3, 0.2, 0.6, 2.0, 17.0, 0.6, 7.0, 22.0, 191.0, 0.07, 127.0, 0.07, 39.0, 0.0, NULL, 0.19, 14.6, 3.0, 0.06, 0.04, 0.2, 0.05, 0.086, 0.0, 0.0, 0.3, '2026-02-26'),
-('fao_vn_2007_5038_raw', 'Nho ta (nho chua)', '{}', 'Grape fruit, sour', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 13.0, 14.0, 0.4, 3.1, NULL, 2.4, 11.0, 40.0, 1.4, 15.0, 21.0, 120.0, 0.17, 160.0, 0.07, 15.0, 0.0, NULL, NULL, NULL, 45.0, 0.05, 0.04, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5039_raw', 'Nhót', '{}', 'Silver berry', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 24.0, 13.0, 1.2, 2.1, NULL, 2.3, NULL, 27.0, 0.2, NULL, 30.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5040_raw', 'ổi', '{}', 'Guava, common', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 5.0, 38.0, 0.6, 6.8, 1.0, 6.0, 4.0, 10.0, 1.3, 22.0, 16.0, 291.0, 2.4, 20.0, 0.15, 374.0, 0.0, NULL, 0.73, 2.6, 62.0, 0.05, 0.04, 1.1, 0.451, 0.11, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5041_raw', 'Quả bơ vỏ tím', '{}', 'Avocado, purple', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 27.0, 74.0, 1.8, 2.8, 6.2, 0.4, NULL, 49.0, 1.4, NULL, 69.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5042_raw', 'Quả bơ vỏ xanh', '{}', 'Avocado, green', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 28.0, 101.0, 1.9, 2.3, 9.4, 0.5, 2.0, 60.0, 1.6, 24.0, 85.0, 351.0, 0.4, 311.0, 0.1, 53.0, 0.0, NULL, 2.66, NULL, 17.0, 0.02, 0.05, 0.7, 0.931, 0.078, 0.0, 0.0, 3.2, '2026-02-26'),
-('fao_vn_2007_5043_raw', 'Quả cóc', '{}', '-', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 25.0, 58.0, 1.8, 12.8, NULL, 0.9, NULL, 38.0, 1.6, NULL, 24.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5044_raw', 'Quả thanh long', '{}', 'Dragon''s eyes fruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', NULL, 40.0, 1.3, 8.7, NULL, 1.8, NULL, 11.0, 0.6, NULL, 11.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 10.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5045_raw', 'Quả trứng gà', '{}', '-', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 25.0, 106.0, 4.3, 21.3, 0.4, NULL, NULL, 101.0, NULL, NULL, 270.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5046_raw', 'Quất chín (cả vỏ)', '{}', 'Mandarin, whole fruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 4.0, 26.0, 0.9, 5.5, NULL, 4.1, NULL, 124.0, 0.3, NULL, 42.0, NULL, NULL, NULL, NULL, 100.0, 0.0, NULL, NULL, NULL, 43.0, 0.1, 0.02, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5047_raw', 'Quít', '{}', 'Tangerine; Orange;', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 19.8, 39.0, 0.8, 8.3, 0.3, 0.6, 4.0, 35.0, 0.4, 10.0, 17.0, 111.0, 0.2, 100.0, 0.08, 71.0, 0.0, NULL, 0.2, 0.0, 55.0, 0.08, 0.03, 0.2, 0.216, 0.078, 0.0, 0.0, 0.8, '2026-02-26'),
-('fao_vn_2007_5048_raw', 'Sầu riêng', '{}', 'Durian, Civet', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 75.0, 132.0, 2.5, 26.9, 1.6, 1.4, 1.0, 20.0, 0.9, 33.0, 63.0, 601.0, 0.28, 0.0, 0.33, 23.0, 0.0, NULL, NULL, NULL, 37.0, 0.27, 0.29, 1.2, 0.23, 0.316, NULL, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5049_raw', 'Sấu chín', '{}', 'Sanpidus, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 24.0, 38.0, 1.3, 8.2, NULL, 2.7, NULL, 100.0, NULL, NULL, 44.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5050_raw', 'Táo ta', '{}', 'Jujube, common or Chinese; Chinese date', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 38.0, 0.8, 8.3, 0.2, 0.7, 3.0, 44.0, 0.2, 10.0, 25.0, 250.0, 0.05, 73.0, 0.08, 5.0, 0.0, NULL, NULL, NULL, 24.0, 0.06, 0.04, 0.6, NULL, 0.081, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5051_raw', 'Táo tây', '{}', 'Apple, common, domestic', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.0, 48.0, 0.5, 11.0, 0.2, 0.6, 15.0, 19.0, 2.5, 3.0, 13.0, 102.0, 0.2, 100.0, 0.06, 27.0, 0.0, NULL, 0.18, 2.2, 7.0, 0.04, 0.03, 0.2, 0.061, 0.041, 0.0, 0.0, 0.3, '2026-02-26'),
-('fao_vn_2007_5052_raw', 'Vải', '{}', 'Litchi; lychee', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 48.0, 45.0, 0.7, 9.6, 0.4, 1.1, 1.0, 6.0, 0.5, 10.0, 34.0, 171.0, 0.07, 148.0, 0.06, NULL, 0.0, NULL, 0.07, 0.4, 36.0, 0.02, 0.04, 0.7, NULL, 0.1, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5053_raw', 'Vải khô', '{}', 'Litchi, dried with shells', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 44.0, 260.0, 3.0, 57.6, 1.9, 1.0, 3.0, 25.0, 4.4, 42.0, 58.0, 1110.0, 0.28, 631.0, 0.23, 0.0, 0.0, NULL, 0.31, 1.6, 183.0, 0.01, 0.57, 3.1, NULL, 0.09, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5054_raw', 'Vú sữa', '{}', 'Starapple, cainito', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 22.0, 42.0, 1.0, 9.4, NULL, 2.3, NULL, 68.0, 0.4, NULL, 32.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 5.0, 0.01, 0.02, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_5055_raw', 'Xoài chín', '{}', 'Mango, common; India mango, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 20.0, 62.0, 0.6, 14.1, 0.3, 1.8, 2.0, 10.0, 0.4, 9.0, 13.0, 114.0, 0.56, 150.0, 0.28, 445.0, 0.0, NULL, 1.12, 4.2, 30.0, 0.05, 0.05, 0.3, 0.16, 0.134, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_5056_raw', 'Quả kiwi', '{}', 'Kiwi fruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 56.0, 1.1, 11.7, 0.5, 3.0, 3.0, 34.0, 0.31, 17.0, 34.0, 312.0, 0.14, 130.0, 0.1, 52.0, 0.0, NULL, 1.46, 40.3, 93.0, 0.03, 0.03, 0.3, 0.183, 0.063, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_6001_raw', 'Bơ', '{}', 'Butter, unsalted', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 756.0, 0.5, 0.5, 83.5, 0.0, 11.0, 12.0, 0.1, 2.0, 12.0, 24.0, 0.09, 16.0, 0.0, 158.0, 600.0, NULL, 2.32, 7.0, 0.0, 0.01, 0.04, 0.0, 0.11, 0.003, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_6002_raw', 'Dầu thảo mộc (Lạc, vừng, cám...)', '{}', 'Vegetable oil, mix', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 897.0, 0.0, 0.0, 99.7, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6003_raw', 'Mỡ lợn muối', '{}', 'Lard, salted', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 827.0, 2.0, 0.0, 91.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6004_raw', 'Mỡ lợn nước', '{}', 'Lard, liquid', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 896.0, 0.0, 0.0, 99.6, 0.0, NULL, 2.0, 0.3, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.02, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6005_raw', 'Bơ thực vật', '{}', 'Butter-margarine blend, stick, unsalted', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 729.0, 0.5, 0.1, 80.7, 0.0, 2.0, 17.0, NULL, 2.0, 13.0, 25.0, 0.02, 0.0, 0.0, 610.0, 768.0, NULL, 12.8, 93.0, 0.0, 0.01, 0.02, 0.0, 0.049, 0.005, 0.0, 0.06, NULL, '2026-02-26'),
-('fao_vn_2007_6006_raw', 'Dầu bông', '{}', 'Cottonseed oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 35.3, 24.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6007_raw', 'Dầu cám gạo', '{}', 'Rice bran oil', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.07, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 32.3, 24.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6008_raw', 'Dầu cọ', '{}', 'Palm oil', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 15.94, 8.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6009_raw', 'Dầu dừa', '{}', 'Coconut oil', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.04, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 0.09, 0.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6010_raw', 'Dầu đậu tương', '{}', 'Soybean oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.02, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 9.21, 197.6, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6011_raw', 'Dầu lạc', '{}', 'Peanut oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.03, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 15.69, 0.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6012_raw', 'Dầu mè', '{}', 'Sesame oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 1.4, 13.6, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6013_raw', 'Dầu ngô', '{}', 'Corn oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 14.3, 1.9, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_6014_raw', 'Dầu oliu', '{}', 'Olive oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, 2.0, 1.0, 0.56, NULL, NULL, 1.0, NULL, NULL, NULL, 0.0, NULL, NULL, 14.35, 60.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7001_raw', 'Thịt bê mỡ', '{}', 'Veal meat, lean and fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 144.0, 19.0, 0.0, 7.5, 0.0, 76.0, 8.0, 1.7, 24.0, 188.0, 329.0, 2.55, 110.0, 0.03, 0.0, 0.0, NULL, 0.25, 4.6, 2.0, 0.23, 0.25, 6.2, 1.36, 0.49, NULL, 1.27, 0.0, '2026-02-26'),
-('fao_vn_2007_7002_raw', 'Thịt bê nạc', '{}', 'Veal meat, lean only', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 85.0, 20.0, 0.0, 0.5, 0.0, 80.0, 8.0, 1.7, 26.0, 176.0, 348.0, 2.73, 116.0, 0.03, 0.0, 0.0, NULL, 0.25, NULL, 2.0, 0.23, 0.25, 6.2, 1.45, 0.52, NULL, 1.34, 0.0, '2026-02-26'),
-('fao_vn_2007_7003_raw', 'Thịt bò loại I', '{}', 'Beef, grade I', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 118.0, 21.0, 0.0, 3.8, 0.0, 83.0, 12.0, 3.1, 28.0, 226.0, 378.0, 2.2, 160.0, NULL, 0.0, 12.0, NULL, NULL, NULL, 1.0, 0.1, 0.17, 4.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7004_raw', 'Thịt bò loại II', '{}', 'Beef, grade II', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 167.0, 18.0, 0.0, 10.5, 0.0, NULL, 10.0, 2.7, NULL, 194.0, NULL, NULL, NULL, NULL, 0.0, 2.0, NULL, NULL, NULL, 1.0, 0.1, 0.17, 4.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7005_raw', 'Thịt bò, lưng, nạc', '{}', 'Beef, top loin, seperable lean only, trimmed to 1/8" fat, prime, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 127.0, 23.1, 0.0, 3.9, 0.0, 57.0, 23.0, 1.63, 24.0, 214.0, 361.0, 4.05, 78.0, 0.01, 0.0, 0.0, NULL, 0.29, 1.2, 0.0, 0.08, 0.12, 6.7, 0.678, 0.651, 0.0, 0.98, 0.0, '2026-02-26'),
-('fao_vn_2007_7006_raw', 'Thịt bò, lưng, nạc và mỡ', '{}', 'Beef, top loin, seperable lean only, trimmed to 1/4" fat, prime, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 182.0, 21.5, 0.0, 10.7, 0.0, 59.0, 5.0, 1.78, 22.0, 185.0, 349.0, 3.64, 78.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.15, 4.5, 0.36, 0.44, NULL, 3.05, NULL, '2026-02-26'),
-('fao_vn_2007_7007_raw', 'Thịt bồ câu ra ràng', '{}', 'Pigeon young bird flesh skin and giblets', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 60.0, 340.0, 17.5, 0.0, 30.0, 0.0, 54.0, 45.0, 5.4, 22.0, 217.0, 199.0, 2.2, 437.0, 0.02, 0.0, 73.0, NULL, NULL, NULL, 5.0, 0.1, 0.28, 5.3, 0.76, 0.41, 0.0, 0.4, NULL, '2026-02-26'),
-('fao_vn_2007_7008_raw', 'Thịt chó sấn', '{}', 'Dog meat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 338.0, 16.0, 0.0, 30.4, 0.0, NULL, 16.0, 1.0, NULL, 43.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.04, 0.08, 1.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7009_raw', 'Thịt chó vai', '{}', 'Dog, shoulder', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 230.0, 18.0, 0.0, 17.6, 0.0, NULL, 20.0, 0.7, NULL, 36.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.08, 1.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7010_raw', 'Thịt cừu, nạc', '{}', 'Mutton meat, lean', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 219.0, 16.4, 0.0, 17.0, 0.0, 91.0, 9.0, 2.5, 27.0, 177.0, 256.0, 2.9, 160.0, 0.04, 0.0, 30.0, NULL, NULL, NULL, 3.0, 0.17, 0.15, 5.8, NULL, NULL, NULL, NULL, 1.0, '2026-02-26'),
-('fao_vn_2007_7011_raw', 'Thịt dê, nạc', '{}', 'Goat, meat, lean', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 122.0, 20.7, 0.0, 4.3, 0.0, 82.0, 11.0, 2.0, NULL, 129.0, 385.0, 4.0, 256.0, 0.04, 0.0, 91.0, NULL, NULL, NULL, 1.0, 0.07, 0.13, 4.9, NULL, NULL, 0.0, 1.13, NULL, '2026-02-26'),
-('fao_vn_2007_7012_raw', 'Thịt gà rừng', '{}', 'Grouse field chicken', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 58.0, 141.0, 24.4, 0.0, 4.8, 0.0, NULL, 14.0, 0.4, NULL, 263.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7013_raw', 'Thịt gà ta', '{}', 'Chicken meat, average', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 52.0, 199.0, 20.3, 0.0, 13.1, 0.0, 70.0, 12.0, 1.5, 29.0, 200.0, 189.0, 1.5, 48.0, 0.02, 0.0, 120.0, NULL, 0.3, 1.5, 4.0, 0.15, 0.16, 8.1, 0.91, 0.35, 0.0, 0.31, NULL, '2026-02-26'),
-('fao_vn_2007_7014_raw', 'Thịt gà tây', '{}', 'Turkey raw flesh and skin giblets', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 53.0, 218.0, 20.1, 0.0, 15.3, 0.0, 66.0, 24.0, 3.2, 18.0, 320.0, 236.0, 2.67, 127.0, 0.02, 0.0, 180.0, NULL, NULL, NULL, 0.0, 0.06, 0.08, 7.0, 0.917, 0.29, 0.0, 0.36, 2.0, '2026-02-26'),
-('fao_vn_2007_7015_raw', 'Thịt hươu', '{}', 'Deer meat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 94.0, 19.0, 0.0, 2.0, 0.0, 51.0, 11.0, 2.8, 23.0, 205.0, 318.0, 2.09, 253.0, 0.04, 0.0, 8.0, NULL, 0.2, 1.1, 0.0, 0.26, 0.6, 5.1, NULL, 0.37, 0.0, 6.31, NULL, '2026-02-26'),
-('fao_vn_2007_7016_raw', 'Thịt lợn mỡ', '{}', 'Pork, lean and fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 394.0, 14.5, 0.0, 37.3, 0.0, 42.0, 8.0, 0.4, 13.0, 156.0, 253.0, 1.59, 55.0, 0.01, 0.0, 2.0, NULL, NULL, NULL, 0.0, 0.0, 0.0, 0.0, 0.526, 0.284, 0.0, 0.61, NULL, '2026-02-26'),
-('fao_vn_2007_7017_raw', 'Thịt lợn nạc', '{}', 'Pork, lean', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 139.0, 19.0, 0.0, 7.0, 0.0, 76.0, 7.0, 0.96, 32.0, 190.0, 341.0, 2.5, 190.0, 0.01, 0.0, 2.0, NULL, NULL, NULL, 1.0, 0.9, 0.18, 4.4, 0.822, 0.415, 0.0, 0.84, 2.6, '2026-02-26'),
-('fao_vn_2007_7018_raw', 'Thịt lợn nửa nạc, nửa mỡ', '{}', 'Pork, medium fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 260.0, 16.5, 0.0, 21.5, 0.0, 55.0, 9.0, 1.5, 19.0, 178.0, 285.0, 1.91, 63.0, 0.01, 0.0, 10.0, NULL, NULL, NULL, 2.0, 0.53, 0.16, 2.7, 0.672, 0.393, 0.0, 0.6, 2.6, '2026-02-26'),
-('fao_vn_2007_7019_raw', 'Thịt ngỗng', '{}', 'Goose', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 52.0, 409.0, 14.0, 0.0, 39.2, 0.0, 73.0, 13.0, 1.8, 18.0, 210.0, 308.0, 1.72, 270.0, 0.02, 0.0, 17.0, NULL, NULL, NULL, 4.0, 0.2, 0.19, 5.7, 1.294, 0.39, 0.0, 0.34, NULL, '2026-02-26'),
-('fao_vn_2007_7020_raw', 'Thịt ngựa', '{}', 'Horse meat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 176.0, 21.5, 0.0, 10.0, 0.0, 62.0, 13.0, 3.1, 20.0, 200.0, 291.0, 4.61, 140.0, 0.02, 0.0, 37.0, 0.3, 0.23, 0.0, 1.0, 0.07, 0.1, 4.2, 0.6, 0.5, 0.0, 3.1, 2.6, '2026-02-26'),
-('fao_vn_2007_7021_raw', 'Thịt thỏ nhà', '{}', 'Rabbit meat, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 45.0, 158.0, 21.5, 0.0, 8.0, 0.0, 41.0, 21.0, 1.6, 19.0, 224.0, 330.0, 1.57, 145.0, 0.03, 0.0, 10.0, NULL, 0.4, 0.0, 0.0, 0.08, 0.06, 7.6, 0.8, 0.5, 0.0, 7.16, 1.0, '2026-02-26'),
-('fao_vn_2007_7022_raw', 'Thịt thỏ rừng', '{}', 'Hare rabbit (field or wild)', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 45.0, 103.0, 23.5, 0.0, 1.0, 0.0, 50.0, 17.0, 4.8, 29.0, 226.0, 378.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.09, 0.06, 8.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7023_raw', 'Thịt trâu', '{}', 'Buffalo meat, average', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 97.0, 20.4, 0.9, 1.4, 0.0, 53.0, 12.0, 1.61, 32.0, 197.0, 297.0, 1.93, 151.0, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.2, 6.0, 0.16, 0.53, 0.0, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7024_raw', 'Thịt trâu bắp', '{}', 'Buffalo meat (shoulder)', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 115.0, 21.9, 0.0, 3.0, 0.0, NULL, 30.0, NULL, NULL, 150.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7025_raw', 'Thịt trâu cổ', '{}', 'Buffalo meat, neck', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 112.0, 20.9, 0.0, 3.1, 0.0, NULL, 20.0, NULL, NULL, 160.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7026_raw', 'Thịt trâu đùi', '{}', 'Buffalo meat, leg', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 112.0, 21.2, 0.0, 3.0, 0.0, NULL, 20.0, NULL, NULL, 215.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7027_raw', 'Thịt trâu thăn', '{}', 'Buffalo meat, lean (loin)', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 121.0, 22.8, 0.0, 3.3, 0.0, NULL, 26.0, 3.3, NULL, 165.0, NULL, NULL, NULL, NULL, 0.0, 5.0, NULL, NULL, NULL, NULL, 0.06, 0.16, 3.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7028_raw', 'Thịt vịt', '{}', 'Duck meat, average', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 55.0, 267.0, 17.8, 0.0, 21.8, 0.0, 63.0, 13.0, 1.8, 15.0, 145.0, 209.0, 1.36, 236.0, 0.02, 0.0, 270.0, NULL, 0.7, 5.5, 3.0, 0.07, 0.15, 4.7, 0.951, 0.19, 0.0, 0.25, NULL, '2026-02-26'),
-('fao_vn_2007_7029_raw', 'Bầu dục bò', '{}', 'Beef, kidney', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 7.0, 67.0, 12.5, 0.3, 1.8, 0.0, 200.0, 9.0, 7.1, 13.0, 219.0, 262.0, 1.92, 323.0, 0.1, 0.0, 330.0, 0.8, 0.22, 0.0, 6.0, 0.4, 1.75, 5.1, 3.97, 0.665, 0.0, 27.5, NULL, '2026-02-26'),
-('fao_vn_2007_7030_raw', 'Bầu dục lợn', '{}', 'Pork, kidney', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 81.0, 13.0, 0.3, 3.1, 0.0, 121.0, 8.0, 8.0, 17.0, 223.0, 390.0, 2.75, 445.0, 0.1, 0.0, 150.0, NULL, NULL, NULL, 5.0, 0.38, 1.12, 4.8, 3.13, 0.44, 0.0, 8.49, NULL, '2026-02-26'),
-('fao_vn_2007_7031_raw', 'Bì lợn', '{}', 'Pork skin', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 10.0, 118.0, 23.3, 0.0, 2.7, 0.0, NULL, 11.0, 0.4, NULL, 8.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.29, 0.05, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7032_raw', 'Chân giò lợn', '{}', 'Pork, leg', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 38.0, 230.0, 15.7, 0.0, 18.6, 0.0, 47.0, 24.0, 2.1, 20.0, 106.0, 315.0, 1.93, 65.0, 0.02, 0.0, 30.0, NULL, NULL, NULL, 1.0, 0.01, 0.07, 1.6, 0.685, 0.401, 0.0, 0.63, 2.6, '2026-02-26'),
-('fao_vn_2007_7033_raw', 'Dạ dày bò', '{}', 'Stomach, beef', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 5.0, 97.0, 14.8, 0.0, 4.2, 0.0, 97.0, 150.0, 0.9, 13.0, 85.0, 67.0, 1.42, 70.0, 0.09, 0.0, 0.0, NULL, 0.09, 0.0, 0.0, 0.04, 0.2, 3.6, 0.227, 0.014, 0.0, 1.39, NULL, '2026-02-26'),
-('fao_vn_2007_7034_raw', 'Dạ dày lợn', '{}', 'Stomach, hog', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 85.0, 14.6, 0.0, 2.9, 0.0, 75.0, 8.0, 1.4, 11.0, 144.0, 140.0, 1.85, 169.0, 0.04, 0.0, 0.0, NULL, 0.04, 0.0, 0.0, 0.05, 0.18, 2.5, 1.22, 0.034, 0.0, 0.3, NULL, '2026-02-26'),
-('fao_vn_2007_7035_raw', 'Đầu bò', '{}', 'Head beef (without tongue, brain, ears).', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 68.0, 185.0, 18.1, 0.0, 12.5, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7036_raw', 'Đầu lợn', '{}', 'Hog, head', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 68.0, 335.0, 13.4, 0.0, 31.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7037_raw', 'Đuôi bò', '{}', 'Beef, tail', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 46.0, 137.0, 19.7, 0.0, 6.5, 0.0, NULL, 7.0, 2.5, NULL, 162.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.03, 0.03, 5.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7038_raw', 'Đuôi lợn', '{}', 'Hog, tail', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 30.0, 467.0, 10.8, 0.0, 47.1, 0.0, 63.0, 18.0, 0.99, 8.0, 50.0, 349.0, 2.31, 84.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.21, 0.11, 2.1, 0.673, 0.37, 0.0, 0.88, NULL, '2026-02-26'),
-('fao_vn_2007_7039_raw', 'Gan bò', '{}', 'Beef, liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 109.0, 17.4, 3.0, 3.1, 0.0, 110.0, 5.0, 9.0, 13.0, 340.0, 213.0, 4.0, 1500.0, 0.3, 621.0, 5000.0, 0.4, 0.38, 3.1, 30.0, 0.4, 3.0, 17.0, 7.713, 1.083, 0.0, 59.3, NULL, '2026-02-26'),
-('fao_vn_2007_7040_raw', 'Gan gà', '{}', 'Chicken liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 111.0, 18.2, 2.0, 3.4, 0.0, 71.0, 21.0, 8.2, 17.0, 260.0, 335.0, 2.67, 300.0, 0.2, 56.0, 3290.0, NULL, 0.7, 0.0, 7.0, 0.38, 1.63, 10.4, 6.233, 0.853, 0.0, 16.58, 210.0, '2026-02-26'),
-('fao_vn_2007_7041_raw', 'Gan lợn', '{}', 'Pork liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 116.0, 18.8, 2.0, 3.6, 0.0, 110.0, 7.0, 12.0, 17.0, 353.0, 447.0, 5.76, 510.0, 0.3, NULL, 6000.0, NULL, NULL, NULL, 18.0, 0.4, 2.11, 16.2, 6.65, 0.69, 0.0, 26.0, NULL, '2026-02-26'),
-('fao_vn_2007_7042_raw', 'Gan vịt', '{}', 'Duck liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 122.0, 17.1, 2.8, 4.7, 0.0, 140.0, 17.0, 4.8, 24.0, 177.0, 230.0, 3.07, 5962.0, 0.26, NULL, 11984.0, NULL, NULL, NULL, 7.0, 0.44, 1.28, 9.1, 6.184, 0.76, 0.0, 54.0, NULL, '2026-02-26'),
-('fao_vn_2007_7043_raw', 'Gân chân bò', '{}', '', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 124.0, 30.2, 0.0, 0.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7044_raw', 'Lưỡi bò', '{}', 'Beef tongue', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 164.0, 13.6, 0.2, 12.1, 0.0, 69.0, 7.0, 3.0, 16.0, 162.0, 315.0, 2.87, 170.0, 0.03, 0.0, 0.0, NULL, NULL, NULL, 3.0, 0.07, 0.15, 4.8, 0.653, 0.31, 0.0, 3.79, NULL, '2026-02-26'),
-('fao_vn_2007_7045_raw', 'Lưỡi lợn', '{}', 'Hog, tongue', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 3.0, 178.0, 14.2, 1.4, 12.8, 0.0, 110.0, 7.0, 2.4, 18.0, 118.0, 243.0, 3.01, 70.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 4.0, 0.08, 0.23, 3.0, 0.641, 0.24, 0.0, 2.84, NULL, '2026-02-26'),
-('fao_vn_2007_7046_raw', 'Lòng lợn (ruột già)', '{}', 'Hog, intestine large raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 167.0, 6.9, 0.8, 15.1, 0.0, NULL, 12.0, 0.5, NULL, 55.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.09, 0.08, 1.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7047_raw', 'Lòng lợn (ruột non)', '{}', 'Hog intestine small raw without fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 44.0, 7.2, 0.8, 1.3, 0.0, NULL, 7.0, 0.8, NULL, 48.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.09, 0.08, 1.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7048_raw', 'Mề gà', '{}', 'Chicken gizzard', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 4.0, 99.0, 21.3, 0.6, 1.3, 0.0, 69.0, 48.0, 6.6, 15.0, 150.0, 237.0, 2.72, 116.0, 0.06, 0.0, 19.0, NULL, 0.33, 0.0, 4.0, 0.04, 0.2, 4.8, 0.631, 0.112, 0.0, 1.21, 1.0, '2026-02-26'),
-('fao_vn_2007_7049_raw', 'óc bò', '{}', 'Brain beef', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 124.0, 9.0, 0.5, 9.5, 0.0, 126.0, 6.0, 0.9, 13.0, 311.0, 274.0, 1.02, 287.0, 0.03, 88.0, 0.0, NULL, 0.99, 0.0, 11.0, 0.13, 0.21, 3.8, 2.01, 0.226, 0.0, 9.51, NULL, '2026-02-26'),
-('fao_vn_2007_7050_raw', 'óc lợn', '{}', 'Hog brain', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 123.0, 9.0, 0.4, 9.5, 0.0, 120.0, 7.0, 1.6, 14.0, 311.0, 258.0, 1.27, 240.0, 0.09, 0.0, 0.0, NULL, NULL, NULL, 14.0, 0.14, 0.19, 2.8, 2.8, 0.19, 0.0, 2.19, NULL, '2026-02-26'),
-('fao_vn_2007_7051_raw', 'Phổi bò', '{}', 'Beef, lung', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 103.0, 15.2, 0.0, 4.7, 0.0, 198.0, 10.0, 6.7, 14.0, 195.0, 340.0, 1.61, 260.0, 0.02, 0.0, 14.0, NULL, NULL, NULL, 39.0, 0.1, 0.14, 1.1, 1.0, 0.04, 0.0, 3.81, NULL, '2026-02-26'),
-('fao_vn_2007_7052_raw', 'Phổi lợn', '{}', 'Hog lung, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 92.0, 14.8, 0.0, 3.6, 0.0, 153.0, 9.0, 6.4, 14.0, 230.0, 303.0, 2.03, 83.0, 0.02, 0.0, 0.0, NULL, NULL, NULL, 12.0, 0.02, 0.14, 0.6, 0.9, 0.1, 0.0, 2.75, NULL, '2026-02-26'),
-('fao_vn_2007_7053_raw', 'Sườn lợn', '{}', 'Pork, ribs', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 57.0, 187.0, 17.9, 0.0, 12.8, 0.0, 60.0, 7.0, 0.61, 14.0, 160.0, 200.0, 3.6, 100.0, 0.01, 0.0, 0.0, 0.69, 0.1, 0.0, 0.0, 0.96, 0.23, 5.2, 0.6, 0.26, 0.0, 0.7, 2.6, '2026-02-26'),
-('fao_vn_2007_7054_raw', 'Tai lợn', '{}', 'Hog ears', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 4.0, 126.0, 21.0, 1.3, 4.1, 0.0, 191.0, 21.0, 2.4, 7.0, 41.0, 55.0, 0.19, 6.0, 0.12, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.08, 0.11, 0.8, 0.068, 0.02, 0.0, 0.07, NULL, '2026-02-26'),
-('fao_vn_2007_7055_raw', 'Tim bò', '{}', 'Beef, heart', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 89.0, 15.0, 0.6, 3.0, 0.0, 98.0, 5.0, 5.4, 21.0, 185.0, 287.0, 1.7, 396.0, 0.04, 0.0, 6.0, NULL, 0.22, 0.0, 7.0, 0.31, 0.49, 6.8, 1.79, 0.279, 0.0, 8.55, 2.0, '2026-02-26'),
-('fao_vn_2007_7056_raw', 'Tim gà', '{}', 'Chicken heart', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 114.0, 16.0, 0.0, 5.5, 0.0, 74.0, 12.0, 5.96, 15.0, 177.0, 176.0, 6.59, 346.0, 0.09, 0.0, 9.0, NULL, NULL, NULL, 3.0, 0.15, 0.73, 4.9, 2.559, 0.36, 0.0, 7.29, NULL, '2026-02-26'),
-('fao_vn_2007_7057_raw', 'Tim lợn', '{}', 'Hog heart', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 6.0, 94.0, 15.1, 1.2, 3.2, 0.0, 56.0, 7.0, 5.9, 19.0, 213.0, 294.0, 2.8, 408.0, 0.06, 0.0, 8.0, NULL, NULL, NULL, 1.0, 0.34, 0.49, 5.7, 2.515, 0.39, 0.0, 3.79, 18.2, '2026-02-26'),
-('fao_vn_2007_7058_raw', 'Tiết bò', '{}', 'Beef, blood', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 75.0, 18.0, 0.4, 0.2, 0.0, NULL, 8.0, 52.6, NULL, 31.0, NULL, NULL, NULL, NULL, 0.0, 30.0, NULL, NULL, NULL, NULL, 0.09, 0.03, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7059_cooked', 'Tiết lợn luộc', '{}', 'Hog blood, boiled', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 44.0, 10.7, 0.0, 0.1, 0.0, NULL, 7.0, 25.9, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, 93.0, NULL, NULL, NULL, NULL, 0.0, 0.1, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7060_raw', 'Tiết lợn sống', '{}', 'Hog blood, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 25.0, 5.7, 0.2, 0.1, 0.0, NULL, 7.0, 20.4, NULL, 7.0, NULL, NULL, NULL, NULL, 0.0, 26.0, NULL, NULL, NULL, NULL, NULL, 0.1, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7061_raw', 'Tủy xương bò', '{}', 'Beef bone marrow', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 814.0, 1.1, 0.0, 89.9, 0.0, NULL, 89.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, 0.01, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7062_raw', 'Tủy xương lợn', '{}', 'Hog, bone marrow', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 749.0, 2.3, 0.0, 82.2, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7063_raw', 'Ba tê', '{}', 'Pa tª', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 326.0, 10.8, 15.4, 24.6, 0.0, NULL, 26.0, 4.2, NULL, 88.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7064_cooked', 'Chả lợn', '{}', 'Pork, mince fat meat grilled', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 517.0, 10.8, 5.1, 50.4, 0.0, NULL, 20.0, NULL, NULL, 100.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7065_cooked', 'Chả quế lợn', '{}', 'Pork, cinnamon mince grilled', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 416.0, 16.2, 0.0, 39.0, 0.0, NULL, 16.0, 2.1, NULL, 45.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7066_raw', 'Dăm bông lợn', '{}', 'Ham, pork', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 318.0, 23.0, 0.3, 25.0, 0.0, NULL, 10.0, 2.1, NULL, 110.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.4, 0.19, 3.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7067_raw', 'Dồi lợn', '{}', 'Blood mix-pudding with viscera in large intestine', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 114.0, 12.4, 0.0, 7.1, 0.0, NULL, 28.0, NULL, NULL, 23.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7068_raw', 'Giò bò', '{}', 'Beef dumpling', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 357.0, 13.8, 0.0, 33.5, 0.0, NULL, 18.0, 3.2, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7069_cooked', 'Giò lụa', '{}', 'Pork, mince lean meat steamed', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 136.0, 21.5, 0.0, 5.5, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7070_cooked', 'Giò thủ lợn', '{}', 'Pork, head meat, steamed', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 553.0, 16.0, 0.0, 54.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7071_raw', 'Lạp xường', '{}', 'Chinese sausage', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 585.0, 20.8, 1.7, 55.0, 0.0, NULL, 52.0, 3.0, NULL, 175.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.46, 0.24, 4.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7072_raw', 'Nem chạo', '{}', '', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 153.0, 16.6, 6.9, 6.5, 0.0, NULL, 24.0, 1.6, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7073_raw', 'Nem chua', '{}', 'Pork mince, fermented', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 137.0, 21.7, 4.3, 3.7, 0.0, NULL, 24.0, NULL, NULL, 78.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7074_raw', 'Ruốc thịt lợn', '{}', '', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 369.0, 46.6, 0.0, 20.3, 0.0, NULL, 29.0, 0.3, NULL, 16.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7075_raw', 'Thịt bò khô', '{}', 'Dried beef', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 239.0, 51.0, 5.2, 1.6, 0.0, NULL, 31.0, 8.1, NULL, 476.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.13, 0.19, 30.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7076_raw', 'Thịt trâu khô', '{}', 'Buffalo meat, dried', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 226.0, 50.4, 0.0, 2.7, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7077_raw', 'Xúc xích', '{}', 'Pork sausage', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 535.0, 27.2, 0.0, 47.4, 0.0, NULL, 7.0, 1.9, NULL, 139.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.34, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7078_raw', 'Bột cóc', '{}', 'Toad meat powder', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 342.0, 55.4, 0.0, 13.4, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7079_raw', 'Châu chấu', '{}', 'Locust', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 20.0, 130.0, 24.3, 0.0, 3.6, 0.0, NULL, 210.0, 0.4, NULL, 270.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7080_raw', 'ếch (thịt đùi)', '{}', 'Frog', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 90.0, 20.0, 0.0, 1.1, 0.0, 58.0, 18.0, 1.5, 20.0, 147.0, 285.0, 1.0, 250.0, NULL, 0.0, 15.0, NULL, 1.0, 0.1, 0.0, 0.14, 0.25, 1.2, NULL, 0.12, 0.0, 0.4, NULL, '2026-02-26'),
-('fao_vn_2007_7081_raw', 'Nhộng', '{}', 'Silk worm', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 111.0, 13.0, 0.0, 6.5, 0.0, NULL, 40.0, NULL, NULL, 109.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_7082_raw', 'Lòng gà (cả bộ)', '{}', 'Chicken giblets', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 119.0, 17.9, 1.8, 4.5, 0.0, 77.0, 10.0, 5.86, 18.0, 197.0, 228.0, 3.32, 243.0, 0.15, 0.0, 2657.0, NULL, NULL, NULL, 16.0, 0.09, 0.99, 0.7, 3.208, 0.42, 0.0, 11.41, NULL, '2026-02-26'),
-('fao_vn_2007_8001_raw', 'Cá bống', '{}', 'Goby, gudgeon', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 45.0, 70.0, 15.8, 0.0, 0.8, 0.0, NULL, 17.0, 0.9, NULL, 181.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.02, 0.04, 3.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8002_raw', 'Cá chày', '{}', 'Pond fish', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 31.0, 113.0, 20.1, 0.0, 3.6, 0.0, NULL, 63.0, 0.2, NULL, 176.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8003_raw', 'Cá chép', '{}', 'Carp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 96.0, 16.0, 0.0, 3.6, 0.0, 49.0, 17.0, 0.9, 30.0, 184.0, 397.0, 1.48, 57.0, 0.04, 0.0, 181.0, NULL, 0.63, 0.1, 0.0, 0.02, 0.04, 1.5, 0.75, 0.19, 0.0, 1.53, NULL, '2026-02-26'),
-('fao_vn_2007_8004_raw', 'Cá dưa', '{}', 'Conger pike', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 115.0, 17.6, 0.0, 5.0, 0.0, NULL, 64.0, NULL, NULL, 70.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8005_raw', 'Cá dầu', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 10.0, 96.0, 18.9, 0.0, 2.3, 0.0, NULL, 527.0, NULL, NULL, 885.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8006_raw', 'Cá diếc', '{}', 'Mullet, harder', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 45.0, 87.0, 17.7, 0.0, 1.8, 0.0, NULL, 70.0, 0.8, NULL, 152.0, NULL, NULL, NULL, NULL, 0.0, 120.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8007_raw', 'Cá đao', '{}', 'Sawfish, wolfherring', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 94.0, 18.3, 0.0, 2.3, 0.0, NULL, 36.0, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8008_raw', 'Cá đé', '{}', 'Chinese herring', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 83.0, 18.7, 0.0, 0.9, 0.0, NULL, 80.0, NULL, NULL, 130.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8009_raw', 'Cá đối', '{}', 'Mullet, gray mullet', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 42.0, 108.0, 19.5, 0.0, 3.3, 0.0, 65.0, 21.0, 1.0, 29.0, 224.0, 357.0, 0.52, 51.0, 0.02, 0.0, 45.0, NULL, 1.0, 0.1, 0.0, 0.07, 0.15, 4.6, 0.76, 0.425, 0.0, 0.22, NULL, '2026-02-26'),
-('fao_vn_2007_8010_raw', 'Cá đồng tiền', '{}', 'Goby', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 98.0, 20.1, 0.0, 2.0, 0.0, NULL, 90.0, NULL, NULL, 100.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8011_raw', 'Cá hồi', '{}', 'Salmon', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 136.0, 22.0, 0.0, 5.3, 0.0, 46.0, 13.0, 1.1, 31.0, 230.0, 423.0, 0.41, 51.0, 0.01, 0.0, 30.0, NULL, 0.65, 0.1, 0.0, 0.22, 0.07, 7.0, 0.823, 0.549, 0.0, 4.17, NULL, '2026-02-26'),
-('fao_vn_2007_8012_raw', 'Cá khô (chim, thu, nụ, đé)', '{}', 'Dried fish, miscellaneous', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 15.0, 208.0, 43.3, 0.0, 3.9, 0.0, NULL, 120.0, 0.9, NULL, 95.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.08, 0.31, 4.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8013_raw', 'Cá lác', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 71.0, 16.7, 0.0, 0.5, 0.0, NULL, 80.0, NULL, NULL, 210.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8014_raw', 'Cá mè', '{}', 'Hypophthalmichthys, chub, dory, tench bream', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 36.0, 144.0, 15.4, 0.0, 9.1, 0.0, NULL, 157.0, NULL, NULL, 215.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8015_raw', 'Cá mòi', '{}', 'Sardin', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 45.0, 124.0, 17.5, 0.0, 6.0, 0.0, 100.0, 80.0, 3.0, 24.0, 240.0, NULL, NULL, 170.0, NULL, 0.0, 20.0, NULL, NULL, NULL, 0.0, 0.02, 0.15, 10.1, NULL, 0.96, NULL, 0.14, NULL, '2026-02-26'),
-('fao_vn_2007_8016_raw', 'Cá mỡ', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 151.0, 16.8, 0.0, 9.3, 0.0, NULL, 42.0, 1.4, NULL, 173.0, NULL, NULL, NULL, NULL, 0.0, 30.0, NULL, NULL, NULL, 0.0, 0.08, 0.21, 2.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8017_raw', 'Cá mối', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 116.0, 22.1, 0.0, 3.1, 0.0, NULL, 60.0, NULL, NULL, 102.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8018_raw', 'Cá nạc', '{}', 'Fish low fat', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 39.0, 80.0, 17.5, 0.0, 1.1, 0.0, NULL, 42.0, 1.4, NULL, 173.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.06, 0.08, 2.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8019_raw', 'Cá ngừ', '{}', 'Flying fish, tuna', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 42.0, 87.0, 21.0, 0.0, 0.3, 0.0, 78.0, 44.0, 1.0, 50.0, 206.0, 518.0, 0.52, 64.0, 0.01, 0.0, 5.0, NULL, 0.5, 0.1, 1.0, 0.02, 0.08, 4.0, 0.75, 0.9, 0.0, 0.52, 1.5, '2026-02-26'),
-('fao_vn_2007_8020_raw', 'Cá nục', '{}', 'Scad, anchovy', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 111.0, 20.2, 0.0, 3.3, 0.0, 104.0, 85.0, 3.25, 41.0, 160.0, 383.0, 1.72, 211.0, 0.07, 0.0, 15.0, NULL, 0.57, 0.1, 0.0, 0.06, 0.26, 14.0, 0.645, 0.143, 0.0, 0.62, NULL, '2026-02-26'),
-('fao_vn_2007_8021_raw', 'Cá phèn', '{}', 'Goatfish, surmullet, red mullet', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 104.0, 15.9, 0.0, 4.5, 0.0, NULL, 40.0, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8022_raw', 'Cá quả', '{}', 'Fish, snake head', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 97.0, 18.2, 0.0, 2.7, 0.0, NULL, 90.0, NULL, NULL, 240.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.12, 2.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8023_raw', 'Cá rô đồng', '{}', 'Anabas', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 44.0, 126.0, 19.1, 0.0, 5.5, 0.0, NULL, 26.0, 0.25, NULL, 151.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8024_raw', 'Cá rô phi', '{}', 'Tilapia, African carp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 43.0, 100.0, 19.7, 0.0, 2.3, 0.0, NULL, 50.0, 0.53, NULL, 148.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8025_raw', 'Cá thờn bơn (cá bơn)', '{}', 'Flounder, sole, turbot', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 73.0, 17.4, 0.0, 0.4, 0.0, NULL, 36.0, NULL, NULL, 45.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8026_raw', 'Cá thu', '{}', 'Mackerel, codfish, kingfish', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 166.0, 18.2, 0.0, 10.3, 0.0, 110.0, 50.0, 1.3, 35.0, 90.0, 486.0, NULL, 200.0, NULL, 0.0, 10.0, NULL, NULL, NULL, 0.0, 0.07, 0.17, 6.6, NULL, NULL, NULL, NULL, 7.0, '2026-02-26'),
-('fao_vn_2007_8027_raw', 'Cá thu đao', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 30.0, 156.0, 20.0, 0.0, 8.4, 0.0, 86.0, 22.0, 3.0, 28.0, 190.0, 406.0, 0.67, 93.0, 0.02, 0.0, 35.0, NULL, 1.0, 0.1, 0.0, 0.05, 0.1, 6.0, 0.316, 0.33, 0.0, 4.4, NULL, '2026-02-26'),
-('fao_vn_2007_8028_raw', 'Cá trạch (cá chạch)', '{}', 'Loach', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 26.0, 110.0, 20.4, 0.0, 3.2, 0.0, NULL, 109.0, 0.2, NULL, 231.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8029_raw', 'Cá trắm cỏ', '{}', 'Carp, amur', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 91.0, 17.0, 0.0, 2.6, 0.0, NULL, 57.0, 0.1, NULL, 145.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8030_raw', 'Cá trê', '{}', 'Catfish, silurus, sheatfish, hito', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 173.0, 16.5, 0.0, 11.9, 0.0, 53.0, 20.0, 1.0, 23.0, 210.0, 299.0, 0.74, 101.0, 0.02, 0.0, 93.0, NULL, 1.2, 0.1, 0.0, 0.1, 0.04, 1.4, 0.6, 0.188, 0.0, 2.47, NULL, '2026-02-26'),
-('fao_vn_2007_8031_raw', 'Cá trích', '{}', 'Herring', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 166.0, 17.7, 0.0, 10.6, 0.0, 160.0, 64.0, 2.8, 32.0, 174.0, 423.0, 0.53, 300.0, 0.02, 0.0, 20.0, NULL, NULL, NULL, 0.0, 0.02, 0.18, 5.0, 1.0, 0.45, 0.0, 10.0, 10.0, '2026-02-26'),
-('fao_vn_2007_8032_raw', 'Cá trôi', '{}', 'Major carp, mud carp; cirrhina molitorella', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 27.6, 127.0, 18.8, 0.0, 5.7, 0.0, NULL, 76.0, 0.05, NULL, 185.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8033_raw', 'Cua bể', '{}', 'Crab, sea water', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 103.0, 17.5, 7.0, 0.6, 0.0, 316.0, 141.0, 3.8, 48.0, 191.0, 322.0, 1.4, NULL, NULL, 0.0, 36.0, NULL, NULL, NULL, 0.0, 0.03, 0.71, 2.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8034_raw', 'Cua đồng', '{}', 'Crab, fresh water', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 69.0, 87.0, 12.3, 2.0, 3.3, 0.0, 453.0, 120.0, 1.4, NULL, 171.0, 266.0, NULL, NULL, NULL, 0.0, 210.0, NULL, NULL, NULL, 0.0, 0.01, 0.51, 2.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8035_raw', 'ghẹ', '{}', 'Crab', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 68.0, 54.0, 11.9, 0.0, 0.7, 0.0, 293.0, 89.0, 0.74, 34.0, 229.0, 329.0, 3.54, 669.0, 0.15, 0.0, 2.0, NULL, NULL, NULL, 0.0, 0.03, 0.71, 2.7, 0.35, 0.15, 0.0, 9.0, NULL, '2026-02-26'),
-('fao_vn_2007_8036_raw', 'Hải sâm', '{}', 'Sea slug, sea cucumber', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 90.0, 21.5, 0.2, 0.3, 0.0, NULL, 118.0, 1.4, NULL, 22.0, NULL, NULL, NULL, NULL, 0.0, 102.0, NULL, NULL, NULL, 0.0, 0.01, 0.02, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8037_raw', 'Hến', '{}', 'Clam', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 82.0, 45.0, 4.5, 5.1, 0.7, 0.0, NULL, 144.0, 1.6, NULL, 86.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, 0.12, 2.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8038_raw', 'Lươn', '{}', 'Eel, silver - pike', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 180.0, 18.4, 0.2, 11.7, 0.0, 51.0, 35.0, 1.0, 20.0, 164.0, 272.0, 1.62, 23.0, 0.04, 0.0, 1800.0, NULL, 4.0, 0.0, 0.0, 0.15, 0.31, 3.8, 0.24, 0.067, 0.0, 3.0, NULL, '2026-02-26'),
-('fao_vn_2007_8039_raw', 'Mực khô', '{}', 'Dried cuttle fish, squid', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 4.0, 291.0, 60.1, 2.5, 4.5, 0.0, NULL, 27.0, 5.6, NULL, 287.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.13, 0.17, 6.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8040_raw', 'Mực tươi', '{}', 'Cuttle fish, raw (Squid)', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 22.0, 73.0, 16.3, 0.0, 0.9, 0.0, 44.0, 14.0, 0.6, 33.0, 150.0, 273.0, 0.7, 1891.0, 0.04, 0.0, 10.0, NULL, 1.2, 0.0, 5.0, 0.01, 0.06, 1.0, 0.5, 0.056, 0.0, 1.3, NULL, '2026-02-26'),
-('fao_vn_2007_8041_raw', 'ốc bươu', '{}', 'Snail medium - size, edible', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 67.0, 84.0, 11.1, 8.3, 0.7, 0.0, NULL, 1310.0, NULL, NULL, 64.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8042_raw', 'ốc đá', '{}', 'Marble snail, edible', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 80.0, 63.0, 11.2, 3.9, 0.3, 0.0, NULL, 1660.0, NULL, NULL, 83.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8043_raw', 'ốc nhồi', '{}', 'Snail large, edible', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 79.0, 84.0, 11.9, 7.6, 0.7, 0.0, NULL, 1357.0, NULL, NULL, 191.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.05, 0.17, 2.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8044_raw', 'ốc vặn', '{}', 'Helix', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 70.0, 72.0, 12.2, 4.3, 0.7, 0.0, NULL, 1356.0, NULL, NULL, 51.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8045_cooked', 'Rạm (muối, đồ)', '{}', 'Small sea - crab bicled, steamed', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'cooked', 50.0, 83.0, 14.2, 0.0, 2.9, 0.0, NULL, 4820.0, NULL, NULL, 330.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8046_raw', 'Rạm tươi', '{}', 'Small sea - crab', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 50.0, 77.0, 12.9, 0.0, 2.8, 0.0, NULL, 3520.0, NULL, NULL, 180.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8047_raw', 'Rươi', '{}', 'Tylorhynchus sinensis', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 5.0, 89.0, 12.4, 0.0, 4.4, 0.0, NULL, 66.0, 1.8, NULL, 57.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8048_raw', 'Sò', '{}', 'Oyster', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 80.0, 78.0, 9.5, 4.9, 2.3, 0.0, 380.0, 37.0, 1.9, 42.0, 82.0, 223.0, 13.4, 1576.0, 0.6, 0.0, 53.0, NULL, NULL, NULL, 0.0, 0.03, 0.15, 1.7, 0.5, 0.05, 0.0, 16.0, 41.0, '2026-02-26'),
-('fao_vn_2007_8049_raw', 'Tép gạo', '{}', 'Tiny shrimp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 8.0, 58.0, 11.7, 0.0, 1.2, 0.0, NULL, 910.0, NULL, NULL, 218.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8050_raw', 'Tép khô', '{}', 'Tiny shrimp, dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 5.0, 269.0, 59.8, 0.7, 3.0, 0.0, NULL, 2000.0, 5.5, NULL, 605.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.07, 2.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8051_raw', 'Tôm biển', '{}', 'Sea shrimp, sea-water shrimp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 54.0, 82.0, 17.6, 0.9, 0.9, 0.0, 148.0, 79.0, 1.6, 37.0, 184.0, 185.0, 1.11, 264.0, 0.05, 5.0, 20.0, NULL, 1.1, 0.0, 0.0, 0.04, 0.08, 2.3, 0.276, 0.104, 0.0, 1.16, 5.0, '2026-02-26'),
-('fao_vn_2007_8052_raw', 'Tôm đồng', '{}', 'Fresh-water shrimp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 10.0, 90.0, 18.4, 0.0, 1.8, 0.0, 418.0, 1120.0, 2.2, 42.0, 150.0, 316.0, NULL, NULL, NULL, NULL, 15.0, NULL, NULL, NULL, 0.0, 0.02, 0.03, 3.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8053_raw', 'Tôm khô', '{}', 'Shrimp, dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 5.0, 347.0, 75.6, 2.5, 3.8, 0.0, NULL, 236.0, 4.6, NULL, 995.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.16, 0.34, 9.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8054_raw', 'Trai', '{}', 'Manodonta', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 60.0, 38.0, 4.6, 2.5, 1.1, 0.0, 56.0, 668.0, 1.5, 9.0, 107.0, 314.0, 1.37, 344.0, 0.5, 0.0, 90.0, NULL, 0.31, 0.2, 0.0, 0.02, 0.46, 3.1, 0.362, 0.06, 0.0, 49.44, NULL, '2026-02-26'),
-('fao_vn_2007_8055_cooked', 'Bánh phồng tôm rán', '{}', 'Deep fried shrimp paste', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'cooked', 0.0, 676.0, 1.6, 34.1, 59.2, 0.0, NULL, 175.0, NULL, NULL, 30.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8056_raw', 'Bánh phồng tôm sống', '{}', 'Shrimp paste', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 381.0, 3.4, 75.3, 7.4, 0.0, NULL, 258.0, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8057_raw', 'Bột cá', '{}', 'Fish flour with bones', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 323.0, 71.2, 3.0, 2.9, 0.0, NULL, 505.0, 50.0, NULL, 207.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.38, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8058_raw', 'Ruốc cá quả', '{}', 'Shredded snake-head fish, salted and dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 312.0, 65.7, 3.0, 4.1, 0.0, NULL, 26.0, NULL, NULL, 654.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_8059_raw', 'Ruốc tôm', '{}', 'Shredded shrimp, salted and dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 305.0, 65.5, 3.7, 3.1, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_9001_raw', 'Trứng gà', '{}', 'Hen egg, raw, whole', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 14.0, 166.0, 14.8, 0.5, 11.6, 0.0, 158.0, 55.0, 2.7, 11.0, 210.0, 176.0, 0.9, 55.0, 0.04, 0.0, 700.0, 0.88, 0.97, 0.3, 0.0, 0.16, 0.31, 0.2, 1.438, 0.143, 0.0, 1.29, 25.0, '2026-02-26'),
-('fao_vn_2007_9002_raw', 'Lòng đỏ trứng gà', '{}', 'Hen egg, yolk', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 327.0, 13.6, 1.0, 29.8, 0.0, 108.0, 134.0, 7.0, 14.0, 532.0, 169.0, 3.7, 125.0, 0.06, 88.0, 960.0, 2.68, 2.58, 0.7, 0.0, 0.32, 0.52, 0.0, 2.99, 0.35, 0.0, 1.95, 60.0, '2026-02-26'),
-('fao_vn_2007_9003_raw', 'Lòng trắng trứng gà', '{}', 'Hen egg, white', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 46.0, 10.3, 1.0, 0.1, 0.0, 215.0, 19.0, 0.3, 7.0, 16.0, 172.0, 0.2, 25.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.01, 0.26, 0.1, 0.19, 0.005, 0.0, 0.09, 0.0, '2026-02-26'),
-('fao_vn_2007_9004_raw', 'Trứng vịt', '{}', 'Duck egg, whole', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 12.0, 184.0, 13.0, 1.0, 14.2, 0.0, 191.0, 71.0, 3.2, 17.0, 210.0, 258.0, 0.8, 62.0, 0.04, 14.0, 360.0, NULL, 1.34, 0.4, 0.0, 0.15, 0.3, 0.1, 1.862, 0.25, 0.0, 5.4, NULL, '2026-02-26'),
-('fao_vn_2007_9005_raw', 'Lòng đỏ trứng vịt', '{}', 'Duck egg, yolk', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 364.0, 13.6, 4.8, 32.3, 0.0, NULL, 146.0, 5.6, NULL, 328.0, NULL, NULL, NULL, NULL, 695.0, 1625.0, NULL, NULL, NULL, 0.0, 0.54, 0.94, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_9006_raw', 'Lòng trắng trứng vịt', '{}', 'Duck egg, white', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 47.0, 10.7, 0.8, 0.1, 0.0, NULL, 6.0, NULL, NULL, 8.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, 0.2, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_9007_raw', 'Trứng chim cút', '{}', 'Quail egg', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 11.0, 154.0, 13.1, 0.4, 11.1, 0.0, 141.0, 64.0, 3.65, 13.0, 226.0, 132.0, 1.47, 62.0, 0.04, 11.0, 155.0, NULL, 1.08, 0.3, 0.0, 0.13, 0.79, 0.2, 1.761, 0.15, 0.0, 1.58, NULL, '2026-02-26'),
-('fao_vn_2007_9008_raw', 'Trứng cá', '{}', 'Fish roe', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 171.0, 20.5, 0.0, 9.9, 0.0, NULL, 28.0, 1.1, NULL, 230.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 24.0, 0.93, 0.65, 1.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_9009_raw', 'Trứng cá muối', '{}', 'Fish caviar, black and red, granule', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 274.0, 24.6, 3.5, 17.9, 0.0, 1500.0, 275.0, 11.88, 300.0, 356.0, 181.0, 0.95, 110.0, 0.05, 0.0, 561.0, 5.8, 7.0, 0.7, 0.0, 0.19, 0.62, 0.1, 3.5, 0.32, 0.0, 20.0, NULL, '2026-02-26'),
-('fao_vn_2007_9010_raw', 'Trứng vịt lộn', '{}', 'Duck egg, embryonated', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 12.0, 182.0, 13.6, 4.0, 12.4, 0.0, NULL, 82.0, 3.0, NULL, 212.0, NULL, NULL, NULL, NULL, 435.0, 875.0, NULL, NULL, NULL, 3.0, 0.12, 0.25, 0.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_9011_raw', 'Bột trứng', '{}', 'Chicken egg powder', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 563.0, 44.0, 1.8, 42.2, 0.0, NULL, 186.0, 9.3, NULL, 786.0, NULL, NULL, NULL, NULL, 770.0, 1340.0, NULL, NULL, NULL, NULL, 0.35, 1.23, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_10001_raw', 'Sữa bò tươi', '{}', 'Milk cow, fresh (fluid)', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 74.0, 3.9, 4.8, 4.4, 0.0, 380.0, 120.0, 0.1, 16.0, 95.0, 143.0, 0.4, 20.0, 0.0, 22.0, 50.0, 1.0, 0.06, 0.2, 1.0, 0.05, 0.19, 0.1, 0.362, 0.036, 0.0, 0.44, 1.4, '2026-02-26'),
-('fao_vn_2007_10002_raw', 'Sữa dê tươi', '{}', 'Milk goat''s, whole', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 69.0, 3.5, 4.5, 4.1, 0.0, 50.0, 147.0, 0.1, 14.0, 126.0, 204.0, 0.3, 46.0, 0.02, 20.0, 50.0, 0.3, 0.07, 0.3, 3.0, 0.04, 0.18, 0.3, 0.31, 0.046, 0.0, 0.07, 2.0, '2026-02-26'),
-('fao_vn_2007_10003_raw', 'Sữa mẹ (sữa người)', '{}', 'Breast milk (Human milk, whole).', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 61.0, 1.5, 7.0, 3.0, 0.0, 15.0, 34.0, 0.1, 2.0, 15.0, 41.0, 0.4, 14.0, 0.01, 1.0, 90.0, 0.1, 0.08, 0.3, 6.0, 0.01, 0.04, 0.1, 0.223, 0.011, 0.0, 0.05, 0.7, '2026-02-26'),
-('fao_vn_2007_10004_raw', 'Sữa chua (từ sữa bò)', '{}', 'Yogurt (whole milk)', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 61.0, 3.3, 3.6, 3.7, 0.0, 46.0, 120.0, 0.1, 12.0, 95.0, 155.0, 0.59, 9.0, 0.0, 11.0, 25.0, NULL, NULL, NULL, 1.0, 0.04, 0.2, 0.1, 0.389, 0.032, 0.0, 0.37, NULL, '2026-02-26'),
-('fao_vn_2007_10005_raw', 'Sữa chua vớt béo', '{}', 'Yogurt, chocolate, nonfat milk', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 103.0, 3.5, 22.3, 0.0, 1.2, 135.0, 143.0, 0.06, 40.0, 109.0, 339.0, 1.13, 209.0, NULL, NULL, 4.0, NULL, 0.0, 0.0, 1.0, 0.04, 0.2, 0.1, NULL, 0.047, 0.0, 0.5, NULL, '2026-02-26'),
-('fao_vn_2007_10006_raw', 'Sữa bột toàn phần', '{}', 'Milk powder, whole', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 494.0, 27.0, 38.0, 26.0, 0.0, 371.0, 939.0, 1.1, 85.0, 790.0, 1330.0, 3.34, 80.0, 0.04, 43.0, 318.0, 7.8, 0.48, 1.8, 10.0, 0.24, 1.31, 0.7, 2.271, 0.302, 0.0, 3.25, 10.0, '2026-02-26'),
-('fao_vn_2007_10007_raw', 'Sữa bột tách béo', '{}', 'Skimmed milk powder', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 357.0, 35.0, 52.0, 1.0, 0.0, 535.0, 1400.0, 0.45, 110.0, 980.0, 1794.0, 4.08, 41.0, 0.02, 1.0, 6.0, 8.3, 0.0, 0.1, 6.0, 0.42, 0.6, 1.2, 3.568, 0.361, 0.0, 4.03, 16.0, '2026-02-26'),
-('fao_vn_2007_10008_raw', 'Sữa đặc có đường Việt Nam', '{}', 'Milk condensed, sweetened', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 336.0, 8.1, 56.0, 8.8, 0.0, NULL, 307.0, 0.6, NULL, 219.0, NULL, NULL, NULL, NULL, 50.0, 58.0, NULL, NULL, NULL, 0.0, 0.06, 0.3, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_10009_raw', 'Pho mát', '{}', 'Cheese (whole fat)', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 380.0, 25.5, 0.0, 30.9, 0.0, 621.0, 760.0, 0.5, 28.0, 424.0, 98.0, 3.11, 31.0, 0.01, 118.0, 275.0, 0.3, 0.29, 2.8, 1.0, 0.1, 0.51, 0.1, 0.413, 0.074, 0.0, 0.83, 1.7, '2026-02-26'),
-('fao_vn_2007_11001_raw', 'Chuối nước đường', '{}', 'Banana, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 58.0, 0.5, 13.9, 0.0, 1.3, NULL, 12.0, 0.6, NULL, 160.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 9.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11002_raw', 'Dưa chuột hộp', '{}', 'Cucumber (canned)', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 8.0, 0.3, 1.2, 0.2, 3.1, 1208.0, 12.0, 0.3, 4.0, 16.0, 23.0, 0.02, 85.0, 0.01, 55.0, NULL, NULL, 0.06, 13.0, 2.0, 0.02, 0.03, 0.1, 0.038, 0.009, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_11003_raw', 'Dứa hộp', '{}', 'Pineapple, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 53.0, 0.4, 12.7, 0.1, 0.8, 1.0, 20.0, 0.3, 16.0, 12.0, 105.0, 0.12, 103.0, 1.1, 23.0, NULL, NULL, 0.01, 0.3, 14.0, 0.06, 0.01, 0.2, 0.1, 0.074, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_11004_cooked', 'Lạc chao dầu', '{}', 'Peanut, oil fried', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'cooked', 0.0, 680.0, 25.7, 10.3, 59.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11005_raw', 'Mắc coọc nước đường', '{}', 'Pyrus pachis in syrup', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 56.0, 0.2, 13.7, 0.0, 0.7, NULL, 20.0, 0.4, NULL, 16.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 14.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11006_raw', 'Mận nước đường', '{}', 'Plum, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 10.0, 64.0, 0.4, 15.4, 0.1, 0.9, 20.0, 16.0, 0.86, 5.0, 15.0, 93.0, 0.08, 38.0, 0.03, 127.0, NULL, NULL, 0.18, 4.3, 0.0, 0.02, 0.04, 0.3, 0.072, 0.027, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_11007_raw', 'Mứt bí ngô', '{}', 'Dried preserved squash', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 198.0, 0.5, 49.1, 0.0, 0.7, NULL, 32.0, NULL, NULL, 92.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11008_raw', 'Mứt cam có vỏ', '{}', 'Orange marmalade, jellies', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 218.0, 0.4, 54.2, 0.0, 2.2, NULL, 28.0, 0.26, NULL, 22.0, NULL, NULL, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, NULL, 0.03, 0.01, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11009_raw', 'Mứt chuối', '{}', 'Banana jam', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 218.0, 0.7, 53.9, 0.0, 1.3, NULL, 28.0, 0.3, NULL, 28.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11010_raw', 'Mứt dứa', '{}', 'Pineapple jam', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 208.0, 0.5, 51.5, 0.0, 0.4, NULL, 20.0, 0.3, NULL, 16.0, NULL, NULL, NULL, NULL, 20.0, NULL, NULL, NULL, NULL, 13.0, 0.09, 0.05, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11011_raw', 'Mứt đu đủ', '{}', 'Papaya jam', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 178.0, 0.4, 44.1, 0.0, 2.0, NULL, 24.0, NULL, NULL, 30.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-27'),
-('fao_vn_2007_11012_raw', 'Nhãn nước đường', '{}', 'Longan, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 62.0, 0.5, 15.0, 0.0, 1.0, NULL, 12.0, 0.3, NULL, 230.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 32.0, NULL, 0.04, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11013_raw', 'Nước dứa hộp', '{}', 'Pineapple juice', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 53.0, 0.4, 12.6, 0.1, 0.2, 2.0, 32.0, 0.3, 12.0, 12.0, 130.0, 0.11, 69.0, 0.5, 3.0, NULL, NULL, 0.02, 0.3, 41.0, 0.04, 0.01, 0.2, 0.056, 0.1, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_11014_raw', 'Vải nước đường', '{}', 'Litchi, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 60.0, 0.4, 14.7, 0.0, 1.1, NULL, 8.0, 0.6, NULL, 160.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 10.0, NULL, 0.04, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11015_raw', 'Cá thu hộp', '{}', 'Mackerel, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 207.0, 24.8, 0.0, 12.0, NULL, NULL, 50.0, 1.6, NULL, 260.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.02, 0.1, 6.5, NULL, NULL, NULL, NULL, 7.0, '2026-02-26'),
-('fao_vn_2007_11016_raw', 'Cá trích hộp', '{}', 'Herring, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 233.0, 22.3, 3.5, 14.4, NULL, NULL, 86.0, 2.3, NULL, 437.0, NULL, NULL, NULL, NULL, 0.0, 28.0, NULL, NULL, NULL, NULL, 0.02, 0.12, 2.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11017_raw', 'Thịt bò hộp', '{}', 'Beef, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 251.0, 16.4, 0.0, 20.6, NULL, NULL, 13.0, 2.9, NULL, 250.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, 0.23, 2.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11018_raw', 'Thịt gà hộp', '{}', 'Chicken, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 273.0, 17.0, 0.0, 22.8, NULL, NULL, 108.0, 2.8, NULL, 138.0, NULL, NULL, NULL, NULL, 0.0, 520.0, NULL, NULL, NULL, NULL, 0.09, 0.37, 2.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11019_raw', 'Thịt lợn hộp', '{}', 'Pork, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 344.0, 17.3, 2.7, 29.3, NULL, NULL, 9.0, 1.2, NULL, 200.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.19, 0.21, 3.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11020_raw', 'Thịt lợn, thịt bò xay hộp', '{}', 'Pork and beef, minced canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 244.0, 16.0, 0.0, 20.0, NULL, NULL, 8.0, 2.1, NULL, 120.0, NULL, NULL, NULL, NULL, 0.0, 8.0, NULL, NULL, NULL, 1.0, 0.26, 0.19, 5.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_11021_raw', 'Thịt vịt hầm', '{}', 'Duck, stewed meat', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 224.0, 19.6, 0.0, 16.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12001_raw', 'Bánh bích cốt', '{}', 'Whole wheat rusk', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 346.0, 12.3, 71.3, 1.3, 0.8, NULL, 39.0, 2.7, NULL, 231.0, NULL, NULL, NULL, NULL, 13.0, 86.0, NULL, NULL, NULL, 0.0, 0.36, 0.18, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12002_raw', 'Bánh bích quy', '{}', 'Biscuits', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 376.0, 8.8, 75.1, 4.5, 0.5, NULL, 75.0, 3.6, NULL, 79.0, NULL, NULL, NULL, NULL, 75.0, 19.0, NULL, NULL, NULL, 0.0, 0.4, 0.26, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12003_raw', 'Bánh chả', '{}', 'Sweet meat pie in lumps', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 395.0, 3.4, 80.5, 6.6, 1.0, NULL, 42.0, 1.9, NULL, 29.0, NULL, NULL, NULL, NULL, 5.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.07, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12004_raw', 'Bánh con cá', '{}', 'Small biscuits, fish figured', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 368.0, 7.5, 79.6, 2.2, 0.2, NULL, 54.0, 2.9, NULL, 99.0, NULL, NULL, NULL, NULL, 5.0, NULL, NULL, NULL, NULL, 0.0, 0.13, 0.13, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12005_raw', 'Bánh đậu xanh', '{}', 'Mungbean cake', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 416.0, 15.6, 62.4, 11.5, 1.1, NULL, 111.0, 3.4, NULL, 273.0, NULL, NULL, NULL, NULL, 105.0, NULL, NULL, NULL, NULL, 0.0, 0.2, 0.15, 6.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12006_raw', 'Bánh kem xốp', '{}', 'Wafers filled', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 492.0, 8.3, 60.7, 24.0, 3.5, NULL, 86.0, 0.8, NULL, 125.0, NULL, NULL, NULL, NULL, 0.0, 84.0, NULL, NULL, NULL, 0.0, 0.12, 0.31, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12007_raw', 'Bánh khảo chay', '{}', 'Rice cake, plain', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 376.0, 3.2, 90.2, 0.3, 0.2, NULL, 2.0, 0.1, NULL, 1.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12008_raw', 'Bánh quế', '{}', 'Cinnamon waffle (roll)', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 435.0, 8.3, 76.4, 10.7, 0.3, NULL, 33.0, 2.0, NULL, 115.0, NULL, NULL, NULL, NULL, 75.0, 12.0, NULL, NULL, NULL, 0.0, 0.04, 1.9, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12009_raw', 'Bánh sô cô la', '{}', 'Chocolate, filled', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 449.0, 3.9, 68.8, 17.6, 0.0, NULL, 58.0, 3.7, NULL, 142.0, NULL, NULL, NULL, NULL, 10.0, 13.0, NULL, NULL, NULL, 0.0, 0.04, 0.17, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12010_raw', 'Bánh thỏi sô cô la', '{}', 'Chocolate, sweet', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 543.0, 4.9, 62.5, 30.4, NULL, NULL, 280.0, 1.5, NULL, 280.0, NULL, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.01, 0.6, NULL, NULL, NULL, NULL, 3.0, '2026-02-26'),
-('fao_vn_2007_12011_raw', 'Bánh trứng nhện', '{}', 'Small biscuit', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 369.0, 9.6, 74.2, 3.7, 0.2, NULL, 76.0, 3.9, NULL, 140.0, NULL, NULL, NULL, NULL, 105.0, 17.0, NULL, NULL, NULL, 0.0, 0.15, 0.36, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12012_raw', 'Bột ca cao', '{}', 'Cocoa powder', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 414.0, 19.6, 53.0, 13.7, 4.6, 21.0, 128.0, 13.86, 499.0, 734.0, 1524.0, 6.81, 3788.0, 3.84, 0.0, 0.0, NULL, 0.1, 2.5, 0.0, 0.08, 0.24, 2.2, 0.254, 0.118, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_12013_raw', 'Đường cát', '{}', 'Refined sugar', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 390.0, 0.0, 97.4, 0.0, 0.0, 39.0, 178.0, 5.8, 29.0, 72.0, 346.0, 0.18, 298.0, 0.32, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.05, 0.1, 0.3, 0.111, 0.026, 0.0, 0.0, 0.0, '2026-02-26'),
-('fao_vn_2007_12014_raw', 'Đường kính', '{}', 'Granulated sugar', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 397.0, 0.0, 99.3, 0.0, 0.0, NULL, 0.0, 0.06, NULL, 0.0, 2.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.03, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12015_raw', 'Kẹo bơ cứng', '{}', 'Toffee, sweets', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 448.0, 2.1, 71.1, 17.2, 0.0, NULL, 64.0, 0.76, NULL, 64.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12016_raw', 'Kẹo cà phê', '{}', 'Coffee sweets', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 378.0, 0.0, 91.5, 1.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12017_raw', 'Kẹo cam chanh', '{}', 'Sweets, caramel with citron, orange aroma', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 377.0, 0.0, 93.1, 0.5, 0.3, NULL, 23.0, 1.4, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12018_raw', 'Kẹo dừa mềm', '{}', 'Sweets with coconut aroma', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 415.0, 0.6, 75.6, 12.2, 2.5, NULL, 16.0, 0.4, NULL, 7.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12019_raw', 'Kẹo dứa mềm', '{}', 'Pineapple sweets candy', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 415.0, 0.6, 75.6, 12.2, 2.5, NULL, 16.0, 0.4, NULL, 7.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12020_raw', 'Kẹo lạc', '{}', 'Peanut candy', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 449.0, 10.3, 64.8, 16.5, 2.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12021_raw', 'Kẹo Pastille (kẹo ngậm bạc hà)', '{}', 'Menthol pastille', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 356.0, 5.2, 83.8, 0.0, NULL, NULL, 96.0, 1.6, NULL, 18.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12022_raw', 'Kẹo sô cô la', '{}', 'Sweets with chocolate', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 388.0, 1.6, 85.1, 4.6, 1.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12023_raw', 'Kẹo sữa', '{}', 'Sweets with milk', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 390.0, 2.9, 83.0, 5.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12024_raw', 'Kẹo vừng viên', '{}', 'Sesame candy', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 417.0, 2.8, 85.9, 6.9, 1.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.05, 0.02, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12025_raw', 'Mạch nha', '{}', 'Malt', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 331.0, 0.2, 82.5, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, 0.1, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_12026_raw', 'Mật ong', '{}', 'Honey', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 327.0, 0.4, 81.3, 0.0, 0.0, 4.0, 5.0, 0.9, 2.0, 16.0, 52.0, 0.22, 36.0, 0.08, 0.0, 0.0, 0.0, 0.0, 0.0, 4.0, 0.0, 0.04, 0.2, 0.068, 0.024, 0.0, 0.0, 0.0, '2026-02-26'),
-('fao_vn_2007_12027_raw', 'Mứt lạc', '{}', 'Peanut sugar (Jam)', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 431.0, 5.4, 82.9, 8.6, 0.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.16, 0.03, 3.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13001_raw', 'Cary bột', '{}', 'Cari powder (Mix, turmeric, red pepper and other spices)', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 283.0, 8.2, 46.0, 7.3, 8.9, NULL, 906.0, NULL, NULL, 421.0, NULL, NULL, NULL, NULL, 380.0, NULL, NULL, NULL, NULL, NULL, 0.03, 0.4, 2.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13002_raw', 'Gừng khô (bột)', '{}', 'Ginger root, dried powder', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 323.0, 9.1, 58.3, 5.9, 12.5, 32.0, 180.0, 11.52, 184.0, 148.0, 1343.0, 4.72, 480.0, 26.5, 88.0, NULL, NULL, 18.02, 0.8, 7.0, 0.16, 0.27, 8.4, NULL, 0.84, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_13003_raw', 'Gừng tươi', '{}', 'Ginger root, fresh', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 10.0, 29.0, 0.4, 5.1, 0.8, 3.3, 7.0, 60.0, 2.5, 43.0, 8.0, 316.0, 0.34, 226.0, 0.23, 0.0, NULL, NULL, 0.26, 0.1, 5.0, 0.04, 0.04, 0.7, 0.203, 0.16, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_13004_raw', 'Hạt tiêu', '{}', 'Peppercorn, seeds', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 231.0, 7.0, 34.1, 7.4, 33.5, 44.0, 732.0, 4.6, 19.0, 44.0, 1259.0, 0.3, 100.0, 0.1, 156.0, NULL, NULL, 0.72, 163.7, 0.0, 0.05, 0.06, 2.6, NULL, 0.34, 0.0, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13005_raw', 'Muối', '{}', 'Table salt', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 38758.0, 150.0, 0.81, 0.0, 70.0, 4.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '2026-02-26'),
-('fao_vn_2007_13006_raw', 'Nghệ khô, bột', '{}', 'Turmeric rhizome, dried powder', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 295.0, 7.8, 43.8, 9.9, 21.1, 38.0, 146.0, 18.6, 193.0, 284.0, 2525.0, 4.35, 603.0, 7.83, 0.0, NULL, NULL, 3.1, 13.4, 26.0, 0.03, 0.12, 2.3, NULL, 1.8, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_13007_raw', 'Nghệ tươi', '{}', 'Turmeric, rhizome, fresh', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 10.0, 25.0, 1.1, 4.4, 0.3, 6.5, 52.0, 12.0, NULL, NULL, 22.0, 587.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 4.0, 0.03, 0.03, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13008_raw', 'ớt khô bột', '{}', 'Red pepper, dried powder', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 227.0, 15.6, 31.8, 4.2, 23.6, NULL, 85.0, 17.0, NULL, 380.0, NULL, NULL, NULL, NULL, 8442.0, NULL, NULL, NULL, NULL, 0.0, 0.61, 0.9, 8.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13009_raw', 'Riềng', '{}', 'Alpinia root, fresh', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 10.0, 26.0, 0.3, 2.5, NULL, 3.7, NULL, 24.0, NULL, NULL, 28.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13010_raw', 'Magi', '{}', 'Soybean sauce', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 65.0, 10.5, 5.6, 0.1, 0.0, 5586.0, 20.0, 2.38, 40.0, 130.0, 212.0, 0.43, 135.0, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06, 0.15, 4.0, 0.376, 0.2, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_13011_raw', 'Mắm tôm đặc', '{}', 'Shrimp sauce concentrate', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 73.0, 14.8, 0.0, 1.5, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13012_raw', 'Mắm tôm loãng', '{}', 'Shrimp sauce, diluted', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 44.0, 7.0, 2.1, 0.8, 0.0, NULL, 645.0, NULL, NULL, 226.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13013_raw', 'Mắm tép chua', '{}', 'Tiny shrimp, sour sauce', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 68.0, 8.7, 5.5, 1.2, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13014_raw', 'Nước mắm cá (loại đặc biệt)', '{}', 'Fish - sauce (super quality).', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 60.0, 15.0, 0.0, 0.0, 0.0, NULL, 387.0, 2.7, NULL, 247.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.09, 0.86, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13015_raw', 'Nước mắm cá loại I', '{}', 'Fish sauce, grade I', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 28.0, 7.1, 0.0, 0.0, 0.0, NULL, 387.0, 2.7, NULL, 247.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.27, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13016_raw', 'Nước mắm loại II', '{}', 'Fish sauce, grade II', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 21.0, 5.2, 0.0, 0.0, 0.0, NULL, 314.0, 1.9, NULL, 116.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13017_raw', 'Nước mắm cá', '{}', 'Fish sauce, ready-to-serve', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 35.0, 5.1, 3.6, 0.01, 0.0, 7720.0, 43.0, 0.78, 175.0, 7.0, 288.0, 0.2, 50.0, 0.23, 0.0, 4.0, 0.0, 0.0, 0.0, 1.0, 0.01, 0.06, 2.3, 0.118, 0.396, 0.0, 0.48, NULL, '2026-02-26'),
-('fao_vn_2007_13018_raw', 'Nước mắm cô', '{}', 'Fish sauce, concentrated', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 131.0, 32.8, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13019_raw', 'Tương ngô', '{}', 'Soybean sauce with rice and maize', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 75.0, 3.9, 14.5, 0.1, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13020_raw', 'Tương nếp', '{}', 'Soybean sauce with glutinous rice', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 86.0, 4.3, 15.7, 0.7, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_13021_raw', 'Tương ớt', '{}', 'Red pepper sauce concentrate', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 37.0, 0.5, 7.6, 0.5, 0.9, 25.0, 9.0, 0.5, 12.0, 16.0, 564.0, 0.15, 87.0, NULL, 257.0, 0.0, NULL, 0.36, 6.7, 30.0, 0.01, 0.09, 0.6, NULL, 0.14, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_13022_raw', 'Xì dầu', '{}', 'Soybean sauce', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 53.0, 6.3, 6.8, 0.04, 0.8, 5637.0, 19.0, 1.93, 43.0, 125.0, 217.0, 0.52, 104.0, 0.42, 0.0, 0.0, NULL, 0.0, 0.0, 0.0, 0.03, 0.17, 2.2, 0.297, 0.148, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_13023_raw', 'Sốt mayonnaise', '{}', 'Mayonnaise', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 701.0, 0.0, 0.1, 77.8, 0.0, 486.0, 7.0, 0.23, 1.0, 25.0, 14.0, 0.13, 0.0, NULL, 0.0, NULL, NULL, 11.79, 24.7, 0.0, 0.01, 0.06, 0.0, NULL, 0.01, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_14001_raw', 'Bia (cồn: 4,5 g)', '{}', 'Beer light (4,5 % Alcohol)', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 11.0, 0.5, 2.3, 0.0, 0.0, 4.0, 6.0, 0.1, 6.0, 26.0, 27.0, 0.01, 5.0, 0.01, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.01, 0.03, 0.8, 0.041, 0.046, 0.0, 0.02, 3.0, '2026-02-26'),
-('fao_vn_2007_14002_raw', 'Cô nhắc (cồn 32 g)', '{}', 'Cognac', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14003_raw', 'Cốc tai (cồn 13 g)', '{}', 'Cocktail, vermouth sweet', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 63.0, 0.0, 15.7, 0.0, 0.0, NULL, 6.0, 0.36, NULL, 6.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14004_raw', 'Coca cola', '{}', 'Coca Cola', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 42.0, 0.0, 10.4, 0.0, 0.0, NULL, 8.0, 0.0, NULL, 15.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14005_raw', 'Nước cam tươi', '{}', 'Orange juice, fresh', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 23.0, 0.7, 4.5, 0.2, 0.2, 1.0, 26.0, 0.3, 11.0, 16.0, 200.0, 0.05, 44.0, 0.01, 33.0, NULL, NULL, 0.04, 0.1, 54.0, 0.09, 0.03, 0.4, 0.19, 0.04, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_14006_raw', 'Nước dừa non tươi', '{}', 'Coconut milk, immature', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 21.0, 0.4, 4.8, 0.0, 0.0, NULL, 60.0, 0.3, NULL, 29.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 1.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14007_raw', 'Nước ép cà chua', '{}', 'Tomato juice', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 19.0, 0.8, 2.6, 0.6, 0.4, 269.0, 8.0, 0.3, 11.0, 13.0, 229.0, 0.15, 61.0, 0.07, 270.0, NULL, NULL, 0.32, 2.3, 7.0, 0.03, 0.03, 0.7, 0.25, 0.111, 0.0, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14008_raw', 'Nước khoáng', '{}', 'Mineral water', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, 5.0, 0.01, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14009_raw', 'Nước quít tươi', '{}', 'Mandarins juice (fresh)', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 24.0, 0.4, 5.1, 0.2, 0.2, 1.0, 20.0, 0.2, 8.0, 24.0, 178.0, 0.03, 25.0, 0.04, 38.0, NULL, NULL, 0.13, 0.0, 47.0, 0.06, 0.02, 0.1, 0.125, 0.042, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_14010_raw', 'Rượu cam, chanh (cồn 24,2 g)', '{}', 'Liqueur, orange flavor', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14011_raw', 'Rượu nếp (80g/ 24 ml) (cồn 5 g)', '{}', 'Rice glutinous (Alcohol fermentation rice 80 g water 24 ml)', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 167.0, 4.0, 37.7, 0.0, 0.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14012_raw', 'Rượu trắng (cồn 39 g)', '{}', 'Vodka', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 273.0, NULL, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14013_raw', 'Rượu vang đỏ (cồn 9,5 g)', '{}', 'Red wine', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 9.0, 0.2, 2.0, 0.0, 0.0, NULL, 8.0, 0.82, NULL, 10.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, 0.02, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26'),
-('fao_vn_2007_14014_raw', 'Rượu vang trắng (cồn 9,5 g)', '{}', 'White wine', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 1.0, 0.1, 0.2, 0.0, 0.0, 4.0, 9.0, 0.5, 8.0, 6.0, 61.0, 0.06, 40.0, 0.02, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, 0.01, 0.1, 0.03, 0.02, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_14015_raw', 'Rượu vang trắng ngọt (cồn 10.2 g)', '{}', 'White wine, sweet', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 24.0, 0.2, 5.9, 0.0, 0.0, 13.0, 14.0, 0.58, 11.0, 13.0, 110.0, 0.06, 40.0, 0.02, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.01, 0.1, 0.03, 0.012, 0.0, 0.0, NULL, '2026-02-26'),
-('fao_vn_2007_14016_raw', 'Rượu Whisky (cồn 35,2 g)', '{}', 'Whisky liqueur', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26');
\ No newline at end of file
+('fao_vn_2007_1001_raw', 'Gạo nếp cái', '{}', 'Glutinous rice, milled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 344.0, 8.6, 74.5, 1.5, 0.6, 3.0, 32.0, 1.2, 17.0, 98.0, 282.0, 2.2, 280.0, 1.1, 0.0, 0.0, 0.0, NULL, NULL, 0.0, 0.14, 0.06, 2.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Gạo nếp cái  Glutinous rice, milled', 'gao nep cai  glutinous rice, milled'),
+('fao_vn_2007_1002_raw', 'Gạo nếp máy (Loại thường)', '{}', 'Glutinous rice, milled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 346.0, 8.4, 74.9, 1.6, 0.5, 3.0, 16.0, 1.2, 17.0, 130.0, 282.0, 2.2, 280.0, 1.1, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.16, 0.06, 2.4, 0.284, 0.107, 0.0, 0.0, NULL, '2026-02-26', 'Gạo nếp máy (Loại thường)  Glutinous rice, milled', 'gao nep may (loai thuong)  glutinous rice, milled'),
+('fao_vn_2007_1003_raw', 'Gạo tẻ giã', '{}', 'Under milled, home-pounded rice', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 344.0, 8.1, 75.0, 1.3, 0.7, 5.0, 36.0, 0.2, 52.0, 108.0, 202.0, 1.9, 360.0, 1.5, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.12, 0.04, 1.9, NULL, NULL, NULL, NULL, 3.0, '2026-02-26', 'Gạo tẻ giã  Under milled, home-pounded rice', 'gao te gia  under milled, home-pounded rice'),
+('fao_vn_2007_1004_raw', 'Gạo tẻ máy', '{}', 'Ordinary polished rice', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 344.0, 7.9, 75.9, 1.0, 0.4, 5.0, 30.0, 1.3, 14.0, 104.0, 241.0, 1.5, 230.0, 0.9, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.03, 1.6, 1.342, 0.145, 0.0, 0.0, 3.0, '2026-02-26', 'Gạo tẻ máy  Ordinary polished rice', 'gao te may  ordinary polished rice'),
+('fao_vn_2007_1005_raw', 'Gạo lứt', '{}', 'Rice, brown or hulled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 345.0, 7.5, 72.8, 2.7, 3.4, 5.0, 16.0, 2.8, 52.0, 246.0, 202.0, 1.9, 360.0, 1.5, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.34, 0.07, 5.0, 1.5, 0.62, 0.0, NULL, NULL, '2026-02-26', 'Gạo lứt  Rice, brown or hulled', 'gao lut  rice, brown or hulled'),
+('fao_vn_2007_1006_raw', 'Kê', '{}', 'Foxtail millet', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 2.0, 331.0, 7.0, 69.0, 3.0, 3.4, 7.0, 22.0, 2.7, 430.0, 290.0, 249.0, 1.5, 440.0, 1.7, 60.0, 0.0, NULL, 0.05, 0.9, 0.0, 0.4, 0.09, 1.6, 0.848, 0.384, 0.0, 0.0, NULL, '2026-02-26', 'Kê  Foxtail millet', 'ke  foxtail millet'),
+('fao_vn_2007_1007_raw', 'Ngô bắp tươi', '{}', 'Fresh maize seeds, raw', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 45.0, 196.0, 4.1, 39.6, 2.3, 1.2, 3.0, 4.0, 0.6, 39.0, 170.0, 306.0, 1.4, 240.0, 0.35, NULL, 0.0, NULL, 0.8, 0.0, 12.0, 0.15, 0.08, 1.8, 0.54, 0.16, 0.0, 0.0, 0.5, '2026-02-26', 'Ngô bắp tươi  Fresh maize seeds, raw', 'ngo bap tuoi  fresh maize seeds, raw'),
+('fao_vn_2007_1008_raw', 'Ngô vàng hạt khô', '{}', 'Yellow maize, dried seeds', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 2.0, 354.0, 8.6, 69.4, 4.7, 2.0, 35.0, 30.0, 2.3, 127.0, 190.0, 287.0, 2.21, 314.0, 0.49, 97.0, 0.0, NULL, 0.49, 0.3, 0.0, 0.28, 0.11, 2.0, 0.424, 0.622, 0.0, 0.0, NULL, '2026-02-26', 'Ngô vàng hạt khô  Yellow maize, dried seeds', 'ngo vang hat kho  yellow maize, dried seeds'),
+('fao_vn_2007_1009_cooked', 'Bánh bao nhân thịt', '{}', 'Ball shaped dumpling, Vietnamese steamed buns', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'cooked', 0.0, 219.0, 6.1, 47.5, 0.5, 0.5, NULL, 19.0, 1.5, NULL, 88.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.1, 0.04, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh bao nhân thịt  Ball shaped dumpling, Vietnamese steamed buns', 'banh bao nhan thit  ball shaped dumpling, vietnamese steamed buns'),
+('fao_vn_2007_1010_raw', 'Bánh đa nem', '{}', 'Rice paper for rollers', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 333.0, 4.0, 78.9, 0.2, 0.5, NULL, 20.0, 0.3, NULL, 65.0, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh đa nem  Rice paper for rollers', 'banh da nem  rice paper for rollers'),
+('fao_vn_2007_1011_raw', 'Bánh đúc', '{}', 'Rice pudding', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 52.0, 0.9, 11.3, 0.3, 0.1, NULL, 50.0, 0.4, NULL, 19.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh đúc  Rice pudding', 'banh duc  rice pudding'),
+('fao_vn_2007_1012_raw', 'Bánh mỳ', '{}', 'French bread', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 249.0, 7.9, 52.6, 0.8, 0.2, NULL, 28.0, 2.0, NULL, 164.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.07, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh mỳ  French bread', 'banh my  french bread'),
+('fao_vn_2007_1013_raw', 'Bánh phở', '{}', 'Rice noodles', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 143.0, 3.2, 31.7, 0.4, 0.0, 3.0, 16.0, 0.3, NULL, 64.0, 15.0, NULL, NULL, NULL, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.01, 0.01, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh phở  Rice noodles', 'banh pho  rice noodles'),
+('fao_vn_2007_1014_cooked', 'Bánh quẩy', '{}', 'Wheat fritters twisted fried', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'cooked', 0.0, 292.0, 8.0, 40.7, 10.8, 0.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.0, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh quẩy  Wheat fritters twisted fried', 'banh quay  wheat fritters twisted fried'),
+('fao_vn_2007_1015_raw', 'Bỏng ngô', '{}', 'Corn flakes', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 372.0, 8.6, 80.8, 1.6, 3.4, NULL, 3.0, 0.6, NULL, 47.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.02, 0.03, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bỏng ngô  Corn flakes', 'bong ngo  corn flakes'),
+('fao_vn_2007_1016_raw', 'Bột gạo nếp', '{}', 'Glutinous rice flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 362.0, 8.2, 78.8, 1.6, 0.6, 3.0, 12.0, 0.8, 18.0, 148.0, 293.0, 2.29, 291.0, 1.14, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.02, 1.7, 0.295, 0.111, 0.0, 0.0, NULL, '2026-02-26', 'Bột gạo nếp  Glutinous rice flour', 'bot gao nep  glutinous rice flour'),
+('fao_vn_2007_1017_raw', 'Bột gạo tẻ', '{}', 'Rice ordinary flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 359.0, 6.6, 82.2, 0.4, 0.4, 0.0, 24.0, 1.9, 35.0, 135.0, 76.0, 0.8, 130.0, 1.2, 0.0, 0.0, NULL, 0.11, 0.0, 0.0, 0.08, 0.05, 2.1, 0.819, 0.436, 0.0, 0.0, 1.0, '2026-02-26', 'Bột gạo tẻ  Rice ordinary flour', 'bot gao te  rice ordinary flour'),
+('fao_vn_2007_1018_raw', 'Bột mì', '{}', 'Wheat flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 346.0, 10.3, 73.6, 1.1, 0.3, 4.0, 29.0, 2.0, 173.0, 132.0, 186.0, 2.5, 21.0, 2.0, 0.0, 0.0, NULL, 0.82, 1.9, 0.0, 0.18, 0.13, 1.0, 1.008, 0.341, 0.0, 0.0, 1.9, '2026-02-26', 'Bột mì  Wheat flour', 'bot mi  wheat flour'),
+('fao_vn_2007_1019_raw', 'Bột ngô vàng', '{}', 'Yellow maize flour', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 361.0, 8.3, 73.0, 4.0, 1.5, 5.0, 15.0, 2.1, 93.0, 170.0, 315.0, 1.73, 230.0, 0.46, 97.0, 0.0, NULL, 0.42, 0.3, 0.0, 0.17, 0.08, 1.9, 0.658, 0.37, 0.0, 0.0, NULL, '2026-02-26', 'Bột ngô vàng  Yellow maize flour', 'bot ngo vang  yellow maize flour'),
+('fao_vn_2007_1020_raw', 'Bún', '{}', 'Rice vermicelli', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 110.0, 1.7, 25.7, NULL, 0.5, NULL, 12.0, 0.2, NULL, 32.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.04, 0.01, 1.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bún  Rice vermicelli', 'bun  rice vermicelli'),
+('fao_vn_2007_1021_raw', 'Cốm', '{}', 'Rice, unriped. Raw', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 297.0, 6.1, 66.3, 0.8, 0.6, NULL, 24.0, 1.0, NULL, 143.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cốm  Rice, unriped. Raw', 'com  rice, unriped. raw'),
+('fao_vn_2007_1022_raw', 'Mỳ sợi', '{}', 'Wheat noodles', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'raw', 0.0, 349.0, 11.0, 74.2, 0.9, 0.3, NULL, 34.0, 1.5, NULL, 97.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.04, 1.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mỳ sợi  Wheat noodles', 'my soi  wheat noodles'),
+('fao_vn_2007_1023_cooked', 'Ngô nếp luộc', '{}', 'Glutinous maize, boiled', 'Ngũ cốc và sản phẩm chế biến', 'Cereal and products', 'FAO_VN_2007', 'cooked', 50.0, 167.0, 3.9, 32.9, 2.2, 1.2, NULL, 18.0, 0.8, NULL, 146.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ngô nếp luộc  Glutinous maize, boiled', 'ngo nep luoc  glutinous maize, boiled'),
+('fao_vn_2007_2001_raw', 'Củ ấu', '{}', 'Water-caltrops', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 50.0, 115.0, 3.6, 24.0, 0.5, 1.0, NULL, 9.0, 0.7, NULL, 49.0, NULL, NULL, NULL, NULL, 5.0, 0.0, NULL, NULL, NULL, 5.0, 0.23, 0.05, 1.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ ấu  Water-caltrops', 'cu au  water-caltrops'),
+('fao_vn_2007_2002_raw', 'Củ cái', '{}', 'Yam winged', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 15.0, 127.0, 3.1, 28.3, 0.2, 1.8, 12.0, 20.0, 2.9, 20.0, 32.0, 397.0, 11.0, NULL, NULL, 83.0, 0.0, NULL, 0.39, 2.6, 1.0, NULL, NULL, NULL, 0.314, 0.293, 0.0, 0.0, NULL, '2026-02-26', 'Củ cái  Yam winged', 'cu cai  yam winged'),
+('fao_vn_2007_2003_raw', 'Củ dong', '{}', 'Bermuda tuber', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 4.0, 119.0, 1.4, 28.4, NULL, 2.4, NULL, 42.0, NULL, NULL, 21.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ dong  Bermuda tuber', 'cu dong  bermuda tuber'),
+('fao_vn_2007_2004_raw', 'Củ sắn', '{}', 'Bitter cassava', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 25.0, 152.0, 1.1, 36.4, 0.2, 1.5, 2.0, 25.0, 1.2, 4.0, 30.0, 394.0, NULL, NULL, NULL, 8.0, 0.0, NULL, 0.19, 1.9, 34.0, 0.03, 0.03, 0.6, 0.107, 0.088, 0.0, 0.0, NULL, '2026-02-26', 'Củ sắn  Bitter cassava', 'cu san  bitter cassava'),
+('fao_vn_2007_2005_raw', 'Củ sắn dây', '{}', 'Radix puerariae', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 10.0, 119.0, 1.6, 28.0, 0.1, 9.2, NULL, 28.0, 0.2, NULL, 45.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ sắn dây  Radix puerariae', 'cu san day  radix puerariae'),
+('fao_vn_2007_2006_raw', 'Củ súng khô (đã bỏ vỏ)', '{}', 'Nymphaea stellata wild, dried, unshelled', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 350.0, 16.1, 70.3, 0.5, 2.3, NULL, 100.0, 0.2, NULL, 720.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ súng khô (đã bỏ vỏ)  Nymphaea stellata wild, dried, unshelled', 'cu sung kho (da bo vo)  nymphaea stellata wild, dried, unshelled'),
+('fao_vn_2007_2007_raw', 'Củ từ', '{}', 'Igname Yam, Chinese', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 6.0, 92.0, 1.5, 21.5, NULL, 1.2, NULL, 28.0, 0.2, NULL, 30.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ từ  Igname Yam, Chinese', 'cu tu  igname yam, chinese'),
+('fao_vn_2007_2008_raw', 'Khoai lang', '{}', 'Sweet potato, white', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 17.0, 119.0, 0.8, 28.5, 0.2, 1.3, 31.0, 34.0, 1.0, 201.0, 49.0, 210.0, 0.2, 260.0, 0.39, 150.0, 0.0, NULL, 0.26, 1.8, 23.0, 0.05, 0.05, 0.6, 0.8, 0.209, 0.0, 0.0, NULL, '2026-02-26', 'Khoai lang  Sweet potato, white', 'khoai lang  sweet potato, white'),
+('fao_vn_2007_2009_raw', 'Khoai lang nghệ', '{}', 'Sweet potato, yellow', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 13.0, 116.0, 1.2, 27.1, 0.3, 0.8, NULL, 36.0, 0.9, NULL, 56.0, NULL, NULL, NULL, NULL, 1470.0, 0.0, NULL, NULL, NULL, 30.0, 0.12, 0.05, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Khoai lang nghệ  Sweet potato, yellow', 'khoai lang nghe  sweet potato, yellow'),
+('fao_vn_2007_2010_raw', 'Khoai môn', '{}', 'Chinese Yam, spiny yam', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 14.0, 109.0, 1.5, 25.2, 0.2, 1.2, NULL, 44.0, 0.8, NULL, 44.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 4.0, 0.09, 0.03, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Khoai môn  Chinese Yam, spiny yam', 'khoai mon  chinese yam, spiny yam'),
+('fao_vn_2007_2011_raw', 'Khoai nước', '{}', 'Water-taro', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 14.0, 98.0, 1.0, 23.3, 0.1, 2.0, NULL, 52.0, 0.2, NULL, 35.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Khoai nước  Water-taro', 'khoai nuoc  water-taro'),
+('fao_vn_2007_2012_raw', 'Khoai riềng', '{}', 'Edible canna', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 19.0, 104.0, 0.8, 25.1, NULL, 2.5, NULL, 64.0, 1.7, NULL, 107.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Khoai riềng  Edible canna', 'khoai rieng  edible canna'),
+('fao_vn_2007_2013_raw', 'Khoai sọ', '{}', 'Taro tuber', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 18.0, 114.0, 1.8, 26.5, 0.1, 1.2, 10.0, 64.0, 1.5, 33.0, 75.0, 448.0, NULL, NULL, 0.38, 35.0, 0.0, NULL, 2.38, 1.0, 4.0, 0.06, 0.03, 0.1, 0.303, 0.283, 0.0, 0.0, NULL, '2026-02-26', 'Khoai sọ  Taro tuber', 'khoai so  taro tuber'),
+('fao_vn_2007_2014_raw', 'Khoai tây', '{}', 'Potato, white', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 13.0, 93.0, 2.0, 20.9, 0.1, 1.0, 7.0, 10.0, 1.2, 32.0, 50.0, 396.0, 0.3, 230.0, 0.2, 5.0, 0.0, NULL, 0.01, 1.6, 10.0, 0.1, 0.05, 0.9, 0.281, 0.203, 0.0, 0.0, 0.47, '2026-02-26', 'Khoai tây  Potato, white', 'khoai tay  potato, white'),
+('fao_vn_2007_2015_raw', 'Miến dong', '{}', 'Vermicelli from Bermuda tuber', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 332.0, 0.6, 82.2, 0.1, 1.5, NULL, 40.0, 1.0, NULL, 120.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Miến dong  Vermicelli from Bermuda tuber', 'mien dong  vermicelli from bermuda tuber'),
+('fao_vn_2007_2016_raw', 'Bột dong lọc', '{}', 'Bermuda flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 341.0, 0.6, 84.7, NULL, 0.5, NULL, 37.0, 1.7, NULL, 18.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột dong lọc  Bermuda flour', 'bot dong loc  bermuda flour'),
+('fao_vn_2007_2017_raw', 'Bột khoai lang', '{}', 'Sweet potato flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 334.0, 2.2, 80.2, 0.5, 1.6, NULL, 50.0, 2.0, NULL, 95.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.24, 0.09, 1.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột khoai lang  Sweet potato flour', 'bot khoai lang  sweet potato flour'),
+('fao_vn_2007_2018_raw', 'Bột khoai riềng (bột đao)', '{}', 'Canna edulis Ker, flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 337.0, 0.2, 84.1, NULL, 1.5, NULL, 16.0, NULL, NULL, 17.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột khoai riềng (bột đao)  Canna edulis Ker, flour', 'bot khoai rieng (bot dao)  canna edulis ker, flour'),
+('fao_vn_2007_2019_raw', 'Bột khoai tây (lọc)', '{}', 'Potato flour, white', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 345.0, 1.0, 84.4, 0.3, 0.4, NULL, 30.0, 3.0, NULL, 125.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, 0.25, 0.0, NULL, 0.01, NULL, 0.4, 0.474, 0.769, 0.0, 0.0, NULL, '2026-02-26', 'Bột khoai tây (lọc)  Potato flour, white', 'bot khoai tay (loc)  potato flour, white'),
+('fao_vn_2007_2020_raw', 'Bột sắn', '{}', 'Cassava flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 333.0, 2.4, 79.6, 0.5, 2.2, NULL, 84.0, NULL, NULL, 37.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.02, 0.03, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột sắn  Cassava flour', 'bot san  cassava flour'),
+('fao_vn_2007_2021_raw', 'Bột sắn dây', '{}', 'Radix puerariae flour', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 340.0, 0.7, 84.3, NULL, 0.8, NULL, 18.0, 1.5, NULL, 20.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột sắn dây  Radix puerariae flour', 'bot san day  radix puerariae flour'),
+('fao_vn_2007_2022_raw', 'Khoai lang khô', '{}', 'Sweet potato, dried', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 5.0, 333.0, 2.2, 80.0, 0.5, 3.6, 86.0, 95.0, 2.78, 559.0, 137.0, 584.0, 0.56, 723.0, 1.08, 417.0, 0.0, NULL, 0.72, 5.0, NULL, 0.09, 0.07, 1.7, 2.225, 0.581, 0.0, 0.0, NULL, '2026-02-26', 'Khoai lang khô  Sweet potato, dried', 'khoai lang kho  sweet potato, dried'),
+('fao_vn_2007_2023_raw', 'Khoai tây khô', '{}', 'Potato, white, dried', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 330.0, 6.6, 75.1, 0.3, 3.4, 25.0, 37.0, 4.3, 114.0, 180.0, 1410.0, 1.07, 819.0, 0.71, 18.0, 0.0, NULL, 0.04, 5.7, NULL, 0.36, 0.18, 3.2, 1.0, 0.723, 0.0, 0.0, NULL, '2026-02-26', 'Khoai tây khô  Potato, white, dried', 'khoai tay kho  potato, white, dried'),
+('fao_vn_2007_2024_raw', 'Khoai tây lát chiên', '{}', 'Potato crisp, fried', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 525.0, 2.2, 49.3, 35.4, 6.3, NULL, 37.0, 2.1, NULL, 130.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 1.0, 0.15, 0.02, 4.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Khoai tây lát chiên  Potato crisp, fried', 'khoai tay lat chien  potato crisp, fried'),
+('fao_vn_2007_2025_raw', 'Sắn khô', '{}', 'Dried bitter cassava', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 5.0, 340.0, 3.0, 80.3, 0.7, 3.0, NULL, 96.0, 7.9, NULL, 81.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.06, 0.05, 0.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Sắn khô  Dried bitter cassava', 'san kho  dried bitter cassava'),
+('fao_vn_2007_2026_raw', 'Trân châu sắn', '{}', 'Tapioca, pearls E.P', 'Khoai củ và sản phẩm chế biến', 'Starchy root and products', 'FAO_VN_2007', 'raw', 0.0, 341.0, 1.0, 84.3, NULL, 0.6, NULL, 30.0, 2.0, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, 0.04, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Trân châu sắn  Tapioca, pearls E.P', 'tran chau san  tapioca, pearls e.p'),
+('fao_vn_2007_3001_raw', 'Cùi dừa già', '{}', 'Coconut meat, mature, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 20.0, 368.0, 4.8, 6.2, 36.0, 4.2, 7.0, 30.0, 30.0, 160.0, 154.0, 555.0, 5.0, 50.0, 1.3, 0.0, 0.0, NULL, 0.24, 0.2, 2.0, 0.1, 0.01, 0.2, 0.3, 0.054, 0.0, 0.0, NULL, '2026-02-26', 'Cùi dừa già  Coconut meat, mature, raw', 'cui dua gia  coconut meat, mature, raw'),
+('fao_vn_2007_3002_raw', 'Cùi dừa non', '{}', 'Coconut meat, immature, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 40.0, 3.5, 2.6, 1.7, 3.5, NULL, 4.0, 1.0, NULL, 53.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 6.0, 0.04, 0.03, 0.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cùi dừa non  Coconut meat, immature, raw', 'cui dua non  coconut meat, immature, raw'),
+('fao_vn_2007_3003_raw', 'Đậu cô ve (hạt)', '{}', 'French bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 10.0, 321.0, 21.8, 54.9, 1.6, 3.5, NULL, 96.0, NULL, NULL, 360.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đậu cô ve (hạt)  French bean seeds, dried', 'dau co ve (hat)  french bean seeds, dried'),
+('fao_vn_2007_3004_raw', 'Đậu đen (hạt)', '{}', 'Black bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 325.0, 24.2, 53.3, 1.7, 4.0, NULL, 56.0, 6.1, NULL, 354.0, NULL, NULL, NULL, NULL, 30.0, 0.0, NULL, 0.22, 6.0, 3.0, 0.5, 0.21, 1.8, 0.899, 0.286, 0.0, NULL, NULL, '2026-02-26', 'Đậu đen (hạt)  Black bean seeds, dried', 'dau den (hat)  black bean seeds, dried'),
+('fao_vn_2007_3005_raw', 'Đậu đũa (hạt)', '{}', 'Cow pea whole seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 10.0, 320.0, 23.7, 51.9, 2.0, 4.3, NULL, 110.0, 6.5, NULL, 382.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, 0.39, 5.0, 1.0, 0.59, 0.22, 2.3, 1.496, 0.357, 0.0, 0.0, NULL, '2026-02-26', 'Đậu đũa (hạt)  Cow pea whole seeds, dried', 'dau dua (hat)  cow pea whole seeds, dried'),
+('fao_vn_2007_3006_raw', 'Đậu Hà lan (hạt)', '{}', 'Peas garden and field, seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 318.0, 22.2, 54.1, 1.4, 6.0, 9.0, 57.0, 4.4, 145.0, 303.0, 135.0, 4.0, 930.0, NULL, 70.0, 0.0, NULL, 0.09, 14.5, 0.0, 0.77, 0.18, 3.1, 1.758, 0.174, 0.0, 0.0, NULL, '2026-02-26', 'Đậu Hà lan (hạt)  Peas garden and field, seeds, dried', 'dau ha lan (hat)  peas garden and field, seeds, dried'),
+('fao_vn_2007_3007_raw', 'Đậu tương (đậu nành)', '{}', 'Yellow dried soybean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 400.0, 34.0, 24.6, 18.4, 4.5, 2.0, 165.0, 11.0, 236.0, 690.0, 1504.0, 3.8, 300.0, 1.2, 30.0, 0.0, NULL, 0.85, 47.0, 4.0, 0.54, 0.29, 2.3, 0.793, 0.377, 0.0, 0.0, 60.0, '2026-02-26', 'Đậu tương (đậu nành)  Yellow dried soybean seeds, dried', 'dau tuong (dau nanh)  yellow dried soybean seeds, dried'),
+('fao_vn_2007_3008_raw', 'Đậu trắng hạt (Đậu Tây)', '{}', 'Kidney bean whole seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 327.0, 23.2, 53.8, 2.1, 3.6, NULL, 160.0, 6.8, NULL, 514.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, 0.22, 19.0, 3.0, 0.54, 0.18, 2.1, 0.78, 0.397, 0.0, 0.0, NULL, '2026-02-26', 'Đậu trắng hạt (Đậu Tây)  Kidney bean whole seeds, dried', 'dau trang hat (dau tay)  kidney bean whole seeds, dried'),
+('fao_vn_2007_3009_raw', 'Đậu trứng cuốc', '{}', 'Egg bird bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 321.0, 25.8, 50.0, 2.0, 4.8, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đậu trứng cuốc  Egg bird bean seeds, dried', 'dau trung cuoc  egg bird bean seeds, dried'),
+('fao_vn_2007_3010_raw', 'Đậu xanh (đậu tắt)', '{}', 'Mungo bean seeds, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 328.0, 23.4, 53.1, 2.4, 4.7, 6.0, 64.0, 4.8, 270.0, 377.0, 1132.0, 1.1, 880.0, NULL, 30.0, 0.0, NULL, 0.51, 9.0, 4.0, 0.72, 0.15, 2.4, 1.91, 0.382, 0.0, 0.0, 0.7, '2026-02-26', 'Đậu xanh (đậu tắt)  Mungo bean seeds, dried', 'dau xanh (dau tat)  mungo bean seeds, dried'),
+('fao_vn_2007_3011_raw', 'Hạt dẻ to', '{}', 'Chestnut, Chinese whole, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 30.0, 638.0, 18.0, 8.7, 59.0, 3.5, NULL, 61.0, 2.3, NULL, 510.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 3.0, 0.48, 0.13, 1.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hạt dẻ to  Chestnut, Chinese whole, raw', 'hat de to  chestnut, chinese whole, raw'),
+('fao_vn_2007_3012_raw', 'Hạt dẻ tươi', '{}', 'Chestnut, Chinese whole, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 18.0, 223.0, 4.2, 49.1, 1.1, NULL, 3.0, 18.0, 1.41, 84.0, 96.0, 447.0, 0.87, 363.0, 1.6, NULL, 0.0, NULL, NULL, NULL, 36.0, 0.16, 0.18, 0.8, 0.555, 0.41, 0.0, 0.0, 1.3, '2026-02-26', 'Hạt dẻ tươi  Chestnut, Chinese whole, raw', 'hat de tuoi  chestnut, chinese whole, raw'),
+('fao_vn_2007_3013_raw', 'Hạt dẻ khô', '{}', 'Chestnut, dried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 20.0, 363.0, 6.8, 79.8, 1.8, NULL, 5.0, 29.0, 2.29, 137.0, 155.0, 726.0, 1.41, 590.0, 2.6, NULL, 0.0, NULL, NULL, NULL, 59.0, 0.26, 0.29, 1.3, 0.902, 0.666, 0.0, 0.0, NULL, '2026-02-26', 'Hạt dẻ khô  Chestnut, dried', 'hat de kho  chestnut, dried'),
+('fao_vn_2007_3014_raw', 'Hạt đen', '{}', 'Black seed', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 50.0, 472.0, 17.3, 35.5, 29.0, 3.5, NULL, 84.0, NULL, NULL, 255.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hạt đen  Black seed', 'hat den  black seed'),
+('fao_vn_2007_3015_raw', 'Hạt điều', '{}', 'Cashew nut, common', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 605.0, 18.4, 28.7, 46.3, 0.6, 12.0, 28.0, 3.6, 292.0, 462.0, 660.0, 5.78, 2195.0, 1.66, 5.0, 0.0, NULL, 0.9, 34.1, 1.0, 0.25, 0.34, 2.4, 0.864, 0.417, 0.0, 0.0, NULL, '2026-02-26', 'Hạt điều  Cashew nut, common', 'hat dieu  cashew nut, common'),
+('fao_vn_2007_3016_raw', 'Hạt mít', '{}', 'Jack fruit, seed, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 15.0, 166.0, 0.7, 38.3, 1.1, NULL, NULL, 46.0, 3.4, NULL, 34.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hạt mít  Jack fruit, seed, raw', 'hat mit  jack fruit, seed, raw'),
+('fao_vn_2007_3017_raw', 'Lạc hạt', '{}', 'Dried peanut seed', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 2.0, 573.0, 27.5, 15.5, 44.5, 2.5, 4.0, 68.0, 2.2, 185.0, 420.0, 421.0, 1.9, 420.0, 1.6, 10.0, 0.0, NULL, 8.33, 0.0, NULL, 0.44, 0.12, 16.0, 1.767, 0.348, 0.0, 0.0, NULL, '2026-02-26', 'Lạc hạt  Dried peanut seed', 'lac hat  dried peanut seed'),
+('fao_vn_2007_3018_raw', 'Quả cọ tươi', '{}', 'Palm fruit fresh', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 40.0, 178.0, 2.3, 12.1, 13.4, 3.5, NULL, 38.0, 0.2, NULL, 34.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả cọ tươi  Palm fruit fresh', 'qua co tuoi  palm fruit fresh'),
+('fao_vn_2007_3019_raw', 'Quả đại hái tươi', '{}', 'Hodgsonia fruit', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 90.0, 427.0, 20.0, 1.2, 38.0, 3.4, NULL, 66.0, 3.1, NULL, 440.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả đại hái tươi  Hodgsonia fruit', 'qua dai hai tuoi  hodgsonia fruit'),
+('fao_vn_2007_3020_raw', 'Vừng (đen, trắng)', '{}', 'Sesame oriental seeds, whole, dried black or white', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 5.0, 568.0, 20.1, 17.6, 46.4, 3.5, 11.0, 975.0, 14.55, 351.0, 629.0, 468.0, 7.75, 4082.0, 2.46, 15.0, 0.0, NULL, 0.25, 0.0, 0.0, 0.79, 0.25, 4.5, 0.05, 0.79, 0.0, 0.0, NULL, '2026-02-26', 'Vừng (đen, trắng)  Sesame oriental seeds, whole, dried black or white', 'vung (den, trang)  sesame oriental seeds, whole, dried black or white'),
+('fao_vn_2007_3021_raw', 'Bột đậu tương đã loại béo (đậu nành)', '{}', 'Soybeans flour, defatted', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 321.0, 49.0, 29.0, 1.0, 2.5, 20.0, 247.0, 7.6, 290.0, 602.0, 2384.0, 2.46, 4067.0, 3.02, 35.0, 0.0, NULL, 0.2, 4.1, 0.0, 0.7, 0.3, 2.0, 1.995, 0.574, 0.0, 0.0, NULL, '2026-02-26', 'Bột đậu tương đã loại béo (đậu nành)  Soybeans flour, defatted', 'bot dau tuong da loai beo (dau nanh)  soybeans flour, defatted'),
+('fao_vn_2007_3022_cooked', 'Bột đậu tương rang chín', '{}', 'Roasted soybeans flour', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 0.0, 418.0, 41.0, 22.9, 18.0, 2.5, NULL, 189.0, 7.5, NULL, 540.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.4, 0.16, 2.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột đậu tương rang chín  Roasted soybeans flour', 'bot dau tuong rang chin  roasted soybeans flour'),
+('fao_vn_2007_3023_raw', 'Bột đậu xanh', '{}', 'Mungo bean flour', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 347.0, 24.6, 56.5, 2.5, 3.9, 6.0, 50.0, 1.0, 283.0, 100.0, 1185.0, 1.15, 921.0, NULL, NULL, 0.0, NULL, 0.53, 9.4, 4.0, 0.75, 0.16, 2.5, 1.999, 0.4, 0.0, 0.0, 0.73, '2026-02-26', 'Bột đậu xanh  Mungo bean flour', 'bot dau xanh  mungo bean flour'),
+('fao_vn_2007_3024_raw', 'Bột lạc', '{}', 'Peanut flour', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 575.0, 27.5, 15.0, 45.0, 2.1, 4.0, 80.0, 3.0, 182.0, 380.0, 414.0, 1.87, 413.0, 1.57, 10.0, 0.0, NULL, 8.2, 0.0, NULL, 0.4, 0.11, 15.3, 1.739, 0.342, 0.0, 0.0, NULL, '2026-02-26', 'Bột lạc  Peanut flour', 'bot lac  peanut flour'),
+('fao_vn_2007_3025_raw', 'Đậu phụ', '{}', 'Soybean curt cake pressed, raw', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 95.0, 10.9, 0.7, 5.4, 0.4, 7.0, 24.0, 2.2, 30.0, 85.0, 121.0, 0.8, 193.0, 0.61, NULL, 0.0, NULL, NULL, NULL, 0.0, 0.03, 0.02, 0.4, 0.068, 0.047, 0.0, 0.0, NULL, '2026-02-26', 'Đậu phụ  Soybean curt cake pressed, raw', 'dau phu  soybean curt cake pressed, raw'),
+('fao_vn_2007_3026_raw', 'Đậu phụ chúc', '{}', 'Curd tofu concentrated', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 414.0, 50.2, 6.5, 20.8, 0.3, NULL, 325.0, 10.8, NULL, 225.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đậu phụ chúc  Curd tofu concentrated', 'dau phu chuc  curd tofu concentrated'),
+('fao_vn_2007_3027_cooked', 'Đậu phụ nướng', '{}', 'Curd tofu, fried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 0.0, 114.0, 13.4, 0.8, 6.4, 0.5, NULL, 370.0, 4.7, NULL, 167.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.04, 0.05, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đậu phụ nướng  Curd tofu, fried', 'dau phu nuong  curd tofu, fried'),
+('fao_vn_2007_3028_cooked', 'Hạt bí đỏ rang', '{}', 'Pumpkin seeds, fried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 19.0, 519.0, 35.1, 23.0, 31.8, 2.3, NULL, 235.0, 2.2, NULL, 900.0, NULL, NULL, NULL, NULL, 235.0, 0.0, NULL, NULL, NULL, NULL, 0.15, 0.15, 3.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hạt bí đỏ rang  Pumpkin seeds, fried', 'hat bi do rang  pumpkin seeds, fried'),
+('fao_vn_2007_3029_cooked', 'Hạt dưa đỏ rang (dưa hấu)', '{}', 'Water melon seeds whole, fried', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 22.0, 551.0, 31.8, 18.0, 39.1, 1.8, NULL, 237.0, 3.0, NULL, 751.0, NULL, NULL, NULL, NULL, 90.0, 0.0, NULL, NULL, NULL, NULL, 0.03, 0.14, 2.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hạt dưa đỏ rang (dưa hấu)  Water melon seeds whole, fried', 'hat dua do rang (dua hau)  water melon seeds whole, fried'),
+('fao_vn_2007_3030_raw', 'Hạt điều khô, chiên dầu', '{}', 'Cashew, common, roasted with oil', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 583.0, 18.3, 16.4, 49.3, 0.7, NULL, 32.0, 3.9, NULL, 411.0, NULL, NULL, NULL, NULL, 5.0, 0.0, NULL, NULL, NULL, NULL, 0.36, 0.34, 1.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hạt điều khô, chiên dầu  Cashew, common, roasted with oil', 'hat dieu kho, chien dau  cashew, common, roasted with oil'),
+('fao_vn_2007_3031_cooked', 'Sữa bột đậu nành', '{}', 'Milk flour, made from roasted soybeans', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'cooked', 0.0, 405.0, 31.1, 48.2, 9.7, 2.2, NULL, 224.0, 7.5, NULL, 320.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.4, 0.16, 2.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Sữa bột đậu nành  Milk flour, made from roasted soybeans', 'sua bot dau nanh  milk flour, made from roasted soybeans'),
+('fao_vn_2007_3032_raw', 'Sữa đậu nành (100g đậu/lít)', '{}', 'Soybean milk (100 g soybean/l)', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 28.0, 3.1, 0.4, 1.6, 0.1, 55.0, 18.0, 1.2, 25.0, 36.0, 124.0, 0.44, 141.0, 0.22, NULL, 0.0, 0.4, 1.35, 3.0, 0.0, 0.05, 0.02, 0.3, 0.518, 0.096, 0.0, 0.0, NULL, '2026-02-26', 'Sữa đậu nành (100g đậu/lít)  Soybean milk (100 g soybean/l)', 'sua dau nanh (100g dau/lit)  soybean milk (100 g soybean/l)'),
+('fao_vn_2007_3033_raw', 'Tào phớ', '{}', 'Tofu in light syrup (Tofu 160g, sirup 65ml)', 'Hạt, quả giàu đạm, béo và sản phẩm chế biến', 'Pulses, nuts, seeds and products', 'FAO_VN_2007', 'raw', 0.0, 37.0, 2.3, 6.4, 0.2, 0.2, NULL, 92.0, 0.3, NULL, 150.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tào phớ  Tofu in light syrup (Tofu 160g, sirup 65ml)', 'tao pho  tofu in light syrup (tofu 160g, sirup 65ml)'),
+('fao_vn_2007_4001_raw', 'Bầu', '{}', 'Calabash, Bottle gourd', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 35.3, 14.0, 0.6, 2.9, 0.02, 1.0, 2.0, 21.0, 0.2, 11.0, 25.0, 150.0, 0.7, 26.0, 0.07, 10.0, 0.0, NULL, NULL, NULL, 12.0, 0.02, 0.03, 0.4, 0.152, 0.04, 0.0, 0.0, NULL, '2026-02-26', 'Bầu  Calabash, Bottle gourd', 'bau  calabash, bottle gourd'),
+('fao_vn_2007_4002_raw', 'Bí đao (bí xanh)', '{}', 'Asgourd Waxgoured, Winter melon', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 12.0, 0.6, 2.4, NULL, 1.0, 13.0, 26.0, 0.3, 8.0, 23.0, 150.0, NULL, NULL, NULL, 5.0, 0.0, NULL, NULL, NULL, 16.0, 0.01, 0.02, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bí đao (bí xanh)  Asgourd Waxgoured, Winter melon', 'bi dao (bi xanh)  asgourd waxgoured, winter melon'),
+('fao_vn_2007_4003_raw', 'Bí ngô', '{}', 'Pumpkin squash', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.3, 27.0, 0.3, 6.1, 0.1, 0.7, 8.0, 24.0, 0.5, 10.0, 16.0, 349.0, 0.1, 210.0, 16.0, 3100.0, 0.0, 0.0, 1.06, 1.1, 8.0, 0.06, 0.03, 0.4, 0.298, 0.061, 0.0, 0.0, 0.4, '2026-02-26', 'Bí ngô  Pumpkin squash', 'bi ngo  pumpkin squash'),
+('fao_vn_2007_4004_raw', 'Cà bát', '{}', 'Egg plant big, Brinja aubergine', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 23.0, 1.2, 4.0, 0.2, 1.5, 2.0, 12.0, 0.7, 14.0, 16.0, 230.0, 0.16, 82.0, 0.25, 40.0, 0.0, NULL, 0.3, 3.5, 3.0, 0.03, 0.04, 0.5, 0.281, 0.084, 0.0, 0.0, NULL, '2026-02-26', 'Cà bát  Egg plant big, Brinja aubergine', 'ca bat  egg plant big, brinja aubergine'),
+('fao_vn_2007_4005_raw', 'Cà chua', '{}', 'Tomato', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 20.0, 0.6, 4.0, 0.2, 0.8, 12.0, 12.0, 1.4, 15.0, 26.0, 275.0, 0.74, 90.0, 0.21, 393.0, 0.0, 0.0, 0.54, 7.9, 40.0, 0.06, 0.04, 0.5, 0.089, 0.08, 0.0, 0.0, NULL, '2026-02-26', 'Cà chua  Tomato', 'ca chua  tomato'),
+('fao_vn_2007_4006_raw', 'Cà pháo', '{}', 'Egg plant - small', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 20.0, 1.5, 3.6, NULL, 1.6, 7.0, 12.0, 0.7, 18.0, 16.0, 221.0, 0.3, 90.0, 0.2, 20.0, 0.0, NULL, NULL, NULL, 3.0, 0.03, 0.04, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cà pháo  Egg plant - small', 'ca phao  egg plant - small'),
+('fao_vn_2007_4007_raw', 'Cà rốt (củ đỏ, vàng)', '{}', 'Carrots', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.5, 39.0, 1.5, 7.8, 0.2, 1.2, 52.0, 43.0, 0.8, 12.0, 39.0, 266.0, 1.11, 150.0, 0.23, 8285.0, 0.0, NULL, NULL, NULL, 8.0, 0.06, 0.06, 0.4, 0.273, 0.138, 0.0, 0.0, 3.4, '2026-02-26', 'Cà rốt (củ đỏ, vàng)  Carrots', 'ca rot (cu do, vang)  carrots'),
+('fao_vn_2007_4008_raw', 'Cà rốt khô', '{}', 'Dried carrot', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 292.0, 9.2, 60.4, 1.5, 9.6, NULL, 323.0, 5.9, NULL, 292.0, NULL, NULL, NULL, NULL, 810.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cà rốt khô  Dried carrot', 'ca rot kho  dried carrot'),
+('fao_vn_2007_4009_raw', 'Cà tím', '{}', 'Aubergine', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 22.0, 1.0, 4.5, NULL, 1.5, NULL, 15.0, 0.4, NULL, 34.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 15.0, 0.04, 0.05, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cà tím  Aubergine', 'ca tim  aubergine'),
+('fao_vn_2007_4010_raw', 'Cải bắp', '{}', 'Cabbage, common', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 29.0, 1.8, 5.3, 0.1, 1.6, 28.0, 48.0, 1.1, 13.0, 31.0, 190.0, 0.81, 180.0, 0.45, 65.0, 0.0, NULL, 0.15, 60.0, 30.0, 0.06, 0.05, 0.4, 0.14, 0.096, 0.0, 0.0, 1.2, '2026-02-26', 'Cải bắp  Cabbage, common', 'cai bap  cabbage, common'),
+('fao_vn_2007_4011_raw', 'Cải bắp đỏ', '{}', 'Cabbage, red', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 22.0, 45.0, 1.9, 9.0, 0.2, 4.0, 27.0, 83.0, 0.5, 16.0, 42.0, 243.0, 0.22, 17.0, 0.24, 670.0, 0.0, 0.0, 0.11, 38.2, 60.0, 0.07, 0.05, 0.8, 0.147, 0.209, 0.0, 0.0, 0.1, '2026-02-26', 'Cải bắp đỏ  Cabbage, red', 'cai bap do  cabbage, red'),
+('fao_vn_2007_4012_raw', 'Cải bắp khô', '{}', 'Dried cabbage, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 245.0, 18.0, 39.7, 1.6, 14.0, NULL, 300.0, 7.5, NULL, 106.0, NULL, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, 2.0, 0.15, 0.52, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cải bắp khô  Dried cabbage, white', 'cai bap kho  dried cabbage, white'),
+('fao_vn_2007_4013_raw', 'Cải cúc', '{}', 'Chrysanthemum. crown-daisy', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 14.0, 1.6, 1.9, NULL, 2.0, 33.0, 63.0, 0.8, 32.0, 38.0, 219.0, 0.67, 180.0, 0.7, 1115.0, 0.0, NULL, NULL, NULL, 27.0, 0.01, 0.03, 0.2, 0.221, 0.176, 0.0, 0.0, NULL, '2026-02-26', 'Cải cúc  Chrysanthemum. crown-daisy', 'cai cuc  chrysanthemum. crown-daisy'),
+('fao_vn_2007_4014_raw', 'Cải soong', '{}', 'Watercress', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 30.0, 15.0, 2.1, 1.3, 0.1, 2.0, 85.0, 69.0, 1.6, 21.0, 28.0, 211.0, 0.8, 200.0, 0.38, 2820.0, 0.0, 0.0, 1.0, 250.0, 25.0, 0.08, 0.26, 1.0, 0.31, 0.129, 0.0, 0.0, NULL, '2026-02-26', 'Cải soong  Watercress', 'cai soong  watercress'),
+('fao_vn_2007_4015_raw', 'Cải thìa (cải trắng)', '{}', 'Chinese cabbage, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 17.0, 1.4, 2.4, 0.2, 1.8, 25.0, 50.0, 0.7, 25.0, 30.0, 200.0, 0.75, 90.0, 0.5, 2681.0, 0.0, NULL, 0.09, 35.8, 26.0, 0.09, 0.07, 0.4, 0.088, 0.194, 0.0, 0.0, NULL, '2026-02-26', 'Cải thìa (cải trắng)  Chinese cabbage, white', 'cai thia (cai trang)  chinese cabbage, white'),
+('fao_vn_2007_4016_raw', 'Cải xanh', '{}', 'Mustard greens, India, leaves and stems', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 24.0, 16.0, 1.7, 1.9, 0.2, 1.8, 29.0, 89.0, 1.9, 23.0, 14.0, 221.0, 0.9, 120.0, 0.32, 6300.0, 0.0, NULL, 2.01, 497.3, 51.0, 0.07, 0.1, 0.8, 0.21, 0.18, 0.0, 0.0, NULL, '2026-02-26', 'Cải xanh  Mustard greens, India, leaves and stems', 'cai xanh  mustard greens, india, leaves and stems'),
+('fao_vn_2007_4017_raw', 'Cần ta', '{}', 'Water drop-wort; Celery water', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 10.0, 1.0, 1.5, NULL, 1.5, NULL, 310.0, 3.0, NULL, 64.0, NULL, NULL, NULL, NULL, 2045.0, 0.0, NULL, NULL, NULL, 6.0, 0.04, 0.03, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cần ta  Water drop-wort; Celery water', 'can ta  water drop-wort; celery water'),
+('fao_vn_2007_4018_raw', 'Cần tây', '{}', 'Celery, Chinese', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 16.0, 48.0, 3.7, 7.9, 0.2, 1.5, 96.0, 325.0, 8.0, 18.0, 128.0, 326.0, 0.3, 90.0, 0.2, 150.0, 0.0, NULL, 0.27, 29.3, 150.0, 0.06, 0.07, 0.4, 0.246, 0.074, 0.0, 0.0, NULL, '2026-02-26', 'Cần tây  Celery, Chinese', 'can tay  celery, chinese'),
+('fao_vn_2007_4019_raw', 'Chuối xanh', '{}', 'Banana common varieties, unripe', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 32.0, 74.0, 1.2, 16.4, 0.5, 1.0, 13.0, 26.0, 0.4, 17.0, 27.0, 256.0, 0.25, 94.0, 0.1, 184.0, 0.0, NULL, 0.69, 9.5, 31.0, 0.05, 0.02, 0.6, 0.265, 0.357, 0.0, 0.0, NULL, '2026-02-26', 'Chuối xanh  Banana common varieties, unripe', 'chuoi xanh  banana common varieties, unripe'),
+('fao_vn_2007_4020_raw', 'Củ cải đỏ', '{}', 'Red radish oriental, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 48.0, 1.3, 10.8, NULL, 0.9, NULL, 28.0, 1.4, NULL, 43.0, NULL, NULL, NULL, NULL, 16.0, 0.0, NULL, NULL, NULL, 20.0, 0.02, 0.05, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ cải đỏ  Red radish oriental, raw', 'cu cai do  red radish oriental, raw'),
+('fao_vn_2007_4021_raw', 'Củ cải trắng', '{}', 'Radish garden while, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.2, 21.0, 1.5, 3.6, 0.1, 1.5, 10.0, 40.0, 1.1, 15.0, 41.0, 242.0, 0.2, 150.0, 0.05, 0.0, 0.0, NULL, 0.0, 0.3, 30.0, 0.06, 0.06, 0.5, 0.138, 0.046, 0.0, 0.0, NULL, '2026-02-26', 'Củ cải trắng  Radish garden while, raw', 'cu cai trang  radish garden while, raw'),
+('fao_vn_2007_4022_raw', 'Củ cải trắng khô', '{}', 'Dried radish, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 220.0, 17.6, 33.9, 1.5, 17.7, 278.0, 629.0, 6.73, 170.0, 204.0, 3494.0, 2.13, 1631.0, 0.54, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.27, 0.68, 3.4, 1.854, 0.618, 0.0, 0.0, NULL, '2026-02-26', 'Củ cải trắng khô  Dried radish, white', 'cu cai trang kho  dried radish, white'),
+('fao_vn_2007_4023_raw', 'Củ đậu', '{}', 'Pachyrrhizus', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 15.0, 28.0, 1.0, 6.0, NULL, 0.7, NULL, 8.0, NULL, NULL, 16.0, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.0, NULL, NULL, 6.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ đậu  Pachyrrhizus', 'cu dau  pachyrrhizus'),
+('fao_vn_2007_4024_raw', 'Củ niễng', '{}', 'Manchurian water-rice, Manchurian Wild rice', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.0, 30.0, 2.0, 5.4, NULL, 1.8, NULL, 24.0, 1.4, NULL, 92.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Củ niễng  Manchurian water-rice, Manchurian Wild rice', 'cu nieng  manchurian water-rice, manchurian wild rice'),
+('fao_vn_2007_4025_raw', 'Dọc củ cải (non)', '{}', 'Horse radish; dish - tree, drumstick leave', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 4.0, 14.0, 1.9, 1.6, NULL, 1.8, NULL, 220.0, 0.4, NULL, 57.0, NULL, NULL, NULL, NULL, 1090.0, 0.0, NULL, NULL, NULL, 72.0, 0.06, 0.11, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dọc củ cải (non)  Horse radish; dish - tree, drumstick leave', 'doc cu cai (non)  horse radish; dish - tree, drumstick leave'),
+('fao_vn_2007_4026_raw', 'Dọc mùng', '{}', 'Colocasia indica', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 5.0, 0.4, 0.8, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dọc mùng  Colocasia indica', 'doc mung  colocasia indica'),
+('fao_vn_2007_4027_raw', 'Dưa chuột', '{}', 'Cucumber', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 16.0, 0.8, 2.9, 0.1, 0.7, 13.0, 23.0, 1.0, 15.0, 27.0, 169.0, 0.18, 90.0, 0.25, 138.0, 0.0, 0.0, 0.03, 16.4, 5.0, 0.03, 0.04, 0.1, 0.259, 0.04, 0.0, 0.0, 0.4, '2026-02-26', 'Dưa chuột  Cucumber', 'dua chuot  cucumber'),
+('fao_vn_2007_4028_raw', 'Dưa gang', '{}', 'Large cucumber', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 11.0, 0.8, 2.0, NULL, 0.7, NULL, 25.0, 0.4, NULL, 37.0, NULL, NULL, NULL, NULL, 130.0, 0.0, NULL, NULL, NULL, 4.0, 0.04, 0.04, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dưa gang  Large cucumber', 'dua gang  large cucumber'),
+('fao_vn_2007_4029_raw', 'Đậu cô ve', '{}', 'Beans, kidney, in pod, French bean; Navy been', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 73.0, 5.0, 13.3, NULL, 1.0, 96.0, 26.0, 0.7, 26.0, 122.0, 254.0, 0.01, 90.0, 0.5, 180.0, 0.0, NULL, NULL, NULL, 25.0, 0.34, 0.19, 2.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đậu cô ve  Beans, kidney, in pod, French bean; Navy been', 'dau co ve  beans, kidney, in pod, french bean; navy been'),
+('fao_vn_2007_4030_raw', 'Đậu đũa', '{}', 'Cow-peas, yard long, Chinese long bean', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 59.0, 6.0, 7.9, 0.4, 2.0, 5.0, 47.0, 1.6, 36.0, 16.0, 194.0, 0.37, 48.0, 0.21, 250.0, 0.0, NULL, NULL, NULL, 22.0, 0.29, 0.18, 1.8, 0.055, 0.024, 0.0, 0.0, NULL, '2026-02-26', 'Đậu đũa  Cow-peas, yard long, Chinese long bean', 'dau dua  cow-peas, yard long, chinese long bean'),
+('fao_vn_2007_4031_raw', 'Đậu Hà Lan', '{}', 'Green peas; field pea; Peas garden', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 72.0, 6.5, 10.6, 0.4, 1.0, 5.0, 57.0, 0.8, 33.0, 43.0, 244.0, 1.24, 176.0, 0.41, 485.0, 0.0, NULL, 0.13, 24.8, 27.0, 0.4, 0.15, 2.2, 0.104, 0.169, 0.0, 0.0, 3.0, '2026-02-26', 'Đậu Hà Lan  Green peas; field pea; Peas garden', 'dau ha lan  green peas; field pea; peas garden'),
+('fao_vn_2007_4032_raw', 'Đậu rồng (quả non)', '{}', 'Winged bean goabean, Indies, asparagus pea', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 34.0, 1.9, 6.3, 0.1, 1.6, NULL, 63.0, 1.3, NULL, 60.0, NULL, NULL, NULL, NULL, 270.0, 0.0, NULL, NULL, NULL, 22.0, 0.06, 0.12, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đậu rồng (quả non)  Winged bean goabean, Indies, asparagus pea', 'dau rong (qua non)  winged bean goabean, indies, asparagus pea'),
+('fao_vn_2007_4033_raw', 'Đu đủ xanh', '{}', 'Papaya, unripe, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 22.0, 0.8, 4.6, NULL, 2.0, 7.0, 63.0, 0.9, 56.0, 50.0, 215.0, NULL, 101.0, NULL, 15.0, 0.0, NULL, NULL, NULL, 40.0, 0.02, 0.03, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đu đủ xanh  Papaya, unripe, raw', 'du du xanh  papaya, unripe, raw'),
+('fao_vn_2007_4034_raw', 'Gấc', '{}', 'Gac fruit, whole', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 80.0, 122.0, 2.1, 10.5, 7.9, 1.8, NULL, 56.0, 1.2, NULL, 6.0, NULL, NULL, NULL, NULL, 21756.0, 0.0, NULL, NULL, NULL, 11.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Gấc  Gac fruit, whole', 'gac  gac fruit, whole'),
+('fao_vn_2007_4035_raw', 'Giá đậu tương', '{}', 'Sprout of soybeans', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 79.0, 7.7, 8.0, 1.8, 0.7, 14.0, 52.0, 1.1, 72.0, 58.0, 484.0, 1.17, 427.0, 0.7, 25.0, 0.0, NULL, NULL, NULL, 10.0, 0.19, 0.15, 0.8, 0.929, 0.176, 0.0, 0.0, NULL, '2026-02-26', 'Giá đậu tương  Sprout of soybeans', 'gia dau tuong  sprout of soybeans'),
+('fao_vn_2007_4036_raw', 'Giá đậu xanh', '{}', 'Mungobean sprouts, Green gram, Tiensin green bean', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 44.0, 5.5, 5.1, 0.2, 2.0, 23.0, 38.0, 1.4, 17.0, 91.0, 164.0, 0.41, 164.0, 0.19, 6.0, 0.0, NULL, 0.1, 33.0, 10.0, 0.2, 0.13, 0.8, 0.38, 0.088, 0.0, 0.0, NULL, '2026-02-26', 'Giá đậu xanh  Mungobean sprouts, Green gram, Tiensin green bean', 'gia dau xanh  mungobean sprouts, green gram, tiensin green bean'),
+('fao_vn_2007_4037_raw', 'Hành củ tươi', '{}', 'Onion, Welsh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 24.0, 26.0, 1.3, 4.4, 0.4, 0.7, 17.0, 32.0, 1.1, 23.0, 49.0, 212.0, 0.52, 70.0, 0.14, 15.0, 0.0, NULL, NULL, NULL, 10.0, 0.03, 0.04, 0.2, 0.169, 0.072, 0.0, 0.0, NULL, '2026-02-26', 'Hành củ tươi  Onion, Welsh', 'hanh cu tuoi  onion, welsh'),
+('fao_vn_2007_4038_raw', 'Hành lá (hành hoa)', '{}', 'Onion, Welsh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 22.0, 1.3, 4.3, NULL, 0.9, 16.0, 80.0, 1.0, 23.0, 41.0, 123.0, 0.44, 180.0, 0.26, 1370.0, 0.0, 0.0, NULL, NULL, 60.0, 0.03, 0.1, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hành lá (hành hoa)  Onion, Welsh', 'hanh la (hanh hoa)  onion, welsh'),
+('fao_vn_2007_4039_raw', 'Hành tây', '{}', 'Onion, common, garden', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 17.0, 41.0, 1.8, 8.2, 0.1, 1.1, 8.0, 38.0, 0.8, 23.0, 58.0, 221.0, 1.43, 70.0, 0.2, 1.0, 0.0, 0.0, 0.02, 0.4, 10.0, 0.03, 0.04, 0.2, 0.122, 0.147, 0.0, 0.0, 0.9, '2026-02-26', 'Hành tây  Onion, common, garden', 'hanh tay  onion, common, garden'),
+('fao_vn_2007_4040_raw', 'Hạt sen tươi', '{}', 'Lotus seed, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 39.0, 161.0, 9.5, 29.5, 0.5, 0.8, 1.0, 76.0, 1.4, 56.0, 164.0, 367.0, 0.28, 94.0, 0.62, 10.0, 0.0, NULL, NULL, NULL, 17.0, 0.17, 0.09, 1.7, 0.228, 0.168, 0.0, 0.0, NULL, '2026-02-26', 'Hạt sen tươi  Lotus seed, raw', 'hat sen tuoi  lotus seed, raw'),
+('fao_vn_2007_4041_raw', 'Hạt sen khô', '{}', 'Dried lotus seed', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 334.0, 20.0, 58.0, 2.4, 2.2, 5.0, 89.0, 6.4, 210.0, 285.0, 1368.0, 1.05, 350.0, 2.32, 30.0, 0.0, NULL, NULL, NULL, 0.0, 0.64, 0.15, 1.6, 0.851, 0.629, 0.0, 0.0, NULL, '2026-02-26', 'Hạt sen khô  Dried lotus seed', 'hat sen kho  dried lotus seed'),
+('fao_vn_2007_4042_raw', 'Hẹ lá', '{}', 'Onion, fragrant, Chinese leek', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.0, 18.0, 2.2, 1.5, 0.3, 0.9, 6.0, 56.0, 1.3, 18.0, 45.0, 234.0, 0.2, 100.0, 0.3, 1000.0, 0.0, 0.0, 0.92, 47.0, 19.0, 0.03, 0.09, 0.9, 0.14, 0.233, 0.0, 0.0, 1.4, '2026-02-26', 'Hẹ lá  Onion, fragrant, Chinese leek', 'he la  onion, fragrant, chinese leek'),
+('fao_vn_2007_4043_raw', 'Hoa chuối', '{}', 'Banana, buds and flowers', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 29.0, 20.0, 1.5, 3.5, NULL, 2.0, NULL, 44.0, 0.9, NULL, 32.0, NULL, NULL, NULL, NULL, 170.0, 0.0, NULL, NULL, NULL, 5.0, 1.04, 0.03, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hoa chuối  Banana, buds and flowers', 'hoa chuoi  banana, buds and flowers'),
+('fao_vn_2007_4044_raw', 'Hoa lý', '{}', 'Daylily, lemon flowers, Pergularia, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 3.0, 23.0, 2.9, 2.8, NULL, 3.0, NULL, 52.0, 1.2, NULL, 53.0, NULL, NULL, NULL, NULL, 585.0, 0.0, NULL, NULL, NULL, 48.0, 0.19, 0.13, 1.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hoa lý  Daylily, lemon flowers, Pergularia, raw', 'hoa ly  daylily, lemon flowers, pergularia, raw'),
+('fao_vn_2007_4045_raw', 'Khế', '{}', 'Carambola; Star fruit', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 13.0, 16.0, 0.6, 2.8, 0.3, 2.6, 2.0, 10.0, 0.9, 10.0, 8.0, 133.0, 0.12, 137.0, 0.04, 25.0, 0.0, 0.0, 0.15, 0.0, 30.0, 0.05, 0.04, 0.4, 0.391, 0.017, 0.0, 0.0, NULL, '2026-02-26', 'Khế  Carambola; Star fruit', 'khe  carambola; star fruit'),
+('fao_vn_2007_4046_raw', 'Lá lốt', '{}', 'Lolot', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 39.0, 4.3, 5.4, NULL, 2.5, 15.0, 260.0, 4.1, 98.0, 980.0, 598.0, NULL, NULL, NULL, 4050.0, 0.0, NULL, NULL, NULL, 34.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lá lốt  Lolot', 'la lot  lolot'),
+('fao_vn_2007_4047_raw', 'Lá me', '{}', 'Tamarind, leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 46.0, 7.5, 4.0, NULL, NULL, NULL, 319.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lá me  Tamarind, leaves', 'la me  tamarind, leaves'),
+('fao_vn_2007_4048_raw', 'Lá mơ lông', '{}', 'Wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 27.0, 3.9, 2.9, NULL, 5.1, NULL, 211.0, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, 330.0, 0.0, NULL, NULL, NULL, 75.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lá mơ lông  Wild plant', 'la mo long  wild plant'),
+('fao_vn_2007_4049_raw', 'Lá sắn tươi', '{}', 'Cassava leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 78.0, 7.0, 12.6, NULL, 4.3, NULL, 200.0, 1.9, NULL, 27.0, NULL, NULL, NULL, NULL, 8280.0, 0.0, NULL, NULL, NULL, 295.0, 0.25, 0.66, 2.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lá sắn tươi  Cassava leaves', 'la san tuoi  cassava leaves'),
+('fao_vn_2007_4050_raw', 'Măng chua', '{}', 'Bamboo shoot, unspecified', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 24.0, 11.0, 1.4, 1.4, NULL, 4.1, 9.0, 18.0, 0.9, 88.0, 29.0, 486.0, 1.1, 190.0, NULL, 15.0, 0.0, NULL, NULL, NULL, 9.0, 0.11, 0.09, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Măng chua  Bamboo shoot, unspecified', 'mang chua  bamboo shoot, unspecified'),
+('fao_vn_2007_4051_raw', 'Măng khô', '{}', 'Dried bamboo shoots', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 157.0, 13.0, 21.5, 2.1, 36.0, NULL, 100.0, 5.0, NULL, 200.0, NULL, NULL, NULL, NULL, 20.0, 0.0, NULL, NULL, NULL, 1.0, 0.11, 0.14, 1.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Măng khô  Dried bamboo shoots', 'mang kho  dried bamboo shoots'),
+('fao_vn_2007_4052_raw', 'Măng tây', '{}', 'Asparagus, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 50.0, 14.0, 2.2, 1.1, 0.1, 2.3, 2.0, 21.0, 0.9, 14.0, 6.0, 202.0, 0.54, 189.0, 0.16, 449.0, 0.0, NULL, 1.13, 41.6, 10.0, 0.16, 0.03, 3.0, 0.274, 0.091, 0.0, 0.0, 0.2, '2026-02-26', 'Măng tây  Asparagus, white', 'mang tay  asparagus, white'),
+('fao_vn_2007_4053_raw', 'Măng tre', '{}', 'Bamboo shoots, spring variety', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 50.0, 15.0, 1.7, 1.4, 0.3, 4.1, 4.0, 22.0, 1.0, 3.0, 58.0, 533.0, 1.1, 190.0, 0.26, 12.0, 0.0, NULL, 1.0, 0.0, 1.0, 0.08, 0.08, 0.6, 0.161, 0.24, 0.0, 0.0, NULL, '2026-02-26', 'Măng tre  Bamboo shoots, spring variety', 'mang tre  bamboo shoots, spring variety'),
+('fao_vn_2007_4054_raw', 'Mướp', '{}', 'Gourd, sponge gourd', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.8, 17.0, 0.9, 2.8, 0.2, 0.5, 3.0, 28.0, 0.8, 14.0, 45.0, 139.0, 0.07, 35.0, 0.09, 160.0, 0.0, NULL, NULL, NULL, 8.0, 0.04, 0.06, 0.5, 0.218, 0.043, 0.0, 0.0, NULL, '2026-02-26', 'Mướp  Gourd, sponge gourd', 'muop  gourd, sponge gourd'),
+('fao_vn_2007_4055_raw', 'Mướp đắng', '{}', 'Balsam-pear, balsam-apple, bitter melon, bitter gourd', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 16.0, 0.9, 2.8, 0.2, 1.1, 5.0, 18.0, 0.6, 17.0, 29.0, 296.0, 0.8, 34.0, 0.09, 190.0, 0.0, NULL, NULL, NULL, 22.0, 0.07, 0.04, 0.3, 0.212, 0.043, 0.0, 0.0, NULL, '2026-02-26', 'Mướp đắng  Balsam-pear, balsam-apple, bitter melon, bitter gourd', 'muop dang  balsam-pear, balsam-apple, bitter melon, bitter gourd'),
+('fao_vn_2007_4056_raw', 'Mướp Nhật bản', '{}', 'Gourd, sponge gourd, Japanese', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 10.0, 0.8, 1.8, 0.0, 1.4, NULL, 30.0, 0.3, NULL, 22.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mướp Nhật bản  Gourd, sponge gourd, Japanese', 'muop nhat ban  gourd, sponge gourd, japanese'),
+('fao_vn_2007_4057_raw', 'Ngải cứu', '{}', 'Mugwort, common sagebrush', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 31.0, 25.0, 3.8, 2.4, 0.0, 2.0, NULL, 136.0, 3.1, NULL, 45.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ngải cứu  Mugwort, common sagebrush', 'ngai cuu  mugwort, common sagebrush'),
+('fao_vn_2007_4058_raw', 'Ngô bao tử', '{}', 'Corn, small variety immature, baby corn', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 40.0, 2.2, 7.4, 0.2, 0.4, NULL, 5.0, 0.9, NULL, 52.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 34.0, 0.09, 0.2, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ngô bao tử  Corn, small variety immature, baby corn', 'ngo bao tu  corn, small variety immature, baby corn'),
+('fao_vn_2007_4059_raw', 'Ngó sen', '{}', 'Lotus, stem underground', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 11.0, 61.0, 1.0, 13.9, 0.1, 1.2, 40.0, 19.0, 0.5, 23.0, 51.0, 556.0, 0.39, 257.0, 0.26, 10.0, 0.0, NULL, NULL, NULL, 25.0, 0.11, 0.04, 0.4, 0.377, 0.258, 0.0, 0.0, NULL, '2026-02-26', 'Ngó sen  Lotus, stem underground', 'ngo sen  lotus, stem underground'),
+('fao_vn_2007_4060_raw', 'Nụ mướp', '{}', 'Sponge gourd, rag, young flower', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.0, 30.0, 4.9, 2.5, NULL, 1.5, NULL, 140.0, 1.2, NULL, 80.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nụ mướp  Sponge gourd, rag, young flower', 'nu muop  sponge gourd, rag, young flower'),
+('fao_vn_2007_4061_raw', 'ớt đỏ to', '{}', 'Chili pepper, peppers red', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 18.0, 23.0, 1.0, 4.0, 0.3, 2.0, 2.0, 7.0, 0.43, 12.0, 26.0, 211.0, 0.25, 17.0, 0.11, 1624.0, 0.0, 0.0, 1.58, 4.9, 190.0, 0.05, 0.09, 1.0, 0.317, 0.291, 0.0, NULL, NULL, '2026-02-26', 'ớt đỏ to  Chili pepper, peppers red', 'ot do to  chili pepper, peppers red'),
+('fao_vn_2007_4062_raw', 'ớt vàng to', '{}', 'Peppers, yellow', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 29.0, 1.3, 5.5, 0.2, 1.4, 15.0, 86.0, 3.6, 12.0, 120.0, 275.0, 0.32, 140.0, 1.1, 120.0, 0.0, NULL, NULL, NULL, 250.0, 0.37, 0.51, 2.5, 0.168, 0.168, 0.0, 0.0, NULL, '2026-02-26', 'ớt vàng to  Peppers, yellow', 'ot vang to  peppers, yellow'),
+('fao_vn_2007_4063_raw', 'ớt xanh to', '{}', 'Peppers, green', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 25.0, 1.3, 4.5, 0.2, 1.5, 3.0, 6.0, 0.8, 10.0, 25.0, 175.0, 0.13, 66.0, 0.12, 198.0, 0.0, NULL, NULL, NULL, 103.0, 0.04, 0.05, 0.9, 0.099, 0.224, 0.0, 0.0, NULL, '2026-02-26', 'ớt xanh to  Peppers, green', 'ot xanh to  peppers, green'),
+('fao_vn_2007_4064_raw', 'Quả dọc', '{}', '', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 36.0, 19.0, 0.8, 3.9, 0.0, NULL, NULL, 21.0, NULL, NULL, 5.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả dọc  ', 'qua doc  '),
+('fao_vn_2007_4065_raw', 'Quả me chua', '{}', 'Tamarind fruit, pulp raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 15.0, 27.0, 1.9, 4.8, NULL, 2.0, NULL, 130.0, 0.4, NULL, 46.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 12.0, 0.15, 0.05, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả me chua  Tamarind fruit, pulp raw', 'qua me chua  tamarind fruit, pulp raw'),
+('fao_vn_2007_4066_raw', 'Rau bí', '{}', 'Pumpkin leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 23.4, 18.0, 2.7, 1.7, NULL, 1.7, 17.0, 100.0, 2.1, 18.0, 26.0, 390.0, 0.45, 90.0, 0.29, 1940.0, 0.0, NULL, NULL, NULL, 11.0, 0.09, 0.13, 0.9, 0.042, 0.207, 0.0, 0.0, NULL, '2026-02-26', 'Rau bí  Pumpkin leaves', 'rau bi  pumpkin leaves'),
+('fao_vn_2007_4067_raw', 'Rau câu khô', '{}', 'Dried seaweed', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 198.0, 11.2, 35.8, 1.1, 20.8, 102.0, 378.0, 8.8, 770.0, 124.0, 1125.0, 5.8, 610.0, 4.3, NULL, 0.0, NULL, 5.0, 24.4, 0.0, 0.01, 0.22, 0.2, 3.018, 0.303, 0.0, 0.0, NULL, '2026-02-26', 'Rau câu khô  Dried seaweed', 'rau cau kho  dried seaweed'),
+('fao_vn_2007_4068_raw', 'Rau câu tươi', '{}', 'Seaweed fresh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 4.0, 25.0, 1.9, 4.1, 0.1, 5.0, 9.0, 85.0, 0.9, 67.0, 34.0, 226.0, 0.58, 61.0, 0.37, NULL, 0.0, NULL, 0.87, 2.3, 0.0, 0.01, 0.03, 0.5, 0.302, 0.032, 0.0, 0.0, NULL, '2026-02-26', 'Rau câu tươi  Seaweed fresh', 'rau cau tuoi  seaweed fresh'),
+('fao_vn_2007_4069_raw', 'Rau diếp', '{}', 'Lettuce garden', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 14.0, 1.2, 1.8, 0.2, 0.5, 14.0, 38.0, 1.1, 18.0, 37.0, 254.0, 0.4, 180.0, 0.8, 4443.0, 0.0, NULL, 0.29, 173.6, 30.0, 0.3, 0.09, 0.2, 0.134, 0.09, 0.0, 0.0, NULL, '2026-02-26', 'Rau diếp  Lettuce garden', 'rau diep  lettuce garden'),
+('fao_vn_2007_4070_raw', 'Rau đay', '{}', 'Jute potherb', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 25.0, 2.8, 3.0, 0.3, 1.5, 16.0, 182.0, 7.7, 79.0, 57.0, 417.0, 0.79, 255.0, 0.12, 4560.0, 0.0, NULL, NULL, NULL, 77.0, 0.13, 0.26, 1.1, 0.072, 0.6, 0.0, 0.0, NULL, '2026-02-26', 'Rau đay  Jute potherb', 'rau day  jute potherb'),
+('fao_vn_2007_4071_raw', 'Rau giấp cá, diếp cá', '{}', 'Wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 22.0, 2.9, 2.7, NULL, 1.8, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 620.0, 0.0, NULL, NULL, NULL, 68.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau giấp cá, diếp cá  Wild plant', 'rau giap ca, diep ca  wild plant'),
+('fao_vn_2007_4072_raw', 'Rau giền cơm', '{}', 'Amaranth, spineless', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 21.0, 3.4, 1.1, 0.3, 1.6, 20.0, 341.0, 4.1, 55.0, 76.0, 611.0, 0.9, 162.0, 0.89, 5300.0, 0.0, NULL, NULL, 1140.0, 63.0, 0.36, 1.3, 1.3, 0.064, 0.192, 0.0, 0.0, NULL, '2026-02-26', 'Rau giền cơm  Amaranth, spineless', 'rau gien com  amaranth, spineless'),
+('fao_vn_2007_4073_raw', 'Rau giền đỏ', '{}', 'Amaranth, sp. Red', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 38.0, 41.0, 3.3, 6.2, 0.3, 1.6, 56.0, 288.0, 5.4, 164.0, 123.0, 476.0, 0.5, 200.0, 1.85, 4080.0, 0.0, NULL, NULL, NULL, 89.0, 0.08, 1.16, 1.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau giền đỏ  Amaranth, sp. Red', 'rau gien do  amaranth, sp. red'),
+('fao_vn_2007_4074_raw', 'Rau giền trắng', '{}', 'Amaranth, sp White', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 14.0, 42.0, 3.2, 6.3, 0.4, 1.5, NULL, 288.0, 6.1, NULL, 80.0, NULL, NULL, NULL, NULL, 2855.0, 0.0, NULL, NULL, NULL, 27.0, 0.08, 0.28, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau giền trắng  Amaranth, sp White', 'rau gien trang  amaranth, sp white'),
+('fao_vn_2007_4075_raw', 'Rau húng', '{}', 'Basil sweet leaves, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 20.0, 2.2, 1.5, 0.6, 3.5, 91.0, 202.0, 4.8, 73.0, 83.0, 148.0, 0.91, 220.0, 1.86, 3142.0, 0.0, NULL, NULL, 414.8, 27.0, 0.08, 0.35, 0.8, 0.238, 0.129, 0.0, 0.0, NULL, '2026-02-26', 'Rau húng  Basil sweet leaves, raw', 'rau hung  basil sweet leaves, raw'),
+('fao_vn_2007_4076_raw', 'Rau khoai lang', '{}', 'Sweet potato, leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 23.0, 2.6, 2.5, 0.3, 1.4, 19.0, 48.0, 2.7, 60.0, 54.0, 498.0, 0.29, 37.0, 0.26, 1830.0, 0.0, NULL, NULL, NULL, 11.0, 0.13, 0.26, 0.9, 0.225, 0.19, 0.0, 0.0, NULL, '2026-02-26', 'Rau khoai lang  Sweet potato, leaves', 'rau khoai lang  sweet potato, leaves'),
+('fao_vn_2007_4077_raw', 'Rau kinh giới', '{}', 'Sweet marjoram', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 16.0, 22.0, 2.7, 2.8, NULL, 3.6, 2.0, 246.0, 1.0, 89.0, 15.0, 211.0, 0.52, 250.0, NULL, 4360.0, 0.0, NULL, NULL, NULL, 110.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau kinh giới  Sweet marjoram', 'rau kinh gioi  sweet marjoram'),
+('fao_vn_2007_4078_raw', 'Rau má rừng', '{}', 'Wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 25.0, 3.1, 3.1, NULL, 1.5, NULL, 172.0, 0.2, NULL, 24.0, NULL, NULL, NULL, NULL, 260.0, 0.0, NULL, NULL, NULL, 20.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau má rừng  Wild plant', 'rau ma rung  wild plant'),
+('fao_vn_2007_4079_raw', 'Rau má, má mơ', '{}', 'Wort, India penny', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 20.0, 3.2, 1.8, NULL, 4.5, NULL, 229.0, 3.1, NULL, 2.0, NULL, NULL, NULL, NULL, 1300.0, 0.0, NULL, NULL, NULL, 37.0, 0.15, 0.14, 1.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau má, má mơ  Wort, India penny', 'rau ma, ma mo  wort, india penny'),
+('fao_vn_2007_4080_raw', 'Rau mồng tơi', '{}', 'Malabar night shade, Vinespinach, Ceylon spinach', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 17.0, 14.0, 2.0, 1.4, NULL, 2.5, 38.0, 176.0, 1.6, 94.0, 34.0, 391.0, 0.54, 20.0, 0.45, 1920.0, 0.0, NULL, NULL, NULL, 72.0, 0.06, 0.17, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau mồng tơi  Malabar night shade, Vinespinach, Ceylon spinach', 'rau mong toi  malabar night shade, vinespinach, ceylon spinach'),
+('fao_vn_2007_4081_raw', 'Rau mùi', '{}', 'Coriander', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 15.0, 16.0, 2.6, 0.2, 0.5, 1.8, 46.0, 133.0, 4.5, 26.0, 80.0, 521.0, 0.5, 225.0, 0.43, 3930.0, 0.0, NULL, 2.5, 310.0, 140.0, 0.11, 0.15, 1.3, 0.57, 0.149, 0.0, 0.0, NULL, '2026-02-26', 'Rau mùi  Coriander', 'rau mui  coriander'),
+('fao_vn_2007_4082_raw', 'Rau mùi tàu', '{}', 'Parsley, curley', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 25.0, 2.1, 2.4, 0.8, 1.6, 39.0, 20.0, 2.9, 35.0, 30.0, 237.0, 0.41, 210.0, 0.36, 5040.0, 0.0, NULL, 0.75, 1640.0, 177.0, 0.11, 0.28, 1.4, 0.4, 0.09, 0.0, 0.0, NULL, '2026-02-26', 'Rau mùi tàu  Parsley, curley', 'rau mui tau  parsley, curley'),
+('fao_vn_2007_4083_raw', 'Rau muống', '{}', 'Swamp cabbage, water spinach, water convol', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 37.5, 25.0, 3.2, 2.1, 0.4, 1.0, 37.0, 100.0, 1.4, 15.0, 37.0, 331.0, 0.35, 100.0, 0.6, 5597.0, 0.0, NULL, 2.03, 482.9, 23.0, 0.1, 0.09, 0.7, 0.065, 0.195, 0.0, 0.0, 1.6, '2026-02-26', 'Rau muống  Swamp cabbage, water spinach, water convol', 'rau muong  swamp cabbage, water spinach, water convol'),
+('fao_vn_2007_4084_raw', 'Rau muống khô', '{}', 'Water spinach, dried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 245.0, 34.2, 23.0, 1.8, 12.0, NULL, 880.0, 15.2, NULL, 300.0, NULL, NULL, NULL, NULL, 12996.0, 0.0, NULL, NULL, NULL, 10.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau muống khô  Water spinach, dried', 'rau muong kho  water spinach, dried'),
+('fao_vn_2007_4085_raw', 'Rau ngổ', '{}', 'Limnophila aromatic', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 29.0, 15.0, 1.5, 2.3, NULL, 2.1, 5.0, 84.0, 2.2, NULL, 18.0, 222.0, 1.48, 480.0, 1.49, 2325.0, 0.0, NULL, NULL, NULL, 78.0, 0.11, 0.15, 1.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau ngổ  Limnophila aromatic', 'rau ngo  limnophila aromatic'),
+('fao_vn_2007_4086_raw', 'Rau ngót', '{}', 'Sauropus, sp. leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 23.0, 35.0, 5.3, 3.4, NULL, 2.5, 25.0, 169.0, 2.7, 123.0, 65.0, 457.0, 0.94, 190.0, 2.4, 6650.0, 0.0, NULL, NULL, NULL, 185.0, 0.07, 0.39, 2.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau ngót  Sauropus, sp. leaves', 'rau ngot  sauropus, sp. leaves'),
+('fao_vn_2007_4087_raw', 'Rau ngót khô', '{}', 'Sauropus, dried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 239.0, 32.2, 21.8, 2.6, 15.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 1560.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau ngót khô  Sauropus, dried', 'rau ngot kho  sauropus, dried'),
+('fao_vn_2007_4088_raw', 'Rau răm', '{}', 'Polygonum odoratum', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 30.0, 4.7, 2.8, NULL, 3.8, 5.0, 316.0, 2.2, 28.0, 55.0, 216.0, 1.05, 390.0, 3.63, NULL, 0.0, NULL, NULL, NULL, 57.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau răm  Polygonum odoratum', 'rau ram  polygonum odoratum'),
+('fao_vn_2007_4089_raw', 'Rau rút', '{}', 'Neptunia, dismanthus', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 55.0, 28.0, 5.1, 1.8, NULL, 1.9, NULL, 180.0, NULL, NULL, 59.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau rút  Neptunia, dismanthus', 'rau rut  neptunia, dismanthus'),
+('fao_vn_2007_4090_raw', 'Rau sà lách', '{}', 'Lettuce, garden asparagus', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 17.0, 1.5, 1.8, 0.4, 0.5, 59.0, 77.0, 0.9, 18.0, 34.0, 333.0, 0.4, 220.0, 0.75, 1050.0, 0.0, NULL, NULL, NULL, 15.0, 0.14, 0.12, 0.7, NULL, NULL, NULL, NULL, 0.7, '2026-02-26', 'Rau sà lách  Lettuce, garden asparagus', 'rau sa lach  lettuce, garden asparagus'),
+('fao_vn_2007_4091_raw', 'Rau sam', '{}', 'Purslane, common', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 18.0, 1.4, 3.0, NULL, 0.7, NULL, 85.0, 1.5, NULL, 56.0, NULL, NULL, NULL, NULL, 160.0, 0.0, NULL, NULL, NULL, 26.0, 0.03, 0.11, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau sam  Purslane, common', 'rau sam  purslane, common'),
+('fao_vn_2007_4092_raw', 'Rau sắng (chùa Hương)', '{}', 'Perfume pagoda wild plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 40.0, 48.0, 6.5, 5.5, NULL, 3.4, NULL, 110.0, NULL, NULL, 80.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 114.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau sắng (chùa Hương)  Perfume pagoda wild plant', 'rau sang (chua huong)  perfume pagoda wild plant'),
+('fao_vn_2007_4093_raw', 'Rau tàu bay', '{}', 'Gynura crepidioides', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 18.0, 2.5, 1.9, NULL, 1.6, NULL, 81.0, NULL, NULL, 25.0, NULL, NULL, NULL, NULL, 1700.0, 0.0, NULL, NULL, NULL, 10.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau tàu bay  Gynura crepidioides', 'rau tau bay  gynura crepidioides'),
+('fao_vn_2007_4094_raw', 'Rau thơm', '{}', 'Mint leaves', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 18.0, 2.0, 2.4, NULL, 3.0, 6.0, 170.0, 3.8, NULL, 49.0, 217.0, 0.56, 740.0, 0.88, 3560.0, 0.0, NULL, NULL, NULL, 41.0, 0.14, 0.15, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rau thơm  Mint leaves', 'rau thom  mint leaves'),
+('fao_vn_2007_4095_raw', 'Sấu xanh', '{}', 'Dracontomelum fruit, unripe, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 35.0, 19.0, 1.8, 3.0, NULL, NULL, NULL, 135.0, NULL, NULL, 6.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Sấu xanh  Dracontomelum fruit, unripe, raw', 'sau xanh  dracontomelum fruit, unripe, raw'),
+('fao_vn_2007_4096_raw', 'Su hào', '{}', 'Kohlrabi', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 22.4, 37.0, 2.8, 6.2, 0.1, 1.7, 53.0, 46.0, 0.6, 19.0, 50.0, 321.0, 0.45, 310.0, 0.62, 22.0, 0.0, NULL, 0.48, 0.1, 40.0, 0.06, 0.05, 0.2, 0.165, 0.15, 0.0, 0.0, NULL, '2026-02-26', 'Su hào  Kohlrabi', 'su hao  kohlrabi'),
+('fao_vn_2007_4097_raw', 'Su hào khô', '{}', 'Dried kohlrabi', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 261.0, 20.0, 42.1, 1.4, 12.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Su hào khô  Dried kohlrabi', 'su hao kho  dried kohlrabi'),
+('fao_vn_2007_4098_raw', 'Su su, quả', '{}', 'Chayote, fruit raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 19.0, 0.8, 3.6, 0.1, 1.0, 2.0, 17.0, 0.4, 12.0, 14.0, 125.0, 0.74, 123.0, 0.19, 0.0, 0.0, NULL, 0.12, 4.6, 4.0, 0.01, 0.02, 0.4, 0.249, 0.076, 0.0, 0.0, NULL, '2026-02-26', 'Su su, quả  Chayote, fruit raw', 'su su, qua  chayote, fruit raw'),
+('fao_vn_2007_4099_raw', 'Súp lơ trắng', '{}', 'Cauliflower, white', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 40.0, 30.0, 2.5, 4.8, 0.1, 0.9, 20.0, 26.0, 1.4, 22.0, 51.0, 349.0, 0.2, 140.0, 0.2, 8.0, 0.0, NULL, 0.08, 16.0, 70.0, 0.11, 0.1, 0.6, 0.652, 0.222, 0.0, 0.0, 1.5, '2026-02-26', 'Súp lơ trắng  Cauliflower, white', 'sup lo trang  cauliflower, white'),
+('fao_vn_2007_4100_raw', 'Súp lơ xanh', '{}', 'Cauliflower, green', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 39.0, 26.0, 3.0, 2.9, 0.3, 3.2, 23.0, 33.0, 0.73, 20.0, 62.0, 300.0, 0.64, 41.0, 0.25, 93.0, 0.0, NULL, 0.04, 20.2, 88.0, 0.08, 0.1, 0.7, 0.696, 0.222, 0.0, 0.0, NULL, '2026-02-26', 'Súp lơ xanh  Cauliflower, green', 'sup lo xanh  cauliflower, green'),
+('fao_vn_2007_4101_raw', 'Thìa là', '{}', 'Dill', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 28.0, 2.6, 1.8, 1.1, 5.0, 48.0, 200.0, 1.2, 55.0, 12.0, 361.0, 0.5, 220.0, 0.55, 2850.0, 0.0, NULL, NULL, NULL, 63.0, 0.05, 0.12, 0.7, 0.397, 0.185, 0.0, 0.0, NULL, '2026-02-26', 'Thìa là  Dill', 'thia la  dill'),
+('fao_vn_2007_4102_raw', 'Tía tô', '{}', 'Balm-mint, garden- balm', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 25.0, 2.9, 3.4, NULL, 3.6, 3.0, 190.0, 3.2, 112.0, 18.0, 284.0, 0.86, 460.0, 0.73, 5520.0, 0.0, NULL, NULL, NULL, 13.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tía tô  Balm-mint, garden- balm', 'tia to  balm-mint, garden- balm'),
+('fao_vn_2007_4103_raw', 'Tỏi ta', '{}', 'Garlic bulbs', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 121.0, 6.0, 23.0, 0.5, 1.5, 18.0, 24.0, 1.5, 8.0, 181.0, 373.0, 0.9, 299.0, 1.3, 0.0, 0.0, NULL, 0.01, 1.4, 10.0, 0.24, 0.03, 0.9, 0.596, 1.235, 0.0, 0.0, NULL, '2026-02-26', 'Tỏi ta  Garlic bulbs', 'toi ta  garlic bulbs'),
+('fao_vn_2007_4104_raw', 'Tỏi tây (cả lá)', '{}', 'Chinese Leek, Onion fragrant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 20.0, 29.0, 1.4, 5.9, NULL, 1.5, NULL, 80.0, 2.0, NULL, 58.0, NULL, NULL, NULL, NULL, 10.0, 0.0, NULL, NULL, NULL, 20.0, 0.06, 0.04, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tỏi tây (cả lá)  Chinese Leek, Onion fragrant', 'toi tay (ca la)  chinese leek, onion fragrant'),
+('fao_vn_2007_4105_raw', 'Trám đen chín', '{}', 'Variety of canarium', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 50.0, 114.0, 2.5, 3.6, 10.0, 4.9, NULL, 140.0, NULL, NULL, 30.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 14.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Trám đen chín  Variety of canarium', 'tram den chin  variety of canarium'),
+('fao_vn_2007_4106_raw', 'Trám xanh sống, trám trắng', '{}', 'Chinese olive', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 34.0, 37.0, 1.2, 4.4, 1.6, 4.9, NULL, 136.0, NULL, NULL, 9.0, NULL, NULL, NULL, NULL, 330.0, 0.0, NULL, NULL, NULL, 20.0, 0.02, 0.11, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Trám xanh sống, trám trắng  Chinese olive', 'tram xanh song, tram trang  chinese olive'),
+('fao_vn_2007_4107_raw', 'Xương sông', '{}', 'Edible herbaceous plant', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 15.0, 2.2, 1.5, NULL, 3.2, 12.0, 112.0, 4.0, 50.0, 17.0, 424.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 4.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Xương sông  Edible herbaceous plant', 'xuong song  edible herbaceous plant'),
+('fao_vn_2007_4108_raw', 'Cà chua muối', '{}', 'Tomato, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 6.0, 0.6, 1.0, NULL, 0.8, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cà chua muối  Tomato, pickled', 'ca chua muoi  tomato, pickled'),
+('fao_vn_2007_4109_raw', 'Cà muối nén', '{}', 'Eggplant, garden, brinjan; aubergine, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 13.0, 1.3, 2.0, NULL, 1.7, NULL, 15.0, 0.8, NULL, 18.0, NULL, NULL, NULL, NULL, 40.0, 0.0, NULL, NULL, NULL, NULL, 0.05, 0.06, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cà muối nén  Eggplant, garden, brinjan; aubergine, pickled', 'ca muoi nen  eggplant, garden, brinjan; aubergine, pickled'),
+('fao_vn_2007_4110_raw', 'Cà muối sổi', '{}', 'Eggplant, garden, brinjan; aubergine, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 16.0, 1.5, 2.5, NULL, 1.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cà muối sổi  Eggplant, garden, brinjan; aubergine, pickled', 'ca muoi soi  eggplant, garden, brinjan; aubergine, pickled'),
+('fao_vn_2007_4111_raw', 'Dưa cải bắp', '{}', 'Cabbage Chinese, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 18.0, 1.2, 3.3, NULL, 1.6, NULL, 51.0, 0.3, NULL, 34.0, NULL, NULL, NULL, NULL, 20.0, 0.0, NULL, NULL, NULL, 20.0, 0.01, 0.06, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dưa cải bắp  Cabbage Chinese, pickled', 'dua cai bap  cabbage chinese, pickled'),
+('fao_vn_2007_4112_raw', 'Dưa cải bẹ', '{}', 'Mustard green, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 17.0, 1.8, 2.4, NULL, 2.1, NULL, 100.0, 3.0, NULL, 21.0, NULL, NULL, NULL, NULL, 745.0, 0.0, NULL, NULL, NULL, 3.0, 0.03, 0.12, 0.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dưa cải bẹ  Mustard green, pickled', 'dua cai be  mustard green, pickled'),
+('fao_vn_2007_4113_raw', 'Dưa cải sen', '{}', 'Rape bird, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 10.0, 1.1, 1.3, NULL, 1.8, NULL, 63.0, NULL, NULL, 41.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dưa cải sen  Rape bird, pickled', 'dua cai sen  rape bird, pickled'),
+('fao_vn_2007_4114_raw', 'Dưa chuột muối', '{}', 'Cucumber, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 5.0, 13.0, 0.8, 2.5, NULL, 0.7, 1208.0, 25.0, 1.2, 4.0, 20.0, 23.0, 0.02, 85.0, 0.01, 100.0, 0.0, NULL, 0.06, 13.0, 4.0, 0.01, 0.02, 0.2, 0.038, 0.009, 0.0, 0.0, NULL, '2026-02-26', 'Dưa chuột muối  Cucumber, pickled', 'dua chuot muoi  cucumber, pickled'),
+('fao_vn_2007_4115_raw', 'Dưa giá (đậu xanh)', '{}', 'Mung bean sprouts, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 39.0, 5.0, 4.8, NULL, 2.0, NULL, 22.0, 1.1, NULL, 33.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dưa giá (đậu xanh)  Mung bean sprouts, pickled', 'dua gia (dau xanh)  mung bean sprouts, pickled'),
+('fao_vn_2007_4116_raw', 'Hành củ muối', '{}', 'Onion, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 30.0, 22.0, 1.4, 4.0, NULL, 0.7, NULL, 12.0, 1.3, NULL, 5.0, NULL, NULL, NULL, NULL, 18.0, 0.0, NULL, NULL, NULL, NULL, 0.02, 0.03, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hành củ muối  Onion, pickled', 'hanh cu muoi  onion, pickled'),
+('fao_vn_2007_4117_raw', 'Kiệu muối', '{}', 'Onion shallot, scallion, pickled', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 30.0, 24.0, 1.3, 4.7, NULL, 1.2, NULL, 50.0, 1.2, NULL, 35.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 12.0, 0.05, 0.1, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kiệu muối  Onion shallot, scallion, pickled', 'kieu muoi  onion shallot, scallion, pickled'),
+('fao_vn_2007_4118_raw', 'Nhút (muối từ mít non, ngọn đậu xanh non...)', '{}', 'Mix pickled from young jack fruit', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 16.0, 2.5, 1.5, NULL, 2.3, NULL, 204.0, 9.0, NULL, 33.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nhút (muối từ mít non, ngọn đậu xanh non...)  Mix pickled from young jack fruit', 'nhut (muoi tu mit non, ngon dau xanh non...)  mix pickled from young jack fruit'),
+('fao_vn_2007_4119_raw', 'Men bia khô', '{}', 'Brewer''s yeast, fried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 340.0, 52.5, 25.4, 3.2, 6.6, NULL, 44.0, 16.1, NULL, 1291.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 2.33, 5.44, 36.7, NULL, NULL, NULL, NULL, 200.0, '2026-02-26', 'Men bia khô  Brewer''s yeast, fried', 'men bia kho  brewer''s yeast, fried'),
+('fao_vn_2007_4120_raw', 'Men bia tươi', '{}', 'Baker''s yeast, fresh', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 0.0, 95.0, 16.2, 4.5, 1.3, 2.0, NULL, 30.0, 5.0, NULL, 272.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.77, 1.06, 8.3, NULL, NULL, NULL, NULL, 60.0, '2026-02-26', 'Men bia tươi  Baker''s yeast, fresh', 'men bia tuoi  baker''s yeast, fresh'),
+('fao_vn_2007_4121_raw', 'Mộc nhĩ', '{}', 'Jew''s ear, Juda''s ear, dried, Wood-ear, Tender variety', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 304.0, 10.6, 65.0, 0.2, 7.0, 70.0, 357.0, 56.1, 146.0, 201.0, 708.0, 7.52, 5070.0, 1.15, 20.0, 0.0, NULL, NULL, NULL, 1.0, 0.15, 0.55, 2.7, 21.477, 0.95, 0.0, 0.0, NULL, '2026-02-26', 'Mộc nhĩ  Jew''s ear, Juda''s ear, dried, Wood-ear, Tender variety', 'moc nhi  jew''s ear, juda''s ear, dried, wood-ear, tender variety'),
+('fao_vn_2007_4122_raw', 'Nấm hương khô', '{}', 'Mushroom Chinese, dried', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 274.0, 36.0, 23.5, 4.0, 17.0, NULL, 184.0, 35.0, NULL, 606.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.16, 1.59, 23.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nấm hương khô  Mushroom Chinese, dried', 'nam huong kho  mushroom chinese, dried'),
+('fao_vn_2007_4123_raw', 'Nấm hương tươi', '{}', 'Mushroom, Chinese, raw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 39.0, 5.5, 3.1, 0.5, 3.0, NULL, 27.0, 5.2, NULL, 89.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nấm hương tươi  Mushroom, Chinese, raw', 'nam huong tuoi  mushroom, chinese, raw'),
+('fao_vn_2007_4124_raw', 'Nấm mỡ (Nấm tây)', '{}', 'Mushroom', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 32.0, 4.0, 3.4, 0.3, 1.1, 12.0, 28.0, 1.3, 14.0, 80.0, 322.0, 0.3, 1790.0, 0.1, 10.0, 0.0, NULL, NULL, NULL, 4.0, 0.11, 0.16, 3.3, NULL, NULL, NULL, NULL, 16.0, '2026-02-26', 'Nấm mỡ (Nấm tây)  Mushroom', 'nam mo (nam tay)  mushroom'),
+('fao_vn_2007_4125_raw', 'Nấm rơm', '{}', 'Mushroom, straw', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 10.0, 57.0, 3.6, 3.4, 3.2, 1.1, NULL, 28.0, 1.2, NULL, 80.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 2.0, 0.12, 0.33, 9.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nấm rơm  Mushroom, straw', 'nam rom  mushroom, straw'),
+('fao_vn_2007_4126_raw', 'Nấm thường tươi', '{}', 'Mushroom, common', 'Rau, quả, củ dùng làm rau', 'Vegetables', 'FAO_VN_2007', 'raw', 25.0, 34.0, 4.6, 2.2, 0.8, 3.5, 5.0, 2.0, 0.7, 9.0, 59.0, 318.0, 0.52, 318.0, 0.05, 10.0, 0.0, 1.9, 0.01, 0.0, 6.0, 0.25, 0.3, 5.2, 1.497, 0.104, 0.0, 0.0, NULL, '2026-02-26', 'Nấm thường tươi  Mushroom, common', 'nam thuong tuoi  mushroom, common'),
+('fao_vn_2007_5001_raw', 'Bưởi', '{}', 'Pomelo, Pummelo; Shaddock', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 35.0, 30.0, 0.2, 7.3, 0.0, 0.7, 3.0, 23.0, 0.5, 6.0, 18.0, 159.0, 0.16, 120.0, 0.02, 0.0, 0.0, NULL, NULL, NULL, 95.0, 0.04, 0.02, 0.3, NULL, 0.036, NULL, NULL, NULL, '2026-02-26', 'Bưởi  Pomelo, Pummelo; Shaddock', 'buoi  pomelo, pummelo; shaddock'),
+('fao_vn_2007_5002_raw', 'Cam', '{}', 'Orange', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 31.1, 38.0, 0.9, 8.3, 0.1, 1.4, 4.0, 34.0, 0.4, 10.0, 23.0, 108.0, 0.22, 140.0, 0.52, 71.0, 0.0, NULL, 0.18, 0.0, 40.0, 0.08, 0.03, 0.2, 0.25, 0.06, 0.0, 0.0, 0.89, '2026-02-26', 'Cam  Orange', 'cam  orange'),
+('fao_vn_2007_5003_raw', 'Chanh', '{}', 'Lemon', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 25.0, 24.0, 0.9, 4.5, 0.3, 1.3, 3.0, 40.0, 0.6, 12.0, 22.0, 145.0, 0.1, 260.0, NULL, NULL, 0.0, NULL, NULL, NULL, 77.0, 0.04, 0.01, 0.1, 0.232, 0.109, NULL, NULL, 0.5, '2026-02-26', 'Chanh  Lemon', 'chanh  lemon'),
+('fao_vn_2007_5004_raw', 'Chôm chôm', '{}', 'Rambutan', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 50.0, 72.0, 1.5, 16.4, 0.0, 1.3, NULL, 28.0, 0.5, NULL, 15.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Chôm chôm  Rambutan', 'chom chom  rambutan'),
+('fao_vn_2007_5005_raw', 'Chuối khô', '{}', 'Banana, dried', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 292.0, 5.0, 68.0, 0.0, 2.3, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Chuối khô  Banana, dried', 'chuoi kho  banana, dried'),
+('fao_vn_2007_5006_raw', 'Chuối tây', '{}', 'Banana', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 26.5, 56.0, 0.9, 12.4, 0.3, 2.6, 17.0, 12.0, 0.5, 27.0, 25.0, 286.0, 0.32, 150.0, 0.31, 26.0, 0.0, NULL, 0.1, 0.5, 6.0, 0.04, 0.07, 0.6, 0.334, 0.367, 0.0, 0.0, 5.5, '2026-02-26', 'Chuối tây  Banana', 'chuoi tay  banana'),
+('fao_vn_2007_5007_raw', 'Chuối tiêu', '{}', 'Banana, dwarf', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 35.0, 97.0, 1.5, 22.2, 0.2, 0.8, 19.0, 8.0, 0.6, 41.0, 28.0, 329.0, 0.37, 140.0, 0.12, 45.0, 0.0, NULL, NULL, NULL, 6.0, 0.04, 0.05, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Chuối tiêu  Banana, dwarf', 'chuoi tieu  banana, dwarf'),
+('fao_vn_2007_5008_raw', 'Dâu gia', '{}', 'Blackberry', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 56.0, 27.0, 0.6, 6.2, NULL, NULL, NULL, 20.0, 0.5, NULL, 12.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dâu gia  Blackberry', 'dau gia  blackberry'),
+('fao_vn_2007_5009_raw', 'Dâu tây', '{}', 'Strawberry', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 15.0, 43.0, 1.8, 8.1, 0.4, 4.0, 37.0, 22.0, 0.7, 17.0, 23.0, 292.0, NULL, NULL, NULL, 30.0, 0.0, NULL, NULL, NULL, 60.0, 0.03, 0.06, 0.3, NULL, NULL, NULL, NULL, 1.1, '2026-02-26', 'Dâu tây  Strawberry', 'dau tay  strawberry'),
+('fao_vn_2007_5010_raw', 'Dưa bở', '{}', 'Musk melon, Spanish melon, Cantaloupe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 10.0, 18.0, 0.5, 3.6, 0.2, 0.7, 0.0, 36.0, 0.3, 9.0, 36.0, 201.0, 0.17, 86.0, 0.05, 150.0, 0.0, NULL, 0.77, 2.2, 9.0, 0.04, 0.02, 0.4, 0.185, 0.025, 0.0, 0.0, NULL, '2026-02-26', 'Dưa bở  Musk melon, Spanish melon, Cantaloupe', 'dua bo  musk melon, spanish melon, cantaloupe'),
+('fao_vn_2007_5011_raw', 'Dưa hấu', '{}', 'Watermelon', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 48.0, 16.0, 1.2, 2.3, 0.2, 0.5, 5.0, 8.0, 1.0, 15.0, 13.0, 187.0, 0.11, 80.0, 0.03, 303.0, 0.0, NULL, 0.05, 0.1, 7.0, 0.04, 0.04, 0.2, 0.221, 0.045, 0.0, 0.0, NULL, '2026-02-26', 'Dưa hấu  Watermelon', 'dua hau  watermelon'),
+('fao_vn_2007_5012_raw', 'Dưa hồng', '{}', 'Honey dew melon', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 16.0, 17.0, 0.3, 3.7, 0.1, 0.4, 18.0, 27.0, 0.4, 10.0, 12.0, 228.0, 0.09, 24.0, 0.03, 30.0, 0.0, NULL, 0.02, 2.9, 7.0, 0.02, 0.02, 0.5, 0.155, 0.088, 0.0, 0.0, NULL, '2026-02-26', 'Dưa hồng  Honey dew melon', 'dua hong  honey dew melon'),
+('fao_vn_2007_5013_raw', 'Dưa lê', '{}', '', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 18.0, 18.0, 0.4, 4.2, 0.0, 0.5, NULL, 11.0, 0.6, NULL, 21.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dưa lê  ', 'dua le  '),
+('fao_vn_2007_5014_raw', 'Dứa ta', '{}', 'Pineapple, wild', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 40.0, 29.0, 0.8, 6.5, NULL, 0.8, 24.0, 15.0, 0.5, 22.0, 17.0, 157.0, 0.25, 320.0, 0.12, 40.0, 0.0, NULL, NULL, NULL, 24.0, 0.08, 0.02, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dứa ta  Pineapple, wild', 'dua ta  pineapple, wild'),
+('fao_vn_2007_5015_raw', 'Dứa tây', '{}', 'Pineapple', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 40.0, 38.0, 0.5, 8.8, 0.1, 0.4, 1.0, 32.0, 0.3, 12.0, 11.0, 115.0, 0.1, 99.0, 1.18, 34.0, 0.0, NULL, 0.02, 0.7, 26.0, 0.08, 0.03, 0.2, 0.205, 0.11, 0.0, 0.0, NULL, '2026-02-26', 'Dứa tây  Pineapple', 'dua tay  pineapple'),
+('fao_vn_2007_5016_raw', 'Đào', '{}', 'Peach', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.0, 31.0, 0.9, 6.3, 0.2, 1.5, 0.0, 20.0, 0.45, 9.0, 34.0, 190.0, 0.17, 68.0, 0.06, 162.0, 0.0, NULL, 0.73, 2.6, 10.0, 0.02, 0.05, 0.9, 0.153, 0.025, 0.0, 0.0, 0.2, '2026-02-26', 'Đào  Peach', 'dao  peach'),
+('fao_vn_2007_5017_raw', 'Đu đủ chín', '{}', 'Papaya, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.4, 36.0, 1.0, 7.6, 0.1, 0.6, 4.0, 40.0, 2.6, 8.0, 32.0, 221.0, 0.1, 40.0, 0.84, 276.0, 0.0, NULL, 0.73, 2.6, 54.0, 0.02, 0.02, 0.4, 0.218, 0.019, 0.0, 0.0, NULL, '2026-02-26', 'Đu đủ chín  Papaya, ripe', 'du du chin  papaya, ripe'),
+('fao_vn_2007_5018_raw', 'Gioi', '{}', 'Ohia; Malaya roseapple', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 19.0, 16.0, 0.4, 3.2, 0.3, 2.9, 0.0, 12.0, 0.5, 5.0, 6.0, 123.0, 0.06, 16.0, 0.03, NULL, 0.0, NULL, NULL, NULL, 30.0, 0.03, 0.02, 0.2, NULL, NULL, NULL, 0.0, NULL, '2026-02-26', 'Gioi  Ohia; Malaya roseapple', 'gioi  ohia; malaya roseapple'),
+('fao_vn_2007_5019_raw', 'Hồng bì', '{}', 'Wampee, Chinese; Wampi', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 46.0, 34.0, 1.4, 7.2, NULL, 2.4, NULL, 48.0, 0.4, NULL, 9.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 24.0, 0.02, 0.11, 3.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hồng bì  Wampee, Chinese; Wampi', 'hong bi  wampee, chinese; wampi'),
+('fao_vn_2007_5020_raw', 'Hồng đỏ', '{}', 'Persimmon kaki, soft type, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 8.8, 29.0, 0.7, 6.0, 0.2, 2.5, 4.0, 10.0, 0.2, 9.0, 19.0, 214.0, 0.19, 100.0, 1.12, 253.0, 0.0, NULL, 0.73, 2.6, 16.0, 0.01, 0.02, 0.2, NULL, 0.1, 0.0, 0.0, NULL, '2026-02-26', 'Hồng đỏ  Persimmon kaki, soft type, ripe', 'hong do  persimmon kaki, soft type, ripe'),
+('fao_vn_2007_5021_raw', 'Hồng ngâm', '{}', 'Persimmon kaki, Hard-type, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 17.7, 38.0, 0.9, 8.6, NULL, 2.5, 3.0, 10.0, 0.2, NULL, 19.0, 217.0, 0.22, 100.0, 1.22, 1615.0, 0.0, NULL, NULL, NULL, 16.0, 0.01, 0.02, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hồng ngâm  Persimmon kaki, Hard-type, ripe', 'hong ngam  persimmon kaki, hard-type, ripe'),
+('fao_vn_2007_5022_raw', 'Hồng xiêm', '{}', 'Sapodilla, sapota ponderosa', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 10.0, 48.0, 0.5, 10.0, 0.7, 2.5, 12.0, 52.0, 2.3, 12.0, 24.0, 193.0, 0.1, 86.0, NULL, NULL, 0.0, NULL, NULL, NULL, 8.0, 0.0, 0.02, 0.2, 0.252, 0.037, 0.0, 0.0, NULL, '2026-02-26', 'Hồng xiêm  Sapodilla, sapota ponderosa', 'hong xiem  sapodilla, sapota ponderosa'),
+('fao_vn_2007_5023_raw', 'Lê', '{}', 'Pear', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.0, 45.0, 0.7, 10.2, 0.2, 0.6, 5.0, 19.0, 2.3, 7.0, 16.0, 88.0, 0.13, 140.0, 0.05, 27.0, 0.0, NULL, 0.12, 4.5, 4.0, 0.02, 0.04, 0.1, 0.048, 0.028, 0.0, 0.0, 0.1, '2026-02-26', 'Lê  Pear', 'le  pear'),
+('fao_vn_2007_5024_raw', 'Lựu', '{}', 'Pome granate', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 85.0, 70.0, 0.6, 16.2, 0.3, 2.5, 3.0, 13.0, 0.7, 3.0, 23.0, 259.0, 0.12, 70.0, NULL, 40.0, 0.0, NULL, 0.6, 4.6, 6.0, 0.07, 0.01, 0.3, 0.596, 0.105, 0.0, 0.0, NULL, '2026-02-26', 'Lựu  Pome granate', 'luu  pome granate'),
+('fao_vn_2007_5025_raw', 'Mãng cầu xiêm', '{}', 'Siamese custard apple, soursop', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 21.0, 53.0, 1.8, 10.1, 0.6, 1.9, 4.0, 38.0, 0.7, 18.0, 14.0, 382.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 19.0, 0.08, 0.1, 0.5, 0.135, 0.221, NULL, NULL, NULL, '2026-02-26', 'Mãng cầu xiêm  Siamese custard apple, soursop', 'mang cau xiem  siamese custard apple, soursop'),
+('fao_vn_2007_5026_raw', 'Mắc coọc', '{}', 'Pyrus pashia Ham', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 24.0, 0.2, 5.7, NULL, NULL, NULL, 32.0, 0.6, NULL, 7.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mắc coọc  Pyrus pashia Ham', 'mac cooc  pyrus pashia ham'),
+('fao_vn_2007_5027_raw', 'Mận', '{}', 'Japanese, plum', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 15.0, 20.0, 0.6, 3.9, 0.2, 0.7, 0.0, 28.0, 0.4, 7.0, 20.0, 157.0, 0.1, 57.0, 0.05, 98.0, 0.0, NULL, 0.26, 6.4, 3.0, 0.06, 0.04, 0.5, 0.135, 0.029, 0.0, 0.0, NULL, '2026-02-26', 'Mận  Japanese, plum', 'man  japanese, plum'),
+('fao_vn_2007_5028_raw', 'Mít dai', '{}', 'Jackfruit, jackfruit mature', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 55.0, 50.0, 0.6, 11.1, 0.3, 1.2, 3.0, 21.0, 0.4, 37.0, 28.0, 368.0, 0.67, 120.0, 0.15, 180.0, 0.0, NULL, NULL, NULL, 5.0, 0.09, 0.04, 0.7, NULL, 0.108, 0.0, 0.0, NULL, '2026-02-26', 'Mít dai  Jackfruit, jackfruit mature', 'mit dai  jackfruit, jackfruit mature'),
+('fao_vn_2007_5029_raw', 'Mít khô', '{}', 'Dried jackfruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 280.0, 2.9, 67.0, NULL, 1.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mít khô  Dried jackfruit', 'mit kho  dried jackfruit'),
+('fao_vn_2007_5030_raw', 'Mít mật', '{}', 'Jack fruit, honey', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 55.0, 62.0, 1.5, 14.0, NULL, 1.2, NULL, 21.0, 0.4, NULL, 28.0, NULL, NULL, NULL, NULL, 80.0, 0.0, NULL, NULL, NULL, 5.0, 0.09, 0.04, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mít mật  Jack fruit, honey', 'mit mat  jack fruit, honey'),
+('fao_vn_2007_5031_raw', 'Mơ', '{}', 'Apricot, Apricot nectar', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 48.0, 0.9, 10.1, 0.4, 0.8, 1.0, 28.0, 2.1, 10.0, 26.0, 259.0, 0.2, 78.0, 0.08, 2554.0, 0.0, NULL, 0.89, 3.3, 7.0, 0.04, 0.06, 0.7, 0.24, 0.054, 0.0, 0.0, NULL, '2026-02-26', 'Mơ  Apricot, Apricot nectar', 'mo  apricot, apricot nectar'),
+('fao_vn_2007_5032_raw', 'Mơ khô', '{}', 'Apricot dried, unsulfured', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 273.0, 3.0, 62.8, 1.1, 4.1, 10.0, 62.0, 4.5, 32.0, 106.0, 1162.0, 0.39, 343.0, 0.24, 2163.0, 0.0, NULL, 4.33, 3.1, 5.0, 0.08, 0.09, 1.6, 0.516, 0.143, 0.0, 0.0, NULL, '2026-02-26', 'Mơ khô  Apricot dried, unsulfured', 'mo kho  apricot dried, unsulfured'),
+('fao_vn_2007_5033_raw', 'Muỗm, quéo', '{}', 'Mango, common; Indian mango, unripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 20.0, 67.0, 0.6, 15.3, 0.4, 0.4, NULL, 4.0, 0.2, NULL, 4.0, NULL, NULL, NULL, NULL, 1905.0, 0.0, NULL, NULL, NULL, 60.0, 0.06, 0.06, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Muỗm, quéo  Mango, common; Indian mango, unripe', 'muom, queo  mango, common; indian mango, unripe'),
+('fao_vn_2007_5034_raw', 'Na', '{}', 'Sugarapple, sweetsop', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 44.4, 66.0, 1.6, 14.2, 0.3, 0.8, 22.0, 35.0, 0.6, 21.0, 45.0, 260.0, 0.21, 200.0, 0.17, 0.0, 0.0, NULL, NULL, NULL, 36.0, 0.11, 0.1, 0.8, 0.226, 0.2, 0.0, 0.0, NULL, '2026-02-26', 'Na  Sugarapple, sweetsop', 'na  sugarapple, sweetsop'),
+('fao_vn_2007_5035_raw', 'Nhãn', '{}', 'Longan', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 45.0, 48.0, 0.9, 10.9, 0.1, 1.0, 26.0, 21.0, 0.4, 10.0, 12.0, 257.0, 0.29, 150.0, 0.1, 0.0, 0.0, NULL, NULL, NULL, 58.0, 0.03, 0.14, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nhãn  Longan', 'nhan  longan'),
+('fao_vn_2007_5036_raw', 'Nhãn khô', '{}', 'Longan, dried', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 0.0, 285.0, 4.3, 65.9, 0.5, 1.7, 48.0, 32.0, 4.4, 46.0, 117.0, 658.0, 0.22, 807.0, 0.25, 0.0, 0.0, NULL, NULL, NULL, 34.0, 0.02, 0.5, 1.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nhãn khô  Longan, dried', 'nhan kho  longan, dried'),
+('fao_vn_2007_5037_raw', 'Nho ngọt', '{}', 'Grape, European, sweet', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 1.9, 68.0, 0.4, 16.3, 0.2, 0.6, 2.0, 17.0, 0.6, 7.0, 22.0, 191.0, 0.07, 127.0, 0.07, 39.0, 0.0, NULL, 0.19, 14.6, 3.0, 0.06, 0.04, 0.2, 0.05, 0.086, 0.0, 0.0, 0.3, '2026-02-26', 'Nho ngọt  Grape, European, sweet', 'nho ngot  grape, european, sweet'),
+('fao_vn_2007_5038_raw', 'Nho ta (nho chua)', '{}', 'Grape fruit, sour', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 13.0, 14.0, 0.4, 3.1, NULL, 2.4, 11.0, 40.0, 1.4, 15.0, 21.0, 120.0, 0.17, 160.0, 0.07, 15.0, 0.0, NULL, NULL, NULL, 45.0, 0.05, 0.04, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nho ta (nho chua)  Grape fruit, sour', 'nho ta (nho chua)  grape fruit, sour'),
+('fao_vn_2007_5039_raw', 'Nhót', '{}', 'Silver berry', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 24.0, 13.0, 1.2, 2.1, NULL, 2.3, NULL, 27.0, 0.2, NULL, 30.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nhót  Silver berry', 'nhot  silver berry'),
+('fao_vn_2007_5040_raw', 'ổi', '{}', 'Guava, common', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 5.0, 38.0, 0.6, 6.8, 1.0, 6.0, 4.0, 10.0, 1.3, 22.0, 16.0, 291.0, 2.4, 20.0, 0.15, 374.0, 0.0, NULL, 0.73, 2.6, 62.0, 0.05, 0.04, 1.1, 0.451, 0.11, 0.0, 0.0, NULL, '2026-02-26', 'ổi  Guava, common', 'oi  guava, common'),
+('fao_vn_2007_5041_raw', 'Quả bơ vỏ tím', '{}', 'Avocado, purple', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 27.0, 74.0, 1.8, 2.8, 6.2, 0.4, NULL, 49.0, 1.4, NULL, 69.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả bơ vỏ tím  Avocado, purple', 'qua bo vo tim  avocado, purple'),
+('fao_vn_2007_5042_raw', 'Quả bơ vỏ xanh', '{}', 'Avocado, green', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 28.0, 101.0, 1.9, 2.3, 9.4, 0.5, 2.0, 60.0, 1.6, 24.0, 85.0, 351.0, 0.4, 311.0, 0.1, 53.0, 0.0, NULL, 2.66, NULL, 17.0, 0.02, 0.05, 0.7, 0.931, 0.078, 0.0, 0.0, 3.2, '2026-02-26', 'Quả bơ vỏ xanh  Avocado, green', 'qua bo vo xanh  avocado, green'),
+('fao_vn_2007_5043_raw', 'Quả cóc', '{}', '-', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 25.0, 58.0, 1.8, 12.8, NULL, 0.9, NULL, 38.0, 1.6, NULL, 24.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả cóc  -', 'qua coc  -'),
+('fao_vn_2007_5044_raw', 'Quả thanh long', '{}', 'Dragon''s eyes fruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', NULL, 40.0, 1.3, 8.7, NULL, 1.8, NULL, 11.0, 0.6, NULL, 11.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 10.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả thanh long  Dragon''s eyes fruit', 'qua thanh long  dragon''s eyes fruit'),
+('fao_vn_2007_5045_raw', 'Quả trứng gà', '{}', '-', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 25.0, 106.0, 4.3, 21.3, 0.4, NULL, NULL, 101.0, NULL, NULL, 270.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quả trứng gà  -', 'qua trung ga  -'),
+('fao_vn_2007_5046_raw', 'Quất chín (cả vỏ)', '{}', 'Mandarin, whole fruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 4.0, 26.0, 0.9, 5.5, NULL, 4.1, NULL, 124.0, 0.3, NULL, 42.0, NULL, NULL, NULL, NULL, 100.0, 0.0, NULL, NULL, NULL, 43.0, 0.1, 0.02, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Quất chín (cả vỏ)  Mandarin, whole fruit', 'quat chin (ca vo)  mandarin, whole fruit'),
+('fao_vn_2007_5047_raw', 'Quít', '{}', 'Tangerine; Orange;', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 19.8, 39.0, 0.8, 8.3, 0.3, 0.6, 4.0, 35.0, 0.4, 10.0, 17.0, 111.0, 0.2, 100.0, 0.08, 71.0, 0.0, NULL, 0.2, 0.0, 55.0, 0.08, 0.03, 0.2, 0.216, 0.078, 0.0, 0.0, 0.8, '2026-02-26', 'Quít  Tangerine; Orange;', 'quit  tangerine; orange;'),
+('fao_vn_2007_5048_raw', 'Sầu riêng', '{}', 'Durian, Civet', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 75.0, 132.0, 2.5, 26.9, 1.6, 1.4, 1.0, 20.0, 0.9, 33.0, 63.0, 601.0, 0.28, 0.0, 0.33, 23.0, 0.0, NULL, NULL, NULL, 37.0, 0.27, 0.29, 1.2, 0.23, 0.316, NULL, 0.0, NULL, '2026-02-26', 'Sầu riêng  Durian, Civet', 'sau rieng  durian, civet'),
+('fao_vn_2007_5049_raw', 'Sấu chín', '{}', 'Sanpidus, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 24.0, 38.0, 1.3, 8.2, NULL, 2.7, NULL, 100.0, NULL, NULL, 44.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 3.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Sấu chín  Sanpidus, ripe', 'sau chin  sanpidus, ripe'),
+('fao_vn_2007_5050_raw', 'Táo ta', '{}', 'Jujube, common or Chinese; Chinese date', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 38.0, 0.8, 8.3, 0.2, 0.7, 3.0, 44.0, 0.2, 10.0, 25.0, 250.0, 0.05, 73.0, 0.08, 5.0, 0.0, NULL, NULL, NULL, 24.0, 0.06, 0.04, 0.6, NULL, 0.081, NULL, NULL, NULL, '2026-02-26', 'Táo ta  Jujube, common or Chinese; Chinese date', 'tao ta  jujube, common or chinese; chinese date'),
+('fao_vn_2007_5051_raw', 'Táo tây', '{}', 'Apple, common, domestic', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 12.0, 48.0, 0.5, 11.0, 0.2, 0.6, 15.0, 19.0, 2.5, 3.0, 13.0, 102.0, 0.2, 100.0, 0.06, 27.0, 0.0, NULL, 0.18, 2.2, 7.0, 0.04, 0.03, 0.2, 0.061, 0.041, 0.0, 0.0, 0.3, '2026-02-26', 'Táo tây  Apple, common, domestic', 'tao tay  apple, common, domestic'),
+('fao_vn_2007_5052_raw', 'Vải', '{}', 'Litchi; lychee', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 48.0, 45.0, 0.7, 9.6, 0.4, 1.1, 1.0, 6.0, 0.5, 10.0, 34.0, 171.0, 0.07, 148.0, 0.06, NULL, 0.0, NULL, 0.07, 0.4, 36.0, 0.02, 0.04, 0.7, NULL, 0.1, 0.0, 0.0, NULL, '2026-02-26', 'Vải  Litchi; lychee', 'vai  litchi; lychee'),
+('fao_vn_2007_5053_raw', 'Vải khô', '{}', 'Litchi, dried with shells', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 44.0, 260.0, 3.0, 57.6, 1.9, 1.0, 3.0, 25.0, 4.4, 42.0, 58.0, 1110.0, 0.28, 631.0, 0.23, 0.0, 0.0, NULL, 0.31, 1.6, 183.0, 0.01, 0.57, 3.1, NULL, 0.09, 0.0, 0.0, NULL, '2026-02-26', 'Vải khô  Litchi, dried with shells', 'vai kho  litchi, dried with shells'),
+('fao_vn_2007_5054_raw', 'Vú sữa', '{}', 'Starapple, cainito', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 22.0, 42.0, 1.0, 9.4, NULL, 2.3, NULL, 68.0, 0.4, NULL, 32.0, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, 5.0, 0.01, 0.02, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Vú sữa  Starapple, cainito', 'vu sua  starapple, cainito'),
+('fao_vn_2007_5055_raw', 'Xoài chín', '{}', 'Mango, common; India mango, ripe', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 20.0, 62.0, 0.6, 14.1, 0.3, 1.8, 2.0, 10.0, 0.4, 9.0, 13.0, 114.0, 0.56, 150.0, 0.28, 445.0, 0.0, NULL, 1.12, 4.2, 30.0, 0.05, 0.05, 0.3, 0.16, 0.134, 0.0, 0.0, NULL, '2026-02-26', 'Xoài chín  Mango, common; India mango, ripe', 'xoai chin  mango, common; india mango, ripe'),
+('fao_vn_2007_5056_raw', 'Quả kiwi', '{}', 'Kiwi fruit', 'Quả chín', 'Fruits', 'FAO_VN_2007', 'raw', 14.0, 56.0, 1.1, 11.7, 0.5, 3.0, 3.0, 34.0, 0.31, 17.0, 34.0, 312.0, 0.14, 130.0, 0.1, 52.0, 0.0, NULL, 1.46, 40.3, 93.0, 0.03, 0.03, 0.3, 0.183, 0.063, 0.0, 0.0, NULL, '2026-02-26', 'Quả kiwi  Kiwi fruit', 'qua kiwi  kiwi fruit'),
+('fao_vn_2007_6001_raw', 'Bơ', '{}', 'Butter, unsalted', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 756.0, 0.5, 0.5, 83.5, 0.0, 11.0, 12.0, 0.1, 2.0, 12.0, 24.0, 0.09, 16.0, 0.0, 158.0, 600.0, NULL, 2.32, 7.0, 0.0, 0.01, 0.04, 0.0, 0.11, 0.003, 0.0, 0.0, NULL, '2026-02-26', 'Bơ  Butter, unsalted', 'bo  butter, unsalted'),
+('fao_vn_2007_6002_raw', 'Dầu thảo mộc (Lạc, vừng, cám...)', '{}', 'Vegetable oil, mix', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 897.0, 0.0, 0.0, 99.7, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu thảo mộc (Lạc, vừng, cám...)  Vegetable oil, mix', 'dau thao moc (lac, vung, cam...)  vegetable oil, mix'),
+('fao_vn_2007_6003_raw', 'Mỡ lợn muối', '{}', 'Lard, salted', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 827.0, 2.0, 0.0, 91.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mỡ lợn muối  Lard, salted', 'mo lon muoi  lard, salted'),
+('fao_vn_2007_6004_raw', 'Mỡ lợn nước', '{}', 'Lard, liquid', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 896.0, 0.0, 0.0, 99.6, 0.0, NULL, 2.0, 0.3, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.02, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mỡ lợn nước  Lard, liquid', 'mo lon nuoc  lard, liquid'),
+('fao_vn_2007_6005_raw', 'Bơ thực vật', '{}', 'Butter-margarine blend, stick, unsalted', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 729.0, 0.5, 0.1, 80.7, 0.0, 2.0, 17.0, NULL, 2.0, 13.0, 25.0, 0.02, 0.0, 0.0, 610.0, 768.0, NULL, 12.8, 93.0, 0.0, 0.01, 0.02, 0.0, 0.049, 0.005, 0.0, 0.06, NULL, '2026-02-26', 'Bơ thực vật  Butter-margarine blend, stick, unsalted', 'bo thuc vat  butter-margarine blend, stick, unsalted'),
+('fao_vn_2007_6006_raw', 'Dầu bông', '{}', 'Cottonseed oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 35.3, 24.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu bông  Cottonseed oil, salad or cooking', 'dau bong  cottonseed oil, salad or cooking'),
+('fao_vn_2007_6007_raw', 'Dầu cám gạo', '{}', 'Rice bran oil', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.07, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 32.3, 24.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu cám gạo  Rice bran oil', 'dau cam gao  rice bran oil'),
+('fao_vn_2007_6008_raw', 'Dầu cọ', '{}', 'Palm oil', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 15.94, 8.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu cọ  Palm oil', 'dau co  palm oil'),
+('fao_vn_2007_6009_raw', 'Dầu dừa', '{}', 'Coconut oil', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.04, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 0.09, 0.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu dừa  Coconut oil', 'dau dua  coconut oil'),
+('fao_vn_2007_6010_raw', 'Dầu đậu tương', '{}', 'Soybean oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.02, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 9.21, 197.6, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu đậu tương  Soybean oil, salad or cooking', 'dau dau tuong  soybean oil, salad or cooking'),
+('fao_vn_2007_6011_raw', 'Dầu lạc', '{}', 'Peanut oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, 0.03, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 15.69, 0.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu lạc  Peanut oil, salad or cooking', 'dau lac  peanut oil, salad or cooking'),
+('fao_vn_2007_6012_raw', 'Dầu mè', '{}', 'Sesame oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 1.4, 13.6, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu mè  Sesame oil, salad or cooking', 'dau me  sesame oil, salad or cooking'),
+('fao_vn_2007_6013_raw', 'Dầu ngô', '{}', 'Corn oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 14.3, 1.9, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu ngô  Corn oil, salad or cooking', 'dau ngo  corn oil, salad or cooking'),
+('fao_vn_2007_6014_raw', 'Dầu oliu', '{}', 'Olive oil, salad or cooking', 'Dầu, mỡ, bơ', 'Oil, lard, butter', 'FAO_VN_2007', 'raw', 0.0, 900.0, 0.0, 0.0, 100.0, 0.0, 2.0, 1.0, 0.56, NULL, NULL, 1.0, NULL, NULL, NULL, 0.0, NULL, NULL, 14.35, 60.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dầu oliu  Olive oil, salad or cooking', 'dau oliu  olive oil, salad or cooking'),
+('fao_vn_2007_7001_raw', 'Thịt bê mỡ', '{}', 'Veal meat, lean and fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 144.0, 19.0, 0.0, 7.5, 0.0, 76.0, 8.0, 1.7, 24.0, 188.0, 329.0, 2.55, 110.0, 0.03, 0.0, 0.0, NULL, 0.25, 4.6, 2.0, 0.23, 0.25, 6.2, 1.36, 0.49, NULL, 1.27, 0.0, '2026-02-26', 'Thịt bê mỡ  Veal meat, lean and fat', 'thit be mo  veal meat, lean and fat'),
+('fao_vn_2007_7002_raw', 'Thịt bê nạc', '{}', 'Veal meat, lean only', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 85.0, 20.0, 0.0, 0.5, 0.0, 80.0, 8.0, 1.7, 26.0, 176.0, 348.0, 2.73, 116.0, 0.03, 0.0, 0.0, NULL, 0.25, NULL, 2.0, 0.23, 0.25, 6.2, 1.45, 0.52, NULL, 1.34, 0.0, '2026-02-26', 'Thịt bê nạc  Veal meat, lean only', 'thit be nac  veal meat, lean only'),
+('fao_vn_2007_7003_raw', 'Thịt bò loại I', '{}', 'Beef, grade I', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 118.0, 21.0, 0.0, 3.8, 0.0, 83.0, 12.0, 3.1, 28.0, 226.0, 378.0, 2.2, 160.0, NULL, 0.0, 12.0, NULL, NULL, NULL, 1.0, 0.1, 0.17, 4.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt bò loại I  Beef, grade I', 'thit bo loai i  beef, grade i'),
+('fao_vn_2007_7004_raw', 'Thịt bò loại II', '{}', 'Beef, grade II', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 167.0, 18.0, 0.0, 10.5, 0.0, NULL, 10.0, 2.7, NULL, 194.0, NULL, NULL, NULL, NULL, 0.0, 2.0, NULL, NULL, NULL, 1.0, 0.1, 0.17, 4.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt bò loại II  Beef, grade II', 'thit bo loai ii  beef, grade ii'),
+('fao_vn_2007_7005_raw', 'Thịt bò, lưng, nạc', '{}', 'Beef, top loin, seperable lean only, trimmed to 1/8" fat, prime, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 127.0, 23.1, 0.0, 3.9, 0.0, 57.0, 23.0, 1.63, 24.0, 214.0, 361.0, 4.05, 78.0, 0.01, 0.0, 0.0, NULL, 0.29, 1.2, 0.0, 0.08, 0.12, 6.7, 0.678, 0.651, 0.0, 0.98, 0.0, '2026-02-26', 'Thịt bò, lưng, nạc  Beef, top loin, seperable lean only, trimmed to 1/8" fat, prime, raw', 'thit bo, lung, nac  beef, top loin, seperable lean only, trimmed to 1/8" fat, prime, raw'),
+('fao_vn_2007_7006_raw', 'Thịt bò, lưng, nạc và mỡ', '{}', 'Beef, top loin, seperable lean only, trimmed to 1/4" fat, prime, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 182.0, 21.5, 0.0, 10.7, 0.0, 59.0, 5.0, 1.78, 22.0, 185.0, 349.0, 3.64, 78.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.1, 0.15, 4.5, 0.36, 0.44, NULL, 3.05, NULL, '2026-02-26', 'Thịt bò, lưng, nạc và mỡ  Beef, top loin, seperable lean only, trimmed to 1/4" fat, prime, raw', 'thit bo, lung, nac va mo  beef, top loin, seperable lean only, trimmed to 1/4" fat, prime, raw'),
+('fao_vn_2007_7007_raw', 'Thịt bồ câu ra ràng', '{}', 'Pigeon young bird flesh skin and giblets', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 60.0, 340.0, 17.5, 0.0, 30.0, 0.0, 54.0, 45.0, 5.4, 22.0, 217.0, 199.0, 2.2, 437.0, 0.02, 0.0, 73.0, NULL, NULL, NULL, 5.0, 0.1, 0.28, 5.3, 0.76, 0.41, 0.0, 0.4, NULL, '2026-02-26', 'Thịt bồ câu ra ràng  Pigeon young bird flesh skin and giblets', 'thit bo cau ra rang  pigeon young bird flesh skin and giblets'),
+('fao_vn_2007_7008_raw', 'Thịt chó sấn', '{}', 'Dog meat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 338.0, 16.0, 0.0, 30.4, 0.0, NULL, 16.0, 1.0, NULL, 43.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.04, 0.08, 1.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt chó sấn  Dog meat', 'thit cho san  dog meat'),
+('fao_vn_2007_7009_raw', 'Thịt chó vai', '{}', 'Dog, shoulder', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 230.0, 18.0, 0.0, 17.6, 0.0, NULL, 20.0, 0.7, NULL, 36.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.08, 1.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt chó vai  Dog, shoulder', 'thit cho vai  dog, shoulder'),
+('fao_vn_2007_7010_raw', 'Thịt cừu, nạc', '{}', 'Mutton meat, lean', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 219.0, 16.4, 0.0, 17.0, 0.0, 91.0, 9.0, 2.5, 27.0, 177.0, 256.0, 2.9, 160.0, 0.04, 0.0, 30.0, NULL, NULL, NULL, 3.0, 0.17, 0.15, 5.8, NULL, NULL, NULL, NULL, 1.0, '2026-02-26', 'Thịt cừu, nạc  Mutton meat, lean', 'thit cuu, nac  mutton meat, lean'),
+('fao_vn_2007_7011_raw', 'Thịt dê, nạc', '{}', 'Goat, meat, lean', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 122.0, 20.7, 0.0, 4.3, 0.0, 82.0, 11.0, 2.0, NULL, 129.0, 385.0, 4.0, 256.0, 0.04, 0.0, 91.0, NULL, NULL, NULL, 1.0, 0.07, 0.13, 4.9, NULL, NULL, 0.0, 1.13, NULL, '2026-02-26', 'Thịt dê, nạc  Goat, meat, lean', 'thit de, nac  goat, meat, lean'),
+('fao_vn_2007_7012_raw', 'Thịt gà rừng', '{}', 'Grouse field chicken', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 58.0, 141.0, 24.4, 0.0, 4.8, 0.0, NULL, 14.0, 0.4, NULL, 263.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt gà rừng  Grouse field chicken', 'thit ga rung  grouse field chicken'),
+('fao_vn_2007_7013_raw', 'Thịt gà ta', '{}', 'Chicken meat, average', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 52.0, 199.0, 20.3, 0.0, 13.1, 0.0, 70.0, 12.0, 1.5, 29.0, 200.0, 189.0, 1.5, 48.0, 0.02, 0.0, 120.0, NULL, 0.3, 1.5, 4.0, 0.15, 0.16, 8.1, 0.91, 0.35, 0.0, 0.31, NULL, '2026-02-26', 'Thịt gà ta  Chicken meat, average', 'thit ga ta  chicken meat, average'),
+('fao_vn_2007_7014_raw', 'Thịt gà tây', '{}', 'Turkey raw flesh and skin giblets', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 53.0, 218.0, 20.1, 0.0, 15.3, 0.0, 66.0, 24.0, 3.2, 18.0, 320.0, 236.0, 2.67, 127.0, 0.02, 0.0, 180.0, NULL, NULL, NULL, 0.0, 0.06, 0.08, 7.0, 0.917, 0.29, 0.0, 0.36, 2.0, '2026-02-26', 'Thịt gà tây  Turkey raw flesh and skin giblets', 'thit ga tay  turkey raw flesh and skin giblets'),
+('fao_vn_2007_7015_raw', 'Thịt hươu', '{}', 'Deer meat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 94.0, 19.0, 0.0, 2.0, 0.0, 51.0, 11.0, 2.8, 23.0, 205.0, 318.0, 2.09, 253.0, 0.04, 0.0, 8.0, NULL, 0.2, 1.1, 0.0, 0.26, 0.6, 5.1, NULL, 0.37, 0.0, 6.31, NULL, '2026-02-26', 'Thịt hươu  Deer meat', 'thit huou  deer meat'),
+('fao_vn_2007_7016_raw', 'Thịt lợn mỡ', '{}', 'Pork, lean and fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 394.0, 14.5, 0.0, 37.3, 0.0, 42.0, 8.0, 0.4, 13.0, 156.0, 253.0, 1.59, 55.0, 0.01, 0.0, 2.0, NULL, NULL, NULL, 0.0, 0.0, 0.0, 0.0, 0.526, 0.284, 0.0, 0.61, NULL, '2026-02-26', 'Thịt lợn mỡ  Pork, lean and fat', 'thit lon mo  pork, lean and fat'),
+('fao_vn_2007_7017_raw', 'Thịt lợn nạc', '{}', 'Pork, lean', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 139.0, 19.0, 0.0, 7.0, 0.0, 76.0, 7.0, 0.96, 32.0, 190.0, 341.0, 2.5, 190.0, 0.01, 0.0, 2.0, NULL, NULL, NULL, 1.0, 0.9, 0.18, 4.4, 0.822, 0.415, 0.0, 0.84, 2.6, '2026-02-26', 'Thịt lợn nạc  Pork, lean', 'thit lon nac  pork, lean'),
+('fao_vn_2007_7018_raw', 'Thịt lợn nửa nạc, nửa mỡ', '{}', 'Pork, medium fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 260.0, 16.5, 0.0, 21.5, 0.0, 55.0, 9.0, 1.5, 19.0, 178.0, 285.0, 1.91, 63.0, 0.01, 0.0, 10.0, NULL, NULL, NULL, 2.0, 0.53, 0.16, 2.7, 0.672, 0.393, 0.0, 0.6, 2.6, '2026-02-26', 'Thịt lợn nửa nạc, nửa mỡ  Pork, medium fat', 'thit lon nua nac, nua mo  pork, medium fat'),
+('fao_vn_2007_7019_raw', 'Thịt ngỗng', '{}', 'Goose', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 52.0, 409.0, 14.0, 0.0, 39.2, 0.0, 73.0, 13.0, 1.8, 18.0, 210.0, 308.0, 1.72, 270.0, 0.02, 0.0, 17.0, NULL, NULL, NULL, 4.0, 0.2, 0.19, 5.7, 1.294, 0.39, 0.0, 0.34, NULL, '2026-02-26', 'Thịt ngỗng  Goose', 'thit ngong  goose'),
+('fao_vn_2007_7020_raw', 'Thịt ngựa', '{}', 'Horse meat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 176.0, 21.5, 0.0, 10.0, 0.0, 62.0, 13.0, 3.1, 20.0, 200.0, 291.0, 4.61, 140.0, 0.02, 0.0, 37.0, 0.3, 0.23, 0.0, 1.0, 0.07, 0.1, 4.2, 0.6, 0.5, 0.0, 3.1, 2.6, '2026-02-26', 'Thịt ngựa  Horse meat', 'thit ngua  horse meat'),
+('fao_vn_2007_7021_raw', 'Thịt thỏ nhà', '{}', 'Rabbit meat, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 45.0, 158.0, 21.5, 0.0, 8.0, 0.0, 41.0, 21.0, 1.6, 19.0, 224.0, 330.0, 1.57, 145.0, 0.03, 0.0, 10.0, NULL, 0.4, 0.0, 0.0, 0.08, 0.06, 7.6, 0.8, 0.5, 0.0, 7.16, 1.0, '2026-02-26', 'Thịt thỏ nhà  Rabbit meat, raw', 'thit tho nha  rabbit meat, raw'),
+('fao_vn_2007_7022_raw', 'Thịt thỏ rừng', '{}', 'Hare rabbit (field or wild)', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 45.0, 103.0, 23.5, 0.0, 1.0, 0.0, 50.0, 17.0, 4.8, 29.0, 226.0, 378.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.09, 0.06, 8.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt thỏ rừng  Hare rabbit (field or wild)', 'thit tho rung  hare rabbit (field or wild)'),
+('fao_vn_2007_7023_raw', 'Thịt trâu', '{}', 'Buffalo meat, average', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 97.0, 20.4, 0.9, 1.4, 0.0, 53.0, 12.0, 1.61, 32.0, 197.0, 297.0, 1.93, 151.0, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.2, 6.0, 0.16, 0.53, 0.0, NULL, NULL, '2026-02-26', 'Thịt trâu  Buffalo meat, average', 'thit trau  buffalo meat, average'),
+('fao_vn_2007_7024_raw', 'Thịt trâu bắp', '{}', 'Buffalo meat (shoulder)', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 115.0, 21.9, 0.0, 3.0, 0.0, NULL, 30.0, NULL, NULL, 150.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt trâu bắp  Buffalo meat (shoulder)', 'thit trau bap  buffalo meat (shoulder)'),
+('fao_vn_2007_7025_raw', 'Thịt trâu cổ', '{}', 'Buffalo meat, neck', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 112.0, 20.9, 0.0, 3.1, 0.0, NULL, 20.0, NULL, NULL, 160.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt trâu cổ  Buffalo meat, neck', 'thit trau co  buffalo meat, neck'),
+('fao_vn_2007_7026_raw', 'Thịt trâu đùi', '{}', 'Buffalo meat, leg', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 112.0, 21.2, 0.0, 3.0, 0.0, NULL, 20.0, NULL, NULL, 215.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt trâu đùi  Buffalo meat, leg', 'thit trau dui  buffalo meat, leg'),
+('fao_vn_2007_7027_raw', 'Thịt trâu thăn', '{}', 'Buffalo meat, lean (loin)', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 121.0, 22.8, 0.0, 3.3, 0.0, NULL, 26.0, 3.3, NULL, 165.0, NULL, NULL, NULL, NULL, 0.0, 5.0, NULL, NULL, NULL, NULL, 0.06, 0.16, 3.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt trâu thăn  Buffalo meat, lean (loin)', 'thit trau than  buffalo meat, lean (loin)'),
+('fao_vn_2007_7028_raw', 'Thịt vịt', '{}', 'Duck meat, average', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 55.0, 267.0, 17.8, 0.0, 21.8, 0.0, 63.0, 13.0, 1.8, 15.0, 145.0, 209.0, 1.36, 236.0, 0.02, 0.0, 270.0, NULL, 0.7, 5.5, 3.0, 0.07, 0.15, 4.7, 0.951, 0.19, 0.0, 0.25, NULL, '2026-02-26', 'Thịt vịt  Duck meat, average', 'thit vit  duck meat, average'),
+('fao_vn_2007_7029_raw', 'Bầu dục bò', '{}', 'Beef, kidney', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 7.0, 67.0, 12.5, 0.3, 1.8, 0.0, 200.0, 9.0, 7.1, 13.0, 219.0, 262.0, 1.92, 323.0, 0.1, 0.0, 330.0, 0.8, 0.22, 0.0, 6.0, 0.4, 1.75, 5.1, 3.97, 0.665, 0.0, 27.5, NULL, '2026-02-26', 'Bầu dục bò  Beef, kidney', 'bau duc bo  beef, kidney'),
+('fao_vn_2007_7030_raw', 'Bầu dục lợn', '{}', 'Pork, kidney', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 81.0, 13.0, 0.3, 3.1, 0.0, 121.0, 8.0, 8.0, 17.0, 223.0, 390.0, 2.75, 445.0, 0.1, 0.0, 150.0, NULL, NULL, NULL, 5.0, 0.38, 1.12, 4.8, 3.13, 0.44, 0.0, 8.49, NULL, '2026-02-26', 'Bầu dục lợn  Pork, kidney', 'bau duc lon  pork, kidney'),
+('fao_vn_2007_7031_raw', 'Bì lợn', '{}', 'Pork skin', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 10.0, 118.0, 23.3, 0.0, 2.7, 0.0, NULL, 11.0, 0.4, NULL, 8.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.29, 0.05, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bì lợn  Pork skin', 'bi lon  pork skin'),
+('fao_vn_2007_7032_raw', 'Chân giò lợn', '{}', 'Pork, leg', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 38.0, 230.0, 15.7, 0.0, 18.6, 0.0, 47.0, 24.0, 2.1, 20.0, 106.0, 315.0, 1.93, 65.0, 0.02, 0.0, 30.0, NULL, NULL, NULL, 1.0, 0.01, 0.07, 1.6, 0.685, 0.401, 0.0, 0.63, 2.6, '2026-02-26', 'Chân giò lợn  Pork, leg', 'chan gio lon  pork, leg'),
+('fao_vn_2007_7033_raw', 'Dạ dày bò', '{}', 'Stomach, beef', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 5.0, 97.0, 14.8, 0.0, 4.2, 0.0, 97.0, 150.0, 0.9, 13.0, 85.0, 67.0, 1.42, 70.0, 0.09, 0.0, 0.0, NULL, 0.09, 0.0, 0.0, 0.04, 0.2, 3.6, 0.227, 0.014, 0.0, 1.39, NULL, '2026-02-26', 'Dạ dày bò  Stomach, beef', 'da day bo  stomach, beef'),
+('fao_vn_2007_7034_raw', 'Dạ dày lợn', '{}', 'Stomach, hog', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 85.0, 14.6, 0.0, 2.9, 0.0, 75.0, 8.0, 1.4, 11.0, 144.0, 140.0, 1.85, 169.0, 0.04, 0.0, 0.0, NULL, 0.04, 0.0, 0.0, 0.05, 0.18, 2.5, 1.22, 0.034, 0.0, 0.3, NULL, '2026-02-26', 'Dạ dày lợn  Stomach, hog', 'da day lon  stomach, hog'),
+('fao_vn_2007_7035_raw', 'Đầu bò', '{}', 'Head beef (without tongue, brain, ears).', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 68.0, 185.0, 18.1, 0.0, 12.5, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đầu bò  Head beef (without tongue, brain, ears).', 'dau bo  head beef (without tongue, brain, ears).'),
+('fao_vn_2007_7036_raw', 'Đầu lợn', '{}', 'Hog, head', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 68.0, 335.0, 13.4, 0.0, 31.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đầu lợn  Hog, head', 'dau lon  hog, head'),
+('fao_vn_2007_7037_raw', 'Đuôi bò', '{}', 'Beef, tail', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 46.0, 137.0, 19.7, 0.0, 6.5, 0.0, NULL, 7.0, 2.5, NULL, 162.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.03, 0.03, 5.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đuôi bò  Beef, tail', 'duoi bo  beef, tail'),
+('fao_vn_2007_7038_raw', 'Đuôi lợn', '{}', 'Hog, tail', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 30.0, 467.0, 10.8, 0.0, 47.1, 0.0, 63.0, 18.0, 0.99, 8.0, 50.0, 349.0, 2.31, 84.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.21, 0.11, 2.1, 0.673, 0.37, 0.0, 0.88, NULL, '2026-02-26', 'Đuôi lợn  Hog, tail', 'duoi lon  hog, tail'),
+('fao_vn_2007_7039_raw', 'Gan bò', '{}', 'Beef, liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 109.0, 17.4, 3.0, 3.1, 0.0, 110.0, 5.0, 9.0, 13.0, 340.0, 213.0, 4.0, 1500.0, 0.3, 621.0, 5000.0, 0.4, 0.38, 3.1, 30.0, 0.4, 3.0, 17.0, 7.713, 1.083, 0.0, 59.3, NULL, '2026-02-26', 'Gan bò  Beef, liver', 'gan bo  beef, liver'),
+('fao_vn_2007_7040_raw', 'Gan gà', '{}', 'Chicken liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 111.0, 18.2, 2.0, 3.4, 0.0, 71.0, 21.0, 8.2, 17.0, 260.0, 335.0, 2.67, 300.0, 0.2, 56.0, 3290.0, NULL, 0.7, 0.0, 7.0, 0.38, 1.63, 10.4, 6.233, 0.853, 0.0, 16.58, 210.0, '2026-02-26', 'Gan gà  Chicken liver', 'gan ga  chicken liver'),
+('fao_vn_2007_7041_raw', 'Gan lợn', '{}', 'Pork liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 116.0, 18.8, 2.0, 3.6, 0.0, 110.0, 7.0, 12.0, 17.0, 353.0, 447.0, 5.76, 510.0, 0.3, NULL, 6000.0, NULL, NULL, NULL, 18.0, 0.4, 2.11, 16.2, 6.65, 0.69, 0.0, 26.0, NULL, '2026-02-26', 'Gan lợn  Pork liver', 'gan lon  pork liver'),
+('fao_vn_2007_7042_raw', 'Gan vịt', '{}', 'Duck liver', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 122.0, 17.1, 2.8, 4.7, 0.0, 140.0, 17.0, 4.8, 24.0, 177.0, 230.0, 3.07, 5962.0, 0.26, NULL, 11984.0, NULL, NULL, NULL, 7.0, 0.44, 1.28, 9.1, 6.184, 0.76, 0.0, 54.0, NULL, '2026-02-26', 'Gan vịt  Duck liver', 'gan vit  duck liver'),
+('fao_vn_2007_7043_raw', 'Gân chân bò', '{}', '', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 124.0, 30.2, 0.0, 0.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Gân chân bò  ', 'gan chan bo  '),
+('fao_vn_2007_7044_raw', 'Lưỡi bò', '{}', 'Beef tongue', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 164.0, 13.6, 0.2, 12.1, 0.0, 69.0, 7.0, 3.0, 16.0, 162.0, 315.0, 2.87, 170.0, 0.03, 0.0, 0.0, NULL, NULL, NULL, 3.0, 0.07, 0.15, 4.8, 0.653, 0.31, 0.0, 3.79, NULL, '2026-02-26', 'Lưỡi bò  Beef tongue', 'luoi bo  beef tongue'),
+('fao_vn_2007_7045_raw', 'Lưỡi lợn', '{}', 'Hog, tongue', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 3.0, 178.0, 14.2, 1.4, 12.8, 0.0, 110.0, 7.0, 2.4, 18.0, 118.0, 243.0, 3.01, 70.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 4.0, 0.08, 0.23, 3.0, 0.641, 0.24, 0.0, 2.84, NULL, '2026-02-26', 'Lưỡi lợn  Hog, tongue', 'luoi lon  hog, tongue'),
+('fao_vn_2007_7046_raw', 'Lòng lợn (ruột già)', '{}', 'Hog, intestine large raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 167.0, 6.9, 0.8, 15.1, 0.0, NULL, 12.0, 0.5, NULL, 55.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.09, 0.08, 1.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lòng lợn (ruột già)  Hog, intestine large raw', 'long lon (ruot gia)  hog, intestine large raw'),
+('fao_vn_2007_7047_raw', 'Lòng lợn (ruột non)', '{}', 'Hog intestine small raw without fat', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 44.0, 7.2, 0.8, 1.3, 0.0, NULL, 7.0, 0.8, NULL, 48.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.09, 0.08, 1.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lòng lợn (ruột non)  Hog intestine small raw without fat', 'long lon (ruot non)  hog intestine small raw without fat'),
+('fao_vn_2007_7048_raw', 'Mề gà', '{}', 'Chicken gizzard', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 4.0, 99.0, 21.3, 0.6, 1.3, 0.0, 69.0, 48.0, 6.6, 15.0, 150.0, 237.0, 2.72, 116.0, 0.06, 0.0, 19.0, NULL, 0.33, 0.0, 4.0, 0.04, 0.2, 4.8, 0.631, 0.112, 0.0, 1.21, 1.0, '2026-02-26', 'Mề gà  Chicken gizzard', 'me ga  chicken gizzard'),
+('fao_vn_2007_7049_raw', 'óc bò', '{}', 'Brain beef', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 124.0, 9.0, 0.5, 9.5, 0.0, 126.0, 6.0, 0.9, 13.0, 311.0, 274.0, 1.02, 287.0, 0.03, 88.0, 0.0, NULL, 0.99, 0.0, 11.0, 0.13, 0.21, 3.8, 2.01, 0.226, 0.0, 9.51, NULL, '2026-02-26', 'óc bò  Brain beef', 'oc bo  brain beef'),
+('fao_vn_2007_7050_raw', 'óc lợn', '{}', 'Hog brain', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 123.0, 9.0, 0.4, 9.5, 0.0, 120.0, 7.0, 1.6, 14.0, 311.0, 258.0, 1.27, 240.0, 0.09, 0.0, 0.0, NULL, NULL, NULL, 14.0, 0.14, 0.19, 2.8, 2.8, 0.19, 0.0, 2.19, NULL, '2026-02-26', 'óc lợn  Hog brain', 'oc lon  hog brain'),
+('fao_vn_2007_7051_raw', 'Phổi bò', '{}', 'Beef, lung', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 103.0, 15.2, 0.0, 4.7, 0.0, 198.0, 10.0, 6.7, 14.0, 195.0, 340.0, 1.61, 260.0, 0.02, 0.0, 14.0, NULL, NULL, NULL, 39.0, 0.1, 0.14, 1.1, 1.0, 0.04, 0.0, 3.81, NULL, '2026-02-26', 'Phổi bò  Beef, lung', 'phoi bo  beef, lung'),
+('fao_vn_2007_7052_raw', 'Phổi lợn', '{}', 'Hog lung, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 92.0, 14.8, 0.0, 3.6, 0.0, 153.0, 9.0, 6.4, 14.0, 230.0, 303.0, 2.03, 83.0, 0.02, 0.0, 0.0, NULL, NULL, NULL, 12.0, 0.02, 0.14, 0.6, 0.9, 0.1, 0.0, 2.75, NULL, '2026-02-26', 'Phổi lợn  Hog lung, raw', 'phoi lon  hog lung, raw'),
+('fao_vn_2007_7053_raw', 'Sườn lợn', '{}', 'Pork, ribs', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 57.0, 187.0, 17.9, 0.0, 12.8, 0.0, 60.0, 7.0, 0.61, 14.0, 160.0, 200.0, 3.6, 100.0, 0.01, 0.0, 0.0, 0.69, 0.1, 0.0, 0.0, 0.96, 0.23, 5.2, 0.6, 0.26, 0.0, 0.7, 2.6, '2026-02-26', 'Sườn lợn  Pork, ribs', 'suon lon  pork, ribs'),
+('fao_vn_2007_7054_raw', 'Tai lợn', '{}', 'Hog ears', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 4.0, 126.0, 21.0, 1.3, 4.1, 0.0, 191.0, 21.0, 2.4, 7.0, 41.0, 55.0, 0.19, 6.0, 0.12, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.08, 0.11, 0.8, 0.068, 0.02, 0.0, 0.07, NULL, '2026-02-26', 'Tai lợn  Hog ears', 'tai lon  hog ears'),
+('fao_vn_2007_7055_raw', 'Tim bò', '{}', 'Beef, heart', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 8.0, 89.0, 15.0, 0.6, 3.0, 0.0, 98.0, 5.0, 5.4, 21.0, 185.0, 287.0, 1.7, 396.0, 0.04, 0.0, 6.0, NULL, 0.22, 0.0, 7.0, 0.31, 0.49, 6.8, 1.79, 0.279, 0.0, 8.55, 2.0, '2026-02-26', 'Tim bò  Beef, heart', 'tim bo  beef, heart'),
+('fao_vn_2007_7056_raw', 'Tim gà', '{}', 'Chicken heart', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 114.0, 16.0, 0.0, 5.5, 0.0, 74.0, 12.0, 5.96, 15.0, 177.0, 176.0, 6.59, 346.0, 0.09, 0.0, 9.0, NULL, NULL, NULL, 3.0, 0.15, 0.73, 4.9, 2.559, 0.36, 0.0, 7.29, NULL, '2026-02-26', 'Tim gà  Chicken heart', 'tim ga  chicken heart'),
+('fao_vn_2007_7057_raw', 'Tim lợn', '{}', 'Hog heart', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 6.0, 94.0, 15.1, 1.2, 3.2, 0.0, 56.0, 7.0, 5.9, 19.0, 213.0, 294.0, 2.8, 408.0, 0.06, 0.0, 8.0, NULL, NULL, NULL, 1.0, 0.34, 0.49, 5.7, 2.515, 0.39, 0.0, 3.79, 18.2, '2026-02-26', 'Tim lợn  Hog heart', 'tim lon  hog heart'),
+('fao_vn_2007_7058_raw', 'Tiết bò', '{}', 'Beef, blood', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 75.0, 18.0, 0.4, 0.2, 0.0, NULL, 8.0, 52.6, NULL, 31.0, NULL, NULL, NULL, NULL, 0.0, 30.0, NULL, NULL, NULL, NULL, 0.09, 0.03, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tiết bò  Beef, blood', 'tiet bo  beef, blood'),
+('fao_vn_2007_7059_cooked', 'Tiết lợn luộc', '{}', 'Hog blood, boiled', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 44.0, 10.7, 0.0, 0.1, 0.0, NULL, 7.0, 25.9, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, 93.0, NULL, NULL, NULL, NULL, 0.0, 0.1, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tiết lợn luộc  Hog blood, boiled', 'tiet lon luoc  hog blood, boiled'),
+('fao_vn_2007_7060_raw', 'Tiết lợn sống', '{}', 'Hog blood, raw', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 25.0, 5.7, 0.2, 0.1, 0.0, NULL, 7.0, 20.4, NULL, 7.0, NULL, NULL, NULL, NULL, 0.0, 26.0, NULL, NULL, NULL, NULL, NULL, 0.1, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tiết lợn sống  Hog blood, raw', 'tiet lon song  hog blood, raw'),
+('fao_vn_2007_7061_raw', 'Tủy xương bò', '{}', 'Beef bone marrow', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 814.0, 1.1, 0.0, 89.9, 0.0, NULL, 89.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, 0.01, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tủy xương bò  Beef bone marrow', 'tuy xuong bo  beef bone marrow'),
+('fao_vn_2007_7062_raw', 'Tủy xương lợn', '{}', 'Hog, bone marrow', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 749.0, 2.3, 0.0, 82.2, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tủy xương lợn  Hog, bone marrow', 'tuy xuong lon  hog, bone marrow'),
+('fao_vn_2007_7063_raw', 'Ba tê', '{}', 'Pa tª', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 326.0, 10.8, 15.4, 24.6, 0.0, NULL, 26.0, 4.2, NULL, 88.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ba tê  Pa tª', 'ba te  pa ta'),
+('fao_vn_2007_7064_cooked', 'Chả lợn', '{}', 'Pork, mince fat meat grilled', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 517.0, 10.8, 5.1, 50.4, 0.0, NULL, 20.0, NULL, NULL, 100.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Chả lợn  Pork, mince fat meat grilled', 'cha lon  pork, mince fat meat grilled'),
+('fao_vn_2007_7065_cooked', 'Chả quế lợn', '{}', 'Pork, cinnamon mince grilled', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 416.0, 16.2, 0.0, 39.0, 0.0, NULL, 16.0, 2.1, NULL, 45.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Chả quế lợn  Pork, cinnamon mince grilled', 'cha que lon  pork, cinnamon mince grilled'),
+('fao_vn_2007_7066_raw', 'Dăm bông lợn', '{}', 'Ham, pork', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 318.0, 23.0, 0.3, 25.0, 0.0, NULL, 10.0, 2.1, NULL, 110.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.4, 0.19, 3.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dăm bông lợn  Ham, pork', 'dam bong lon  ham, pork'),
+('fao_vn_2007_7067_raw', 'Dồi lợn', '{}', 'Blood mix-pudding with viscera in large intestine', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 114.0, 12.4, 0.0, 7.1, 0.0, NULL, 28.0, NULL, NULL, 23.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Dồi lợn  Blood mix-pudding with viscera in large intestine', 'doi lon  blood mix-pudding with viscera in large intestine'),
+('fao_vn_2007_7068_raw', 'Giò bò', '{}', 'Beef dumpling', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 357.0, 13.8, 0.0, 33.5, 0.0, NULL, 18.0, 3.2, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Giò bò  Beef dumpling', 'gio bo  beef dumpling'),
+('fao_vn_2007_7069_cooked', 'Giò lụa', '{}', 'Pork, mince lean meat steamed', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 136.0, 21.5, 0.0, 5.5, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Giò lụa  Pork, mince lean meat steamed', 'gio lua  pork, mince lean meat steamed'),
+('fao_vn_2007_7070_cooked', 'Giò thủ lợn', '{}', 'Pork, head meat, steamed', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'cooked', 0.0, 553.0, 16.0, 0.0, 54.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Giò thủ lợn  Pork, head meat, steamed', 'gio thu lon  pork, head meat, steamed'),
+('fao_vn_2007_7071_raw', 'Lạp xường', '{}', 'Chinese sausage', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 585.0, 20.8, 1.7, 55.0, 0.0, NULL, 52.0, 3.0, NULL, 175.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.46, 0.24, 4.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lạp xường  Chinese sausage', 'lap xuong  chinese sausage'),
+('fao_vn_2007_7072_raw', 'Nem chạo', '{}', '', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 153.0, 16.6, 6.9, 6.5, 0.0, NULL, 24.0, 1.6, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nem chạo  ', 'nem chao  '),
+('fao_vn_2007_7073_raw', 'Nem chua', '{}', 'Pork mince, fermented', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 137.0, 21.7, 4.3, 3.7, 0.0, NULL, 24.0, NULL, NULL, 78.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nem chua  Pork mince, fermented', 'nem chua  pork mince, fermented'),
+('fao_vn_2007_7074_raw', 'Ruốc thịt lợn', '{}', '', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 369.0, 46.6, 0.0, 20.3, 0.0, NULL, 29.0, 0.3, NULL, 16.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ruốc thịt lợn  ', 'ruoc thit lon  '),
+('fao_vn_2007_7075_raw', 'Thịt bò khô', '{}', 'Dried beef', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 239.0, 51.0, 5.2, 1.6, 0.0, NULL, 31.0, 8.1, NULL, 476.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.13, 0.19, 30.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt bò khô  Dried beef', 'thit bo kho  dried beef'),
+('fao_vn_2007_7076_raw', 'Thịt trâu khô', '{}', 'Buffalo meat, dried', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 226.0, 50.4, 0.0, 2.7, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt trâu khô  Buffalo meat, dried', 'thit trau kho  buffalo meat, dried'),
+('fao_vn_2007_7077_raw', 'Xúc xích', '{}', 'Pork sausage', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 535.0, 27.2, 0.0, 47.4, 0.0, NULL, 7.0, 1.9, NULL, 139.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.34, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Xúc xích  Pork sausage', 'xuc xich  pork sausage'),
+('fao_vn_2007_7078_raw', 'Bột cóc', '{}', 'Toad meat powder', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 342.0, 55.4, 0.0, 13.4, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột cóc  Toad meat powder', 'bot coc  toad meat powder'),
+('fao_vn_2007_7079_raw', 'Châu chấu', '{}', 'Locust', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 20.0, 130.0, 24.3, 0.0, 3.6, 0.0, NULL, 210.0, 0.4, NULL, 270.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Châu chấu  Locust', 'chau chau  locust'),
+('fao_vn_2007_7080_raw', 'ếch (thịt đùi)', '{}', 'Frog', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 90.0, 20.0, 0.0, 1.1, 0.0, 58.0, 18.0, 1.5, 20.0, 147.0, 285.0, 1.0, 250.0, NULL, 0.0, 15.0, NULL, 1.0, 0.1, 0.0, 0.14, 0.25, 1.2, NULL, 0.12, 0.0, 0.4, NULL, '2026-02-26', 'ếch (thịt đùi)  Frog', 'ech (thit dui)  frog'),
+('fao_vn_2007_7081_raw', 'Nhộng', '{}', 'Silk worm', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 2.0, 111.0, 13.0, 0.0, 6.5, 0.0, NULL, 40.0, NULL, NULL, 109.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nhộng  Silk worm', 'nhong  silk worm'),
+('fao_vn_2007_7082_raw', 'Lòng gà (cả bộ)', '{}', 'Chicken giblets', 'Thịt và sản phẩm chế biến', 'Meat and meat products', 'FAO_VN_2007', 'raw', 0.0, 119.0, 17.9, 1.8, 4.5, 0.0, 77.0, 10.0, 5.86, 18.0, 197.0, 228.0, 3.32, 243.0, 0.15, 0.0, 2657.0, NULL, NULL, NULL, 16.0, 0.09, 0.99, 0.7, 3.208, 0.42, 0.0, 11.41, NULL, '2026-02-26', 'Lòng gà (cả bộ)  Chicken giblets', 'long ga (ca bo)  chicken giblets'),
+('fao_vn_2007_8001_raw', 'Cá bống', '{}', 'Goby, gudgeon', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 45.0, 70.0, 15.8, 0.0, 0.8, 0.0, NULL, 17.0, 0.9, NULL, 181.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.02, 0.04, 3.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá bống  Goby, gudgeon', 'ca bong  goby, gudgeon'),
+('fao_vn_2007_8002_raw', 'Cá chày', '{}', 'Pond fish', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 31.0, 113.0, 20.1, 0.0, 3.6, 0.0, NULL, 63.0, 0.2, NULL, 176.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá chày  Pond fish', 'ca chay  pond fish'),
+('fao_vn_2007_8003_raw', 'Cá chép', '{}', 'Carp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 96.0, 16.0, 0.0, 3.6, 0.0, 49.0, 17.0, 0.9, 30.0, 184.0, 397.0, 1.48, 57.0, 0.04, 0.0, 181.0, NULL, 0.63, 0.1, 0.0, 0.02, 0.04, 1.5, 0.75, 0.19, 0.0, 1.53, NULL, '2026-02-26', 'Cá chép  Carp', 'ca chep  carp'),
+('fao_vn_2007_8004_raw', 'Cá dưa', '{}', 'Conger pike', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 115.0, 17.6, 0.0, 5.0, 0.0, NULL, 64.0, NULL, NULL, 70.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá dưa  Conger pike', 'ca dua  conger pike'),
+('fao_vn_2007_8005_raw', 'Cá dầu', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 10.0, 96.0, 18.9, 0.0, 2.3, 0.0, NULL, 527.0, NULL, NULL, 885.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá dầu  ', 'ca dau  '),
+('fao_vn_2007_8006_raw', 'Cá diếc', '{}', 'Mullet, harder', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 45.0, 87.0, 17.7, 0.0, 1.8, 0.0, NULL, 70.0, 0.8, NULL, 152.0, NULL, NULL, NULL, NULL, 0.0, 120.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá diếc  Mullet, harder', 'ca diec  mullet, harder'),
+('fao_vn_2007_8007_raw', 'Cá đao', '{}', 'Sawfish, wolfherring', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 94.0, 18.3, 0.0, 2.3, 0.0, NULL, 36.0, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá đao  Sawfish, wolfherring', 'ca dao  sawfish, wolfherring'),
+('fao_vn_2007_8008_raw', 'Cá đé', '{}', 'Chinese herring', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 83.0, 18.7, 0.0, 0.9, 0.0, NULL, 80.0, NULL, NULL, 130.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá đé  Chinese herring', 'ca de  chinese herring'),
+('fao_vn_2007_8009_raw', 'Cá đối', '{}', 'Mullet, gray mullet', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 42.0, 108.0, 19.5, 0.0, 3.3, 0.0, 65.0, 21.0, 1.0, 29.0, 224.0, 357.0, 0.52, 51.0, 0.02, 0.0, 45.0, NULL, 1.0, 0.1, 0.0, 0.07, 0.15, 4.6, 0.76, 0.425, 0.0, 0.22, NULL, '2026-02-26', 'Cá đối  Mullet, gray mullet', 'ca doi  mullet, gray mullet'),
+('fao_vn_2007_8010_raw', 'Cá đồng tiền', '{}', 'Goby', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 98.0, 20.1, 0.0, 2.0, 0.0, NULL, 90.0, NULL, NULL, 100.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá đồng tiền  Goby', 'ca dong tien  goby'),
+('fao_vn_2007_8011_raw', 'Cá hồi', '{}', 'Salmon', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 136.0, 22.0, 0.0, 5.3, 0.0, 46.0, 13.0, 1.1, 31.0, 230.0, 423.0, 0.41, 51.0, 0.01, 0.0, 30.0, NULL, 0.65, 0.1, 0.0, 0.22, 0.07, 7.0, 0.823, 0.549, 0.0, 4.17, NULL, '2026-02-26', 'Cá hồi  Salmon', 'ca hoi  salmon'),
+('fao_vn_2007_8012_raw', 'Cá khô (chim, thu, nụ, đé)', '{}', 'Dried fish, miscellaneous', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 15.0, 208.0, 43.3, 0.0, 3.9, 0.0, NULL, 120.0, 0.9, NULL, 95.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.08, 0.31, 4.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá khô (chim, thu, nụ, đé)  Dried fish, miscellaneous', 'ca kho (chim, thu, nu, de)  dried fish, miscellaneous'),
+('fao_vn_2007_8013_raw', 'Cá lác', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 71.0, 16.7, 0.0, 0.5, 0.0, NULL, 80.0, NULL, NULL, 210.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá lác  ', 'ca lac  '),
+('fao_vn_2007_8014_raw', 'Cá mè', '{}', 'Hypophthalmichthys, chub, dory, tench bream', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 36.0, 144.0, 15.4, 0.0, 9.1, 0.0, NULL, 157.0, NULL, NULL, 215.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá mè  Hypophthalmichthys, chub, dory, tench bream', 'ca me  hypophthalmichthys, chub, dory, tench bream'),
+('fao_vn_2007_8015_raw', 'Cá mòi', '{}', 'Sardin', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 45.0, 124.0, 17.5, 0.0, 6.0, 0.0, 100.0, 80.0, 3.0, 24.0, 240.0, NULL, NULL, 170.0, NULL, 0.0, 20.0, NULL, NULL, NULL, 0.0, 0.02, 0.15, 10.1, NULL, 0.96, NULL, 0.14, NULL, '2026-02-26', 'Cá mòi  Sardin', 'ca moi  sardin'),
+('fao_vn_2007_8016_raw', 'Cá mỡ', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 151.0, 16.8, 0.0, 9.3, 0.0, NULL, 42.0, 1.4, NULL, 173.0, NULL, NULL, NULL, NULL, 0.0, 30.0, NULL, NULL, NULL, 0.0, 0.08, 0.21, 2.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá mỡ  ', 'ca mo  '),
+('fao_vn_2007_8017_raw', 'Cá mối', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 116.0, 22.1, 0.0, 3.1, 0.0, NULL, 60.0, NULL, NULL, 102.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá mối  ', 'ca moi  '),
+('fao_vn_2007_8018_raw', 'Cá nạc', '{}', 'Fish low fat', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 39.0, 80.0, 17.5, 0.0, 1.1, 0.0, NULL, 42.0, 1.4, NULL, 173.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.06, 0.08, 2.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá nạc  Fish low fat', 'ca nac  fish low fat'),
+('fao_vn_2007_8019_raw', 'Cá ngừ', '{}', 'Flying fish, tuna', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 42.0, 87.0, 21.0, 0.0, 0.3, 0.0, 78.0, 44.0, 1.0, 50.0, 206.0, 518.0, 0.52, 64.0, 0.01, 0.0, 5.0, NULL, 0.5, 0.1, 1.0, 0.02, 0.08, 4.0, 0.75, 0.9, 0.0, 0.52, 1.5, '2026-02-26', 'Cá ngừ  Flying fish, tuna', 'ca ngu  flying fish, tuna'),
+('fao_vn_2007_8020_raw', 'Cá nục', '{}', 'Scad, anchovy', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 111.0, 20.2, 0.0, 3.3, 0.0, 104.0, 85.0, 3.25, 41.0, 160.0, 383.0, 1.72, 211.0, 0.07, 0.0, 15.0, NULL, 0.57, 0.1, 0.0, 0.06, 0.26, 14.0, 0.645, 0.143, 0.0, 0.62, NULL, '2026-02-26', 'Cá nục  Scad, anchovy', 'ca nuc  scad, anchovy'),
+('fao_vn_2007_8021_raw', 'Cá phèn', '{}', 'Goatfish, surmullet, red mullet', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 104.0, 15.9, 0.0, 4.5, 0.0, NULL, 40.0, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá phèn  Goatfish, surmullet, red mullet', 'ca phen  goatfish, surmullet, red mullet'),
+('fao_vn_2007_8022_raw', 'Cá quả', '{}', 'Fish, snake head', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 97.0, 18.2, 0.0, 2.7, 0.0, NULL, 90.0, NULL, NULL, 240.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.12, 2.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá quả  Fish, snake head', 'ca qua  fish, snake head'),
+('fao_vn_2007_8023_raw', 'Cá rô đồng', '{}', 'Anabas', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 44.0, 126.0, 19.1, 0.0, 5.5, 0.0, NULL, 26.0, 0.25, NULL, 151.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá rô đồng  Anabas', 'ca ro dong  anabas'),
+('fao_vn_2007_8024_raw', 'Cá rô phi', '{}', 'Tilapia, African carp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 43.0, 100.0, 19.7, 0.0, 2.3, 0.0, NULL, 50.0, 0.53, NULL, 148.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá rô phi  Tilapia, African carp', 'ca ro phi  tilapia, african carp'),
+('fao_vn_2007_8025_raw', 'Cá thờn bơn (cá bơn)', '{}', 'Flounder, sole, turbot', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', NULL, 73.0, 17.4, 0.0, 0.4, 0.0, NULL, 36.0, NULL, NULL, 45.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá thờn bơn (cá bơn)  Flounder, sole, turbot', 'ca thon bon (ca bon)  flounder, sole, turbot'),
+('fao_vn_2007_8026_raw', 'Cá thu', '{}', 'Mackerel, codfish, kingfish', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 166.0, 18.2, 0.0, 10.3, 0.0, 110.0, 50.0, 1.3, 35.0, 90.0, 486.0, NULL, 200.0, NULL, 0.0, 10.0, NULL, NULL, NULL, 0.0, 0.07, 0.17, 6.6, NULL, NULL, NULL, NULL, 7.0, '2026-02-26', 'Cá thu  Mackerel, codfish, kingfish', 'ca thu  mackerel, codfish, kingfish'),
+('fao_vn_2007_8027_raw', 'Cá thu đao', '{}', '', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 30.0, 156.0, 20.0, 0.0, 8.4, 0.0, 86.0, 22.0, 3.0, 28.0, 190.0, 406.0, 0.67, 93.0, 0.02, 0.0, 35.0, NULL, 1.0, 0.1, 0.0, 0.05, 0.1, 6.0, 0.316, 0.33, 0.0, 4.4, NULL, '2026-02-26', 'Cá thu đao  ', 'ca thu dao  '),
+('fao_vn_2007_8028_raw', 'Cá trạch (cá chạch)', '{}', 'Loach', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 26.0, 110.0, 20.4, 0.0, 3.2, 0.0, NULL, 109.0, 0.2, NULL, 231.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá trạch (cá chạch)  Loach', 'ca trach (ca chach)  loach'),
+('fao_vn_2007_8029_raw', 'Cá trắm cỏ', '{}', 'Carp, amur', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 91.0, 17.0, 0.0, 2.6, 0.0, NULL, 57.0, 0.1, NULL, 145.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá trắm cỏ  Carp, amur', 'ca tram co  carp, amur'),
+('fao_vn_2007_8030_raw', 'Cá trê', '{}', 'Catfish, silurus, sheatfish, hito', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 173.0, 16.5, 0.0, 11.9, 0.0, 53.0, 20.0, 1.0, 23.0, 210.0, 299.0, 0.74, 101.0, 0.02, 0.0, 93.0, NULL, 1.2, 0.1, 0.0, 0.1, 0.04, 1.4, 0.6, 0.188, 0.0, 2.47, NULL, '2026-02-26', 'Cá trê  Catfish, silurus, sheatfish, hito', 'ca tre  catfish, silurus, sheatfish, hito'),
+('fao_vn_2007_8031_raw', 'Cá trích', '{}', 'Herring', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 166.0, 17.7, 0.0, 10.6, 0.0, 160.0, 64.0, 2.8, 32.0, 174.0, 423.0, 0.53, 300.0, 0.02, 0.0, 20.0, NULL, NULL, NULL, 0.0, 0.02, 0.18, 5.0, 1.0, 0.45, 0.0, 10.0, 10.0, '2026-02-26', 'Cá trích  Herring', 'ca trich  herring'),
+('fao_vn_2007_8032_raw', 'Cá trôi', '{}', 'Major carp, mud carp; cirrhina molitorella', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 27.6, 127.0, 18.8, 0.0, 5.7, 0.0, NULL, 76.0, 0.05, NULL, 185.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá trôi  Major carp, mud carp; cirrhina molitorella', 'ca troi  major carp, mud carp; cirrhina molitorella'),
+('fao_vn_2007_8033_raw', 'Cua bể', '{}', 'Crab, sea water', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 40.0, 103.0, 17.5, 7.0, 0.6, 0.0, 316.0, 141.0, 3.8, 48.0, 191.0, 322.0, 1.4, NULL, NULL, 0.0, 36.0, NULL, NULL, NULL, 0.0, 0.03, 0.71, 2.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cua bể  Crab, sea water', 'cua be  crab, sea water'),
+('fao_vn_2007_8034_raw', 'Cua đồng', '{}', 'Crab, fresh water', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 69.0, 87.0, 12.3, 2.0, 3.3, 0.0, 453.0, 120.0, 1.4, NULL, 171.0, 266.0, NULL, NULL, NULL, 0.0, 210.0, NULL, NULL, NULL, 0.0, 0.01, 0.51, 2.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cua đồng  Crab, fresh water', 'cua dong  crab, fresh water'),
+('fao_vn_2007_8035_raw', 'ghẹ', '{}', 'Crab', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 68.0, 54.0, 11.9, 0.0, 0.7, 0.0, 293.0, 89.0, 0.74, 34.0, 229.0, 329.0, 3.54, 669.0, 0.15, 0.0, 2.0, NULL, NULL, NULL, 0.0, 0.03, 0.71, 2.7, 0.35, 0.15, 0.0, 9.0, NULL, '2026-02-26', 'ghẹ  Crab', 'ghe  crab'),
+('fao_vn_2007_8036_raw', 'Hải sâm', '{}', 'Sea slug, sea cucumber', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 90.0, 21.5, 0.2, 0.3, 0.0, NULL, 118.0, 1.4, NULL, 22.0, NULL, NULL, NULL, NULL, 0.0, 102.0, NULL, NULL, NULL, 0.0, 0.01, 0.02, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hải sâm  Sea slug, sea cucumber', 'hai sam  sea slug, sea cucumber'),
+('fao_vn_2007_8037_raw', 'Hến', '{}', 'Clam', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 82.0, 45.0, 4.5, 5.1, 0.7, 0.0, NULL, 144.0, 1.6, NULL, 86.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, 0.12, 2.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Hến  Clam', 'hen  clam'),
+('fao_vn_2007_8038_raw', 'Lươn', '{}', 'Eel, silver - pike', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 35.0, 180.0, 18.4, 0.2, 11.7, 0.0, 51.0, 35.0, 1.0, 20.0, 164.0, 272.0, 1.62, 23.0, 0.04, 0.0, 1800.0, NULL, 4.0, 0.0, 0.0, 0.15, 0.31, 3.8, 0.24, 0.067, 0.0, 3.0, NULL, '2026-02-26', 'Lươn  Eel, silver - pike', 'luon  eel, silver - pike'),
+('fao_vn_2007_8039_raw', 'Mực khô', '{}', 'Dried cuttle fish, squid', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 4.0, 291.0, 60.1, 2.5, 4.5, 0.0, NULL, 27.0, 5.6, NULL, 287.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.13, 0.17, 6.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mực khô  Dried cuttle fish, squid', 'muc kho  dried cuttle fish, squid'),
+('fao_vn_2007_8040_raw', 'Mực tươi', '{}', 'Cuttle fish, raw (Squid)', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 22.0, 73.0, 16.3, 0.0, 0.9, 0.0, 44.0, 14.0, 0.6, 33.0, 150.0, 273.0, 0.7, 1891.0, 0.04, 0.0, 10.0, NULL, 1.2, 0.0, 5.0, 0.01, 0.06, 1.0, 0.5, 0.056, 0.0, 1.3, NULL, '2026-02-26', 'Mực tươi  Cuttle fish, raw (Squid)', 'muc tuoi  cuttle fish, raw (squid)'),
+('fao_vn_2007_8041_raw', 'ốc bươu', '{}', 'Snail medium - size, edible', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 67.0, 84.0, 11.1, 8.3, 0.7, 0.0, NULL, 1310.0, NULL, NULL, 64.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'ốc bươu  Snail medium - size, edible', 'oc buou  snail medium - size, edible'),
+('fao_vn_2007_8042_raw', 'ốc đá', '{}', 'Marble snail, edible', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 80.0, 63.0, 11.2, 3.9, 0.3, 0.0, NULL, 1660.0, NULL, NULL, 83.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'ốc đá  Marble snail, edible', 'oc da  marble snail, edible'),
+('fao_vn_2007_8043_raw', 'ốc nhồi', '{}', 'Snail large, edible', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 79.0, 84.0, 11.9, 7.6, 0.7, 0.0, NULL, 1357.0, NULL, NULL, 191.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.05, 0.17, 2.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'ốc nhồi  Snail large, edible', 'oc nhoi  snail large, edible'),
+('fao_vn_2007_8044_raw', 'ốc vặn', '{}', 'Helix', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 70.0, 72.0, 12.2, 4.3, 0.7, 0.0, NULL, 1356.0, NULL, NULL, 51.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'ốc vặn  Helix', 'oc van  helix'),
+('fao_vn_2007_8045_cooked', 'Rạm (muối, đồ)', '{}', 'Small sea - crab bicled, steamed', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'cooked', 50.0, 83.0, 14.2, 0.0, 2.9, 0.0, NULL, 4820.0, NULL, NULL, 330.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rạm (muối, đồ)  Small sea - crab bicled, steamed', 'ram (muoi, do)  small sea - crab bicled, steamed'),
+('fao_vn_2007_8046_raw', 'Rạm tươi', '{}', 'Small sea - crab', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 50.0, 77.0, 12.9, 0.0, 2.8, 0.0, NULL, 3520.0, NULL, NULL, 180.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rạm tươi  Small sea - crab', 'ram tuoi  small sea - crab'),
+('fao_vn_2007_8047_raw', 'Rươi', '{}', 'Tylorhynchus sinensis', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 5.0, 89.0, 12.4, 0.0, 4.4, 0.0, NULL, 66.0, 1.8, NULL, 57.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rươi  Tylorhynchus sinensis', 'ruoi  tylorhynchus sinensis'),
+('fao_vn_2007_8048_raw', 'Sò', '{}', 'Oyster', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 80.0, 78.0, 9.5, 4.9, 2.3, 0.0, 380.0, 37.0, 1.9, 42.0, 82.0, 223.0, 13.4, 1576.0, 0.6, 0.0, 53.0, NULL, NULL, NULL, 0.0, 0.03, 0.15, 1.7, 0.5, 0.05, 0.0, 16.0, 41.0, '2026-02-26', 'Sò  Oyster', 'so  oyster'),
+('fao_vn_2007_8049_raw', 'Tép gạo', '{}', 'Tiny shrimp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 8.0, 58.0, 11.7, 0.0, 1.2, 0.0, NULL, 910.0, NULL, NULL, 218.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tép gạo  Tiny shrimp', 'tep gao  tiny shrimp'),
+('fao_vn_2007_8050_raw', 'Tép khô', '{}', 'Tiny shrimp, dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 5.0, 269.0, 59.8, 0.7, 3.0, 0.0, NULL, 2000.0, 5.5, NULL, 605.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.07, 2.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tép khô  Tiny shrimp, dried', 'tep kho  tiny shrimp, dried'),
+('fao_vn_2007_8051_raw', 'Tôm biển', '{}', 'Sea shrimp, sea-water shrimp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 54.0, 82.0, 17.6, 0.9, 0.9, 0.0, 148.0, 79.0, 1.6, 37.0, 184.0, 185.0, 1.11, 264.0, 0.05, 5.0, 20.0, NULL, 1.1, 0.0, 0.0, 0.04, 0.08, 2.3, 0.276, 0.104, 0.0, 1.16, 5.0, '2026-02-26', 'Tôm biển  Sea shrimp, sea-water shrimp', 'tom bien  sea shrimp, sea-water shrimp'),
+('fao_vn_2007_8052_raw', 'Tôm đồng', '{}', 'Fresh-water shrimp', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 10.0, 90.0, 18.4, 0.0, 1.8, 0.0, 418.0, 1120.0, 2.2, 42.0, 150.0, 316.0, NULL, NULL, NULL, NULL, 15.0, NULL, NULL, NULL, 0.0, 0.02, 0.03, 3.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tôm đồng  Fresh-water shrimp', 'tom dong  fresh-water shrimp'),
+('fao_vn_2007_8053_raw', 'Tôm khô', '{}', 'Shrimp, dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 5.0, 347.0, 75.6, 2.5, 3.8, 0.0, NULL, 236.0, 4.6, NULL, 995.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, 0.16, 0.34, 9.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tôm khô  Shrimp, dried', 'tom kho  shrimp, dried'),
+('fao_vn_2007_8054_raw', 'Trai', '{}', 'Manodonta', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 60.0, 38.0, 4.6, 2.5, 1.1, 0.0, 56.0, 668.0, 1.5, 9.0, 107.0, 314.0, 1.37, 344.0, 0.5, 0.0, 90.0, NULL, 0.31, 0.2, 0.0, 0.02, 0.46, 3.1, 0.362, 0.06, 0.0, 49.44, NULL, '2026-02-26', 'Trai  Manodonta', 'trai  manodonta'),
+('fao_vn_2007_8055_cooked', 'Bánh phồng tôm rán', '{}', 'Deep fried shrimp paste', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'cooked', 0.0, 676.0, 1.6, 34.1, 59.2, 0.0, NULL, 175.0, NULL, NULL, 30.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh phồng tôm rán  Deep fried shrimp paste', 'banh phong tom ran  deep fried shrimp paste'),
+('fao_vn_2007_8056_raw', 'Bánh phồng tôm sống', '{}', 'Shrimp paste', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 381.0, 3.4, 75.3, 7.4, 0.0, NULL, 258.0, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh phồng tôm sống  Shrimp paste', 'banh phong tom song  shrimp paste'),
+('fao_vn_2007_8057_raw', 'Bột cá', '{}', 'Fish flour with bones', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 323.0, 71.2, 3.0, 2.9, 0.0, NULL, 505.0, 50.0, NULL, 207.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.38, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột cá  Fish flour with bones', 'bot ca  fish flour with bones'),
+('fao_vn_2007_8058_raw', 'Ruốc cá quả', '{}', 'Shredded snake-head fish, salted and dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 312.0, 65.7, 3.0, 4.1, 0.0, NULL, 26.0, NULL, NULL, 654.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ruốc cá quả  Shredded snake-head fish, salted and dried', 'ruoc ca qua  shredded snake-head fish, salted and dried'),
+('fao_vn_2007_8059_raw', 'Ruốc tôm', '{}', 'Shredded shrimp, salted and dried', 'Thủy sản và sản phẩm chế biến', 'Fish, shellfish and products', 'FAO_VN_2007', 'raw', 0.0, 305.0, 65.5, 3.7, 3.1, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Ruốc tôm  Shredded shrimp, salted and dried', 'ruoc tom  shredded shrimp, salted and dried'),
+('fao_vn_2007_9001_raw', 'Trứng gà', '{}', 'Hen egg, raw, whole', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 14.0, 166.0, 14.8, 0.5, 11.6, 0.0, 158.0, 55.0, 2.7, 11.0, 210.0, 176.0, 0.9, 55.0, 0.04, 0.0, 700.0, 0.88, 0.97, 0.3, 0.0, 0.16, 0.31, 0.2, 1.438, 0.143, 0.0, 1.29, 25.0, '2026-02-26', 'Trứng gà  Hen egg, raw, whole', 'trung ga  hen egg, raw, whole'),
+('fao_vn_2007_9002_raw', 'Lòng đỏ trứng gà', '{}', 'Hen egg, yolk', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 327.0, 13.6, 1.0, 29.8, 0.0, 108.0, 134.0, 7.0, 14.0, 532.0, 169.0, 3.7, 125.0, 0.06, 88.0, 960.0, 2.68, 2.58, 0.7, 0.0, 0.32, 0.52, 0.0, 2.99, 0.35, 0.0, 1.95, 60.0, '2026-02-26', 'Lòng đỏ trứng gà  Hen egg, yolk', 'long do trung ga  hen egg, yolk'),
+('fao_vn_2007_9003_raw', 'Lòng trắng trứng gà', '{}', 'Hen egg, white', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 46.0, 10.3, 1.0, 0.1, 0.0, 215.0, 19.0, 0.3, 7.0, 16.0, 172.0, 0.2, 25.0, 0.01, 0.0, 0.0, NULL, NULL, NULL, 0.0, 0.01, 0.26, 0.1, 0.19, 0.005, 0.0, 0.09, 0.0, '2026-02-26', 'Lòng trắng trứng gà  Hen egg, white', 'long trang trung ga  hen egg, white'),
+('fao_vn_2007_9004_raw', 'Trứng vịt', '{}', 'Duck egg, whole', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 12.0, 184.0, 13.0, 1.0, 14.2, 0.0, 191.0, 71.0, 3.2, 17.0, 210.0, 258.0, 0.8, 62.0, 0.04, 14.0, 360.0, NULL, 1.34, 0.4, 0.0, 0.15, 0.3, 0.1, 1.862, 0.25, 0.0, 5.4, NULL, '2026-02-26', 'Trứng vịt  Duck egg, whole', 'trung vit  duck egg, whole'),
+('fao_vn_2007_9005_raw', 'Lòng đỏ trứng vịt', '{}', 'Duck egg, yolk', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 364.0, 13.6, 4.8, 32.3, 0.0, NULL, 146.0, 5.6, NULL, 328.0, NULL, NULL, NULL, NULL, 695.0, 1625.0, NULL, NULL, NULL, 0.0, 0.54, 0.94, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lòng đỏ trứng vịt  Duck egg, yolk', 'long do trung vit  duck egg, yolk'),
+('fao_vn_2007_9006_raw', 'Lòng trắng trứng vịt', '{}', 'Duck egg, white', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 47.0, 10.7, 0.8, 0.1, 0.0, NULL, 6.0, NULL, NULL, 8.0, NULL, NULL, NULL, NULL, 0.0, 0.0, NULL, NULL, NULL, 0.0, NULL, 0.2, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lòng trắng trứng vịt  Duck egg, white', 'long trang trung vit  duck egg, white'),
+('fao_vn_2007_9007_raw', 'Trứng chim cút', '{}', 'Quail egg', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 11.0, 154.0, 13.1, 0.4, 11.1, 0.0, 141.0, 64.0, 3.65, 13.0, 226.0, 132.0, 1.47, 62.0, 0.04, 11.0, 155.0, NULL, 1.08, 0.3, 0.0, 0.13, 0.79, 0.2, 1.761, 0.15, 0.0, 1.58, NULL, '2026-02-26', 'Trứng chim cút  Quail egg', 'trung chim cut  quail egg'),
+('fao_vn_2007_9008_raw', 'Trứng cá', '{}', 'Fish roe', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 171.0, 20.5, 0.0, 9.9, 0.0, NULL, 28.0, 1.1, NULL, 230.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 24.0, 0.93, 0.65, 1.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Trứng cá  Fish roe', 'trung ca  fish roe'),
+('fao_vn_2007_9009_raw', 'Trứng cá muối', '{}', 'Fish caviar, black and red, granule', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 274.0, 24.6, 3.5, 17.9, 0.0, 1500.0, 275.0, 11.88, 300.0, 356.0, 181.0, 0.95, 110.0, 0.05, 0.0, 561.0, 5.8, 7.0, 0.7, 0.0, 0.19, 0.62, 0.1, 3.5, 0.32, 0.0, 20.0, NULL, '2026-02-26', 'Trứng cá muối  Fish caviar, black and red, granule', 'trung ca muoi  fish caviar, black and red, granule'),
+('fao_vn_2007_9010_raw', 'Trứng vịt lộn', '{}', 'Duck egg, embryonated', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 12.0, 182.0, 13.6, 4.0, 12.4, 0.0, NULL, 82.0, 3.0, NULL, 212.0, NULL, NULL, NULL, NULL, 435.0, 875.0, NULL, NULL, NULL, 3.0, 0.12, 0.25, 0.8, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Trứng vịt lộn  Duck egg, embryonated', 'trung vit lon  duck egg, embryonated'),
+('fao_vn_2007_9011_raw', 'Bột trứng', '{}', 'Chicken egg powder', 'Trứng và sản phẩm chế biến', 'Egg and products', 'FAO_VN_2007', 'raw', 0.0, 563.0, 44.0, 1.8, 42.2, 0.0, NULL, 186.0, 9.3, NULL, 786.0, NULL, NULL, NULL, NULL, 770.0, 1340.0, NULL, NULL, NULL, NULL, 0.35, 1.23, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bột trứng  Chicken egg powder', 'bot trung  chicken egg powder'),
+('fao_vn_2007_10001_raw', 'Sữa bò tươi', '{}', 'Milk cow, fresh (fluid)', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 74.0, 3.9, 4.8, 4.4, 0.0, 380.0, 120.0, 0.1, 16.0, 95.0, 143.0, 0.4, 20.0, 0.0, 22.0, 50.0, 1.0, 0.06, 0.2, 1.0, 0.05, 0.19, 0.1, 0.362, 0.036, 0.0, 0.44, 1.4, '2026-02-26', 'Sữa bò tươi  Milk cow, fresh (fluid)', 'sua bo tuoi  milk cow, fresh (fluid)'),
+('fao_vn_2007_10002_raw', 'Sữa dê tươi', '{}', 'Milk goat''s, whole', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 69.0, 3.5, 4.5, 4.1, 0.0, 50.0, 147.0, 0.1, 14.0, 126.0, 204.0, 0.3, 46.0, 0.02, 20.0, 50.0, 0.3, 0.07, 0.3, 3.0, 0.04, 0.18, 0.3, 0.31, 0.046, 0.0, 0.07, 2.0, '2026-02-26', 'Sữa dê tươi  Milk goat''s, whole', 'sua de tuoi  milk goat''s, whole'),
+('fao_vn_2007_10003_raw', 'Sữa mẹ (sữa người)', '{}', 'Breast milk (Human milk, whole).', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 61.0, 1.5, 7.0, 3.0, 0.0, 15.0, 34.0, 0.1, 2.0, 15.0, 41.0, 0.4, 14.0, 0.01, 1.0, 90.0, 0.1, 0.08, 0.3, 6.0, 0.01, 0.04, 0.1, 0.223, 0.011, 0.0, 0.05, 0.7, '2026-02-26', 'Sữa mẹ (sữa người)  Breast milk (Human milk, whole).', 'sua me (sua nguoi)  breast milk (human milk, whole).'),
+('fao_vn_2007_10004_raw', 'Sữa chua (từ sữa bò)', '{}', 'Yogurt (whole milk)', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 61.0, 3.3, 3.6, 3.7, 0.0, 46.0, 120.0, 0.1, 12.0, 95.0, 155.0, 0.59, 9.0, 0.0, 11.0, 25.0, NULL, NULL, NULL, 1.0, 0.04, 0.2, 0.1, 0.389, 0.032, 0.0, 0.37, NULL, '2026-02-26', 'Sữa chua (từ sữa bò)  Yogurt (whole milk)', 'sua chua (tu sua bo)  yogurt (whole milk)'),
+('fao_vn_2007_10005_raw', 'Sữa chua vớt béo', '{}', 'Yogurt, chocolate, nonfat milk', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 103.0, 3.5, 22.3, 0.0, 1.2, 135.0, 143.0, 0.06, 40.0, 109.0, 339.0, 1.13, 209.0, NULL, NULL, 4.0, NULL, 0.0, 0.0, 1.0, 0.04, 0.2, 0.1, NULL, 0.047, 0.0, 0.5, NULL, '2026-02-26', 'Sữa chua vớt béo  Yogurt, chocolate, nonfat milk', 'sua chua vot beo  yogurt, chocolate, nonfat milk'),
+('fao_vn_2007_10006_raw', 'Sữa bột toàn phần', '{}', 'Milk powder, whole', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 494.0, 27.0, 38.0, 26.0, 0.0, 371.0, 939.0, 1.1, 85.0, 790.0, 1330.0, 3.34, 80.0, 0.04, 43.0, 318.0, 7.8, 0.48, 1.8, 10.0, 0.24, 1.31, 0.7, 2.271, 0.302, 0.0, 3.25, 10.0, '2026-02-26', 'Sữa bột toàn phần  Milk powder, whole', 'sua bot toan phan  milk powder, whole'),
+('fao_vn_2007_10007_raw', 'Sữa bột tách béo', '{}', 'Skimmed milk powder', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 357.0, 35.0, 52.0, 1.0, 0.0, 535.0, 1400.0, 0.45, 110.0, 980.0, 1794.0, 4.08, 41.0, 0.02, 1.0, 6.0, 8.3, 0.0, 0.1, 6.0, 0.42, 0.6, 1.2, 3.568, 0.361, 0.0, 4.03, 16.0, '2026-02-26', 'Sữa bột tách béo  Skimmed milk powder', 'sua bot tach beo  skimmed milk powder'),
+('fao_vn_2007_10008_raw', 'Sữa đặc có đường Việt Nam', '{}', 'Milk condensed, sweetened', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 336.0, 8.1, 56.0, 8.8, 0.0, NULL, 307.0, 0.6, NULL, 219.0, NULL, NULL, NULL, NULL, 50.0, 58.0, NULL, NULL, NULL, 0.0, 0.06, 0.3, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Sữa đặc có đường Việt Nam  Milk condensed, sweetened', 'sua dac co duong viet nam  milk condensed, sweetened'),
+('fao_vn_2007_10009_raw', 'Pho mát', '{}', 'Cheese (whole fat)', 'Sữa và sản phẩm chế biến', 'Milk and products', 'FAO_VN_2007', 'raw', 0.0, 380.0, 25.5, 0.0, 30.9, 0.0, 621.0, 760.0, 0.5, 28.0, 424.0, 98.0, 3.11, 31.0, 0.01, 118.0, 275.0, 0.3, 0.29, 2.8, 1.0, 0.1, 0.51, 0.1, 0.413, 0.074, 0.0, 0.83, 1.7, '2026-02-26', 'Pho mát  Cheese (whole fat)', 'pho mat  cheese (whole fat)'),
+('fao_vn_2007_11001_raw', 'Chuối nước đường', '{}', 'Banana, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 58.0, 0.5, 13.9, 0.0, 1.3, NULL, 12.0, 0.6, NULL, 160.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 9.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Chuối nước đường  Banana, canned, sweetened', 'chuoi nuoc duong  banana, canned, sweetened'),
+('fao_vn_2007_11002_raw', 'Dưa chuột hộp', '{}', 'Cucumber (canned)', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 8.0, 0.3, 1.2, 0.2, 3.1, 1208.0, 12.0, 0.3, 4.0, 16.0, 23.0, 0.02, 85.0, 0.01, 55.0, NULL, NULL, 0.06, 13.0, 2.0, 0.02, 0.03, 0.1, 0.038, 0.009, 0.0, 0.0, NULL, '2026-02-26', 'Dưa chuột hộp  Cucumber (canned)', 'dua chuot hop  cucumber (canned)'),
+('fao_vn_2007_11003_raw', 'Dứa hộp', '{}', 'Pineapple, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 53.0, 0.4, 12.7, 0.1, 0.8, 1.0, 20.0, 0.3, 16.0, 12.0, 105.0, 0.12, 103.0, 1.1, 23.0, NULL, NULL, 0.01, 0.3, 14.0, 0.06, 0.01, 0.2, 0.1, 0.074, 0.0, 0.0, NULL, '2026-02-26', 'Dứa hộp  Pineapple, canned, sweetened', 'dua hop  pineapple, canned, sweetened'),
+('fao_vn_2007_11004_cooked', 'Lạc chao dầu', '{}', 'Peanut, oil fried', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'cooked', 0.0, 680.0, 25.7, 10.3, 59.5, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Lạc chao dầu  Peanut, oil fried', 'lac chao dau  peanut, oil fried'),
+('fao_vn_2007_11005_raw', 'Mắc coọc nước đường', '{}', 'Pyrus pachis in syrup', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 56.0, 0.2, 13.7, 0.0, 0.7, NULL, 20.0, 0.4, NULL, 16.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 14.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mắc coọc nước đường  Pyrus pachis in syrup', 'mac cooc nuoc duong  pyrus pachis in syrup'),
+('fao_vn_2007_11006_raw', 'Mận nước đường', '{}', 'Plum, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 10.0, 64.0, 0.4, 15.4, 0.1, 0.9, 20.0, 16.0, 0.86, 5.0, 15.0, 93.0, 0.08, 38.0, 0.03, 127.0, NULL, NULL, 0.18, 4.3, 0.0, 0.02, 0.04, 0.3, 0.072, 0.027, 0.0, 0.0, NULL, '2026-02-26', 'Mận nước đường  Plum, canned, sweetened', 'man nuoc duong  plum, canned, sweetened'),
+('fao_vn_2007_11007_raw', 'Mứt bí ngô', '{}', 'Dried preserved squash', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 198.0, 0.5, 49.1, 0.0, 0.7, NULL, 32.0, NULL, NULL, 92.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mứt bí ngô  Dried preserved squash', 'mut bi ngo  dried preserved squash'),
+('fao_vn_2007_11008_raw', 'Mứt cam có vỏ', '{}', 'Orange marmalade, jellies', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 218.0, 0.4, 54.2, 0.0, 2.2, NULL, 28.0, 0.26, NULL, 22.0, NULL, NULL, NULL, NULL, 50.0, NULL, NULL, NULL, NULL, NULL, 0.03, 0.01, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mứt cam có vỏ  Orange marmalade, jellies', 'mut cam co vo  orange marmalade, jellies'),
+('fao_vn_2007_11009_raw', 'Mứt chuối', '{}', 'Banana jam', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 218.0, 0.7, 53.9, 0.0, 1.3, NULL, 28.0, 0.3, NULL, 28.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mứt chuối  Banana jam', 'mut chuoi  banana jam'),
+('fao_vn_2007_11010_raw', 'Mứt dứa', '{}', 'Pineapple jam', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 208.0, 0.5, 51.5, 0.0, 0.4, NULL, 20.0, 0.3, NULL, 16.0, NULL, NULL, NULL, NULL, 20.0, NULL, NULL, NULL, NULL, 13.0, 0.09, 0.05, 0.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mứt dứa  Pineapple jam', 'mut dua  pineapple jam'),
+('fao_vn_2007_11011_raw', 'Mứt đu đủ', '{}', 'Papaya jam', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 178.0, 0.4, 44.1, 0.0, 2.0, NULL, 24.0, NULL, NULL, 30.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-27', 'Mứt đu đủ  Papaya jam', 'mut du du  papaya jam'),
+('fao_vn_2007_11012_raw', 'Nhãn nước đường', '{}', 'Longan, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 62.0, 0.5, 15.0, 0.0, 1.0, NULL, 12.0, 0.3, NULL, 230.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 32.0, NULL, 0.04, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nhãn nước đường  Longan, canned, sweetened', 'nhan nuoc duong  longan, canned, sweetened'),
+('fao_vn_2007_11013_raw', 'Nước dứa hộp', '{}', 'Pineapple juice', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 53.0, 0.4, 12.6, 0.1, 0.2, 2.0, 32.0, 0.3, 12.0, 12.0, 130.0, 0.11, 69.0, 0.5, 3.0, NULL, NULL, 0.02, 0.3, 41.0, 0.04, 0.01, 0.2, 0.056, 0.1, 0.0, 0.0, NULL, '2026-02-26', 'Nước dứa hộp  Pineapple juice', 'nuoc dua hop  pineapple juice'),
+('fao_vn_2007_11014_raw', 'Vải nước đường', '{}', 'Litchi, canned, sweetened', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 60.0, 0.4, 14.7, 0.0, 1.1, NULL, 8.0, 0.6, NULL, 160.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 10.0, NULL, 0.04, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Vải nước đường  Litchi, canned, sweetened', 'vai nuoc duong  litchi, canned, sweetened'),
+('fao_vn_2007_11015_raw', 'Cá thu hộp', '{}', 'Mackerel, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 207.0, 24.8, 0.0, 12.0, NULL, NULL, 50.0, 1.6, NULL, 260.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, 0.02, 0.1, 6.5, NULL, NULL, NULL, NULL, 7.0, '2026-02-26', 'Cá thu hộp  Mackerel, canned', 'ca thu hop  mackerel, canned'),
+('fao_vn_2007_11016_raw', 'Cá trích hộp', '{}', 'Herring, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 233.0, 22.3, 3.5, 14.4, NULL, NULL, 86.0, 2.3, NULL, 437.0, NULL, NULL, NULL, NULL, 0.0, 28.0, NULL, NULL, NULL, NULL, 0.02, 0.12, 2.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cá trích hộp  Herring, canned', 'ca trich hop  herring, canned'),
+('fao_vn_2007_11017_raw', 'Thịt bò hộp', '{}', 'Beef, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 251.0, 16.4, 0.0, 20.6, NULL, NULL, 13.0, 2.9, NULL, 250.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, 0.23, 2.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt bò hộp  Beef, canned', 'thit bo hop  beef, canned'),
+('fao_vn_2007_11018_raw', 'Thịt gà hộp', '{}', 'Chicken, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 273.0, 17.0, 0.0, 22.8, NULL, NULL, 108.0, 2.8, NULL, 138.0, NULL, NULL, NULL, NULL, 0.0, 520.0, NULL, NULL, NULL, NULL, 0.09, 0.37, 2.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt gà hộp  Chicken, canned', 'thit ga hop  chicken, canned'),
+('fao_vn_2007_11019_raw', 'Thịt lợn hộp', '{}', 'Pork, canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 344.0, 17.3, 2.7, 29.3, NULL, NULL, 9.0, 1.2, NULL, 200.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.19, 0.21, 3.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt lợn hộp  Pork, canned', 'thit lon hop  pork, canned'),
+('fao_vn_2007_11020_raw', 'Thịt lợn, thịt bò xay hộp', '{}', 'Pork and beef, minced canned', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 244.0, 16.0, 0.0, 20.0, NULL, NULL, 8.0, 2.1, NULL, 120.0, NULL, NULL, NULL, NULL, 0.0, 8.0, NULL, NULL, NULL, 1.0, 0.26, 0.19, 5.5, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt lợn, thịt bò xay hộp  Pork and beef, minced canned', 'thit lon, thit bo xay hop  pork and beef, minced canned'),
+('fao_vn_2007_11021_raw', 'Thịt vịt hầm', '{}', 'Duck, stewed meat', 'Đồ hộp', 'Canned food', 'FAO_VN_2007', 'raw', 0.0, 224.0, 19.6, 0.0, 16.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Thịt vịt hầm  Duck, stewed meat', 'thit vit ham  duck, stewed meat'),
+('fao_vn_2007_12001_raw', 'Bánh bích cốt', '{}', 'Whole wheat rusk', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 346.0, 12.3, 71.3, 1.3, 0.8, NULL, 39.0, 2.7, NULL, 231.0, NULL, NULL, NULL, NULL, 13.0, 86.0, NULL, NULL, NULL, 0.0, 0.36, 0.18, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh bích cốt  Whole wheat rusk', 'banh bich cot  whole wheat rusk'),
+('fao_vn_2007_12002_raw', 'Bánh bích quy', '{}', 'Biscuits', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 376.0, 8.8, 75.1, 4.5, 0.5, NULL, 75.0, 3.6, NULL, 79.0, NULL, NULL, NULL, NULL, 75.0, 19.0, NULL, NULL, NULL, 0.0, 0.4, 0.26, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh bích quy  Biscuits', 'banh bich quy  biscuits'),
+('fao_vn_2007_12003_raw', 'Bánh chả', '{}', 'Sweet meat pie in lumps', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 395.0, 3.4, 80.5, 6.6, 1.0, NULL, 42.0, 1.9, NULL, 29.0, NULL, NULL, NULL, NULL, 5.0, NULL, NULL, NULL, NULL, 0.0, 0.04, 0.07, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh chả  Sweet meat pie in lumps', 'banh cha  sweet meat pie in lumps'),
+('fao_vn_2007_12004_raw', 'Bánh con cá', '{}', 'Small biscuits, fish figured', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 368.0, 7.5, 79.6, 2.2, 0.2, NULL, 54.0, 2.9, NULL, 99.0, NULL, NULL, NULL, NULL, 5.0, NULL, NULL, NULL, NULL, 0.0, 0.13, 0.13, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh con cá  Small biscuits, fish figured', 'banh con ca  small biscuits, fish figured'),
+('fao_vn_2007_12005_raw', 'Bánh đậu xanh', '{}', 'Mungbean cake', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 416.0, 15.6, 62.4, 11.5, 1.1, NULL, 111.0, 3.4, NULL, 273.0, NULL, NULL, NULL, NULL, 105.0, NULL, NULL, NULL, NULL, 0.0, 0.2, 0.15, 6.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh đậu xanh  Mungbean cake', 'banh dau xanh  mungbean cake'),
+('fao_vn_2007_12006_raw', 'Bánh kem xốp', '{}', 'Wafers filled', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 492.0, 8.3, 60.7, 24.0, 3.5, NULL, 86.0, 0.8, NULL, 125.0, NULL, NULL, NULL, NULL, 0.0, 84.0, NULL, NULL, NULL, 0.0, 0.12, 0.31, 0.6, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh kem xốp  Wafers filled', 'banh kem xop  wafers filled'),
+('fao_vn_2007_12007_raw', 'Bánh khảo chay', '{}', 'Rice cake, plain', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 376.0, 3.2, 90.2, 0.3, 0.2, NULL, 2.0, 0.1, NULL, 1.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.04, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh khảo chay  Rice cake, plain', 'banh khao chay  rice cake, plain'),
+('fao_vn_2007_12008_raw', 'Bánh quế', '{}', 'Cinnamon waffle (roll)', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 435.0, 8.3, 76.4, 10.7, 0.3, NULL, 33.0, 2.0, NULL, 115.0, NULL, NULL, NULL, NULL, 75.0, 12.0, NULL, NULL, NULL, 0.0, 0.04, 1.9, 0.7, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh quế  Cinnamon waffle (roll)', 'banh que  cinnamon waffle (roll)'),
+('fao_vn_2007_12009_raw', 'Bánh sô cô la', '{}', 'Chocolate, filled', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 449.0, 3.9, 68.8, 17.6, 0.0, NULL, 58.0, 3.7, NULL, 142.0, NULL, NULL, NULL, NULL, 10.0, 13.0, NULL, NULL, NULL, 0.0, 0.04, 0.17, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh sô cô la  Chocolate, filled', 'banh so co la  chocolate, filled'),
+('fao_vn_2007_12010_raw', 'Bánh thỏi sô cô la', '{}', 'Chocolate, sweet', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 543.0, 4.9, 62.5, 30.4, NULL, NULL, 280.0, 1.5, NULL, 280.0, NULL, NULL, NULL, NULL, 2.0, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.01, 0.6, NULL, NULL, NULL, NULL, 3.0, '2026-02-26', 'Bánh thỏi sô cô la  Chocolate, sweet', 'banh thoi so co la  chocolate, sweet'),
+('fao_vn_2007_12011_raw', 'Bánh trứng nhện', '{}', 'Small biscuit', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 369.0, 9.6, 74.2, 3.7, 0.2, NULL, 76.0, 3.9, NULL, 140.0, NULL, NULL, NULL, NULL, 105.0, 17.0, NULL, NULL, NULL, 0.0, 0.15, 0.36, 0.9, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Bánh trứng nhện  Small biscuit', 'banh trung nhen  small biscuit'),
+('fao_vn_2007_12012_raw', 'Bột ca cao', '{}', 'Cocoa powder', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 414.0, 19.6, 53.0, 13.7, 4.6, 21.0, 128.0, 13.86, 499.0, 734.0, 1524.0, 6.81, 3788.0, 3.84, 0.0, 0.0, NULL, 0.1, 2.5, 0.0, 0.08, 0.24, 2.2, 0.254, 0.118, 0.0, 0.0, NULL, '2026-02-26', 'Bột ca cao  Cocoa powder', 'bot ca cao  cocoa powder'),
+('fao_vn_2007_12013_raw', 'Đường cát', '{}', 'Refined sugar', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 390.0, 0.0, 97.4, 0.0, 0.0, 39.0, 178.0, 5.8, 29.0, 72.0, 346.0, 0.18, 298.0, 0.32, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.05, 0.1, 0.3, 0.111, 0.026, 0.0, 0.0, 0.0, '2026-02-26', 'Đường cát  Refined sugar', 'duong cat  refined sugar'),
+('fao_vn_2007_12014_raw', 'Đường kính', '{}', 'Granulated sugar', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 397.0, 0.0, 99.3, 0.0, 0.0, NULL, 0.0, 0.06, NULL, 0.0, 2.0, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.0, 0.03, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Đường kính  Granulated sugar', 'duong kinh  granulated sugar'),
+('fao_vn_2007_12015_raw', 'Kẹo bơ cứng', '{}', 'Toffee, sweets', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 448.0, 2.1, 71.1, 17.2, 0.0, NULL, 64.0, 0.76, NULL, 64.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo bơ cứng  Toffee, sweets', 'keo bo cung  toffee, sweets'),
+('fao_vn_2007_12016_raw', 'Kẹo cà phê', '{}', 'Coffee sweets', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 378.0, 0.0, 91.5, 1.3, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo cà phê  Coffee sweets', 'keo ca phe  coffee sweets'),
+('fao_vn_2007_12017_raw', 'Kẹo cam chanh', '{}', 'Sweets, caramel with citron, orange aroma', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 377.0, 0.0, 93.1, 0.5, 0.3, NULL, 23.0, 1.4, NULL, 12.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo cam chanh  Sweets, caramel with citron, orange aroma', 'keo cam chanh  sweets, caramel with citron, orange aroma'),
+('fao_vn_2007_12018_raw', 'Kẹo dừa mềm', '{}', 'Sweets with coconut aroma', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 415.0, 0.6, 75.6, 12.2, 2.5, NULL, 16.0, 0.4, NULL, 7.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo dừa mềm  Sweets with coconut aroma', 'keo dua mem  sweets with coconut aroma'),
+('fao_vn_2007_12019_raw', 'Kẹo dứa mềm', '{}', 'Pineapple sweets candy', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 415.0, 0.6, 75.6, 12.2, 2.5, NULL, 16.0, 0.4, NULL, 7.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo dứa mềm  Pineapple sweets candy', 'keo dua mem  pineapple sweets candy'),
+('fao_vn_2007_12020_raw', 'Kẹo lạc', '{}', 'Peanut candy', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 449.0, 10.3, 64.8, 16.5, 2.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo lạc  Peanut candy', 'keo lac  peanut candy'),
+('fao_vn_2007_12021_raw', 'Kẹo Pastille (kẹo ngậm bạc hà)', '{}', 'Menthol pastille', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 356.0, 5.2, 83.8, 0.0, NULL, NULL, 96.0, 1.6, NULL, 18.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo Pastille (kẹo ngậm bạc hà)  Menthol pastille', 'keo pastille (keo ngam bac ha)  menthol pastille'),
+('fao_vn_2007_12022_raw', 'Kẹo sô cô la', '{}', 'Sweets with chocolate', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 388.0, 1.6, 85.1, 4.6, 1.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo sô cô la  Sweets with chocolate', 'keo so co la  sweets with chocolate'),
+('fao_vn_2007_12023_raw', 'Kẹo sữa', '{}', 'Sweets with milk', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 390.0, 2.9, 83.0, 5.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo sữa  Sweets with milk', 'keo sua  sweets with milk'),
+('fao_vn_2007_12024_raw', 'Kẹo vừng viên', '{}', 'Sesame candy', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 417.0, 2.8, 85.9, 6.9, 1.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.05, 0.02, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Kẹo vừng viên  Sesame candy', 'keo vung vien  sesame candy'),
+('fao_vn_2007_12025_raw', 'Mạch nha', '{}', 'Malt', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 331.0, 0.2, 82.5, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, 0.1, 0.2, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mạch nha  Malt', 'mach nha  malt'),
+('fao_vn_2007_12026_raw', 'Mật ong', '{}', 'Honey', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 327.0, 0.4, 81.3, 0.0, 0.0, 4.0, 5.0, 0.9, 2.0, 16.0, 52.0, 0.22, 36.0, 0.08, 0.0, 0.0, 0.0, 0.0, 0.0, 4.0, 0.0, 0.04, 0.2, 0.068, 0.024, 0.0, 0.0, 0.0, '2026-02-26', 'Mật ong  Honey', 'mat ong  honey'),
+('fao_vn_2007_12027_raw', 'Mứt lạc', '{}', 'Peanut sugar (Jam)', 'Đồ ngọt (đường, bánh, mứt, kẹo)', 'Sugar, confectionery', 'FAO_VN_2007', 'raw', 0.0, 431.0, 5.4, 82.9, 8.6, 0.7, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.16, 0.03, 3.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mứt lạc  Peanut sugar (Jam)', 'mut lac  peanut sugar (jam)'),
+('fao_vn_2007_13001_raw', 'Cary bột', '{}', 'Cari powder (Mix, turmeric, red pepper and other spices)', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 283.0, 8.2, 46.0, 7.3, 8.9, NULL, 906.0, NULL, NULL, 421.0, NULL, NULL, NULL, NULL, 380.0, NULL, NULL, NULL, NULL, NULL, 0.03, 0.4, 2.3, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cary bột  Cari powder (Mix, turmeric, red pepper and other spices)', 'cary bot  cari powder (mix, turmeric, red pepper and other spices)'),
+('fao_vn_2007_13002_raw', 'Gừng khô (bột)', '{}', 'Ginger root, dried powder', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 323.0, 9.1, 58.3, 5.9, 12.5, 32.0, 180.0, 11.52, 184.0, 148.0, 1343.0, 4.72, 480.0, 26.5, 88.0, NULL, NULL, 18.02, 0.8, 7.0, 0.16, 0.27, 8.4, NULL, 0.84, 0.0, 0.0, NULL, '2026-02-26', 'Gừng khô (bột)  Ginger root, dried powder', 'gung kho (bot)  ginger root, dried powder'),
+('fao_vn_2007_13003_raw', 'Gừng tươi', '{}', 'Ginger root, fresh', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 10.0, 29.0, 0.4, 5.1, 0.8, 3.3, 7.0, 60.0, 2.5, 43.0, 8.0, 316.0, 0.34, 226.0, 0.23, 0.0, NULL, NULL, 0.26, 0.1, 5.0, 0.04, 0.04, 0.7, 0.203, 0.16, 0.0, 0.0, NULL, '2026-02-26', 'Gừng tươi  Ginger root, fresh', 'gung tuoi  ginger root, fresh'),
+('fao_vn_2007_13004_raw', 'Hạt tiêu', '{}', 'Peppercorn, seeds', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 231.0, 7.0, 34.1, 7.4, 33.5, 44.0, 732.0, 4.6, 19.0, 44.0, 1259.0, 0.3, 100.0, 0.1, 156.0, NULL, NULL, 0.72, 163.7, 0.0, 0.05, 0.06, 2.6, NULL, 0.34, 0.0, NULL, NULL, '2026-02-26', 'Hạt tiêu  Peppercorn, seeds', 'hat tieu  peppercorn, seeds'),
+('fao_vn_2007_13005_raw', 'Muối', '{}', 'Table salt', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 38758.0, 150.0, 0.81, 0.0, 70.0, 4.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, '2026-02-26', 'Muối  Table salt', 'muoi  table salt'),
+('fao_vn_2007_13006_raw', 'Nghệ khô, bột', '{}', 'Turmeric rhizome, dried powder', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 295.0, 7.8, 43.8, 9.9, 21.1, 38.0, 146.0, 18.6, 193.0, 284.0, 2525.0, 4.35, 603.0, 7.83, 0.0, NULL, NULL, 3.1, 13.4, 26.0, 0.03, 0.12, 2.3, NULL, 1.8, 0.0, 0.0, NULL, '2026-02-26', 'Nghệ khô, bột  Turmeric rhizome, dried powder', 'nghe kho, bot  turmeric rhizome, dried powder'),
+('fao_vn_2007_13007_raw', 'Nghệ tươi', '{}', 'Turmeric, rhizome, fresh', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 10.0, 25.0, 1.1, 4.4, 0.3, 6.5, 52.0, 12.0, NULL, NULL, 22.0, 587.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 4.0, 0.03, 0.03, 0.4, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nghệ tươi  Turmeric, rhizome, fresh', 'nghe tuoi  turmeric, rhizome, fresh'),
+('fao_vn_2007_13008_raw', 'ớt khô bột', '{}', 'Red pepper, dried powder', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 227.0, 15.6, 31.8, 4.2, 23.6, NULL, 85.0, 17.0, NULL, 380.0, NULL, NULL, NULL, NULL, 8442.0, NULL, NULL, NULL, NULL, 0.0, 0.61, 0.9, 8.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'ớt khô bột  Red pepper, dried powder', 'ot kho bot  red pepper, dried powder'),
+('fao_vn_2007_13009_raw', 'Riềng', '{}', 'Alpinia root, fresh', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 10.0, 26.0, 0.3, 2.5, NULL, 3.7, NULL, 24.0, NULL, NULL, 28.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Riềng  Alpinia root, fresh', 'rieng  alpinia root, fresh'),
+('fao_vn_2007_13010_raw', 'Magi', '{}', 'Soybean sauce', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 65.0, 10.5, 5.6, 0.1, 0.0, 5586.0, 20.0, 2.38, 40.0, 130.0, 212.0, 0.43, 135.0, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06, 0.15, 4.0, 0.376, 0.2, 0.0, 0.0, NULL, '2026-02-26', 'Magi  Soybean sauce', 'magi  soybean sauce'),
+('fao_vn_2007_13011_raw', 'Mắm tôm đặc', '{}', 'Shrimp sauce concentrate', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 73.0, 14.8, 0.0, 1.5, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mắm tôm đặc  Shrimp sauce concentrate', 'mam tom dac  shrimp sauce concentrate'),
+('fao_vn_2007_13012_raw', 'Mắm tôm loãng', '{}', 'Shrimp sauce, diluted', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 44.0, 7.0, 2.1, 0.8, 0.0, NULL, 645.0, NULL, NULL, 226.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mắm tôm loãng  Shrimp sauce, diluted', 'mam tom loang  shrimp sauce, diluted'),
+('fao_vn_2007_13013_raw', 'Mắm tép chua', '{}', 'Tiny shrimp, sour sauce', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 68.0, 8.7, 5.5, 1.2, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Mắm tép chua  Tiny shrimp, sour sauce', 'mam tep chua  tiny shrimp, sour sauce'),
+('fao_vn_2007_13014_raw', 'Nước mắm cá (loại đặc biệt)', '{}', 'Fish - sauce (super quality).', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 60.0, 15.0, 0.0, 0.0, 0.0, NULL, 387.0, 2.7, NULL, 247.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.09, 0.86, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nước mắm cá (loại đặc biệt)  Fish - sauce (super quality).', 'nuoc mam ca (loai dac biet)  fish - sauce (super quality).'),
+('fao_vn_2007_13015_raw', 'Nước mắm cá loại I', '{}', 'Fish sauce, grade I', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 28.0, 7.1, 0.0, 0.0, 0.0, NULL, 387.0, 2.7, NULL, 247.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.03, 0.27, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nước mắm cá loại I  Fish sauce, grade I', 'nuoc mam ca loai i  fish sauce, grade i'),
+('fao_vn_2007_13016_raw', 'Nước mắm loại II', '{}', 'Fish sauce, grade II', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 21.0, 5.2, 0.0, 0.0, 0.0, NULL, 314.0, 1.9, NULL, 116.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nước mắm loại II  Fish sauce, grade II', 'nuoc mam loai ii  fish sauce, grade ii'),
+('fao_vn_2007_13017_raw', 'Nước mắm cá', '{}', 'Fish sauce, ready-to-serve', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 35.0, 5.1, 3.6, 0.01, 0.0, 7720.0, 43.0, 0.78, 175.0, 7.0, 288.0, 0.2, 50.0, 0.23, 0.0, 4.0, 0.0, 0.0, 0.0, 1.0, 0.01, 0.06, 2.3, 0.118, 0.396, 0.0, 0.48, NULL, '2026-02-26', 'Nước mắm cá  Fish sauce, ready-to-serve', 'nuoc mam ca  fish sauce, ready-to-serve'),
+('fao_vn_2007_13018_raw', 'Nước mắm cô', '{}', 'Fish sauce, concentrated', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 131.0, 32.8, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nước mắm cô  Fish sauce, concentrated', 'nuoc mam co  fish sauce, concentrated'),
+('fao_vn_2007_13019_raw', 'Tương ngô', '{}', 'Soybean sauce with rice and maize', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 75.0, 3.9, 14.5, 0.1, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tương ngô  Soybean sauce with rice and maize', 'tuong ngo  soybean sauce with rice and maize'),
+('fao_vn_2007_13020_raw', 'Tương nếp', '{}', 'Soybean sauce with glutinous rice', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 86.0, 4.3, 15.7, 0.7, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Tương nếp  Soybean sauce with glutinous rice', 'tuong nep  soybean sauce with glutinous rice'),
+('fao_vn_2007_13021_raw', 'Tương ớt', '{}', 'Red pepper sauce concentrate', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 37.0, 0.5, 7.6, 0.5, 0.9, 25.0, 9.0, 0.5, 12.0, 16.0, 564.0, 0.15, 87.0, NULL, 257.0, 0.0, NULL, 0.36, 6.7, 30.0, 0.01, 0.09, 0.6, NULL, 0.14, 0.0, 0.0, NULL, '2026-02-26', 'Tương ớt  Red pepper sauce concentrate', 'tuong ot  red pepper sauce concentrate'),
+('fao_vn_2007_13022_raw', 'Xì dầu', '{}', 'Soybean sauce', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 53.0, 6.3, 6.8, 0.04, 0.8, 5637.0, 19.0, 1.93, 43.0, 125.0, 217.0, 0.52, 104.0, 0.42, 0.0, 0.0, NULL, 0.0, 0.0, 0.0, 0.03, 0.17, 2.2, 0.297, 0.148, 0.0, 0.0, NULL, '2026-02-26', 'Xì dầu  Soybean sauce', 'xi dau  soybean sauce'),
+('fao_vn_2007_13023_raw', 'Sốt mayonnaise', '{}', 'Mayonnaise', 'Gia vị, nước chấm', 'Condiments, traditional sauces', 'FAO_VN_2007', 'raw', 0.0, 701.0, 0.0, 0.1, 77.8, 0.0, 486.0, 7.0, 0.23, 1.0, 25.0, 14.0, 0.13, 0.0, NULL, 0.0, NULL, NULL, 11.79, 24.7, 0.0, 0.01, 0.06, 0.0, NULL, 0.01, 0.0, 0.0, NULL, '2026-02-26', 'Sốt mayonnaise  Mayonnaise', 'sot mayonnaise  mayonnaise'),
+('fao_vn_2007_14001_raw', 'Bia (cồn: 4,5 g)', '{}', 'Beer light (4,5 % Alcohol)', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 11.0, 0.5, 2.3, 0.0, 0.0, 4.0, 6.0, 0.1, 6.0, 26.0, 27.0, 0.01, 5.0, 0.01, 0.0, NULL, NULL, NULL, NULL, 0.0, 0.01, 0.03, 0.8, 0.041, 0.046, 0.0, 0.02, 3.0, '2026-02-26', 'Bia (cồn: 4,5 g)  Beer light (4,5 % Alcohol)', 'bia (con: 4,5 g)  beer light (4,5 % alcohol)'),
+('fao_vn_2007_14002_raw', 'Cô nhắc (cồn 32 g)', '{}', 'Cognac', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cô nhắc (cồn 32 g)  Cognac', 'co nhac (con 32 g)  cognac'),
+('fao_vn_2007_14003_raw', 'Cốc tai (cồn 13 g)', '{}', 'Cocktail, vermouth sweet', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 63.0, 0.0, 15.7, 0.0, 0.0, NULL, 6.0, 0.36, NULL, 6.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Cốc tai (cồn 13 g)  Cocktail, vermouth sweet', 'coc tai (con 13 g)  cocktail, vermouth sweet'),
+('fao_vn_2007_14004_raw', 'Coca cola', '{}', 'Coca Cola', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 42.0, 0.0, 10.4, 0.0, 0.0, NULL, 8.0, 0.0, NULL, 15.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Coca cola  Coca Cola', 'coca cola  coca cola'),
+('fao_vn_2007_14005_raw', 'Nước cam tươi', '{}', 'Orange juice, fresh', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 23.0, 0.7, 4.5, 0.2, 0.2, 1.0, 26.0, 0.3, 11.0, 16.0, 200.0, 0.05, 44.0, 0.01, 33.0, NULL, NULL, 0.04, 0.1, 54.0, 0.09, 0.03, 0.4, 0.19, 0.04, 0.0, 0.0, NULL, '2026-02-26', 'Nước cam tươi  Orange juice, fresh', 'nuoc cam tuoi  orange juice, fresh'),
+('fao_vn_2007_14006_raw', 'Nước dừa non tươi', '{}', 'Coconut milk, immature', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 21.0, 0.4, 4.8, 0.0, 0.0, NULL, 60.0, 0.3, NULL, 29.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 1.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nước dừa non tươi  Coconut milk, immature', 'nuoc dua non tuoi  coconut milk, immature'),
+('fao_vn_2007_14007_raw', 'Nước ép cà chua', '{}', 'Tomato juice', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 19.0, 0.8, 2.6, 0.6, 0.4, 269.0, 8.0, 0.3, 11.0, 13.0, 229.0, 0.15, 61.0, 0.07, 270.0, NULL, NULL, 0.32, 2.3, 7.0, 0.03, 0.03, 0.7, 0.25, 0.111, 0.0, NULL, NULL, '2026-02-26', 'Nước ép cà chua  Tomato juice', 'nuoc ep ca chua  tomato juice'),
+('fao_vn_2007_14008_raw', 'Nước khoáng', '{}', 'Mineral water', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, 5.0, 0.01, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Nước khoáng  Mineral water', 'nuoc khoang  mineral water'),
+('fao_vn_2007_14009_raw', 'Nước quít tươi', '{}', 'Mandarins juice (fresh)', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 24.0, 0.4, 5.1, 0.2, 0.2, 1.0, 20.0, 0.2, 8.0, 24.0, 178.0, 0.03, 25.0, 0.04, 38.0, NULL, NULL, 0.13, 0.0, 47.0, 0.06, 0.02, 0.1, 0.125, 0.042, 0.0, 0.0, NULL, '2026-02-26', 'Nước quít tươi  Mandarins juice (fresh)', 'nuoc quit tuoi  mandarins juice (fresh)'),
+('fao_vn_2007_14010_raw', 'Rượu cam, chanh (cồn 24,2 g)', '{}', 'Liqueur, orange flavor', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rượu cam, chanh (cồn 24,2 g)  Liqueur, orange flavor', 'ruou cam, chanh (con 24,2 g)  liqueur, orange flavor'),
+('fao_vn_2007_14011_raw', 'Rượu nếp (80g/ 24 ml) (cồn 5 g)', '{}', 'Rice glutinous (Alcohol fermentation rice 80 g water 24 ml)', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 167.0, 4.0, 37.7, 0.0, 0.2, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rượu nếp (80g/ 24 ml) (cồn 5 g)  Rice glutinous (Alcohol fermentation rice 80 g water 24 ml)', 'ruou nep (80g/ 24 ml) (con 5 g)  rice glutinous (alcohol fermentation rice 80 g water 24 ml)'),
+('fao_vn_2007_14012_raw', 'Rượu trắng (cồn 39 g)', '{}', 'Vodka', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 273.0, NULL, 0.0, 0.0, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rượu trắng (cồn 39 g)  Vodka', 'ruou trang (con 39 g)  vodka'),
+('fao_vn_2007_14013_raw', 'Rượu vang đỏ (cồn 9,5 g)', '{}', 'Red wine', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 9.0, 0.2, 2.0, 0.0, 0.0, NULL, 8.0, 0.82, NULL, 10.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, 0.02, 0.1, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rượu vang đỏ (cồn 9,5 g)  Red wine', 'ruou vang do (con 9,5 g)  red wine'),
+('fao_vn_2007_14014_raw', 'Rượu vang trắng (cồn 9,5 g)', '{}', 'White wine', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 1.0, 0.1, 0.2, 0.0, 0.0, 4.0, 9.0, 0.5, 8.0, 6.0, 61.0, 0.06, 40.0, 0.02, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, 0.01, 0.1, 0.03, 0.02, 0.0, 0.0, NULL, '2026-02-26', 'Rượu vang trắng (cồn 9,5 g)  White wine', 'ruou vang trang (con 9,5 g)  white wine'),
+('fao_vn_2007_14015_raw', 'Rượu vang trắng ngọt (cồn 10.2 g)', '{}', 'White wine, sweet', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 24.0, 0.2, 5.9, 0.0, 0.0, 13.0, 14.0, 0.58, 11.0, 13.0, 110.0, 0.06, 40.0, 0.02, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.01, 0.1, 0.03, 0.012, 0.0, 0.0, NULL, '2026-02-26', 'Rượu vang trắng ngọt (cồn 10.2 g)  White wine, sweet', 'ruou vang trang ngot (con 10.2 g)  white wine, sweet'),
+('fao_vn_2007_14016_raw', 'Rượu Whisky (cồn 35,2 g)', '{}', 'Whisky liqueur', 'Nước giải khát, bia, rượu', 'Beverage and liquor', 'FAO_VN_2007', 'raw', 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, NULL, 2.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, 0.0, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, '2026-02-26', 'Rượu Whisky (cồn 35,2 g)  Whisky liqueur', 'ruou whisky (con 35,2 g)  whisky liqueur');
+
+ALTER TABLE vietnamese_food_composition ENABLE TRIGGER on_food_composition_search_text;
+
+COMMIT;